@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the formatting throughput over the example numbers of every
+region.
+
+The example numbers are read from the metadata XML file, since the generated
+metadata leaves them out. All metadata is loaded and compiled before timing
+starts (see PhoneNumberUtil.preload_for_fork()), so the runs measure
+formatting alone.
+"""
+
+import optparse
+import os.path
+import time
+
+from phonenumbers import buildmetadatafromxml
+from phonenumbers import metadata
+from phonenumbers import patternpool
+from phonenumbers import phonenumber_pb2
+from phonenumbers import phonenumberutil
+
+
+USAGE = """Example command line invocation:
+python -m phonenumbers.benchmark.formatting -n 20
+python -m phonenumbers.benchmark.formatting -r GB -r US"""
+
+
+DEFAULT_XML_FILE = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "PhoneNumberMetaData.xml")
+
+FORMATS = (
+    ("national", phonenumberutil.FORMAT_NATIONAL),
+    ("international", phonenumberutil.FORMAT_INTERNATIONAL),
+)
+
+
+def iter_example_numbers(input_xml_file, region_codes=None,
+                         field_names=patternpool.NUMBER_DESC_FIELDS):
+    """Yields the region metadata, description field name and example number
+    of each example number in the XML file, only for region_codes and
+    field_names if given."""
+    # Example numbers are only kept by the "lite" build.
+    for region_metadata in buildmetadatafromxml.iter_phone_metadata(
+            input_xml_file, True):
+        if region_codes and region_metadata.id not in region_codes:
+            continue
+        for field_name in field_names:
+            example_number = getattr(region_metadata,
+                                     field_name).example_number
+            if example_number:
+                yield region_metadata, field_name, example_number
+
+
+def load_example_numbers(input_xml_file, region_codes=None):
+    """Returns a PhoneNumber for each example number of the regions in the
+    XML file, or only of region_codes if given."""
+    numbers = []
+    for region_metadata, _, example_number in iter_example_numbers(
+            input_xml_file, region_codes):
+        number = phonenumber_pb2.PhoneNumber()
+        number.country_code = region_metadata.country_code
+        number.national_number = long(example_number)
+        numbers.append(number)
+    return numbers
+
+
+def time_format(util, numbers, number_format):
+    """Formats every number once and returns the time taken in seconds."""
+    start = time.time()
+    for number in numbers:
+        util.format(number, number_format)
+    return time.time() - start
+
+
+def run(runs, numbers):
+    """Returns a mapping from format name to the sorted durations of its
+    runs."""
+    util = phonenumberutil.PhoneNumberUtil.get_instance(
+            metadata_module=metadata)
+    util.preload_for_fork()
+    results = {}
+    for name, number_format in FORMATS:
+        # Untimed run, which also fills the regex cache.
+        time_format(util, numbers, number_format)
+        results[name] = sorted(time_format(util, numbers, number_format)
+                               for _ in xrange(runs))
+    return results
+
+
+def main():
+    parser = optparse.OptionParser(USAGE)
+    parser.add_option("-n", "--runs", dest="runs", type="int", default=10,
+            help="Number of times to format every number (default: 10).")
+    parser.add_option("-r", "--region", dest="region_codes", action="append",
+            default=[],
+            help="Region whose example numbers to format; may be repeated "
+                 "(default: every region).")
+    parser.add_option("-i", "--input", dest="input_xml_file",
+            default=DEFAULT_XML_FILE,
+            help="Metadata XML file to read the example numbers from.")
+    options = parser.parse_args()[0]
+
+    numbers = load_example_numbers(options.input_xml_file,
+                                   options.region_codes)
+    results = run(options.runs, numbers)
+    print "%d example numbers" % len(numbers)
+    print "%-14s %12s %16s" % ("format", "median (ms)", "numbers/second")
+    for name, _ in FORMATS:
+        median = results[name][len(results[name]) // 2]
+        print "%-14s %12.2f %16.0f" % (name, median * 1000,
+                                        len(numbers) / median)
+
+
+if __name__ == "__main__":
+    main()
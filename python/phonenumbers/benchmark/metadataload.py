@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the first-call latency of each way of loading metadata.
+
+Every measurement runs in a fresh interpreter, so it covers what a cold worker
+pays: creating the PhoneNumberUtil instance and loading the metadata for the
+requested regions. The modes compared are the per-region proto files, the
+memory-mapped bundle and the generated metadata module.
+"""
+
+import optparse
+import os
+import py_compile
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from phonenumbers import buildconstants
+
+
+USAGE = """Example command line invocation:
+python -m phonenumbers.benchmark.metadataload -n 20 -r GB
+python -m phonenumbers.benchmark.metadataload --all-regions"""
+
+
+MODES = ("files", "bundle", "module")
+
+_SCRIPT = """\
+import time
+from phonenumbers import phonenumberutil
+from phonenumbers import countrycodetoregioncodemap
+start = time.time()
+if %(mode)r == "module":
+    from phonenumbers import metadata
+    util = phonenumberutil.PhoneNumberUtil.get_instance(
+            metadata_module=metadata)
+else:
+    util = phonenumberutil.PhoneNumberUtil.get_instance(%(file_prefix)r,
+            countrycodetoregioncodemap.country_code_to_region_code_map)
+for region_code in %(region_codes)r or util._get_generation().supported_countries:
+    util.get_metadata_for_region(region_code)
+print time.time() - start
+"""
+
+
+def _copy_region_files(directory):
+    """Copies the per-region metadata files, without the bundle, to directory
+    and returns the file prefix to load them from."""
+    data_directory = os.path.dirname(buildconstants.META_DATA_FILE_PREFIX)
+    prefix = os.path.basename(buildconstants.META_DATA_FILE_PREFIX) + "_"
+    for file_name in os.listdir(data_directory):
+        if file_name.startswith(prefix):
+            shutil.copy(os.path.join(data_directory, file_name), directory)
+    return os.path.join(directory,
+                        os.path.basename(buildconstants.META_DATA_FILE_PREFIX))
+
+
+def time_first_call(mode, file_prefix, region_codes):
+    """Runs one cold load in a new interpreter and returns its duration in
+    seconds."""
+    script = _SCRIPT % {"mode": mode,
+                        "file_prefix": file_prefix,
+                        "region_codes": region_codes}
+    output = subprocess.Popen([sys.executable, "-c", script],
+                              stdout=subprocess.PIPE).communicate()[0]
+    return float(output.splitlines()[-1])
+
+
+def run(runs, region_codes):
+    """Returns a mapping from mode to the sorted durations of its runs."""
+    # Make sure the metadata module is read as bytecode, even where the
+    # environment stops the interpreter writing it (PYTHONDONTWRITEBYTECODE).
+    py_compile.compile(os.path.join(os.path.dirname(buildconstants.__file__),
+                                    buildconstants.METADATA_MODULE_NAME + ".py"))
+    temp_directory = tempfile.mkdtemp()
+    try:
+        file_prefixes = {
+            "files": _copy_region_files(temp_directory),
+            "bundle": buildconstants.META_DATA_FILE_PREFIX,
+            "module": None,
+        }
+        results = {}
+        for mode in MODES:
+            # Untimed run so that the page cache is warm.
+            time_first_call(mode, file_prefixes[mode], region_codes)
+            results[mode] = sorted(
+                    time_first_call(mode, file_prefixes[mode], region_codes)
+                    for _ in xrange(runs))
+        return results
+    finally:
+        shutil.rmtree(temp_directory)
+
+
+def main():
+    parser = optparse.OptionParser(USAGE)
+    parser.add_option("-n", "--runs", dest="runs", type="int", default=10,
+            help="Number of cold processes to time per mode (default: 10).")
+    parser.add_option("-r", "--region", dest="region_codes", action="append",
+            default=[],
+            help="Region to load on the first call; may be repeated "
+                 "(default: US).")
+    parser.add_option("-a", "--all-regions", dest="all_regions",
+            action="store_true", default=False,
+            help="Load every supported region on the first call.")
+    options = parser.parse_args()[0]
+    if options.all_regions:
+        region_codes = []
+    else:
+        region_codes = options.region_codes or ["US"]
+
+    results = run(options.runs, region_codes)
+    print "%-8s %12s %12s %12s" % ("mode", "min (ms)", "median (ms)",
+                                    "max (ms)")
+    for mode in MODES:
+        durations = results[mode]
+        print "%-8s %12.2f %12.2f %12.2f" % (mode, durations[0] * 1000,
+                durations[len(durations) // 2] * 1000, durations[-1] * 1000)
+
+
+if __name__ == "__main__":
+    main()
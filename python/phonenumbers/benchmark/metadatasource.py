@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the cost of loading metadata from each type of source.
+
+Each run opens a new source and loads the metadata of the requested regions
+from it, so the time covers opening the source as well as reading and decoding
+each region. Unlike metadataload.py this runs in a single process, so it
+measures the sources themselves rather than interpreter start-up.
+"""
+
+import optparse
+import os.path
+import shutil
+import tempfile
+import time
+import zipfile
+
+from phonenumbers import buildconstants
+from phonenumbers import metadata
+from phonenumbers import metadatasource
+from phonenumbers.benchmark import metadataload
+
+
+USAGE = """Example command line invocation:
+python -m phonenumbers.benchmark.metadatasource -n 20 -r GB -r US
+python -m phonenumbers.benchmark.metadatasource --all-regions"""
+
+
+SOURCE_TYPES = ("directory", "bundle", "module", "dict", "zip", "zip-bundle",
+                "package")
+
+
+def _make_zip_file(zip_file_name, region_codes, include_bundle):
+    """Stores the metadata files of region_codes, and optionally the bundle,
+    in a new zip file, under the names ZipSource expects for the prefix
+    "metadata"."""
+    zip_file = zipfile.ZipFile(zip_file_name, "w", zipfile.ZIP_DEFLATED)
+    for region_code in region_codes:
+        zip_file.write(buildconstants.META_DATA_FILE_PREFIX + "_" + region_code,
+                       "metadata_" + region_code)
+    if include_bundle:
+        zip_file.write(buildconstants.META_DATA_FILE_PREFIX +
+                       buildconstants.META_DATA_BUNDLE_SUFFIX,
+                       "metadata" + buildconstants.META_DATA_BUNDLE_SUFFIX)
+    zip_file.close()
+
+
+def _get_source_factories(directory, all_region_codes):
+    """Returns a mapping from source type to a function opening a new source
+    of that type."""
+    directory_prefix = metadataload._copy_region_files(directory)
+    zip_file_name = os.path.join(directory, "metadata.zip")
+    _make_zip_file(zip_file_name, all_region_codes, False)
+    zip_bundle_file_name = os.path.join(directory, "metadata-bundle.zip")
+    _make_zip_file(zip_bundle_file_name, all_region_codes, True)
+    directory_source = metadatasource.DirectorySource(directory_prefix)
+    metadata_by_region_code = dict(
+            (region_code, directory_source.load_metadata(region_code))
+            for region_code in all_region_codes)
+    return {
+        "directory": lambda: metadatasource.DirectorySource(directory_prefix),
+        "bundle": lambda: metadatasource.BundleSource(
+                buildconstants.META_DATA_FILE_PREFIX +
+                buildconstants.META_DATA_BUNDLE_SUFFIX),
+        "module": lambda: metadatasource.ModuleSource(metadata),
+        "dict": lambda: metadatasource.DictSource(metadata_by_region_code),
+        "zip": lambda: metadatasource.ZipSource(zip_file_name, "metadata"),
+        "zip-bundle": lambda: metadatasource.ZipSource(zip_bundle_file_name,
+                                                       "metadata"),
+        "package": lambda: metadatasource.PackageResourceSource(
+                "phonenumbers", buildconstants.META_DATA_RESOURCE_PREFIX),
+    }
+
+
+def time_load(source_factory, region_codes):
+    """Opens a source and loads region_codes from it, and returns the time
+    taken in seconds."""
+    start = time.time()
+    source = source_factory()
+    for region_code in region_codes:
+        source.load_metadata(region_code)
+    duration = time.time() - start
+    source.close()
+    return duration
+
+
+def run(runs, region_codes):
+    """Returns a mapping from source type to the sorted durations of its
+    runs."""
+    all_region_codes = sorted(metadata.country_to_metadata.keys())
+    region_codes = region_codes or all_region_codes
+    temp_directory = tempfile.mkdtemp()
+    try:
+        source_factories = _get_source_factories(temp_directory,
+                                                 all_region_codes)
+        results = {}
+        for source_type in SOURCE_TYPES:
+            # Untimed run so that the page cache is warm.
+            time_load(source_factories[source_type], region_codes)
+            results[source_type] = sorted(
+                    time_load(source_factories[source_type], region_codes)
+                    for _ in xrange(runs))
+        return results
+    finally:
+        shutil.rmtree(temp_directory)
+
+
+def main():
+    parser = optparse.OptionParser(USAGE)
+    parser.add_option("-n", "--runs", dest="runs", type="int", default=10,
+            help="Number of times to open and load each source (default: "
+                 "10).")
+    parser.add_option("-r", "--region", dest="region_codes", action="append",
+            default=[],
+            help="Region to load; may be repeated (default: US).")
+    parser.add_option("-a", "--all-regions", dest="all_regions",
+            action="store_true", default=False,
+            help="Load every region.")
+    options = parser.parse_args()[0]
+    if options.all_regions:
+        region_codes = []
+    else:
+        region_codes = options.region_codes or ["US"]
+
+    results = run(options.runs, region_codes)
+    print "%-12s %12s %12s %12s" % ("source", "min (ms)", "median (ms)",
+                                    "max (ms)")
+    for source_type in SOURCE_TYPES:
+        durations = results[source_type]
+        print "%-12s %12.2f %12.2f %12.2f" % (source_type,
+                durations[0] * 1000, durations[len(durations) // 2] * 1000,
+                durations[-1] * 1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark of PhoneNumberUtil.normalize() on inputs of increasing
+length.
+
+Each kind of input is repeated up to each length and normalized many times in
+a row. Two strategies are timed: normalize() itself, which counts the letters
+of the number with str.translate() and normalizes ASCII numbers as byte
+strings, and the check of _VALID_ALPHA_PHONE_PATTERN followed by the
+translation of the number as unicode, which normalize() did before. Both must
+normalize every input alike.
+"""
+
+import optparse
+import timeit
+
+from phonenumbers import phonenumberutil
+
+
+USAGE = """Example command line invocation:
+python -m phonenumbers.benchmark.normalization -n 5
+python -m phonenumbers.benchmark.normalization -l 10 -l 10000"""
+
+
+# The kinds of input, each repeated up to the lengths benchmarked.
+INPUTS = (
+    ("digits", u"6502530000"),
+    ("punctuated", u"+1 (650) 253-0000 "),
+    ("alpha", u"1-800-MICROSOFT "),
+    ("fullwidth", u"\uFF16\uFF15\uFF10-253-0000 "),
+)
+
+DEFAULT_LENGTHS = (10, 100, 1000, 10000)
+
+STRATEGIES = ("translate", "regex")
+
+# The number of characters normalized in each timed run, so that runs on
+# short inputs are long enough to time.
+_CHARACTERS_PER_RUN = 100000
+
+
+def _get_normalizer(strategy):
+    phoneutil = phonenumberutil.PhoneNumberUtil()
+    if strategy == "translate":
+        return phoneutil.normalize
+
+    def normalize(number):
+        if phonenumberutil._VALID_ALPHA_PHONE_PATTERN.match(number):
+            table = phonenumberutil._ALL_NORMALIZATION_TABLE
+        else:
+            table = phonenumberutil._DIGITS_ONLY_TABLE
+        return phoneutil._normalize_helper(number, table)
+    return normalize
+
+
+def time_normalize(normalizer, number, runs):
+    """Returns the shortest time in seconds a single normalization of number
+    took over runs runs."""
+    loops = max(1, _CHARACTERS_PER_RUN // len(number))
+    return min(timeit.repeat(lambda: normalizer(number), number=loops,
+                             repeat=runs)) / loops
+
+
+def run(runs, lengths):
+    """Returns a mapping from (input kind, length, strategy) to the time in
+    seconds one normalization took.
+
+    Raises:
+        AssertionError: the strategies disagree on some input.
+    """
+    normalizers = dict((strategy, _get_normalizer(strategy))
+                       for strategy in STRATEGIES)
+    results = {}
+    for kind, base in INPUTS:
+        for length in lengths:
+            number = (base * (length // len(base) + 1))[:length]
+            expected = normalizers[STRATEGIES[0]](number)
+            for strategy in STRATEGIES:
+                assert normalizers[strategy](number) == expected, strategy
+                results[(kind, length, strategy)] = time_normalize(
+                        normalizers[strategy], number, runs)
+    return results
+
+
+def main():
+    parser = optparse.OptionParser(USAGE)
+    parser.add_option("-n", "--runs", dest="runs", type="int", default=3,
+            help="Number of timed runs of each input, of which the fastest "
+                 "is kept (default: 3).")
+    parser.add_option("-l", "--length", dest="lengths", type="int",
+            action="append", default=[],
+            help="Length of the inputs; may be repeated (default: %s)." %
+                 ", ".join(str(length) for length in DEFAULT_LENGTHS))
+    options = parser.parse_args()[0]
+
+    lengths = options.lengths or DEFAULT_LENGTHS
+    results = run(options.runs, lengths)
+    print "%-12s %8s %16s %16s" % (("input", "length") +
+                                   tuple("%s (us)" % strategy
+                                         for strategy in STRATEGIES))
+    for kind, _ in INPUTS:
+        for length in lengths:
+            print "%-12s %8d %16.2f %16.2f" % ((kind, length) + tuple(
+                    results[(kind, length, strategy)] * 1e6
+                    for strategy in STRATEGIES))
+
+
+if __name__ == "__main__":
+    main()
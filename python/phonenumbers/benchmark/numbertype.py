@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of number type classification on mixed mobile and fixed line
+numbers.
+
+The numbers are the mobile and fixed line example numbers of every region in
+the metadata XML file, each classified against the metadata of its own region.
+Three strategies are timed: the single scan of the combined number type
+pattern, the number type descriptions matched one by one in order of
+precedence, and the single run of the DFA of the number descriptions built
+into phonenumbers.metadatadfa. All must classify every number alike.
+"""
+
+import optparse
+import time
+
+from phonenumbers import metadata
+from phonenumbers import metadatadfa
+from phonenumbers import metadatageneration
+from phonenumbers.benchmark import formatting
+
+
+USAGE = """Example command line invocation:
+python -m phonenumbers.benchmark.numbertype -n 20
+python -m phonenumbers.benchmark.numbertype -r GB -r US"""
+
+
+STRATEGIES = ("combined", "sequential", "dfa")
+
+
+def load_numbers(input_xml_file, region_codes=None):
+    """Returns a list of the region code and national number of the fixed
+    line and mobile example numbers in the XML file, or only of region_codes
+    if given."""
+    return [(region_metadata.id, example_number)
+            for region_metadata, _, example_number in
+            formatting.iter_example_numbers(input_xml_file, region_codes,
+                                            ("fixed_line", "mobile"))]
+
+
+def _get_classifier(numbers, strategy):
+    """Returns a function classifying numbers with strategy, whose metadata
+    is already compiled."""
+    if strategy == "dfa":
+        dfa_module = metadatadfa
+    else:
+        dfa_module = None
+    generation = metadatageneration.MetadataGeneration(
+            1, metadata_module=metadata, dfa_module=dfa_module)
+    compiled_numbers = [
+            (generation.get_compiled_metadata_for_region(region_code),
+             national_number)
+            for region_code, national_number in numbers]
+    if strategy == "sequential":
+        return lambda: [
+                compiled_metadata._match_number_type_sequentially(
+                        national_number)
+                for compiled_metadata, national_number in compiled_numbers]
+    return lambda: [compiled_metadata.match_number_type(national_number)
+                    for compiled_metadata, national_number in
+                    compiled_numbers]
+
+
+def time_classify(classifier):
+    """Classifies every number once and returns the time taken in
+    seconds."""
+    start = time.time()
+    classifier()
+    return time.time() - start
+
+
+def run(runs, numbers):
+    """Returns a mapping from strategy to the sorted durations of its runs.
+
+    Raises:
+        AssertionError: the strategies disagree on some number.
+    """
+    classifiers = dict((strategy, _get_classifier(numbers, strategy))
+                       for strategy in STRATEGIES)
+    # Also an untimed run, which compiles the patterns still uncompiled.
+    expected_types = classifiers[STRATEGIES[0]]()
+    for strategy in STRATEGIES[1:]:
+        assert classifiers[strategy]() == expected_types, strategy
+    results = {}
+    for strategy in STRATEGIES:
+        results[strategy] = sorted(time_classify(classifiers[strategy])
+                                   for _ in xrange(runs))
+    return results
+
+
+def main():
+    parser = optparse.OptionParser(USAGE)
+    parser.add_option("-n", "--runs", dest="runs", type="int", default=10,
+            help="Number of times to classify every number (default: 10).")
+    parser.add_option("-r", "--region", dest="region_codes", action="append",
+            default=[],
+            help="Region whose example numbers to classify; may be repeated "
+                 "(default: every region).")
+    parser.add_option("-i", "--input", dest="input_xml_file",
+            default=formatting.DEFAULT_XML_FILE,
+            help="Metadata XML file to read the example numbers from.")
+    options = parser.parse_args()[0]
+
+    numbers = load_numbers(options.input_xml_file, options.region_codes)
+    results = run(options.runs, numbers)
+    print "%d example numbers" % len(numbers)
+    print "%-12s %12s %16s" % ("strategy", "median (ms)", "numbers/second")
+    for strategy in STRATEGIES:
+        median = results[strategy][len(results[strategy]) // 2]
+        print "%-12s %12.2f %16.0f" % (strategy, median * 1000,
+                                      len(numbers) / median)
+
+
+if __name__ == "__main__":
+    main()
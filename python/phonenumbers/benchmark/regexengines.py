@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the regex engines of regexengine.py on the same metadata.
+
+For each engine available here, the patterns of every region are compiled
+into a pattern pool of their own, which is timed, and then every example
+number is matched against all the number descriptions of its region and
+against the leading digits patterns of its formats, which is timed over
+several runs. All engines must match every number alike.
+"""
+
+import optparse
+import time
+
+from phonenumbers import metadata
+from phonenumbers import metadatageneration
+from phonenumbers import patternpool
+from phonenumbers import regexengine
+from phonenumbers.benchmark import formatting
+
+
+USAGE = """Example command line invocation:
+python -m phonenumbers.benchmark.regexengines -n 20
+python -m phonenumbers.benchmark.regexengines -e re -e dfa -r GB -r US"""
+
+
+def load_numbers(input_xml_file, region_codes=None):
+    """Returns a list of the region code and national number of the example
+    numbers in the XML file, or only of region_codes if given."""
+    return [(region_metadata.id, example_number)
+            for region_metadata, _, example_number in
+            formatting.iter_example_numbers(input_xml_file, region_codes)]
+
+
+def _get_matcher(numbers, engine):
+    """Returns the time taken to compile the patterns the numbers are matched
+    against with engine, and a function matching them."""
+    generation = metadatageneration.MetadataGeneration(
+            1, metadata_module=metadata, regex_engine=engine)
+    region_codes = sorted(set(region_code for region_code, _ in numbers))
+    regions_metadata = dict((region_code,
+                             generation.get_metadata_for_region(region_code))
+                            for region_code in region_codes)
+    pool = generation.pattern_pool
+    start = time.time()
+    patterns_by_region_code = {}
+    for region_code, region_metadata in regions_metadata.items():
+        anchored_patterns = []
+        for field_name in patternpool.NUMBER_DESC_FIELDS:
+            number_desc = getattr(region_metadata, field_name)
+            for regex in (number_desc.possible_number_pattern,
+                          number_desc.national_number_pattern):
+                if pool.contains_regex(regex):
+                    anchored_patterns.append(pool.get_anchored_pattern(regex))
+        leading_digits_patterns = [
+                pool.get_pattern(number_format.leading_digits_pattern[-1])
+                for number_format in region_metadata.number_format
+                if number_format.leading_digits_pattern]
+        patterns_by_region_code[region_code] = (anchored_patterns,
+                                                leading_digits_patterns)
+    compile_time = time.time() - start
+    compiled_numbers = [(patterns_by_region_code[region_code], national_number)
+                        for region_code, national_number in numbers]
+
+    def match():
+        return [([pattern.match(national_number) is not None
+                  for pattern in anchored_patterns],
+                 [pattern.match(national_number) is not None
+                  for pattern in leading_digits_patterns])
+                for (anchored_patterns, leading_digits_patterns),
+                    national_number in compiled_numbers]
+    return compile_time, match
+
+
+def time_match(matcher):
+    """Matches every number once and returns the time taken in seconds."""
+    start = time.time()
+    matcher()
+    return time.time() - start
+
+
+def run(runs, numbers, engine_names):
+    """Returns a mapping from engine name to the time compiling the patterns
+    took and the sorted durations of the runs matching them.
+
+    Raises:
+        AssertionError: the engines disagree on some number.
+    """
+    matchers = dict((name, _get_matcher(numbers,
+                                        regexengine.get_engine(name)))
+                    for name in engine_names)
+    expected_matches = matchers[engine_names[0]][1]()
+    for name in engine_names[1:]:
+        assert matchers[name][1]() == expected_matches, name
+    results = {}
+    for name in engine_names:
+        compile_time, matcher = matchers[name]
+        results[name] = (compile_time,
+                         sorted(time_match(matcher) for _ in xrange(runs)))
+    return results
+
+
+def main():
+    parser = optparse.OptionParser(USAGE)
+    parser.add_option("-n", "--runs", dest="runs", type="int", default=10,
+            help="Number of times to match every number (default: 10).")
+    parser.add_option("-e", "--engine", dest="engine_names", action="append",
+            default=[],
+            help="Engine to benchmark; may be repeated (default: every "
+                 "engine available).")
+    parser.add_option("-r", "--region", dest="region_codes", action="append",
+            default=[],
+            help="Region whose example numbers to match; may be repeated "
+                 "(default: every region).")
+    parser.add_option("-i", "--input", dest="input_xml_file",
+            default=formatting.DEFAULT_XML_FILE,
+            help="Metadata XML file to read the example numbers from.")
+    options = parser.parse_args()[0]
+
+    engine_names = (tuple(options.engine_names) or
+                    regexengine.get_available_engine_names())
+    numbers = load_numbers(options.input_xml_file, options.region_codes)
+    results = run(options.runs, numbers, engine_names)
+    print "%d example numbers" % len(numbers)
+    print "%-8s %12s %12s %16s" % ("engine", "compile (ms)", "median (ms)",
+                                   "numbers/second")
+    for name in engine_names:
+        compile_time, durations = results[name]
+        median = durations[len(durations) // 2]
+        print "%-8s %12.2f %12.2f %16.0f" % (name, compile_time * 1000,
+                                            median * 1000,
+                                            len(numbers) / median)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,4 +26,32 @@ META_DATA_FILE_PREFIX = os.path.join(
 TEST_META_DATA_FILE_PREFIX = os.path.join(
         _ROOT, "test", "data", "phonenumbermetadataproto_test")
 
+# The same prefixes relative to the phonenumbers package, for reading the
+# metadata as package resources (see metadatasource.PackageResourceSource).
+META_DATA_RESOURCE_PREFIX = "data/phonenumbermetadataproto"
+
+TEST_META_DATA_RESOURCE_PREFIX = "test/data/phonenumbermetadataproto_test"
+
+# Appended to a metadata file prefix to name the bundle file holding the
+# metadata for every region (see metadatabundle.py).
+META_DATA_BUNDLE_SUFFIX = ".bundle"
+
+# Appended to a metadata file prefix to name the file recording the content
+# hash of each territory built, which lets later builds skip unchanged ones.
+META_DATA_MANIFEST_SUFFIX = ".manifest"
+
 COUNTRY_CODE_TO_REGION_CODE_MAP_NAME = "country_code_to_region_code_map"
+
+# Name of the generated Python module holding the metadata for all regions,
+# and of the mapping it defines from region code to metadata.
+METADATA_MODULE_NAME = "metadata"
+REGION_CODES_BY_COUNTRY_CODE_NAME = "region_codes_by_country_code"
+COUNTRY_CODE_BY_REGION_CODE_NAME = "country_code_by_region_code"
+
+COUNTRY_TO_METADATA_NAME = "country_to_metadata"
+
+# Name of the generated Python module holding the DFA of the number
+# descriptions of each region (see dfacompiler.py), and of the mapping it
+# defines from region code to serialized DFA.
+DFA_MODULE_NAME = "metadatadfa"
+NUMBER_DESC_DFAS_NAME = "number_desc_dfas"
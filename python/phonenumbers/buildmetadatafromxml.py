@@ -5,34 +5,192 @@
 Based on BuildMetadataFromXml.java.
 """
 
+import hashlib
 import logging
 import re
 import xml.etree.ElementTree
 
+from phonenumbers import compiledmetadata
+from phonenumbers import dfacompiler
 from phonenumbers import phonemetadata_pb2
 
 
+# The phone number description elements of a territory, in the order they are
+# loaded. Each corresponds to a PhoneNumberDesc field of PhoneMetadata.
+NUMBER_TYPES = (
+    "generalDesc",
+    "fixedLine",
+    "mobile",
+    "tollFree",
+    "premiumRate",
+    "sharedCost",
+    "voip",
+    "personalNumber",
+    "pager",
+)
+
+
+class BuildProfile(object):
+    """Restricts the metadata built to what a deployment needs.
+
+    Attributes:
+        region_codes: the regions to build, or None for all of them.
+        number_types: the number description elements (see NUMBER_TYPES) to
+            build, or None for all of them. Other types are built as "NA", as
+            if the territory had no numbers of that type. The general
+            description is always built.
+        include_intl_formats: whether to build the intlNumberFormat elements.
+        include_example_numbers: whether to build example numbers.
+    """
+    def __init__(self, region_codes=None, number_types=None,
+                 include_intl_formats=True, include_example_numbers=True):
+        if region_codes is not None:
+            region_codes = frozenset(region_codes)
+        if number_types is not None:
+            unknown_types = set(number_types) - set(NUMBER_TYPES)
+            if unknown_types:
+                raise ValueError("Unknown number types: %s" %
+                                 ", ".join(sorted(unknown_types)))
+            number_types = frozenset(number_types) | frozenset(["generalDesc"])
+        self.region_codes = region_codes
+        self.number_types = number_types
+        self.include_intl_formats = include_intl_formats
+        self.include_example_numbers = include_example_numbers
+
+    def includes_region(self, region_code):
+        return self.region_codes is None or region_code in self.region_codes
+
+    def includes_number_type(self, number_type):
+        return self.number_types is None or number_type in self.number_types
+
+
 _lite_build = False
+_profile = BuildProfile()
 
 
-def build_phone_metadata_collection(input_xml_file, lite_build):
-    """Build the PhoneMetadataCollection from the input XML file."""
-    global _lite_build
-    _lite_build = lite_build
-    tree = xml.etree.ElementTree.parse(input_xml_file)
+def build_phone_metadata_collection(input_xml_file, lite_build, profile=None):
+    """Build the PhoneMetadataCollection from the input XML file.
+
+    If a BuildProfile is given, only the regions and parts of the metadata it
+    includes are built.
+    """
+    _set_build_options(lite_build, profile)
     metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
-    for territory in tree.getiterator("territory"):
-        region_code = territory.attrib["id"]
+    for territory in iter_territories(input_xml_file, _profile):
         # Unlike Java version, use add() to create new PhoneMetadata instance
         # and pass it to _load_country_metadata(). This saves having to make
         # a copy of all metadata when calling extend(). See 'Repeated Message
         # Fields' on
         # http://code.google.com/apis/protocolbuffers/docs/reference/python-generated.html
         metadata = metadata_collection.metadata.add()
-        _load_country_metadata(region_code, territory, metadata)
+        _load_country_metadata(territory.attrib["id"], territory, metadata)
     return metadata_collection
 
 
+def iter_phone_metadata(input_xml_file, lite_build, profile=None):
+    """Yields the PhoneMetadata of each territory in the input XML file, in
+    order, as soon as the territory has been read.
+
+    Unlike build_phone_metadata_collection(), neither the XML tree nor the
+    metadata of the territories already yielded is kept, so memory use does
+    not grow with the number of territories.
+    """
+    for territory in iter_territories(input_xml_file, profile):
+        yield build_metadata_for_territory(territory, lite_build, profile)
+
+
+def iter_territories(input_xml_file, profile=None):
+    """Yields the <territory> elements of the input XML file that profile
+    includes, parsing the file incrementally.
+
+    Each element is cleared, and detached from the tree, once the caller
+    moves on to the next one, so it must not be kept.
+    """
+    profile = profile or BuildProfile()
+    territories_element = None
+    for event, element in xml.etree.ElementTree.iterparse(
+            input_xml_file, events=("start", "end")):
+        if element.tag == "territories":
+            if event == "start":
+                territories_element = element
+            continue
+        if event != "end" or element.tag != "territory":
+            continue
+        if profile.includes_region(element.attrib["id"]):
+            yield element
+        element.clear()
+        if territories_element is not None:
+            territories_element.remove(element)
+
+
+def get_territory_hash(territory_element):
+    """Returns a digest of the content of a <territory> element, used to tell
+    which territories changed since a previous build."""
+    # The element's tail is not part of its content, and is not yet complete
+    # when iterparse() yields the element, so it is left out.
+    digest = hashlib.sha1(repr(sorted(territory_element.attrib.items())))
+    digest.update(territory_element.text or "")
+    for child in territory_element:
+        digest.update(xml.etree.ElementTree.tostring(child))
+    return digest.hexdigest()
+
+
+def build_metadata_for_territory(territory, lite_build, profile=None):
+    """Builds the PhoneMetadata for a single <territory> element."""
+    _set_build_options(lite_build, profile)
+    metadata = phonemetadata_pb2.PhoneMetadata()
+    _load_country_metadata(territory.attrib["id"], territory, metadata)
+    return metadata
+
+
+def build_territory_metadata(territory_xml, lite_build, profile=None):
+    """Builds the metadata for a single territory.
+
+    Takes and returns strings so that it can be run in a worker process.
+
+    Args:
+        territory_xml: the <territory> element, as XML text.
+        lite_build: as for build_phone_metadata_collection().
+        profile: as for build_phone_metadata_collection().
+    Returns:
+        the serialized PhoneMetadata for the territory.
+    """
+    return build_metadata_for_territory(
+            xml.etree.ElementTree.fromstring(territory_xml), lite_build,
+            profile).SerializeToString()
+
+
+def build_number_desc_dfa(serialized_metadata):
+    """Compiles the number descriptions of a region to a DFA (see
+    compiledmetadata.get_number_desc_regexes()).
+
+    Takes and returns strings so that it can be run in a worker process.
+
+    Args:
+        serialized_metadata: the serialized PhoneMetadata for the region.
+    Returns:
+        the DFA serialized by dfacompiler.dfa_to_string(), or None if the
+        region has no number descriptions or one of their patterns is not
+        supported by the DFA compiler.
+    """
+    metadata = phonemetadata_pb2.PhoneMetadata()
+    metadata.ParseFromString(serialized_metadata)
+    regexes = compiledmetadata.get_number_desc_regexes(metadata)
+    if not regexes:
+        return None
+    try:
+        return dfacompiler.dfa_to_string(dfacompiler.compile_dfa(regexes))
+    except dfacompiler.UnsupportedPatternError, e:
+        logging.warning("no DFA for %s: %s" % (metadata.id, e))
+        return None
+
+
+def _set_build_options(lite_build, profile):
+    global _lite_build, _profile
+    _lite_build = lite_build
+    _profile = profile or BuildProfile()
+
+
 def build_country_code_to_region_code_map(metadata_collection):
     """Build a mapping from a country calling code to the region codes which
     denote the country/region represented by that country code. In the case of
@@ -139,6 +297,8 @@ def _load_country_metadata(region_code, element, metadata):
         metadata.number_format.add().CopyFrom(format)
 
     for intl_number_format_element in element.getiterator("intlNumberFormat"):
+        if not _profile.include_intl_formats:
+            break
         format = phonemetadata_pb2.NumberFormat()
         _set_leading_digits_patterns(intl_number_format_element, format)
         format.pattern = _validate_re(intl_number_format_element.attrib["pattern"])
@@ -241,9 +401,10 @@ def _process_phone_number_desc_element(general_desc, country_element, number_typ
     phone_number_desc_list = country_element.findall(number_type)
     number_desc = phonemetadata_pb2.PhoneNumberDesc()
 
-    if (not phone_number_desc_list and
-        (number_type != "fixedLine" and number_type != "mobile") and
-        number_type != "generalDesc"):
+    if ((not phone_number_desc_list and
+         (number_type != "fixedLine" and number_type != "mobile") and
+         number_type != "generalDesc") or
+        not _profile.includes_number_type(number_type)):
         number_desc.national_number_pattern = "NA"
         number_desc.possible_number_pattern = "NA"
         return number_desc
@@ -260,7 +421,7 @@ def _process_phone_number_desc_element(general_desc, country_element, number_typ
         if valid_pattern:
             number_desc.national_number_pattern = \
                     _validate_re(valid_pattern[0].text, True)
-        if _lite_build:
+        if _lite_build and _profile.include_example_numbers:
             example_number = element.findall("exampleNumber")
             if example_number:
                 number_desc.example_number = example_number[0].text
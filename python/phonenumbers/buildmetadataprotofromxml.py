@@ -17,19 +17,41 @@
 buffer format. (Based on the Java version.)
 """
 
+import cStringIO as StringIO
+import gc
+import hashlib
+import json
 import logging
+import multiprocessing
 import optparse
 import os.path
 import pprint
+import re
+import shutil
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree
+
+from google.protobuf import descriptor
 
 from phonenumbers import buildmetadatafromxml
+from phonenumbers import countrycodeindex
 from phonenumbers import buildconstants
+from phonenumbers import metadataarray
+from phonenumbers import metadatabundle
 from phonenumbers import phonemetadata_pb2
+from phonenumbers import regexanalyzer
 
 
 USAGE = """Example command line invocation:
 ./buildmetadataprotofromxml.py -i PhoneNumberMetadata.xml -o .
-./buildmetadataprotofromxml.py -i PhoneNumberMetadataForTesting.xml -o test -vtl"""
+./buildmetadataprotofromxml.py -i PhoneNumberMetadataForTesting.xml -o test -vtl
+./buildmetadataprotofromxml.py -i PhoneNumberMetadata.xml -o . --dfa
+./buildmetadataprotofromxml.py -i PhoneNumberMetadata.xml -o . \\
+    --pattern-report=patterns.json --max-match-time=0.0001
+./buildmetadataprotofromxml.py -i PhoneNumberMetadata.xml -o . --regions=GB,US \\
+    --number-types=fixedLine,mobile,tollFree --drop-intl-formats"""
 
 
 COPYRIGHT_NOTICE = """\
@@ -56,6 +78,23 @@ not modify directly."""
 
 '''
 
+METADATA_COMMENT = """\
+# A mapping from a region code to the PhoneMetadata for that region, in the
+# array representation read by metadataarray.array_to_metadata().
+"""
+
+COUNTRY_CODE_INDEX_COMMENT = """\
+# The same mapping as a tuple indexed by country code, with None for the codes
+# that have no regions, and its reverse from region code to country code (see
+# countrycodeindex.py).
+"""
+
+DFA_COMMENT = """\
+# A mapping from a region code to the DFA of the number descriptions of that
+# region, serialized by dfacompiler.dfa_to_string(). Regions whose patterns
+# the DFA compiler does not support are left out.
+"""
+
 MAPPING_COMMENT = """\
 # A mapping from a country code to the region codes which denote the
 # country/region represented by that country code. In the case of multiple
@@ -71,8 +110,9 @@ def main():
                  "format.")
     parser.add_option("-o", "--output-dir", dest="output_dir",
             help="The output directory to store phone number metadata in "
-                 "proto format (one file per region) and the country code to "
-                 "region code mapping file.")
+                 "proto format (one file per region, plus a bundle file "
+                 "holding all regions), the metadata Python module and the "
+                 "country code to region code mapping file.")
     parser.add_option("-t", "--for-testing", dest="for_testing", 
             action="store_true", default=False,
             help="Flag whether to generate metadata for testing purposes or "
@@ -83,6 +123,51 @@ def main():
                  "(default: false). When set to true certain metadata will "
                  "be omitted. At this moment, example numbers information is "
                  "omitted.")
+    parser.add_option("--regions", dest="regions",
+            help="Comma-separated list of the region codes to build "
+                 "(default: all regions).")
+    parser.add_option("--number-types", dest="number_types",
+            help="Comma-separated list of the number types to build, named "
+                 "as in the XML, e.g. fixedLine,mobile,tollFree (default: all "
+                 "types). Other types are built as having no numbers.")
+    parser.add_option("--drop-intl-formats", dest="drop_intl_formats",
+            action="store_true", default=False,
+            help="Omit the international number formats (default: false).")
+    parser.add_option("--drop-example-numbers", dest="drop_example_numbers",
+            action="store_true", default=False,
+            help="Omit the example numbers (default: false).")
+    parser.add_option("-j", "--jobs", dest="jobs", type="int",
+            default=multiprocessing.cpu_count(),
+            help="Number of processes to build changed territories with "
+                 "(default: number of CPUs).")
+    parser.add_option("-f", "--force", dest="force",
+            action="store_true", default=False,
+            help="Rebuild every territory, not only those changed since the "
+                 "last build (default: false).")
+    parser.add_option("-s", "--streaming", dest="streaming",
+            action="store_true", default=False,
+            help="Build one territory at a time while the input file is "
+                 "read, writing each as soon as it is built, so that neither "
+                 "the XML tree nor the metadata of more than one territory "
+                 "is held; the bundle and the modules are assembled from "
+                 "temporary files (default: false). Territories are then "
+                 "built in this process only.")
+    parser.add_option("-d", "--dfa", dest="dfa",
+            action="store_true", default=False,
+            help="Also compile the number descriptions of each region to a "
+                 "DFA, written to a module next to the metadata module, for "
+                 "matching numbers in linear time (default: false).")
+    parser.add_option("--pattern-report", dest="pattern_report",
+            help="Analyse the patterns of the metadata for catastrophic "
+                 "backtracking (see regexanalyzer.py) and write the report, "
+                 "slowest pattern first, to this JSON file.")
+    parser.add_option("--max-match-time", dest="max_match_time",
+            type="float",
+            help="Analyse the patterns as for --pattern-report and fail the "
+                 "build, before any output is written unless streaming, if "
+                 "the worst case match time of one exceeds this many "
+                 "seconds. The territories built are then not recorded as "
+                 "built, so the next build rebuilds and analyses them again.")
     parser.add_option("-v", "--verbose", dest="verbose", 
             action="store_true", default=False,
             help="Log debug information (default: false).")
@@ -93,42 +178,623 @@ def main():
         logging.basicConfig(level=logging.DEBUG)
     logging.debug("parsed options: %s" % options)
 
-    metadata_collection = buildmetadatafromxml.build_phone_metadata_collection(
-            options.input_file, options.lite_build)
-    
-    _generate_metadata_proto_files(metadata_collection, options)
+    profile = _get_build_profile(options)
+    if options.streaming:
+        if profile is not None:
+            logging.info("not reporting build profile savings, which needs "
+                         "the whole metadata in memory")
+        _build_streaming(options, profile)
+        return
+
+    metadata_collection, changed_region_codes, manifest = \
+            _build_changed_territories(options, profile)
+    print "Built %d of %d territories" % (len(changed_region_codes),
+                                          len(metadata_collection.metadata))
+    _analyze_patterns(metadata_collection.metadata, options)
+    if profile is not None:
+        _report_build_profile_savings(metadata_collection, options)
+
+    _generate_metadata_proto_files(metadata_collection, options,
+                                   changed_region_codes)
+    _generate_metadata_bundle_file(metadata_collection, options)
+    _write_metadata_to_python_file(metadata_collection, options)
     _write_country_calling_code_mapping_to_python_file(metadata_collection,
             options)
+    if options.dfa:
+        _write_dfa_module(_build_number_desc_dfas(
+                [(str(metadata.id), metadata.SerializeToString())
+                 for metadata in metadata_collection.metadata], options),
+                options)
+    # Last, so that a build that fails before this is redone in full.
+    _write_manifest(options, *manifest)
+
+
+def _build_changed_territories(options, profile):
+    """Builds the metadata of the territories whose content hash differs from
+    the one recorded by the previous build, and reads that of the others from
+    their existing metadata files.
+
+    Returns:
+        the PhoneMetadataCollection of all territories built, in the order of
+        the input file, the set of region codes actually rebuilt, and the
+        (build key, territory hashes) arguments of _write_manifest() to call
+        once every output is written.
+    """
+    file_prefix = _get_file_prefix(options)
+    build_key, previous_hashes = _read_manifest(options, profile)
+    region_codes = []
+    territory_hashes = {}
+    changed_territory_xmls = []
+    for territory in buildmetadatafromxml.iter_territories(options.input_file,
+                                                           profile):
+        region_code = territory.attrib["id"]
+        region_codes.append(region_code)
+        territory_hashes[region_code] = \
+                buildmetadatafromxml.get_territory_hash(territory)
+        if _is_territory_changed(file_prefix, region_code, previous_hashes,
+                                 territory_hashes):
+            changed_territory_xmls.append(
+                    (region_code, xml.etree.ElementTree.tostring(territory)))
+    serialized_metadata = _build_territories(changed_territory_xmls, options,
+                                             profile)
+
+    metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    for region_code in region_codes:
+        metadata = metadata_collection.metadata.add()
+        if region_code in serialized_metadata:
+            metadata.ParseFromString(serialized_metadata[region_code])
+        else:
+            metadata.CopyFrom(_read_metadata_proto_file(
+                    file_prefix + "_" + region_code))
+    return (metadata_collection, set(serialized_metadata),
+            (build_key, territory_hashes))
+
+
+def _build_streaming(options, profile):
+    """Builds and writes the metadata one territory at a time.
+
+    Neither the XML tree nor the PhoneMetadata of more than one territory is
+    ever held: the serialized metadata of each territory, its entry of the
+    metadata module and its DFA go to temporary files as soon as it is built,
+    and its patterns are analysed there and then. The bundle and the modules
+    are assembled from those files at the end.
+    """
+    file_prefix = _get_file_prefix(options)
+    build_key, previous_hashes = _read_manifest(options, profile)
+    territory_hashes = {}
+    changed_region_codes = set()
+    bundle_region_lengths = []
+    bundle_data_file = tempfile.TemporaryFile()
+    metadata_arrays_file = tempfile.TemporaryFile()
+    dfas = None
+    if options.dfa:
+        dfas = _SpooledDFAs()
+    pattern_analyzer = _get_pattern_analyzer(options)
+    # Just the fields needed for the country code mapping of each region.
+    mapping_metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    try:
+        for territory in buildmetadatafromxml.iter_territories(
+                options.input_file, profile):
+            region_code = territory.attrib["id"]
+            territory_hashes[region_code] = \
+                    buildmetadatafromxml.get_territory_hash(territory)
+            if _is_territory_changed(file_prefix, region_code,
+                                     previous_hashes, territory_hashes):
+                metadata = buildmetadatafromxml.build_metadata_for_territory(
+                        territory, options.lite_build, profile)
+                _write_metadata_proto_file(file_prefix, metadata)
+                changed_region_codes.add(region_code)
+            else:
+                metadata = _read_metadata_proto_file(
+                        file_prefix + "_" + region_code)
+            serialized_metadata = metadata.SerializeToString()
+            bundle_data_file.write(serialized_metadata)
+            bundle_region_lengths.append((str(region_code),
+                                          len(serialized_metadata)))
+            metadata_arrays_file.write(_format_metadata_array(metadata))
+            if pattern_analyzer is not None:
+                pattern_analyzer.add_metadata(metadata)
+            if dfas is not None:
+                dfa = buildmetadatafromxml.build_number_desc_dfa(
+                        serialized_metadata)
+                if dfa is not None:
+                    dfas[str(region_code)] = dfa
+            mapping_metadata = mapping_metadata_collection.metadata.add()
+            mapping_metadata.id = metadata.id
+            mapping_metadata.country_code = metadata.country_code
+            mapping_metadata.main_country_for_code = \
+                    metadata.main_country_for_code
+        print "Built %d of %d territories" % (len(changed_region_codes),
+                                              len(bundle_region_lengths))
+        # The territories were written as they were built, so this can only
+        # fail the build after the fact, but before the manifest records them
+        # as built.
+        if pattern_analyzer is not None:
+            _check_pattern_reports(pattern_analyzer.get_reports(), options)
+
+        def write_bundle(bundle_file):
+            metadatabundle.write_bundle_index(bundle_file,
+                                              bundle_region_lengths)
+            bundle_data_file.seek(0)
+            shutil.copyfileobj(bundle_data_file, bundle_file)
+        _replace_file_if_changed(
+                file_prefix + buildconstants.META_DATA_BUNDLE_SUFFIX,
+                write_bundle)
+        _write_metadata_module(
+                _build_country_code_to_region_code_map(
+                        mapping_metadata_collection),
+                metadata_arrays_file, options)
+        _write_country_calling_code_mapping_to_python_file(
+                mapping_metadata_collection, options)
+        if dfas is not None:
+            _write_dfa_module(dfas, options)
+    finally:
+        bundle_data_file.close()
+        metadata_arrays_file.close()
+        if dfas is not None:
+            dfas.close()
+    _write_manifest(options, build_key, territory_hashes)
+
+
+class _SpooledDFAs(object):
+    """The serialized DFAs of the regions, kept in a temporary file rather
+    than in memory, and read back by region code as from a dict."""
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._index = {}
+
+    def __setitem__(self, region_code, dfa):
+        self._file.seek(0, os.SEEK_END)
+        self._index[region_code] = (self._file.tell(), len(dfa))
+        self._file.write(dfa)
+
+    def __getitem__(self, region_code):
+        offset, length = self._index[region_code]
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def close(self):
+        self._file.close()
+
+
+def _read_manifest(options, profile):
+    """Returns the key identifying the options the output depends on and the
+    territory hashes recorded by the previous build with the same key."""
+    manifest_file_name = (_get_file_prefix(options) +
+                          buildconstants.META_DATA_MANIFEST_SUFFIX)
+    # The options that change the output, and changes to the builder itself,
+    # invalidate every territory.
+    build_key = repr((options.lite_build, _describe_build_profile(profile),
+                      _get_builder_digest()))
+    previous_hashes = {}
+    if not options.force and os.path.exists(manifest_file_name):
+        manifest_file = open(manifest_file_name)
+        manifest = json.load(manifest_file)
+        manifest_file.close()
+        if manifest["build_key"] == build_key:
+            previous_hashes = manifest["territory_hashes"]
+    return build_key, previous_hashes
+
+
+def _get_builder_digest():
+    """Returns a digest of the sources of the modules that decide the content
+    of the metadata files."""
+    digest = hashlib.sha1()
+    for module_file_name in (__file__, buildmetadatafromxml.__file__,
+                             phonemetadata_pb2.__file__):
+        # The module may have been imported from its bytecode.
+        source_file = open(os.path.splitext(module_file_name)[0] + ".py",
+                           "rb")
+        try:
+            digest.update(source_file.read())
+        finally:
+            source_file.close()
+    return digest.hexdigest()
+
+
+def _is_territory_changed(file_prefix, region_code, previous_hashes,
+                          territory_hashes):
+    return (previous_hashes.get(region_code) !=
+                    territory_hashes[region_code] or
+            not os.path.exists(file_prefix + "_" + region_code))
+
+
+def _write_manifest(options, build_key, territory_hashes):
+    """Records the territory hashes of this build and removes the metadata
+    files of the territories no longer built, found by listing the output
+    directory, as the previous manifest may be missing or from a build with
+    another key."""
+    file_prefix = _get_file_prefix(options)
+    output_dir, prefix = os.path.split(file_prefix)
+    region_file_pattern = re.compile(re.escape(prefix) + "_([A-Z0-9]+)$")
+    for file_name in sorted(os.listdir(output_dir)):
+        match = region_file_pattern.match(file_name)
+        if match and match.group(1) not in territory_hashes:
+            stale_file_name = os.path.join(output_dir, file_name)
+            logging.debug("removing file: %s" % stale_file_name)
+            os.remove(stale_file_name)
+    _write_file_if_changed(
+            file_prefix + buildconstants.META_DATA_MANIFEST_SUFFIX,
+            json.dumps({"build_key": build_key,
+                        "territory_hashes": territory_hashes},
+                       indent=1, sort_keys=True) + "\n")
+
+
+def _build_territories(territory_xmls, options, profile):
+    """Returns a dict mapping the region code of each territory to its
+    serialized PhoneMetadata, building them across a process pool.
+
+    Args:
+        territory_xmls: a list of (region code, <territory> element as XML
+            text) pairs.
+    """
+    if options.jobs <= 1 or len(territory_xmls) <= 1:
+        return dict((region_code,
+                     buildmetadatafromxml.build_territory_metadata(
+                             territory_xml, options.lite_build, profile))
+                    for region_code, territory_xml in territory_xmls)
+    pool = multiprocessing.Pool(min(options.jobs, len(territory_xmls)))
+    try:
+        results = [(region_code, pool.apply_async(
+                            buildmetadatafromxml.build_territory_metadata,
+                            (territory_xml, options.lite_build, profile)))
+                   for region_code, territory_xml in territory_xmls]
+        return dict((region_code, result.get())
+                    for region_code, result in results)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _build_number_desc_dfas(serialized_regions, options):
+    """Returns a dict mapping the region code of each region that has one to
+    its serialized number description DFA, compiling them across a process
+    pool.
+
+    Args:
+        serialized_regions: a list of (region code, serialized PhoneMetadata)
+            pairs.
+    """
+    if options.jobs <= 1 or len(serialized_regions) <= 1:
+        dfas = [(region_code,
+                 buildmetadatafromxml.build_number_desc_dfa(serialized_metadata))
+                for region_code, serialized_metadata in serialized_regions]
+    else:
+        pool = multiprocessing.Pool(min(options.jobs, len(serialized_regions)))
+        try:
+            results = [(region_code, pool.apply_async(
+                                buildmetadatafromxml.build_number_desc_dfa,
+                                (serialized_metadata,)))
+                       for region_code, serialized_metadata in
+                       serialized_regions]
+            dfas = [(region_code, result.get())
+                    for region_code, result in results]
+        finally:
+            pool.close()
+            pool.join()
+    return dict((region_code, dfa) for region_code, dfa in dfas
+                if dfa is not None)
+
+
+def _analyze_patterns(metadata_list, options):
+    """Runs regexanalyzer over the patterns of metadata_list if
+    --pattern-report or --max-match-time is given, writing the report and
+    exiting if a pattern is slower than --max-match-time."""
+    pattern_analyzer = _get_pattern_analyzer(options)
+    if pattern_analyzer is None:
+        return
+    for metadata in metadata_list:
+        pattern_analyzer.add_metadata(metadata)
+    _check_pattern_reports(pattern_analyzer.get_reports(), options)
+
+
+def _get_pattern_analyzer(options):
+    """Returns a regexanalyzer.MetadataAnalyzer if --pattern-report or
+    --max-match-time is given, or None."""
+    if options.pattern_report is None and options.max_match_time is None:
+        return None
+    return regexanalyzer.MetadataAnalyzer()
+
+
+def _check_pattern_reports(reports, options):
+    """Logs the issues of the pattern reports, writes them to
+    --pattern-report and exits if a pattern is slower than
+    --max-match-time."""
+    for report in reports:
+        for issue in report.issues:
+            logging.warning("%s in %s pattern %s of %s" % (
+                    issue, report.kind, report.regex,
+                    ",".join(report.region_codes)))
+    if reports:
+        print ("Analysed %d patterns, slowest %.2f microseconds for %r" %
+               (len(reports), reports[0].max_time * 1e6,
+                reports[0].regex))
+    if options.pattern_report is not None:
+        report_file = open(options.pattern_report, "w")
+        try:
+            json.dump([report.to_dict() for report in reports], report_file,
+                      indent=1, sort_keys=True)
+        finally:
+            report_file.close()
+    if options.max_match_time is not None:
+        slow_reports = [report for report in reports
+                        if report.max_time > options.max_match_time]
+        for report in slow_reports:
+            logging.error("%s pattern %s of %s took %.2f microseconds on %s" %
+                          (report.kind, report.regex,
+                           ",".join(report.region_codes),
+                           report.max_time * 1e6, report.worst_input))
+        if slow_reports:
+            sys.exit("%d patterns exceed the maximum match time of %g "
+                     "seconds" % (len(slow_reports), options.max_match_time))
+
+
+def _describe_build_profile(profile):
+    if profile is None:
+        return None
+    return (profile.region_codes and sorted(profile.region_codes),
+            profile.number_types and sorted(profile.number_types),
+            profile.include_intl_formats, profile.include_example_numbers)
 
 
-def _generate_metadata_proto_files(metadata_collection, options):
-    # Generate metadata proto files
+def _read_metadata_proto_file(file_name):
+    input_for_region = open(file_name, "rb")
+    metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    metadata_collection.ParseFromString(input_for_region.read())
+    input_for_region.close()
+    return metadata_collection.metadata[0]
+
+
+def _replace_file_if_changed(file_name, write_content):
+    """Like _write_file_if_changed(), but for content too large to hold in
+    memory: write_content(output_file) writes it to a temporary file, which
+    then replaces file_name unless the two files are the same."""
+    temp_file_name = file_name + ".tmp"
+    output_file = open(temp_file_name, "wb")
+    try:
+        write_content(output_file)
+    finally:
+        output_file.close()
+    if os.path.exists(file_name) and _are_files_equal(file_name,
+                                                      temp_file_name):
+        logging.debug("unchanged: %s" % file_name)
+        os.remove(temp_file_name)
+        return False
+    logging.debug("writing file: %s" % file_name)
+    os.rename(temp_file_name, file_name)
+    return True
+
+
+def _are_files_equal(file_name, other_file_name):
+    if os.path.getsize(file_name) != os.path.getsize(other_file_name):
+        return False
+    first_file = open(file_name, "rb")
+    second_file = open(other_file_name, "rb")
+    try:
+        while True:
+            first_block = first_file.read(65536)
+            if first_block != second_file.read(65536):
+                return False
+            if not first_block:
+                return True
+    finally:
+        first_file.close()
+        second_file.close()
+
+
+def _write_file_if_changed(file_name, content):
+    """Writes content to file_name unless the file already holds exactly that
+    content, so that unchanged outputs keep their modification time."""
+    if os.path.exists(file_name):
+        existing_file = open(file_name, "rb")
+        existing_content = existing_file.read()
+        existing_file.close()
+        if existing_content == content:
+            logging.debug("unchanged: %s" % file_name)
+            return False
+    logging.debug("writing file: %s" % file_name)
+    output_file = open(file_name, "wb")
+    output_file.write(content)
+    output_file.close()
+    return True
+
+
+def _get_build_profile(options):
+    if not (options.regions or options.number_types or
+            options.drop_intl_formats or options.drop_example_numbers):
+        return None
+    region_codes = None
+    if options.regions:
+        region_codes = options.regions.split(",")
+    number_types = None
+    if options.number_types:
+        number_types = options.number_types.split(",")
+    return buildmetadatafromxml.BuildProfile(
+            region_codes, number_types,
+            include_intl_formats=not options.drop_intl_formats,
+            include_example_numbers=not options.drop_example_numbers)
+
+
+def _report_build_profile_savings(metadata_collection, options):
+    # Compare against the metadata that would be built without the profile
+    full_metadata_collection = \
+            buildmetadatafromxml.build_phone_metadata_collection(
+                    options.input_file, options.lite_build)
+    full = _measure_metadata_collection(full_metadata_collection)
+    profiled = _measure_metadata_collection(metadata_collection)
+    print "%-22s %14s %14s %14s" % ("", "full", "profile", "delta")
+    for name, full_value, profiled_value in zip(
+            ("regions", "serialized bytes", "decode time (ms)",
+             "decoded memory (KiB)"), full, profiled):
+        print "%-22s %14.1f %14.1f %14.1f" % (name, full_value, profiled_value,
+                profiled_value - full_value)
+
+
+def _measure_metadata_collection(metadata_collection):
+    """Returns the number of regions in metadata_collection, its serialized
+    size in bytes, the time in milliseconds to decode the metadata of every
+    region and the approximate memory in KiB held by the decoded metadata."""
+    serialized_regions = [metadata.SerializeToString()
+                          for metadata in metadata_collection.metadata]
+    best_time = None
+    for _ in xrange(3):
+        start = time.time()
+        decoded_regions = []
+        for data in serialized_regions:
+            metadata = phonemetadata_pb2.PhoneMetadata()
+            metadata.ParseFromString(data)
+            decoded_regions.append(metadata)
+        elapsed = time.time() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    return (len(serialized_regions),
+            sum(len(data) for data in serialized_regions),
+            best_time * 1000,
+            _get_approximate_size(decoded_regions) / 1024.0)
+
+
+def _get_approximate_size(root):
+    """Sums the sizes of the objects reachable from root, not counting the
+    classes and protocol buffer descriptors they share with other messages."""
+    seen = set()
+    size = 0
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if (id(obj) in seen or isinstance(obj, type) or
+            isinstance(obj, descriptor.DescriptorBase)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return size
+
+
+def _get_file_prefix(options):
     if options.for_testing:
-        file_prefix = os.path.join(options.output_dir,
+        return os.path.join(options.output_dir,
                 buildconstants.TEST_META_DATA_FILE_PREFIX)
-    else:
-        file_prefix = os.path.join(options.output_dir,
-                buildconstants.META_DATA_FILE_PREFIX)
+    return os.path.join(options.output_dir,
+            buildconstants.META_DATA_FILE_PREFIX)
+
+
+def _generate_metadata_proto_files(metadata_collection, options,
+                                   region_codes=None):
+    # Generate metadata proto files, only for region_codes if given
+    file_prefix = _get_file_prefix(options)
     logging.debug("file_prefix: %s" % file_prefix)
 
     for metadata in metadata_collection.metadata:
-        region_code = metadata.id
-        out_metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
-        out_metadata_collection.metadata.add().CopyFrom(metadata)
-        output_filename = file_prefix + "_" + region_code
-        logging.debug("writing file: %s" % output_filename)
-        output_for_region = open(output_filename, "wb")
-        output_for_region.write(
-                out_metadata_collection.SerializeToString())
-        output_for_region.close()
+        if region_codes is not None and metadata.id not in region_codes:
+            continue
+        _write_metadata_proto_file(file_prefix, metadata)
     return metadata_collection
-    
 
-def _write_country_calling_code_mapping_to_python_file(metadata_collection,
-                                                       options):
+
+def _write_metadata_proto_file(file_prefix, metadata):
+    out_metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    out_metadata_collection.metadata.add().CopyFrom(metadata)
+    output_filename = file_prefix + "_" + metadata.id
+    logging.debug("writing file: %s" % output_filename)
+    output_for_region = open(output_filename, "wb")
+    output_for_region.write(out_metadata_collection.SerializeToString())
+    output_for_region.close()
+
+
+def _generate_metadata_bundle_file(metadata_collection, options):
+    _write_bundle_file([(str(metadata.id), metadata.SerializeToString())
+                        for metadata in metadata_collection.metadata],
+                       options)
+
+
+def _write_bundle_file(serialized_regions, options):
+    # Generate a single bundle file indexed by region code
+    bundle_filename = (_get_file_prefix(options) +
+                       buildconstants.META_DATA_BUNDLE_SUFFIX)
+    output_bundle = StringIO.StringIO()
+    metadatabundle.write_serialized_bundle(output_bundle, serialized_regions)
+    _write_file_if_changed(bundle_filename, output_bundle.getvalue())
+
+
+def _write_metadata_to_python_file(metadata_collection, options):
+    _write_metadata_module(
+            _build_country_code_to_region_code_map(metadata_collection),
+            StringIO.StringIO("".join(_format_metadata_array(metadata)
+                              for metadata in metadata_collection.metadata)),
+            options)
+
+
+def _format_metadata_array(metadata):
+    return "%r: %r,\n" % (str(metadata.id),
+                          metadataarray.message_to_array(metadata))
+
+
+def _write_metadata_module(country_code_to_region_code_map,
+                           metadata_arrays_file, options):
+    # Same module layout as generated by BuildMetadataPythonFromXml.java
+    module_name = buildconstants.METADATA_MODULE_NAME
+    if options.for_testing:
+        module_name += "fortesting"
+    elif options.lite_build:
+        module_name += "lite"
+    module_file_name = os.path.join(options.output_dir, module_name + ".py")
+
+    def write_module(module_file):
+        module_file.write(COPYRIGHT_NOTICE)
+        module_file.write(MODULE_COMMENT)
+        module_file.write(MAPPING_COMMENT)
+        module_file.write("%s = " %
+                          buildconstants.COUNTRY_CODE_TO_REGION_CODE_MAP_NAME)
+        pprint.pprint(country_code_to_region_code_map, module_file)
+        module_file.write("\n")
+        _write_country_code_index(country_code_to_region_code_map,
+                                  module_file)
+        module_file.write("\n")
+        module_file.write(METADATA_COMMENT)
+        module_file.write("%s = {\n" %
+                          buildconstants.COUNTRY_TO_METADATA_NAME)
+        metadata_arrays_file.seek(0)
+        shutil.copyfileobj(metadata_arrays_file, module_file)
+        module_file.write("}\n")
+    _replace_file_if_changed(module_file_name, write_module)
+
+
+def _write_dfa_module(dfas, options):
+    module_name = buildconstants.DFA_MODULE_NAME
+    if options.for_testing:
+        module_name += "fortesting"
+    elif options.lite_build:
+        module_name += "lite"
+    module_file_name = os.path.join(options.output_dir, module_name + ".py")
+
+    def write_module(module_file):
+        module_file.write(COPYRIGHT_NOTICE)
+        module_file.write(MODULE_COMMENT)
+        module_file.write(DFA_COMMENT)
+        module_file.write("%s = {\n" % buildconstants.NUMBER_DESC_DFAS_NAME)
+        for region_code in sorted(dfas):
+            module_file.write("%r: %r,\n" % (region_code, dfas[region_code]))
+        module_file.write("}\n")
+    _replace_file_if_changed(module_file_name, write_module)
+
+
+def _build_country_code_to_region_code_map(metadata_collection):
     country_code_to_region_code_map = \
             buildmetadatafromxml.build_country_code_to_region_code_map(
                     metadata_collection)
+    for region_codes in country_code_to_region_code_map.values():
+        region_codes[:] = [str(region_code) for region_code in region_codes]
+    return country_code_to_region_code_map
+
+
+def _write_country_calling_code_mapping_to_python_file(metadata_collection,
+                                                       options):
+    country_code_to_region_code_map = \
+            _build_country_code_to_region_code_map(metadata_collection)
     mapping_name = buildconstants.COUNTRY_CODE_TO_REGION_CODE_MAP_NAME
     module_name = mapping_name.replace("_", "")
     if options.for_testing:
@@ -137,15 +803,34 @@ def _write_country_calling_code_mapping_to_python_file(metadata_collection,
     mapping_file_name = os.path.join(options.output_dir, module_name)
 
     logging.debug("%s = %s" % (mapping_name, country_code_to_region_code_map))
-    logging.debug("writing map to %s" % mapping_file_name)
-    
-    mapping_file = open(mapping_file_name, "w")
+
+    mapping_file = StringIO.StringIO()
     mapping_file.write(COPYRIGHT_NOTICE) 
     mapping_file.write(MODULE_COMMENT) 
     mapping_file.write(MAPPING_COMMENT)
     mapping_file.write("%s = " % mapping_name)
     pprint.pprint(country_code_to_region_code_map, mapping_file)
-    mapping_file.close()
+    mapping_file.write("\n")
+    _write_country_code_index(country_code_to_region_code_map, mapping_file)
+    # Only rewrite the module when the mapping changes, so that its bytecode
+    # stays valid.
+    _write_file_if_changed(mapping_file_name, mapping_file.getvalue())
+
+
+def _write_country_code_index(country_code_to_region_code_map, module_file):
+    module_file.write(COUNTRY_CODE_INDEX_COMMENT)
+    module_file.write("%s = (\n" %
+                      buildconstants.REGION_CODES_BY_COUNTRY_CODE_NAME)
+    region_codes_by_country_code = \
+            countrycodeindex.build_region_codes_by_country_code(
+                    country_code_to_region_code_map)
+    for country_code, region_codes in enumerate(region_codes_by_country_code):
+        module_file.write("    %r,  # %d\n" % (region_codes, country_code))
+    module_file.write(")\n")
+    module_file.write("%s = " %
+                      buildconstants.COUNTRY_CODE_BY_REGION_CODE_NAME)
+    pprint.pprint(countrycodeindex.build_country_code_by_region_code(
+                          country_code_to_region_code_map), module_file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,452 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Phone number metadata with its regular expressions compiled.
+
+A CompiledPhoneMetadata is built once for each region and holds, next to the
+PhoneMetadata it wraps, compiled pattern objects for every PhoneNumberDesc and
+NumberFormat, so that matching a number never goes through a regular
+expression cache. Patterns that must match a whole number are compiled
+anchored at both ends (see patternpool.anchor_regex()), so a single match()
+call decides.
+
+The number type of a national number is decided in one scan as well: the
+descriptions of a region are combined into a single alternation with a named
+group per number type, in the order the types take precedence, so the first
+alternative that matches names the type (see
+CompiledPhoneMetadata.match_number_type()).
+
+Format templates such as "$1 $2-$3" are expanded up front as well, into the
+literal text between the groups and the indices of the groups, so that
+formatting a number takes one match() and one string join rather than parsing
+the template again for every number.
+
+Where the build compiled the descriptions of a region to a DFA (see
+dfacompiler.py and the --dfa option of buildmetadataprotofromxml.py), the
+descriptions and the number type are matched with the DFA instead, which takes
+time linear in the length of the number however the patterns are written.
+
+The patterns are obtained from a pattern compiler: an object with methods
+get_pattern(regex) and get_anchored_pattern(regex), such as a
+patternpool.PatternPool, which shares them between regions.
+"""
+
+import re
+
+from phonenumbers import leadingdigitstrie
+from phonenumbers import patternpool
+
+
+# A group reference in a format template, such as the $2 of "$1 $2-$3".
+_GROUP_REFERENCE_PATTERN = re.compile(u"\\$(\\d)")
+# A group reference directly followed by a digit, which re.sub() would read as
+# a two-digit group index.
+_AMBIGUOUS_GROUP_REFERENCE_PATTERN = re.compile(u"\\$\\d\\d")
+
+# The number of formats from which they are selected through a
+# LeadingDigitsTrie rather than all tried in turn.
+_MIN_FORMATS_FOR_TRIE = 5
+
+# The fields of the number type descriptions, in the order a number is tested
+# against them: a number is of the first type it matches.
+NUMBER_TYPE_FIELDS = (
+    "premium_rate",
+    "toll_free",
+    "shared_cost",
+    "voip",
+    "personal_number",
+    "pager",
+    "fixed_line",
+    "mobile",
+)
+
+
+def get_number_desc_regexes(metadata):
+    """Returns the regular expressions a DFA for the number descriptions of
+    metadata is compiled from: the possible number pattern and the national
+    number pattern of each PhoneNumberDesc that has both, in the order of
+    patternpool.NUMBER_DESC_FIELDS."""
+    regexes = []
+    for field_name in _get_dfa_field_names(metadata):
+        number_desc = getattr(metadata, field_name)
+        regexes.append(number_desc.possible_number_pattern)
+        regexes.append(number_desc.national_number_pattern)
+    return tuple(regexes)
+
+
+def _get_dfa_field_names(metadata):
+    return [field_name for field_name in patternpool.NUMBER_DESC_FIELDS
+            if getattr(metadata, field_name).HasField("national_number_pattern")
+            and getattr(metadata, field_name).HasField(
+                    "possible_number_pattern")]
+
+
+def expand_template(template):
+    """Expands a format template into the literal and group segments it is
+    made of.
+
+    Args:
+        template: a format template such as "$1 $2-$3".
+    Returns:
+        a tuple of a %-format string holding the literal segments, with a %s
+        for each group reference, and a tuple of the referenced group indices
+        in order; ("%s %s-%s", (1, 2, 3)) for the example above. The template
+        is None if re.sub() would read it differently, because it holds a
+        backslash or a group reference followed by a digit, so that such
+        templates go through re instead.
+    """
+    if (u"\\" in template or
+        _AMBIGUOUS_GROUP_REFERENCE_PATTERN.search(template)):
+        return None, ()
+    segments = _GROUP_REFERENCE_PATTERN.split(template)
+    # split() alternates literal segments with the captured group indices.
+    literals = [literal.replace(u"%", u"%%") for literal in segments[::2]]
+    return (u"%s".join(literals),
+            tuple(int(group_index) for group_index in segments[1::2]))
+
+
+class CompiledNumberDesc(object):
+    """A PhoneNumberDesc with its patterns compiled and anchored.
+
+    Attributes:
+        has_national_number_pattern: whether the description has a national
+            number pattern at all.
+        national_number_pattern: the anchored national number pattern.
+        possible_number_pattern: the anchored possible number pattern.
+        dfa: the DFA of the number descriptions of the region, if the
+            description is matched with it, or None.
+        dfa_mask: the accept mask bits of the patterns of the description in
+            the DFA.
+        possible_lengths_mask: the bitmask of the lengths of the possible
+            numbers of the description, where bit n stands for length n (see
+            PatternPool.get_possible_lengths_mask()), or 0 if the
+            description lacks a pattern; callers filtering many numbers can
+            check (mask >> len(number)) & 1 before matching.
+        engine: the regexengine.RegexEngine the patterns are matched with.
+    """
+    __slots__ = ("has_national_number_pattern", "national_number_pattern",
+                 "possible_number_pattern", "dfa", "dfa_mask",
+                 "possible_lengths_mask", "engine")
+
+    def __init__(self, number_desc, pattern_compiler, region_code=None):
+        self.has_national_number_pattern = \
+                number_desc.HasField("national_number_pattern")
+        self.national_number_pattern = pattern_compiler.get_anchored_pattern(
+                number_desc.national_number_pattern, region_code)
+        self.possible_number_pattern = pattern_compiler.get_anchored_pattern(
+                number_desc.possible_number_pattern, region_code)
+        self.engine = pattern_compiler.engine
+        self.dfa = None
+        self.dfa_mask = 0
+        if (self.national_number_pattern is None or
+            self.possible_number_pattern is None):
+            # A description without patterns matches no number.
+            self.possible_lengths_mask = 0
+        else:
+            self.possible_lengths_mask = \
+                    pattern_compiler.get_possible_lengths_mask(
+                            number_desc.possible_number_pattern)
+
+    def matches(self, national_number):
+        """Returns whether national_number is a possible number and matches
+        the national number pattern in full."""
+        # Numbers of other lengths are rejected before any pattern is tried.
+        if not (self.possible_lengths_mask >> len(national_number)) & 1:
+            return False
+        if self.dfa is not None:
+            return (self.dfa.match_mask(national_number) & self.dfa_mask ==
+                    self.dfa_mask)
+        engine = self.engine
+        return (engine.full_match(self.possible_number_pattern,
+                                  national_number) and
+                engine.full_match(self.national_number_pattern,
+                                  national_number))
+
+    def matches_with_telemetry(self, national_number, telemetry, region_code):
+        """As matches(), but always matches the patterns, recording each match
+        into telemetry against region_code."""
+        if not (self.possible_lengths_mask >> len(national_number)) & 1:
+            return False
+        return bool(telemetry.match(self.possible_number_pattern,
+                                    national_number, region_code) and
+                    telemetry.match(self.national_number_pattern,
+                                    national_number, region_code))
+
+
+class CompiledNumberFormat(object):
+    """A NumberFormat with its patterns compiled.
+
+    Attributes:
+        number_format: the NumberFormat.
+        pattern: the pattern of the format, anchored; it both decides whether
+            the format applies and captures the groups for the template.
+        leading_digits_pattern: the last, and most detailed, leading digits
+            pattern, which must match at the start of a number for the format
+            to apply, or None if the format has none.
+        template: the format template expanded into a %-format string, or
+            None if it must be applied by re (see expand_template()).
+        template_groups: the group indices the template refers to, in order.
+    """
+    __slots__ = ("number_format", "pattern", "leading_digits_pattern",
+                 "template", "template_groups", "_backslash_template")
+
+    def __init__(self, number_format, pattern_compiler, region_code=None):
+        self.number_format = number_format
+        self.pattern = pattern_compiler.get_anchored_pattern(
+                number_format.pattern, region_code)
+        if number_format.leading_digits_pattern:
+            self.leading_digits_pattern = pattern_compiler.get_pattern(
+                    number_format.leading_digits_pattern[-1], region_code)
+        else:
+            self.leading_digits_pattern = None
+        self.template, self.template_groups = \
+                expand_template(number_format.format)
+        # The template as re.sub() takes it, for the templates that cannot be
+        # expanded and for groups that did not take part in the match.
+        self._backslash_template = number_format.format.replace(u"$", u"\\")
+
+    def format_match(self, match):
+        """Returns the number matched in full by the pattern of the format,
+        laid out by the template of the format.
+
+        Args:
+            match: the match of pattern against the whole number.
+        Returns:
+            the formatted number, as pattern.sub() with the template would
+            give it.
+        """
+        if self.template is not None:
+            template_groups = self.template_groups
+            if len(template_groups) == 1:
+                groups = (match.group(template_groups[0]),)
+            elif template_groups:
+                groups = match.group(*template_groups)
+            else:
+                groups = ()
+            if None not in groups:
+                return self.template % groups
+        return match.expand(self._backslash_template)
+
+
+class CompiledPhoneMetadata(object):
+    """The metadata for a region with all its number descriptions and formats
+    compiled.
+
+    Attributes:
+        metadata: the PhoneMetadata.
+        general_desc, fixed_line, mobile, toll_free, premium_rate,
+        shared_cost, personal_number, voip, pager: the CompiledNumberDesc for
+            each PhoneNumberDesc of the metadata.
+        number_formats: tuple of the CompiledNumberFormat for each
+            number_format of the metadata.
+        intl_number_formats: the same for intl_number_format.
+        same_mobile_and_fixed_line_pattern: as in the metadata.
+        number_type_fields: the fields of NUMBER_TYPE_FIELDS a number is
+            tested against; mobile is left out when it has the same pattern
+            as fixed_line.
+        number_desc_dfa: the DFA the number descriptions are matched with, or
+            None if they are matched with re. A DFA passed in is only used if
+            it was built from get_number_desc_regexes() of the metadata, and
+            not, say, from an older release of it.
+    """
+
+    def __init__(self, metadata, pattern_compiler, number_desc_dfa=None):
+        self.metadata = metadata
+        self._pattern_compiler = pattern_compiler
+        region_code = metadata.id
+        for field_name in patternpool.NUMBER_DESC_FIELDS:
+            setattr(self, field_name, CompiledNumberDesc(
+                    getattr(metadata, field_name), pattern_compiler,
+                    region_code))
+        self.number_formats = tuple(
+                CompiledNumberFormat(number_format, pattern_compiler,
+                                     region_code)
+                for number_format in metadata.number_format)
+        self.intl_number_formats = tuple(
+                CompiledNumberFormat(number_format, pattern_compiler,
+                                     region_code)
+                for number_format in metadata.intl_number_format)
+        self.same_mobile_and_fixed_line_pattern = \
+                metadata.same_mobile_and_fixed_line_pattern
+        if self.same_mobile_and_fixed_line_pattern:
+            self.number_type_fields = NUMBER_TYPE_FIELDS[:-1]
+        else:
+            self.number_type_fields = NUMBER_TYPE_FIELDS
+        # The combined pattern of the number types, built on first use; False
+        # if it could not be compiled.
+        self._number_type_pattern = None
+        # The LeadingDigitsTrie of number_formats and of intl_number_formats,
+        # built on first use.
+        self._number_format_trie = None
+        self._intl_number_format_trie = None
+        self.number_desc_dfa = None
+        if (number_desc_dfa is not None and
+            number_desc_dfa.regexes == get_number_desc_regexes(metadata)):
+            self._use_number_desc_dfa(number_desc_dfa)
+
+    def _use_number_desc_dfa(self, dfa):
+        self.number_desc_dfa = dfa
+        for bit, field_name in enumerate(_get_dfa_field_names(self.metadata)):
+            number_desc = getattr(self, field_name)
+            number_desc.dfa = dfa
+            # The possible and national number patterns of each description
+            # are consecutive patterns of the DFA.
+            number_desc.dfa_mask = 3 << (2 * bit)
+        # The number type of the strings leading to each state, so that
+        # classifying a number is a single run of the DFA.
+        self._number_type_by_state = [
+                self._get_number_type_for_mask(accept_mask)
+                for accept_mask in dfa.accept_masks]
+
+    def _get_number_type_for_mask(self, accept_mask):
+        general_mask = self.general_desc.dfa_mask
+        if not general_mask or accept_mask & general_mask != general_mask:
+            return None
+        for field_name in self.number_type_fields:
+            mask = getattr(self, field_name).dfa_mask
+            if mask and accept_mask & mask == mask:
+                return field_name
+        return None
+
+    def get_candidate_formats(self, national_number, intl=False):
+        """Returns those of number_formats, or of intl_number_formats if intl
+        is true, whose leading digits can match national_number, in order
+        (see leadingdigitstrie.py).
+
+        Short lists of formats are returned whole, as trying each of them is
+        no slower than walking a trie.
+        """
+        trie = self._get_format_trie(intl)
+        if trie is None:
+            if intl:
+                return self.intl_number_formats
+            return self.number_formats
+        return trie.get_candidate_formats(national_number)
+
+    def build_format_tries(self):
+        """Builds the LeadingDigitsTrie of number_formats and of
+        intl_number_formats ahead of the first call to
+        get_candidate_formats(), where the lists are long enough to have
+        one."""
+        self._get_format_trie(False)
+        self._get_format_trie(True)
+
+    def _get_format_trie(self, intl):
+        """Returns the LeadingDigitsTrie of intl_number_formats if intl is
+        true, or else of number_formats, building it on first use, or None
+        if there are fewer than _MIN_FORMATS_FOR_TRIE formats."""
+        if intl:
+            if len(self.intl_number_formats) < _MIN_FORMATS_FOR_TRIE:
+                return None
+            trie = self._intl_number_format_trie
+            if trie is None:
+                trie = self._intl_number_format_trie = \
+                        leadingdigitstrie.LeadingDigitsTrie(
+                                self.intl_number_formats)
+        else:
+            if len(self.number_formats) < _MIN_FORMATS_FOR_TRIE:
+                return None
+            trie = self._number_format_trie
+            if trie is None:
+                trie = self._number_format_trie = \
+                        leadingdigitstrie.LeadingDigitsTrie(
+                                self.number_formats)
+        return trie
+
+    def compile_number_type_pattern(self):
+        """Returns the pattern that matches a national number in full if it
+        matches the general description, with the named group of the first
+        number type it matches taking part, or False if there is none, as
+        when the general description has no pattern, the number type is
+        decided by the DFA or re cannot compile the pattern."""
+        pattern = self._number_type_pattern
+        if pattern is None:
+            pattern = False
+            if (self.general_desc.has_national_number_pattern and
+                self.number_desc_dfa is None):
+                try:
+                    pattern = self._pattern_compiler.compile_unshared(
+                            self._get_number_type_regex(), re.compile,
+                            self.metadata.id)
+                except (re.error, AssertionError, OverflowError):
+                    # Such as too many groups for re; the descriptions are
+                    # matched one by one instead.
+                    pass
+            self._number_type_pattern = pattern
+        return pattern
+
+    def _get_number_type_regex(self):
+        branches = []
+        for field_name in self.number_type_fields:
+            number_desc = getattr(self, field_name)
+            # A description without patterns matches no number.
+            if (number_desc.possible_number_pattern is None or
+                number_desc.national_number_pattern is None):
+                continue
+            # A description needs both its patterns to match, so the possible
+            # number pattern goes into a lookahead.
+            branches.append(u"(?P<%s>(?=%s)%s)" % (field_name,
+                    number_desc.possible_number_pattern.pattern,
+                    number_desc.national_number_pattern.pattern))
+        return u"(?=%s)(?=%s)(?:%s)" % (
+                self.general_desc.possible_number_pattern.pattern,
+                self.general_desc.national_number_pattern.pattern,
+                u"|".join(branches))
+
+    def match_number_type(self, national_number):
+        """Returns the first of number_type_fields whose description
+        national_number matches, or None if it matches none of them or does
+        not match the general description."""
+        if not self.general_desc.has_national_number_pattern:
+            return None
+        if not (self.general_desc.possible_lengths_mask >>
+                len(national_number)) & 1:
+            return None
+        if self.number_desc_dfa is not None:
+            return self._number_type_by_state[
+                    self.number_desc_dfa.run(national_number)]
+        pattern = self._number_type_pattern
+        if pattern is None:
+            pattern = self.compile_number_type_pattern()
+        if pattern is False:
+            return self._match_number_type_sequentially(national_number)
+        match = pattern.match(national_number)
+        if match is None:
+            return None
+        return match.lastgroup
+
+    def match_number_type_with_telemetry(self, national_number, telemetry):
+        """As match_number_type(), but matches the patterns of the
+        descriptions one at a time, recording each match into telemetry
+        against the region, so that a slow classification points at the
+        description responsible rather than at the DFA or the combined
+        pattern."""
+        region_code = self.metadata.id
+        if not (self.general_desc.has_national_number_pattern and
+                self.general_desc.matches_with_telemetry(
+                        national_number, telemetry, region_code)):
+            return None
+        for field_name in self.number_type_fields:
+            if getattr(self, field_name).matches_with_telemetry(
+                    national_number, telemetry, region_code):
+                return field_name
+        return None
+
+    def _match_number_type_sequentially(self, national_number):
+        if not self.general_desc.matches(national_number):
+            return None
+        for field_name in self.number_type_fields:
+            if getattr(self, field_name).matches(national_number):
+                return field_name
+        return None
@@ -0,0 +1,55 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lookup tables between country calling codes and region codes.
+
+Both are derived from a country code to region code mapping, and are written
+next to it by buildmetadataprotofromxml.py so that they load as literals:
+
+    region_codes_by_country_code: a tuple with one slot for every possible
+        country calling code, holding the tuple of region codes for that code
+        (main country first) or None.
+    country_code_by_region_code: a dict mapping each region code to its
+        country calling code.
+
+Neither needs the metadata of any region to be loaded.
+"""
+
+
+# Country calling codes have at most three digits.
+COUNTRY_CODE_SLOTS = 1000
+
+
+def build_region_codes_by_country_code(country_code_to_region_code_map):
+    region_codes_by_country_code = [None] * COUNTRY_CODE_SLOTS
+    for country_code, region_codes in country_code_to_region_code_map.items():
+        region_codes_by_country_code[country_code] = tuple(region_codes)
+    return tuple(region_codes_by_country_code)
+
+
+def build_country_code_by_region_code(country_code_to_region_code_map):
+    country_code_by_region_code = {}
+    for country_code, region_codes in country_code_to_region_code_map.items():
+        for region_code in region_codes:
+            country_code_by_region_code[region_code] = country_code
+    return country_code_by_region_code
+
+
+def get_region_codes_for_country_code(region_codes_by_country_code,
+                                      country_code):
+    """Returns the region codes for a country calling code, or None if there
+    are none (including for codes outside the range of calling codes)."""
+    if 0 <= country_code < COUNTRY_CODE_SLOTS:
+        return region_codes_by_country_code[country_code]
+    return None
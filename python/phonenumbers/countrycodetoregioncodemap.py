@@ -247,3 +247,1244 @@ country_code_to_region_code_map = {1: ['US',
  995: ['GE'],
  996: ['KG'],
  998: ['UZ']}
+
+# The same mapping as a tuple indexed by country code, with None for the codes
+# that have no regions, and its reverse from region code to country code (see
+# countrycodeindex.py).
+region_codes_by_country_code = (
+    None,  # 0
+    ('US', 'AG', 'AI', 'AS', 'BB', 'BM', 'BS', 'CA', 'DM', 'DO', 'GD', 'GU', 'JM', 'KN', 'KY', 'LC', 'MP', 'MS', 'PR', 'TC', 'TT', 'VC', 'VG', 'VI'),  # 1
+    None,  # 2
+    None,  # 3
+    None,  # 4
+    None,  # 5
+    None,  # 6
+    ('RU', 'KZ'),  # 7
+    None,  # 8
+    None,  # 9
+    None,  # 10
+    None,  # 11
+    None,  # 12
+    None,  # 13
+    None,  # 14
+    None,  # 15
+    None,  # 16
+    None,  # 17
+    None,  # 18
+    None,  # 19
+    ('EG',),  # 20
+    None,  # 21
+    None,  # 22
+    None,  # 23
+    None,  # 24
+    None,  # 25
+    None,  # 26
+    ('ZA',),  # 27
+    None,  # 28
+    None,  # 29
+    ('GR',),  # 30
+    ('NL',),  # 31
+    ('BE',),  # 32
+    ('FR',),  # 33
+    ('ES',),  # 34
+    None,  # 35
+    ('HU',),  # 36
+    None,  # 37
+    None,  # 38
+    ('IT',),  # 39
+    ('RO',),  # 40
+    ('CH',),  # 41
+    None,  # 42
+    ('AT',),  # 43
+    ('GB', 'GG', 'IM', 'JE'),  # 44
+    ('DK',),  # 45
+    ('SE',),  # 46
+    ('NO',),  # 47
+    ('PL',),  # 48
+    ('DE',),  # 49
+    None,  # 50
+    ('PE',),  # 51
+    ('MX',),  # 52
+    ('CU',),  # 53
+    ('AR',),  # 54
+    ('BR',),  # 55
+    ('CL',),  # 56
+    ('CO',),  # 57
+    ('VE',),  # 58
+    None,  # 59
+    ('MY',),  # 60
+    ('AU',),  # 61
+    ('ID',),  # 62
+    ('PH',),  # 63
+    ('NZ',),  # 64
+    ('SG',),  # 65
+    ('TH',),  # 66
+    None,  # 67
+    None,  # 68
+    None,  # 69
+    None,  # 70
+    None,  # 71
+    None,  # 72
+    None,  # 73
+    None,  # 74
+    None,  # 75
+    None,  # 76
+    None,  # 77
+    None,  # 78
+    None,  # 79
+    None,  # 80
+    ('JP',),  # 81
+    ('KR',),  # 82
+    None,  # 83
+    ('VN',),  # 84
+    None,  # 85
+    ('CN',),  # 86
+    None,  # 87
+    None,  # 88
+    None,  # 89
+    ('TR',),  # 90
+    ('IN',),  # 91
+    ('PK',),  # 92
+    ('AF',),  # 93
+    ('LK',),  # 94
+    ('MM',),  # 95
+    None,  # 96
+    None,  # 97
+    ('IR',),  # 98
+    None,  # 99
+    None,  # 100
+    None,  # 101
+    None,  # 102
+    None,  # 103
+    None,  # 104
+    None,  # 105
+    None,  # 106
+    None,  # 107
+    None,  # 108
+    None,  # 109
+    None,  # 110
+    None,  # 111
+    None,  # 112
+    None,  # 113
+    None,  # 114
+    None,  # 115
+    None,  # 116
+    None,  # 117
+    None,  # 118
+    None,  # 119
+    None,  # 120
+    None,  # 121
+    None,  # 122
+    None,  # 123
+    None,  # 124
+    None,  # 125
+    None,  # 126
+    None,  # 127
+    None,  # 128
+    None,  # 129
+    None,  # 130
+    None,  # 131
+    None,  # 132
+    None,  # 133
+    None,  # 134
+    None,  # 135
+    None,  # 136
+    None,  # 137
+    None,  # 138
+    None,  # 139
+    None,  # 140
+    None,  # 141
+    None,  # 142
+    None,  # 143
+    None,  # 144
+    None,  # 145
+    None,  # 146
+    None,  # 147
+    None,  # 148
+    None,  # 149
+    None,  # 150
+    None,  # 151
+    None,  # 152
+    None,  # 153
+    None,  # 154
+    None,  # 155
+    None,  # 156
+    None,  # 157
+    None,  # 158
+    None,  # 159
+    None,  # 160
+    None,  # 161
+    None,  # 162
+    None,  # 163
+    None,  # 164
+    None,  # 165
+    None,  # 166
+    None,  # 167
+    None,  # 168
+    None,  # 169
+    None,  # 170
+    None,  # 171
+    None,  # 172
+    None,  # 173
+    None,  # 174
+    None,  # 175
+    None,  # 176
+    None,  # 177
+    None,  # 178
+    None,  # 179
+    None,  # 180
+    None,  # 181
+    None,  # 182
+    None,  # 183
+    None,  # 184
+    None,  # 185
+    None,  # 186
+    None,  # 187
+    None,  # 188
+    None,  # 189
+    None,  # 190
+    None,  # 191
+    None,  # 192
+    None,  # 193
+    None,  # 194
+    None,  # 195
+    None,  # 196
+    None,  # 197
+    None,  # 198
+    None,  # 199
+    None,  # 200
+    None,  # 201
+    None,  # 202
+    None,  # 203
+    None,  # 204
+    None,  # 205
+    None,  # 206
+    None,  # 207
+    None,  # 208
+    None,  # 209
+    None,  # 210
+    None,  # 211
+    ('MA',),  # 212
+    ('DZ',),  # 213
+    None,  # 214
+    None,  # 215
+    ('TN',),  # 216
+    None,  # 217
+    ('LY',),  # 218
+    None,  # 219
+    ('GM',),  # 220
+    ('SN',),  # 221
+    ('MR',),  # 222
+    ('ML',),  # 223
+    ('GN',),  # 224
+    ('CI',),  # 225
+    ('BF',),  # 226
+    ('NE',),  # 227
+    ('TG',),  # 228
+    ('BJ',),  # 229
+    ('MU',),  # 230
+    ('LR',),  # 231
+    ('SL',),  # 232
+    ('GH',),  # 233
+    ('NG',),  # 234
+    ('TD',),  # 235
+    ('CF',),  # 236
+    ('CM',),  # 237
+    ('CV',),  # 238
+    ('ST',),  # 239
+    ('GQ',),  # 240
+    ('GA',),  # 241
+    ('CG',),  # 242
+    ('CD',),  # 243
+    ('AO',),  # 244
+    ('GW',),  # 245
+    ('IO',),  # 246
+    None,  # 247
+    ('SC',),  # 248
+    ('SD',),  # 249
+    ('RW',),  # 250
+    ('ET',),  # 251
+    ('SO',),  # 252
+    ('DJ',),  # 253
+    ('KE',),  # 254
+    ('TZ',),  # 255
+    ('UG',),  # 256
+    ('BI',),  # 257
+    ('MZ',),  # 258
+    None,  # 259
+    ('ZM',),  # 260
+    ('MG',),  # 261
+    ('RE', 'TF', 'YT'),  # 262
+    ('ZW',),  # 263
+    ('NA',),  # 264
+    ('MW',),  # 265
+    ('LS',),  # 266
+    ('BW',),  # 267
+    ('SZ',),  # 268
+    ('KM',),  # 269
+    None,  # 270
+    None,  # 271
+    None,  # 272
+    None,  # 273
+    None,  # 274
+    None,  # 275
+    None,  # 276
+    None,  # 277
+    None,  # 278
+    None,  # 279
+    None,  # 280
+    None,  # 281
+    None,  # 282
+    None,  # 283
+    None,  # 284
+    None,  # 285
+    None,  # 286
+    None,  # 287
+    None,  # 288
+    None,  # 289
+    ('SH',),  # 290
+    ('ER',),  # 291
+    None,  # 292
+    None,  # 293
+    None,  # 294
+    None,  # 295
+    None,  # 296
+    ('AW',),  # 297
+    ('FO',),  # 298
+    ('GL',),  # 299
+    None,  # 300
+    None,  # 301
+    None,  # 302
+    None,  # 303
+    None,  # 304
+    None,  # 305
+    None,  # 306
+    None,  # 307
+    None,  # 308
+    None,  # 309
+    None,  # 310
+    None,  # 311
+    None,  # 312
+    None,  # 313
+    None,  # 314
+    None,  # 315
+    None,  # 316
+    None,  # 317
+    None,  # 318
+    None,  # 319
+    None,  # 320
+    None,  # 321
+    None,  # 322
+    None,  # 323
+    None,  # 324
+    None,  # 325
+    None,  # 326
+    None,  # 327
+    None,  # 328
+    None,  # 329
+    None,  # 330
+    None,  # 331
+    None,  # 332
+    None,  # 333
+    None,  # 334
+    None,  # 335
+    None,  # 336
+    None,  # 337
+    None,  # 338
+    None,  # 339
+    None,  # 340
+    None,  # 341
+    None,  # 342
+    None,  # 343
+    None,  # 344
+    None,  # 345
+    None,  # 346
+    None,  # 347
+    None,  # 348
+    None,  # 349
+    ('GI',),  # 350
+    ('PT',),  # 351
+    ('LU',),  # 352
+    ('IE',),  # 353
+    ('IS',),  # 354
+    ('AL',),  # 355
+    ('MT',),  # 356
+    ('CY',),  # 357
+    ('FI',),  # 358
+    ('BG',),  # 359
+    None,  # 360
+    None,  # 361
+    None,  # 362
+    None,  # 363
+    None,  # 364
+    None,  # 365
+    None,  # 366
+    None,  # 367
+    None,  # 368
+    None,  # 369
+    ('LT',),  # 370
+    ('LV',),  # 371
+    ('EE',),  # 372
+    ('MD',),  # 373
+    ('AM',),  # 374
+    ('BY',),  # 375
+    ('AD',),  # 376
+    ('MC',),  # 377
+    ('SM',),  # 378
+    ('VA',),  # 379
+    ('UA',),  # 380
+    ('RS',),  # 381
+    ('ME',),  # 382
+    None,  # 383
+    None,  # 384
+    ('HR',),  # 385
+    ('SI',),  # 386
+    ('BA',),  # 387
+    None,  # 388
+    ('MK',),  # 389
+    None,  # 390
+    None,  # 391
+    None,  # 392
+    None,  # 393
+    None,  # 394
+    None,  # 395
+    None,  # 396
+    None,  # 397
+    None,  # 398
+    None,  # 399
+    None,  # 400
+    None,  # 401
+    None,  # 402
+    None,  # 403
+    None,  # 404
+    None,  # 405
+    None,  # 406
+    None,  # 407
+    None,  # 408
+    None,  # 409
+    None,  # 410
+    None,  # 411
+    None,  # 412
+    None,  # 413
+    None,  # 414
+    None,  # 415
+    None,  # 416
+    None,  # 417
+    None,  # 418
+    None,  # 419
+    ('CZ',),  # 420
+    ('SK',),  # 421
+    None,  # 422
+    ('LI',),  # 423
+    None,  # 424
+    None,  # 425
+    None,  # 426
+    None,  # 427
+    None,  # 428
+    None,  # 429
+    None,  # 430
+    None,  # 431
+    None,  # 432
+    None,  # 433
+    None,  # 434
+    None,  # 435
+    None,  # 436
+    None,  # 437
+    None,  # 438
+    None,  # 439
+    None,  # 440
+    None,  # 441
+    None,  # 442
+    None,  # 443
+    None,  # 444
+    None,  # 445
+    None,  # 446
+    None,  # 447
+    None,  # 448
+    None,  # 449
+    None,  # 450
+    None,  # 451
+    None,  # 452
+    None,  # 453
+    None,  # 454
+    None,  # 455
+    None,  # 456
+    None,  # 457
+    None,  # 458
+    None,  # 459
+    None,  # 460
+    None,  # 461
+    None,  # 462
+    None,  # 463
+    None,  # 464
+    None,  # 465
+    None,  # 466
+    None,  # 467
+    None,  # 468
+    None,  # 469
+    None,  # 470
+    None,  # 471
+    None,  # 472
+    None,  # 473
+    None,  # 474
+    None,  # 475
+    None,  # 476
+    None,  # 477
+    None,  # 478
+    None,  # 479
+    None,  # 480
+    None,  # 481
+    None,  # 482
+    None,  # 483
+    None,  # 484
+    None,  # 485
+    None,  # 486
+    None,  # 487
+    None,  # 488
+    None,  # 489
+    None,  # 490
+    None,  # 491
+    None,  # 492
+    None,  # 493
+    None,  # 494
+    None,  # 495
+    None,  # 496
+    None,  # 497
+    None,  # 498
+    None,  # 499
+    ('FK',),  # 500
+    ('BZ',),  # 501
+    ('GT',),  # 502
+    ('SV',),  # 503
+    ('HN',),  # 504
+    ('NI',),  # 505
+    ('CR',),  # 506
+    ('PA',),  # 507
+    ('PM',),  # 508
+    ('HT',),  # 509
+    None,  # 510
+    None,  # 511
+    None,  # 512
+    None,  # 513
+    None,  # 514
+    None,  # 515
+    None,  # 516
+    None,  # 517
+    None,  # 518
+    None,  # 519
+    None,  # 520
+    None,  # 521
+    None,  # 522
+    None,  # 523
+    None,  # 524
+    None,  # 525
+    None,  # 526
+    None,  # 527
+    None,  # 528
+    None,  # 529
+    None,  # 530
+    None,  # 531
+    None,  # 532
+    None,  # 533
+    None,  # 534
+    None,  # 535
+    None,  # 536
+    None,  # 537
+    None,  # 538
+    None,  # 539
+    None,  # 540
+    None,  # 541
+    None,  # 542
+    None,  # 543
+    None,  # 544
+    None,  # 545
+    None,  # 546
+    None,  # 547
+    None,  # 548
+    None,  # 549
+    None,  # 550
+    None,  # 551
+    None,  # 552
+    None,  # 553
+    None,  # 554
+    None,  # 555
+    None,  # 556
+    None,  # 557
+    None,  # 558
+    None,  # 559
+    None,  # 560
+    None,  # 561
+    None,  # 562
+    None,  # 563
+    None,  # 564
+    None,  # 565
+    None,  # 566
+    None,  # 567
+    None,  # 568
+    None,  # 569
+    None,  # 570
+    None,  # 571
+    None,  # 572
+    None,  # 573
+    None,  # 574
+    None,  # 575
+    None,  # 576
+    None,  # 577
+    None,  # 578
+    None,  # 579
+    None,  # 580
+    None,  # 581
+    None,  # 582
+    None,  # 583
+    None,  # 584
+    None,  # 585
+    None,  # 586
+    None,  # 587
+    None,  # 588
+    None,  # 589
+    ('GP', 'BL', 'MF'),  # 590
+    ('BO',),  # 591
+    ('GY',),  # 592
+    ('EC',),  # 593
+    ('GF',),  # 594
+    ('PY',),  # 595
+    ('MQ',),  # 596
+    ('SR',),  # 597
+    ('UY',),  # 598
+    ('AN',),  # 599
+    None,  # 600
+    None,  # 601
+    None,  # 602
+    None,  # 603
+    None,  # 604
+    None,  # 605
+    None,  # 606
+    None,  # 607
+    None,  # 608
+    None,  # 609
+    None,  # 610
+    None,  # 611
+    None,  # 612
+    None,  # 613
+    None,  # 614
+    None,  # 615
+    None,  # 616
+    None,  # 617
+    None,  # 618
+    None,  # 619
+    None,  # 620
+    None,  # 621
+    None,  # 622
+    None,  # 623
+    None,  # 624
+    None,  # 625
+    None,  # 626
+    None,  # 627
+    None,  # 628
+    None,  # 629
+    None,  # 630
+    None,  # 631
+    None,  # 632
+    None,  # 633
+    None,  # 634
+    None,  # 635
+    None,  # 636
+    None,  # 637
+    None,  # 638
+    None,  # 639
+    None,  # 640
+    None,  # 641
+    None,  # 642
+    None,  # 643
+    None,  # 644
+    None,  # 645
+    None,  # 646
+    None,  # 647
+    None,  # 648
+    None,  # 649
+    None,  # 650
+    None,  # 651
+    None,  # 652
+    None,  # 653
+    None,  # 654
+    None,  # 655
+    None,  # 656
+    None,  # 657
+    None,  # 658
+    None,  # 659
+    None,  # 660
+    None,  # 661
+    None,  # 662
+    None,  # 663
+    None,  # 664
+    None,  # 665
+    None,  # 666
+    None,  # 667
+    None,  # 668
+    None,  # 669
+    ('TL',),  # 670
+    None,  # 671
+    ('NF',),  # 672
+    ('BN',),  # 673
+    ('NR',),  # 674
+    ('PG',),  # 675
+    ('TO',),  # 676
+    ('SB',),  # 677
+    ('VU',),  # 678
+    ('FJ',),  # 679
+    ('PW',),  # 680
+    ('WF',),  # 681
+    ('CK',),  # 682
+    ('NU',),  # 683
+    None,  # 684
+    ('WS',),  # 685
+    ('KI',),  # 686
+    ('NC',),  # 687
+    ('TV',),  # 688
+    ('PF',),  # 689
+    ('TK',),  # 690
+    ('FM',),  # 691
+    ('MH',),  # 692
+    None,  # 693
+    None,  # 694
+    None,  # 695
+    None,  # 696
+    None,  # 697
+    None,  # 698
+    None,  # 699
+    None,  # 700
+    None,  # 701
+    None,  # 702
+    None,  # 703
+    None,  # 704
+    None,  # 705
+    None,  # 706
+    None,  # 707
+    None,  # 708
+    None,  # 709
+    None,  # 710
+    None,  # 711
+    None,  # 712
+    None,  # 713
+    None,  # 714
+    None,  # 715
+    None,  # 716
+    None,  # 717
+    None,  # 718
+    None,  # 719
+    None,  # 720
+    None,  # 721
+    None,  # 722
+    None,  # 723
+    None,  # 724
+    None,  # 725
+    None,  # 726
+    None,  # 727
+    None,  # 728
+    None,  # 729
+    None,  # 730
+    None,  # 731
+    None,  # 732
+    None,  # 733
+    None,  # 734
+    None,  # 735
+    None,  # 736
+    None,  # 737
+    None,  # 738
+    None,  # 739
+    None,  # 740
+    None,  # 741
+    None,  # 742
+    None,  # 743
+    None,  # 744
+    None,  # 745
+    None,  # 746
+    None,  # 747
+    None,  # 748
+    None,  # 749
+    None,  # 750
+    None,  # 751
+    None,  # 752
+    None,  # 753
+    None,  # 754
+    None,  # 755
+    None,  # 756
+    None,  # 757
+    None,  # 758
+    None,  # 759
+    None,  # 760
+    None,  # 761
+    None,  # 762
+    None,  # 763
+    None,  # 764
+    None,  # 765
+    None,  # 766
+    None,  # 767
+    None,  # 768
+    None,  # 769
+    None,  # 770
+    None,  # 771
+    None,  # 772
+    None,  # 773
+    None,  # 774
+    None,  # 775
+    None,  # 776
+    None,  # 777
+    None,  # 778
+    None,  # 779
+    None,  # 780
+    None,  # 781
+    None,  # 782
+    None,  # 783
+    None,  # 784
+    None,  # 785
+    None,  # 786
+    None,  # 787
+    None,  # 788
+    None,  # 789
+    None,  # 790
+    None,  # 791
+    None,  # 792
+    None,  # 793
+    None,  # 794
+    None,  # 795
+    None,  # 796
+    None,  # 797
+    None,  # 798
+    None,  # 799
+    None,  # 800
+    None,  # 801
+    None,  # 802
+    None,  # 803
+    None,  # 804
+    None,  # 805
+    None,  # 806
+    None,  # 807
+    None,  # 808
+    None,  # 809
+    None,  # 810
+    None,  # 811
+    None,  # 812
+    None,  # 813
+    None,  # 814
+    None,  # 815
+    None,  # 816
+    None,  # 817
+    None,  # 818
+    None,  # 819
+    None,  # 820
+    None,  # 821
+    None,  # 822
+    None,  # 823
+    None,  # 824
+    None,  # 825
+    None,  # 826
+    None,  # 827
+    None,  # 828
+    None,  # 829
+    None,  # 830
+    None,  # 831
+    None,  # 832
+    None,  # 833
+    None,  # 834
+    None,  # 835
+    None,  # 836
+    None,  # 837
+    None,  # 838
+    None,  # 839
+    None,  # 840
+    None,  # 841
+    None,  # 842
+    None,  # 843
+    None,  # 844
+    None,  # 845
+    None,  # 846
+    None,  # 847
+    None,  # 848
+    None,  # 849
+    ('KP',),  # 850
+    None,  # 851
+    ('HK',),  # 852
+    ('MO',),  # 853
+    None,  # 854
+    ('KH',),  # 855
+    ('LA',),  # 856
+    None,  # 857
+    None,  # 858
+    None,  # 859
+    None,  # 860
+    None,  # 861
+    None,  # 862
+    None,  # 863
+    None,  # 864
+    None,  # 865
+    None,  # 866
+    None,  # 867
+    None,  # 868
+    None,  # 869
+    None,  # 870
+    None,  # 871
+    None,  # 872
+    None,  # 873
+    None,  # 874
+    None,  # 875
+    None,  # 876
+    None,  # 877
+    None,  # 878
+    None,  # 879
+    ('BD',),  # 880
+    None,  # 881
+    None,  # 882
+    None,  # 883
+    None,  # 884
+    None,  # 885
+    ('TW',),  # 886
+    None,  # 887
+    None,  # 888
+    None,  # 889
+    None,  # 890
+    None,  # 891
+    None,  # 892
+    None,  # 893
+    None,  # 894
+    None,  # 895
+    None,  # 896
+    None,  # 897
+    None,  # 898
+    None,  # 899
+    None,  # 900
+    None,  # 901
+    None,  # 902
+    None,  # 903
+    None,  # 904
+    None,  # 905
+    None,  # 906
+    None,  # 907
+    None,  # 908
+    None,  # 909
+    None,  # 910
+    None,  # 911
+    None,  # 912
+    None,  # 913
+    None,  # 914
+    None,  # 915
+    None,  # 916
+    None,  # 917
+    None,  # 918
+    None,  # 919
+    None,  # 920
+    None,  # 921
+    None,  # 922
+    None,  # 923
+    None,  # 924
+    None,  # 925
+    None,  # 926
+    None,  # 927
+    None,  # 928
+    None,  # 929
+    None,  # 930
+    None,  # 931
+    None,  # 932
+    None,  # 933
+    None,  # 934
+    None,  # 935
+    None,  # 936
+    None,  # 937
+    None,  # 938
+    None,  # 939
+    None,  # 940
+    None,  # 941
+    None,  # 942
+    None,  # 943
+    None,  # 944
+    None,  # 945
+    None,  # 946
+    None,  # 947
+    None,  # 948
+    None,  # 949
+    None,  # 950
+    None,  # 951
+    None,  # 952
+    None,  # 953
+    None,  # 954
+    None,  # 955
+    None,  # 956
+    None,  # 957
+    None,  # 958
+    None,  # 959
+    ('MV',),  # 960
+    ('LB',),  # 961
+    ('JO',),  # 962
+    ('SY',),  # 963
+    ('IQ',),  # 964
+    ('KW',),  # 965
+    ('SA',),  # 966
+    ('YE',),  # 967
+    ('OM',),  # 968
+    None,  # 969
+    ('PS',),  # 970
+    ('AE',),  # 971
+    ('IL',),  # 972
+    ('BH',),  # 973
+    ('QA',),  # 974
+    ('BT',),  # 975
+    ('MN',),  # 976
+    ('NP',),  # 977
+    None,  # 978
+    None,  # 979
+    None,  # 980
+    None,  # 981
+    None,  # 982
+    None,  # 983
+    None,  # 984
+    None,  # 985
+    None,  # 986
+    None,  # 987
+    None,  # 988
+    None,  # 989
+    None,  # 990
+    None,  # 991
+    ('TJ',),  # 992
+    ('TM',),  # 993
+    ('AZ',),  # 994
+    ('GE',),  # 995
+    ('KG',),  # 996
+    None,  # 997
+    ('UZ',),  # 998
+    None,  # 999
+)
+country_code_by_region_code = {'AD': 376,
+ 'AE': 971,
+ 'AF': 93,
+ 'AG': 1,
+ 'AI': 1,
+ 'AL': 355,
+ 'AM': 374,
+ 'AN': 599,
+ 'AO': 244,
+ 'AR': 54,
+ 'AS': 1,
+ 'AT': 43,
+ 'AU': 61,
+ 'AW': 297,
+ 'AZ': 994,
+ 'BA': 387,
+ 'BB': 1,
+ 'BD': 880,
+ 'BE': 32,
+ 'BF': 226,
+ 'BG': 359,
+ 'BH': 973,
+ 'BI': 257,
+ 'BJ': 229,
+ 'BL': 590,
+ 'BM': 1,
+ 'BN': 673,
+ 'BO': 591,
+ 'BR': 55,
+ 'BS': 1,
+ 'BT': 975,
+ 'BW': 267,
+ 'BY': 375,
+ 'BZ': 501,
+ 'CA': 1,
+ 'CD': 243,
+ 'CF': 236,
+ 'CG': 242,
+ 'CH': 41,
+ 'CI': 225,
+ 'CK': 682,
+ 'CL': 56,
+ 'CM': 237,
+ 'CN': 86,
+ 'CO': 57,
+ 'CR': 506,
+ 'CU': 53,
+ 'CV': 238,
+ 'CY': 357,
+ 'CZ': 420,
+ 'DE': 49,
+ 'DJ': 253,
+ 'DK': 45,
+ 'DM': 1,
+ 'DO': 1,
+ 'DZ': 213,
+ 'EC': 593,
+ 'EE': 372,
+ 'EG': 20,
+ 'ER': 291,
+ 'ES': 34,
+ 'ET': 251,
+ 'FI': 358,
+ 'FJ': 679,
+ 'FK': 500,
+ 'FM': 691,
+ 'FO': 298,
+ 'FR': 33,
+ 'GA': 241,
+ 'GB': 44,
+ 'GD': 1,
+ 'GE': 995,
+ 'GF': 594,
+ 'GG': 44,
+ 'GH': 233,
+ 'GI': 350,
+ 'GL': 299,
+ 'GM': 220,
+ 'GN': 224,
+ 'GP': 590,
+ 'GQ': 240,
+ 'GR': 30,
+ 'GT': 502,
+ 'GU': 1,
+ 'GW': 245,
+ 'GY': 592,
+ 'HK': 852,
+ 'HN': 504,
+ 'HR': 385,
+ 'HT': 509,
+ 'HU': 36,
+ 'ID': 62,
+ 'IE': 353,
+ 'IL': 972,
+ 'IM': 44,
+ 'IN': 91,
+ 'IO': 246,
+ 'IQ': 964,
+ 'IR': 98,
+ 'IS': 354,
+ 'IT': 39,
+ 'JE': 44,
+ 'JM': 1,
+ 'JO': 962,
+ 'JP': 81,
+ 'KE': 254,
+ 'KG': 996,
+ 'KH': 855,
+ 'KI': 686,
+ 'KM': 269,
+ 'KN': 1,
+ 'KP': 850,
+ 'KR': 82,
+ 'KW': 965,
+ 'KY': 1,
+ 'KZ': 7,
+ 'LA': 856,
+ 'LB': 961,
+ 'LC': 1,
+ 'LI': 423,
+ 'LK': 94,
+ 'LR': 231,
+ 'LS': 266,
+ 'LT': 370,
+ 'LU': 352,
+ 'LV': 371,
+ 'LY': 218,
+ 'MA': 212,
+ 'MC': 377,
+ 'MD': 373,
+ 'ME': 382,
+ 'MF': 590,
+ 'MG': 261,
+ 'MH': 692,
+ 'MK': 389,
+ 'ML': 223,
+ 'MM': 95,
+ 'MN': 976,
+ 'MO': 853,
+ 'MP': 1,
+ 'MQ': 596,
+ 'MR': 222,
+ 'MS': 1,
+ 'MT': 356,
+ 'MU': 230,
+ 'MV': 960,
+ 'MW': 265,
+ 'MX': 52,
+ 'MY': 60,
+ 'MZ': 258,
+ 'NA': 264,
+ 'NC': 687,
+ 'NE': 227,
+ 'NF': 672,
+ 'NG': 234,
+ 'NI': 505,
+ 'NL': 31,
+ 'NO': 47,
+ 'NP': 977,
+ 'NR': 674,
+ 'NU': 683,
+ 'NZ': 64,
+ 'OM': 968,
+ 'PA': 507,
+ 'PE': 51,
+ 'PF': 689,
+ 'PG': 675,
+ 'PH': 63,
+ 'PK': 92,
+ 'PL': 48,
+ 'PM': 508,
+ 'PR': 1,
+ 'PS': 970,
+ 'PT': 351,
+ 'PW': 680,
+ 'PY': 595,
+ 'QA': 974,
+ 'RE': 262,
+ 'RO': 40,
+ 'RS': 381,
+ 'RU': 7,
+ 'RW': 250,
+ 'SA': 966,
+ 'SB': 677,
+ 'SC': 248,
+ 'SD': 249,
+ 'SE': 46,
+ 'SG': 65,
+ 'SH': 290,
+ 'SI': 386,
+ 'SK': 421,
+ 'SL': 232,
+ 'SM': 378,
+ 'SN': 221,
+ 'SO': 252,
+ 'SR': 597,
+ 'ST': 239,
+ 'SV': 503,
+ 'SY': 963,
+ 'SZ': 268,
+ 'TC': 1,
+ 'TD': 235,
+ 'TF': 262,
+ 'TG': 228,
+ 'TH': 66,
+ 'TJ': 992,
+ 'TK': 690,
+ 'TL': 670,
+ 'TM': 993,
+ 'TN': 216,
+ 'TO': 676,
+ 'TR': 90,
+ 'TT': 1,
+ 'TV': 688,
+ 'TW': 886,
+ 'TZ': 255,
+ 'UA': 380,
+ 'UG': 256,
+ 'US': 1,
+ 'UY': 598,
+ 'UZ': 998,
+ 'VA': 379,
+ 'VC': 1,
+ 'VE': 58,
+ 'VG': 1,
+ 'VI': 1,
+ 'VN': 84,
+ 'VU': 678,
+ 'WF': 681,
+ 'WS': 685,
+ 'YE': 967,
+ 'YT': 262,
+ 'ZA': 27,
+ 'ZM': 260,
+ 'ZW': 263}
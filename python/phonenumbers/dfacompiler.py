@@ -0,0 +1,566 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compilation of metadata regular expressions to deterministic automata.
+
+The patterns in the metadata use a small subset of regular expressions:
+literal characters, digit classes such as \\d and [2-9], grouping, alternation
+and the quantifiers ?, *, + and {n,m}. Patterns in this subset are compiled
+here to a deterministic finite automaton (DFA), whose matcher reads each
+character of a string once and never backtracks, so a match takes time linear
+in the length of the string whatever the pattern.
+
+Several patterns can be compiled into one DFA, which then tells in a single
+pass which of them match: every state records, as a bitmask, the patterns that
+match the characters read so far in full. This is how a number is tested
+against both patterns of a PhoneNumberDesc, or against every description of a
+region, at once.
+
+Anything outside the subset, such as anchors, lookaheads or backreferences,
+raises UnsupportedPatternError; callers then use re for that pattern.
+"""
+
+import array
+import base64
+import marshal
+import sys
+import zlib
+
+# The symbols of the automata: the digits are symbols 0 to 9, and other
+# characters the patterns name literally are numbered from 10 for each DFA.
+_DIGITS = u"0123456789"
+_DIGIT_SYMBOLS = frozenset(xrange(10))
+
+# The quantifiers of the subset and the repetition counts they allow; None
+# stands for no upper bound.
+_QUANTIFIERS = {
+    u"?": (0, 1),
+    u"*": (0, None),
+    u"+": (1, None),
+}
+
+# Characters with a special meaning to re, which stand for themselves in a
+# pattern only when escaped. A closing bracket or brace on its own is taken
+# literally by re as well.
+_SPECIAL_CHARACTERS = frozenset(u".^$*+?{}[]\\|()")
+_LITERAL_SPECIAL_CHARACTERS = frozenset(u"]}")
+
+# States of the DFA are numbered from 1, so 0 is the dead state: the state
+# after a character that no pattern can go on to match.
+_DEAD_STATE = 0
+
+
+class UnsupportedPatternError(ValueError):
+    """Raised when a regular expression uses a construct the DFA compiler
+    does not support."""
+    pass
+
+
+class _Parser(object):
+    """Parses a regular expression of the subset to a syntax tree.
+
+    The nodes of the tree are tuples:
+        ("symbols", frozenset of symbols): one character in the set.
+        ("concat", [nodes]): the nodes in sequence.
+        ("alternate", [nodes]): any one of the nodes.
+        ("repeat", node, minimum, maximum): node repeated; maximum is None if
+            unbounded.
+    """
+
+    def __init__(self, regex, symbols):
+        self._regex = regex
+        self._position = 0
+        # Maps each non-digit character named in the pattern to its symbol,
+        # and is filled in while parsing.
+        self._symbols = symbols
+
+    def parse(self):
+        node = self._parse_alternation()
+        if self._position != len(self._regex):
+            self._fail("unbalanced parenthesis")
+        return node
+
+    def _fail(self, reason):
+        raise UnsupportedPatternError("%s at position %d of %r" %
+                                      (reason, self._position, self._regex))
+
+    def _peek(self):
+        if self._position < len(self._regex):
+            return self._regex[self._position]
+        return None
+
+    def _next(self):
+        character = self._peek()
+        if character is None:
+            self._fail("unexpected end of pattern")
+        self._position += 1
+        return character
+
+    def _parse_alternation(self):
+        branches = [self._parse_concatenation()]
+        while self._peek() == u"|":
+            self._position += 1
+            branches.append(self._parse_concatenation())
+        if len(branches) == 1:
+            return branches[0]
+        return ("alternate", branches)
+
+    def _parse_concatenation(self):
+        items = []
+        while self._peek() not in (None, u"|", u")"):
+            items.append(self._parse_quantified())
+        return ("concat", items)
+
+    def _parse_quantified(self):
+        node = self._parse_atom()
+        while True:
+            character = self._peek()
+            if character in _QUANTIFIERS:
+                self._position += 1
+                minimum, maximum = _QUANTIFIERS[character]
+            elif character == u"{":
+                minimum, maximum = self._parse_counts()
+            else:
+                return node
+            if self._peek() in (u"?", u"+"):
+                # Lazy or possessive quantifiers.
+                self._fail("unsupported quantifier")
+            node = ("repeat", node, minimum, maximum)
+
+    def _parse_counts(self):
+        end = self._regex.find(u"}", self._position)
+        if end == -1:
+            self._fail("unsupported brace")
+        counts = self._regex[self._position + 1:end].split(u",")
+        try:
+            if len(counts) == 1:
+                minimum = maximum = int(counts[0])
+            elif len(counts) == 2:
+                minimum = int(counts[0] or 0)
+                maximum = counts[1] and int(counts[1]) or None
+            else:
+                raise ValueError(counts)
+        except ValueError:
+            self._fail("unsupported brace")
+        if maximum is not None and maximum < minimum:
+            self._fail("bad repetition counts")
+        self._position = end + 1
+        return minimum, maximum
+
+    def _parse_atom(self):
+        character = self._next()
+        if character == u"(":
+            if self._regex.startswith(u"?:", self._position):
+                self._position += 2
+            elif self._peek() == u"?":
+                self._fail("unsupported group")
+            node = self._parse_alternation()
+            if self._next() != u")":
+                self._fail("unbalanced parenthesis")
+            return node
+        if character == u"[":
+            return ("symbols", self._parse_class())
+        if character == u"\\":
+            return ("symbols", self._parse_escape())
+        if (character in _SPECIAL_CHARACTERS and
+            character not in _LITERAL_SPECIAL_CHARACTERS):
+            self._fail("unsupported character %r" % character)
+        return ("symbols", frozenset([self._get_symbol(character)]))
+
+    def _parse_escape(self):
+        character = self._next()
+        if character == u"d":
+            return _DIGIT_SYMBOLS
+        if character in _SPECIAL_CHARACTERS or character in u"-~#/":
+            return frozenset([self._get_symbol(character)])
+        self._fail("unsupported escape \\%s" % character)
+
+    def _parse_class(self):
+        if self._peek() == u"^":
+            self._fail("unsupported negated class")
+        symbols = set()
+        first = True
+        while True:
+            character = self._next()
+            if character == u"]" and not first:
+                return frozenset(symbols)
+            first = False
+            if character == u"\\":
+                symbols.update(self._parse_escape())
+                continue
+            if character == u"[":
+                self._fail("unsupported character %r in class" % character)
+            if (self._peek() == u"-" and
+                self._regex[self._position + 1:self._position + 2] not in
+                    (u"]", u"")):
+                self._position += 1
+                last = self._next()
+                if character not in _DIGITS or last not in _DIGITS:
+                    self._fail("unsupported range %s-%s" % (character, last))
+                if last < character:
+                    self._fail("bad range %s-%s" % (character, last))
+                symbols.update(xrange(int(character), int(last) + 1))
+            else:
+                symbols.add(self._get_symbol(character))
+
+    def _get_symbol(self, character):
+        if character in _DIGITS:
+            return int(character)
+        return self._symbols.setdefault(character, 10 + len(self._symbols))
+
+
+class _NFA(object):
+    """A nondeterministic automaton built from syntax trees by Thompson's
+    construction. State 0 is the start state."""
+
+    def __init__(self):
+        # For each state, a list of (frozenset of symbols, target state).
+        self.transitions = []
+        # For each state, the states reachable without reading a character.
+        self.epsilons = []
+        self.accept_state = None
+
+    def new_state(self):
+        self.transitions.append([])
+        self.epsilons.append([])
+        return len(self.transitions) - 1
+
+    def build(self, node):
+        start = self.new_state()
+        self.accept_state = self._add(node, start)
+        return self
+
+    def _add(self, node, start):
+        """Adds the states for node, entered at start, and returns the state
+        reached when node has matched."""
+        kind = node[0]
+        if kind == "symbols":
+            end = self.new_state()
+            self.transitions[start].append((node[1], end))
+            return end
+        if kind == "concat":
+            state = start
+            for item in node[1]:
+                state = self._add(item, state)
+            return state
+        if kind == "alternate":
+            end = self.new_state()
+            for branch in node[1]:
+                branch_start = self.new_state()
+                self.epsilons[start].append(branch_start)
+                self.epsilons[self._add(branch, branch_start)].append(end)
+            return end
+        _, item, minimum, maximum = node
+        state = start
+        for _ in xrange(minimum):
+            state = self._add(item, state)
+        if maximum is None:
+            # A loop back for each further repetition.
+            loop_start = self.new_state()
+            self.epsilons[state].append(loop_start)
+            loop_end = self._add(item, loop_start)
+            self.epsilons[loop_end].append(loop_start)
+            end = self.new_state()
+            self.epsilons[state].append(end)
+            self.epsilons[loop_end].append(end)
+            return end
+        end = self.new_state()
+        for _ in xrange(maximum - minimum):
+            self.epsilons[state].append(end)
+            state = self._add(item, state)
+        self.epsilons[state].append(end)
+        return end
+
+    def closure(self, states):
+        """Returns the frozenset of the states reachable from states without
+        reading a character."""
+        result = set(states)
+        pending = list(states)
+        while pending:
+            for target in self.epsilons[pending.pop()]:
+                if target not in result:
+                    result.add(target)
+                    pending.append(target)
+        return frozenset(result)
+
+    def step(self, states, symbol):
+        """Returns the closure of the states reached from states by reading
+        symbol."""
+        targets = [target for state in states
+                   for symbols, target in self.transitions[state]
+                   if symbol in symbols]
+        return self.closure(targets)
+
+
+class DFA(object):
+    """A deterministic automaton matching one or more patterns at once.
+
+    Attributes:
+        regexes: the patterns, in the order of the bits of the accept masks.
+        symbols: maps each character the patterns can match to its symbol.
+        symbol_count: the number of symbols, which is the width of a row of
+            the transition table.
+        transitions: array with a row of symbol_count next states for each
+            state; state 0 is the dead state, whose row leads back to itself,
+            and state 1 is the start state.
+        accept_masks: array holding for each state the bitmask of the
+            patterns that match in full the characters read to reach it; bit
+            i stands for regexes[i].
+    """
+
+    def __init__(self, regexes, symbols, transitions, accept_masks):
+        self.regexes = tuple(regexes)
+        self.symbols = symbols
+        self.symbol_count = len(symbols)
+        self.transitions = transitions
+        self.accept_masks = accept_masks
+
+    @property
+    def state_count(self):
+        return len(self.accept_masks)
+
+    def run(self, string):
+        """Returns the state reached by reading all of string from the start
+        state, which is 0 as soon as no pattern can match."""
+        symbols = self.symbols
+        symbol_count = self.symbol_count
+        transitions = self.transitions
+        state = 1
+        for character in string:
+            symbol = symbols.get(character)
+            if symbol is None:
+                return _DEAD_STATE
+            state = transitions[state * symbol_count + symbol]
+            if state == _DEAD_STATE:
+                return _DEAD_STATE
+        return state
+
+    def match_mask(self, string):
+        """Returns the bitmask of the patterns that match all of string."""
+        return self.accept_masks[self.run(string)]
+
+    def full_match(self, string):
+        """Returns whether every pattern of the DFA matches all of string."""
+        all_patterns = (1 << len(self.regexes)) - 1
+        return self.accept_masks[self.run(string)] == all_patterns
+
+    def get_match_lengths_mask(self, max_length):
+        """Returns the bitmask of the lengths of the strings that every
+        pattern of the DFA matches in full, where bit n stands for length n,
+        or None if some of these strings are longer than max_length."""
+        symbol_count = self.symbol_count
+        transitions = self.transitions
+        accept_masks = self.accept_masks
+        all_patterns = (1 << len(self.regexes)) - 1
+        mask = 0
+        states = set([1])
+        for length in xrange(max_length + 1):
+            states.discard(_DEAD_STATE)
+            if not states:
+                return mask
+            if any(accept_masks[state] == all_patterns for state in states):
+                mask |= 1 << length
+            states = set(transitions[state * symbol_count + symbol]
+                         for state in states
+                         for symbol in xrange(symbol_count))
+        # Strings of max_length + 1 characters or more may still be matched.
+        if states - self._get_dead_ends():
+            return None
+        return mask
+
+    def _get_dead_ends(self):
+        # The states from which no string is matched by every pattern.
+        symbol_count = self.symbol_count
+        all_patterns = (1 << len(self.regexes)) - 1
+        live_states = set(state for state in xrange(self.state_count)
+                          if self.accept_masks[state] == all_patterns)
+        changed = True
+        while changed:
+            changed = False
+            for state in xrange(self.state_count):
+                if state not in live_states and any(
+                        self.transitions[state * symbol_count + symbol] in
+                        live_states for symbol in xrange(symbol_count)):
+                    live_states.add(state)
+                    changed = True
+        return set(xrange(self.state_count)) - live_states
+
+
+# The array typecodes tables are stored with, by item size; these sizes hold on
+# every platform Python supports.
+_TYPECODES_BY_ITEM_SIZE = {1: "B", 2: "H", 4: "I"}
+
+# The most regular expressions a DFA can be compiled from, as each takes a bit
+# of the accept masks, which must fit in the largest item size.
+_MAX_REGEX_COUNT = 8 * max(_TYPECODES_BY_ITEM_SIZE)
+
+
+def _get_typecode(count):
+    """Returns the smallest unsigned array typecode of _TYPECODES_BY_ITEM_SIZE
+    that holds values below count.
+
+    Raises:
+        OverflowError: values below count do not all fit in 32 bits.
+    """
+    for item_size in sorted(_TYPECODES_BY_ITEM_SIZE):
+        if count <= 1 << (8 * item_size):
+            return _TYPECODES_BY_ITEM_SIZE[item_size]
+    raise OverflowError("values below %d do not fit in %d bits" %
+                        (count, 8 * max(_TYPECODES_BY_ITEM_SIZE)))
+
+
+def _minimize(transitions, accept_masks, symbol_count):
+    """Merges the states that no string tells apart, by refining the
+    partition of the states by accept mask until the states of each block
+    lead to the same blocks.
+
+    Returns:
+        the transitions and accept masks of the minimal DFA, as lists, with
+        the dead state still 0 and the start state 1.
+    """
+    state_count = len(accept_masks)
+    blocks = list(accept_masks)
+    block_count = len(set(blocks))
+    while True:
+        signatures = {}
+        new_blocks = [
+                signatures.setdefault(
+                        (blocks[state],
+                         tuple([blocks[target] for target in transitions[
+                                state * symbol_count:
+                                (state + 1) * symbol_count]])),
+                        len(signatures))
+                for state in xrange(state_count)]
+        blocks = new_blocks
+        if len(signatures) == block_count:
+            break
+        block_count = len(signatures)
+
+    # Number the blocks in the order their first states were found, which
+    # puts the dead state first and the start state second, unless no string
+    # is matched at all and the start state is dead too.
+    state_by_block = {}
+    kept_states = []
+    for state in xrange(state_count):
+        if blocks[state] not in state_by_block or state == 1:
+            state_by_block.setdefault(blocks[state], len(kept_states))
+            kept_states.append(state)
+    new_transitions = []
+    for state in kept_states:
+        new_transitions.extend(
+                state_by_block[blocks[target]] for target in
+                transitions[state * symbol_count:(state + 1) * symbol_count])
+    return new_transitions, [accept_masks[state] for state in kept_states]
+
+
+def compile_dfa(regexes, max_states=10000):
+    """Compiles one or more regular expressions of the supported subset to a
+    single DFA.
+
+    Args:
+        regexes: the regular expressions; each one is matched as if anchored
+            at both ends.
+        max_states: limit on the number of states of the DFA.
+    Returns:
+        the DFA.
+    Raises:
+        UnsupportedPatternError: a regular expression uses a construct outside
+            the subset, the DFA would have more than max_states states, or
+            there are more than 32 regular expressions, which is as many as
+            the accept masks can tell apart.
+    """
+    if isinstance(regexes, basestring):
+        regexes = [regexes]
+    if len(regexes) > _MAX_REGEX_COUNT:
+        raise UnsupportedPatternError("more than %d regular expressions" %
+                                      _MAX_REGEX_COUNT)
+    symbol_map = {}
+    nfas = [_NFA().build(_Parser(regex, symbol_map).parse())
+            for regex in regexes]
+    symbol_count = 10 + len(symbol_map)
+    symbols = dict((digit, int(digit)) for digit in _DIGITS)
+    symbols.update(symbol_map)
+
+    # Subset construction over all the NFAs at once: a DFA state is the tuple
+    # of the sets of states each NFA can be in.
+    dead = tuple(frozenset() for _ in nfas)
+    start = tuple(nfa.closure([0]) for nfa in nfas)
+    state_ids = {dead: _DEAD_STATE, start: 1}
+    states = [dead, start]
+    transitions = [_DEAD_STATE] * (2 * symbol_count)
+    index = 1
+    while index < len(states):
+        state = states[index]
+        for symbol in xrange(symbol_count):
+            target = tuple(nfa.step(nfa_states, symbol)
+                           for nfa, nfa_states in zip(nfas, state))
+            target_id = state_ids.get(target)
+            if target_id is None:
+                if len(states) >= max_states:
+                    raise UnsupportedPatternError(
+                            "more than %d states for %r" % (max_states,
+                                                            regexes))
+                target_id = len(states)
+                state_ids[target] = target_id
+                states.append(target)
+                transitions.extend([_DEAD_STATE] * symbol_count)
+            transitions[index * symbol_count + symbol] = target_id
+        index += 1
+
+    accept_masks = []
+    for state in states:
+        mask = 0
+        for bit, (nfa, nfa_states) in enumerate(zip(nfas, state)):
+            if nfa.accept_state in nfa_states:
+                mask |= 1 << bit
+        accept_masks.append(mask)
+    transitions, accept_masks = _minimize(transitions, accept_masks,
+                                          symbol_count)
+    return DFA(regexes, symbols,
+               array.array(_get_typecode(len(accept_masks)), transitions),
+               array.array(_get_typecode(1 << len(nfas)), accept_masks))
+
+
+def dfa_to_string(dfa):
+    """Serializes a DFA to an ASCII string, for generated modules."""
+    non_digit_symbols = sorted((symbol, character) for character, symbol in
+                               dfa.symbols.items() if character not in _DIGITS)
+    tables = []
+    for table in (dfa.transitions, dfa.accept_masks):
+        table = array.array(table.typecode, table)
+        # Tables are stored little-endian.
+        if sys.byteorder == "big":
+            table.byteswap()
+        tables.append((table.itemsize, table.tostring()))
+    return base64.b64encode(zlib.compress(marshal.dumps(
+            (tuple(dfa.regexes),
+             u"".join(character for _, character in non_digit_symbols),
+             tuple(tables))), 9))
+
+
+def dfa_from_string(data):
+    """Reads a DFA serialized by dfa_to_string()."""
+    regexes, non_digit_characters, tables = marshal.loads(zlib.decompress(
+            base64.b64decode(data)))
+    symbols = dict((digit, int(digit)) for digit in _DIGITS)
+    for symbol, character in enumerate(non_digit_characters):
+        symbols[character] = 10 + symbol
+    arrays = []
+    for item_size, table_data in tables:
+        table = array.array(_TYPECODES_BY_ITEM_SIZE[item_size])
+        table.fromstring(table_data)
+        if sys.byteorder == "big":
+            table.byteswap()
+        arrays.append(table)
+    return DFA(regexes, symbols, arrays[0], arrays[1])
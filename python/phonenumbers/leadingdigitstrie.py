@@ -0,0 +1,137 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Selection of the number formats that can apply to a number by its leading
+digits.
+
+A number format applies only to numbers whose start matches its leading
+digits pattern. Each such pattern is expanded here into the shortest digit
+prefixes it matches, such as "[2-4]|51" into "2", "3", "4" and "51", and the
+prefixes of all the formats of a region are merged into a trie. Walking the
+digits of a number down the trie then yields, in order, the formats whose
+leading digits can match it, so that formatting a number tries the patterns of
+a few formats rather than of every format of its region.
+
+The trie only narrows the formats down: the leading digits pattern and the
+pattern of each candidate are still matched before it is used.
+"""
+
+from phonenumbers import dfacompiler
+
+
+# Limits on the expansion of a leading digits pattern. A format whose pattern
+# has more prefixes, or longer ones, is a candidate for every number instead.
+_MAX_PREFIXES = 1000
+_MAX_PREFIX_LENGTH = 8
+
+_DIGITS = u"0123456789"
+
+
+def expand_leading_digits(regex):
+    """Returns the shortest digit strings that regex matches, so that it
+    matches the start of a string of digits if and only if the string starts
+    with one of them.
+
+    Returns:
+        a sorted list of the prefixes, or None if regex cannot be expanded
+        within the limits; [u""] if it matches the empty string.
+    """
+    try:
+        dfa = dfacompiler.compile_dfa(regex)
+    except dfacompiler.UnsupportedPatternError:
+        return None
+    prefixes = []
+    # Depth-first walk of the DFA from the start state, up to the first
+    # accepting state along each path.
+    pending = [(u"", 1)]
+    while pending:
+        prefix, state = pending.pop()
+        if dfa.accept_masks[state]:
+            prefixes.append(prefix)
+            if len(prefixes) > _MAX_PREFIXES:
+                return None
+            continue
+        if len(prefix) == _MAX_PREFIX_LENGTH:
+            return None
+        for digit in _DIGITS:
+            next_state = dfa.transitions[state * dfa.symbol_count +
+                                         dfa.symbols[digit]]
+            if next_state:
+                pending.append((prefix + digit, next_state))
+    return sorted(prefixes)
+
+
+class LeadingDigitsTrie(object):
+    """The number formats of a region, indexed by the leading digits they
+    apply to.
+
+    Each node of the trie is a pair of a dict from digit to child node and the
+    tuple of the formats that can apply to a number whose digits lead to the
+    node, in their original order.
+    """
+
+    def __init__(self, compiled_formats):
+        """Args:
+            compiled_formats: the CompiledNumberFormat instances, in the order
+                they are tried in.
+        """
+        self.compiled_formats = tuple(compiled_formats)
+        # Built as nested pairs of a dict from digit to child and the set of
+        # the indices of the formats whose prefixes end at the node.
+        root = ({}, set())
+        for index, compiled_format in enumerate(self.compiled_formats):
+            prefixes = None
+            if compiled_format.leading_digits_pattern is not None:
+                prefixes = expand_leading_digits(
+                        compiled_format.leading_digits_pattern.pattern)
+            if prefixes is None:
+                # Tried for every number, with its regex deciding if it has
+                # one.
+                prefixes = [u""]
+            for prefix in prefixes:
+                node = root
+                for digit in prefix:
+                    node = node[0].setdefault(digit, ({}, set()))
+                node[1].add(index)
+        self._root = self._freeze_node(root, frozenset())
+
+    def _freeze_node(self, node, inherited_indices):
+        # A format that can apply at a node can apply at all the nodes below
+        # it.
+        indices = inherited_indices | node[1]
+        return (dict((digit, self._freeze_node(child, indices))
+                     for digit, child in node[0].items()),
+                tuple(self.compiled_formats[index]
+                      for index in sorted(indices)))
+
+    def get_candidate_formats(self, national_number):
+        """Returns the formats whose leading digits can match the start of
+        national_number, in their original order."""
+        node = self._root
+        for digit in national_number:
+            child = node[0].get(digit)
+            if child is None:
+                break
+            node = child
+        return node[1]
+
+    def get_node_count(self):
+        """Returns the number of nodes of the trie."""
+        count = 0
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            count += 1
+            pending.extend(node[0].values())
+        return count
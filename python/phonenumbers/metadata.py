@@ -0,0 +1,1730 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This file is automatically generated by buildmetadataprotofromxml.py. Do
+not modify directly."""
+
+
+# A mapping from a country code to the region codes which denote the
+# country/region represented by that country code. In the case of multiple
+# countries sharing a calling code, such as the NANPA countries, the one
+# indicated with "is_main_country_for_code" in the metadata should be first.
+country_code_to_region_code_map = {1: ['US',
+     'AG',
+     'AI',
+     'AS',
+     'BB',
+     'BM',
+     'BS',
+     'CA',
+     'DM',
+     'DO',
+     'GD',
+     'GU',
+     'JM',
+     'KN',
+     'KY',
+     'LC',
+     'MP',
+     'MS',
+     'PR',
+     'TC',
+     'TT',
+     'VC',
+     'VG',
+     'VI'],
+ 7: ['RU', 'KZ'],
+ 20: ['EG'],
+ 27: ['ZA'],
+ 30: ['GR'],
+ 31: ['NL'],
+ 32: ['BE'],
+ 33: ['FR'],
+ 34: ['ES'],
+ 36: ['HU'],
+ 39: ['IT'],
+ 40: ['RO'],
+ 41: ['CH'],
+ 43: ['AT'],
+ 44: ['GB', 'GG', 'IM', 'JE'],
+ 45: ['DK'],
+ 46: ['SE'],
+ 47: ['NO'],
+ 48: ['PL'],
+ 49: ['DE'],
+ 51: ['PE'],
+ 52: ['MX'],
+ 53: ['CU'],
+ 54: ['AR'],
+ 55: ['BR'],
+ 56: ['CL'],
+ 57: ['CO'],
+ 58: ['VE'],
+ 60: ['MY'],
+ 61: ['AU'],
+ 62: ['ID'],
+ 63: ['PH'],
+ 64: ['NZ'],
+ 65: ['SG'],
+ 66: ['TH'],
+ 81: ['JP'],
+ 82: ['KR'],
+ 84: ['VN'],
+ 86: ['CN'],
+ 90: ['TR'],
+ 91: ['IN'],
+ 92: ['PK'],
+ 93: ['AF'],
+ 94: ['LK'],
+ 95: ['MM'],
+ 98: ['IR'],
+ 212: ['MA'],
+ 213: ['DZ'],
+ 216: ['TN'],
+ 218: ['LY'],
+ 220: ['GM'],
+ 221: ['SN'],
+ 222: ['MR'],
+ 223: ['ML'],
+ 224: ['GN'],
+ 225: ['CI'],
+ 226: ['BF'],
+ 227: ['NE'],
+ 228: ['TG'],
+ 229: ['BJ'],
+ 230: ['MU'],
+ 231: ['LR'],
+ 232: ['SL'],
+ 233: ['GH'],
+ 234: ['NG'],
+ 235: ['TD'],
+ 236: ['CF'],
+ 237: ['CM'],
+ 238: ['CV'],
+ 239: ['ST'],
+ 240: ['GQ'],
+ 241: ['GA'],
+ 242: ['CG'],
+ 243: ['CD'],
+ 244: ['AO'],
+ 245: ['GW'],
+ 246: ['IO'],
+ 248: ['SC'],
+ 249: ['SD'],
+ 250: ['RW'],
+ 251: ['ET'],
+ 252: ['SO'],
+ 253: ['DJ'],
+ 254: ['KE'],
+ 255: ['TZ'],
+ 256: ['UG'],
+ 257: ['BI'],
+ 258: ['MZ'],
+ 260: ['ZM'],
+ 261: ['MG'],
+ 262: ['RE', 'TF', 'YT'],
+ 263: ['ZW'],
+ 264: ['NA'],
+ 265: ['MW'],
+ 266: ['LS'],
+ 267: ['BW'],
+ 268: ['SZ'],
+ 269: ['KM'],
+ 290: ['SH'],
+ 291: ['ER'],
+ 297: ['AW'],
+ 298: ['FO'],
+ 299: ['GL'],
+ 350: ['GI'],
+ 351: ['PT'],
+ 352: ['LU'],
+ 353: ['IE'],
+ 354: ['IS'],
+ 355: ['AL'],
+ 356: ['MT'],
+ 357: ['CY'],
+ 358: ['FI'],
+ 359: ['BG'],
+ 370: ['LT'],
+ 371: ['LV'],
+ 372: ['EE'],
+ 373: ['MD'],
+ 374: ['AM'],
+ 375: ['BY'],
+ 376: ['AD'],
+ 377: ['MC'],
+ 378: ['SM'],
+ 379: ['VA'],
+ 380: ['UA'],
+ 381: ['RS'],
+ 382: ['ME'],
+ 385: ['HR'],
+ 386: ['SI'],
+ 387: ['BA'],
+ 389: ['MK'],
+ 420: ['CZ'],
+ 421: ['SK'],
+ 423: ['LI'],
+ 500: ['FK'],
+ 501: ['BZ'],
+ 502: ['GT'],
+ 503: ['SV'],
+ 504: ['HN'],
+ 505: ['NI'],
+ 506: ['CR'],
+ 507: ['PA'],
+ 508: ['PM'],
+ 509: ['HT'],
+ 590: ['GP', 'BL', 'MF'],
+ 591: ['BO'],
+ 592: ['GY'],
+ 593: ['EC'],
+ 594: ['GF'],
+ 595: ['PY'],
+ 596: ['MQ'],
+ 597: ['SR'],
+ 598: ['UY'],
+ 599: ['AN'],
+ 670: ['TL'],
+ 672: ['NF'],
+ 673: ['BN'],
+ 674: ['NR'],
+ 675: ['PG'],
+ 676: ['TO'],
+ 677: ['SB'],
+ 678: ['VU'],
+ 679: ['FJ'],
+ 680: ['PW'],
+ 681: ['WF'],
+ 682: ['CK'],
+ 683: ['NU'],
+ 685: ['WS'],
+ 686: ['KI'],
+ 687: ['NC'],
+ 688: ['TV'],
+ 689: ['PF'],
+ 690: ['TK'],
+ 691: ['FM'],
+ 692: ['MH'],
+ 850: ['KP'],
+ 852: ['HK'],
+ 853: ['MO'],
+ 855: ['KH'],
+ 856: ['LA'],
+ 880: ['BD'],
+ 886: ['TW'],
+ 960: ['MV'],
+ 961: ['LB'],
+ 962: ['JO'],
+ 963: ['SY'],
+ 964: ['IQ'],
+ 965: ['KW'],
+ 966: ['SA'],
+ 967: ['YE'],
+ 968: ['OM'],
+ 970: ['PS'],
+ 971: ['AE'],
+ 972: ['IL'],
+ 973: ['BH'],
+ 974: ['QA'],
+ 975: ['BT'],
+ 976: ['MN'],
+ 977: ['NP'],
+ 992: ['TJ'],
+ 993: ['TM'],
+ 994: ['AZ'],
+ 995: ['GE'],
+ 996: ['KG'],
+ 998: ['UZ']}
+
+# The same mapping as a tuple indexed by country code, with None for the codes
+# that have no regions, and its reverse from region code to country code (see
+# countrycodeindex.py).
+region_codes_by_country_code = (
+    None,  # 0
+    ('US', 'AG', 'AI', 'AS', 'BB', 'BM', 'BS', 'CA', 'DM', 'DO', 'GD', 'GU', 'JM', 'KN', 'KY', 'LC', 'MP', 'MS', 'PR', 'TC', 'TT', 'VC', 'VG', 'VI'),  # 1
+    None,  # 2
+    None,  # 3
+    None,  # 4
+    None,  # 5
+    None,  # 6
+    ('RU', 'KZ'),  # 7
+    None,  # 8
+    None,  # 9
+    None,  # 10
+    None,  # 11
+    None,  # 12
+    None,  # 13
+    None,  # 14
+    None,  # 15
+    None,  # 16
+    None,  # 17
+    None,  # 18
+    None,  # 19
+    ('EG',),  # 20
+    None,  # 21
+    None,  # 22
+    None,  # 23
+    None,  # 24
+    None,  # 25
+    None,  # 26
+    ('ZA',),  # 27
+    None,  # 28
+    None,  # 29
+    ('GR',),  # 30
+    ('NL',),  # 31
+    ('BE',),  # 32
+    ('FR',),  # 33
+    ('ES',),  # 34
+    None,  # 35
+    ('HU',),  # 36
+    None,  # 37
+    None,  # 38
+    ('IT',),  # 39
+    ('RO',),  # 40
+    ('CH',),  # 41
+    None,  # 42
+    ('AT',),  # 43
+    ('GB', 'GG', 'IM', 'JE'),  # 44
+    ('DK',),  # 45
+    ('SE',),  # 46
+    ('NO',),  # 47
+    ('PL',),  # 48
+    ('DE',),  # 49
+    None,  # 50
+    ('PE',),  # 51
+    ('MX',),  # 52
+    ('CU',),  # 53
+    ('AR',),  # 54
+    ('BR',),  # 55
+    ('CL',),  # 56
+    ('CO',),  # 57
+    ('VE',),  # 58
+    None,  # 59
+    ('MY',),  # 60
+    ('AU',),  # 61
+    ('ID',),  # 62
+    ('PH',),  # 63
+    ('NZ',),  # 64
+    ('SG',),  # 65
+    ('TH',),  # 66
+    None,  # 67
+    None,  # 68
+    None,  # 69
+    None,  # 70
+    None,  # 71
+    None,  # 72
+    None,  # 73
+    None,  # 74
+    None,  # 75
+    None,  # 76
+    None,  # 77
+    None,  # 78
+    None,  # 79
+    None,  # 80
+    ('JP',),  # 81
+    ('KR',),  # 82
+    None,  # 83
+    ('VN',),  # 84
+    None,  # 85
+    ('CN',),  # 86
+    None,  # 87
+    None,  # 88
+    None,  # 89
+    ('TR',),  # 90
+    ('IN',),  # 91
+    ('PK',),  # 92
+    ('AF',),  # 93
+    ('LK',),  # 94
+    ('MM',),  # 95
+    None,  # 96
+    None,  # 97
+    ('IR',),  # 98
+    None,  # 99
+    None,  # 100
+    None,  # 101
+    None,  # 102
+    None,  # 103
+    None,  # 104
+    None,  # 105
+    None,  # 106
+    None,  # 107
+    None,  # 108
+    None,  # 109
+    None,  # 110
+    None,  # 111
+    None,  # 112
+    None,  # 113
+    None,  # 114
+    None,  # 115
+    None,  # 116
+    None,  # 117
+    None,  # 118
+    None,  # 119
+    None,  # 120
+    None,  # 121
+    None,  # 122
+    None,  # 123
+    None,  # 124
+    None,  # 125
+    None,  # 126
+    None,  # 127
+    None,  # 128
+    None,  # 129
+    None,  # 130
+    None,  # 131
+    None,  # 132
+    None,  # 133
+    None,  # 134
+    None,  # 135
+    None,  # 136
+    None,  # 137
+    None,  # 138
+    None,  # 139
+    None,  # 140
+    None,  # 141
+    None,  # 142
+    None,  # 143
+    None,  # 144
+    None,  # 145
+    None,  # 146
+    None,  # 147
+    None,  # 148
+    None,  # 149
+    None,  # 150
+    None,  # 151
+    None,  # 152
+    None,  # 153
+    None,  # 154
+    None,  # 155
+    None,  # 156
+    None,  # 157
+    None,  # 158
+    None,  # 159
+    None,  # 160
+    None,  # 161
+    None,  # 162
+    None,  # 163
+    None,  # 164
+    None,  # 165
+    None,  # 166
+    None,  # 167
+    None,  # 168
+    None,  # 169
+    None,  # 170
+    None,  # 171
+    None,  # 172
+    None,  # 173
+    None,  # 174
+    None,  # 175
+    None,  # 176
+    None,  # 177
+    None,  # 178
+    None,  # 179
+    None,  # 180
+    None,  # 181
+    None,  # 182
+    None,  # 183
+    None,  # 184
+    None,  # 185
+    None,  # 186
+    None,  # 187
+    None,  # 188
+    None,  # 189
+    None,  # 190
+    None,  # 191
+    None,  # 192
+    None,  # 193
+    None,  # 194
+    None,  # 195
+    None,  # 196
+    None,  # 197
+    None,  # 198
+    None,  # 199
+    None,  # 200
+    None,  # 201
+    None,  # 202
+    None,  # 203
+    None,  # 204
+    None,  # 205
+    None,  # 206
+    None,  # 207
+    None,  # 208
+    None,  # 209
+    None,  # 210
+    None,  # 211
+    ('MA',),  # 212
+    ('DZ',),  # 213
+    None,  # 214
+    None,  # 215
+    ('TN',),  # 216
+    None,  # 217
+    ('LY',),  # 218
+    None,  # 219
+    ('GM',),  # 220
+    ('SN',),  # 221
+    ('MR',),  # 222
+    ('ML',),  # 223
+    ('GN',),  # 224
+    ('CI',),  # 225
+    ('BF',),  # 226
+    ('NE',),  # 227
+    ('TG',),  # 228
+    ('BJ',),  # 229
+    ('MU',),  # 230
+    ('LR',),  # 231
+    ('SL',),  # 232
+    ('GH',),  # 233
+    ('NG',),  # 234
+    ('TD',),  # 235
+    ('CF',),  # 236
+    ('CM',),  # 237
+    ('CV',),  # 238
+    ('ST',),  # 239
+    ('GQ',),  # 240
+    ('GA',),  # 241
+    ('CG',),  # 242
+    ('CD',),  # 243
+    ('AO',),  # 244
+    ('GW',),  # 245
+    ('IO',),  # 246
+    None,  # 247
+    ('SC',),  # 248
+    ('SD',),  # 249
+    ('RW',),  # 250
+    ('ET',),  # 251
+    ('SO',),  # 252
+    ('DJ',),  # 253
+    ('KE',),  # 254
+    ('TZ',),  # 255
+    ('UG',),  # 256
+    ('BI',),  # 257
+    ('MZ',),  # 258
+    None,  # 259
+    ('ZM',),  # 260
+    ('MG',),  # 261
+    ('RE', 'TF', 'YT'),  # 262
+    ('ZW',),  # 263
+    ('NA',),  # 264
+    ('MW',),  # 265
+    ('LS',),  # 266
+    ('BW',),  # 267
+    ('SZ',),  # 268
+    ('KM',),  # 269
+    None,  # 270
+    None,  # 271
+    None,  # 272
+    None,  # 273
+    None,  # 274
+    None,  # 275
+    None,  # 276
+    None,  # 277
+    None,  # 278
+    None,  # 279
+    None,  # 280
+    None,  # 281
+    None,  # 282
+    None,  # 283
+    None,  # 284
+    None,  # 285
+    None,  # 286
+    None,  # 287
+    None,  # 288
+    None,  # 289
+    ('SH',),  # 290
+    ('ER',),  # 291
+    None,  # 292
+    None,  # 293
+    None,  # 294
+    None,  # 295
+    None,  # 296
+    ('AW',),  # 297
+    ('FO',),  # 298
+    ('GL',),  # 299
+    None,  # 300
+    None,  # 301
+    None,  # 302
+    None,  # 303
+    None,  # 304
+    None,  # 305
+    None,  # 306
+    None,  # 307
+    None,  # 308
+    None,  # 309
+    None,  # 310
+    None,  # 311
+    None,  # 312
+    None,  # 313
+    None,  # 314
+    None,  # 315
+    None,  # 316
+    None,  # 317
+    None,  # 318
+    None,  # 319
+    None,  # 320
+    None,  # 321
+    None,  # 322
+    None,  # 323
+    None,  # 324
+    None,  # 325
+    None,  # 326
+    None,  # 327
+    None,  # 328
+    None,  # 329
+    None,  # 330
+    None,  # 331
+    None,  # 332
+    None,  # 333
+    None,  # 334
+    None,  # 335
+    None,  # 336
+    None,  # 337
+    None,  # 338
+    None,  # 339
+    None,  # 340
+    None,  # 341
+    None,  # 342
+    None,  # 343
+    None,  # 344
+    None,  # 345
+    None,  # 346
+    None,  # 347
+    None,  # 348
+    None,  # 349
+    ('GI',),  # 350
+    ('PT',),  # 351
+    ('LU',),  # 352
+    ('IE',),  # 353
+    ('IS',),  # 354
+    ('AL',),  # 355
+    ('MT',),  # 356
+    ('CY',),  # 357
+    ('FI',),  # 358
+    ('BG',),  # 359
+    None,  # 360
+    None,  # 361
+    None,  # 362
+    None,  # 363
+    None,  # 364
+    None,  # 365
+    None,  # 366
+    None,  # 367
+    None,  # 368
+    None,  # 369
+    ('LT',),  # 370
+    ('LV',),  # 371
+    ('EE',),  # 372
+    ('MD',),  # 373
+    ('AM',),  # 374
+    ('BY',),  # 375
+    ('AD',),  # 376
+    ('MC',),  # 377
+    ('SM',),  # 378
+    ('VA',),  # 379
+    ('UA',),  # 380
+    ('RS',),  # 381
+    ('ME',),  # 382
+    None,  # 383
+    None,  # 384
+    ('HR',),  # 385
+    ('SI',),  # 386
+    ('BA',),  # 387
+    None,  # 388
+    ('MK',),  # 389
+    None,  # 390
+    None,  # 391
+    None,  # 392
+    None,  # 393
+    None,  # 394
+    None,  # 395
+    None,  # 396
+    None,  # 397
+    None,  # 398
+    None,  # 399
+    None,  # 400
+    None,  # 401
+    None,  # 402
+    None,  # 403
+    None,  # 404
+    None,  # 405
+    None,  # 406
+    None,  # 407
+    None,  # 408
+    None,  # 409
+    None,  # 410
+    None,  # 411
+    None,  # 412
+    None,  # 413
+    None,  # 414
+    None,  # 415
+    None,  # 416
+    None,  # 417
+    None,  # 418
+    None,  # 419
+    ('CZ',),  # 420
+    ('SK',),  # 421
+    None,  # 422
+    ('LI',),  # 423
+    None,  # 424
+    None,  # 425
+    None,  # 426
+    None,  # 427
+    None,  # 428
+    None,  # 429
+    None,  # 430
+    None,  # 431
+    None,  # 432
+    None,  # 433
+    None,  # 434
+    None,  # 435
+    None,  # 436
+    None,  # 437
+    None,  # 438
+    None,  # 439
+    None,  # 440
+    None,  # 441
+    None,  # 442
+    None,  # 443
+    None,  # 444
+    None,  # 445
+    None,  # 446
+    None,  # 447
+    None,  # 448
+    None,  # 449
+    None,  # 450
+    None,  # 451
+    None,  # 452
+    None,  # 453
+    None,  # 454
+    None,  # 455
+    None,  # 456
+    None,  # 457
+    None,  # 458
+    None,  # 459
+    None,  # 460
+    None,  # 461
+    None,  # 462
+    None,  # 463
+    None,  # 464
+    None,  # 465
+    None,  # 466
+    None,  # 467
+    None,  # 468
+    None,  # 469
+    None,  # 470
+    None,  # 471
+    None,  # 472
+    None,  # 473
+    None,  # 474
+    None,  # 475
+    None,  # 476
+    None,  # 477
+    None,  # 478
+    None,  # 479
+    None,  # 480
+    None,  # 481
+    None,  # 482
+    None,  # 483
+    None,  # 484
+    None,  # 485
+    None,  # 486
+    None,  # 487
+    None,  # 488
+    None,  # 489
+    None,  # 490
+    None,  # 491
+    None,  # 492
+    None,  # 493
+    None,  # 494
+    None,  # 495
+    None,  # 496
+    None,  # 497
+    None,  # 498
+    None,  # 499
+    ('FK',),  # 500
+    ('BZ',),  # 501
+    ('GT',),  # 502
+    ('SV',),  # 503
+    ('HN',),  # 504
+    ('NI',),  # 505
+    ('CR',),  # 506
+    ('PA',),  # 507
+    ('PM',),  # 508
+    ('HT',),  # 509
+    None,  # 510
+    None,  # 511
+    None,  # 512
+    None,  # 513
+    None,  # 514
+    None,  # 515
+    None,  # 516
+    None,  # 517
+    None,  # 518
+    None,  # 519
+    None,  # 520
+    None,  # 521
+    None,  # 522
+    None,  # 523
+    None,  # 524
+    None,  # 525
+    None,  # 526
+    None,  # 527
+    None,  # 528
+    None,  # 529
+    None,  # 530
+    None,  # 531
+    None,  # 532
+    None,  # 533
+    None,  # 534
+    None,  # 535
+    None,  # 536
+    None,  # 537
+    None,  # 538
+    None,  # 539
+    None,  # 540
+    None,  # 541
+    None,  # 542
+    None,  # 543
+    None,  # 544
+    None,  # 545
+    None,  # 546
+    None,  # 547
+    None,  # 548
+    None,  # 549
+    None,  # 550
+    None,  # 551
+    None,  # 552
+    None,  # 553
+    None,  # 554
+    None,  # 555
+    None,  # 556
+    None,  # 557
+    None,  # 558
+    None,  # 559
+    None,  # 560
+    None,  # 561
+    None,  # 562
+    None,  # 563
+    None,  # 564
+    None,  # 565
+    None,  # 566
+    None,  # 567
+    None,  # 568
+    None,  # 569
+    None,  # 570
+    None,  # 571
+    None,  # 572
+    None,  # 573
+    None,  # 574
+    None,  # 575
+    None,  # 576
+    None,  # 577
+    None,  # 578
+    None,  # 579
+    None,  # 580
+    None,  # 581
+    None,  # 582
+    None,  # 583
+    None,  # 584
+    None,  # 585
+    None,  # 586
+    None,  # 587
+    None,  # 588
+    None,  # 589
+    ('GP', 'BL', 'MF'),  # 590
+    ('BO',),  # 591
+    ('GY',),  # 592
+    ('EC',),  # 593
+    ('GF',),  # 594
+    ('PY',),  # 595
+    ('MQ',),  # 596
+    ('SR',),  # 597
+    ('UY',),  # 598
+    ('AN',),  # 599
+    None,  # 600
+    None,  # 601
+    None,  # 602
+    None,  # 603
+    None,  # 604
+    None,  # 605
+    None,  # 606
+    None,  # 607
+    None,  # 608
+    None,  # 609
+    None,  # 610
+    None,  # 611
+    None,  # 612
+    None,  # 613
+    None,  # 614
+    None,  # 615
+    None,  # 616
+    None,  # 617
+    None,  # 618
+    None,  # 619
+    None,  # 620
+    None,  # 621
+    None,  # 622
+    None,  # 623
+    None,  # 624
+    None,  # 625
+    None,  # 626
+    None,  # 627
+    None,  # 628
+    None,  # 629
+    None,  # 630
+    None,  # 631
+    None,  # 632
+    None,  # 633
+    None,  # 634
+    None,  # 635
+    None,  # 636
+    None,  # 637
+    None,  # 638
+    None,  # 639
+    None,  # 640
+    None,  # 641
+    None,  # 642
+    None,  # 643
+    None,  # 644
+    None,  # 645
+    None,  # 646
+    None,  # 647
+    None,  # 648
+    None,  # 649
+    None,  # 650
+    None,  # 651
+    None,  # 652
+    None,  # 653
+    None,  # 654
+    None,  # 655
+    None,  # 656
+    None,  # 657
+    None,  # 658
+    None,  # 659
+    None,  # 660
+    None,  # 661
+    None,  # 662
+    None,  # 663
+    None,  # 664
+    None,  # 665
+    None,  # 666
+    None,  # 667
+    None,  # 668
+    None,  # 669
+    ('TL',),  # 670
+    None,  # 671
+    ('NF',),  # 672
+    ('BN',),  # 673
+    ('NR',),  # 674
+    ('PG',),  # 675
+    ('TO',),  # 676
+    ('SB',),  # 677
+    ('VU',),  # 678
+    ('FJ',),  # 679
+    ('PW',),  # 680
+    ('WF',),  # 681
+    ('CK',),  # 682
+    ('NU',),  # 683
+    None,  # 684
+    ('WS',),  # 685
+    ('KI',),  # 686
+    ('NC',),  # 687
+    ('TV',),  # 688
+    ('PF',),  # 689
+    ('TK',),  # 690
+    ('FM',),  # 691
+    ('MH',),  # 692
+    None,  # 693
+    None,  # 694
+    None,  # 695
+    None,  # 696
+    None,  # 697
+    None,  # 698
+    None,  # 699
+    None,  # 700
+    None,  # 701
+    None,  # 702
+    None,  # 703
+    None,  # 704
+    None,  # 705
+    None,  # 706
+    None,  # 707
+    None,  # 708
+    None,  # 709
+    None,  # 710
+    None,  # 711
+    None,  # 712
+    None,  # 713
+    None,  # 714
+    None,  # 715
+    None,  # 716
+    None,  # 717
+    None,  # 718
+    None,  # 719
+    None,  # 720
+    None,  # 721
+    None,  # 722
+    None,  # 723
+    None,  # 724
+    None,  # 725
+    None,  # 726
+    None,  # 727
+    None,  # 728
+    None,  # 729
+    None,  # 730
+    None,  # 731
+    None,  # 732
+    None,  # 733
+    None,  # 734
+    None,  # 735
+    None,  # 736
+    None,  # 737
+    None,  # 738
+    None,  # 739
+    None,  # 740
+    None,  # 741
+    None,  # 742
+    None,  # 743
+    None,  # 744
+    None,  # 745
+    None,  # 746
+    None,  # 747
+    None,  # 748
+    None,  # 749
+    None,  # 750
+    None,  # 751
+    None,  # 752
+    None,  # 753
+    None,  # 754
+    None,  # 755
+    None,  # 756
+    None,  # 757
+    None,  # 758
+    None,  # 759
+    None,  # 760
+    None,  # 761
+    None,  # 762
+    None,  # 763
+    None,  # 764
+    None,  # 765
+    None,  # 766
+    None,  # 767
+    None,  # 768
+    None,  # 769
+    None,  # 770
+    None,  # 771
+    None,  # 772
+    None,  # 773
+    None,  # 774
+    None,  # 775
+    None,  # 776
+    None,  # 777
+    None,  # 778
+    None,  # 779
+    None,  # 780
+    None,  # 781
+    None,  # 782
+    None,  # 783
+    None,  # 784
+    None,  # 785
+    None,  # 786
+    None,  # 787
+    None,  # 788
+    None,  # 789
+    None,  # 790
+    None,  # 791
+    None,  # 792
+    None,  # 793
+    None,  # 794
+    None,  # 795
+    None,  # 796
+    None,  # 797
+    None,  # 798
+    None,  # 799
+    None,  # 800
+    None,  # 801
+    None,  # 802
+    None,  # 803
+    None,  # 804
+    None,  # 805
+    None,  # 806
+    None,  # 807
+    None,  # 808
+    None,  # 809
+    None,  # 810
+    None,  # 811
+    None,  # 812
+    None,  # 813
+    None,  # 814
+    None,  # 815
+    None,  # 816
+    None,  # 817
+    None,  # 818
+    None,  # 819
+    None,  # 820
+    None,  # 821
+    None,  # 822
+    None,  # 823
+    None,  # 824
+    None,  # 825
+    None,  # 826
+    None,  # 827
+    None,  # 828
+    None,  # 829
+    None,  # 830
+    None,  # 831
+    None,  # 832
+    None,  # 833
+    None,  # 834
+    None,  # 835
+    None,  # 836
+    None,  # 837
+    None,  # 838
+    None,  # 839
+    None,  # 840
+    None,  # 841
+    None,  # 842
+    None,  # 843
+    None,  # 844
+    None,  # 845
+    None,  # 846
+    None,  # 847
+    None,  # 848
+    None,  # 849
+    ('KP',),  # 850
+    None,  # 851
+    ('HK',),  # 852
+    ('MO',),  # 853
+    None,  # 854
+    ('KH',),  # 855
+    ('LA',),  # 856
+    None,  # 857
+    None,  # 858
+    None,  # 859
+    None,  # 860
+    None,  # 861
+    None,  # 862
+    None,  # 863
+    None,  # 864
+    None,  # 865
+    None,  # 866
+    None,  # 867
+    None,  # 868
+    None,  # 869
+    None,  # 870
+    None,  # 871
+    None,  # 872
+    None,  # 873
+    None,  # 874
+    None,  # 875
+    None,  # 876
+    None,  # 877
+    None,  # 878
+    None,  # 879
+    ('BD',),  # 880
+    None,  # 881
+    None,  # 882
+    None,  # 883
+    None,  # 884
+    None,  # 885
+    ('TW',),  # 886
+    None,  # 887
+    None,  # 888
+    None,  # 889
+    None,  # 890
+    None,  # 891
+    None,  # 892
+    None,  # 893
+    None,  # 894
+    None,  # 895
+    None,  # 896
+    None,  # 897
+    None,  # 898
+    None,  # 899
+    None,  # 900
+    None,  # 901
+    None,  # 902
+    None,  # 903
+    None,  # 904
+    None,  # 905
+    None,  # 906
+    None,  # 907
+    None,  # 908
+    None,  # 909
+    None,  # 910
+    None,  # 911
+    None,  # 912
+    None,  # 913
+    None,  # 914
+    None,  # 915
+    None,  # 916
+    None,  # 917
+    None,  # 918
+    None,  # 919
+    None,  # 920
+    None,  # 921
+    None,  # 922
+    None,  # 923
+    None,  # 924
+    None,  # 925
+    None,  # 926
+    None,  # 927
+    None,  # 928
+    None,  # 929
+    None,  # 930
+    None,  # 931
+    None,  # 932
+    None,  # 933
+    None,  # 934
+    None,  # 935
+    None,  # 936
+    None,  # 937
+    None,  # 938
+    None,  # 939
+    None,  # 940
+    None,  # 941
+    None,  # 942
+    None,  # 943
+    None,  # 944
+    None,  # 945
+    None,  # 946
+    None,  # 947
+    None,  # 948
+    None,  # 949
+    None,  # 950
+    None,  # 951
+    None,  # 952
+    None,  # 953
+    None,  # 954
+    None,  # 955
+    None,  # 956
+    None,  # 957
+    None,  # 958
+    None,  # 959
+    ('MV',),  # 960
+    ('LB',),  # 961
+    ('JO',),  # 962
+    ('SY',),  # 963
+    ('IQ',),  # 964
+    ('KW',),  # 965
+    ('SA',),  # 966
+    ('YE',),  # 967
+    ('OM',),  # 968
+    None,  # 969
+    ('PS',),  # 970
+    ('AE',),  # 971
+    ('IL',),  # 972
+    ('BH',),  # 973
+    ('QA',),  # 974
+    ('BT',),  # 975
+    ('MN',),  # 976
+    ('NP',),  # 977
+    None,  # 978
+    None,  # 979
+    None,  # 980
+    None,  # 981
+    None,  # 982
+    None,  # 983
+    None,  # 984
+    None,  # 985
+    None,  # 986
+    None,  # 987
+    None,  # 988
+    None,  # 989
+    None,  # 990
+    None,  # 991
+    ('TJ',),  # 992
+    ('TM',),  # 993
+    ('AZ',),  # 994
+    ('GE',),  # 995
+    ('KG',),  # 996
+    None,  # 997
+    ('UZ',),  # 998
+    None,  # 999
+)
+country_code_by_region_code = {'AD': 376,
+ 'AE': 971,
+ 'AF': 93,
+ 'AG': 1,
+ 'AI': 1,
+ 'AL': 355,
+ 'AM': 374,
+ 'AN': 599,
+ 'AO': 244,
+ 'AR': 54,
+ 'AS': 1,
+ 'AT': 43,
+ 'AU': 61,
+ 'AW': 297,
+ 'AZ': 994,
+ 'BA': 387,
+ 'BB': 1,
+ 'BD': 880,
+ 'BE': 32,
+ 'BF': 226,
+ 'BG': 359,
+ 'BH': 973,
+ 'BI': 257,
+ 'BJ': 229,
+ 'BL': 590,
+ 'BM': 1,
+ 'BN': 673,
+ 'BO': 591,
+ 'BR': 55,
+ 'BS': 1,
+ 'BT': 975,
+ 'BW': 267,
+ 'BY': 375,
+ 'BZ': 501,
+ 'CA': 1,
+ 'CD': 243,
+ 'CF': 236,
+ 'CG': 242,
+ 'CH': 41,
+ 'CI': 225,
+ 'CK': 682,
+ 'CL': 56,
+ 'CM': 237,
+ 'CN': 86,
+ 'CO': 57,
+ 'CR': 506,
+ 'CU': 53,
+ 'CV': 238,
+ 'CY': 357,
+ 'CZ': 420,
+ 'DE': 49,
+ 'DJ': 253,
+ 'DK': 45,
+ 'DM': 1,
+ 'DO': 1,
+ 'DZ': 213,
+ 'EC': 593,
+ 'EE': 372,
+ 'EG': 20,
+ 'ER': 291,
+ 'ES': 34,
+ 'ET': 251,
+ 'FI': 358,
+ 'FJ': 679,
+ 'FK': 500,
+ 'FM': 691,
+ 'FO': 298,
+ 'FR': 33,
+ 'GA': 241,
+ 'GB': 44,
+ 'GD': 1,
+ 'GE': 995,
+ 'GF': 594,
+ 'GG': 44,
+ 'GH': 233,
+ 'GI': 350,
+ 'GL': 299,
+ 'GM': 220,
+ 'GN': 224,
+ 'GP': 590,
+ 'GQ': 240,
+ 'GR': 30,
+ 'GT': 502,
+ 'GU': 1,
+ 'GW': 245,
+ 'GY': 592,
+ 'HK': 852,
+ 'HN': 504,
+ 'HR': 385,
+ 'HT': 509,
+ 'HU': 36,
+ 'ID': 62,
+ 'IE': 353,
+ 'IL': 972,
+ 'IM': 44,
+ 'IN': 91,
+ 'IO': 246,
+ 'IQ': 964,
+ 'IR': 98,
+ 'IS': 354,
+ 'IT': 39,
+ 'JE': 44,
+ 'JM': 1,
+ 'JO': 962,
+ 'JP': 81,
+ 'KE': 254,
+ 'KG': 996,
+ 'KH': 855,
+ 'KI': 686,
+ 'KM': 269,
+ 'KN': 1,
+ 'KP': 850,
+ 'KR': 82,
+ 'KW': 965,
+ 'KY': 1,
+ 'KZ': 7,
+ 'LA': 856,
+ 'LB': 961,
+ 'LC': 1,
+ 'LI': 423,
+ 'LK': 94,
+ 'LR': 231,
+ 'LS': 266,
+ 'LT': 370,
+ 'LU': 352,
+ 'LV': 371,
+ 'LY': 218,
+ 'MA': 212,
+ 'MC': 377,
+ 'MD': 373,
+ 'ME': 382,
+ 'MF': 590,
+ 'MG': 261,
+ 'MH': 692,
+ 'MK': 389,
+ 'ML': 223,
+ 'MM': 95,
+ 'MN': 976,
+ 'MO': 853,
+ 'MP': 1,
+ 'MQ': 596,
+ 'MR': 222,
+ 'MS': 1,
+ 'MT': 356,
+ 'MU': 230,
+ 'MV': 960,
+ 'MW': 265,
+ 'MX': 52,
+ 'MY': 60,
+ 'MZ': 258,
+ 'NA': 264,
+ 'NC': 687,
+ 'NE': 227,
+ 'NF': 672,
+ 'NG': 234,
+ 'NI': 505,
+ 'NL': 31,
+ 'NO': 47,
+ 'NP': 977,
+ 'NR': 674,
+ 'NU': 683,
+ 'NZ': 64,
+ 'OM': 968,
+ 'PA': 507,
+ 'PE': 51,
+ 'PF': 689,
+ 'PG': 675,
+ 'PH': 63,
+ 'PK': 92,
+ 'PL': 48,
+ 'PM': 508,
+ 'PR': 1,
+ 'PS': 970,
+ 'PT': 351,
+ 'PW': 680,
+ 'PY': 595,
+ 'QA': 974,
+ 'RE': 262,
+ 'RO': 40,
+ 'RS': 381,
+ 'RU': 7,
+ 'RW': 250,
+ 'SA': 966,
+ 'SB': 677,
+ 'SC': 248,
+ 'SD': 249,
+ 'SE': 46,
+ 'SG': 65,
+ 'SH': 290,
+ 'SI': 386,
+ 'SK': 421,
+ 'SL': 232,
+ 'SM': 378,
+ 'SN': 221,
+ 'SO': 252,
+ 'SR': 597,
+ 'ST': 239,
+ 'SV': 503,
+ 'SY': 963,
+ 'SZ': 268,
+ 'TC': 1,
+ 'TD': 235,
+ 'TF': 262,
+ 'TG': 228,
+ 'TH': 66,
+ 'TJ': 992,
+ 'TK': 690,
+ 'TL': 670,
+ 'TM': 993,
+ 'TN': 216,
+ 'TO': 676,
+ 'TR': 90,
+ 'TT': 1,
+ 'TV': 688,
+ 'TW': 886,
+ 'TZ': 255,
+ 'UA': 380,
+ 'UG': 256,
+ 'US': 1,
+ 'UY': 598,
+ 'UZ': 998,
+ 'VA': 379,
+ 'VC': 1,
+ 'VE': 58,
+ 'VG': 1,
+ 'VI': 1,
+ 'VN': 84,
+ 'VU': 678,
+ 'WF': 681,
+ 'WS': 685,
+ 'YE': 967,
+ 'YT': 262,
+ 'ZA': 27,
+ 'ZM': 260,
+ 'ZW': 263}
+
+# A mapping from a region code to the PhoneMetadata for that region, in the
+# array representation read by metadataarray.array_to_metadata().
+country_to_metadata = {
+'AD': [None, [None, None, '(?:[346-9]|180)\\d{5}', '\\d{6,8}', None, None, None], [None, None, '[78]\\d{5}', '\\d{6}', None, None, None], [None, None, '[346]\\d{5}', '\\d{6}', None, None, None], [None, None, '180[02]\\d{4}', '\\d{8}', None, None, None], [None, None, '9\\d{5}', '\\d{6}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AD', 376, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{3})', '$1 $2', ['[346-9]'], '', ''], [None, '(180[02])(\\d{4})', '$1 $2', ['1'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AE': [None, [None, None, '[2-79]\\d{7,8}|800\\d{2,9}', '\\d{5,12}', None, None, None], [None, None, '(?:[2-4679][2-8]\\d|600[25])\\d{5}', '\\d{7,9}', None, None, None], [None, None, '5[056]\\d{7}', '\\d{9}', None, None, None], [None, None, '400\\d{6}|800\\d{2,9}', '\\d{5,12}', None, None, None], [None, None, '900[02]\\d{5}', '\\d{9}', None, None, None], [None, None, '700[05]\\d{5}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AE', 971, '00', '0', None, None, '0', None, None, None, [[None, '([2-4679])(\\d{3})(\\d{4})', '$1 $2 $3', ['[2-4679][2-8]'], '0\\$1', ''], [None, '(5[056])(\\d{3})(\\d{4})', '$1 $2 $3', ['5'], '0\\$1', ''], [None, '([4679]00)(\\d)(\\d{5})', '$1 $2 $3', ['[4679]0'], '0\\$1', ''], [None, '(800)(\\d{2,9})', '$1 $2', ['8'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AF': [None, [None, None, '[2-7]\\d{8}', '\\d{7,9}', None, None, None], [None, None, '(?:[25][0-8]|[34][0-4]|6[0-5])[2-9]\\d{6}', '\\d{7,9}', None, None, None], [None, None, '7[057-9]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AF', 93, '00', '0', None, None, '0', None, None, None, [[None, '([2-7]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AG': [None, [None, None, '[289]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '268(?:4(?:6[0-3]|84)|56[0-2])\\d{4}', '\\d{7,10}', None, None, None], [None, None, '268(?:464|7(?:2[0-9]|64|7[0-5]|8[358]))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '26848[01]\\d{4}', '\\d{10}', None, None, None], 'AG', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '268'],
+'AI': [None, [None, None, '[289]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '2644(?:6[12]|9[78])\\d{4}', '\\d{7,10}', None, None, None], [None, None, '264(?:235|476|5(?:3[6-9]|8[1-4])|7(?:29|72))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AI', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '264'],
+'AL': [None, [None, None, '[2-57]\\d{7}|6\\d{8}|8\\d{5,7}|9\\d{5}', '\\d{5,9}', None, None, None], [None, None, '(?:2(?:[168][1-9]|[247]\\d|9[1-7])|3(?:1[1-3]|[2-6]\\d|[79][1-8]|8[1-9])|4\\d{2}|5(?:1[1-4]|[2-578]\\d|6[1-5]|9[1-7])|8(?:[19][1-5]|[2-6]\\d|[78][1-7]))\\d{5}', '\\d{5,8}', None, None, None], [None, None, '6[6-9]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{4}', '\\d{7}', None, None, None], [None, None, '900\\d{3}', '\\d{6}', None, None, None], [None, None, '808\\d{3}', '\\d{6}', None, None, None], [None, None, '700\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AL', 355, '00', '0', None, None, '0', None, None, None, [[None, '(4)(\\d{3})(\\d{4})', '$1 $2 $3', ['4[0-6]'], '0\\$1', ''], [None, '(6[6-9])(\\d{3})(\\d{4})', '$1 $2 $3', ['6'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[2358][2-5]|4[7-9]'], '0\\$1', ''], [None, '(\\d{3})(\\d{3,5})', '$1 $2', ['[235][16-9]|8[016-9]|[79]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AM': [None, [None, None, '[1-37-9]\\d{7}', '\\d{5,8}', None, None, None], [None, None, '(?:10\\d|2(?:2[2-46]|3[1-8]|4[2-69]|5[2-7]|6[1-9]|8[1-7])|3[12]2)\\d{5}', '\\d{5,8}', None, None, None], [None, None, '(?:77|9[1-469])\\d{6}', '\\d{8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '90[016]\\d{5}', '\\d{8}', None, None, None], [None, None, '80[1-4]\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AM', 374, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{6})', '$1 $2', ['[17]|9[1-469]'], '(0\\$1)', ''], [None, '(\\d{3})(\\d{5})', '$1 $2', ['[23]'], '(0\\$1)', ''], [None, '(\\d{3})(\\d{2})(\\d{3})', '$1 $2 $3', ['8|90'], '(0\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AN': [None, [None, None, '[13-79]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '(?:318|5(?:25|4\\d|8[239])|7(?:1[578]|50)|9(?:[48]\\d{2}|50\\d|7(?:2[0-2]|[34]\\d|6[35-7]|77)))\\d{4}|416[0239]\\d{3}', '\\d{7,8}', None, None, None], [None, None, '(?:318|5(?:1[01]|2[0-7]|5\\d|8[016-8])|7(?:0[01]|[89]\\d)|9(?:5(?:[1246]\\d|3[01])|6(?:[1679]\\d|3[01])))\\d{4}|416[15-8]\\d{3}', '\\d{7,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '(?:10|69)\\d{5}', '\\d{7,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AN', 599, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', ['[13-7]'], '', ''], [None, '(9)(\\d{3})(\\d{4})', '$1 $2 $3', ['9'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AO': [None, [None, None, '[29]\\d{8}', '\\d{9}', None, None, None], [None, None, '2\\d(?:[26-9]\\d|\\d[26-9])\\d{5}', '\\d{9}', None, None, None], [None, None, '9[1-3]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AO', 244, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{3})(\\d{3})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AR': [None, [None, None, '[1-9]\\d{9,11}', '\\d{6,12}', None, None, None], [None, None, '[1-9]\\d{9}', '\\d{6,10}', None, None, None], [None, None, '9(?:11[2-9]\\d{7}|(?:2(?:2[013]|37|6[14]|9[179])|3(?:4[1235]|5[138]|8[1578]))[2-9]\\d{6}|\\d{4}[2-9]\\d{5})', '\\d{6,12}', None, None, None], [None, None, '80\\d{8}', '\\d{10}', None, None, None], [None, None, '6(?:0\\d|10)\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AR', 54, '00', '0', None, None, '0(?:(11|2(?:2(?:02?|[13]|2[13-79]|4[1-6]|5[2457]|6[124-8]|7[1-4]|8[13-6]|9[1-367])|3(?:[06]2|1[467]|2[02-6]|3[13-8]|[49][2-6]|5[2-8]|7)|47[3-578]|6(?:1|2[2-7]|4[6-8]?|5[125-8])|9(?:0[1-3]|[19]|2\\d|3[1-6]|4[0-24-68]|5[2-4]|6[2-6]|72?|8[23]?))|3(?:3(?:2[79]|8[2578])|4(?:0[124-9]|[12]|3[5-8]?|4[24-7]|5[4-68]?|6\\d|7[126]|8[237-9]|9[1-36-8])|5(?:1|2[1245]|3[2-4]?|4[1-46-9]|6[2-4]|7[1-6]|8[2-5]?)|7(?:1[15-8]|2[125]|3[1245]|4[13]|5[124-8]|7[2-57]|8[1-36])|8(?:1|2[125-7]|3[23578]|4[13-6]|5[4-8]?|6[1-357-9]|7[5-8]?|8[4-7]?|9[124])))15)?', '9$1', None, None, [[None, '([68]\\d{2})(\\d{3})(\\d{4})', '$1-$2-$3', ['[68]'], '0\\$1', ''], [None, '9(11)(\\d{4})(\\d{4})', '$1 15-$2-$3', ['91'], '0\\$1', ''], [None, '9(\\d{3})(\\d{3})(\\d{4})', '$1 15-$2-$3', ['9(?:2[2369]|3[458])', '9(?:2(?:2[013]|37|6[14]|9[179])|3(?:4[1235]|5[138]|8[1578]))'], '0\\$1', ''], [None, '9(\\d{4})(\\d{2})(\\d{4})', '$1 15-$2-$3', ['9(?:2[2-469]|3[3-578])', '9(?:2(?:2[24-9]|3[0-69]|47|6[25]|9[02-68])|3(?:3[28]|4[046-9]|5[2467]|7[1-578]|8[23469]))'], '0\\$1', ''], [None, '(11)(\\d{4})(\\d{4})', '$1 $2-$3', ['1'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2-$3', ['2(?:2[013]|37|6[14]|9[179])|3(?:4[1235]|5[138]|8[1578])'], '0\\$1', ''], [None, '(\\d{4})(\\d{2})(\\d{4})', '$1 $2-$3', ['[23]'], '0\\$1', '']], [[None, '([68]\\d{2})(\\d{3})(\\d{4})', '$1-$2-$3', ['[68]'], None, ''], [None, '9(11)(\\d{4})(\\d{4})', '9 $1 $2-$3', ['91'], None, ''], [None, '9(\\d{3})(\\d{3})(\\d{4})', '9 $1 $2-$3', ['9(?:2[2369]|3[458])', '9(?:2(?:2[013]|37|6[14]|9[179])|3(?:4[1235]|5[138]|8[1578]))'], None, ''], [None, '9(\\d{4})(\\d{2})(\\d{4})', '9 $1 $2-$3', ['9(?:2[2-469]|3[3-578])', '9(?:2(?:2[24-9]|3[0-69]|47|6[25]|9[02-68])|3(?:3[28]|4[046-9]|5[2467]|7[1-578]|8[23469]))'], None, ''], [None, '(11)(\\d{4})(\\d{4})', '$1 $2-$3', ['1'], None, ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2-$3', ['2(?:2[013]|37|6[14]|9[179])|3(?:4[1235]|5[138]|8[1578])'], None, ''], [None, '(\\d{4})(\\d{2})(\\d{4})', '$1 $2-$3', ['[23]'], None, '']], [None, None, 'NA', 'NA', None, None, None], None, None],
+'AS': [None, [None, None, '[689]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '6846(?:22|33|44|55|77|88|9[19])\\d{4}', '\\d{7,10}', None, None, None], [None, None, '684(?:733|258)\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AS', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '684'],
+'AT': [None, [None, None, '\\d{4,13}', '\\d{3,13}', None, None, None], [None, None, '1\\d{3,12}|(?:2(?:1[467]|2[134-8]|5[2357]|6[1-46-8]|7[1-8]|8[124-7]|8[1458])|3(?:1[1-8]|3[23568]|4[5-7]|5[1378]|6[1-38]|8[3-68])|4(?:2[1-8]|35|63|7[1368]|8[2457])|5(?:1[27]|2[1-8]|3[357]|4[147]|5[12578]|6[37])|6(?:13|2[1-47]|4[1-35-8]|5[468]|62)|7(?:2[1-8]|3[25]|4[13478]|5[68]|6[16-8]|7[1-6]|9[45]))\\d{3,10}|5(?:0[1-9]|[79]\\d)\\d{2,10}|720\\d{6,10}', '\\d{3,13}', None, None, None], [None, None, '6(?:44|5[0-3579]|6[013-9]|[7-9]\\d)\\d{4,10}', '\\d{7,13}', None, None, None], [None, None, '80[02]\\d{6,10}', '\\d{9,13}', None, None, None], [None, None, '(?:711|9(?:0[01]|3[019]))\\d{6,10}', '\\d{9,13}', None, None, None], [None, None, '8(?:10|2[018])\\d{6,10}', '\\d{9,13}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '780\\d{6,10}', '\\d{9,13}', None, None, None], 'AT', 43, '00', '0', None, None, '0', None, None, None, [[None, '([15])(\\d{3,12})', '$1 $2', ['1|5[079]'], '0\\$1', ''], [None, '(\\d{3})(\\d{3,10})', '$1 $2', ['316|46|51|732|6(?:44|5[0-3579]|[6-9])|7(?:1|[28]0)|[89]'], '0\\$1', ''], [None, '(\\d{4})(\\d{3,9})', '$1 $2', ['2|3(?:1[1-578]|[3-8])|4[2378]|5[2-6]|6(?:[12]|4[1-35-9]|5[468])|7(?:2[1-8]|35|4[1-8]|[57-9])'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AU': [None, [None, None, '[1-578]\\d{5,9}', '\\d{6,10}', None, None, None], [None, None, '[2378]\\d{8}', '\\d{8,9}', None, None, None], [None, None, '4[0-68]\\d{7}', '\\d{9}', None, None, None], [None, None, '1(?:80(?:0\\d{2})?|3(?:00\\d{2})?)\\d{4}', '\\d{6,10}', None, None, None], [None, None, '190[0126]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '500\\d{6}', '\\d{9}', None, None, None], [None, None, '550\\d{6}', '\\d{9}', None, None, None], 'AU', 61, '(?:14(?:1[14]|34|4[17]|[56]6|7[47]|88))?001[14-689]', '0', None, None, '0', None, '0011', None, [[None, '([2378])(\\d{4})(\\d{4})', '$1 $2 $3', ['[2378]'], '', ''], [None, '(4\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['4'], '', ''], [None, '(5[05]0)(\\d{3})(\\d{3})', '$1 $2 $3', ['5'], '', ''], [None, '(1[389]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['1(?:[38]0|9)', '1(?:[38]00|9)'], '', ''], [None, '(180)(\\d{4})', '$1 $2', ['180', '180[1-9]'], '', ''], [None, '(13)(\\d{2})(\\d{2})', '$1 $2 $3', ['13[1-9]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AW': [None, [None, None, '[5-9]\\d{6}', '\\d{7}', None, None, None], [None, None, '5(?:2\\d{2}|8(?:[2-7]\\d|8[0-79]|9[48]))\\d{3}', '\\d{7}', None, None, None], [None, None, '(?:5[69]\\d|660|9(?:6\\d|9[02-9])|7[34]\\d)\\d{4}', '\\d{7}', None, None, None], [None, None, '800\\d{4}', '\\d{7}', None, None, None], [None, None, '900\\d{4}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AW', 297, '00', None, None, None, None, None, None, None, [[None, '([5-9]\\d{2})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'AZ': [None, [None, None, '[1-8]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '(?:1(?:(?:[28]\\d|9)\\d|02|1[0-589]|3[358]|4[013-79]|5[0-479]|6[0236-9]|7[0-24-8])|2(?:16|2\\d|3[0-24]|4[1468]|55|6[56]|79)|365?\\d)\\d{5}', '\\d{8,9}', None, None, None], [None, None, '(?:4[04]|5[015]|60|7[07])\\d{7}', '\\d{9}', None, None, None], [None, None, '88\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'AZ', 994, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['1[28]|22|[3-8]'], '', ''], [None, '([12]\\d{2})(\\d{5})', '$1 $2', ['1[013-79]|2[013-9]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BA': [None, [None, None, '[3-689]\\d{7}', '\\d{6,8}', None, None, None], [None, None, '(?:[35]\\d|49|81)\\d{6}', '\\d{6,8}', None, None, None], [None, None, '6[1-356]\\d{6}', '\\d{8}', None, None, None], [None, None, '8[08]\\d{6}', '\\d{8}', None, None, None], [None, None, '9[0246]\\d{6}', '\\d{8}', None, None, None], [None, None, '82\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BA', 387, '00', '0', None, None, '0', None, None, None, [[None, '([3-689]\\d)(\\d{3})(\\d{3})', '$1 $2-$3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BB': [None, [None, None, '[289]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '246[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '246(?:(?:2[346]|45|82)\\d|25[0-4])\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BB', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '246'],
+'BD': [None, [None, None, '[2-79]\\d{5,9}|1\\d{9}|8[0-7]\\d{4,8}', '\\d{6,10}', None, None, None], [None, None, '2(?:7\\d1|8(?:[026]1|[1379][1-5]|8[1-8])|9(?:0[0-2]|1[1-4]|3[3-5]|5[56]|6[67]|71|8[078]))\\d{4}|3(?:[6-8]1|(?:0[23]|[25][12]|82|416)\\d|(?:31|12?[5-7])\\d{2})\\d{3}|4(?:(?:02|[49]6|[68]1)|(?:0[13]|21\\d?|[23]2|[457][12]|6[28])\\d|(?:23|[39]1)\\d{2}|1\\d{3})\\d{3}|5(?:(?:[457-9]1|62)|(?:1\\d?|2[12]|3[1-3]|52)\\d|61{2})|6(?:[45]1|(?:11|2[15]|[39]1)\\d|(?:[06-8]1|62)\\d{2})|7(?:(?:32|91)|(?:02|31|[67][12])\\d|[458]1\\d{2}|21\\d{3})\\d{3}|8(?:(?:4[12]|[5-7]2|1\\d?)|(?:0|3[12]|[5-7]1|217)\\d)\\d{4}|9(?:[35]1|(?:[024]2|81)\\d|(?:1|[24]1)\\d{2})\\d{3}', '\\d{6,9}', None, None, None], [None, None, '(?:1[13-9]\\d|(?:3[78]|44)[02-9]|6(?:44|6[02-9]))\\d{7}', '\\d{10}', None, None, None], [None, None, '80[03]\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BD', 880, '00[12]?', '0', None, None, '0', None, '00', None, [[None, '(2)(\\d{7})', '$1 $2', ['2'], '0\\$1', ''], [None, '(\\d{2})(\\d{4,6})', '$1 $2', ['[3-79]1'], '0\\$1', ''], [None, '(\\d{3})(\\d{3,7})', '$1 $2', ['[3-79][2-9]|8'], '0\\$1', ''], [None, '(\\d{4})(\\d{6})', '$1 $2', ['1'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BE': [None, [None, None, '[1-9]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '(?:1[0-69]|[23][2-8]|[49][23]|5\\d|6[013-57-9]|7[18])\\d{6}|8(?:0[1-9]|[1-79]\\d)\\d{5}', '\\d{8}', None, None, None], [None, None, '4(?:7\\d|8[4-9]|9[1-9])\\d{6}', '\\d{9}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '(?:90|7[07])\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BE', 32, '00', '0', None, None, '0', None, None, None, [[None, '(4[7-9]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['4[7-9]'], '0\\$1', ''], [None, '([2-49])(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[23]|[49][23]'], '0\\$1', ''], [None, '([15-8]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[156]|7[0178]|8(?:0[1-9]|[1-79])'], '0\\$1', ''], [None, '([89]\\d{2})(\\d{2})(\\d{3})', '$1 $2 $3', ['(?:80|9)0'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BF': [None, [None, None, '[2457]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:20(?:49|5[23]|9[016-9])|40(?:4[569]|55|7[0179])|50[34]\\d)\\d{4}', '\\d{8}', None, None, None], [None, None, '7(?:[024-6]\\d|1[0-489]|3[01]|8[013-9]|9[012])\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BF', 226, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BG': [None, [None, None, '[2-9]\\d{6,8}', '\\d{7,9}', None, None, None], [None, None, '(?:2\\d|[36]\\d|5[1-9]|8[1-6]|9[1-7])\\d{5,6}|(?:4(?:[124-7]\\d|3[1-6])|7(?:0[1-9]|[1-9]\\d))\\d{4,5}', '\\d{7,8}', None, None, None], [None, None, '(?:8[7-9]|98)\\d{7}|4(?:3[0789]|8\\d)\\d{5}', '\\d{8,9}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '90\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '700\\d{5}', '\\d{7,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BG', 359, '00', '0', None, None, '0', None, None, None, [[None, '(2)(\\d{3})(\\d{3,4})', '$1/$2 $3', ['2'], '0\\$1', ''], [None, '(\\d{3})(\\d{4})', '$1/$2', ['43[124-7]|70[1-9]'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{2})', '$1/$2 $3', ['43[124-7]|70[1-9]'], '0\\$1', ''], [None, '(\\d{3})(\\d{2})(\\d{3})', '$1 $2 $3', ['[78]00'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{2,3})', '$1/$2 $3', ['[356]|7[1-9]|8[1-6]|9[1-7]'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['48|8[7-9]|9[08]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BH': [None, [None, None, '[136-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:1(?:3[3-6]|6[0156]|7\\d)|6(?:1[16]|6[03469]|9[69])|77\\d)\\d{5}', '\\d{8}', None, None, None], [None, None, '(?:3(?:[369]\\d|77|8[38])|6(?:1[16]|6[03469]|9[69])|77\\d)\\d{5}', '\\d{8}', None, None, None], [None, None, '80\\d{6}', '\\d{8}', None, None, None], [None, None, '(?:87|9[014578])\\d{6}', '\\d{8}', None, None, None], [None, None, '84\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BH', 973, '00', None, None, None, None, None, None, None, [[None, '(\\d{4})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BI': [None, [None, None, '[27]\\d{7}', '\\d{8}', None, None, None], [None, None, '22(?:2[0-7]|[3-5]0)\\d{4}', '\\d{8}', None, None, None], [None, None, '(?:29\\d|7(?:1[1-3]|[4-9]\\d))\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BI', 257, '00', None, None, None, None, None, None, None, [[None, '([27]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BJ': [None, [None, None, '[2689]\\d{7}|7\\d{3}', '\\d{4,8}', None, None, None], [None, None, '2(?:02|1[037]|2[45]|3[68])\\d{5}', '\\d{8}', None, None, None], [None, None, '66\\d{6}|9(?:0[069]|[35][0-2457-9]|[6-8]\\d)\\d{5}', '\\d{8}', None, None, None], [None, None, '7[3-5]\\d{2}', '\\d{4}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '857[58]\\d{4}', '\\d{8}', None, None, None], 'BJ', 229, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BL': [None, [None, None, '[56]\\d{8}', '\\d{9}', None, None, None], [None, None, '590(?:2[7-9]|5[12]|87)\\d{4}', '\\d{9}', None, None, None], [None, None, '690(?:10|2[27]|66|77|8[78])\\d{4}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BL', 590, '00', '0', None, None, '0', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BM': [None, [None, None, '[489]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '441(?:2(?:02|23|61|[3479]\\d)|[46]\\d{2}|5(?:4\\d|60|89)|824)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '441(?:[37]\\d|5[0-39])\\d{5}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BM', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '441'],
+'BN': [None, [None, None, '[2-578]\\d{6}', '\\d{7}', None, None, None], [None, None, '[2-5]\\d{6}', '\\d{7}', None, None, None], [None, None, '[78]\\d{6}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BN', 673, '00', '0', None, None, '0', None, None, None, [[None, '([2-578]\\d{2})(\\d{4})', '$1 $2', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BO': [None, [None, None, '[23467]\\d{7}', '\\d{7,8}', None, None, None], [None, None, '(?:2(?:2\\d{2}|5(?:11|[258]\\d|9[67])|6(?:12|2\\d|9[34])|8(?:2[34]|39|62))|3(?:3\\d{2}|4(?:6\\d|8[24])|8(?:25|42|5[257]|86|9[25])|9(?:2\\d|3[234]|4[248]|5[24]|6[2-6]|7\\d))|4(?:4\\d{2}|6(?:11|[24689]\\d|72)))\\d{4}', '\\d{7,8}', None, None, None], [None, None, '[67]\\d{7}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BO', 591, '00(1\\d)?', '0', None, None, '0(1\\d)?', None, None, None, [[None, '([234])(\\d{7})', '$1 $2', ['[234]'], '', ''], [None, '([67]\\d{7})', '$1', ['[67]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BR': [None, [None, None, '[1-9]\\d{7,9}', '\\d{8,10}', None, None, None], [None, None, '(?:[14689][1-9]|2[12478]|3[1-578]|5[13-5]|7[13-579])[2-5]\\d{7}', '\\d{8,10}', None, None, None], [None, None, '(?:[14689][1-9]|2[12478]|3[1-578]|5[13-5]|7[13-579])[6-9]\\d{7}', '\\d{10}', None, None, None], [None, None, '800\\d{6,7}', '\\d{8,10}', None, None, None], [None, None, '[359]00\\d{6,7}', '\\d{8,10}', None, None, None], [None, None, '(?:400\\d|3003)\\d{4}', '\\d{8,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BR', 55, '00(?:1[45]|2[135]|[34]1|43)', '0', None, None, '0(?:(?:1[245]|2[135]|[34]1)(\\d{10}))?', '$1', None, None, [[None, '(\\d{2})(\\d{4})(\\d{4})', '$1 $2-$3', ['[1-9][1-9]'], '', '0 $CC \\$1'], [None, '([34]00\\d)(\\d{4})', '$1-$2', ['[34]00', '400|3003'], '', ''], [None, '([3589]00)(\\d{2,3})(\\d{4})', '$1 $2 $3', ['[3589]00'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BS': [None, [None, None, '[289]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '242(?:3(?:02|[236][1-9]|4[0-24-9]|5[0-68]|7[3467]|8[0-4]|9[2-467])|461|502|6(?:12|7[67]|8[78]|9[89])|702)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '242(?:3(?:5[79]|[79]5)|4(?:[2-4][1-9]|5[1-8]|6[2-8]|7\\d|81)|5(?:2[34]|3[35]|44|5[1-9]|65|77)|6[34]6|727)\\d{4}', '\\d{10}', None, None, None], [None, None, '242300\\d{4}|8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BS', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '242'],
+'BT': [None, [None, None, '(?:17|[2-8])\\d{6}', '\\d{6,8}', None, None, None], [None, None, '(?:2[3-6]|[34][5-7]|5[236]|6[2-46]|7[246]|8[2-4])\\d{5}', '\\d{6,7}', None, None, None], [None, None, '17\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BT', 975, '00', None, None, None, None, None, None, None, [[None, '(17)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['1'], '', ''], [None, '([2-8])(\\d{3})(\\d{3})', '$1 $2 $3', ['[2-8]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BW': [None, [None, None, '[2-9]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '(?:2(?:4[0-48]|6[0-24]|9[0578])|3(?:1[0235-9]|55|6\\d|7[01]|9[0-57])|4(?:6[03]|7[1267]|9[0-5])|5(?:3[0389]|4[0489]|7[1-47]|88|9[0-49])|6(?:2[1-35]|5[149]|8[067]))\\d{4}', '\\d{7}', None, None, None], [None, None, '7(?:[1-3]\\d{6}|4[0-7]\\d{5})', '\\d{8}', None, None, None], [None, None, '8\\d{6}', '\\d{7}', None, None, None], [None, None, '90\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BW', 267, '00', None, None, None, None, None, None, None, [[None, '(7[1-4])(\\d{3})(\\d{3})', '$1 $2 $3', ['7'], '', ''], [None, '(90)(\\d{5})', '$1 $2', ['9'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BY': [None, [None, None, '[12-4]\\d{8}|[89]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '(?:1(?:5(?:1[1-5]|2\\d|6[1-4]|9[1-7])|6(?:[235]\\d|4[1-7])|7\\d{2})|2(?:1(?:[246]\\d|3[0-35-9]|5[1-9])|2(?:[235]\\d|4[0-8])|3(?:2\\d|3[02-79]|4[024-7]|5[0-7])))\\d{5}', '\\d{7,9}', None, None, None], [None, None, '(?:2(?:5[679]|9[1-9])|33\\d|44\\d)\\d{6}', '\\d{9}', None, None, None], [None, None, '80[13]\\d{7}', '\\d{10}', None, None, None], [None, None, '902\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BY', 375, '8~10', '8', None, None, '80?', None, None, None, [[None, '([1-4]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['[1-4]'], '', ''], [None, '([89]\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['[89]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'BZ': [None, [None, None, '[2-8]\\d{6}|0\\d{10}', '\\d{7}(?:\\d{4})?', None, None, None], [None, None, '[234578][02]\\d{5}', '\\d{7}', None, None, None], [None, None, '6(?:[01]\\d|2[0-5]|[67][01])\\d{4}', '\\d{7}', None, None, None], [None, None, '0800\\d{7}', '\\d{11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'BZ', 501, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1-$2', ['[2-8]'], '', ''], [None, '(0)(800)(\\d{4})(\\d{3})', '$1-$2-$3-$4', ['0'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CA': [None, [None, None, '[2-9]\\d{9}|3\\d{6}', '\\d{7,10}', None, None, None], [None, None, '(?:2(?:04|26|50|89)|306|4(?:03|16|18|38|50|56)|5(?:00|06|14|19|81|87)|6(?:00|04|13|47)|7(?:00|05|09|10|78|80)|8(?:07|19|67))[2-9]\\d{6}|310\\d{4}', '\\d{7,10}', None, None, None], [None, None, '(?:2(?:04|26|50|89)|306|4(?:03|16|18|38|50|56)|5(?:00|06|14|19|81|87)|6(?:00|04|13|47)|7(?:00|05|09|10|78|80)|8(?:07|19|67)|9(?:02|05))[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}|310\\d{4}', '\\d{7,10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CA', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CD': [None, [None, None, '[89]\\d{8}|[1-6]\\d{6}', '\\d{7,9}', None, None, None], [None, None, '[1-6]\\d{6}', '\\d{7}', None, None, None], [None, None, '(?:8[0-2489]|9[7-9])\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CD', 243, '00', '0', None, None, '0', None, None, None, [[None, '([89]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[89]'], '0\\$1', ''], [None, '([1-6]\\d)(\\d{5})', '$1 $2', ['[1-6]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CF': [None, [None, None, '[278]\\d{7}', '\\d{8}', None, None, None], [None, None, '2[12]\\d{6}', '\\d{8}', None, None, None], [None, None, '7[0257]\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '8776\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CF', 236, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CG': [None, [None, None, '[028]\\d{8}', '\\d{9}', None, None, None], [None, None, '222[1-589]\\d{5}', '\\d{9}', None, None, None], [None, None, '0[14-6]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CG', 242, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['[02]'], '', ''], [None, '(\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['8'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CH': [None, [None, None, '[2-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '(?:2[12467]|3[1-4]|4[134]|5[12568]|6[12]|[7-9]1)\\d{7}', '\\d{9}', None, None, None], [None, None, '7[46-9]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '90[016]\\d{6}', '\\d{9}', None, None, None], [None, None, '84[0248]\\d{6}', '\\d{9}', None, None, None], [None, None, '878\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CH', 41, '00', '0', None, None, '0', None, None, None, [[None, '([2-9]\\d)(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[2-7]|[89]1'], '0\\$1', ''], [None, '([89]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['8[047]|90'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CI': [None, [None, None, '[02-5]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:2(?:0[023]|1[02357]|[23][045]|4[03-5])|3(?:0[06]|1[069]|[2-4][07]|5[09]|6[08]))\\d{5}', '\\d{8}', None, None, None], [None, None, '(?:0[1-9]|4[04-9]|50|6[067])\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CI', 225, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CK': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CK', 682, '00', '00', None, None, '00', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CL': [None, [None, None, '(?:[2-9]|600|123)\\d{7,8}', '\\d{6,11}', None, None, None], [None, None, '(?:2|32|41)\\d{7}|(?:3[3-5]|4[235]|5[1-3578]|6[13-57]|7[1-35])\\d{6,7}', '\\d{6,9}', None, None, None], [None, None, '9[6-9]\\d{7}', '\\d{8,9}', None, None, None], [None, None, '800\\d{6}|1230\\d{7}', '\\d{9,11}', None, None, None], [None, None, '600\\d{7,8}', '\\d{10,11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '44\\d{7}', '\\d{9}', None, None, None], 'CL', 56, '(?:0|1(?:1[0-69]|2[0-57]|5[13-58]|69|7[0167]|8[018]))0', '0', None, None, '(?:0|1(?:1[0-69]|2[0-57]|5[13-58]|69|7[0167]|8[018]))', None, None, None, [[None, '(2)(\\d{3})(\\d{4})', '$1 $2 $3', ['2'], '0\\$1', ''], [None, '(\\d{2})(\\d{2,3})(\\d{4})', '$1 $2 $3', ['[357]|4[1-35]|6[13-57]'], '0\\$1', ''], [None, '(9)([6-9]\\d{3})(\\d{4})', '$1 $2 $3', ['9'], '0\\$1', ''], [None, '(44)(\\d{3})(\\d{4})', '$1 $2 $3', ['44'], '0\\$1', ''], [None, '([68]00)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['60|8'], '0\\$1', ''], [None, '(600)(\\d{3})(\\d{2})(\\d{3})', '$1 $2 $3 $4', ['60'], '0\\$1', ''], [None, '(1230)(\\d{3})(\\d{4})', '$1 $2 $3', ['1'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CM': [None, [None, None, '[237-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:22|33)\\d{6}', '\\d{8}', None, None, None], [None, None, '[79]\\d{7}', '\\d{8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '88\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CM', 237, '00', None, None, None, None, None, None, None, [[None, '([237-9]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[2379]|88'], '', ''], [None, '(800)(\\d{2})(\\d{3})', '$1 $2 $3', ['80'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CN': [None, [None, None, '[1-79]\\d{7,11}|8[0-357-9]\\d{6,9}', '\\d{4,12}', None, None, None], [None, None, '21\\d{8,10}|(?:10|2[02-57-9]|3(?:11|7[159])|4[135]1|5(?:1\\d|2[37]|3[12]|7[13-79]|9[15])|7(?:31|5[457]|6[09])|898)\\d{8}|(?:3(?:1[02-9]|35|49|5\\d|7[02-68]|9[1-68])|4(?:1[02-9]|2[179]|[35][2-9]|6[4789]|7[0-46-9]|8[23])|5(?:3[03-9]|4[36]|5\\d|6[1-6]|7[028]|80|9[2-46-9])|6(?:3[1-5]|6[0238]|9[12])|7(?:01|[1579]\\d|2[248]|3[04-9]|4[3-6]|6[2368])|8(?:1[236-8]|2[5-7]|[37]\\d|5[1-9]|8[3678]|9[1-7])|9(?:0[1-3689]|1[1-79]|[379]\\d|4[13]|5[1-5]))\\d{7}|80(?:29|6[03578]|7[018]|81)\\d{4}', '\\d{4,12}', None, None, None], [None, None, '1(?:3[0-9]|47|5[0135689]|8[05-9])\\d{8}', '\\d{11}', None, None, None], [None, None, '(?:10)?800\\d{7}', '\\d{10,12}', None, None, None], [None, None, '16[08]\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '400\\d{7}', '\\d{10}', None, None, None], 'CN', 86, '00', '0', None, None, '0', None, None, None, [[None, '(80\\d{2})(\\d{4})', '$1 $2', ['80[2678]'], '', ''], [None, '([48]00)(\\d{3})(\\d{4})', '$1 $2 $3', ['[48]00'], '', ''], [None, '(\\d{3,4})(\\d{4})', '$1 $2', ['[2-9]'], '', ''], [None, '(21)(\\d{4})(\\d{4,6})', '$1 $2 $3', ['21'], '', ''], [None, '([12]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['10[1-9]|2[02-9]', '10[1-9]|2[02-9]', '10(?:[1-79]|8(?:[1-9]|0[1-9]))|2[02-9]'], '', ''], [None, '(\\d{3})(\\d{4})(\\d{4})', '$1 $2 $3', ['3(?:11|7[159])|4[135]1|5(?:1|2[37]|3[12]|7[13-79]|9[15])|7(?:31|5[457]|6[09])|898'], '', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['3(?:1[02-9]|35|49|5|7[02-68]|9[1-68])|4(?:1[02-9]|2[179]|[35][2-9]|6[4789]|7[0-46-9]|8[23])|5(?:3[03-9]|4[36]|5|6[1-6]|7[028]|80|9[2-46-9])|6(?:3[1-5]|6[0238]|9[12])|7(?:01|[1579]|2[248]|3[04-9]|4[3-6]|6[2368])|8(?:1[236-8]|2[5-7]|[37]|5[1-9]|8[3678]|9[1-7])|9(?:0[1-3689]|1[1-79]|[379]|4[13]|5[1-5])'], '', ''], [None, '(1[3-58]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['1[3-58]'], '', ''], [None, '(10800)(\\d{3})(\\d{4})', '$1 $2 $3', ['108', '1080', '10800'], '', '']], [[None, '(21)(\\d{4})(\\d{4,6})', '$1 $2 $3', ['21'], None, ''], [None, '([12]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['10[1-9]|2[02-9]', '10[1-9]|2[02-9]', '10(?:[1-79]|8(?:[1-9]|0[1-9]))|2[02-9]'], None, ''], [None, '(80\\d{2})(\\d{4})', '$1 $2', ['80[2678]'], None, ''], [None, '(\\d{3})(\\d{4})(\\d{4})', '$1 $2 $3', ['3(?:11|7[159])|4[135]1|5(?:1|2[37]|3[12]|7[13-79]|9[15])|7(?:31|5[457]|6[09])|898'], None, ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['3(?:1[02-9]|35|49|5|7[02-68]|9[1-68])|4(?:1[02-9]|2[179]|[35][2-9]|6[4789]|7[0-46-9]|8[23])|5(?:3[03-9]|4[36]|5|6[1-6]|7[028]|80|9[2-46-9])|6(?:3[1-5]|6[0238]|9[12])|7(?:01|[1579]|2[248]|3[04-9]|4[3-6]|6[2368])|8(?:1[236-8]|2[5-7]|[37]|5[1-9]|8[3678]|9[1-7])|9(?:0[1-3689]|1[1-79]|[379]|4[13]|5[1-5])'], None, ''], [None, '(1[3-58]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['1[3-58]'], None, ''], [None, '([48]00)(\\d{3})(\\d{4})', '$1 $2 $3', ['[48]00'], None, ''], [None, '(10800)(\\d{3})(\\d{4})', '$1 $2 $3', ['108', '1080', '10800'], None, '']], [None, None, 'NA', 'NA', None, None, None], None, None],
+'CO': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CO', 57, '(?:00[579]|#555|#999)', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CR': [None, [None, None, '[289]\\d{7,9}', '\\d{8,10}', None, None, None], [None, None, '2[24-7]\\d{6}', '\\d{8}', None, None, None], [None, None, '8[389]\\d{6}', '\\d{8}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '90[059]\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CR', 506, '00', None, None, None, None, None, None, None, [[None, '(\\d{4})(\\d{4})', '$1 $2', ['2|8[389]'], '', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1-$2-$3', ['[89]0'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CU': [None, [None, None, '[2-57]\\d{5,7}', '\\d{4,8}', None, None, None], [None, None, '(?:2[1-4]\\d{5,6}|3(?:1\\d{6}|[23]\\d{4,6})|4(?:[125]\\d{5,6}|[36]\\d{6}|[78]\\d{4,6})|7\\d{6,7})', '\\d{4,8}', None, None, None], [None, None, '5\\d{7}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CU', 53, '119', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{6,7})', '$1 $2', ['7'], '(0\\$1)', ''], [None, '(\\d{2})(\\d{4,6})', '$1 $2', ['[2-4]'], '(0\\$1)', ''], [None, '(\\d)(\\d{7})', '$1 $2', ['5'], '(0\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CV': [None, [None, None, '[259]\\d{6}', '\\d{7}', None, None, None], [None, None, '2(?:2[1-7]|3[0-8]|4[12]|5[1256]|6\\d|7[1-3]|8[1-5])\\d{4}', '\\d{7}', None, None, None], [None, None, '(?:9\\d|59)\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CV', 238, '0', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CY': [None, [None, None, '[27-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '2[2-6]\\d{6}', '\\d{8}', None, None, None], [None, None, '7777\\d{4}|9(?:[69]\\d|7[67])\\d{5}', '\\d{8}', None, None, None], [None, None, '8000\\d{4}', '\\d{8}', None, None, None], [None, None, '9009\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '700\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CY', 357, '00', None, None, None, None, None, None, None, [[None, '([27-9]\\d)(\\d{6})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'CZ': [None, [None, None, '[2-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '2\\d{8}|(?:3[1257-9]|4[16-9]|5[13-9])\\d{7}', '\\d{9}', None, None, None], [None, None, '60[1-8]\\d{6}|7[2379]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '90[0689]\\d{6}', '\\d{9}', None, None, None], [None, None, '8[134]\\d{7}', '\\d{9}', None, None, None], [None, None, '70[01]\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'CZ', 420, '00', None, None, None, None, None, None, None, [[None, '([2-9]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'DE': [None, [None, None, '[1-35-9]\\d{3,13}|4(?:[0-8]\\d{4,12}|9(?:4[1-8]|[0-35-7]\\d)\\d{2,7})', '\\d{2,14}', None, None, None], [None, None, '[246]\\d{5,13}|3(?:[03-9]\\d{4,11}|2\\d{9})|5(?:0[2-8]|[38][0-8]|[124-6]\\d|[79][0-7])\\d{3,10}|7(?:0[2-8]|[1-9]\\d)\\d{3,10}|8(?:0[2-9]|[1-9]\\d)\\d{3,10}|9(?:0[6-9]|[1-9]\\d)\\d{3,10}', '\\d{2,14}', None, None, None], [None, None, '1(?:5\\d{9}|7(?:[0-57-9]|6\\d)\\d{7}|6(?:[02]\\d{7,8}|3\\d{7}))', '\\d{10,11}', None, None, None], [None, None, '800\\d{7,9}', '\\d{10,12}', None, None, None], [None, None, '900(?:[135]\\d{6}|9\\d{7})', '\\d{10,11}', None, None, None], [None, None, '180\\d{5,11}', '\\d{8,14}', None, None, None], [None, None, '700\\d{8}', '\\d{11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'DE', 49, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{4,11})', '$1/$2', ['3[02]|40|[68]9'], '0\\$1', ''], [None, '(\\d{3})(\\d{3,10})', '$1/$2', ['2(?:\\d1|0[2389]|1[24]|28|34)|3(?:[3-9][15]|40)|[4-8][1-9]1|9(?:06|[1-9]1)'], '0\\$1', ''], [None, '(\\d{4})(\\d{2,8})', '$1/$2', ['[24-6]|[7-9](?:\\d[1-9]|[1-9]\\d)|3(?:[3569][02-46-9]|4[2-4679]|7[2-467]|8[2-46-8])', '[24-6]|[7-9](?:\\d[1-9]|[1-9]\\d)|3(?:3(?:0[1-467]|2[127-9]|3[124578]|[46][1246]|7[1257-9]|8[1256]|9[145])|4(?:2[135]|3[1357]|4[13578]|6[1246]|7[1356]|9[1346])|5(?:0[14]|2[1-3589]|3[1357]|4[1246]|6[1-4]|7[1346]|8[13568]|9[1246])|6(?:0[356]|2[1-489]|3[124-6]|4[1347]|6[13]|7[12579]|8[1-356]|9[135])|7(?:2[1-7]|3[1357]|4[145]|6[1-5]|7[1-4])|8(?:21|3[1468]|4[1347]|6[0135-9]|7[1467]|8[136])|9(?:0[12479]|2[1358]|3[1357]|4[134679]|6[1-9]|7[136]|8[147]|9[1468]))'], '0\\$1', ''], [None, '(\\d{5})(\\d{1,6})', '$1/$2', ['3'], '0\\$1', ''], [None, '([18]\\d{2})(\\d{7,9})', '$1 $2', ['1[5-7]|800'], '0\\$1', ''], [None, '(\\d{3})(\\d)(\\d{4,10})', '$1 $2 $3', ['(?:18|90)0', '180|900[1359]'], '0\\$1', ''], [None, '(700)(\\d{4})(\\d{4})', '$1 $2 $3', ['700'], '0\\$1', '']], None, [None, None, '16(?:4\\d{1,10}|[89]\\d{1,11})', '\\d{4,14}', None, None, None], None, None],
+'DJ': [None, [None, None, '[1-8]\\d{5}', '\\d{6}', None, None, None], [None, None, '(?:1[05]|[2-5]\\d)\\d{4}', '\\d{6}', None, None, None], [None, None, '[6-8]\\d{5}', '\\d{6}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'DJ', 253, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'DK': [None, [None, None, '[1-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:3[2-9]|4[3-9]|5[4-9]|6[2-9]|7[02-9]|8[26-9]|9[6-9])\\d{6}', '\\d{8}', None, None, None], [None, None, '(?:2[0-9]|3[0-2]|4[0-2]|5[0-3]|6[01]|72|99)\\d{6}', '\\d{8}', None, None, None], [None, None, '80\\d{6}', '\\d{8}', None, None, None], [None, None, '90\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'DK', 45, '00', None, None, None, None, None, None, None, [[None, '([1-9]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'DM': [None, [None, None, '[7-9]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '767(?:2(?:55|66)|4(?:2[01]|4[0-25-9])|50[0-4])\\d{4}', '\\d{7,10}', None, None, None], [None, None, '767(?:2(?:[2346]5|7[5-7])|31[5-7]|61[4-6])\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'DM', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '767'],
+'DO': [None, [None, None, '[89]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '8[024]9[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '8[024]9[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'DO', 1, '011', '1', None, None, '1', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, '8[024]9'],
+'DZ': [None, [None, None, '(?:[1-4]|[5-9]\\d)\\d{7}', '\\d{8,9}', None, None, None], [None, None, '(?:1\\d|2[014-79]|3[0-8]|4[0135689])\\d{6}|9619\\d{5}', '\\d{8,9}', None, None, None], [None, None, '(?:5[56]|6[69]|7[79])\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '80[3-689]1\\d{5}', '\\d{9}', None, None, None], [None, None, '80[12]1\\d{5}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '98[23]\\d{6}', '\\d{9}', None, None, None], 'DZ', 213, '00', '0', None, None, '0', None, None, None, [[None, '([1-4]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[1-4]'], '0\\$1', ''], [None, '([5-8]\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[5-8]'], '0\\$1', ''], [None, '(9\\d)(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['9'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'EC': [None, [None, None, '[2-9]\\d{7}|1\\d{9,10}', '\\d{7,11}', None, None, None], [None, None, '[2-7][2-7]\\d{6}', '\\d{7,8}', None, None, None], [None, None, '[89]\\d{7}', '\\d{8}', None, None, None], [None, None, '1800\\d{6,7}', '\\d{10,11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'EC', 593, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{3})(\\d{4})', '$1 $2-$3', ['[2-7]'], '(0\\$1)', ''], [None, '(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[89]'], '(0\\$1)', ''], [None, '(1800)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['1'], '(0\\$1)', '']], [[None, '(\\d)(\\d{3})(\\d{4})', '$1-$2-$3', ['[2-7]'], None, ''], [None, '(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[89]'], None, ''], [None, '(1800)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['1'], None, '']], [None, None, 'NA', 'NA', None, None, None], None, None],
+'EE': [None, [None, None, '[3-9]\\d{6,7}|800\\d{6,7}', '\\d{6,10}', None, None, None], [None, None, '(?:3[23589]|4(?:0\\d|[3-8])|6\\d|7[1-9]|88)\\d{5}', '\\d{7,8}', None, None, None], [None, None, '(?:5\\d|8[1-5])\\d{6}|5(?:[02]\\d{2}|1(?:[0-8]\\d|95)|5[0-478]\\d|64[0-4]|65[1-589])\\d{3}', '\\d{7,8}', None, None, None], [None, None, '800(?:0\\d{3}|1\\d|[2-9])\\d{3}', '\\d{7,10}', None, None, None], [None, None, '900\\d{4}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '70[0-2]?\\d{5}', '\\d{7,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'EE', 372, '00', None, None, None, None, None, None, None, [[None, '([34-79]\\d{2})(\\d{4})', '$1 $2', ['[3679]|4[3-8]|5(?:[0-2]|5[0-478]|6[45])', '[3679]|4[3-8]|5(?:[02]|1(?:[0-8]|95)|5[0-478]|6(?:4[0-4]|5[1-589]))'], '', ''], [None, '(70)(\\d{2})(\\d{4})', '$1 $2 $3', ['70'], '', ''], [None, '(8000)(\\d{3})(\\d{3})', '$1 $2 $3', ['800', '8000'], '', ''], [None, '([458]\\d{3})(\\d{3,4})', '$1 $2', ['40|5|8(?:00|[1-5])', '40|5|8(?:00[1-9]|[1-5])'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'EG': [None, [None, None, '1\\d{4,9}|[2-689]\\d{7,9}', '\\d{5,10}', None, None, None], [None, None, '(?:1[35][23]|2[23]\\d|3\\d|4(?:0[2-4]|[578][23]|64)|5(?:0[234]|[57][23])|6[24-689]3|8(?:[28][2-4]|42|6[23])|9(?:[25]2|3[24]|6[23]|7[2-4]))\\d{6}|1[69]\\d{3}', '\\d{5,9}', None, None, None], [None, None, '1[0-246-9]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '900\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'EG', 20, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{7,8})', '$1 $2', ['[23]'], '0\\$1', ''], [None, '(\\d{2})(\\d{7})', '$1 $2', ['[14-6]|[89][2-9]'], '0\\$1', ''], [None, '([89]00)(\\d{3})(\\d{4})', '$1 $2 $3', ['[89]00'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ER': [None, [None, None, '[178]\\d{6}', '\\d{6,7}', None, None, None], [None, None, '1(?:1[12568]|20|40|55|6[146])\\d{4}|8\\d{6}', '\\d{6,7}', None, None, None], [None, None, '17[1-3]\\d{4}|7\\d{6}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ER', 291, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{3})(\\d{3})', '$1 $2 $3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ES': [None, [None, None, '[5-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '[89][1-8]\\d{7}', '\\d{9}', None, None, None], [None, None, '6\\d{8}', '\\d{9}', None, None, None], [None, None, '[89]00\\d{6}', '\\d{9}', None, None, None], [None, None, '80[367]\\d{6}', '\\d{9}', None, None, None], [None, None, '90[12]\\d{6}', '\\d{9}', None, None, None], [None, None, '(?:51|70)\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ES', 34, '00', None, None, None, None, None, None, None, [[None, '([5-9]\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ET': [None, [None, None, '[1-59]\\d{8}', '\\d{7,9}', None, None, None], [None, None, '(?:11(?:1(?:1[124]|2[2-57]|3[1-5]|5[5-8]|8[6-8])|2(?:13|3[6-8]|5[89]|7[05-9]|8[2-6])|3(?:2[01]|3[0-289]|4[1289]|7[1-4]|87)|4(?:1[69]|3[2-49]|4[0-23]|6[5-8])|5(?:1[57]|44|5[0-4])|6(?:18|2[69]|4[5-7]|5[1-5]|6[0-59]|8[015-8]))|2(?:2(?:11[1-9]|22[0-7]|33\\d|44[1467]|66[1-68])|5(?:11[124-6]|33[2-8]|44[1467]|55[14]|66[1-3679]|77[124-79]|880))|3(?:3(?:11[0-46-8]|22[0-6]|33[0134689]|44[04]|55[0-6]|66[01467])|4(?:44[0-8]|55[0-69]|66[0-3]|77[1-5]))|4(?:6(?:22[0-24-7]|33[1-5]|44[13-69]|55[14-689]|660|88[1-4])|7(?:11[1-9]|22[1-9]|33[13-7]|44[13-6]|55[1-689]))|5(?:7(?:227|55[05]|(?:66|77)[14-8])|8(?:11[149]|22[013-79]|33[0-68]|44[013-8]|550|66[1-5]|77\\d)))\\d{4}', '\\d{7,9}', None, None, None], [None, None, '91(?:1(?:[146]\\d|2[0-5]|3[4-6]|50|7[2-6]|8[46-9])|31\\d|4(?:3[0-2489]|7[0-3])|5(?:3[23]|7[3-5])|6(?:58|8[23])|7(?:5[57]|8[01])|8(?:3[45]|7[67]))\\d{4}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ET', 251, '00', '0', None, None, '0', None, None, None, [[None, '([1-59]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'FI': [None, [None, None, '[1-9]\\d{4,11}', '\\d{5,12}', None, None, None], [None, None, '1(?:0[1-9]\\d{3,7}|[35689][1-8]\\d{3,9}|[47]\\d{5,10})|2(?:0(?:[16-8]\\d{3,7}|2[14-9]\\d{1,6}|[3-5]\\d{2,7}|9[0-7]\\d{1,6})|[1-8]\\d{3,9}|9\\d{4,8})|3(?:0[1-9]\\d{3,7}|[1-8]\\d{3,9}|9\\d{4,8})|[5689][1-8]\\d{3,9}|7(?:1\\d{7}|3\\d{8}|5[03-9]\\d{2,7})', '\\d{5,12}', None, None, None], [None, None, '4\\d{5,10}|50\\d{4,8}', '\\d{6,11}', None, None, None], [None, None, '800\\d{4,7}', '\\d{7,10}', None, None, None], [None, None, '[67]00\\d{5,6}', '\\d{8,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'FI', 358, '00|99[049]', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{4,10})', '$1 $2', ['2[09]|[14]|50|7[135]'], '0\\$1', ''], [None, '(\\d)(\\d{4,11})', '$1 $2', ['[25689][1-8]|3'], '0\\$1', ''], [None, '([6-8]00)(\\d{4,7})', '$1 $2', ['[6-8]0'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'FJ': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'FJ', 679, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'FK': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'FK', 500, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'FM': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'FM', 691, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'FO': [None, [None, None, '[2-9]\\d{5}', '\\d{6}', None, None, None], [None, None, '(?:20|[3-4]\\d|8[19])\\d{4}', '\\d{6}', None, None, None], [None, None, '(?:2[1-9]|5\\d|7[1-79])\\d{4}', '\\d{6}', None, None, None], [None, None, '80[257-9]\\d{3}', '\\d{6}', None, None, None], [None, None, '90(?:[1345][15-7]|2[125-7]|99)\\d{2}', '\\d{6}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '(?:6[0-36]|88)\\d{4}', '\\d{6}', None, None, None], 'FO', 298, '00', None, None, None, '10(?:01|[12]0|88)', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'FR': [None, [None, None, '[1-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '[1-5]\\d{8}', '\\d{9}', None, None, None], [None, None, '6\\d{8}|7[5-9]\\d{7}', '\\d{9}', None, None, None], [None, None, '80\\d{7}', '\\d{9}', None, None, None], [None, None, '89[1-37-9]\\d{6}', '\\d{9}', None, None, None], [None, None, '8(?:1[019]|2[0156]|84|90)\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '9\\d{8}', '\\d{9}', None, None, None], 'FR', 33, '[04579]0', '0', None, None, '0', None, '00', None, [[None, '([1-79])(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4 $5', ['[1-79]'], '0\\$1', ''], [None, '(8\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['8'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GA': [None, [None, None, '[4-9]\\d{5}|0\\d{7}', '\\d{6,8}', None, None, None], [None, None, '(?:4(?:[04-8]\\d|2[04])|(?:5[04-689]|6[024-9]|7\\d|8[236]|9[02368])\\d)\\d{3}', '\\d{6}', None, None, None], [None, None, '0(?:5(?:0[89]|3[0-4]|8[0-26]|9[238])|6(?:0[3-7]|1[01]|2[0-7]|6[0-589]|71|83|9[57])|7(?:1[2-5]|2[89]|3[35-9]|4[01]|5[0-347-9]|[67]\\d|8[457-9]|9[0146]))\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GA', 241, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3', ['[4-9]'], '', ''], [None, '(0\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['0'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GB': [None, [None, None, '\\d{7,10}', '\\d{4,10}', None, None, None], [None, None, '2(?:0[01378]|3[0189]|4[017]|8[0-46-9]|9[012])\\d{7}|1(?:(?:1(?:3[0-48]|[46][0-4]|5[012789]|7[0-39]|8[01349])|21[0-7]|31[0-8]|[459]1\\d|61[01246-9]))\\d{6}|1(?:2(?:0[024-9]|2[3-9]|3[3-79]|4[1-689]|[58][02-9]|6[0-4789]|7[013-9]|9\\d)|3(?:0\\d|[25][02-9]|3[02-579]|[468][0-46-9]|7[1235679]|9[24578])|4(?:0[03-9]|[28][02-5789]|[37]\\d|4[02-69]|5[0-8]|[69][0-79])|5(?:0[1235-9]|2[024-9]|3[015689]|4[02-9]|5[03-9]|6\\d|7[0-35-9]|8[0-468]|9[0-5789])|6(?:0[034689]|2[0-35689]|[38][013-9]|4[1-467]|5[0-69]|6[13-9]|7[0-8]|9[0124578])|7(?:0[0246-9]|2\\d|3[023678]|4[03-9]|5[0-46-9]|6[013-9]|7[0-35-9]|8[024-9]|9[02-9])|8(?:0[35-9]|2[1-5789]|3[02-578]|4[0-578]|5[124-9]|6[2-69]|7\\d|8[02-9]|9[02569])|9(?:0[02-589]|2[02-689]|3[1-5789]|4[2-9]|5[0-579]|6[234789]|7[0124578]|8\\d|9[2-57]))\\d{6}|1(?:2(?:0(?:46[1-4]|87[2-9])|545[1-79]|76(?:2\\d|3[1-8]|6[1-6])|9(?:7(?:2[0-4]|3[2-5])|8(?:2[2-8]|7[0-4789]|8[345])))|3(?:638[2-5]|647[23]|8(?:47[04-9]|64[015789]))|4(?:044[1-7]|20(?:2[23]|8\\d)|6(?:0(?:30|5[2-57]|6[1-8]|7[2-8])|140)|8(?:052|87[123]))|5(?:24(?:3[2-79]|6\\d)|276\\d|6(?:26[06-9]|686))|6(?:06(?:4\\d|7[4-79])|295[567]|35[34]\\d|47(?:24|61)|59(?:5[08]|6[67]|74)|955[0-4])|7(?:26(?:6[13-9]|7[0-7])|442\\d|50(?:2[0-3]|[3-68]2|76))|8(?:27[56]\\d|37(?:5[2-5]|8[239])|84(?:3[2-58]))|9(?:0(?:0(?:6[1-8]|85)|52\\d)|3583|4(?:66[1-8]|9(?:2[01]|81))|63(?:23|3[1-4])|9561))\\d{3}|176888[234678]\\d{2}|16977[23]\\d{3}|(?:3[0347]|55)\\d{8}', '\\d{4,10}', None, None, None], [None, None, '7(?:[1-4]\\d\\d|5(?:0[0-8]|[13-9]\\d|2[0-35-9])|7(?:0[1-9]|[1-7]\\d|8[02-9]|9[0-689])|8(?:[014-9]\\d|[23][0-8])|9(?:[04-9]\\d|1[02-9]|2[0135-9]|3[0-689]))\\d{6}', '\\d{10}', None, None, None], [None, None, '80(?:0(?:1111|\\d{6,7})|8\\d{7})|500\\d{6}', '\\d{7}(?:\\d{2,3})?', None, None, None], [None, None, '(?:87[123]|9(?:[01]\\d|8[0-3]))\\d{7}', '\\d{10}', None, None, None], [None, None, '8(?:4(?:5464\\d|[2-5]\\d{7})|70\\d{7})', '\\d{7}(?:\\d{3})?', None, None, None], [None, None, '70\\d{8}', '\\d{10}', None, None, None], [None, None, '56\\d{8}', '\\d{10}', None, None, None], 'GB', 44, '00', '0', ' x', None, '0', None, None, None, [[None, '(\\d{2})(\\d{4})(\\d{4})', '$1 $2 $3', ['2|5[56]|7[06]'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['1(?:1|\\d1)|3|9[018]'], '0\\$1', ''], [None, '(\\d{5})(\\d{4,5})', '$1 $2', ['1(?:38|5[23]|69|76|94)', '1(?:387|5(?:24|39)|697|768|946)', '1(?:3873|5(?:242|39[456])|697[347]|768[347]|9467)'], '0\\$1', ''], [None, '(1\\d{3})(\\d{5,6})', '$1 $2', ['1'], '0\\$1', ''], [None, '(7\\d{3})(\\d{6})', '$1 $2', ['7[1-5789]'], '0\\$1', ''], [None, '(800)(\\d{4})', '$1 $2', ['800', '8001', '80011', '800111', '8001111'], '0\\$1', ''], [None, '(845)(46)(4\\d)', '$1 $2 $3', ['845', '8454', '84546', '845464'], '0\\$1', ''], [None, '(8\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['8(?:4[2-5]|7[0-3])'], '0\\$1', ''], [None, '(80\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['80'], '0\\$1', ''], [None, '([58]00)(\\d{6})', '$1 $2', ['[58]00'], '0\\$1', '']], None, [None, None, '76(?:0[012]|2[356]|4[0134]|5[49]|6[0-369]|77|81|9[39])\\d{6}', '\\d{10}', None, None, None], 1, None],
+'GD': [None, [None, None, '[489]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '473(?:2(?:3[0-2]|69)|3(?:2[89]|86)|4(?:08|3[5-9]|4[0-49]|5[5-79]|68|73|90)|63[68]|7(?:58|84)|938)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '473(?:4(?:0[3-79]|1[04-9]|20|58)|53[3-8])\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GD', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '473'],
+'GE': [None, [None, None, '[1-3579]\\d{7}|8\\d{8}', '\\d{3,9}', None, None, None], [None, None, '(?:122|2(?:22|36|5[03])|3(?:1[0-35-8]|[24-6]\\d|3[1-35679]|7[0-39]|9[1-35-7])|44[2-6])\\d{5}', '\\d{3,8}', None, None, None], [None, None, '(?:5[1578]|6[28]|7[0147-9]|9[0135-9])\\d{6}', '\\d{8}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GE', 995, '8~10', '8', None, None, '8', None, None, None, [[None, '(32)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['32'], '8 \\$1', ''], [None, '(\\d{3})(\\d{5})', '$1 $2', ['2|3[13-79]|446'], '8 \\$1', ''], [None, '(\\d{4})(\\d{3,4})', '$1 $2', ['44[2-5]'], '8 \\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[5679]'], '8 \\$1', ''], [None, '(800)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['8'], '8 \\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GF': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GF', 594, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GG': [None, [None, None, '[15789]\\d{6,9}', '\\d{6,10}', None, None, None], [None, None, '1481\\d{6}', '\\d{6,10}', None, None, None], [None, None, '7(?:781|839|911)\\d{6}', '\\d{10}', None, None, None], [None, None, '80(?:0(?:1111|\\d{6,7})|8\\d{7})|500\\d{6}', '\\d{7}(?:\\d{2,3})?', None, None, None], [None, None, '(?:87[123]|9(?:[01]\\d|8[0-3]))\\d{7}', '\\d{10}', None, None, None], [None, None, '8(?:4(?:5464\\d|[2-5]\\d{7})|70\\d{7})', '\\d{7}(?:\\d{3})?', None, None, None], [None, None, '70\\d{8}', '\\d{10}', None, None, None], [None, None, '56\\d{8}', '\\d{10}', None, None, None], 'GG', 44, '00', '0', ' x', None, '0', None, None, None, None, None, [None, None, '76(?:0[012]|2[356]|4[0134]|5[49]|6[0-369]|77|81|9[39])\\d{6}', '\\d{10}', None, None, None], None, None],
+'GH': [None, [None, None, '[235]\\d{6,8}', '\\d{7,9}', None, None, None], [None, None, '3(?:0[237]\\d|[167](?:2[0-6]|7\\d)|2(?:2[0-5]|7\\d)|3(?:2[0-37]|7\\d)|4(?:[27]\\d|30)|5(?:2[0-7]|7\\d)|8(?:2[0-2]|7\\d)|9(?:20|7\\d))\\d{5}', '\\d{7,9}', None, None, None], [None, None, '2(?:(?:[47]\\d|08)\\d{6}|[368]\\d{7})|54\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GH', 233, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GI': [None, [None, None, '[2568]\\d{7}', '\\d{8}', None, None, None], [None, None, '2(?:00\\d|16[0-7]|22[2457])\\d{4}', '\\d{8}', None, None, None], [None, None, '(?:5[4-8]|60)\\d{6}', '\\d{8}', None, None, None], [None, None, '80\\d{6}', '\\d{8}', None, None, None], [None, None, '8[1-689]\\d{6}', '\\d{8}', None, None, None], [None, None, '87\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GI', 350, '00', None, None, None, None, None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GL': [None, [None, None, '[1-689]\\d{5}', '\\d{6}', None, None, None], [None, None, '(?:19|3[1-6]|6[14689]|8[14-79]|9\\d)\\d{4}', '\\d{6}', None, None, None], [None, None, '[245][2-9]\\d{4}', '\\d{6}', None, None, None], [None, None, '80\\d{4}', '\\d{6}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '3[89]\\d{4}', '\\d{6}', None, None, None], 'GL', 299, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GM': [None, [None, None, '[3-9]\\d{6}', '\\d{7}', None, None, None], [None, None, '(?:4(?:[23]\\d{2}|4(?:1[024679]|[6-9]\\d))|5(?:54[0-7]|6(?:[67]\\d)|7(?:1[04]|2[035]|3[58]|48))|8\\d{3})\\d{3}', '\\d{7}', None, None, None], [None, None, '[3679]\\d{6}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GM', 220, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GN': [None, [None, None, '[3567]\\d{7}', '\\d{8}', None, None, None], [None, None, '30(?:24|3[12]|4[1-35-7]|5[13]|6[189]|[78]1|9[1478])\\d{4}', '\\d{8}', None, None, None], [None, None, '55\\d{6}|6(?:0(?:2\\d|3[3467]|5[2457-9])|[24578]\\d{2}|3(?:[14]0|35))\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GN', 224, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GP': [None, [None, None, '[56]\\d{8}', '\\d{9}', None, None, None], [None, None, '590(?:1[12]|2[0-68]|3[28]|4[126-8]|5[067]|6[018]|[89]\\d)\\d{4}', '\\d{9}', None, None, None], [None, None, '690(?:00|[3-5]\\d|6[0-57-9]|7[1-6]|8[0-6]|9[09])\\d{4}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GP', 590, '00', '0', None, None, '0', None, None, None, [[None, '([56]90)(\\d{2})(\\d{4})', '$1 $2-$3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], 1, None],
+'GQ': [None, [None, None, '[23589]\\d{8}', '\\d{6,9}', None, None, None], [None, None, '3(?:3(?:3\\d[7-9]|[0-24-9]\\d[46])|5\\d{2}[7-9])\\d{4}', '\\d{6,9}', None, None, None], [None, None, '(?:222|551)\\d{6}', '\\d{6,9}', None, None, None], [None, None, '80\\d[1-9]\\d{5}', '\\d{6,9}', None, None, None], [None, None, '90\\d[1-9]\\d{5}', '\\d{6,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GQ', 240, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['[235]'], '', ''], [None, '(\\d{3})(\\d{6})', '$1 $2', ['[89]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GR': [None, [None, None, '[26-9]\\d{9}', '\\d{10}', None, None, None], [None, None, '2(?:1\\d{2}|2(?:3[1-8]|4[1-7]|5[1-4]|6[1-8]|7[1-5]|[289][1-9])|3(?:1\\d|2[1-5]|3[1-4]|[45][1-3]|7[1-7]|8[1-6]|9[1-79])|4(?:1\\d|2[1-8]|3[1-4]|4[13-5]|6[1-578]|9[1-5])|5(?:1\\d|2[1-3]|4[124]|5[1-6]|[39][1-4])|6(?:1\\d|3[24]|4[1-7]|5[13-9]|[269][1-6]|7[14]|8[1-35])|7(?:1\\d|[23][1-5]|4[1-7]|5[1-57]|6[134]|9[15-7])|8(?:1\\d|2[1-5]|[34][1-4]|9[1-7]))\\d{6}', '\\d{10}', None, None, None], [None, None, '69\\d{8}', '\\d{10}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '90[19]\\d{7}', '\\d{10}', None, None, None], [None, None, '8(?:0[16]|12|25)\\d{7}', '\\d{10}', None, None, None], [None, None, '70\\d{8}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GR', 30, '00', None, None, None, None, None, None, None, [[None, '([27]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['21|7'], '', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['2[2-9]1|[689]'], '', ''], [None, '(2\\d{3})(\\d{6})', '$1 $2', ['2[2-9][02-9]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GT': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GT', 502, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GU': [None, [None, None, '[689]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '671(?:3\\d{2}|47\\d|56\\d|6[3-5]\\d|7(?:3\\d|89)|828)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '671(?:3\\d{2}|47\\d|56\\d|6[3-5]\\d|7(?:3\\d|89)|828)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GU', 1, '011', '1', None, None, '1', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, '671'],
+'GW': [None, [None, None, '[3567]\\d{6}', '\\d{7}', None, None, None], [None, None, '3(?:2[0125]|3[1245]|4[12]|5[1-4]|70|9[1-467])\\d{4}', '\\d{7}', None, None, None], [None, None, '[5-7]\\d{6}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GW', 245, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'GY': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'GY', 592, '001', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'HK': [None, [None, None, '[235-7]\\d{7}|8\\d{7,8}|9\\d{7,10}', '\\d{8,11}', None, None, None], [None, None, '[23]\\d{7}', '\\d{8}', None, None, None], [None, None, '[5-79]\\d{7}', '\\d{8}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '900\\d{8}', '\\d{11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '8[1-3]\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'HK', 852, '00', None, None, None, None, None, None, None, [[None, '(\\d{4})(\\d{4})', '$1 $2', ['[235-7]|[89](?:0[1-9]|[1-9])'], '', ''], [None, '(800)(\\d{3})(\\d{3})', '$1 $2 $3', ['800'], '', ''], [None, '(900)(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['900'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'HN': [None, [None, None, '[237-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '2(?:2(?:0[019]|1[1-36]|[23]\\d|4[056]|5[57]|9[01])|4(?:2|3-59]|3[13-689]|4[0-68]|5[1-35])|5(?:4[3-5]|5\\d|6[56]|74)|6(?:4[0-378]|[56]\\d|[78][0-8]|9[01])|7(?:6[46-9]|7[02-9]|8[34])|8(?:79|8[0-35789]|9[1-57-9]))\\d{4}', '\\d{8}', None, None, None], [None, None, '[37-9]\\d{7}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'HN', 504, '00', None, None, None, None, None, None, None, [[None, '(\\d{4})(\\d{4})', '$1-$2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'HR': [None, [None, None, '[1-7]\\d{5,8}|[89]\\d{6,11}', '\\d{6,12}', None, None, None], [None, None, '(?:1|6[029])\\d{7}|(?:2[0-3]|3[1-5]|4[02-47-9]|5[1-3])\\d{6}', '\\d{6,9}', None, None, None], [None, None, '9[12589]\\d{6,10}', '\\d{8,12}', None, None, None], [None, None, '80[01]\\d{4,7}', '\\d{7,10}', None, None, None], [None, None, '6[145]\\d{4,7}', '\\d{6,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '7[45]\\d{4,7}', '\\d{6,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'HR', 385, '00', '0', None, None, '0', None, None, None, [[None, '(1)(\\d{4})(\\d{3})', '$1 $2 $3', ['1'], '0\\$1', ''], [None, '(6[029])(\\d{4})(\\d{3})', '$1 $2 $3', ['6[029]'], '0\\$1', ''], [None, '([2-5]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[2-5]'], '0\\$1', ''], [None, '(9[12589])(\\d{3,4})(\\d{3,4})', '$1 $2 $3', ['9'], '0\\$1', ''], [None, '(9[12589])(\\d{3,4})(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['9'], '0\\$1', ''], [None, '(\\d{2})(\\d{2})(\\d{2,3})', '$1 $2 $3', ['6[145]|7'], '0\\$1', ''], [None, '(\\d{2})(\\d{3,4})(\\d{3})', '$1 $2 $3', ['6[145]|7'], '0\\$1', ''], [None, '(80[01])(\\d{2})(\\d{2,3})', '$1 $2 $3', ['8'], '0\\$1', ''], [None, '(80[01])(\\d{3,4})(\\d{3})', '$1 $2 $3', ['8'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'HT': [None, [None, None, '[2-489]\\d{7}', '\\d{8}', None, None, None], [None, None, '2(?:[24]\\d|5[1-5]|94)\\d{5}', '\\d{8}', None, None, None], [None, None, '(?:3[4-9]|4\\d)\\d{6}', '\\d{8}', None, None, None], [None, None, '8\\d{7}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '98[89]\\d{5}', '\\d{8}', None, None, None], 'HT', 509, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{4})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'HU': [None, [None, None, '\\d{8,9}', '\\d{6,9}', None, None, None], [None, None, '(?:1\\d|2(?:1\\d|[2-9])|3[2-7]|4[24-9]|5[2-79]|6[23689]|7(?:1\\d|[2-9])|8[2-57-9]|9[2-69])\\d{6}', '\\d{6,9}', None, None, None], [None, None, '(?:[27]0|3[01])\\d{7}', '\\d{9}', None, None, None], [None, None, '80\\d{6}', '\\d{8}', None, None, None], [None, None, '9[01]\\d{6}', '\\d{8}', None, None, None], [None, None, '40\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'HU', 36, '00', '06', None, None, '06', None, None, None, [[None, '(1)(\\d{3})(\\d{4})', '$1 $2 $3', ['1'], '(\\$1)', ''], [None, '(\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[2-9]'], '(\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ID': [None, [None, None, '[1-9]\\d{6,10}', '\\d{5,11}', None, None, None], [None, None, '2[124]\\d{7,8}|(?:2(?:[35][1-4]|6[0-8]|7[1-6]|8\\d|9[1-8])|3(?:1|2[1-578]|3[1-68]|4[1-3]|5[1-8]|6[1-3568]|7[0-46]|8\\d)|4(?:0[1-589]|1[01347-9]|2[0-36-8]|3[0-24-68]|5[1-378]|6[1-5]|7[134]|8[1245])|5(?:1[1-35-9]|2[25-8]|3[1246-9]|4[1-3589]|5[1-46]|6[1-8])|6(?:19?|[25]\\d|3[1-469]|4[1-6])|7(?:1[1-46-9]|2[14-9]|[36]\\d|4[1-8]|5[1-9]|7[0-36-9])|9(?:0[12]|1[0134-8]|2[0-479]|5[125-8]|6[23679]|7[159]|8[01346]))\\d{5,8}', '\\d{5,10}', None, None, None], [None, None, '8[1-35-9]\\d{7,9}', '\\d{9,11}', None, None, None], [None, None, '177\\d{6,8}|800\\d{5,7}', '\\d{8,11}', None, None, None], [None, None, '809\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ID', 62, '0(?:0[1789]|10(?:00|1[67]))', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{7,8})', '$1 $2', ['2[124]|[36]1'], '0\\$1', ''], [None, '(\\d{3})(\\d{5,7})', '$1 $2', ['[4579]|2[035-9]|[36][02-9]'], '0\\$1', ''], [None, '(8\\d{2})(\\d{3,4})(\\d{3,4})', '$1-$2-$3', ['8[1-35-9]'], '0\\$1', ''], [None, '(177)(\\d{6,8})', '$1 $2', ['1'], '0\\$1', ''], [None, '(800)(\\d{5,7})', '$1 $2', ['800'], '0\\$1', ''], [None, '(809)(\\d)(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['809'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IE': [None, [None, None, '[124-9]\\d{6,9}', '\\d{5,10}', None, None, None], [None, None, '1\\d{7,8}|2(?:1\\d{6,7}|[24-9]\\d{5}|3\\d{5,7})|4(?:0[24]\\d{5}|[1269]\\d{7}|[34]\\d{5,7}|5\\d{6}|7\\d{5}|8[0-46-9]\\d{7})|5(?:0[45]\\d{5}|1\\d{6}|2\\d{5,7}|[3679]\\d{7}|8\\d{5})|6(?:1\\d{6}|4\\d{5,7}|[237-9]\\d{5}|[56]\\d{7})|7[14]\\d{7}|818\\d{6}|9(?:1\\d{6}|[04]\\d{7}|[3-9]\\d{5})', '\\d{5,10}', None, None, None], [None, None, '8(?:22\\d{6}|[35-9]\\d{7,8})', '\\d{9,10}', None, None, None], [None, None, '1800\\d{6}', '\\d{10}', None, None, None], [None, None, '15(?:1[2-9]|[2-8]0|59|9[089])\\d{6}', '\\d{10}', None, None, None], [None, None, '18[59]0\\d{6}', '\\d{10}', None, None, None], [None, None, '700\\d{6}', '\\d{9}', None, None, None], [None, None, '76\\d{7}', '\\d{9}', None, None, None], 'IE', 353, '00', '0', None, None, '0', None, None, None, [[None, '(1)(\\d{3,4})(\\d{4})', '$1 $2 $3', ['1'], '(0\\$1)', ''], [None, '(\\d{2})(\\d{5})', '$1 $2', ['2[2-9]|4[347]|5[2-58]|6[2-47-9]|9[3-9]'], '(0\\$1)', ''], [None, '(\\d{3})(\\d{5})', '$1 $2', ['40[24]|50[45]'], '(0\\$1)', ''], [None, '(48)(\\d{4})(\\d{4})', '$1 $2 $3', ['48'], '(0\\$1)', ''], [None, '(818)(\\d{3})(\\d{3})', '$1 $2 $3', ['81'], '(0\\$1)', ''], [None, '(\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[24-69]|7[14]'], '(0\\$1)', ''], [None, '([78]\\d)(\\d{3,4})(\\d{4})', '$1 $2 $3', ['76|8[35-9]'], '(0\\$1)', ''], [None, '(700)(\\d{3})(\\d{3})', '$1 $2 $3', ['70'], '(0\\$1)', ''], [None, '(\\d{4})(\\d{3})(\\d{3})', '$1 $2 $3', ['1(?:8[059]|5)', '1(?:8[059]0|5)'], '(0\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IL': [None, [None, None, '[1-57-9]\\d{6,9}', '\\d{7,10}', None, None, None], [None, None, '(?:[2-489]|7[2-46-8])\\d{7}', '\\d{7,9}', None, None, None], [None, None, '5[024679]\\d{7}', '\\d{9}', None, None, None], [None, None, '1(?:80[01]\\d{3}|255)\\d{3}', '\\d{7,10}', None, None, None], [None, None, '1(?:212|(?:919|200)\\d{2})\\d{4}', '\\d{8,10}', None, None, None], [None, None, '1(?:700|809)\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '77\\d{7}', '\\d{9}', None, None, None], 'IL', 972, '0(?:0|1[2-48])', '0', None, None, '0', None, None, None, [[None, '([2-489])(\\d{3})(\\d{4})', '$1-$2-$3', ['[2-489]'], '\\$1', ''], [None, '([57]\\d)(\\d{3})(\\d{4})', '$1-$2-$3', ['[57]'], '\\$1', ''], [None, '(1)([7-9]\\d{2})(\\d{3})(\\d{3})', '$1-$2-$3-$4', ['1[7-9]'], '\\$1', ''], [None, '(1255)(\\d{3})', '$1-$2', ['125'], '\\$1', ''], [None, '(1200)(\\d{3})(\\d{3})', '$1-$2-$3', ['120'], '\\$1', ''], [None, '(1212)(\\d{2})(\\d{2})', '$1-$2-$3', ['121'], '\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IM': [None, [None, None, '[15789]\\d{6,9}', '\\d{6,10}', None, None, None], [None, None, '1624\\d{6}', '\\d{6,10}', None, None, None], [None, None, '7[569]24\\d{6}', '\\d{10}', None, None, None], [None, None, '80(?:0(?:1111|\\d{6,7})|8\\d{7})|500\\d{6}', '\\d{7}(?:\\d{2,3})?', None, None, None], [None, None, '(?:87[123]|9(?:[01]\\d|8[0-3]))\\d{7}', '\\d{10}', None, None, None], [None, None, '8(?:4(?:5464\\d|[2-5]\\d{7})|70\\d{7})', '\\d{7}(?:\\d{3})?', None, None, None], [None, None, '70\\d{8}', '\\d{10}', None, None, None], [None, None, '56\\d{8}', '\\d{10}', None, None, None], 'IM', 44, '00', '0', ' x', None, '0', None, None, None, None, None, [None, None, '7624\\d{6}', '\\d{10}', None, None, None], None, None],
+'IN': [None, [None, None, '[1-9]\\d{9,10}', '\\d{6,11}', None, None, None], [None, None, '(?:11|2[02]|33|4[04]|79|80)[2-6]\\d{7}|(?:1(?:2[0-249]|3[0-25]|4[145]|[59][14]|6[014]|7[1257]|8[01346])|2(?:1[257]|3[013]|4[01]|5[0137]|6[0158]|78|8[1568]|9[14])|3(?:26|4[1-3]|5[34]|6[01489]|7[02-46]|8[159])|4(?:1[36]|2[1-47]|3[15]|5[12]|6[126-9]|7[0-24-9]|8[013-57]|9[014-7])|5(?:[136][25]|22|4[28]|5[12]|[78]1|9[15])|6(?:12|[2345]1|57|6[13]|7[14]|80)|7(?:12|2[14]|3[134]|4[47]|5[15]|[67]1|88)|8(?:16|2[014]|3[126]|6[136]|7[078]|8[34]|91))[2-6]\\d{6}|(?:(?:1(?:2[35-8]|3[346-9]|4[236-9]|[59][0235-9]|6[235-9]|7[34689]|8[257-9])|2(?:1[134689]|3[24-8]|4[2-8]|5[25689]|6[2-4679]|7[13-79]|8[2-479]|9[235-9])|3(?:01|1[79]|2[1-5]|4[25-8]|5[125689]|6[235-7]|7[157-9]|8[2-467])|4(?:1[14578]|2[5689]|3[2-467]|5[4-7]|6[35]|73|8[2689]|9[2389])|5(?:[16][146-9]|2[14-8]|3[1346]|4[14-69]|5[46]|7[2-4]|8[2-8]|9[246])|6(?:1[1358]|2[2457]|3[2-4]|4[235-7]|5[2-689]|6[24-58]|7[23-689]|8[1-6])|8(?:1[1357-9]|2[235-8]|3[03-57-9]|4[0-24-9]|5\\d|6[2457-9]|7[1-6]|8[1256]|9[2-4]))\\d|7(?:(?:1[013-9]|2[0235-9]|3[2679]|4[1-35689]|5[2-46-9]|[67][02-9]|9\\d)\\d|8(?:2[0-6]|[013-8]\\d)))[2-6]\\d{5}', '\\d{6,10}', None, None, None], [None, None, '(?:7(?:39[89]|5(?:50|6[6-8]|79|[89][7-9])|6(?:0[027]|20|3[19]|54|65|7[67]|9[6-9])|7(?:0[89]|3[589]|42|60|9[5-9])|8(?:[03][07-9]|14|2[7-9]|4[25]|6[09]))\\d|9\\d{4}|8(?:(?:0[01589]|1[024])\\d|8(?:[079]\\d|44)|9[057-9]\\d)\\d)\\d{5}', '\\d{10}', None, None, None], [None, None, '1(?:800\\d?|600)\\d{6}', '\\d{10,11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'IN', 91, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{2})(\\d{6})', '$1 $2 $3', ['7(?:39|5[5-9]|[67][02-9]|8[0-6])|8(?:0[01589]|1[024]|8[0479]|9[057-9])|9', '7(?:39|5(?:50|[6-9])|[67][02-9]|8[0-6])|8(?:0[01589]|1[024]|8(?:[079]|44)|9[057-9])|9'], '0\\$1', ''], [None, '(\\d{2})(\\d{4})(\\d{4})', '$1 $2 $3', ['11|2[02]|33|4[04]|79|80[2-6]'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['1(?:2[0-249]|3[0-25]|4[145]|[569][14]|7[1257]|8[1346]|[68][1-9])'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['2(?:1[257]|3[013]|4[01]|5[0137]|6[0158]|78|8[1568]|9[14])'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['3(?:26|4[1-3]|5[34]|6[01489]|7[02-46]|8[159])'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['4(?:1[36]|2[1-47]|3[15]|5[12]|6[126-9]|7[0-24-9]|8[013-57]|9[014-7])'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['5(?:[136][25]|22|4[28]|5[12]|[78]1|9[15])'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['6(?:12|[2345]1|57|6[13]|7[14]|80)'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['7(?:12|2[14]|3[134]|4[47]|5[15]|[67]1|88)', '7(?:12|2[14]|3[134]|4[47]|5(?:1|5[1-9])|[67]1|88)'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['8(?:16|2[014]|3[126]|6[136]|7[078]|8[34]|91)'], '0\\$1', ''], [None, '(\\d{4})(\\d{3})(\\d{3})', '$1 $2 $3', ['1(?:[2-579]|[68][1-9])|[2-8]'], '0\\$1', ''], [None, '(1600)(\\d{2})(\\d{4})', '$1 $2 $3', ['160', '1600'], '0\\$1', ''], [None, '(1800)(\\d{2,3})(\\d{4})', '$1 $2 $3', ['180', '1800'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IO': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'IO', 246, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IQ': [None, [None, None, '[1-7]\\d{7,9}', '\\d{6,10}', None, None, None], [None, None, '1\\d{7}|(?:2[13-5]|3[02367]|4[023]|5[03]|6[026])\\d{6,7}', '\\d{6,9}', None, None, None], [None, None, '7[5-9]\\d{8}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'IQ', 964, '00', '0', None, None, '0', None, None, None, [[None, '(1)(\\d{3})(\\d{4})', '$1 $2 $3', ['1'], '0\\$1', ''], [None, '([2-6]\\d)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[2-6]'], '0\\$1', ''], [None, '(7[5-9]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['7'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IR': [None, [None, None, '[1-9]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '[1-8]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '9(?:1\\d|3[1-8])\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'IR', 98, '00', '0', None, None, '0', None, None, None, [[None, '(21)(\\d{4})(\\d{4})', '$1 $2 $3', ['21'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['[13-89]|2[02-9]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IS': [None, [None, None, '[4-9]\\d{6}|38\\d{7}', '\\d{7,9}', None, None, None], [None, None, '(?:4(?:1[0-245]|2[0-7]|[37][0-8]|4[0245]|5[0-356]|6\\d|8[0-46-8]|9[013-79])|5(?:05|[156]\\d|2[02578]|3[013-6]|4[03-6]|7[0-2578]|8[0-25-9]|9[013-689])|87[23])\\d{4}', '\\d{7}', None, None, None], [None, None, '38[59]\\d{6}|(?:6(?:1[014-8]|2[0-8]|3[0-27-9]|4[0-29]|5[029]|[67][0-69]|[89]\\d)|7(?:5[057]|7[0-7])|8(?:2[0-5]|[469]\\d|5[1-9]))\\d{4}', '\\d{7,9}', None, None, None], [None, None, '800\\d{4}', '\\d{7}', None, None, None], [None, None, '90\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '49[013-79]\\d{4}', '\\d{7}', None, None, None], 'IS', 354, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', ['[4-9]'], '', ''], [None, '(3\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['3'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'IT': [None, [None, None, '[01389]\\d{5,10}', '\\d{6,11}', None, None, None], [None, None, '0\\d{7,10}', '\\d{8,11}', None, None, None], [None, None, '3\\d{8,9}', '\\d{9,10}', None, None, None], [None, None, '80(?:0\\d{6}|3\\d{3})', '\\d{6,9}', None, None, None], [None, None, '89(?:2\\d{3}|9\\d{6})', '\\d{6,9}', None, None, None], [None, None, '84[78]\\d{6,7}', '\\d{9,10}', None, None, None], [None, None, '178\\d{6,7}', '\\d{9,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'IT', 39, '00', None, None, None, None, None, None, None, [[None, '(0[26])(\\d{3,4})(\\d{4})', '$1 $2 $3', ['0[26]'], '', ''], [None, '(0[26])(\\d{4})(\\d{5})', '$1 $2 $3', ['0[26]'], '', ''], [None, '(0[26])(\\d{6})', '$1 $2', ['0[26]'], '', ''], [None, '(0\\d{2})(\\d{3,4})(\\d{4})', '$1 $2 $3', ['0(?:[13-57-9][0159]|36)'], '', ''], [None, '(0\\d{2})(\\d{5,6})', '$1 $2', ['0(?:[13-57-9][0159]|36)'], '', ''], [None, '(0\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['0[13-57-9]'], '', ''], [None, '(0\\d{3})(\\d{4,6})', '$1 $2', ['0[13-57-9]'], '', ''], [None, '(\\d{3})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[13]|8(?:00|4[78])'], '', ''], [None, '(\\d{3})(\\d{3,6})', '$1 $2', ['8(?:03|9)'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'JE': [None, [None, None, '[15789]\\d{6,9}', '\\d{6,10}', None, None, None], [None, None, '1534\\d{6}', '\\d{6,10}', None, None, None], [None, None, '7(?:509|7(?:00|97)|829|937)\\d{6}', '\\d{10}', None, None, None], [None, None, '80(?:07(?:35|81)|8901)\\d{4}', '\\d{10}', None, None, None], [None, None, '(?:871206|90(?:066[59]|1810|71(?:07|55)))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:4(?:4(?:4(?:05|42|69)|703)|5(?:041|800))|70002)\\d{4}', '\\d{10}', None, None, None], [None, None, '701511\\d{4}', '\\d{10}', None, None, None], [None, None, '56\\d{8}', '\\d{10}', None, None, None], 'JE', 44, '00', '0', ' x', None, '0', None, None, None, None, None, [None, None, '76(?:0[012]|2[356]|4[0134]|5[49]|6[0-369]|77|81|9[39])\\d{6}', '\\d{10}', None, None, None], None, None],
+'JM': [None, [None, None, '[89]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '876(?:(?:5[0-26]|6\\d|7[1-6]|9[2-8])\\d{5}|(?:7(?:0[2-689]|8[056]|9[45])|9(?:0[1-8]|1[02378]|9[2-468]))\\d{4})', '\\d{7,10}', None, None, None], [None, None, '876(?:(?:21|[348]\\d|5[78]|77)\\d|7(?:0[07]|8[1-47-9]|9[0-36-9])|9(?:[01]9|9[0579]))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'JM', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '876'],
+'JO': [None, [None, None, '[235-9]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '[2356][2-8]\\d{6}', '\\d{7,8}', None, None, None], [None, None, '7(?:[1-8]\\d|9[02-9])\\d{6}', '\\d{9}', None, None, None], [None, None, '80\\d{6}', '\\d{8}', None, None, None], [None, None, '900\\d{5}', '\\d{8}', None, None, None], [None, None, '8(?:10\\d|5\\d{2}|7(?:[02]0|7[08]|9[09]))\\d{4}', '\\d{8}', None, None, None], [None, None, '70\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'JO', 962, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['[2356]'], '0\\$1', ''], [None, '(7)(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4 $5', ['7[457-9]'], '0\\$1', ''], [None, '(\\d{3})(\\d{5,6})', '$1 $2', ['70|[89]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'JP': [None, [None, None, '\\d{9,10}', '\\d{9,10}', None, None, None], [None, None, '(?:1(?:2[3-6]|3[3-9]|4[2-6]|[58][2-8]|6[2-7]|7[2-9]|9[1-578])|2[2-9]\\d|[36][1-9]\\d|4(?:6[0235-8]|[2-578]\\d|9[2-59])|5(?:6[1-9]|7[2-8]|[2-589]\\d)|7(?:3[4-9]|4[02-9]|[25-9]\\d)|8(?:3[2-9]|4[5-9]|5[1-9]|8[03-9]|[2679]\\d)|9(?:[679][1-9]|[2-58]\\d))\\d{6}', '\\d{9}', None, None, None], [None, None, '[7-9]0\\d{8}', '\\d{10}', None, None, None], [None, None, '120\\d{6}', '\\d{9}', None, None, None], [None, None, '990\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '60\\d{7}', '\\d{9}', None, None, None], [None, None, '50\\d{8}', '\\d{10}', None, None, None], 'JP', 81, '010', '0', None, None, '0', None, None, None, [[None, '(\\d{3})(\\d{3})(\\d{3})', '$1-$2-$3', ['(?:12|99)0'], '0\\$1', ''], [None, '(\\d{2})(\\d{4})(\\d{4})', '$1-$2-$3', ['[57-9]0'], '0\\$1', ''], [None, '(\\d{4})(\\d)(\\d{4})', '$1-$2-$3', ['1(?:26|3[79]|4[56]|5[4-68]|6[3-5])|5(?:76|97)|499|746|8(?:3[89]|63|47|51)|9(?:49|80|9[16])', '1(?:267|3(?:7[247]|9[278])|4(?:5[67]|66)|5(?:47|58|64|8[67])|6(?:3[245]|48|5[4-68]))|5(?:76|97)9|499[2468]|7468|8(?:3(?:8[78]|96)|636|477|51[24])|9(?:496|802|9(?:1[23]|69))', '1(?:267|3(?:7[247]|9[278])|4(?:5[67]|66)|5(?:47|58|64|8[67])|6(?:3[245]|48|5[4-68]))|5(?:769|979[2-69])|499[2468]|7468|8(?:3(?:8[78]|96[2457-9])|636[2-57-9]|477|51[24])|9(?:496|802|9(?:1[23]|69))'], '0\\$1', ''], [None, '(\\d{3})(\\d{2})(\\d{4})', '$1-$2-$3', ['1(?:2[3-6]|3[3-9]|4[2-6]|5[2-8]|[68][2-7]|7[2-689]|9[1-578])|2(?:2[034-9]|3[3-58]|4[0-468]|5[04-8]|6[013-8]|7[06-9]|8[02-57-9]|9[13])|4(?:2[28]|3[689]|6[035-7]|7[05689]|80|9[3-5])|5(?:3[1-36-9]|4[4578]|5[013-8]|6[1-9]|7[2-8]|8[14-7]|9[4-9])|7(?:2[15]|3[5-9]|4[02-9]|6[135-8]|7[0-4689]|9[014-9])|8(?:2[49]|3[3-8]|4[5-8]|5[2-9]|6[35-9]|7[579]|8[03-579]|9[2-8])|9(?:[23]0|4[02-46-9]|5[0245-79]|6[4-9]|7[2-47-9]|8[02-7]|9[3-7])', '1(?:2[3-6]|3[3-9]|4[2-6]|5(?:[236-8]|[45][2-69])|[68][2-7]|7[2-689]|9[1-578])|2(?:2(?:[04-9]|3[23])|3[3-58]|4[0-468]|5(?:5[78]|7[2-4]|[0468][2-9])|6(?:[0135-8]|4[2-5])|7(?:[0679]|8[2-7])|8(?:[024578]|3[25-9]|9[6-9])|9(?:11|3[2-4]))|4(?:2(?:2[2-9]|8[237-9])|3[689]|6[035-7]|7(?:[059][2-8]|[68])|80|9[3-5])|5(?:3[1-36-9]|4[4578]|5[013-8]|6[1-9]|7[2-8]|8[14-7]|9(?:[89][2-8]|[4-7]))|7(?:2[15]|3[5-9]|4[02-9]|6[135-8]|7[0-4689]|9(?:[017-9]|4[6-8]|5[2-478]|6[2-589]))|8(?:2(?:4[4-8]|9[2-8])|3(?:7[2-56]|[3-6][2-9]|8[2-5])|4[5-8]|5[2-9]|6(?:[37]|5[4-7]|6[2-9]|8[2-8]|9[236-9])|7[579]|8[03-579]|9[2-8])|9(?:[23]0|4[02-46-9]|5[0245-79]|6[4-9]|7[2-47-9]|8[02-7]|9(?:3[34]|[4-7]))', '1(?:2[3-6]|3[3-9]|4[2-6]|5(?:[236-8]|[45][2-69])|[68][2-7]|7[2-689]|9[1-578])|2(?:2(?:[04-9]|3[23])|3[3-58]|4[0-468]|5(?:5[78]|7[2-4]|[0468][2-9])|6(?:[0135-8]|4[2-5])|7(?:[0679]|8[2-7])|8(?:[024578]|3[25-9]|9[6-9])|9(?:11|3[2-4]))|4(?:2(?:2[2-9]|8[237-9])|3[689]|6[035-7]|7(?:[059][2-8]|[68])|80|9[3-5])|5(?:3[1-36-9]|4[4578]|5[013-8]|6[1-9]|7[2-8]|8[14-7]|9(?:[89][2-8]|[4-7]))|7(?:2[15]|3[5-9]|4[02-9]|6[135-8]|7[0-4689]|9(?:[017-9]|4[6-8]|5[2-478]|6[2-589]))|8(?:2(?:4[4-8]|9(?:[3578]|20|4[04-9]|6[56]))|3(?:7(?:[2-5]|6[0-59])|[3-6][2-9]|8[2-5])|4[5-8]|5[2-9]|6(?:[37]|5(?:[467]|5[014-9])|6(?:[2-8]|9[02-69])|8[2-8]|9(?:[236-8]|9[23]))|7[579]|8[03-579]|9[2-8])|9(?:[23]0|4[02-46-9]|5[0245-79]|6[4-9]|7[2-47-9]|8[02-7]|9(?:3(?:3[02-9]|4[0-24689])|4[2-69]|[5-7]))', '1(?:2[3-6]|3[3-9]|4[2-6]|5(?:[236-8]|[45][2-69])|[68][2-7]|7[2-689]|9[1-578])|2(?:2(?:[04-9]|3[23])|3[3-58]|4[0-468]|5(?:5[78]|7[2-4]|[0468][2-9])|6(?:[0135-8]|4[2-5])|7(?:[0679]|8[2-7])|8(?:[024578]|3[25-9]|9[6-9])|9(?:11|3[2-4]))|4(?:2(?:2[2-9]|8[237-9])|3[689]|6[035-7]|7(?:[059][2-8]|[68])|80|9[3-5])|5(?:3[1-36-9]|4[4578]|5[013-8]|6[1-9]|7[2-8]|8[14-7]|9(?:[89][2-8]|[4-7]))|7(?:2[15]|3[5-9]|4[02-9]|6[135-8]|7[0-4689]|9(?:[017-9]|4[6-8]|5[2-478]|6[2-589]))|8(?:2(?:4[4-8]|9(?:[3578]|20|4[04-9]|6(?:5[25]|60)))|3(?:7(?:[2-5]|6[0-59])|[3-6][2-9]|8[2-5])|4[5-8]|5[2-9]|6(?:[37]|5(?:[467]|5[014-9])|6(?:[2-8]|9[02-69])|8[2-8]|9(?:[236-8]|9[23]))|7[579]|8[03-579]|9[2-8])|9(?:[23]0|4[02-46-9]|5[0245-79]|6[4-9]|7[2-47-9]|8[02-7]|9(?:3(?:3[02-9]|4[0-24689])|4[2-69]|[5-7]))'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{4})', '$1-$2-$3', ['1|2(?:23|5[5-89]|64|78|8[39]|91)|4(?:2[2689]|64|7[347])|5(?:[2-589]|39)|8(?:[46-9]|3[279]|2[124589])|9(?:[235-8]|93)', '1|2(?:23|5(?:[57]|[68]0|9[19])|64|78|8[39]|917)|4(?:2(?:[68]|20|9[178])|64|7[347])|5(?:[2-589]|39[67])|8(?:[46-9]|3[279]|2[124589])|9(?:[235-8]|93[34])', '1|2(?:23|5(?:[57]|[68]0|9(?:17|99))|64|78|8[39]|917)|4(?:2(?:[68]|20|9[178])|64|7[347])|5(?:[2-589]|39[67])|8(?:[46-9]|3[279]|2[124589])|9(?:[235-8]|93(?:31|4))'], '0\\$1', ''], [None, '(\\d{3})(\\d{2})(\\d{4})', '$1-$2-$3', ['2(?:9[14-79]|74|[34]7|[56]9)|82|993'], '0\\$1', ''], [None, '(\\d)(\\d{4})(\\d{4})', '$1-$2-$3', ['[36]|4(?:2[09]|7[01])'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{4})', '$1-$2-$3', ['[2479]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KE': [None, [None, None, '\\d{6,10}', '\\d{4,10}', None, None, None], [None, None, '(?:20|4[0-6]|5\\d|6[0-24-9])\\d{4,7}', '\\d{4,9}', None, None, None], [None, None, '7(?:1[0-6]|2\\d|3[2-8]|5[0-2]|7[023])\\d{6}', '\\d{9}', None, None, None], [None, None, '8(?:00|88)\\d{6,7}', '\\d{9,10}', None, None, None], [None, None, '9(?:00|1)\\d{6,7}', '\\d{8,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KE', 254, '000', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{4,7})', '$1 $2', ['[2-6]|91'], '0\\$1', ''], [None, '(\\d{3})(\\d{6,7})', '$1 $2', ['[78]|90'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KG': [None, [None, None, '[356-8]\\d{8}', '\\d{5,9}', None, None, None], [None, None, '(?:3(?:1(?:2\\d|3[1-9]|52|6[1-8])|2(?:22|3[0-479]|6[0-7])|4(?:22|5[6-9]|6[0-4])|5(?:22|3[4-7]|59|6[0-5])|6(?:22|5[35-7]|6[0-3])|7(?:22|3[468]|4[1-8]|59|6\\d|7[5-7])|9(?:22|4[1-7]|6[0-8]))|6(?:09|12|2[2-4])\\d)\\d{5}', '\\d{5,9}', None, None, None], [None, None, '5[124-7]\\d{7}|7(?:0[05]|7\\d)\\d{6}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KG', 996, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{3})(\\d{3})(\\d{3})', '$1 $2 $3', ['31[25]|[5-8]'], '0\\$1', ''], [None, '(\\d{4})(\\d{5})', '$1 $2', ['3(?:1[36]|[2-9])'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KH': [None, [None, None, '[1-9]\\d{7,9}', '\\d{6,10}', None, None, None], [None, None, '(?:2[3-6]|3[2-6]|4[2-4]|[5-7][2-5])[2-47-9]\\d{5}', '\\d{6,8}', None, None, None], [None, None, '(?:(?:1[0-35-9]|9[1-49])[1-9]|85[2-689])\\d{5}', '\\d{8}', None, None, None], [None, None, '1800(?:1\\d|2[09])\\d{4}', '\\d{10}', None, None, None], [None, None, '1900(?:1\\d|2[09])\\d{4}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KH', 855, '00[178]', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['1\\d[1-9]|[2-9]'], '', ''], [None, '(1[89]00)(\\d{3})(\\d{3})', '$1 $2 $3', ['1[89]0'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KI': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KI', 686, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KM': [None, [None, None, '[37]\\d{6}', '\\d{7}', None, None, None], [None, None, '7(?:6[0-37-9]|7[0-57-9])\\d{4}', '\\d{7}', None, None, None], [None, None, '3[23]\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KM', 269, '00', None, None, None, None, None, None, None, [[None, '(\\d)(\\d{3})(\\d{3})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KN': [None, [None, None, '[89]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '869(?:2(?:29|36)|4(?:6[5-9]|70))\\d{4}', '\\d{7,10}', None, None, None], [None, None, '869(?:5(?:5[6-8]|6[5-7])|66[2-9]|76[2-5])\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KN', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '869'],
+'KP': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KP', 850, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KR': [None, [None, None, '[1-79]\\d{3,9}|8\\d{8}', '\\d{4,10}', None, None, None], [None, None, '1(?:5(?:44|66|77|88|99)|6(?:00|44|6[16]|70|88))\\d{4}|(?:2|[34][1-3]|5[1-5]|6[1-4])(?:1\\d{2,3}|[2-9]\\d{6,7})', '\\d{4,10}', None, None, None], [None, None, '1[0-25-9]\\d{7,8}', '\\d{9,10}', None, None, None], [None, None, '80\\d{7}', '\\d{9}', None, None, None], [None, None, '60[2-9]\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '50\\d{8}', '\\d{10}', None, None, None], [None, None, '70\\d{8}', '\\d{10}', None, None, None], 'KR', 82, '00(?:[124-68]|[37]\\d{2})', '0', None, None, '0(?:8[1-46-8]|85\\d{2})?', None, None, None, [[None, '(\\d{2})(\\d{4})(\\d{4})', '$1-$2-$3', ['1(?:0|1[19]|[69]9|5[458])|[57]0', '1(?:0|1[19]|[69]9|5(?:44|59|8))|[57]0'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{4})', '$1-$2-$3', ['1(?:[169][2-8]|[78]|5[1-4])|[68]0|[3-9][1-9][2-9]', '1(?:[169][2-8]|[78]|5(?:[1-3]|4[56]))|[68]0|[3-9][1-9][2-9]'], '0\\$1', ''], [None, '(\\d{3})(\\d)(\\d{4})', '$1-$2-$3', ['131', '1312'], '0\\$1', ''], [None, '(\\d{3})(\\d{2})(\\d{4})', '$1-$2-$3', ['131', '131[13-9]'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1-$2-$3', ['13[2-9]'], '0\\$1', ''], [None, '(\\d{2})(\\d{2})(\\d{3})(\\d{4})', '$1-$2-$3-$4', ['30'], '0\\$1', ''], [None, '(\\d)(\\d{4})(\\d{4})', '$1-$2-$3', ['2(?:[26]|3[0-467])', '2(?:[26]|3(?:01|1[45]|2[17-9]|39|4|6[67]|7[078]))'], '0\\$1', ''], [None, '(\\d)(\\d{3})(\\d{4})', '$1-$2-$3', ['2(?:3[0-35-9]|[457-9])', '2(?:3(?:0[02-9]|1[0-36-9]|2[02-6]|3[0-8]|6[0-589]|7[1-69]|[589])|[457-9])'], '0\\$1', ''], [None, '(\\d)(\\d{3,4})', '$1-$2', ['21[0-46-9]'], '0\\$1', ''], [None, '(\\d{2})(\\d{3,4})', '$1-$2', ['[3-9][1-9]1', '[3-9][1-9]1(?:[0-46-9])'], '0\\$1', ''], [None, '(\\d{4})(\\d{4})', '$1-$2', ['1(?:5[46-9]|6[04678])', '1(?:5(?:44|66|77|88|99)|6(?:00|44|6[16]|70|88))'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KW': [None, [None, None, '[12569]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '(?:18\\d|2(?:[23]\\d{2}|4[1-35-9]\\d|5(?:0[034]|[2-46]\\d|5[1-3]|7[1-7])))\\d{4}', '\\d{7,8}', None, None, None], [None, None, '(?:5[05]|6[05-7]|9[0479])\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KW', 965, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{4})(\\d{3,4})', '$1 $2', ['[1269]'], '0\\$1', ''], [None, '(5[05]\\d)(\\d{5})', '$1 $2', ['5'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'KY': [None, [None, None, '[389]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '345(?:2(?:22|44)|444|6(?:23|38|40)|7(?:6[6-9]|77)|8(?:00|1[45]|25|4[89]|88)|9(?:14|4[035-9]))\\d{4}', '\\d{7,10}', None, None, None], [None, None, '345(?:32[3-79]|5(?:1[467]|2[5-7]|4[5-9])|9(?:1[679]|2[4-9]|3[89]))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}|345976\\d{4}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KY', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '345'],
+'KZ': [None, [None, None, '(?:[67]\\d{2}|80[09])\\d{7}', '\\d{10}', None, None, None], [None, None, '7(?:1(?:0(?:[23]\\d|4[023]|59|63)|1(?:[23]\\d|4[0-79]|59)|2(?:[23]\\d|59)|3(?:2\\d|3[1-7]|4[1235-9]|59)|4(?:2\\d|3[013-79]|4[0-58]|5[1-79])|5(?:2\\d|3[1-8]|4[1-7]|59)|6(?:22|[34]\\d|5[19])|72\\d|8(?:[27]\\d|3[1-46-9]|4[0-4]|))|2(?:1(?:[23]\\d|4[46-9]|5[3469])|2(?:2\\d|3[0679]|46|5[12679]|)|3(?:[234]\\d|5[139]|)|4(?:22|3[1235-8])|5(?:[23]\\d|4[0124-8]|59)|6(?:22|3[1-9]|4[0-4]|59)|7(?:[23]\\d|40|5[279]|7\\d)|8(?:[23]\\d|4[0-3]|59)|9(?:2\\d|3[12478]|59))|3622)\\d{5}', '\\d{10}', None, None, None], [None, None, '7(?:0[01257]\\d{2}|1[2-578]9[01]|2(?:[13-6]9[01]|7(?:58|9[01]))|6[02-4]\\d{2}|7[157]\\d{2})\\d{5}|6\\d{9}', '\\d{10}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '809\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'KZ', 7, '8~10', '8', None, None, '8', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LA': [None, [None, None, '[2-57]\\d{7,9}', '\\d{6,10}', None, None, None], [None, None, '(?:[2-57]1|54)\\d{6}', '\\d{6,8}', None, None, None], [None, None, '20(?:[23]|5[4-6]|77|9[89])\\d{6}', '\\d{9,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LA', 856, '00', '0', None, None, '0', None, None, None, [[None, '(20)([23])(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['20[23]'], '0\\$1', ''], [None, '(20)([579]\\d)(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['20[579]'], '0\\$1', ''], [None, '([2-57]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['21|[3-57]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LB': [None, [None, None, '[13-9]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '(?:[14-6]\\d{2}|7(?:[2-57-9]\\d|62)|[89][2-9]\\d)\\d{4}', '\\d{7}', None, None, None], [None, None, '(?:3\\d|7(?:[01]\\d|66))\\d{5}', '\\d{7,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '8[01]\\d{6}', '\\d{8}', None, None, None], [None, None, '9[01]\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LB', 961, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[13-6]|7(?:[2-57-9]|62)|[89][2-9]'], '0\\$1', ''], [None, '([7-9]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[89][01]|7(?:[01]|66)'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LC': [None, [None, None, '[789]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '758(?:234|4(?:5[0-9]|6[2-9]|8[0-2])|638|758)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '758(?:28[4-7]|384|4(?:6[01]|8[4-9])|5(?:1[89]|20|84)|7(?:1[2-9]|2[0-4]))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LC', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '758'],
+'LI': [None, [None, None, '(?:66|80|90)\\d{7}|[237-9]\\d{6}', '\\d{7,9}', None, None, None], [None, None, '(?:2(?:17|3\\d|6[02-58]|96)|3(?:02|7[01357]|8[048]|9[0269])|870)\\d{4}', '\\d{7}', None, None, None], [None, None, '66(?:[0178][0-4]|2[025-9]|[36]\\d|4[129]|5[45]|9[019])\\d{5}|7(?:4[2-59]|56|[6-9]\\d)\\d{4}', '\\d{7,9}', None, None, None], [None, None, '80(?:0(?:07|2[238]|79|\\d{4})|9\\d{2})\\d{2}', '\\d{7,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '90(?:0(?:2[278]|79|\\d{4})|1(?:23|\\d{4})|6(?:66|\\d{4}))\\d{2}', '\\d{7,9}', None, None, None], [None, None, '701\\d{4}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LI', 423, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3', ['[23]|7[4-9]|87'], '', ''], [None, '(6\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['6'], '', ''], [None, '([7-9]0\\d)(\\d{2})(\\d{2})', '$1 $2 $3', ['[7-9]0'], '', ''], [None, '([89]0\\d)(\\d{2})(\\d{2})(\\d{2})', '0$1 $2 $3 $4', ['[89]0'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LK': [None, [None, None, '[1-9]\\d{8}', '\\d{7,9}', None, None, None], [None, None, '(?:[189]1|2[13-7]|3[1-8]|4[157]|5[12457]|6[35-7])[2-57]\\d{6}', '\\d{7,9}', None, None, None], [None, None, '7[12578]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LK', 94, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{1})(\\d{6})', '$1 $2 $3', ['[1-689]'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['7'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LR': [None, [None, None, '(?:[279]\\d|[4-6])\\d{6}', '\\d{7,8}', None, None, None], [None, None, '2\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:4[67]|5\\d|6[4-8]|7\\d{2})\\d{5}', '\\d{7,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '90\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LR', 231, '00', '0', None, None, '0', None, None, None, [[None, '([279]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[279]'], '0\\$1', ''], [None, '([4-6])(\\d{3})(\\d{3})', '$1 $2 $3', ['[4-6]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LS': [None, [None, None, '[2568]\\d{7}', '\\d{8}', None, None, None], [None, None, '2\\d{7}', '\\d{8}', None, None, None], [None, None, '[56]\\d{7}', '\\d{8}', None, None, None], [None, None, '800[256]\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LS', 266, '00', None, None, None, None, None, None, None, [[None, '(\\d{4})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LT': [None, [None, None, '[3-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:3[1478]|4[124-6]|52)\\d{6}', '\\d{8}', None, None, None], [None, None, '6\\d{7}', '\\d{8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '90[0239]\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LT', 370, '00', '8', None, None, '8', None, None, None, [[None, '([34]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['37|4(?:1|5[45]|6[2-4])'], '8 \\$1', ''], [None, '([3-689]\\d{2})(\\d{2})(\\d{3})', '$1 $2 $3', ['3[148]|4(?:[24]|6[09])|5(?:[0189]|28)|[689]'], '8 \\$1', ''], [None, '(5)(2[0-79]\\d)(\\d{4})', '$1 $2 $3', ['52[0-79]'], '8 \\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LU': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LU', 352, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LV': [None, [None, None, '[2689]\\d{7}', '\\d{8}', None, None, None], [None, None, '6\\d{7}', '\\d{8}', None, None, None], [None, None, '2\\d{7}', '\\d{8}', None, None, None], [None, None, '80\\d{6}', '\\d{8}', None, None, None], [None, None, '90\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LV', 371, '00', None, None, None, None, None, None, None, [[None, '([2689]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'LY': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'LY', 218, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MA': [None, [None, None, '[5689]\\d{8}', '\\d{9}', None, None, None], [None, None, '5(?:2(?:(?:[015-7]\\d|2[2-9]|3[2-57]|4[2-8]|8[235-9]|)\\d|9(?:0\\d|[89]0))|3(?:(?:[0-4]\\d|[57][2-9]|6[235-8]|9[3-9])\\d|8(?:0\\d|[89]0)))\\d{4}', '\\d{9}', None, None, None], [None, None, '6(?:0[06]|[14-7]\\d|2[236]|33|99)\\d{6}', '\\d{9}', None, None, None], [None, None, '80\\d{7}', '\\d{9}', None, None, None], [None, None, '89\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MA', 212, '00', '0', None, None, '0', None, None, None, [[None, '([56]\\d{2})(\\d{6})', '$1-$2', ['5(?:2[015-7]|3[0-4])|6'], '0\\$1', ''], [None, '([58]\\d{3})(\\d{5})', '$1-$2', ['5(?:2[2-489]|3[5-9])|892', '5(?:2(?:[2-48]|90)|3(?:[5-79]|80))|892'], '0\\$1', ''], [None, '(5\\d{4})(\\d{4})', '$1-$2', ['5(?:29|38)', '5(?:29|38)[89]'], '0\\$1', ''], [None, '(8[09])(\\d{7})', '$1-$2', ['8(?:0|9[013-9])'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MC': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MC', 377, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MD': [None, [None, None, '[256-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:2(?:1[0569]|2\\d|3[015-7]|4[1-46-9]|5[0-24689]|6[2-589]|7[1-37]|9[1347-9])|5(?:33|5[257]))\\d{5}', '\\d{5,8}', None, None, None], [None, None, '(?:6(?:50|7[12]|[89]\\d)|7(?:80|9\\d))\\d{5}', '\\d{8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '900\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MD', 373, '00', '0', None, None, '0', None, None, None, [[None, '(22)(\\d{3})(\\d{3})', '$1 $2 $3', ['22'], '0\\$1', ''], [None, '([25-7]\\d{2})(\\d{2})(\\d{3})', '$1 $2 $3', ['2[13-79]|[5-7]'], '0\\$1', ''], [None, '([89]00)(\\d{5})', '$1 $2', ['[89]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ME': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ME', 382, '99', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MG': [None, [None, None, '[23]\\d{8}', '\\d{7,9}', None, None, None], [None, None, '2(?:0(?:(?:2\\d|4[47]|5[3467]|6[279]|8[268]|9[245])\\d|7(?:2[29]|[35]\\d))|210\\d)\\d{4}', '\\d{7,9}', None, None, None], [None, None, '3[02-4]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MG', 261, '00', '0', None, None, '0', None, None, None, [[None, '([23]\\d)(\\d{2})(\\d{3})(\\d{2})', '$1 $2 $3 $4', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MF': [None, [None, None, '[56]\\d{8}', '\\d{9}', None, None, None], [None, None, '590(?:10|2[79]|5[128]|[78]7)\\d{4}', '\\d{9}', None, None, None], [None, None, '690(?:10|2[27]|66|77|8[78])\\d{4}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MF', 590, '00', '0', None, None, '0', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MH': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MH', 692, '011', '1', None, None, '1', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MK': [None, [None, None, '[2-578]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:2(?:[23]\\d|5[125]|61)|3(?:1[3-6]|2[2-6]|3[2-5]|4[235])|4(?:[23][2-6]|4[3-6]|5[25]|6[25-8]|7[24-6]|8[4-6]))\\d{5}', '\\d{6,8}', None, None, None], [None, None, '7[0-25-8]\\d{6}', '\\d{8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '5[02-9]\\d{6}', '\\d{8}', None, None, None], [None, None, '8(?:0[1-9]|[1-9]\\d)\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MK', 389, '00', '0', None, None, '0', None, None, None, [[None, '(2)(\\d{3})(\\d{4})', '$1 $2 $3', ['2'], '0\\$1', ''], [None, '([347]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[347]'], '0\\$1', ''], [None, '([58]\\d{2})(\\d)(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[58]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ML': [None, [None, None, '[246-8]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:2(?:0(?:2[0-589]|7[027-9])|1(?:2[5-7]|[3-689]\\d))|442\\d)\\d{4}', '\\d{8}', None, None, None], [None, None, '(?:6(?:[569]\\d)|7(?:[08][1-9]|[3579][0-4]|4[014-7]|6\\d))\\d{5}', '\\d{8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ML', 223, '00', '0', None, None, '0', None, None, None, [[None, '([246-8]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MM': [None, [None, None, '[124-8]\\d{5,7}|9\\d{7,8}', '\\d{5,9}', None, None, None], [None, None, '(?:1\\d|2|4[2-6]|5[2-9]|6\\d|7[0-5]|8[1-6])\\d{5}|1333\\d{4}', '\\d{5,8}', None, None, None], [None, None, '9(?:[25689]\\d|444)\\d{5}', '\\d{8,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MM', 95, '00', None, None, None, None, None, None, None, [[None, '(1)(\\d{3})(\\d{3})', '$1 $2 $3', ['1'], '', ''], [None, '(1)(3)(33\\d)(\\d{3})', '$1 $2 $3 $4', ['133', '1333'], '', ''], [None, '(2)(\\d{2})(\\d{3})', '$1 $2 $3', ['2'], '', ''], [None, '(\\d{2})(\\d{2})(\\d{3})', '$1 $2 $3', ['[4-8]'], '', ''], [None, '(9444)(\\d{5})', '$1 $2', ['94'], '', ''], [None, '(9)([25689]\\d{2})(\\d{4})', '$1 $2 $3', ['9[25689]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MN': [None, [None, None, '[12]\\d{7,9}|[57-9]\\d{7}', '\\d{8,10}', None, None, None], [None, None, '[12](?:1\\d|2(?:[1-3]\\d?|7\\d)|3[2-8]\\d{1,2}|4[2-68]\\d{1,2}|5[1-4689]\\d{1,2})\\d{5}|(?:5[0568]|70)\\d{6}', '\\d{8,10}', None, None, None], [None, None, '(?:8[89]|9[15689])\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '7[569]\\d{6}', '\\d{8}', None, None, None], 'MN', 976, '001', '0', None, None, '0', None, None, None, [[None, '([12]\\d)(\\d{2})(\\d{4})', '$1 $2 $3', ['[12]1'], '0\\$1', ''], [None, '([12]2\\d)(\\d{5,6})', '$1 $2', ['[12]2[1-3]'], '0\\$1', ''], [None, '([12]\\d{3})(\\d{5})', '$1 $2', ['[12](?:27|[3-5])', '[12](?:27|[3-5]\\d)2'], '0\\$1', ''], [None, '(\\d{4})(\\d{4})', '$1 $2', ['[57-9]'], '0\\$1', ''], [None, '([12]\\d{4})(\\d{4,5})', '$1 $2', ['[12](?:27|[3-5])', '[12](?:27|[3-5]\\d)[4-9]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MO': [None, [None, None, '[268]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:28[2-57-9]|8[2-57-9]\\d)\\d{5}', '\\d{8}', None, None, None], [None, None, '6[26]\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MO', 853, '00', None, None, None, None, None, None, None, [[None, '([268]\\d{3})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MP': [None, [None, None, '[689]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '670(?:2(?:3[3-5]|88|56)|32[23]|4[38]3|532|6(?:64|70|8\\d))\\d{4}', '\\d{7,10}', None, None, None], [None, None, '670(?:2(?:3[3-5]|88|56)|32[23]|4[38]3|532|6(?:64|70|8\\d))\\d{4}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MP', 1, '011', '1', None, None, '1', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, '670'],
+'MQ': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MQ', 596, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MR': [None, [None, None, '[2-4]\\d{6,7}|[5-7]\\d{6}|8\\d{7}', '\\d{7,8}', None, None, None], [None, None, '5(?:1[035]|2[0-69]|3[0348]|4[468]|5[02-467]|6[39]|7[4-69])\\d{4}|[2-4]5\\d{6}', '\\d{7,8}', None, None, None], [None, None, '(?:[23][0-4]|4[3-5]|6\\d|7[0-7])\\d{5}|(?:2[27]|3[367]|4[467])\\d{6}', '\\d{7,8}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MR', 222, '00', None, None, None, None, None, None, None, [[None, '([2-48]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[2-48]'], '', ''], [None, '([2-7]\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3', ['[2-7]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MS': [None, [None, None, '[689]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '664491\\d{4}', '\\d{7,10}', None, None, None], [None, None, '664492\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MS', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '664'],
+'MT': [None, [None, None, '[2579]\\d{7}', '\\d{8}', None, None, None], [None, None, '2(?:0(?:1[0-6]|[69]\\d)|[1-357]\\d{2})\\d{4}', '\\d{8}', None, None, None], [None, None, '(?:7(?:210|[79]\\d{2}|)|9(?:2[13]\\d|696|8(?:1[1-3]|89|97)|9\\d{2}))\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '50(?:0(?:3[1679]|4\\d)|[169]\\d{2}|7[06]\\d)\\d{3}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MT', 356, '00', None, None, None, None, None, None, None, [[None, '(\\d{4})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, '7117\\d{4}', '\\d{8}', None, None, None], None, None],
+'MU': [None, [None, None, '[2-9]\\d{6}', '\\d{7}', None, None, None], [None, None, '(?:2(?:[034789]\\d|1[0-8]|2[0-79])|4(?:[013-8]\\d|2[4-7])|[56]\\d{2}|8(?:14|3[129]))\\d{4}', '\\d{7}', None, None, None], [None, None, '(?:25\\d|4(?:2[12389]|9\\d)|7\\d{2}|87[15-7]|9[1-8]\\d)\\d{4}', '\\d{7}', None, None, None], [None, None, '80[012]\\d{4}', '\\d{7}', None, None, None], [None, None, '30\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MU', 230, '020', None, None, None, None, None, None, None, [[None, '([2-9]\\d{2})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MV': [None, [None, None, '[3679]\\d{6}', '\\d{7}', None, None, None], [None, None, '(?:3(?:00|3[0-59]|)|6(?:[567][02468]|8[024689]))\\d{4}', '\\d{7}', None, None, None], [None, None, '(?:7(?:[679]\\d|8[02-9])|9[6-9]\\d)\\d{4}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MV', 960, '0(?:0|19)', None, None, None, None, None, '00', None, [[None, '(\\d{3})(\\d{4})', '$1-$2', None, '', '']], None, [None, None, '781\\d{4}', '\\d{7}', None, None, None], None, None],
+'MW': [None, [None, None, '(?:[13-5]|[27]\\d{2}|[89](?:\\d{2})?)\\d{6}', '\\d{7,9}', None, None, None], [None, None, '(?:1[2-9]|21\\d{2})\\d{5}', '\\d{7,9}', None, None, None], [None, None, '(?:[3-5]|77|8(?:8\\d)?|9(?:9\\d)?)\\d{6}', '\\d{7,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MW', 265, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[13-5]'], '0\\$1', ''], [None, '(2\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['2'], '0\\$1', ''], [None, '(\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['7'], '0\\$1', ''], [None, '(\\d)(\\d{3,4})(\\d{3,4})', '$1 $2 $3', ['[89]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MX': [None, [None, None, '[1-9]\\d{9,10}', '\\d{7,11}', None, None, None], [None, None, '(?:33|55|81)\\d{8}|(?:2(?:2[2-9]|3[1-35-8]|4[13-9]|7[1-689]|8[1-58]|9[467])|3(?:1[1-79]|[2458][1-9]|7[1-8]|9[1-5])|4(?:1[1-57-9]|[24-6][1-9]|[37][1-8]|8[1-35-9]|9[2-689])|5(?:88|9[1-79])|6(?:1[2-68]|[234][1-9]|5[1-3689]|6[12457-9]|7[1-7]|8[67]|9[4-8])|7(?:[13467][1-9]|2[1-8]|5[13-9]|8[1-69]|9[17])|8(?:2[13-689]|3[1-6]|4[124-6]|6[1246-9]|7[1-378]|9[12479])|9(?:1[346-9]|2[1-4]|3[2-46-8]|5[1348]|[69][1-9]|7[12]|8[1-8]))\\d{7}', '\\d{7,10}', None, None, None], [None, None, '1(?:(?:33|55|81)\\d{8}|(?:2(?:2[2-9]|3[1-35-8]|4[13-9]|7[1-689]|8[1-58]|9[467])|3(?:1[1-79]|[2458][1-9]|7[1-8]|9[1-5])|4(?:1[1-57-9]|[24-6][1-9]|[37][1-8]|8[1-35-9]|9[2-689])|5(?:88|9[1-79])|6(?:1[2-68]|[2-4][1-9]|5[1-3689]|6[12457-9]|7[1-7]|8[67]|9[4-8])|7(?:[13467][1-9]|2[1-8]|5[13-9]|8[1-69]|9[17])|8(?:2[13-689]|3[1-6]|4[124-6]|6[1246-9]|7[1-378]|9[12479])|9(?:1[346-9]|2[1-4]|3[2-46-8]|5[1348]|[69][1-9]|7[12]|8[1-8]))\\d{7})', '\\d{11}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '900\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MX', 52, '0[09]', '01', None, None, '0[12]|04[45](\\d{10})', '1$1', None, None, [[None, '([358]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['33|55|81'], '01 \\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['[2467]|3[12457-9]|5[89]|8[02-9]|9[0-35-9]'], '01 \\$1', ''], [None, '1([358]\\d)(\\d{4})(\\d{4})', '045 $1 $2 $3', ['1(?:33|55|81)'], '01 \\$1', ''], [None, '1(\\d{3})(\\d{3})(\\d{4})', '045 $1 $2 $3', ['1(?:[2467]|3[12457-9]|5[89]|8[2-9]|9[1-35-9])'], '01 \\$1', '']], [[None, '([358]\\d)(\\d{4})(\\d{4})', '$1 $2 $3', ['33|55|81'], None, ''], [None, '(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3', ['[2467]|3[12457-9]|5[89]|8[02-9]|9[0-35-9]'], None, ''], [None, '(1)([358]\\d)(\\d{4})(\\d{4})', '$1 $2 $3 $4', ['1(?:33|55|81)'], None, ''], [None, '(1)(\\d{3})(\\d{3})(\\d{4})', '$1 $2 $3 $4', ['1(?:[2467]|3[12457-9]|5[89]|8[2-9]|9[1-35-9])'], None, '']], [None, None, 'NA', 'NA', None, None, None], None, None],
+'MY': [None, [None, None, '[13-9]\\d{7,9}', '\\d{6,10}', None, None, None], [None, None, '(?:3\\d{2}|[4-79]\\d|8[2-9])\\d{6}', '\\d{6,9}', None, None, None], [None, None, '1[0-46-9]\\d{7}', '\\d{9}', None, None, None], [None, None, '1[38]00\\d{6}', '\\d{10}', None, None, None], [None, None, '1600\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '1700\\d{6}', '\\d{10}', None, None, None], [None, None, '154\\d{7}', '\\d{10}', None, None, None], 'MY', 60, '00', '0', None, None, '0', None, None, None, [[None, '([4-79])(\\d{3})(\\d{4})', '$1-$2 $3', ['[4-79]'], '', ''], [None, '(3)(\\d{4})(\\d{4})', '$1-$2 $3', ['3'], '', ''], [None, '([18]\\d)(\\d{3})(\\d{3,4})', '$1-$2 $3', ['1[0-46-9][1-9]|8'], '', ''], [None, '(1)([36-8]00)(\\d{2})(\\d{4})', '$1-$2-$3-$4', ['1[36-8]0'], '', ''], [None, '(154)(\\d{3})(\\d{4})', '$1-$2 $3', ['15'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'MZ': [None, [None, None, '[28]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '2(?:[1346]\\d|5[0-2]|[78][12]|93)\\d{5}', '\\d{8}', None, None, None], [None, None, '8[24]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'MZ', 258, '00', None, None, None, None, None, None, None, [[None, '([28]\\d)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['2|8[24]'], '', ''], [None, '(80\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['80'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NA': [None, [None, None, '[68]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '6(?:1(?:17|2(?:[0189]\\d|[23-6]|7\\d?)|3(?:2\\d|3[378])|4[01]|69|7[014])|2(?:17|25|5(?:[0-36-8]|4\\d?)|69|70)|3(?:17|2(?:[0237]\\d?|[14-689])|34|6[29]|7[01]|81)|4(?:17|2(?:[012]|7?)|4(?:[06]|1\\d)|5(?:[01357]|[25]\\d?)|69|7[01])|5(?:17|2(?:[0459]|[23678]\\d?)|69|7[01])|6(?:17|2(?:5|6\\d?)|38|42|69|7[01])|7(?:17|2(?:[569]|[234]\\d?)|3(?:0\\d?|[13])|69|7[01]))\\d{4}', '\\d{8,9}', None, None, None], [None, None, '(?:60|8[125])\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '8701\\d{5}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '886\\d{5}', '\\d{8}', None, None, None], 'NA', 264, '00', '0', None, None, '0', None, None, None, [[None, '(8\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['8[125]'], '0\\$1', ''], [None, '(6\\d)(\\d{2,3})(\\d{4})', '$1 $2 $3', ['6'], '0\\$1', ''], [None, '(88)(\\d{3})(\\d{3})', '$1 $2 $3', ['88'], '0\\$1', ''], [None, '(870)(\\d{3})(\\d{3})', '$1 $2 $3', ['870'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NC': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NC', 687, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NE': [None, [None, None, '[029]\\d{7}', '\\d{8}', None, None, None], [None, None, '2(?:0(?:20|3[1-7]|4[134]|5[14]|6[14578]|7[1-578])|1(?:4[145]|5[14]|6[14-68]|7[169]|88))\\d{4}', '\\d{8}', None, None, None], [None, None, '9[03467]\\d{6}', '\\d{8}', None, None, None], [None, None, '08\\d{6}', '\\d{8}', None, None, None], [None, None, '09\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NE', 227, '00', None, None, None, None, None, None, None, [[None, '([029]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[29]|09'], '', ''], [None, '(08)(\\d{3})(\\d{3})', '$1 $2 $3', ['08'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NF': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NF', 672, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NG': [None, [None, None, '[1-69]\\d{5,8}|[78]\\d{5,13}', '\\d{5,14}', None, None, None], [None, None, '[12]\\d{6,7}|9\\d{7}|(?:4[023568]|5[02368]|6[02-469]|7[569]|8[2-9])\\d{6}|(?:4[47]|5[14579]|6[1578]|7[0-357])\\d{5,6}|(?:78|41)\\d{5}', '\\d{5,9}', None, None, None], [None, None, '(?:70[3-9]|8(?:0[2-9]|1[23]))\\d{7}|(?:702[1-9]|819[01])\\d{6}', '\\d{10}', None, None, None], [None, None, '800\\d{7,11}', '\\d{10,14}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '700\\d{7,11}', '\\d{10,14}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NG', 234, '009', '0', None, None, '0', None, None, None, [[None, '([129])(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[129]'], '0\\$1', ''], [None, '([3-8]\\d)(\\d{3})(\\d{2,3})', '$1 $2 $3', ['[3-6]|7(?:[1-79]|0[1-9])|8[2-9]'], '0\\$1', ''], [None, '([78]\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['70[03-9]|8(?:0|1[23])'], '0\\$1', ''], [None, '([78]\\d{3})(\\d{3})(\\d{3})', '$1 $2 $3', ['702|819'], '0\\$1', ''], [None, '([78]00)(\\d{4})(\\d{4,5})', '$1 $2 $3', ['[78]00'], '0\\$1', ''], [None, '([78]00)(\\d{5})(\\d{5,6})', '$1 $2 $3', ['[78]00'], '0\\$1', ''], [None, '(78)(\\d{2})(\\d{3})', '$1 $2 $3', ['78'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NI': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NI', 505, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NL': [None, [None, None, '[1-9]\\d{6,9}', '\\d{7,10}', None, None, None], [None, None, '(?:1[0135-8]|2[02-69]|3[0-68]|4[0135-9]|[57]\\d|8[478])\\d{7}', '\\d{9}', None, None, None], [None, None, '6[1-58]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{4,7}', '\\d{7,10}', None, None, None], [None, None, '90[069]\\d{4,7}', '\\d{7,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '85\\d{7}', '\\d{9}', None, None, None], 'NL', 31, '00', '0', None, None, '0', None, None, None, [[None, '([1-578]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['1[035]|2[0346]|3[03568]|4[0356]|5[0358]|7|8[458]'], '0\\$1', ''], [None, '([1-5]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['1[16-8]|2[259]|3[124]|4[17-9]|5[124679]'], '0\\$1', ''], [None, '(6)(\\d{8})', '$1 $2', ['6'], '0\\$1', ''], [None, '([89]0\\d)(\\d{4,7})', '$1 $2', ['80|9'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NO': [None, [None, None, '0\\d{4}|[2-9]\\d{7}', '\\d{5}(?:\\d{3})?', None, None, None], [None, None, '0\\d{4}|(?:2[1-4]|3[1-3578]|5[1-35-7]|6[1-4679]|7\\d)\\d{6}|81(?:0(?:0[7-9]|1\\d)|5\\d{2})\\d{3}', '\\d{5}(?:\\d{3})?', None, None, None], [None, None, '(?:4[015-8]|9\\d)\\d{6}', '\\d{8}', None, None, None], [None, None, '80[01]\\d{5}', '\\d{8}', None, None, None], [None, None, '82[09]\\d{5}', '\\d{8}', None, None, None], [None, None, '810(?:0[0-6]|[2-8]\\d)\\d{3}', '\\d{8}', None, None, None], [None, None, '880\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NO', 47, '00', None, None, None, None, None, None, None, [[None, '([489]\\d{2})(\\d{2})(\\d{3})', '$1 $2 $3', ['[489]'], '', ''], [None, '([235-7]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[235-7]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NP': [None, [None, None, '[1-8]\\d{5,7}|98[45]\\d{7}', '\\d{6,10}', None, None, None], [None, None, '(?:1[014-6]|2[13-79]|3[135-8]|4[146-9]|5[135-7]|6[13-9]|7[15-9]|8[1-4679]|9[1-79])\\d{6}', '\\d{6,8}', None, None, None], [None, None, '98[45]\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NP', 977, '00', '0', None, None, '0', None, None, None, [[None, '(1)([4-6]\\d{3})(\\d{3})', '$1 $2 $3', ['1[4-6]'], '0\\$1', ''], [None, '(\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['1[01]|[2-8]|9[1-79]'], '0\\$1', ''], [None, '(98[45])(\\d{3})(\\d{4})', '$1 $2 $3', ['98'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NR': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NR', 674, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NU': [None, [None, None, '[1-5]\\d{3}', '\\d{4}', None, None, None], [None, None, '[34]\\d{3}', '\\d{4}', None, None, None], [None, None, '[125]\\d{3}', '\\d{4}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NU', 683, '00', None, None, None, None, None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'NZ': [None, [None, None, '[2-9]\\d{7,9}', '\\d{7,10}', None, None, None], [None, None, '(?:3[2-79]|[479][2-689]|6[235-9])\\d{6}|24099\\d{3}', '\\d{7,8}', None, None, None], [None, None, '2(?:[027]\\d{7}|9\\d{6,7}|1(?:0\\d{5,7}|[12]\\d{5,6}|[3-9]\\d{5})|4[1-9]\\d{6}|8\\d{7,8})', '\\d{8,10}', None, None, None], [None, None, '(?:800|508)\\d{6,7}', '\\d{9,10}', None, None, None], [None, None, '900\\d{6,7}', '\\d{9,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'NZ', 64, '00', '0', None, None, '0', None, None, None, [[None, '([34679])(\\d{3})(\\d{4})', '$1-$2 $3', ['[3467]|9[1-9]'], '0\\$1', ''], [None, '(21)(\\d{4})(\\d{3,4})', '$1 $2 $3', ['21'], '0\\$1', ''], [None, '([2589]\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['2[0247-9]|5|[89]00'], '0\\$1', ''], [None, '(2[019])(\\d{3})(\\d{3})', '$1 $2 $3', ['2[019]'], '0\\$1', ''], [None, '(24099)(\\d{3})', '$1 $2', ['240', '2409', '24099'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'OM': [None, [None, None, '(?:2[3-6]|5|9[2-9])\\d{6}|800\\d{5,6}', '\\d{7,9}', None, None, None], [None, None, '2[3-6]\\d{6}', '\\d{8}', None, None, None], [None, None, '9[2-9]\\d{6}', '\\d{8}', None, None, None], [None, None, '8007\\d{4,5}|500\\d{4}', '\\d{7,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'OM', 968, '00', None, None, None, None, None, None, None, [[None, '(2\\d)(\\d{6})', '$1 $2', ['2'], '', ''], [None, '(9\\d{3})(\\d{4})', '$1 $2', ['9'], '', ''], [None, '([58]00)(\\d{4,6})', '$1 $2', ['[58]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PA': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PA', 507, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PE': [None, [None, None, '[14-9]\\d{7,8}', '\\d{6,9}', None, None, None], [None, None, '(?:1\\d|4[1-4]|5[1-46]|6[1-7]|7[2-46]|8[2-4])\\d{6}', '\\d{6,8}', None, None, None], [None, None, '9\\d{8}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PE', 51, '00', '0', ' Anexo ', None, '0', None, None, None, [[None, '(1)(\\d{7})', '$1 $2', ['1'], '(\\$1)', ''], [None, '([4-8]\\d)(\\d{6})', '$1 $2', ['[4-8]'], '(\\$1)', ''], [None, '(9\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['9'], '(\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PF': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PF', 689, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PG': [None, [None, None, '[1-9]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '(?:3\\d{2}|4[257]\\d|5[34]\\d|6(?:29|4[1-9])|85[02-46-9]|9[78]\\d)\\d{4}', '\\d{7}', None, None, None], [None, None, '(?:68|7(?:[126]\\d|3[1-9]))\\d{5}', '\\d{7,8}', None, None, None], [None, None, '180\\d{4}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '275\\d{4}', '\\d{7}', None, None, None], 'PG', 675, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', ['[1-689]'], '', ''], [None, '(7[1-36]\\d)(\\d{2})(\\d{3})', '$1 $2 $3', ['7[1-36]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PH': [None, [None, None, '[2-9]\\d{7,9}|1800\\d{7,9}', '\\d{7,13}', None, None, None], [None, None, '(?:2|3[2-68]|4[2-9]|5[2-6]|6[2-58]|7[24578]|8[2-8])\\d{7}', '\\d{7,9}', None, None, None], [None, None, '9(?:0[5-9]|1[025-9]|2[0-36-9]|3[0235-9]|7[349]|[89]9)\\d{7}', '\\d{10}', None, None, None], [None, None, '1800\\d{7,9}', '\\d{11,13}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PH', 63, '00', '0', None, None, '0', None, None, None, [[None, '(2)(\\d{3})(\\d{4})', '$1 $2 $3', ['2'], '', ''], [None, '(\\d{4})(\\d{5})', '$1 $2', ['3(?:23|39|46)|4(?:2[3-6]|[35]9|4[26]|76)|5(?:22|44)|642|8(?:62|8[245])', '3(?:230|397|461)|4(?:2(?:35|[46]4|51)|396|4(?:22|63)|59[347]|76[15])|5(?:221|446)|642[23]|8(?:622|8(?:[24]2|5[13]))'], '', ''], [None, '(\\d{5})(\\d{4})', '$1 $2', ['346|4(?:27|9[35])|883', '3469|4(?:279|9(?:30|56))|8834'], '', ''], [None, '([3-8]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['[3-8]'], '', ''], [None, '(9\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['9'], '', ''], [None, '(1800)(\\d{3})(\\d{4})', '$1 $2 $3', ['1'], '', ''], [None, '(1800)(\\d{1,2})(\\d{3})(\\d{4})', '$1 $2 $3 $4', ['1'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PK': [None, [None, None, '1\\d{8}|[2-8]\\d{5,11}|9(?:[013-9]\\d{4,9}|2\\d(?:111\\d{6}|\\d{3,7}))', '\\d{6,12}', None, None, None], [None, None, '(?:21|42)[2-9]\\d{7}|(?:2[25]|4[0146-9]|5[1-35-7]|6[1-8]|7[14]|8[16]|91)[2-9]\\d{6}|(?:2(?:3[2358]|4[2-4]|9[2-8])|45[3479]|54[2-467]|60[468]|72[236]|8(?:2[2-689]|3[23578]|4[3478]|5[2356])|9(?:1|2[2-8]|3[27-9]|4[2-6]|6[3569]|9[25-8]))[2-9]\\d{5,6}|58[126]\\d{7}', '\\d{6,10}', None, None, None], [None, None, '3(?:0\\d|1[2-5]|2[1-3]|3[1-6]|4[2-6]|64)\\d{7}', '\\d{10}', None, None, None], [None, None, '800\\d{5}', '\\d{8}', None, None, None], [None, None, '900\\d{5}', '\\d{8}', None, None, None], [None, None, '(?:2(?:[125]|3[2358]|4[2-4]|9[2-8])|4(?:[0-246-9]|5[3479])|5(?:[1-35-7]|4[2-467])|6(?:[1-8]|0[468])|7(?:[14]|2[236])|8(?:[16]|2[2-689]|3[23578]|4[3478]|5[2356])|9(?:1|22|3[27-9]|4[2-6]|6[3569]|9[2-7]))111\\d{6}', '\\d{11,12}', None, None, None], [None, None, '122\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PK', 92, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(111)(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['(?:2[125]|4[0-246-9]|5[1-35-7]|6[1-8]|7[14]|8[16]|91)1', '(?:2[125]|4[0-246-9]|5[1-35-7]|6[1-8]|7[14]|8[16]|91)11', '(?:2[125]|4[0-246-9]|5[1-35-7]|6[1-8]|7[14]|8[16]|91)111'], '(0\\$1)', ''], [None, '(\\d{3})(111)(\\d{3})(\\d{3})', '$1 $2 $3 $4', ['(?:2[349]|45|54|60|72|8[2-5]|9[2-9])', '(?:2[349]|45|54|60|72|8[2-5]|9[2-9])\\d1', '(?:2[349]|45|54|60|72|8[2-5]|9[2-9])\\d11', '(?:2[349]|45|54|60|72|8[2-5]|9[2-9])\\d111'], '(0\\$1)', ''], [None, '(\\d{2})(\\d{7,8})', '$1 $2', ['(?:2[125]|4[0-246-9]|5[1-35-7]|6[1-8]|7[14]|8[16]|91)[2-9]'], '(0\\$1)', ''], [None, '(\\d{3})(\\d{6,7})', '$1 $2', ['2[349]|45|54|60|72|8[2-5]|9[2-9]', '(?:2[349]|45|54|60|72|8[2-5]|9[2-9])\\d[2-9]'], '(0\\$1)', ''], [None, '(3\\d{2})(\\d{7})', '$1 $2', ['3'], '(0\\$1)', ''], [None, '([15]\\d{3})(\\d{5,6})', '$1 $2', ['58[12]|1'], '(0\\$1)', ''], [None, '(586\\d{2})(\\d{5})', '$1 $2', ['586'], '(0\\$1)', ''], [None, '([89]00)(\\d{3})(\\d{2})', '$1 $2 $3', ['[89]00'], '(0\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PL': [None, [None, None, '[1-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '(?:1[2-8]|2[2-59]|3[2-4]|4[1-468]|5[24-689]|6[1-3578]|7[14-7]|8[1-79]|9[145])\\d{7}', '\\d{9}', None, None, None], [None, None, '(?:5[013]|6[069]|7[289]|88)\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '70\\d{7}', '\\d{9}', None, None, None], [None, None, '801\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '39\\d{7}', '\\d{9}', None, None, None], 'PL', 48, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[124]|3[2-4]|5[24-689]|6[1-3578]|7[14-7]|8[1-79]|9[145]'], '', ''], [None, '(\\d{3})(\\d{3})(\\d{3})', '$1 $2 $3', ['39|5[013]|6[069]|7[0289]|8[08]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PM': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PM', 508, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PR': [None, [None, None, '[789]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '(?:787|939)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '(?:787|939)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PR', 1, '011', '1', None, None, '1', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, '787|939'],
+'PS': [None, [None, None, '(?:[24589]\\d{7,9}|1(?:[78]\\d{8}|[49]\\d{2,3}))', '\\d{4,10}', None, None, None], [None, None, '(?:22[2379]|42[45]|82[01458]|92[369])\\d{5}', '\\d{7,8}', None, None, None], [None, None, '5[69]\\d{7}', '\\d{9}', None, None, None], [None, None, '1800\\d{6}', '\\d{10}', None, None, None], [None, None, '1(?:4|9\\d)\\d{2}', '\\d{4,5}', None, None, None], [None, None, '1700\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PS', 970, '00', '0', None, None, '0', None, None, None, [[None, '([2489])(2\\d{2})(\\d{4})', '$1 $2 $3', ['[2489]'], '0\\$1', ''], [None, '(5[69]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['5'], '0\\$1', ''], [None, '(1[78]00)(\\d{3})(\\d{3})', '$1 $2 $3', ['1[78]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PT': [None, [None, None, '[2-46-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '2(?:[12]\\d|[35][1-689]|4[1-59]|6[1-35689]|7[1-9]|8[1-69]|9[1256])\\d{6}', '\\d{9}', None, None, None], [None, None, '9(?:[136]\\d{2}|2[25-79]\\d|4(?:80|9\\d))\\d{5}', '\\d{9}', None, None, None], [None, None, '4\\d{8}|80[02]\\d{6}', '\\d{9}', None, None, None], [None, None, '71\\d{7}', '\\d{9}', None, None, None], [None, None, '808\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '30\\d{7}', '\\d{9}', None, None, None], 'PT', 351, '00', None, None, None, None, None, None, None, [[None, '([2-46-9]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PW': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PW', 680, '011', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'PY': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'PY', 595, '002', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'QA': [None, [None, None, '[3-8]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '44\\d{6}', '\\d{7,8}', None, None, None], [None, None, '(?:33|55|66|77)\\d{6}', '\\d{7,8}', None, None, None], [None, None, '800\\d{4}', '\\d{7,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'QA', 974, '00', None, None, None, None, None, None, None, [[None, '(8\\d{2})(\\d{4})', '$1 $2', ['8'], '', ''], [None, '([3-7]\\d{3})(\\d{4})', '$1 $2', ['[3-7]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'RE': [None, [None, None, '[268]\\d{8}', '\\d{9}', None, None, None], [None, None, '262\\d{6}', '\\d{9}', None, None, None], [None, None, '6(?:9[23]|47)\\d{6}', '\\d{9}', None, None, None], [None, None, '80\\d{7}', '\\d{9}', None, None, None], [None, None, '89[1-37-9]\\d{6}', '\\d{9}', None, None, None], [None, None, '8(?:1[019]|2[0156]|84|90)\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'RE', 262, '00', '0', None, None, '0', None, None, None, [[None, '([268]\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], 1, '262|6[49]|8'],
+'RO': [None, [None, None, '[237-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '[23][13-6]\\d{7}', '\\d{9}', None, None, None], [None, None, '7[1-8]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '90[036]\\d{6}', '\\d{9}', None, None, None], [None, None, '801\\d{6}', '\\d{9}', None, None, None], [None, None, '802\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'RO', 40, '00', '0', ' int ', None, '0', None, None, None, [[None, '([237]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['[23]1|7'], '0\\$1', ''], [None, '(\\d{3})(\\d{3})(\\d{3})', '$1 $2 $3', ['[23][02-9]|[89]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'RS': [None, [None, None, '[1-46-9]\\d{4,11}', '\\d{5,12}', None, None, None], [None, None, '[1-3]\\d{6,9}', '\\d{5,10}', None, None, None], [None, None, '6[0-689]\\d{3,10}', '\\d{5,12}', None, None, None], [None, None, '800\\d{3,6}', '\\d{6,9}', None, None, None], [None, None, '(?:9[0-2]|42)\\d{4,7}', '\\d{6,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'RS', 381, '00', '0', None, None, '0', None, None, None, [[None, '([23]\\d{2})(\\d{4,7})', '$1 $2', ['(?:2[389]|39)0'], '0\\$1', ''], [None, '([1-4]\\d)(\\d{4,8})', '$1 $2', ['1|2(?:[0-24-7]|[389][1-9])|3(?:[0-8]|9[1-9])|42'], '0\\$1', ''], [None, '(6[0-689])(\\d{3,10})', '$1 $2', ['6'], '0\\$1', ''], [None, '([89]\\d{2})(\\d{3,6})', '$1 $2', ['[89]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'RU': [None, [None, None, '[3489]\\d{9}', '\\d{10}', None, None, None], [None, None, '(?:3(?:0[12]|4[1-35-79]|5[1-3]|8[1-58]|9[0145])|4(?:01|1[1356]|2[13467]|7[1-5]|8[1-7]|9[1-689])|8(?:1[1-8]|2[01]|3[13-6]|4[0-8]|5[15]|6[1-35-7]|7[1-37-9]))\\d{7}', '\\d{10}', None, None, None], [None, None, '9\\d{9}', '\\d{10}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '809\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'RU', 7, '8~10', '8', None, None, '8', None, None, None, [[None, '([3489]\\d{2})(\\d{3})(\\d{2})(\\d{2})', '$1 $2-$3-$4', ['[34689]'], '8 (\\$1)', ''], [None, '([67]\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', ['[67]'], '8 (\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], 1, None],
+'RW': [None, [None, None, '[27-9]\\d{8}', '\\d{9}', None, None, None], [None, None, '25\\d{7}', '\\d{9}', None, None, None], [None, None, '7[258]\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '900\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'RW', 250, '000', '0', None, None, '0', None, None, None, [[None, '(25\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['2'], '0\\$1', ''], [None, '([7-9]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[7-9]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SA': [None, [None, None, '[1-9]\\d{7,10}', '\\d{7,11}', None, None, None], [None, None, '(?:1[24-7]|2[24-8]|3[35-8]|4[34-68]|6[2-5]|7[235-7])\\d{6}', '\\d{7,8}', None, None, None], [None, None, '(?:5[013-69]\\d|8111)\\d{6}', '\\d{9,10}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '9200\\d{7}', '\\d{11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SA', 966, '00', '0', None, None, '0', None, None, None, [[None, '([1-467])(\\d{3})(\\d{4})', '$1 $2 $3', ['[1-467]'], '0\\$1', ''], [None, '(9200)(\\d{3})(\\d{4})', '$1 $2 $3', ['9'], '0\\$1', ''], [None, '(5\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['5'], '0\\$1', ''], [None, '(800)(\\d{3})(\\d{4})', '$1 $2 $3', ['80'], '0\\$1', ''], [None, '(8111)(\\d{3})(\\d{3})', '$1 $2 $3', ['81'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SB': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SB', 677, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SC': [None, [None, None, '[2-8]\\d{5,6}', '\\d{6,7}', None, None, None], [None, None, '(?:2(?:1[78]|2[14-69]|3[2-4]|4[1-36-8]|6[167]|[89]\\d)|3(?:2[1-6]|4[4-6]|55|6[016]|7\\d|8[0-589]|9[0-5])|5(?:5\\d|6[0-2])|6(?:0[0-27-9]|1[0-478]|2[145]|3[02-4]|4[124]|6[015]|7\\d|8[1-3])|78[0138])\\d{3}', '\\d{6}', None, None, None], [None, None, '(?:5(?:[1247-9]\\d|6[3-9])|7(?:[14679]\\d|2[1-9]|8[24-79]))\\d{3}', '\\d{6}', None, None, None], [None, None, '8000\\d{2}', '\\d{6}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '(?:4?4[1-3]|6?47)\\d{4}', '\\d{6,7}', None, None, None], 'SC', 248, '0[0-2]', None, None, None, None, None, '00', None, [[None, '(\\d{3})(\\d{3})', '$1 $2', ['[23578]|[46][0-35-9]'], '', ''], [None, '(\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[46]4'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SD': [None, [None, None, '[19]\\d{8}', '\\d{9}', None, None, None], [None, None, '1(?:[25]\\d|8[3567])\\d{6}', '\\d{9}', None, None, None], [None, None, '9[1259]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SD', 249, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SE': [None, [None, None, '\\d{7,10}', '\\d{5,10}', None, None, None], [None, None, '1(?:0[1-8]\\d{6}|[136]\\d{5,7}|(?:2[0-35]|4[0-4]|5[0-25-9]|7[13-6]|[89]\\d)\\d{5,6})|2(?:[136]\\d{5,7}|(?:2[0-7]|4[0136-8]|5[0-38]|7[018]|8[01]|9[0-57])\\d{5,6})|3(?:[356]\\d{5,7}|(?:0[0-4]|1\\d|2[0-25]|4[056]|7[0-2]|8[0-3]|9[023])\\d{5,6})|4(?:[0246]\\d{5,7}|(?:1[01-8]|3[0135]|5[14-79]|7[0-246-9]|8[0156]|9[0-689])\\d{5,6})|5(?:0[0-6]|1[1-5]|2[0-68]|3[0-4]|4\\d|5[0-5]|6[03-5]|7[013]|8[0-79]|9[01])\\d{5,6}|6(?:[03]\\d{5,7}|(?:1[1-3]|2[0-4]|4[02-57]|5[0-37]|6[0-3]|7[0-2]|8[0247]|9[0-356])\\d{5,6})|8\\d{6,8}|9(?:0\\d{5,7}|(?:1[0-68]|2\\d|3[02-59]|4[0-4]|5[0-4]|6[01]|7[0135-8]|8[01])\\d{5,6})', '\\d{5,9}', None, None, None], [None, None, '7[02-46]\\d{7}', '\\d{9}', None, None, None], [None, None, '20\\d{4,7}', '\\d{6,9}', None, None, None], [None, None, '9(?:00|39|44)\\d{7}', '\\d{10}', None, None, None], [None, None, '77\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SE', 46, '00', '0', None, None, '0', None, None, None, [[None, '(8)(\\d{2,3})(\\d{2,3})(\\d{2})', '$1 $2 $3 $4', ['8'], '0\\$1', ''], [None, '([1-69]\\d)(\\d{2,3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['1[013689]|2[0136]|3[1356]|4[0246]|54|6[03]|90'], '0\\$1', ''], [None, '([1-69]\\d)(\\d{3})(\\d{2})', '$1 $2 $3', ['1[13689]|2[136]|3[1356]|4[0246]|54|6[03]|90'], '0\\$1', ''], [None, '(\\d{3})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['1[2457]|2[2457-9]|3[0247-9]|4[1357-9]|5[0-35-9]|6[124-9]|9(?:[125-8]|3[0-5]|4[0-3])'], '0\\$1', ''], [None, '(\\d{3})(\\d{2,3})(\\d{2})', '$1 $2 $3', ['1[2457]|2[2457-9]|3[0247-9]|4[1357-9]|5[0-35-9]|6[124-9]|9(?:[125-8]|3[0-5]|4[0-3])'], '0\\$1', ''], [None, '(7[02-467])(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['7[02-467]'], '0\\$1', ''], [None, '(20)(\\d{2,3})(\\d{2})', '$1 $2 $3', ['20'], '0\\$1', ''], [None, '(9[034]\\d)(\\d{2})(\\d{2})(\\d{3})', '$1 $2 $3 $4', ['9[034]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SG': [None, [None, None, '[36]\\d{7}|[17-9]\\d{7,10}', '\\d{8,11}', None, None, None], [None, None, '6[1-8]\\d{6}|7000\\d{7}', '\\d{8,11}', None, None, None], [None, None, '(?:8[1-5]|9[0-8])\\d{6}', '\\d{8}', None, None, None], [None, None, '1?800\\d{7}', '\\d{10,11}', None, None, None], [None, None, '1900\\d{7}', '\\d{11}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '3[0-2]\\d{6}', '\\d{8}', None, None, None], 'SG', 65, '0[0-3][0-9]', None, None, None, None, None, None, None, [[None, '([3689]\\d{3})(\\d{4})', '$1 $2', ['[369]|8[1-9]'], '', ''], [None, '(1[89]00)(\\d{3})(\\d{4})', '$1 $2 $3', ['1[89]'], '', ''], [None, '(7000)(\\d{4})(\\d{3})', '$1 $2 $3', ['70'], '', ''], [None, '(800)(\\d{3})(\\d{4})', '$1 $2 $3', ['80'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SH': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SH', 290, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SI': [None, [None, None, '[1-7]\\d{6,7}|[89]\\d{4,7}', '\\d{5,8}', None, None, None], [None, None, '(?:1\\d|2[2-8]|3[4-8]|4[24-8]|[57][3-8])\\d{6}', '\\d{7,8}', None, None, None], [None, None, '(?:[37][01]|4[019]|51|64)\\d{6}', '\\d{8}', None, None, None], [None, None, '80\\d{4,6}', '\\d{6,8}', None, None, None], [None, None, '90\\d{4,6}|89[1-3]\\d{2,5}', '\\d{5,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '(?:59|8[1-3])\\d{6}', '\\d{8}', None, None, None], 'SI', 386, '00', '0', None, None, '0', None, None, None, [[None, '(\\d)(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['[12]|3[4-8]|4[24-8]|5[3-8]|7[3-8]'], '0\\$1', ''], [None, '([3-7]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['[37][01]|4[019]|51|64'], '0\\$1', ''], [None, '([89][09])(\\d{3,6})', '$1 $2', ['[89][09]'], '0\\$1', ''], [None, '([58]\\d{2})(\\d{5})', '$1 $2', ['59|8[1-3]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SK': [None, [None, None, '[2-689]\\d{8}', '\\d{9}', None, None, None], [None, None, '[2-5]\\d{8}', '\\d{9}', None, None, None], [None, None, '9(?:0[1-8]|1[0-24-9]|4[0489])\\d{6}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '9(?:[78]\\d{7}|00\\d{6})', '\\d{9}', None, None, None], [None, None, '8[5-9]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '6(?:5[0-4]|9[0-6])\\d{6}', '\\d{9}', None, None, None], 'SK', 421, '00', '0', None, None, '0', None, None, None, [[None, '(2)(\\d{3})(\\d{3})(\\d{2})', '$1/$2 $3 $4', ['2'], '0\\$1', ''], [None, '([3-5]\\d)(\\d{3})(\\d{2})(\\d{2})', '$1/$2 $3 $4', ['[3-5]'], '0\\$1', ''], [None, '([689]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[689]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SL': [None, [None, None, '[2-578]\\d{7}', '\\d{6,8}', None, None, None], [None, None, '[235]2[2-4][2-9]\\d{4}', '\\d{6,8}', None, None, None], [None, None, '(?:25|3[03]|44|5[056]|7[6-8]|88)[1-9]\\d{5}', '\\d{6,8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SL', 232, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{6})', '$1 $2', None, '(0\\$1)', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SM': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SM', 378, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SN': [None, [None, None, '[37]\\d{8}', '\\d{9}', None, None, None], [None, None, '3(?:010|3(?:8[1-9]|9[2-9]))\\d{5}', '\\d{9}', None, None, None], [None, None, '7(?:0[1256]0|6(?:1[23]|2[89]|3[3489]|4[6-9]|5[1-389]|6[6-9]|7[45]|8[3-8])|7(?:1[014-8]|2[0-7]|3[0-35-8]|4[0-6]|[56]\\d|7[0-589]|8[01]|9[0-6]))\\d{5}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '33301\\d{4}', '\\d{9}', None, None, None], 'SN', 221, '00', None, None, None, None, None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SO': [None, [None, None, '[13-59]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '(?:5[57-9]|[134]\\d)\\d{5}', '\\d{7}', None, None, None], [None, None, '(?:9[01]|15)\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SO', 252, '00', None, None, None, None, None, None, None, [[None, '([13-5])(\\d{6})', '$1 $2', ['[13-5]'], '', ''], [None, '([19]\\d)(\\d{6})', '$1 $2', ['15|9'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SR': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SR', 597, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ST': [None, [None, None, '[29]\\d{6}', '\\d{7}', None, None, None], [None, None, '22\\d{5}', '\\d{7}', None, None, None], [None, None, '9[89]\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ST', 239, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SV': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SV', 503, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SY': [None, [None, None, '[1-59]\\d{7,8}', '\\d{6,9}', None, None, None], [None, None, '(?:1(?:1\\d?|4\\d|[2356])|2[1-35]|3(?:1\\d|[34])|4[13]|5[1-3])\\d{6}', '\\d{6,9}', None, None, None], [None, None, '9(?:3[23]|4[457]|55|6[67]|88|9[19])\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SY', 963, '00', '0', None, None, '0', None, None, None, [[None, '(\\d{2})(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[1-5]'], '0\\$1', ''], [None, '(9[3-689])(\\d{4})(\\d{3})', '$1 $2 $3', ['9'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'SZ': [None, [None, None, '[02-7]\\d{6,7}', '\\d{7,8}', None, None, None], [None, None, '2?(?:2(?:0[07]|[13]7|2[57])|3(?:0[34]|[1278]3|3[23]|[46][34])|(?:40[4-69]|16|2[12]|3[57]|[4578]2|67)|5(?:0[5-7]|1[6-9]|[23][78]|48|5[01]))\\d{4}', '\\d{7,8}', None, None, None], [None, None, '(?:6|7[6-8])\\d{6}', '\\d{7,8}', None, None, None], [None, None, '0800\\d{4}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'SZ', 268, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', ['[2-6]'], '', ''], [None, '(\\d{4})(\\d{4})', '$1 $2', ['[027]'], '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TC': [None, [None, None, '[689]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '649(?:712|9(?:4\\d|50))\\d{4}', '\\d{7,10}', None, None, None], [None, None, '649(?:2(?:3[12]|4[1-5])|3(?:3[1-39]|4[1-57])|4[34][12])\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '64971[01]\\d{4}', '\\d{10}', None, None, None], 'TC', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '649'],
+'TD': [None, [None, None, '[2679]\\d{7}', '\\d{8}', None, None, None], [None, None, '22(?:[3789]0|5[0-5]|6[89])\\d{4}', '\\d{8}', None, None, None], [None, None, '(?:6(?:3[0-7]|6\\d)|77\\d|9(?:5[0-4]|9\\d))\\d{5}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TD', 235, '00|16', None, None, None, None, None, '00', None, [[None, '(\\d{2})(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TF': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TF', 262, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TG': [None, [None, None, '[02-9]\\d{6}', '\\d{7}', None, None, None], [None, None, '(?:2[2-7]|3[23]|44|55|66|77)\\d{5}', '\\d{7}', None, None, None], [None, None, '(?:0[1-9]|7[56]|8[1-7]|9\\d)\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TG', 228, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TH': [None, [None, None, '[2-8]\\d{7,8}|1\\d{9}', '\\d{8,10}', None, None, None], [None, None, '(?:2[1-9]|3[24-9]|4[2-5]|5[3-6]|7[3-7])\\d{6}', '\\d{8}', None, None, None], [None, None, '8\\d{8}', '\\d{9}', None, None, None], [None, None, '1800\\d{6}', '\\d{10}', None, None, None], [None, None, '1900\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '60\\d{7}', '\\d{9}', None, None, None], 'TH', 66, '00', '0', None, None, '0', None, None, None, [[None, '(2)(\\d{3})(\\d{4})', '$1 $2 $3', ['2'], '0\\$1', ''], [None, '([3-7]\\d)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[3-7]'], '0\\$1', ''], [None, '(8)(\\d{4})(\\d{4})', '$1 $2 $3', ['8'], '0\\$1', ''], [None, '(1[89]00)(\\d{3})(\\d{3})', '$1 $2 $3', ['1'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TJ': [None, [None, None, '[349]\\d{8}', '\\d{3,9}', None, None, None], [None, None, '(?:3(?:1[3-5]|2[245]|31|4[24-7]|5[25]|72)|4(?:46|74|87))\\d{6}', '\\d{3,9}', None, None, None], [None, None, '9[0-35-9]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TJ', 992, '8~10', '8', None, None, '8', None, None, None, [[None, '([349]\\d{2})(\\d{2})(\\d{4})', '$1 $2 $3', ['[34]7|91[78]'], '8\\$1', ''], [None, '([49]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['4[48]|9(?:19|[0235-9])'], '8\\$1', ''], [None, '(331700)(\\d)(\\d{2})', '$1 $2 $3', ['331', '3317', '33170', '331700'], '8\\$1', ''], [None, '(\\d{4})(\\d)(\\d{4})', '$1 $2 $3', ['3[1-5]', '3(?:[1245]|3(?:[02-9]|1[0-589]))'], '8\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TK': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TK', 690, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TL': [None, [None, None, '[2-47-9]\\d{6}', '\\d{7}', None, None, None], [None, None, '(?:2[1-5]|3[1-9]|4[1-4])\\d{5}', '\\d{7}', None, None, None], [None, None, '7[2-4]\\d{5}', '\\d{7}', None, None, None], [None, None, '80\\d{5}', '\\d{7}', None, None, None], [None, None, '90\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '70\\d{5}', '\\d{7}', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TL', 670, '00', None, None, None, None, None, None, None, [[None, '(\\d{3})(\\d{4})', '$1 $2', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TM': [None, [None, None, '[1-6]\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:12\\d|243|[3-5]22)\\d{5}', '\\d{8}', None, None, None], [None, None, '6[6-8]\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TM', 993, '8~10', '8', None, None, '8', None, None, None, [[None, '([1-6]\\d)(\\d{2})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '8 \\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TN': [None, [None, None, '[247-9]\\d{7}', '\\d{8}', None, None, None], [None, None, '7\\d{7}', '\\d{8}', None, None, None], [None, None, '(?:2[0-7]|40|9\\d)\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '8[028]\\d{6}', '\\d{8}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TN', 216, '00', None, None, None, None, None, None, None, [[None, '([247-9]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TO': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TO', 676, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TR': [None, [None, None, '[2-589]\\d{9}', '\\d{10}', None, None, None], [None, None, '[2-4]\\d{9}|850\\d{7}', '\\d{10}', None, None, None], [None, None, '5\\d{9}', '\\d{10}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '900\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TR', 90, '00', '0', None, None, '0', None, None, None, [[None, '([2-589]\\d{2})(\\d{3})(\\d{4})', '$1 $2 $3', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TT': [None, [None, None, '[89]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '868(?:2(?:01|2[1-4])|6(?:1[4-6]|2[1-9]|[3-6]\\d|7[0-79]|9[0-8])|82[12])\\d{4}', '\\d{7,10}', None, None, None], [None, None, '868(?:29\\d|3(?:0[1-9]|1[02-9]|[2-9]\\d)|4(?:[679]\\d|8[0-4])|6(?:20|78|8\\d)|7(?:1[02-9]|[2-9]\\d))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TT', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '868'],
+'TV': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TV', 688, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TW': [None, [None, None, '[2-9]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '[2-8]\\d{7,8}', '\\d{8,9}', None, None, None], [None, None, '9\\d{8}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '900\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'TW', 886, '0(?:0[25679]|19)', '0', '#', None, '0', None, None, None, [[None, '([2-8])(\\d{3,4})(\\d{4})', '$1 $2 $3', ['[2-7]|8[1-9]'], '0\\$1', ''], [None, '([89]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['80|9'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'TZ': [None, [None, None, '\\d{9}', '\\d{7,9}', None, None, None], [None, None, '2[2-8]\\d{7}', '\\d{7,9}', None, None, None], [None, None, '(?:6[158]|7[1-9])(?:\\d{7})', '\\d{9}', None, None, None], [None, None, '80[08]\\d{6}', '\\d{9}', None, None, None], [None, None, '90\\d{7}', '\\d{9}', None, None, None], [None, None, '8(?:40|6[01])\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '41\\d{7}', '\\d{9}', None, None, None], 'TZ', 255, '00[056]', '0', None, None, '0', None, None, None, [[None, '([24]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['[24]'], '0\\$1', ''], [None, '([67]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['[67]'], '0\\$1', ''], [None, '([89]\\d{2})(\\d{2})(\\d{4})', '$1 $2 $3', ['[89]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'UA': [None, [None, None, '[3-689]\\d{8}', '\\d{5,9}', None, None, None], [None, None, '(?:3[1-8]|4[13-8]|5[1-7]|6[12459])\\d{7}', '\\d{5,9}', None, None, None], [None, None, '(?:39|50|6[36-8]|9[1-9])\\d{7}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, '900\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'UA', 380, '0~0', '0', None, None, '0', None, None, None, [[None, '([3-69]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['39|4(?:[45][0-5]|87)|5(?:0|6[37]|7[37])|6[36-8]|9[1-9]', '39|4(?:[45][0-5]|87)|5(?:0|6(?:3[14-7]|7)|7[37])|6[36-8]|9[1-9]'], '0\\$1', ''], [None, '([3-689]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['3[1-8]2|4[1378]2|5(?:[12457]2|6[24])|6(?:[49]2|[12][29]|5[24])|8|90', '3(?:[1-46-8]2[013-9]|52)|4[1378]2|5(?:[12457]2|6[24])|6(?:[49]2|[12][29]|5[24])|8|90'], '0\\$1', ''], [None, '([3-6]\\d{3})(\\d{5})', '$1 $2', ['3(?:5[013-9]|[1-46-8])|4(?:[137][013-9]|6|[45][6-9]|8[4-6])|5(?:[1245][013-9]|6[0135-9]|3|7[4-6])|6(?:[49][013-9]|5[0135-9]|[12][13-8])', '3(?:5[013-9]|[1-46-8](?:22|[013-9]))|4(?:[137][013-9]|6|[45][6-9]|8[4-6])|5(?:[1245][013-9]|6(?:3[02389]|[015689])|3|7[4-6])|6(?:[49][013-9]|5[0135-9]|[12][13-8])'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'UG': [None, [None, None, '\\d{9}', '\\d{5,9}', None, None, None], [None, None, '3\\d{8}|4(?:[1-6]\\d|7[136]|8[1356]|96)\\d{6}|20(?:0\\d|24)\\d{5}', '\\d{5,9}', None, None, None], [None, None, '7(?:[1578]\\d|0[0-4])\\d{6}', '\\d{9}', None, None, None], [None, None, '800[123]\\d{5}', '\\d{9}', None, None, None], [None, None, '90[123]\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'UG', 256, '00[057]', '0', None, None, '0', None, None, None, [[None, '([247-9]\\d{2})(\\d{6})', '$1 $2', ['[7-9]|200|4(?:6[45]|[7-9])'], '0\\$1', ''], [None, '([34]\\d)(\\d{7})', '$1 $2', ['3|4(?:[1-5]|6[0-36-9])'], '0\\$1', ''], [None, '(2024)(\\d{5})', '$1 $2', ['202'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'US': [None, [None, None, '[2-9]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '(?:2(?:0[1-35-9]|1[02-9]|2[4589]|3[149]|4[08]|5[1-46]|6[0279]|7[06]|8[13])|3(?:0[1-57-9]|1[02-9]|2[0135]|3[014679]|47|5[12]|6[01]|8[056])|4(?:0[124-9]|1[02-579]|2[3-5]|3[0245]|4[0235]|69|7[089]|8[04])|5(?:0[1-57-9]|1[0235-8]|[23]0|4[01]|5[19]|6[1-37]|7[013-5]|8[056])|6(?:0[1-35-9]|1[024-9]|2[036]|3[016]|4[16]|5[017]|6[0-29]|78|8[12])|7(?:0[1-46-8]|1[2-9]|2[047]|3[124]|4[07]|5[47]|6[02359]|7[02-59]|8[156])|8(?:0[1-68]|1[02-8]|28|3[0-25]|4[3578]|5[06-9]|6[02-5]|7[028])|9(?:0[1346-9]|1[02-9]|2[058]|3[167]|4[0179]|5[1246]|7[0-3589]|8[059]))[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '(?:2(?:0[1-35-9]|1[02-9]|2[4589]|3[149]|4[08]|5[1-46]|6[0279]|7[06]|8[13])|3(?:0[1-57-9]|1[02-9]|2[0135]|3[014679]|47|5[12]|6[01]|8[056])|4(?:0[124-9]|1[02-579]|2[3-5]|3[0245]|4[0235]|69|7[089]|8[04])|5(?:0[1-57-9]|1[0235-8]|[23]0|4[01]|5[19]|6[1-37]|7[013-5]|8[056])|6(?:0[1-35-9]|1[024-9]|2[036]|3[016]|4[16]|5[017]|6[0-29]|78|8[12])|7(?:0[1-46-8]|1[2-9]|2[047]|3[124]|4[07]|5[47]|6[02359]|7[02-59]|8[156])|8(?:0[1-68]|1[02-8]|28|3[0-25]|4[3578]|5[06-9]|6[02-5]|7[028])|9(?:0[1346-9]|1[02-9]|2[058]|3[167]|4[0179]|5[1246]|7[0-3589]|8[059]))[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'US', 1, '011', '1', None, None, '1', None, None, 1, [[None, '(\\d{3})(\\d{3})(\\d{4})', '($1) $2-$3', None, '', ''], [None, '(\\d{3})(\\d{4})', '$1-$2', None, '', '']], [[None, '(\\d{3})(\\d{3})(\\d{4})', '$1-$2-$3', None, None, '']], [None, None, 'NA', 'NA', None, None, None], 1, None],
+'UY': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'UY', 598, '00', '0', None, None, '0', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'UZ': [None, [None, None, '[679]\\d{8}', '\\d{7,9}', None, None, None], [None, None, '(?:6[125679]|7[0-69])\\d{7}', '\\d{7,9}', None, None, None], [None, None, '9[0-57-9]\\d{7}', '\\d{7,9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'UZ', 998, '8~10', '8', None, None, '8', None, None, None, [[None, '([679]\\d)(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', None, '8\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'VA': [None, [None, None, '06\\d{8}', '\\d{10}', None, None, None], [None, None, '06698\\d{5}', '\\d{10}', None, None, None], [None, None, 'N/A', 'N/A', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VA', 379, '00', None, None, None, None, None, None, None, [[None, '(06)(\\d{4})(\\d{4})', '$1 $2 $3', None, '', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'VC': [None, [None, None, '(?:784|8(?:00|66|77|88)|900)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '784(?:266|3(?:6[6-9]|7\\d|8[0-24-6])|4(?:38|5[0-36-8]|8\\d|9[01])|555|638|784)\\d{4}', '\\d{7,10}', None, None, None], [None, None, '784(?:4(?:3[0-24]|5[45]|9[2-5])|5(?:2[6-9]|3[0-3]|93))\\d{4}', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VC', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '784'],
+'VE': [None, [None, None, '[24589]\\d{9}', '\\d{7,10}', None, None, None], [None, None, '(?:2(?:12|3[457-9]|[58][1-9]|[467]\\d|9[1-6])|50[01])\\d{7}', '\\d{7,10}', None, None, None], [None, None, '4(?:1[24-8]|2[46])\\d{7}', '\\d{10}', None, None, None], [None, None, '800\\d{7}', '\\d{10}', None, None, None], [None, None, '900\\d{7}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VE', 58, '00', '0', None, None, '1\\d{2}|0', None, None, None, [[None, '(\\d{3})(\\d{7})', '$1-$2', None, '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'VG': [None, [None, None, '(?:284|8(?:00|66|77|88)|900)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '284(?:(?:229|4(?:46|9[45])|8(?:52|6[459]))\\d{4}|496[0-5]\\d{3})', '\\d{7,10}', None, None, None], [None, None, '284(?:(?:30[0-3]|4(?:4[0-5]|68|99)|54[0-4])\\d{4}|496[6-9]\\d{3})', '\\d{10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VG', 1, '011', '1', None, None, '1', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '284'],
+'VI': [None, [None, None, '340(?:6[49]2|7[17]\\d)\\d{4}|(?:8(?:00|66|77|88)|900)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '340(?:6[49]2|7[17]\\d)\\d{4}|(?:8(?:00|66|77|88)|900)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '340(?:6[49]2|7[17]\\d)\\d{4}|(?:8(?:00|66|77|88)|900)[2-9]\\d{6}', '\\d{7,10}', None, None, None], [None, None, '8(?:00|55|66|77|88)[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, '900[2-9]\\d{6}', '\\d{10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VI', 1, '011', '1', None, None, '1', None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, '340'],
+'VN': [None, [None, None, '8\\d{5,8}|[1-79]\\d{7,9}', '\\d{7,10}', None, None, None], [None, None, '(?:2(?:[025-79]|1[0189]|[348][01])|3(?:[0136-9]|[25][01])|[48]\\d|5(?:[01][01]|[2-9])|6(?:[0-46-8]|5[01])|7(?:[02-79]|[18][01]))\\d{7}|69\\d{5,6}|80\\d{5}', '\\d{7,10}', None, None, None], [None, None, '(?:9\\d|1(?:2\\d|6[3-9]|88|99))\\d{7}', '\\d{9,10}', None, None, None], [None, None, '1800\\d{4,6}', '\\d{8,10}', None, None, None], [None, None, '1900\\d{4,6}', '\\d{8,10}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VN', 84, '00', '0', None, None, '0', None, None, None, [[None, '([48])(\\d{4})(\\d{4})', '$1 $2 $3', ['[48]'], '0\\$1', ''], [None, '([235-7]\\d)(\\d{4})(\\d{3})', '$1 $2 $3', ['2[025-79]|3[0136-9]|5[2-9]|6[0-46-9]|7[02-79]'], '0\\$1', ''], [None, '(80)(\\d{5})', '$1 $2', ['80'], '0\\$1', ''], [None, '(69\\d)(\\d{4,5})', '$1 $2', ['69'], '0\\$1', ''], [None, '([235-7]\\d{2})(\\d{4})(\\d{3})', '$1 $2 $3', ['2[1348]|3[25]|5[01]|65|7[18]'], '0\\$1', ''], [None, '(9\\d)(\\d{3})(\\d{2})(\\d{2})', '$1 $2 $3 $4', ['9'], '0\\$1', ''], [None, '(1[2689]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['1(?:[26]|88|99)'], '0\\$1', ''], [None, '(1[89]00)(\\d{4,6})', '$1 $2', ['1[89]0'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'VU': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'VU', 678, '00', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'WF': [None, [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, None, None, None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'WF', 681, '19', None, None, None, None, None, None, 1, None, None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'WS': [None, [None, None, '[2-8]\\d{4,6}', '\\d{5,7}', None, None, None], [None, None, '(?:[2-5]\\d|6[1-9]|840\\d)\\d{3}', '\\d{5,7}', None, None, None], [None, None, '(?:60|7[25-7]\\d)\\d{4}', '\\d{6,7}', None, None, None], [None, None, '800\\d{3}', '\\d{6}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'WS', 685, '0', '0', None, None, '0', None, None, None, [[None, '(8[04]0)(\\d{3,4})', '$1 $2', ['8[04]0'], '0\\$1', ''], [None, '(7[25-7])(\\d{5})', '$1 $2', ['7[25-7]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'YE': [None, [None, None, '[1-7]\\d{6,8}', '\\d{6,9}', None, None, None], [None, None, '(?:1(?:7\\d|[2-68])|2[2-68]|3[2358]|4[2-58]|5[2-6]|6[3-58]|7[24-68])\\d{5}', '\\d{6,8}', None, None, None], [None, None, '7[137]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'YE', 967, '00', '0', None, None, '0', None, None, None, [[None, '([1-7])(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[1-6]|7[24-68]'], '0\\$1', ''], [None, '(7[137]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['7[137]'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'YT': [None, [None, None, '[268]\\d{8}', '\\d{9}', None, None, None], [None, None, '2696[0-4]\\d{4}', '\\d{9}', None, None, None], [None, None, '639\\d{6}', '\\d{9}', None, None, None], [None, None, '80\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'YT', 262, '00', '0', None, None, '0', None, None, None, None, None, [None, None, 'NA', 'NA', None, None, None], None, '269|63'],
+'ZA': [None, [None, None, '\\d{9}', '\\d{8,9}', None, None, None], [None, None, '(?:1[0-8]|2[1-478]|3[1-69]|4\\d|5[1346-8])\\d{7}', '\\d{8,9}', None, None, None], [None, None, '(?:7[1-4689]|8[1-5789])\\d{7}', '\\d{9}', None, None, None], [None, None, '80\\d{7}', '\\d{9}', None, None, None], [None, None, '86[1-9]\\d{6}', '\\d{9}', None, None, None], [None, None, '860\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '87\\d{7}', '\\d{9}', None, None, None], 'ZA', 27, '00', '0', None, None, '0', None, None, None, [[None, '(860)(\\d{3})(\\d{3})', '$1 $2 $3', ['860'], '0\\$1', ''], [None, '([1-578]\\d)(\\d{3})(\\d{4})', '$1 $2 $3', ['[1-57]|8(?:[0-57-9]|6[1-9])'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ZM': [None, [None, None, '[289]\\d{8}', '\\d{9}', None, None, None], [None, None, '21[1-8]\\d{6}', '\\d{9}', None, None, None], [None, None, '9(?:55|6[4-9]|7[4-9])\\d{6}', '\\d{9}', None, None, None], [None, None, '800\\d{6}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], 'ZM', 260, '00', '0', None, None, '0', None, None, None, [[None, '([29]\\d)(\\d{7})', '$1 $2', ['[29]'], '0\\$1', ''], [None, '(800)(\\d{3})(\\d{3})', '$1 $2 $3', ['8'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+'ZW': [None, [None, None, '2(?:[012457-9]\\d{3,8}|6\\d{3,6})|[13-79]\\d{4,8}|86\\d{8}', '\\d{3,10}', None, None, None], [None, None, '(?:1[3-9]|2(?:0[45]|[16]|2[28]|[49]8?|58[23]|7[246]|8[1346-9])|3(?:08?|17?|3[78]|[2456]|7[1569]|8[379])|5(?:[07-9]|1[78]|483|5(?:7?|8))|6(?:0|28|37?|[45][68][78]|98?)|848)\\d{3,6}|(?:2(?:27|5|7[135789]|8[25])|3[39]|5[1-46]|6[126-8])\\d{4,6}|2(?:0|70)\\d{5,6}|(?:4\\d|9[2-8])\\d{4,7}', '\\d{3,10}', None, None, None], [None, None, '7[137]\\d{7}', '\\d{9}', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, 'NA', 'NA', None, None, None], [None, None, '86(?:1[12]|22|30|44|8[367]|99)\\d{6}', '\\d{10}', None, None, None], 'ZW', 263, '00', '0', None, None, '0', None, None, None, [[None, '([49])(\\d{3})(\\d{2,5})', '$1 $2 $3', ['4|9[2-9]'], '0\\$1', ''], [None, '([179]\\d)(\\d{3})(\\d{3,4})', '$1 $2 $3', ['[19]1|7'], '0\\$1', ''], [None, '([1-356]\\d)(\\d{3,5})', '$1 $2', ['1[3-9]|2(?:[1-469]|0[0-35-9]|[45][0-79])|3(?:0[0-79]|1[0-689]|[24-69]|3[0-69])|5(?:[02-46-9]|[15][0-69])|6(?:[0145]|[29][0-79]|3[0-689]|[68][0-69])'], '0\\$1', ''], [None, '([1-356]\\d)(\\d{3})(\\d{3})', '$1 $2 $3', ['1[3-9]|2(?:[1-469]|0[0-35-9]|[45][0-79])|3(?:0[0-79]|1[0-689]|[24-69]|3[0-69])|5(?:[02-46-9]|[15][0-69])|6(?:[0145]|[29][0-79]|3[0-689]|[68][0-69])'], '0\\$1', ''], [None, '([2356]\\d{2})(\\d{3,5})', '$1 $2', ['2(?:[278]|0[45]|48)|3(?:08|17|3[78]|[78])|5[15][78]|6(?:[29]8|37|[68][78])'], '0\\$1', ''], [None, '([2356]\\d{2})(\\d{3})(\\d{3})', '$1 $2 $3', ['2(?:[278]|0[45]|48)|3(?:08|17|3[78]|[78])|5[15][78]|6(?:[29]8|37|[68][78])'], '0\\$1', ''], [None, '([25]\\d{3})(\\d{3,5})', '$1 $2', ['(?:25|54)8', '258[23]|5483'], '0\\$1', ''], [None, '([25]\\d{3})(\\d{3})(\\d{3})', '$1 $2 $3', ['(?:25|54)8', '258[23]|5483'], '0\\$1', ''], [None, '(8\\d{3})(\\d{6})', '$1 $2', ['8'], '0\\$1', '']], None, [None, None, 'NA', 'NA', None, None, None], None, None],
+}
@@ -0,0 +1,89 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conversion between protocol buffer messages and Python array literals.
+
+This is the representation written to metadata.py by BuildMetadataPythonFromXml
+(see PythonArrayBuilder.java) and by buildmetadataprotofromxml.py: a message
+becomes a list whose element i holds the value of the field numbered i, or
+None if the field is not set. Nested messages are nested lists, repeated fields
+are lists and true booleans are written as 1.
+
+Because the generated module is made only of literals, it is compiled once to
+bytecode and afterwards loads metadata for every region without any file
+lookups or protocol buffer decoding.
+"""
+
+from google.protobuf import descriptor
+
+from phonenumbers import phonemetadata_pb2
+
+
+def message_to_array(message):
+    """Converts a protocol buffer message to its array representation."""
+    fields = message.DESCRIPTOR.fields
+    array = [None] * (max(field.number for field in fields) + 1)
+    for field, value in message.ListFields():
+        if field.label == descriptor.FieldDescriptor.LABEL_REPEATED:
+            array[field.number] = [_value_to_literal(field, item)
+                                   for item in value]
+        else:
+            array[field.number] = _value_to_literal(field, value)
+    return array
+
+
+def _value_to_literal(field, value):
+    if field.type == descriptor.FieldDescriptor.TYPE_MESSAGE:
+        return message_to_array(value)
+    if field.type == descriptor.FieldDescriptor.TYPE_BOOL:
+        return value and 1 or None
+    if isinstance(value, unicode):
+        try:
+            return value.encode("ascii")
+        except UnicodeEncodeError:
+            pass
+    return value
+
+
+def array_to_message(array, message):
+    """Fills in message from its array representation and returns it."""
+    length = len(array)
+    for field in message.DESCRIPTOR.fields:
+        if field.number >= length:
+            continue
+        value = array[field.number]
+        if value is None:
+            continue
+        if field.label == descriptor.FieldDescriptor.LABEL_REPEATED:
+            repeated = getattr(message, field.name)
+            if field.type == descriptor.FieldDescriptor.TYPE_MESSAGE:
+                for item in value:
+                    array_to_message(item, repeated.add())
+            else:
+                repeated.extend(value)
+        elif field.type == descriptor.FieldDescriptor.TYPE_MESSAGE:
+            sub_message = getattr(message, field.name)
+            # Mark the field as present even if all its own fields are unset.
+            sub_message.SetInParent()
+            array_to_message(value, sub_message)
+        elif field.type == descriptor.FieldDescriptor.TYPE_BOOL:
+            setattr(message, field.name, bool(value))
+        else:
+            setattr(message, field.name, value)
+    return message
+
+
+def array_to_metadata(array):
+    """Builds the PhoneMetadata for a region from its array representation."""
+    return array_to_message(array, phonemetadata_pb2.PhoneMetadata())
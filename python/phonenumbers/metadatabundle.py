@@ -0,0 +1,158 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single-file bundle of the phone number metadata for every region.
+
+A bundle starts with a fixed header and an index giving the byte range of the
+serialized PhoneMetadata for each region code, followed by the serialized
+metadata itself. At runtime the bundle is memory-mapped read-only, so loading
+a region costs a dictionary lookup and the decoding of its own slice, and
+processes forked after the bundle is opened share the same pages.
+
+Layout (all integers little-endian):
+
+    header:  magic "PNMB", version (uint16), number of regions (uint16)
+    index:   one entry per region: region code (4 bytes, NUL padded),
+             offset of the region's data from the start of the file (uint32),
+             length of the region's data (uint32)
+    data:    serialized PhoneMetadata messages
+"""
+
+import mmap
+import struct
+
+from phonenumbers import phonemetadata_pb2
+
+
+_MAGIC = "PNMB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_INDEX_ENTRY = struct.Struct("<4sII")
+
+
+class BundleFormatError(Exception):
+    """Raised when a file is not a metadata bundle this module can read."""
+    pass
+
+
+def write_bundle(output_file, metadata_list):
+    """Writes the serialized metadata of every region to output_file.
+
+    Args:
+        output_file: a file object opened for writing in binary mode.
+        metadata_list: an iterable of PhoneMetadata instances, one per region.
+    """
+    write_serialized_bundle(output_file,
+            [(str(metadata.id), metadata.SerializeToString())
+             for metadata in metadata_list])
+
+
+def write_serialized_bundle(output_file, serialized_regions):
+    """Writes a bundle from metadata that is already serialized.
+
+    Args:
+        output_file: a file object opened for writing in binary mode.
+        serialized_regions: a list of (region code, serialized PhoneMetadata)
+            pairs, one per region.
+    """
+    write_bundle_index(output_file,
+                       [(region_code, len(data))
+                        for region_code, data in serialized_regions])
+    for region_code, data in serialized_regions:
+        output_file.write(data)
+
+
+def write_bundle_index(output_file, region_lengths):
+    """Writes the header and index of a bundle, to be followed by the
+    serialized metadata of each region in the same order, so that a bundle can
+    be written without holding the metadata of every region.
+
+    Args:
+        output_file: a file object opened for writing in binary mode.
+        region_lengths: a list of (region code, length of the serialized
+            PhoneMetadata) pairs, one per region.
+    """
+    offset = _HEADER.size + _INDEX_ENTRY.size * len(region_lengths)
+    output_file.write(_HEADER.pack(_MAGIC, _VERSION, len(region_lengths)))
+    for region_code, length in region_lengths:
+        output_file.write(_INDEX_ENTRY.pack(region_code, offset, length))
+        offset += length
+
+
+class MetadataBundle(object):
+    """Read-only, memory-mapped view of a metadata bundle file."""
+
+    def __init__(self, file_name, data=None):
+        """Maps the bundle file file_name, or if data is given, reads the
+        bundle from that string instead, as for a bundle stored in a zip
+        file; file_name is then only used in error messages."""
+        self.file_name = file_name
+        if data is not None:
+            self._mmap = data
+        else:
+            f = open(file_name, "rb")
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            finally:
+                # The mapping stays valid after the file descriptor is closed.
+                f.close()
+        self._index = self._read_index()
+
+    def _read_index(self):
+        if len(self._mmap) < _HEADER.size:
+            raise BundleFormatError("%s is too short to be a metadata bundle" %
+                                    self.file_name)
+        magic, version, region_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise BundleFormatError("%s is not a version %d metadata bundle" %
+                                    (self.file_name, _VERSION))
+        index = {}
+        position = _HEADER.size
+        for _ in xrange(region_count):
+            region_code, offset, length = \
+                    _INDEX_ENTRY.unpack_from(self._mmap, position)
+            index[region_code.rstrip("\0")] = (offset, length)
+            position += _INDEX_ENTRY.size
+        return index
+
+    def region_codes(self):
+        """Returns the region codes contained in the bundle."""
+        return self._index.keys()
+
+    def has_region(self, region_code):
+        return region_code in self._index
+
+    def get_serialized_metadata(self, region_code):
+        """Returns the serialized PhoneMetadata for region_code, or None if the
+        bundle does not contain that region."""
+        entry = self._index.get(region_code)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._mmap[offset:offset + length]
+
+    def load_metadata(self, region_code):
+        """Decodes the PhoneMetadata for region_code, or returns None if the
+        bundle does not contain that region."""
+        data = self.get_serialized_metadata(region_code)
+        if data is None:
+            return None
+        metadata = phonemetadata_pb2.PhoneMetadata()
+        metadata.ParseFromString(data)
+        return metadata
+
+    def close(self):
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
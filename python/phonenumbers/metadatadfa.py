@@ -0,0 +1,258 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This file is automatically generated by buildmetadataprotofromxml.py. Do
+not modify directly."""
+
+
+# A mapping from a region code to the DFA of the number descriptions of that
+# region, serialized by dfacompiler.dfa_to_string(). Regions whose patterns
+# the DFA compiler does not support are left out.
+number_desc_dfas = {
+'AD': 'eNqt0slOAlEQheGfHkAQJ6TFGWcbowkqMrgxxL0vgOzYuDa9Ut7It/C1XFhX9NhtYmKIX1LVJ3eo9OLGPhBXrCUFa/ejp/Zpd5xU3erN9eCy1T7rDZ/Pu82GbV2Nk/Dz0DgpWhp0usOf6yW3bveyGzazbMkGDZoXbquVvpO31Juc9yze9af9xO7z0R5y1h4DF1M83wsCLwjDfIEZQblouSQwK1CWzMi5eYGFVF4UWBKoSPbflgWqUTWagBWBmsCqwJrAusCGwKbAlsC2QF1gR2BXYE9gX+BA4FDgSOBYsmd+y7FAQ+BE+JPJkwjck3hhSm8+/yHKfVfHqm5Vs9HuvX5V3+rV6tbqHRakVXk=',
+'AE': 'eNqt1NtPE0EUx/EvLVCEAgpe8AooYtFFlpXdtiiXKnhXvGFNauMLLz6TxgfZv84H/gT/Df8Ez3Sbn7Mmool80pk5c3bmTJNOt1IEKhPWdYas+7j3NQ6Wo7QzZZNWtFitty1VDWrpQS0MLYyCetopZSurLp5x+zdWbe1KYqttrNmWgyQMW1HcXnAF085AtsGWj1gUt8I46dZN84dO2mSle0ySO+/X9rJFdSsdRu3fK7tHVfco7j0qWOJl49+Hihu63ec+6/aDfnIKhWKxf2CwNHRimBGBcnk0Y99gzIvHy2bc9XDSy5/y4gmvzqSX95w+I3BW4JzAlJc/L3DBy1/04ktezcte3ndFYFpgRmBW4Kq49de6H7d+zg1zWXxdYH56XjVviP0EAgsCNwVuCQQCiwK3BZYEQoFlgUjgjtiNFLu6AonYxROoid1VgVWBuwL3BNYE1gU2BDYFGgL3BR4IbAlsCzwUeCTwWOCJwFOBZwLPJR+/EPt3CewIvBJ4LfBG4K38X/xO8vldgfcCTYEPwh9lrw730tjf6+P4/SgeW6nGEe3bX577a7aPaIdebLeKnd7ot8PeuGuv8aa179a+WPvk5qPZvFnKn+mPPwEQrPv5',
+'AF': 'eNq108tKw1AQxvG/SWs1sVXr/VrvRrBQatu0bsQX8AVidm5cS1Y2b+OD+EC+g84x7YdZSRF/cGaGOcwhMCTygahpIatZeHx6ja9HeRZYnXTbcWqNYV66itzA3W3S7adJpz1Mx8lNz1W9dDyw1E+vbHDkBgd5Vi0GbaxuVZx0+nFxF+eZZ52H+/9IkUvf4XnOwsuHiz94nl+p+NV5z6uxILA4FUzqwJn2izp0KQzCMCw9uVQXaDSWJ1w9BStS/p5VgabAmsC6wIbApsCWwLbAjsCuwJ7AvsCBwKFAS+BI4FjgROBU4EzgXOBC4FJsfcLMitVX3OrfZp/m/dPnr6q/HNsctiVa7rew8wWoPk8G',
+'AG': 'eNrF08tu00AUxvF/k7aEQgsUQ7m1QLnFjQOOYztOKZRyhwU7xMJYbNiwRhELnB0vxlPwOpyJ0y8OdEnFT5qZz8dzLMuXdhNor9s0atn08fP3QdALx6MVO8ijbFhYZTieP7dtB1Gatfd3YxtpHnb7RZnFfpm4HBW+7YzHo+Wqx3UEs440Lge2RrZzWJTuyFJi/Xk/yQr/795Ni64zDMskKdO0HAzKLPPzqDu5uXRu86rFYRjWTjas8u7g6KXWuFbdYZzlYa+o7uGolrZbJtOXBZu+/nCPr6bRaDacxaVlTgi0Jk7agBUXT51eXbN8pnVo7jJnzwmsyyyft+z9Wffqe7z6fq/e61m+UOutuyiwIVW+dHnjSpWvTrl8bQo2BbbkMF/fuqF8c1rftvXW7TuW7wrcE3vUAr7AjulMcxD4/s6srj0dqXo7c/UqT8odN0FX4L7AA4FQoCf26Qj0BWKBRCAVGIh96GLfscCuwEOBPYFHAo8F9gWeCBwIPBV4JvBc4IXAS4FXAq8F3gi8FY5F9Usuul8yWPgH19tr8r8sHcN4b6/4g41PNr65/BN+udVe8W/OW7Yl',
+'AI': 'eNrF00tv00AUBeCTR0sIpEAIJKVNm5bS2hCD7fjZd+hr1x3qwlh00Q1rFLFg8jv5Myy4Y5sjG3YoUj9pxmfmXo8SyzYaAIyuTLOWTJ/vfoRjx57P2rJI3ChOZSeeV2sDWbiB5xkn+0HiuKmKkzBKTal789ly3qn7nLxP2tyJr7wwUL7kSRJYcaqixLG81FShLscqdM1/DxhKjKRu28r3VRCoMFRRZCaulf2uoNLckRjbdqlYl53r6f9eDH3Jpq81mb7d6idVUq836lpzaRkPCGhlHsoA2jo+etxZkfyk9UflmKfPCOhSnp8XuffXfrdXytmC9/ZKWRbAi9K9ZS8J6JPOg/7qq/5antcLOg8LwAYBm5TlUSmLre3N11ne0as32f6ujnu6xyDAJOAtAe+oyOMiW1Z1PyuwX6rcF5L1pdKvSzqPec57Aj4QYBPgkLzdBEwI8AjwCQgICElecpJ3mIB9Ag4IOCTgiIBjAk4IOCVgSsBHAs4IOCfggoBLAq4IC5N/bk39uY1qCzjvVwP3aWlB45M8ixsZ32V8kfFTr+Wv/QZv/qdI',
+'AL': 'eNrF1MlWE0EUxvE/gRgUQwScECdQMUGimbrTwQFxwnmeY6sLN645WdnZufQBfBx3vpa3utOfaQWPLjz8zqmuW7duV3WSTpVHgfK0XXoFu7z58Mlb7vR7CxZ3G1WvHVqm3Y9864J+FMTzNu64oP/zlqDf++oWWl1pWOvW/SDs1qudMOo2Wm6NqGPDdliJmjZdt7jppqq+m+q2O644CKMgvqcStWzNRj/yBrWtuNZrB67at4QXar0g3i5ewBteMt7fCirJg+aTB7VPNmGR3/Vtn/iTpTMWjVsU1Go2aCntJ+lOnG7+mg5qQSYdJOl2XG275mxwf+1PXdl18eXjiF02voyRkcuNjuV3FMZ37ppgt0BxslQs2WVyj8VTJWd60n7Fklh+xvV7SyWr2Rfbb+BAMQUHZw85c3OzcPhIKvMIR48JHBeL51MwPxSn+bTmt/o0zuSTeEHghMDJoX1PLSZOL8Ji2XEj+xolzbsZqCylYGkoHnZGYFmgKnBW4JxATaAu0BBoCrQEPLG3UuwVEnvLxF5EgRWB8wIXBC4KXBJYFbgssCZwReCqwDWB6wI3BNYFbgrcErgtcEfgrsA9sX+LwAOBhwKPBB4LPBF4KvBM4Llk4xeS3Xc4finwSuC12HkqdlgIhJK9d6t13srW8TuB95Kt+RvJ0eQOpY3PI2yfb6P/fYv8v7b85q2QtuKgLyS9/UM2bd+trQ9a3o7qgjV3ZOcHrWDHypTNzViz04MftGs5zg==',
+'AM': 'eNq11E1T01AUxvE/KZWiQQSqkqr1DbBFCmnaJim+IAu37BwWJeOGjWunw4L0c/o1+Aic25eH1HHBONPfzL335NxzT2baJI0S0Ni0abhi08Xlde8gHQ3XLB60W52k1c8sl4zmdr+7MyfH7fDiMo8siAZRqxtneceOpFnetcu4n+U9W5Msjy1rV6ktSdZ0RVEWNV2v0bA86Wo9q5OeSZL3rbBr511JXCypWJSG4d8nfYv64SBsx9m/ttLQ9ZtueZY4O73/0nDLePq1ZNPvbfdzFXil5bLneQ9WKqs8FHjkz4Dvrz1ef7Lhb7p4a6uQH6u6+Gmh/lnVuHR17lbPtwUCgZq42FK1YBLPSmZ5i2qB4mCuJriLp33U84XAy1dmmq/X3Vofx0WvBd4IvBV4J/BeYEdgV2BP4IPYXyPQFNgX+ChwINASOBQ4EggF2gKRQEegK9ATiAUSsYdT7BkWOBb4JPBZ4IvAV4ETgW8Cp8JCTF6TZfeaVJZYrJvSfx8tL2D8sOmnjXMbVzb+uNi+oef21bwFb3eaBQ==',
+'AN': 'eNrNlMly00AURW9sQxiiEGKMGWUsK2Bhy9EsOQwmzFPxA4p22bBiQWVB0f4TPoZ/4gd4LcvXMpWiKhuKU9X9bt/ufu9ZKnnYBDDclelkU6aj4+/pOJufbIvO/dBNp4VYyTidr21/0ZdmB6GfqVhiEKvo6FhleRBOC0elYvl5nGaFij1HTWWZR5lOFMzFkZP6RJB7blCoPIxkRyV5GLtpodLUcRw5Gc1V5Ce5pzPKMlyv/229vp97fqF0QskQl514fuJmVS9euZ1nOtOiHX0p94Mo0aVDve2opPSS8hdXXr0TP3azqpOGVP90eHr48yHq7jyVTHWm+O9XTwtDHcrp84ZMX3/o11Wj0Wy0zp3fvNC4eAmXCbBlLAGM7Zq+UtM7V43dtmFc03rJFrDTkXjdMNrthd+9cfNW11gre/sOAe4SwCQr3aO+V/r9/upMX9PTDmCRyi/R2rJMU6RV5bFMMeR8rdaAiLbtPdu0Fz3Y5p5p2rLUd+8PBuaDofbrOAR4SIARAcYEcCeuO5oILjAh4hNgnwAe0XqVUzapZdoflQbrltonQECAkAARAWICJARICZARYEqAAwI8IsBjAjwhwFMCzAjwjACHBHhOgBcEeEmAVwR4TYA3BHhLgHcEeE/Orj8Q4CPBmVl8qi39qUYb+Kf8/NXE/0hHnkZX/la6EmcyejLS1mKtR6eKS/838ejo0A==',
+'AO': 'eNq90TtOw0AQxvE/dgIxMQ+b9yOEN6ZIgREE0yAuwAVsOjfUyBX4LhyFo3ATmHXEJ6dMAT9pZmfXu15pJ/GBJLZUdS0V5VtWV4FVeZo92+yubq0PrEqLMnm4z9Pbkfv+XpST8tJ23LT39q3K8qvRtfvLuK48mz89/sWQuKFJL3OWXr9cbvE832t0uswLLAj0giDoNaaOLvYFwnAptDCwLLAi0/euCkRRHFkYiMWt/4I1gXWBDYFNgS2BbYEdgV2BPYF9gYHAgcBQ4FDgSOBY4ETgVOBM4FzgQpjZpN0d1+6PGY59fvv8B+sU1hXs5Rhb/ACJZkk5',
+'AR': 'eNq91Elv00AYxvF/m9KWQqAt1OxrMMSQgifOWpa2tGwXbpyMxQUJcUaRkLA/K1+EA+/YyRPn0Auq+EkeP/PO2PE2aTeA9rY1k3VrPn/9Nei4bjFpWid1u+PMKuOOc0VtOC4mG/XhYvHQb9YZt/f3nEu71YxhkVu/67c0dkmWJ8N8kLpelo9TNxxnUZ7YWC913aSf5f3UJaMsH6WuPxxlUTQ7y6DIre0Vs36/iCar1Q/7S1qzOIqtMyrq5U2LAzu7jeQujsqrmSxb8ePhv+7aflc235es+fHTP8Oa5Ya30jizusa6wFmBjXPzfL5Wb164uNksLZxya1vgksBlsVyr7wgEYvlKLQdXrwXB9SC4Uc25eSsIbgeL93JH4K7APYH7Ai3x+cEUhGErnNdLYZnD1nSgymU99Hl2RFkPq4HpHOv7/FDgkdirEYgEHgs8EV+f547ArsBTgWfi58RTEMfz7AS6AolAT6Av9rkKDMW+brEFJrAn8FzghcBLgVcC+wIHAocCrwWOBI4F3gi8lZPzO4H3Ah9kMZ+kWoYrfhm2lzgdfxr8LzunvH2yZ/DFb3YLv6d5y+r2j0DCPP8F2qzDgQ==',
+'AS': 'eNrF00tv00AUhuG3SVtCoVzScKelQAEHYnAcx7HLpS3XHTvEIlSwYMMaRSxwfid/hgVnfPmYwA5F4pFm/M34nFFi2UEbCLo2zTo2ffj8fTIYRvPZhi2maZYf204+X7y3Z4s0S9LgYD+Oi9GoSJJiPC4mkyLLinw6zI/7VpvMZ+tVl+vZqnqsZWIN8Tj7u2TbYmYFUeROS9PqwP40DstfkS4Ub1rMo8i72bKdt0f/egncpZy+rNj09ZN7Lp5Wqd1aXVvnhECndtKe0IYLp05vnrF8trnRWTjm3HmBrlR5q869P/a7PS+XC/X2vGwLuOD1+i4KXBKXL9v1ytUqX6u5fL0G2wI7UucbTd69eev2zt6du+X+vaYmEOgL3Bd4IL/zoMyhvx/6NaFfHy70hv45ocvNMWG5P2jOeSjwSCASGArEAiOBRGAs9r4LTMRecrF3WGBf4LHAE4GnAs8EDgQOBY4Engu8EHgp8ErgtcAbYWmqz23VfW67K0s472eb/2ltSeOdPYv3Nr7Z+Gjjh1vbX/sFLjGjRQ==',
+'AT': 'eNrdlmd3G0UUhh/sNAgbQwwJECAEAkghgu2rtWIbm9AJHQzZiFBM7zVAZHrvf4pvfOfvcGdm9VrihHIOBz7wyLNz585779yZlXbdmQU6u+3y9g67nFg/nR1Oso3xIJ8chJnjZ0ESRunGqLO8kFpLmryshqO0SbK81x+OiibNCnOUTdLLS+epzLKu3yRp3qu8kRf9YXeU+XA/mbmo0oy8KZymsHRVP2TJfHDWK11M7pZtY4pRmbnsWekVaW7rdkeFz5qGmkJuX1Buy4bMaRFSZ05eOnnmtXlQ9bIibCR3ecu0O6omFm3SwquyvPKiMlSpnZbDUd3kxbDbDScVb/iKYpuqh6Omqocn1t1U6qeqNDa7dPb4rCt/1ods4ErLc1sjtpIs0NaJkyyk6Y3z5JOxtY/dZYN+3MTp8Pe5w/wBd+OXF6okGdW+tDhxG4uTOlR9hpA9LqU7qdhOKk7sTkg3Y1N3r4y7qaidNqj68R9IQ9dxnb88b18v3vxlG1PMzG7Zum37jrPP2XkukYBdAqK586Lo/N3zF5g/mo8u3LP3ouhiZ0fzl0TRvksvM/vy/fNXHLjyqoPRQfPvuzq65tpOt9s1+9B1h3vX3xAnKWR5ofxlFFVje4J+LWBBgPMM6sHA+b3hcLbzuY/3O1/rHww2NYM2QHoXEHJ6eZvTj9rYsJ7XhKzSh9rG1mbsWNOmd/aRMcEfYtpY1Vy3f6HOEK783n9kMo+vZnO/i+2+Fo2B/zh7sBgI/rFdL22e7fLk+bQV6Gxr1VBrX4PxYelsvf7GifsVFMFeqVfkX53QrLaDVbOXJuqRvTT9/bxJwFEBNwu4RcCtAm4TcLuAOwTcKeAuAceE/YoE3COm/fcKuE/A/QIeEPCggIcEPCxgTUzbjwh4VMBxAY2wB4aAoYDHBJwU8LiAJwQ8KeApAesCnhbwjIBnBTwn7Kkk4AUBLwp4ScDLAl4R8KqA1wS8LqY1bwh7KAp4S9iLW8A7Ak4JeFfAewLeF3BawEjAhoAPBHwo4CMBHwv4RMCnAj4T8LmALwR8KeArAV8L+EbAtwK+E/C9gB8E/CjgJ8G/Qni1bXGvtqMz/P+JZ9lq3d9p263Ntf1ftbl/qNlrbb/7d6S1z9T+bH7NHuMnrZ2ytmaP7rWf4VdnH/vv534Ds7R6mQ==',
+'AU': 'eNrF1Nlu00AUxvF/k3QxLQHKvhYChQQScJLGccoSQgpl30uBgLjhBokLpMriAvx0fQEeiTMx/rARikBC4iedmTMzx+PEGrtaBKqL1kRz1rx5/yWoN/04Kttg1Gx0uuFbm+vUe3E0m6yHLp93y612shrG0XSyZisLlq2M/EYwXurG+W2XbdCs9ldD3xrfpltxrf+17QbpqGb9ShzNJJelv6XZ80d+sxW4TYM4KtjUw0Ha/by7u1lnvFUQ/zrd8X93bdJVXTduPkxZs7VWIqdQLJWmZwqlUmGWOQHP83ZYePP2t3cKlBNe2YNdrmC3a3Jb7lkU2Cuwb38KDmTmD2byQwKHBY5kao5m8qxjAscFTiylYCmTnzyVgkqlYrWVcf1pgTMCywJnBc6JPWqBmsB5gQsCdYGGwEWBSwK+2NERaAm0xU6suIOSgkCgKxAK9ARWBS4LXBG4KnBNoC/5+esCA4EbAkOBNYGbArcE1gVuC9yRfJ6tuStwT+C+wAOxt0vgkcBjgScCTwWeCTwX2BB4IbAp8FLglcBrydf8Sf63kk+K+5hsfZzi31go8r/Z6cNOGts/YjghBpl8Ur2dUNYnxIYdk81MvLP47PJPFt/sPvZ8hxbbrrdH9B12N/3t',
+'AW': 'eNq900tPwkAQwPG/PBRrfSHiC3w/QKzWAqXlQvwC3oyHSrxw8WyIB8s39O6X8eBsCUNNPBniL9ndmdnZ7qFtLQvUijIN8zI9Dd47o6ElUdR2wr6k/ii10ZCoXet1PUm9URxIGHlOR/riIHKdTtiPw6gV9Ot1aWimTzrmml63HfnmqbHvu3EouS9xGLme3FWPO1GzJZvmbCt9tiBR4Lq/lcNJOSPJ/d1fl5pZkullTqbXgQlTMkY2l59fKLCowLKWLMuyrWXbxMaKjCS27SSHVWsC1pJVdtZ/PL64oaCkYFNBWZmecXVrW+qp/p1UvJuKy6Xp2bQ9BRUFVQX7alqvVMf91WTAgYJDBUcKjhWcKDhVcKbgXMGFktekoK7gUkFDwZUCR8G1ghsFroJbBZ5iZsafXM58ch/M0FeW//IgP8yjjGcZbzI+TS7XfwMg7nHm',
+'AZ': 'eNrN1MlyElEUxvF/IDEOUTSadiZKO4CC9kA3TRxInMe4slwQyk02ri3KRZql7+Vb+Dh6bjd8glut0l9xb58+fe49FwpoVoHmuk3jVZv29g+ydn8yXrN4GHaykSV67Wyy8PCrWzLYCm3Yaxi5qrzfsimI8nAYdJKsP8rjYZxko7w7DMK407NEYk+6LkiHQRSnHYt6loq61qaVR27HNI9sl7jIuqVhN7UtksSWJKmV91t5nCaDvX1rdpBMxivlqexM9fJM1q1bdAoT6xO4Br2RK+7NF7s3k2VltmLx7s7fuTTdpZg+Ldn0+Zv7cOdUqssrh1YPHzlaOcaawPETtZOn1k+fqW2Ad3bj3PkLFy95nsWFy56L6zbXi3uLdVPmPW8hrv9a63mb3sIRrlwVaDT8Rgn8gmV8uCauxopcvqhplFX+tL54ZnGjXOmX+WnRbM8y35BZ7M/6Tk9h+XLDopdKFPtza939dP/r5f43BG7K4uffFGgJ3BK4LdAW6AjcEbgrEAiEApFALNAVSARSgZ647+wM9AW2BO4J3Bd4IPBQYCCwLbAj8EjgscATgacCzwSeC7wQeCnwSuC1wBtZjN/KYrwr8E74I+XPedn9nLeX+Pd+VPmfuD9V93da++3qxnsbH2x8tPHFxncbPwEJu9kg',
+'BA': 'eNq11ElOAmEQhuHXBkQZHFCc5xEUFGiGho3xAu4Mi5a4cePaEBfC7byDl3DhEawf4heRjTHydKq6+q+ekq50LgLkMpa6cUt3Dy/1QtDvpqwO/WI9aHZsqdEfaWbdJVet0K9Zs1dt9oJy3vX63djwLDsnbVU9LBf9Wr3zs5ewKghLwVjDPbUZlirV8Wvc84PKcNWz+ub697uc2w3S45Slp1dXfuN5XiQaiXnT8RlmBRICyS+uTqVSFnYA6cTcYDlt9XxyuLn1bxYWBTICSwLLAlmBFYFVGX3/NYF1gQ2BTYEtgW2BHYFdgT2BfYEDgUOBI4FjgROBU7FPI5AXOBM4FygIFAUuBC4FSgJlgYqAL1AVqInNs0BDbC7FxlegJUzEcKSjbqTf/+N+H5GJvGbsj3Fr6d6ibfFs8eZq+6+07V/wCa+keb4=',
+'BB': 'eNq9009T00AcxvEvLWBBEMWCRkAbQGyBSghJmvJXeAHcGA6lw4WLZ6cn0vFl+mY8+Ns2fUwZTk7Hz3R3n93tbibJpl4G6stW9SpW3T08tvYPg35v3jqdMG13baTdH59btE4YJZ2wOZhO+r3Z4bSb3BlO1i+O7Rd2jqKkm0VxloaNu4csjDtBM+pafIzGVm1YTG1BEGRxnCVJ1mpladp4/hLu+u0gKEyWbOT68l+bumsG1fcpq35su2dSUCqVS870zCwvBCpmzlX2dOZd83Jh8ZXlpcrI2Dav3wgsyyi/HeTq0/Fq8T/VQnadv/tULa8U1hatCrwTl997HzzPW/NcXs+5vJGDjwKfBGq1mu9v+tYMci7P/ij7Gt8S2Bb4LLAj8EXs1Uie8/GGwK7AnsC+QFPgq8CBQCBwKHakBY4EIoFYIBFoiR1ysTMscCxwInAqcCZwLnAh8E3gUuBKmJjhJzPtPpmFqQns97vM/zIzoXJj931r5d7KTyu/XN9u4w8ZK5Lp',
+'BD': 'eNrdlXd3G0UUxS92EhsClgggY5qoRjJW0M42KWsjAgghA5GT0FdrmimhN9EyIrSE3kPv5WPwLfhA8GZXururc8w5HMI//I52987se3feFEmVaQCVXXIbzMqtv3nYW7bqw8HF0ghVzW9G0uUuN4faEiGPRliv+abTWW4MBzPjnOZwMDcFqEprj9/ftHRDRFhXXmTp0LLFJrRqbiTZVq0RVXVTXtfFSUXaki4n0nZomwA3dL1Ie6HnR9q3zGi+xFfNeENtG1NPDCwd5ys70qFyxVt8Gko7lieR5p1taUu1QldKNblqaO72UDvyzqQqHTrNyNOhJ2bVxM0SNyWzbGljbCJcP7H2QtWIRs7K1qHdlKTYNl4Ve+zuJu4msSYh2lOxdeypYidbJivDuMq4eZYpTHtJSjIpyzKRshDjQXS8kMmkPTWajPaTkWylm6PylZY5m2Uz45g8sZScpEqVK7ORJDtxRfEaKTOPVmJkahz3SzGWL1mj9Te7FtqjSmV3HUlsjIuU0aXDyi73YEdyPMyBcs05kyhZ5po5VPEuhbK52nGq4iWd8Uo4jix33Ix33c+Z7BTZkHNjR8krOXHYt/fEPCrmEd8OnSS3Z383ZzvD1PS27TtmZk8+ZeepOI0Ac4W5QgJQTDh91xnAmWeV5s8uLZxzbhE47/wLyheWLiotyNeqeMmlly1eXllcXASqS1csLS/WqtUlYHfxyvr8fKk0vwBYynZK5XLZ+O92ywvlhWLRK+bK8RsEaBJgDwECAqwQ0asrq0GwsnrVKtC6OtgbXHPtynWBiW+3x/FBcH0QdDqdWI+7je6knsENGd1N9Vp3bYTRN1IH7S79O0T6b2p3Uv90rLW2yb05yR2ltllDN47ZR6S/10vr6Y0botczda5nYvavp/pAJqY3oXupz9q4tgMH03kFmfW5JZPb7lLf2m7LxwDcRiTm9kx8p0PdJsYnjclyBwHuJMBdRH7Fieh+Vhuy2jTlq9bv52PGOgzT+DBupTpuSC4bQERGMRsbG2HiP4K5sc/dBLiHAPcS4D4C3E+ATZLXublvpvoBAjxIgA0CPESAhwk947kcIsAjBHiUAI8R4HECPEGAJwnwFAGeJsAzRH6cCPAcyY81IMDzBHiBAC8S4CUCvEyAwwTQBBgS4BUCHCHAqwR4jQCvE+ANArxJ8mNlc48S4BgB3iLA2wR4hwDvEuA9ArxPgA9IPv5DAnxEgI9JPuYTkvf/lACfEeA4AT4nwBck3/8lAb4ieZ3N/ZoA3xDgWwJ8R4DvSV7/QIAfCfATAX4mwC8E+JXk+7eK+Y3gH5P8lW8zf+XHp/D/5s/p/8x6duJ5on3/rUfWZ3vmmpm4Clu0C1vkFSZ0YYvYSd+/e79froPmQMr1h1x/Af3tQww=',
+'BE': 'eNrF1Mtu00AUxvE/TUIKTdw25damQK+QQgx2brbTBWKBuoMFS9e7bLqusqrzfN3yKH2ALjgTJ5+cRSWEhPhJM3M8PmdmJE/SqQCdlnXTunWXk5u4m8ymDYvT0E8ym4i68WxaW7ycTX+6gi/jMA38UZLlaa+fpT0/tmiQZO4pH15O8lEahH1/GNkSeZSGcXZm1aNZHltpMF85tz5yG7g3Q+1gm7ctGlheZOvE6cDlJvOSYo3SWdYtioNgZQGb3i6OmAS2dRAty9Zs9vvXvx06bph3V4+su/7lwpK1SrVae1xff/J0g4ZAs+B5TbBu8VTEnudtbm0rx7jYJXnzuOUyPK/l8neWpW6+qDUrR3j2XOCFwEuBV1LMKy7N7wrsldYpawvsC7wWeCPwVuBA4FDgSOBY4ETgVOCdwHuxzyRwJvBB4KNAV8AX+CTwWSAQCAV6An2xyywwFBgJRGJXWiARGMtqfC4P5/yJ4npX3fW+4x+4r/C/fLMf7Q9rF8tmR7m10f1V7Fizr8Rv+eWWEQ==',
+'BF': 'eNq9k7lSwzAQhn+UhCPBHCHhCmBuEsDg2FIc0zDpGV5AcUdDzbhCeTcK3gtWsbOIkhngm9Hq82p3XVjuVgB0mxTyGoXx0+twkjfIdCRVktFzMnFORrb6/i4KKcjUKB3FmUl12B8EadYzcprXapBmRimT0EFi8yrUsaRhPZoi3XkRWUI9OoxkMKAK09dhIIfUH1NzZoYUY5o9fUmU2QFqkgtqexz9xda12zQ8z1F4ebDqIERFVGtiXogFLDLAUn0G0HB82XFvxVv1PK++tv5tZHODAVpEe5PCVuEFhW/vtHZL73TK/B5TOmUL/+old2s477LPAAeM475135/lC/OJssYm2N0aevKtzwAOGeCIAY4Z4IQBThngjAHOGeCCoc/HAD0GuGSAKwa4ZoCAAW4Y4JYBQgY/prhaVXu13vF7vH1U8F+0adHthG//XVqfHOtvvA==',
+'BG': 'eNrF08lv00AUx/Fv44YUEqBugLCUpawJpODEiZeylELhyAnUgxP1kgtnFHHA/g+58+/wJk5/OAgkkJD4SG/m5eWNJ8tM1wO6WzbMGzZMZl/iflrMW5Znw910aoWonxQ/3rT82C3Z3xtOZnkWRtaSj7OB9eaJTdE0T22Kpz1rH/ejIrfWkUU2GI6sbN3hoq2Xx1YNypWLcTLruUWj/lj7Je7DdMv9kix2rWnimuIidw8NsyBO3M621u1XzOvLhcV8w7IkCH4uuyenrhoV85rl7w5OpuoP4BbHJ4tX2341dd20GD6u2fDpvftZK2o1z1uve6caG6c5I9AUaDWbZ112rrXIVT9fyTfLxPd92FpW/dbKVu0LAhcFLgl0ymKn07Fc4HKl/0ql/6rANVn9jtsC1wVuCNwUuCWwI3Bb4I7AXYF7AvcFHoj9HQI9gYcCjwT6ArsCjwWeCAQCA4GhQCgwEhgLRGJHTuzsih1YgT2BpwLPBJ4LvBDYF3gpcCDwSuC1wKHAG/n7/K2s1v9EecXW3RXbXuPf+urxv9U37bpbNH4TH+zaH1scWXx2sx23b8vXR23wradtEVp8B4f0wM4=',
+'BH': 'eNrN1E9T00AcxvEvKYi6IFJFEWgURG3VakPaJAWxIn/UizfHQ9rxwsWzw+iMYXyZvg1fgr9N5JnCSQ46fCa/3Seb3c1M2qRZA5p1a46mrBkefs+Oj2Ys5VGctPsjG0iPxy4N/PTBZmQV53E7GRVJ3ol61qfDw1aR+Gt5VA3H3aQ/Kvq5ta0i9ddtj974btvVbrFVHif+bjavyPI4G517r2lLWcdyMj66UN0hS21tJ+r2Utv57JxyZbcaDSy/3/n7rum7svk8Yc2Xb/55jglqwWQQTF2avnyFqwLOuRnnZq85V+Y5O67Pz1mu25m74dzNctxb8HNuWbjt3KLPi9Za2XHqVneWBJalzCumzGWnfAIaorWNP2sb1Ynl0KewXGttGPocnsyvcihwV+CewKqcflZrAvcF1gUeCDwUeCT2cwi0BB4LPBF4KtAWeCbwXKAjEAlsCMQCXYGeQCKQiv0XBfoCmwJbAi8EtgVeCgwEXgnsCLwW2BXYE9gXOBB4I/BW4J3wz1Wv4aR/DZsT/B+/alx0H+xL99Hqk9VXqx9WP/3YrJV9+34Dh/G6YQ==',
+'BI': 'eNq10TtOw0AQxvE/6wTzNoRXeIYAhVNYSpxEJjSIC3ABx10aauSK+BYch4KbwdiBT6ZMkZ/kmfF6diXPhh4QtizkTQvT2ftDkW9alcZJZm9JUVtvWxXH4dNjnPajJJunw2ic9Xv2cVRv65ZHWtNkOpsnVgzSQTS07lE0sSN7Zf+4yJ11vTyvIoVlqsLrmoW3zzLWOOc503CuybqA72/4Fft/f8tS5d/W7R2BXSnrvSAIFvW+2LrFv566A4GWwOGvqq6tHwkcC5wInAq0Bc4EzgUuBC4FrgSuBToCNwJdgVuBO4F7YWmLq2yUV/mx5Navb49VsMljU8YmQWLPDyevSIE=',
+'BJ': 'eNq1k8tOwkAUhn8Kioq2gCDFG94taqX0jhs07n2BsTs3rk1Xtu/io5j4Ij6KZzpwBGOMifHrnDP/nP5zaTK1ygCsJqW0Sun+4dm/iPNUFoQbxqOEKlGeRdR5ebqgLGTokXKt8ZXjZkPheFGSucIPkswTYZz0yRPMugekwpB0mGcjOUs44SjJhBckwrFdP4hsOQztmPabn+3naY1UJDw7kIdx81Sj8d3Nb7rPE6ySioNIBHIHueh3fkt2RXosUXp6kXIGTStrmlZZWKwuYZkBVmqra3oBoHqj0PV6vdFoUK5P6k3lWdf1lt4yDEOfW769wQCdjtlRAKYamFLLimmqunpv0jPVqt5lgE0G2GLYv134C0m5W8ztFK07/+07DLDLAD0G2GOAfQY4YCZzD2UDjhjgmAFOGOCUmffPaosB+gxwxgDnDHDBADYDXDLAgAEcBhgy9AMwgMcAPgMEjPwFptCFZvAn1HWtyOv6jn9iXP7x9c2XuKV4m+jSH6J9TdeUokcRSf0KfADcB4Md',
+'BL': 'eNrF0ktOwzAUBdBL0wLlGwqlQAyU8kv5SG1E4oQJYgNsIHjGhHHVEe6uWAA7g+cAF1eMOkAcyc/X9vPIjgMAcUvKuCHl8emlmIybkso0M7LKJ95+JCktBvHdbVLq68LYtBwmxua6L+c3fmdXUlZ1Dgc2KRNtbJZZrW1e6tx8tdek6eH+L6bYTVV5npMyUi56ak5Ql9LAPAEL3xa93Jy6urRMwAoBq15e87JvnYCQXN4Iw1YYbrq81Za97c6O5F0C9og5iuRFpP7ad1lN9Vcr9dOj/H7lZyV5n4ADAg4J6BJwRECPgGMCTgg4JeCMgHOS5yOgT8AFAZcEXBFm9vlV6u6rvM5w7e09wH9py+jIkJeAlvEBzG5WJg==',
+'BM': 'eNrF00lv00AYxvF/m7aEQllKWBooGNxCAjU4jreUJS37iRvi4FZcekHihiIOTD4nX4YD72R56lxRJX7SjJ+ZeWecWHanAXQ2rRs1rTs6+VXs9eLxaN0GVVoOjm1mMF5cG9ogTXud4X5iLU5c0nd5z1X9tPD1XVelud+XjF1mBenRictjVw66rkzSri2k49Ha9EB/XFvHVf3C9rmsiqP+4NhXZguV2xZLf8vYZZnLc1cUriy7VRJNfme+ULxhcRDHtcVlm/l0+K+Xjr9Mum9L1v347p9czbJpWFtZXeOcQNOc9509w3V/uXBx45Lly825hWOuXBXYFMvXTnOrPu+1anky0N5WLdsArtf21t0QuCk+39pq325v3Znk7Rmf787APYFA4H7wIAyDnTAIYVcglOl8GDwMHu36vR3t7Qo8FngisCc+R7U8H0AkNh+d1j8Vq1k4Zyaa5mg2/0wgFugJJAJ98a/3HGQCuUAh9pKLvcMC+wLPBV4IvBR4JTAUOBA4FHgt8EbgrcA7gfcCHwQ+Cmdm+umt+E9vZ+kMzvvT4H9bPaP22Z7HF2tfrf209tuP7e/9Be7MsPM=',
+'BN': 'eNq10DkOwjAQheEfJ2EJe1g72hTQIEFouQAXADoaapQK5W7cDCaAnohoQsEn+XkZjWw59oA4skgDi8PpmmRpy1b75WKVbI52sM4+SuG79FVo5AU1ONvttv+Y4nx6xrlicZnn+cE5zzjfdwFVgZpAXQqtjVCgKdCS4l1tgY5AV6An0BeIBAYCQ4GRwFhgIjAVSnl9nZ9/3alcB7e7x6/sxcxsJDYeyf0wUA==',
+'BO': 'eNrFkk9y0zAYxR9O0+JS/rTFLimFUigohhaILMsOG4YLcAHXu25YM1lVuRGH4AAcg3vA+6zmI2bHDAy/RNLz06dnyaPpCMB0j91ii93F5VV91iwXO9StLZ2vO7GWg8lvsuT9OyuNnl2GinI2C62tGtaHect1RfDi2mB7p3R0GlkiMpTz4G1RhJJOGUMcpWdt01qtrYKzoWJu3YXGM8ZWnJrHN4dSttgFxwVNJ2V88K09912oLy6ZLpEupvvVFp1v5rLJmq8vOOeWi3E8HI+Wyrn10AmfPn74F8NUhr77dIPd5y8i10iS0cY42dxMki3cVIA03U7TWzvp7VR0un2H3d17vebMLntgTxlE7t9XgEwBcoX+QZ5l8n9APcljyaHUHz7MsklfH808O+r1o2zyOMuOn4jOT54ePcv7GubwN5HMU2V4xucK8EIBjELf/PLjaEzUZt03ZlAjTqwZ+GalzfWUZq77K72WGXPMyjexfqoAhQK8VIBXCnCmAOcK8FoB3ijAWwWYKYBVgFIBnAJUCuAVoFaARsEfE6/uhlzd7/i7fP0xwv9g/FvjLcYB2zEbvxZ+ArT5o4c=',
+'BR': 'eNrN08tu00AUxvF/m6YtpQ7Qcr+ae0ITsGM7jgv0ApT7ZYVYGIsNG9Yo6oLk3djxCLwGj8AZp/1wIpCQ6IJfNDNnzhmPJnGmWQOaK9YNFq17//FLvx0Go8GyTfKwkxWWSdvZaLK64R7aXM/DuNfPinLdsJuH3TjtF8PI5okLkjyMOkkxTMsxzYpW3rW523E0mB/v90+79fbON3W6JZv0g8DmvfZ0reG+V5RkxR/qq+OzxK48jIIgalkpHg1mLf96+++HphvK7tOMdZ+/ut+5YrY2V59fqC0eWjrMsoDX2FfGXsNzPRwpc+P4aGXNMZezRZ7n1pexfWBlYs2vuGL1uMAJcfFJc8rA6Ur+TCU+W4nPVeKq8wIXBC4KXBLwff+yX4IrUub9/fxVgWsC1wVuCNwUex0CLYFbAmsCbYGOwG2BOwKBQCjQFYgEYoFEoCeQiv2nBTKBdYG7AvcE7gtsCGwKbAlsCzwQeCjwSGBH4LHAE4GnMhlXn30m8FzghcBLgVdit07gjXBgxtd5zl3nrRkO1o8a/7udur3O6ebttfpv6gvwzca31t5Z+2Bt18WW/27jT7Oj1rU=',
+'BS': 'eNrVlMly00AQhv/YSTCBsASzb4rZJIhBGi0jKzZJIOz7EjjIKi65cIBLysWB8XPyMhzoluz2qLhRvvBVzczfrd48KsttAnDXaBu1aBvu/9QbgT8erZCRq7RXkKc3rj/7ToaKlLuVhbR8ZXIVJkUedHuFiXK/qyJWMakkLYzOwyjRhUnJjgrTy1WXbc9ESWBiyk6oSKAororSKQdRZ89oX3nUNRqPlqv+3P1brXuca+rFW0wVycHlJ7PEdFCxhFw8x3DfpIFnYgpSNFNhwjyMaeKoDKT4JDZaexRPDxOjlf67uVc1D32/fGRSvgDfxLFJKEObNPWoW3lrSS1xlWTP962HDfK83vnXw+Wj3L4u0HbQXkSNRqPZYBaXlnFIAFrEYd7oja7wceTo6jHSx1tTamVOnBSANYH1KdHtmp9oW7o0JLdtaTKA01auzRkBOCuU+tz5CxcvVfryBNZXJgBXBcARgHWn07l2vXPj5i32u67r3b6zQf6uc/ee7waKY5yuE4aOE8UJ+5XkagFIBXqnApAJwGbWF531pwC0ZZZmBv1Bmcuqz/Gld5qb9cWfDaZYuqw/04NazGyezJ4no2xLV3HV/JY/s/2VNdUDyz+ZTYzZPfBv3BSA+wKwJQDbArAjAA8E4KEA7ArAIwF4LABPBOCpADwTgOcC8EIAXgrAK4H+dQLwRgDeCsA7AXgvAB8E4KMA7AnAJwFzo/pE8MfhYLgwh3q/m/hfWZrT2qN7/EzrF60vtH6wTdfyB1bSDcE=',
+'BT': 'eNq107lOw0AQBuAfOyZcTki4z3BKRsJF7PgQDeIFeIHFHQ01coX9HjwOJW8FM17lxy5SIMQn7cx4tDuytHbgAgjGEsq+hKfnt/Q2r8uRdu/vplllojAvbrRf/+zI6jK1OyITh2lRmXhWmCTMiioxUSyNVM7NJGcm0pTrYzMmqUvPjsntwGlmhztSPz78Rwo0NeFlScLrp8YWx+153nJ/ZdVZwzphXm9o7fv+QEhq6ubJ1prnfW2y9gedvt/ULcNNAkYEjAnYou47bxOwQ8AuAXsE7BNwQMAhAUcEHBNwQsApARMCzgg4J+CCgEsCrgi4pm6/XS9ir7Wn1/qOv/n4cn99xluw9MMeytL/KJb1DTQtUbw=',
+'BW': 'eNrNk8lu1EAQhv/MZGFJA0nYE5ZhcxvG4KW9TFhCgMANLtwc33LhjHzCfh1ehZfiwN9tu/AgISEkJD7JXTVVf1dVe9p6CkBvc6k3uByffMnnRVtv0i/jYFExkM3ztl7rk2391W442I/5mDIMTFE1GW1sqmZRhmleVH6TMBmVYZykLNGkaZMdnzR5GUZOE6Q5NYYabkwqJqI4y/sUMykzCTMF97KFsZaawFBTFE5mFtRldgzGk5Q9yoixpihDVvJ9jmpkaJ5nl15OuVW7M7W2cpBbP2390fHW6RVOMQraV7MInbae0H9/+LdGW+OWTytcPn+073/EZDJdXVvfOHX6zFlsCoAi59R5pS7Q3+KP7Z2L6lIXV+ryFXXV+deuK7W7d8P6N5W6pdRtRX82m91xOuCuANxTA0sj3H8gAJ7AsS30dOd7eoh7Lqhd3Bon7Pfq0d4+rvUvNV0pV0cPca/rpEcab6xxdfryrlcncfqhuh7N7PWaYR5PCvXz97184adv4w8F4JGw/N/NBSAQgMcC8EQAQgGIBCAWgEQAjACkApAJvOQCr7HA2ysA+wLwVACeCcBzAXghAAcC8FIADgXglQC8FoA3AnAkLPtvhd9r/oTuE1u1n9jeCv5Pvk//eYsjnv0dnw+9/WYt224xt8OHtwo/AMU5zm4=',
+'BY': 'eNrN1cl20zAYBeDbpGkLZiwphWBapkCGGmx5isvQhjLP88bxLhvWPVlhPwsPw2ux4JflXJwd9BzO4euRdSX9Uh0nTXtNAL11uczW5DKZfot3PLeYbcgg9ZQTZDI1KvJ0lOiUFLPVeZnk73rz3q4nLdR96jlhlqvJNI8kBlmeSBdn/TyS1VT5oZyRB9VcLKeoop+r6oRUBZFe91PX8UMnyfJQKpPMVPze7TojmfNlTplq5cRSLAsqkINll6vP7/fl/LCYtcz9yt12zd3q08I00nuS6hf4vj45mEz1nqiYrZg9+kFYEkdu6vn65ccLS/qBJa4y8w0ZvBkftevprrx8XZLLYXsZCxrN5dZKo9FYXTuG4wRY2omTpyy5Tev0mbPWuozPlfPtcs0yNe0qb5yfAzZruebCRQI6JPmSLf3lTmdLz9v2lm3mbSrnt+0rtqmXmqtVjeRr12/Ms9btduT9kK4CdGv55i35KUkmnXvMdX0CBiR5qJk8pGp+oUYPTc2gXlNlRl1TLQyGZR7U987zDgEOAbcJuEOAS4BHgCLAJyAgICQgIiAm+QSTfGQJ2CXgLgH3CLhPwAMC9gjYJ2BMwEMCDgh4RMBjAp4Q8JSAZwQ8J+AFAS8JeEXAa5K/NALeEvCOgPcEfCDgI/1Z/kTAZwK+EP6a+YrQXw6HkyX8ez+b+B+1jtj0f7VNadvS4mo8b2N5ngfSfuheXvYvZVsDvw==',
+'BZ': 'eNq10rtSwlAQxvG/hIsigqB4v+AdVDSJQNDGcex9gUhnY+2kkryXvS/jW+gG5DMlM+pvZs9uztmTFNmmAzRrtkQVWx6fXoO4eXtjuRO3bqPkIPTb/YFt9OKha8lz4yg3aY2qo4arTjfoD0LXT/q66fOGVT17Yeh6djb0Q7fdHQzDXjBIdlqj70T5cbvnxdGclW7fdce3M/b0cPc3qZmk0fI8Y8vLW1KmZJysyWWzTp7Ct9kCzAkU54vzY1AqLVgul5M6pbIoUE3VNYElgWWBukzqyf5PT9qKwGqqXhNYF9gQ2BTYEtgW2BHYFWgI7AnsCxwIHAocCRwLnIj9JoGWwKnAmcC5QFvgQuBSbMJkutoT8AWuBDoCXbHpFwgE+gLXwlTGY5xNxviDX/p0+G/1VNj0sGoRTHn33uLd4s7iC/mMfVw=',
+'CA': 'eNrN1Mly00AUBdAbO4QwpLEDIWGeJQsnINnWFIYQ5nkOZgrzhnUqxYLn4hOAP+FvWPIjLHgtybdkwwIoqsgpd+vqqbur5bK7UQXQmNRudVy7p2/ex7OB31ut682T1ly6rJW0J229RL3BIR/tzIX5lja/I61IQl+S1JO2H0nHFtsSRBIk0k7sozDyJLRlX3RA0JEglSSQJPYkKspaa0tHC3FRCMVPJfAlTiTxPUlsObYTo9jz+tuLdHuBr6EztMHP/3eDktq7lg4q73Vwi47eJPlaYShRJHEsSfLLVxvL59lZExpT3y8tWtHKzcW/vTTsJevejmi38mUUAyqV6ui6sfXjGzZuwmYCJswWY2rG1A0wuXVbAZjabqbNjFHAzA6T2al515Qxu01e31PLwnRN8966pn37DxzUfMj0DWzh8BECHOXazsmzM5DdLLs/1e0jfc2Mpw042ujr1/PM5UtruqV1XK7vcoxbrO/wQT5maJ+sZw90fLNUz1KzPL7pluY2y+/S1DzrzDn2Y+tlxwg4Tjb7BSAgm1sFoE12fKdgc1iwOSoAMekvmfT3ScA8AScIOEnAKQJOE7BAwBkCFgk4S8A5As4TcIGAiwRcIuAyAVcIuErANQKuE3CD9B9FwC0CbhNwh4C7BNwj4D79Xn2JgAcEdAl4SMAjAh6THvykRw4BywQ8I+A5AS8IeEnAKwJeE/6Z/PiyB9fKpxGsPd+ra25LS6XWLdq3ofofN/3uu9o+aPtqs772O73+ANgHWy0=',
+'CD': 'eNq10slKw0Acx/Fvk9Y649Ja61K3alWIYMCNNvEivoAvEHvz4llysnkPH8ejb6UzTfmR4kURP/BfwiwM/BOFQNRxKW+69Pj0OjpPi7zr+ixJx+47KSbZZTz07bDIG7NNRW79lm8L7mzP33h3m2QX8dWNu2OSZqM4HZ+VxwK3+nD/HyXyZZqeay69fPhcEYRTQb2xQFNgUcAYY4211hiwJeP7iqVlgRWBVYGWzL+hLbAm0BFYF+gKbAhsCmwJbAv0BHYEdgX2BPYFDgT6Aocy3x8JDASOBU4EToUfKcda92N943feP0P+yv/crVn1UauEmx7XLty0+AIMzklb',
+'CF': 'eNq90j1Ow0AQhuEX2yG2CRACIfyHfwwVWJB1ywW4gKGjoUapUG7EIThYCmZt8mGlAyQeaWdmd2blwpuFQNazMG5ZeHx+Kybj1Koyd8WTbd1krpGXN7lvjJqNjlWuvM7v3FcrsIOH+1n6HkysKpwb2e52fuqnKfOpCi8LFl4jXzYEQRiYqBUs0haIkySuQRqncVwFO68t+bqhsyywIrAq0BXNrPmZpp7AusCGQF9mM5vVzEBgS2BbYEdgV2BPYF/gQGAocChwJHAscCJwKnAmcC5wIfbLBC4FroQ/qZ9E5J/E+y+uf0xD/kPfHu3A1tCW87V99hMum0sC',
+'CG': 'eNrF0jlOw1AQxvE/ccIzISYQ9n2HsAQciwSngwvQIQqDaGiokUWBcjduwXFgHpE+vRqQ+EmzacaVXzsC2i1LZc3S/dPbYFjWrSvSLH+wMR8Gi6Z1WZYV3U4vH/htL9w2rEuL7kWn71eX4Sq2Lk9TG/rDsmLDzfXflLYv3+l5zNLLlW8DlagaebVoHBc7F8eWHEwIOFd3IzDpnPpAIxGYEmgKJMm0bmaC+1BLYFZgTuxm3mtZgQWBRYElgWWBFYFVgTWBdYENgU2BLYFtgR2BXYE9gX2BA4FDsV8mcCRwLHAicCrQETgTOBd+ZfScqv45vf/k+8+I/3Jn8Wpxa/Fo8WHxBfOMVbg=',
+'CH': 'eNrV1M1S01AYxvE/LSgipwhiUakfqGhBK0maJimoiIBfMO6cLmLGjRvXDuPCcidejHfh7fCeFB8Czrhj4a9zTp7zOZ32nLTrQHvOqoMJqz59+dE/PJiylEedfmHN7LAy0POTN9ejPIziJC2G3TzsxMUwzsOuPXrW3UuyYphYKIZ5ajuEK7Yyre4xbSnN42S0/amhSUtZEFgjObuiH+RBmBRnh5xfEedBFGd/jZW7pdmou2aND1v/erT9o6y+jln17af/ZSpqtfr4xIWLk5emLjMt4BoN1/CVK7MPbpRdJVsq5x3nkzluxs0YuGJ51rk533/1zxR36ivMXxNoCiwIXBe4UZlzs+k/TSsnaxctt1o+tco5VbcEbgvcEbgrsCRwT+C+wAOBZYGHAo/E/g6BFYFVgccCTwQ6Ak8F1gQCgVAgEugKxAI9gUTsbIsdP7ETLLAusCHwTOC5wAuBTYGXAlsCrwS2BXYEdgVeC7wReCvwTuC9wJ7AvnDuRld13F/VeOwc9v9V53/30V4TAyufrXy38tu37ToP7MgO7FVxBEBYsyY=',
+'CI': 'eNq90stSwjAUxvG/FLyAioICWm94BRUN0BZw4/gCbl3U7ty4dlgJex/Lx/Bt9KTYQ1k7+OskOWm+tDNtGg7QKEk3zEn3/PLeHw8LUoWm0/IjmffGqZUnm76/60gzkuhGo7Yd/F40CmUWGs+PRl5ourK3OepOYkGcCgY20/IkJGk/NDIPQtOPmk15tp9+S33yFhO2W4P4cZ4dfWPzQS+y+WA8zEjq8WEeQ8MOcfe6IN3bhy1TMk42t7i07DjOCvlCAlYVrK0Xixt5CzZL5XJ5azuuC9In+UI+AZV4X6Vi96ZUawp2FOwqcGuum2Ti2l5xXftdiWs3VduV2dpN6uneyWxau3J/T81+k30FBwoOFRwpqCs4VnCi4FTBmYJzBRdKfpmCpoJLBVcKrhW0FNwouFVgFLQVdBR0FXgKfMWfTI5l1h7LL+br89vhP1Sl9aRtS5NTgv1CP9rneis=',
+'CK': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'CL': 'eNrF1NlSE0EUxvE/BGRziVEUV9xNlOhMJiuigOC+L4g6Rlxwu6ZSXjh5Hx/DKh/CV/HS0zOZj6QKLrig/KW6+3TPyUlX0ul8BsjnrGsNW/dm9Ud1yvfbrQm3PDsdloqNZlT1vMgvBQV7Wpuqt1tDaWaj3VpMEktRUIrKfpzSjmwhCINipRmVw1JgQyX0i0GlVrdaoW8Pas2oFi81C3GhmorWXdExixth1T47rpdurRFvzW227nnufW23LS/JGUlyfC9OGrVZNU6Kd9xv04fzGw+DneLJFsrlpNxGqXk3xN23PuvW/g7Qoz8zMLhjaHhkdGwnuwSLdyveI5DN7s3lclljsYX70tit2itn8f5cZ7a+HueMZ1OujnPA9Gzn4ISAdYfS+LDAEYGjAscEjgtMduWf6IpPSu93ckrg9JkUnBU4J3Be7KsWKAhcELgoMCVQFLgkcFnAE/AFSgKBuLORgorYQROoiZ1SseMsMC1wRWBG4KrANYFZgTmBeYHrAgsCiwI3BG4K3BK4LXBH4K7APYH7Ag/E/jkCjwQeCzwReCrwTOC5wJLAC4FlgZcCrwReC4Rit4D0xk3pjd8KrAi8E3gv8EHgo8Cq9OZsFn+SzXM+C3wR+Cp2iwlbllyD7gJc+9nH9prJ8L8NblMb72qT7s7utO44bUtz623Z2oobfyXxH2vf3TVgv8VC2jLJ/HfX/B/TLECf',
+'CM': 'eNrF08svA1EUx/GvmVY7VFHvZ71NUcZMmGEj/gE7sUBsurGWxoL+h/b+GQvnGn6Zxg6JT3LPPffcR24yd0IfCBsWumULN52nrNetWXYdJ2n75NYKaa8wVXfLz07j+DlJWlY6Lk4Gbl/6fVPVsiyKbHBULFdcOcsP8Sy/OP9pF7ruI9wPWHjouLTA8/yS53nlwXKFqkAQDAU5l38NYFig9rliJOg7sj4qMCYwLtAQmCismZT+e04JTAvMCMwKzAnMCywILAosCSwLNAVWBFYF1gTWBTYENgW2BLbFPpNAS2BHYFdgT6AtsC9wIBAJHArEwp/Jn1zJPbmX35zz5vNfLu2HubJ2Z+3R2qsb23XeAbSEXpI=',
+'CN': 'eNrllmd3G0UUhh/iVJKwEDChhtCCHSzYVVspBDZOUIIoNj3AWoQSei+iRaL33nvvvff+Lf+A38Od2fWblU/4kHP4lsdnZu++um1mR9aODAEjS2zqzrdpavOW6lhU7neX200aleJmx6R4LIr6vUYaliq1uOSl+lizPxjxzy5Qjuy2MRaF/d5IsioKe+U0LJd8TK/ilKgXp1Gt2RntVdOoUutEvZqTpzabZyU2pzQqd5xPxZXuNc3ZfGPzqZhrWq2ZTz0NXYJGszHqqvlSPrmr5QrVetVmr2Y5Y6fUGz6Pu1rVgl85jVyN1NpIvVBPq3Gj6cqHpWrdKY20XLEo12MlDStOqqaVesdnr7uk3rtsJRqhVSlncaO9uo+ISjXfbrmS9VDO1xJGPVuY31vrolxtuIWH1Ty9S1q3wr7hhm/YbkoN13GtFLuOYxdZs/y+x0o9ztcYW0TTFTDb4u3TKHuILsaXc9ve8aG2sW7/YnuwoYWUm65Te74Nv6TILSlyDtV+d272nO0QdFeYGWXb4duNLVdoT9IXsxNSc8v3j6W7II8K/fEI3DlzZ2I0aYShL9ydk3mY70KX1uo33Nmq9buz7H5ifPuX6W7C7ABWp7Ntz3nEXfx0hR1Pblrkmiowa2j2nLnz5i/YdeEiFgvYLQh232PJnsFe1vbw3sNGYAOCpcE++w4H+wX7wwFLD1wWLDto+cHmExxy6GGHD684YmTU7CBYGQRHBsEYlIaPOjqMyhYNlWqtvjhebDsFq44JhlevDLxe4NjjBCQ5axIYF7BWSF+b6XZ1k+nr8g/WOd17ZP6JgOOF6a1tug9Msloqm+Q+65PxpGV65mxusKHQWxZns8szI6d95O08MteTZDq2Jbx/KxuubquYJ8ma29ZD5pP4SNdbUuzHhbby2Gl355/XTbI8M/vP157428TnHx8v9qC6bkvW266Y3vKJsv05oX1iu90+6eRT2tBuT0y4MeHtdmaaPSFML9rmIf9cnWxn/fv8WkuS7XMyrj0scqqA0wScXrDPEHCmgLMEnC1go4BzBJwr4DxhPyGiYE/Z99dm9zdluk2Z7Hymtvl3BJwvYJOACwRcWLAvEnCxgM0CLhFwqYDLBFwu7D+IgCsFXCXgagHXCLhWwHUCrhdwg4Abhf3TEnCzsB9sAbcIuFXAbQJuF3CHgC0CegL6Au4UcJeAuwXcI+BeAfcJuF/AAwIeFPCQgIcFPCLgUQGPCXhcwBMCnhTwlICnBTwj4FkBzwl4XsALAl4U8JKAlwW8IuBVAa8JeF3AGwLeFPCWGNTfFvCOgHcFvCfgfQEfiEH7QwEfCfhYwCcCPhXwmYDPBXwh4EsBXwn4WsA3Ar4V8J2A7wX8IOBHAT+JQf1nAb8I+FUM2sXY38R/278L+EPAnwL+EoP632JQL+Yp2jtK9mo0270azR5i52T1/7fwOTvbsJfqeTPH0Ha0fAQF28XP28HRWgOT+diQj8ni1b4mW2fo9gbDxnzYLyKb8rExv9rbGhtsbLUxaeNf3ZMGZA==',
+'CO': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'CR': 'eNrF00lSwlAQxvG/TD4EJ3CecBYVNIwJS8q9F4ju3Li2WFncy72X8RAu7Gfwq2SpG39V6X50F52kaJp5oFmzMHEWHp5eo1YnmE6q9iHuRqNHq4St0XRSnHWTVjfu9tuhbw7TrYqdoriXfM06paTjB/rpURD4cZm6nzYK4mCQ3Go6yVnhfvzX1PTpOzzPWXh588eUXC6f8wrFEvMCzpVd2Th7zgXnKs5U7HWq7kdmzOKSwLLAisBqql4TqPuSD/Xss60JrAtsCGwKbAlsC+wI7ArsCewLHAg0BA4FjgSOBU4ETgXOBM4FLsR+JoFLgSuBa4GWQFvgRuBWIBDoiC2vQE+y575k6wOBoUAotuZiqy38WrLGBb/GH/zRZ57/YpuLbSmNWQ5n2f8v86lrbIU7u959tsIX9XJziQ==',
+'CU': 'eNq10stOwkAUxvG/BUQpiOL9fldQUCmXEjfGvfEBrOzcuDaspO/mwvfSM4Cf1MSFGn/JzHw9Pe006ZRTQLlkUy9r0/3Dc7PaiXsFy1FQa4Vdq7SqYZy4e+eeuboMonqtOWxox/2GVep2YTEKGt1Bbzuu9JtWj+pBS41Ro90d9YWdz77Q1WynSi8z3Mo2mrTUsmj7exZvr/9jKbtlMD1O2PR04+IYz0ulM5Ne1vOmmBbI+SbnWM4XCrmP7Pv5nO8KMCPgS+L1xVmBOYGSwLzAgsCiJL95SWBZYEVgVWBNYF1gQ2BTYEtgW2BHYFdgT2Bf4EDgUOBI4FjsNwlUBE4ETiVZrwrUBM4EziWZL4QfGx6ttDtar/zNy1vq23uZX4zs2CiO1syXazfc6bLTg/1hQhvvjpNu2Q==',
+'CV': 'eNq100lOwzAUBuAfp4VQhpY2zEMZpbCoRNM6abqpuAAXSL3rhjXqCuceHIclt4JnDL+SJQK+xfPz9KzYShwAiLsSlk0J88VzVi5bkhWJzo1007IykUmWxLNpUgwHmbGj4m4wMXZcDBNjtUSdGpvOFzaT+ZGxE2m0uZW942qVtjtyNs1loc7drC6XSsYe7v+jiV3zGR5XJDy9uVihVKBUQynVXMUaAWG43trY3Npuhy7/0gE6VCuz0yWgR5JHnsujb368uqbn+5U1kd9br+PzXap/yx4B+wQcEHBIwBEBxwScEHBKwBkBfQLOCbgg4JKAKwKuCbgh/Jh/1oZ71hf8jdf34Nc13KvIrUNuBu6X+QAy2lAZ',
+'CY': 'eNrN08lOAkEQxvG/gMu4Ie644K64oCPKjKMmxhfwZjyMxIsXz4Z4EN7QuxcfwwewepDPkXjUxF9CV3V1zUDSRTkLlMdtafTacnv/fNJqDFkWV8NKVLd92Oo6qcbVSuBOgvTJsmWhsd1xqxmVL07jwD3fDOMgrG9buZZu9yw78X0/ae+qR74ftesZ211ddsJX14D7suThWnfTT6HsQrI89Njy+ObSlEwmmzG53r5+BgQ8b9DxPPtVQ15i2OUjXgeMJjE/5uW/vbIwLjAhMCkwlap/JtMun0nVZ1N5UTr9xaKrp80JzAssCCyKekquZynVr9QutiSwIrAqsCawLrAhsCmwJXY1AtsCOwK7AnsCFYF9gQMBX+BQbJIFjgSOBWoCgbRnvc0GWWx4BU4FzgTOhT/RHvWcG/X333rnS5b/5roAN/a5c9Gu88niq8vtL/EBxDF/BA==',
+'CZ': 'eNrV1MtSE0EUxvE/CSiC0xAiStB4QZREic7kNhOuIt4RdhaLgWLDxrVFuTB5Hx7Dt/B1PD2Gz0Gq2LHwVzV9znSfnqkkp1MrArUZG07GbDg4/tEbnExYljYbvUO7TQa5hbplzWyyX9tcaaVRsxNbWb+dRl0fO2nUsli3kji/r2JZN0yjRuIf2R3047TZirPnn6sbtywJw6wmNx1Y1gvTsJv0Dv9dm/Rb7LXtCw/zK7HtioZ7Cna/t3VZqPmQDV9HbPh26r+cnEKhODp27fr4jYlJbgoEAi4InAvcMHfmbN6pZsqdgWlXKllSciWYKbtyeTh/K1eTM3tb4I7AnFheGbJ8fv7vfEXgbq7+nkA1m6vOVavnP/t9gQcCDwUeCSwIPBZYFHgi8FRgSeznEKgLPBN4LrAs0BB4IfBSIBSIxNpcoCXQFuiItbdY14n1plgPC6wIrAqsCawLbAhsCrwS2BJ4LbAt8EbgrcA7gfcCHwQ+CnwS2BH4LLArXLk/x3bUH9tk5Ire8bPI/+7LLBzZtW/Xdx+tdX/5aMd93/5GfgN6a7ig',
+'DE': 'eNq91ud721QUx/FvarvpiCnUhKbQkrYUiMEBy9uBUgqUskpZIYAxZZS9hwlQm7333nuWVfZeZZb5mn+HcyX5F6nJG54n8MlzdK/uOPdKlhUPJYCh+XZozbLDqRs2FnJeqdNaZScNb7hYHq43rbGY84qddmlo5UgjP1xzLaWcV+i069ZSsnG1Zts6bHTV+rJ+lmonG0+52aUslCpudtnPV/TzFYMlLKHXaResVu9k22XryjcKfuJiremv2m54hdKwm99uVOuurdrMBpvLd9rVyAzPTznRVwv76lP01f2+ylR9rdnB/r2821trxM48G1329+gvaHsoV93USjCt2mlX/OaCu6RqrmYX6Tdns9FkhU5rjp3V8nl/VH3blQbsrJ7Pu0xesexSVWyjQaLuTa35N3Wu21MtH9xSmzkzzGNVN67qr1DrtGbYydGrukWYouSnWORSuF2X3ET/njRq/kfiuZTZcNKQK/zD+T12uHKT23LEjEQyNbM3OWv2nLn0CaSd7eZtv0Ma5gtk0jtmAtDftRMsyGQGrHHhwELYOZPRmF0i9UWResTiXQUGBZYILB1cumw3a12+HJb5lljA7pHxewjsKXb5AlmBvczeFrmcWzccPhiZG6m7/MORMfsMTuTf118/qEflxT4qgYJAUaAkUBaoiD0aYg+i2HMnMCKwn8D+Aiu61RVWFzhAYKXY/g/0/zzPXjEHCRwscIjAaoFDBdYIHCZwuMARAkcKHCWwVuwpF1gncIzAsQLHCRwvcILAqMCJAmMCJwmcLHCK2KtT7Lsr0BQ4TeJj1gucLnCGwJkCZwlsEDhb4ByBcwXOE3tTCFwgcKHARQIXC1wicKnAZQKXC1wh9nISuErsf5zA1QLjAtcIXCtwncBGgbZAR+B6gRsEbhS4SeBmgVsEbhW4TeB2gTsE7hS4S+BugXsE7hW4T+B+gQcEHhR4SOBhgUcEHhV4TOBxgScEnhR4SuBpgWcEnhV4TuB5gRcEXhR4SeBlgVcEXhV4TeB1gTcENgm8KfCWwNsSr0fHvCPwrsBmgfcE3hf4QOBDgY8EPhb4ROJ7+FTgM4HPJV7/QuBLga8Evhb4RuJ5vpV4PTrmO4m3bxH4XuAHgR8FfhL4WeAXga0Sz/mrwG8Sr/8u8IfAnxIf/5cwbYKfbUn3s62W+PfTU9MQbJmePEH00DspEmHE21ORmKrv/8gzL4xuPf1f5UhaOSkSQfTZvGQQvWGZnmL8dOQYTfUwFsZ4GGOpRBDpHtanghgLy2ZY/9uVvUF9tN9Ki3G/TASx2Mb3x6Pp+ss215ULelht66/xIxGE7XldMoi1Fltj1zj5utLb9vdNtP8DfvcnSw==',
+'DJ': 'eNq10M1OwkAYheGX/oAW5U+poAu3dUEChIJxQ7gB4750x8YdCekKe2/emX6DyQl11wVPMmdmMvNNO5P4QDKwKEKL7e64LIvIRtls8prbNC3PFmK3ef02y6Zp/pXNJ6nteLGlRfm/eqlqz6bvm0t0ietO8dmwOHy4POP5gQnD0GvSEri6NqewsUAklWPaNwK3Ah2BrlT/oSfQFxgI3AncCwwFYoEHgZHAWOBR4Emo7e95A/e8+5ql3z9+7c/ZTXm2ZjdjZe0X32Q2dQ==',
+'DK': 'eNrN07lOw0AQxvE/hDNAgrnv+wi3YydOzClegA5RGERDQ40QBSAekxehpGDWRh9GUCFF4iftznh2PbJlb6UAVIZsuu+06fLmsfl8X7Qsqe7EV3bZeM4tHLjNJ/thEtjiUy0JXagnNReirNhI/DQ2kyByMU5c2LD7o3wnP+sUJL7bFFoIXMM01C2ErqFftX7BUxz/uL3bsqb/WzX+rLZbfnb611BxIZ1u22y6e3NpTnuho7Oru6e32NfPgEBJoCwuH/QyaT2fl79yT3Wv9LV/qORZvywfTntbOvjtcUZGBcYExgUmBCYFpgSm5fv7zgjMCswJzAssCCwKLAksC6wIrAqsCayLfRqBDYFNgS2BbYEdgV2BPQFfoCoQCIQCNYG6QCTQEPt3xf5YgX2BA4FDgSOBY6ElsiPQ4Y7Aeyv6vxf4T87tsF/YeLDxYuPaxqur2WN+ADatkck=',
+'DM': 'eNrF00tP20AUBeADARoolALpAygtoSm1AZux40fCK1Ae7ao71IWJ2LCpxA5FLJj8Tv4Mi96x3cOk6gpF4pNmfGY8d5xYHqcCwJmXrleV7uLqLt0KVL83JYMs9dpdmWn3B+81ZZAmqdPZCaXFsU4SV0dmmKmgq6NMeWEspa6OleSo60pp1O9NFJuYLbYHtsjCZpR0Y51msZdKWTPIg06CLPKS/5SvSGxJoVI6f7xOU91quVlY/OBkYPGMxLZS1s1Rmfl59NSLYy5593tEuptr8woto4XK2PgEXhBQzU1KA6ZMfDk980rybPWvgW1ezxEwT8wLJtf+na/Za2r2+pqVZQC8sWptbwl4Rya/X1xa/lDmlZLJH0vAJwJWyeR6vb72uZHnhj3/ZXW9zF/t9c5jdgnYIGCTgC0qs2dl3573rex5Jvv+Y61vBr6R5/JWsT5fLnmbAEVAQEBIQJOAiICYgITkXJB85CTfMAE7BOwSsEfAPgEHBHQIOCTgiIBvBBwTcELAKQFnBHwn4AdhaIqjN2aOXmNkCPs9VPDcxofUzuV9/JJ2K+1S2r0Zy9/7A/S5sK0=',
+'DO': 'eNqt08tOwkAUxvG/gFhU1KLgFe+XoqIFgVI3xhdwZ1wgOzeuDStLfBXfyq0P4sIZKF9K4sKIv2TOnDlz2rTp1EsDXsGEnmPC49NrcF7z+72cWXTaYdcUwv74lmsW7Y5fb3TDTr06aGn9qiU7bLENZdvg3Vz7ftRsRq1WFARRu135uTlv0tD3E5spU7m7/evk2WkQnqdMeHm3aUIqls5MkxWYcXJObnZuPm/edcEZGbt0cUnALcSWoSCJfFR3k3U32eMm+12TryTuk1QUKJVWYzYfsflazObrMdgQ2BTYEigLbAvsCOwK7AnsCxwIHAocCRwLnIj5ZAIVgVOBM4FzgarAhcClgC9QE6gLXAk0BJoCLYFAmMjwuGbscf1kQl9p/ltxgnFvfsIHMz7MeLO5ebxv/xl3Fg==',
+'DZ': 'eNrd1Mt20lAUxvF/SyvV1gJVq9Ri1XqhWpRwCaRe2nq/3yu6QpYTBjruYjkwPJ7P4Ou4D2k+wLU67MQf5ORjZ+eEwckpZ4Dykg39rA3d3q/2ZjDoL7vq9lboVRpRHDYrQdTtbdjF1mCirZa0ed1eXAurXqPSCqK4HlYr7ShuWKHe9NtB5G70B3Hge4Gl5qA/m0xhE6wkEzTDph/Ffujb7a2wldzSGm+cs9SuVoczjZVzw3JYr7jneP/OvpBc9WrppWkrvNlNT6PGeUtBO6zVo+QBk33JqexOw+HHlA377RkmTGdmZo9l546fmF/gpMCiuJzLuZRbHKvnhnX7uC/knULBhoOct1xIs/2wvJRPpfVT+dP5ib9zZlngrMA5gaLAisD51dWSKZZK1nNh1FMsrq2ledxFgUsClwXWBa4IXBXruTbqWb8+llNl2BC4IXBTYFOgInBL4LZAVcATqAnUBRoCTQFfoCW2CMXWmcCWwB2BuwL3BO4LbAvsCOwKPBB4KPBI4LHAE4GnAs8Engu8EHgp8ErgtdhbJPBW4J3Ae4EPcnj+KPBJYE/gs0BH4IvAV+HIJduI20D2v08d0TOqGf4XbqN2O332IB927NkS7tjx044/LtuS69jy/ebyb/gLtTTsHg==',
+'EC': 'eNq10stOwkAUxvE/N4Giogje71fUoi0qFHfEvS+g7Ny4Nl1pn04fx3fQ04JfigmJMfpLzpkznemkmZ5mDmjWLIUlS/cPz13X96OwbpO7dqs3iJ9EL74NPdf3orD4tSuIwupwU3eQJHvaicLCcN1Wy/FqMDohmVnle8nxFZv5gefF77i2mrX5bf9vhmY8JOkxY+npLS5Tsrl8olCYoihQGinbRThOJeE4MC1jx8zMClQF5lL1vEBNYEHGv60u0BBYTNVLAssCKwKrAmsC6wIbApsCWwLbAjsCuwJ7AvsCBwKHAkdiv0ngWOBE4FTAFWgJnAmcC3hi/SbQFrgQuJTxPZPqK4GOQFcgEOgJXAs/MmzpfNzS7/zSR47/VpgQjVRY52Ldhd0OmVT0LW4sXr/Vn0moeUA=',
+'EE': 'eNrN1NtT00AUx/EvBQS1FQoqXhDFK0XA9JI2xUtFvN8vIGqNqOOLz0yHB5P/wD/D/8RX3/l3PJuE3zQzPsiDM35mdvec7dlk00l2bhCYm7CuN2rd+y/fmgtVL+5NWdKtL7bDZKYVR4HnZWFvJC1sLQRxb8kt7yzXu7W6H7TDqGGJFUa2NggrUdPCVrdq14mCoGKL/PzytXS5b2WBlfmhq2nGkW+TXa/m7l6Lo2qS2QWtrO1XIt+SRitJmw0Xh1HTd8ttB+4C9Xj3YVrJw0xbYvtPt2a/RlW3w9qiqoez6nRdO3nURtwrWPJ0ZXfo33fJ4pZnt66FnfSp8rV/GubckHRfB6zb+jFETqFQGBwa3jcyuv8ABwWKxVKpWHI9HHKDU4Sx8bFyeWKyXC5DSeBwX3yk7Ngiqz9a3JW77dQxgeMCJwROCkxLX3wKZiSbn5mxls6fPpPOz87Onk3Bub57ne+L+10QuChwSewvFagIzDsV12XxfBonP2fxfJa4+ssCCwKLS1cy4AlUBWoCdYGGgC/QFHuPxN5SsddQYFngqsA1gesCNwQ6AjcFVgRuCawK3Ba4I3BX4J7AfYEHAg8FHgk8Fngi9rUIPBN4LvBC4KXAK4E1gXWB15KPNwTeSD5+K/m178SOTrEzQ/L1oew9/iCwKfn4o8Angc/CX0mPLHdYbX0f4N/6Ncj/aGCPbd2O5A1rm9m4nY0b1axl+Y4bJ61+3EZrm9a2Xeyl+U42b18oq1lz8c8s/g0t9D3s',
+'EG': 'eNq91dlW2lAUxvG/omIHJAqinbR2lFZaSEIAO6i18zxPkTtvem25aniPvk9fqxfdJ5Gv2KUX7XL1xzrTPvtATlZyWM4ByzNW9Sat2tr+1lxp1Pu9ORs0bBSudPpJ7Neidqdrw5YNe/lBovW/u+Vrq404aHZjP+gmvqu3tpPASmgzdVscdpO42WpnCVFYTZrZRJBNpPFqEsV+mP5OkLRtPvbdArc29N2cS+mk8WbXTwJL7mbhpJWmVat2TVE/acRReqlBvzeeXahdZtFtJ67X/DCqZRvp9yayWbdbt/V2vb5vvDOIj9rg+ca/NsuuSasvI1btbI2xx2hubHwiPzl65OgxjgsUCoWpwlSxULAteN70tJeCGYGSC5Vny2Vv0LeP5/IrXqXiCsx5JW/ewiWLn/DmT3rz5ZLLGXLqtMAZgYWFxcWFFJwVWBI4J3BeXI6FdnNcf0l9G/3uK35h6DsVtv7FP+KDtcMuCVwWu+0CVYErAlcFVgRqAtcErgvUxZ4yAV8gEAgFmgKRQEvs0RR7HAVWBW4I3BS4JXtzbgusCawLbAjcEdgUuCtwT+C+wAOBhwKPBB4LPBF4KvBM7I0SeCEHx18KvBJ4LfBG4K3AO4H3sjf+QeCjwCeBz3JwPxY7hYS/lh017pDZ+TrC//Uzd+hf6Y7y/FAp7sb2K8N5h5VTHOrPWrG3EvcfubjburJh93nTyg/X2i34BRK6FLI=',
+'ER': 'eNq10blOw0AQgOEfOyHG3F5zH+EqHAmkOPgSDeIFeAHjjoYapcJ+Cx6HgjeDWayMYroI8UkzO1rPrKzdyAWiQNJ0IOnp+S27zpupL3UZ50VlN5rOp5HUcXR/F5fxJM2Kqp6M62Rcp2mdlXGSVSNpTJq6aCf77aTMGTuXl/HNbdV25G2HI/uPD/+xRHb5SS9Lkl4/bJ7juI7V6zvLDBR4K77nr66tex5sKNhUnWO2thUESmpjAhtGajO/b5lZjy1NW4dhOOsJlcyq7v/vKNhVsKdgX8GBgkMFRwqOFZwoOFUwVHCm4FzBhYJLBVeKhbVP2bNP+c7ffX65C8/0f4XcPHLLyE2QS3wDL3VNJg==',
+'ES': 'eNrV08lOAkEQxvG/Ai7gioq4b6igogPI6oK4n7wZDyPx4sXEmyEe1HfzLXwdq5V8mWjiSQ/+MtNdXTU96cl0p0NAOm5NK2LN9e1T9aUVtcgvZqtNG1ZeAoUBV6hUm34uW3HFcrDYZVHp64xYe4bn2bgUrPRZVPH8Qqnc/Fpyk6qen8t/q7gFpOu1Yu657GU+F9BpqYvGT13adR/NXYc1D/fumwM6nVA40tXdQ69ANBZtgz4BpS3fP9Bm8WAgDhgaFogLjAiMCozF4wm7Eu6ZcbF8Mqm5QRMCkwJTAtMCMwKzAnMC8wILAosCSwIpgWWBFYFVsd8hkBFYE1gX2BDICmwKbAl4AjmBvEBBYFugKLahBcpiO1dsqwrUBHYEdgX2BPYF6gIHAg2BQ4EjgWOBE4FTgTOBc+HPfR69sDt6qY5feN9riP/ucgyu3G1b7NH6NxfbEb9xvR3Ld7fPnUM=',
+'ET': 'eNrtVmdzHEUQbU4SNhzRYDiiwSQteGH3Np4JxuRoGBBxdbYxItiYaMkEr0gmiGCbYGBH5ByKH8E/g+6esL1QBcUHf/Or2tu3M69fhxlVaXoCAKZX4c/CCvyZndtTrBstLvSRV3GYjca4Ui529g70MGLD+jimH3qqeJiO62E1DLNiXCcUN66zKgvLcV1WOb6CekjCBDfpEzfL0bguqigLR6QZhjlqEtQMqygmjygckiRFbyONQ8xRFkGdcsp8RKphmLII1cm4zjllUGesoFrSFFNFGBnUOS2WWGXOEVlYUBlcao6SjOuIYnYw5XLJ2ByVOMS6KCJJZufQtYrTHL/yHHdzn5IHgZ2gCisrx60ww0yp1Sd5QQ0VLCZallFgmk+MCxbMU+Kkxi6KkzTngWCzKRvyFjpGnMLMhXZ5vrw9MvthYtJhq4GR0SzYnCpgf54DlZtwGNcbcsI8j7BCHn9QF92R8Juik7Dw4SaagwMzmILTFVwVpqECcqwooBw0vNK6pnbQZGeMI5ou94xr3FdkhphRS7NzQRDgrUwXF6bM/cTbeRDZyF1NGj/e4Jp6zejC8PGgScFXDk8cJz2iqxfTudIR8FTs7cTJmQ7wPGmIVUIz5KuUlXRtEzuTjG8b3R/bDmaiEis6GVsi/tXApo2H4jVNL/7ZfgT+7JpcCR30JianjlzR6/VWHgVHewD0j+lbIO8f2+8f53j/+BP8OuHEVS3vn3Qy8dVtrMApp3oADDyQn3b6GWeedbbha845d+3gPMPPH1yw9sKLpgPiF1+yLrz0MrOOiOJhYnia5UU5GHHs+suvuNJ6Dq4aDDZcvZH5Ndded/0NN97E/ObBLbfedvumOwbdOdzpAaA8kN9194y6R6l7id+Hr/vVAw8SV9XsWKnNW4hvVQ9tIxHxh5Wae8TGPrpVPTbzuNpOfIfwVE8IrnYKrp4UXKmnDH9axqpnpF49K/XPCa52Ca7miS9In93S83np+YL03y39X/T8JanZIzXbZA0zhtcy14zMtSh9XpY+89JHbWa+Q/q8In1elT6vOb5FdWb1uvTfK/33Mn9DzudNGfuW9Hlbes5LzxnpuZP50jvvLr239P4+5p1z3I/PAcs/wOdDH/sRLVj+sVIHDf8En09J85kHQOOBXOtGO44f5pPXidv1xm65WM+192ncDoB2eu08NWu0bvNac9Y3Xa5111O3HKnz5E/26dagW71uc/3ds9GiL6/RzlP0qx2cRuptj5rTirnpRrvZ2t4bZ9Q4vZ8/felGez1z3XRmZZ18XjdPzuRm3vbb1uPLlLGml8b10jjqetHankWj/6GRPfqzdr240xY9alun60vMx60TX/ZwvD0v84Hr8t42TmQ1jY9tljnG+Ei9uCcdfxNvOYdTrMzlop1+mTWfewB84QHwpQfAVx4AX3sAfOMB8K0HwHceAN97APzgAfCjB8BPHgA/ewD84gHwqwfAbx7wv2H+JZikfwl+78Ehwx9/TsBhHMa/Yeo/ntX44H+MsAafAp+/AIvH1s0=',
+'FI': 'eNq91Xdb01AUx/EvSxDBIqg4QS0q1VabljYtDsS9t1atFQfuPSoqretN8hp8D/7hSdP8TBnq4x98np7k3HvPvU3yZAy3AMO9til32Obm5HQm7qSq5W5rFJ1EvmQ9I3HHqTYO/7CGMzw2mgxq0nG3WimmM9lcvmR9Ob8vb30jbsmflqzGKilvjkXRyQY1Ni9VdEb8ZZx41lsmkfEaKW8sX0wm3GAoVmlYO187uJx1p+cey/yFxblH6Npcxxo2KW27XLWSKSbT/lLeIcSCU8/WrkOfNUaCM6pkkvWlgyLX6y53WiOX9MfcarndH8vZ3/lXNuuWaqMZO6lys/WcHf/f3bC3q20eN9nm7dASGjS3tLYtae9Y2rmsi26B5ZFIz4oe7we9fXUrrT+UrxJYHfRHoD+cr4msjayLGFgf6o+E8pANGwUGBgOWi+Wb6izfLF79lmg0auVDsFVgMLTONoHtYpcotH5MYIdAdGAg6oOdofqwuEBCYJfAboGkWL2TSDg19vjI79xbJyWQFrvnBDICWQFX7PYTyAuMCuwR2CuwT2C/wJjAAYFxgYMChwQOCxwROCpwTOC4wAmBk9JYc0rgtMAZsadF4JzAeYELAhcFLglcFrgijflVgYLANYHrAjfE3g9i7w2BksAtgQmB2wJ3BO4K3BOYFLgv8EDgocAjsTeOwBOBpwLPBJ4LvBB4KfBK4LXAG7GXnMA7sW+YwHuBKYEPAh+lcZ2F1vwkMC1Qkca8KvBZ4IssPPerwDeB79LYH87/hf/JaPU+GV3NLL6fLYv+l20W7bMiUo/2BcK+fPRbDNYjyN169M8Ke/Kxp5yJUEzVoxCKGa/WPtgFi4lQTNWj0OKPeTHT9PfaiXDtH45hZp5zckPXxrsWvwCzmfyw',
+'FJ': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'FK': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'FM': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'FO': 'eNq10stOwkAUBuBfLl4QGAUvrXjB4gXUaq+0NSaGuDXujIuxcePGtSEuLA9n4jv4Op6B9lgSlvKlM/Nz5jAtod0igG6DpmGZpufXz/5oWKEkHTOK6aM/ym3oqvn22rES6ZoebSehtKO4R7tevq+V9kmbDkl86gsoBjM665RCSzp+MLmdm9/sUIosOkjarufH0vbNIE7oVGccokgd54yGBep7GMxe/k5rTh6qLy3T7cdJGKYPM+trXbWMp7cFmt7vVcwpFIqlUnlxaXmlglUGVGsZygyo5ep1IgRdAhBpVVB9rSrG6tS/LjJTt200GbDBgE0GbDFgm6msqUvTNMr6jq7rVG5N/65dBuwxYJ8BBwxoM+CQUd2gkmEYqt5WS5YzBtBhwBEDjhlwwoBTRn8NA3oMOGPAOQMuGGAy4JIBVwywGOZi8mqV1Kv1/Z/n3hQxT48D4IXGB42nLxq0/qh8B/wCwidzpQ==',
+'FR': 'eNrV08kyQ0EUxvE/Qcwxc2OeY75Bhmuex2KnLCJlY2OtlIV4By/lGbyO07nxSdiy8Kvq0+d2n+66SfdNRIBEh4XHWgs3d8/By2OjZbnkQpC3x+zLz4nUjwm3Qbo4WMjkUuHKTHlB1LKs/3005kYD23ElE65Jl88OudnE9loy5yeDfGHZulQ6X8iuFgJ/JiyutpLL3c/ua2mdZUH4kpUlYZdwXTHcV1l4eHX/QpnqiFNTWxetp0GgUaBJoNkp5S2tseJjWzt0SMX2nV0C3QI9Ar0CfQKeVxr2SnkxhPVeqd6Lx+OWWIR+qfyNAwKDAkMCwwIjAqMCYwLjAhMCkwJTAtNixyEwIzArMCcwL7AgsCiwJOALJAWWBVYEVgVSYtdcICN2U8WunsCawLrAhsCmwJbAtsCOwK7AnsC+wIHAocCRwLHAicCpwJnAufDnws+zxn2eftUv7+1H+O+u7ChvrT1Zu7b27voLa3aU12/wAVa+rdQ=',
+'GA': 'eNrFlMty00AQRW+imADmYScOj/AmQKwhAkkzejhAUSzZ8APK7LJhTWkV6Uv4GT6HT2AHtyWlrSyoYgHFKffMVdftnnZZ42UAYLnDpd7mcnJ6lh+VbT2nrly08kxkbRNzK9p6Mjja+qNUvT92jCp2UUlfk1L5sGEqk1xernyTV3EqbZqChrJKbe6bFXM2L314csrPmdW+PPcrVSwdGHElHWwVR86zNo7Srji1LG3yzmCjwjdJFSdeTpcHHhhlUlckTWlpzwq6C7qTKo0y8fVdbSZjua6W80bWFZKo8sJ3o7qse+awict9KJO6tt7kfJ8+/IttKVu3fN7g8uW7yBGbQRBsTS5tX75yFVPh2vUb0ylwUwFm8535TJiLnotmiJ71edEKIA4GnZ2n01I7YnehAHuLxS1Rt+8Ad/fvUd1/8PARsHi892T/6cHBs+fACwU4VPjVFOa5Hg56TKistTGAEYZ8r8zg6dOm9w828az7mIG17nuG5sJZ5sK5JjTn/fteg6er13nWesj3857nhzasfakARwoQKcArBXit8DYoQKIAqQJYBXAKkClArgCFApQKsFKAY+X3+o0CvFWAdwr+iP6135LX/gf+Lt9+BvifTEbBGwr5k90YxS6Dvxrk1v0C6ni6Ww==',
+'GB': 'eNrtWWWUHEUQriQXAQIhQUKwAAFyCznYme6RDRI8uIcAe4se7nJY9vAL7u7umsPdCe7urhfcvaq6Z3ek5vb4CS/7pae7q8ureua9S3M/AGgeho/2QfhobZukxzjFjmgTxDfmpL0/gNs8bmyxXHRUEFaqChdhqVLVOAeValgutmi/BQklJLiVAqnpqDoogv9oUsSBgmXtV2hZqXrEGZCSAAmqxFocpUuVQtV1kIR6Fc0s5ZUqTmtb1XdIik0VyIhvjFjfXE0uuGVFk8IpYBedFp/MlL0QTbt05pMLkW2H2UutbYWqIj1opux6Eaui2SNF6HpYqQUalB1XeX7AMbvaw6wUqtr4wQrLrjHnsZ2yCiqoWBPFL3H0HBiuKVQK2mNh0mqisOFQqj3fJptd8qwFHxVy7ljA1CDkEhijhapv/dEs7zKvyYUi50zklCDtB8Ynn7NjDgLjI5fUBhhEieYcuOgA5Uf51BPauuXVcuRHJhJemrBKJphCNWSVUdCOzZdNu1FrFh7mRhu1JocBmg9tTkid55O+knWxxbMxu6b8qqZbl6M0msKiPlXvBhNqNUTlWFjkyHYaDu1T1pAtKJswPI3+ccMFlHWTGofyR5y+dYzy55r+V6Tcxu/iOjRpMo6EZaXxsGBa0lchM1d9jeZUhWVwWTTpoEtoCm47UFNJsaBu0ehWHI5tB7qMRQyeQ2Pn2DI5UKg6umgr4rkUG3YjaaXWdDVfY5dj9EmdG1AHcrRYaVPx0C9YO/TQ3KHa9Ldb8soe9ZnyMDq+DZwOjbcaTVB6sCScMOIKNKbM42ayjeeSynhzBnTlNKXaK9rEKuptLHjFxToUbHYDtEv2VMA2OJWYUcXtF4WFb4eC7R47bG5CD71z+fXghYoz7NujkrHqIJNDcVOxXMWFJ6dLHkZGzaOweQI/DMmopsuCNBdpfingghoW85rEVsTe9Egs7GgfYF7D9BI+C5cUACtvbaOoTavzi4SzgjQ3umrRZXX4ZUT9kLwufCtMgjACbaTJGVZoMmE6DOmOlaNgzVVVkQZzOdqH2o9HB4pRdGNUR2Fc+2ikhlE+HfxViXtM0FGgjpxEs1csGg2xUEfRB2rcWNuA1hXHBtCijNGgo31I0iibJFm+H1Rr7WuOCituzQVFs4ibG0iZLWYSTmTPz5CXIm77ZsVvHX1vsL34U6j4u6btF0bxSyrA3sB8U7OZOIGC6xs9dqDHXno4iL++0A+aoD/OA3AMhEEwA8woYiYYDDPDLDAEZoWhMAxmg9mZPgfMaTmGw1wwglcjajM9567pGAHz2NW8MJ/F/DASFoAFYSEYZc8W5uci/FwUEfdiNI7mXBRgMVgcxxhowd0SsCQUwQEXFGjwwIcAQijhPBaWwufSsAwsC+NgOaQuj2MFPFsR55VgZVgF5/GwKnKtBqvDGrAmrAVrwzqwLqwH68MGsCHyToCNYCLa2Rg2gU2hDK3IV0GJzZC2OWwBW8JWsDXqaYNtYFuct4PtYQfYEXaCnXG3C44QOUPre7QLExGFFnFKnB4m1mnp9JnBrkLmdhOwu4A9BOyJY68UbW/U2Y5jH9gX9oP94QCYBNUUTwccaOX3zJwcZM8iHJzy9xA7H8o4rEY/FA5nxHkP7wFxvk4Bk2uI9llanS8rJXOleY3eI+z5kSl5SUfaq8kx3Z0pjvh8lKB7sqCDcHSGkodj4NgGHHke5vsb4Tg4PsUvzYQTcHdiIqLORL4j6kkxmZMF3dkaT4ZT4NSMl6elJE5vEG2ncHIGr88U6tkp1ibCWXY+W7CX70Vepus2z2nQTcl8nhvbn5eTx/NzuvaCHO09xXAhPo9PxSNzX5TxtjMREz0vjvFfkmM9vrs0t2OlN0N8fZmQmctzbKXrL9/QOM8VQq3juq6syV6ceQulK2pwldh9V/PzmpzOoue1Qr92Zt55hn5dTe56ATcIuFHAlF6hU1hNgS6G9Nbv4tFV2yX3ac46V11jV+o0yS1bTdK7Er5OESNoHGuc+ya4GUcStwi4tQfcFlvfLuAOAXc2wF0i9e7U/p7E7l64j+f7Y7QH4MGMlodqq4fhEcFKVuJRgWtqYveYwPF4D1rura2ewPEkev5QgvcJMf6ncrL1dGz9TEq/ZLOOZ3M0PpeRez7F8UJGe1r/i3Z+KaP9ZXildlqvlOTHq/Baj/6/jjkxeE7MzhsNfIyq/WZt/1ZuT1J3vS3Q3xH4IrwbW79U478r10bE856A9wV8IOBDAR8J+FjEJxnKpwI+a4DP7fyFgC8FdIuYZiFT66c97/PpaW1p/Y29ybdQP+3OrOuU5D4vvug0L97ujK9Zn6dl7KS5unvIc9pbOReNbXc3lJP86G5oJ52jabk9kNdVSXwl1igrP+1feCrZ/FrANwK+FfCdgO8F/CDixwzlJwE/94BfYutfBfwm4HcBfwio0+vznwL+EvC3AOiThfTrK6JfhtIkoL+AAQIGChgkYAYBMwqYScBgATMLmEXAEAGz9hJDBQzrJWYTMLuAOQTMKWC4gLkEjBAwt4B5BMwrYD4B8wsYKWABAQv2EpLsQgJGCVhYwCICFu0lRgtoFgD/wZ/5E3oT/Qn90iaY/pv+y/z6Tx//uzG+qfGYGt8PNjP9j96/GePtWAfH1Ng+GmnaxAl9YHMcE1/G0d4H9qX1hH7wKs0VHBP7wD8YGkN5',
+'GD': 'eNrVk8lu1EAQhv9kkjAEwjIMhC0sZrMhDh5v3Q5LCPsSVglxMCMuCIkzGnGg5zl5AR6DA9Vt+x9b3NBc+KTq/qu6qtpudfs9AP5Ahklfho+ff6jNUTSdrIpTproYS6SYdte+iJOqxN/ZjsWSMgrjscmLwLhQKUVG54FJxYu0ScoslEgqaanMmbhK5lwblZgiCkyelLkeGyXpmTY6DUyR6EB2S6eTlWpfu+sWd3WNy8S1GZVRatvHkcl0YLJE4nr8d/WGSG3rJC8zeW6UMloHZRy6X8w7yWsiiyhqLS5K5NXuv06+ndzwdUGGb7/sobdYFHpiS8sr2EeAfsX+vhz/qlUHDq4dEn2439Bpc+QoAQbE6WONHnbjg8GwpZ3D2mFLiwMcb9W2OUGAdWL1yVOnz5zdWD9n9fkaqy/UABcJ4BGnL3ne5VpfcdGroq/5wfUbm+GWd9PlRK38UUt7Xuh5caXDJp4QuUoEyAiQE0ApRc2wmmlFrZocbVFaLlvj1LrTR1lc/2oHNYvrdv8qX/F7un2q9vnsG+r8ukDuMAG2CXCLALcJcIcAdwmwQ4B7BNglwH0CPCDAQwI8IsBjAjwhwFMCPCPAcwK8IMAeAV4SeXUEeE2ANwR4S4B3BHOjevJL9snvLcyh3+8e/heW52Tv5dw+iH0S+y720/pyDH8APebjOQ==',
+'GE': 'eNrN1MlTE0EUx/EvBAS3UQnIoIa4oCZIdJZMJsEFcF/x7pibF89WTk7+N6v8w/R1T/JzjlZpWX6quvvl9evuCnSn0wA6a9ZNVqz7+OlrujeaTtYtLuJemuWjseXyaTm0YTj9VWTxB7f0YD9OkjKx0YZ0UGZFlI67Zeomish26A3HZZH0ewPbqEz9pgPbtczdrI0jn+rltqjfLxKr69oB2XSyXB1lB+1WB2VFnOW226BIhn593M97focoth1GfuFAC+1rrFo0jKIqvWgfjo/+ztBxg+8+L1j35Zv7M9YsNpaWT6ysnjx1+gxnBYLgXFDx8fngwixea643m82N4CK+fnNeH9p0GIRh4PJbPrtleUu4qTAM4dLlOZ931T5fc6UlsC0ubtdip+3jtiYsNtu+q+KK1c/y2+1ZjV9ey1t9q3XV8edeE7gucGNnDnZqcd1NgVsCt8X+HQJdgV2BOwJ7Aj2BuwL3BCKBWCARSAX6ApnAQCAXu6gCI4F9gfsCDwQeCjwSOBA4FDgSeCzwROCpwDOB5wIvBF4KvBJ4LfBG4K3AO/mz+FjgvfBbque85J7z4QL/3o8G7pfrf24b1jat2SvHXjR2a8lmedfsNvHdmt0efgJkjtaN',
+'GF': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'GG': 'eNrt1FdX1EAUB/BsqFEEQdG1F1Q27q6mlwVd24q9I2qIWLBgV4yoTOx+Nj6Bx6/jnUny3wIejj745O+cO3PvnZkzSR5SaJMkqTBAQ9RNw+T0vFPStTjqpSLQbdfzQ9Hz4+Z1hQrd8nTeiKPOZIkvDFLqFqoV19OZZ/rM13U12dSfbHJjWqXZKJmxWo2Gqetp1OKhEybucGOVeWK3ymxNW3TNEH/sasVzA90wQ+ZTHmg6PSvzAq1shqoqDkd9zZeKK/lZj2qLwrYciw4FRtkO0+tcLUkar+vib8X7Xtzatp1F7RG+2+HvRM9khMwITNsJmUWVaYXMDiw/ZA5/TocS12X0rfzA9MP0S0n85eRsmMnRMDvaITWQ22RZbpc7Oru6QSEr+KCsFGMPxSqR9fat7h+geY2irFWUwUHRVNYp6yG/yIb8RuSbYDNsyW/Nb9u+Y+fQrmzXbj7saSy44XQuUKiqupfnarFYTLrFJkmvBOW6fVmyHzTQwTCM+hmjLCojnbOmaImNRlqm7YajaW6UzXIr07KtlANuE0+MPlRgBEbhAByEKhyCw3Ck7miWHINai+MUY3ACTsIpOA1n4Cycg/Nwoe5illyCy02uiHEcrsIEXIPrcAMCmIQQbtZNZcktuA134C5Mwz24Dw/gIczAI3gMT5bwFJ4t4Tm8gJfwCmbhNUTwBubgLbyD9zAPDGL4APXeR/gEn+ELfF3CN/gO0j+Q/Erb+a80L0v/LaPjL6NGX3hsmVhorHuSmZ/t+oOoUYylsdCQ/643Pp6TJiim+PyDIuJ1mzRH9U/eCykmctIvoAnh7Q==',
+'GH': 'eNq1k0tSg0AQhn9JYgTxLUGNr/iEmCjhHTeWF/ACJLtsXFushI0rj+UxvI32TLAzcWeV+YoZvu7pGYZicGoAnG3q8iZ1o8lr0huWuUme+UE0pkTcS8u5wTfywHm496gioYoiG8TJmBJ+5vXjcZGMJm7hV3FUxUEV04xpIqRE5sv5gecWUTX+M5xWsV/FQxF70l3aSFTmjemWaENdMvE8sWIoV/RSURSXRRbEqXiJpKRHhFJyjcqfHhdxc8RNds9L1L28C1XQtFpda2jEMpoMsKLrhkGXoQOr5tr6xqZpbtFH0QlDdPrcMju7DGBVtKyZW+QtRuRtm5K2JWv2rJnvK36guN2e+aGSP1K8za5yzAAnDHDKAB2GXdawVk7Ska6s0+EJ0jl/xgDnDHDBAJcMcMUA1wx9PgZwGaDLADcM0GOAPgPcMsAdA3gMMGDoADP0dzFAyAARgz8zPZZ1cSw/8b98fNWwKMRf3lTa71icPptaQo1OAb4BH26NAA==',
+'GI': 'eNrN1LlOw0AUheEfh52EsO9hX8IScExim02IF6BDFMaioaFGiILwnLwCJSUld2I4BERBARKfNDMn19cjWRlNOQeUh2y67bDp4uo+frjts5QE9TBO7Xf00PJkzlJQPt73/YurRjVM/EqUNoIgCWr1KF23nlprt9vWmutJrRKnjdB3DWFrQ5el2P9aLbhqUq2E8V767RtRVvUsn578fCm7pTldt9l08+RiC8/LeV57h9fpddEt0NPbl8+AmwuO5UI+r3p/sWmgWPy05eCQwPDIO8jW0bc89qWe5XGBCYFJgSn5/C3TAjMCJfmou1wqzZQsNfOswJzAvMCCwKLAksCywIrAqsCa2F8jsC6wIbApsCVQEdgW2BHwBapiB1pgV6AmUBcIBSKxcymwJ7AvcCBwKHAk/Ins2Le7Y//yW3s+5/iPzuy2uLRxbuPOxqPLdm+c273yCmVSg8Y=',
+'GL': 'eNqt0ctOwkAUxvG/UEShguL9fte6IJFbLW7QF3BnXBTCho1rQ1xY3sYH8S18CR/CMyCfkLhwwa+ZM19mTqdNJkgDQclKP2Ol3XsLB33fUlwph1GzYwuNwcRW4Npbt5VmUnMdnSSMK3XXmEQWyjcWmu3elTXXJ18ruhOr9UYnrpaHh07tZi1F16PVlOWH+/9Mv+/nLNXiaHzwX92Bm4blec7Ky5erE1JpL+N586nswiI5gfyY7/LSD8v+UL5QcNm23WM9RZfdhmVfpj61vCJQElgVWBNYF9iQ6f/fFNgS2BbYEdgV2BPYFzgQOBQ4EjgWOBE4FTgTOBe4ELgUuyZhZkZX77mrf5/Fea30zH7t8Q6ebHRtvLr8AZ82fwOr31h0',
+'GM': 'eNq1kslSg0AQhn8hcQHXmBg34q5gVaoi2yReLF/AFxi5eck5lZPDG/kQvpl2D9jBo2Xlg+75p+efhoIJXQBhh9K8Ten17V2Vc4+UToaTgqZ52ViYsvnpMaXQccLLcWl49qBHcZqrSWF0bvdFkcmonqV6NFSFyXlHrnjBqMqfFibWoyQrTKKzcWHSMe0ZU8ukjGxuPNe3L8T9qzdyaP7yvIwh5MGm6QqlWYtlA8dx3FbbdVfdNawLwIYAeJ7vb3oMa2Jre4e1L/xqubsnAB0B2BeArkD1HtdqTRzUnsrb7VrdPzw6rutNTgTgVAACARgIpAN70b2oWw85Bz/+wJqstiVbWPRkfSYA5wJwIQCXAnAlANcCcCMAtwJwJ9DvE4BIAO4F/JnqSLT4SHzg/3x+uVgWPQpF0aegr41vk9Jk7w==',
+'GN': 'eNrFkstOg0AUhn9p66V4wWprtSp4BxUtd+rGuHJjfAHKrhvXpiuHd3Phe+mZgZ4Sd5oYv8zlm8PwMwljNwDYHRqmLRrGk7e0mOpkWRDFSU7rpKg9ScmCoX1/54ciyDw/F2HmuUHkJrmIMi/IRZx56SgXWZLmnhhlXkji0MthPeaRLIrI40LElKYSxxOKDMJYRflhlLij3BHKUnkQvxAB7aPIfCiCyKlSNcp6fviLyZaTGl4WaHh9klpD07SG1mwtatoSlhlgpT0DUJNe+mpbX9P1NrWqXu2psb7BAIax2dna7vZ6O9JnAH1G1vu7xl5ZNwbG/qDaU+eAAQ6Z0s2Zm+a8btJCduXVltIVpjn3WV02k9xiVL5lyaa+ZZULqlvfznBolX7EAMcMcMIApwxwxgDnDHDB0O9jAIcBLhngigGuGcBlgBsGuGWAIYMfU16tprxaH/g9758N/Bdd6nQ7QTcCCfUvFAF0eg==',
+'GP': 'eNrNkslOwzAQhn+6AGUNZSllS8qaAganbZwECSFegDOS8Y0LZ9QT7rtx5K1g3LQjc+wBiU/y+PNkZnKw4yqAuElhWKfw8vpRjIYNMp0qQ6d85OXvydJCxg93iU56xva0FCo3tq97FAeUU4Ik1VJlxiotEzrpvKBBXZow8GcNyNR4lpRW90VKRa5FpJkojM10IpSxufuDsYWWhZmMqFDj0+NfbLHbxuFtjsL7s1OPiqNao1DHPAMsTFn0vPGrdWmZAVYYYNXzNc991hkgYMg3mptb2ztBqwXsBkG73d7bPzgEjhggZMijiD0qCSOXD8t8xDXuC9WU2aisD7kmYoCON7/DTD0cezg5eDWlT1up5pgBThjglAHOGOCcAS4Yuj4G6DLAJQNcMcA1AwgGuGGAWwaQDJAwmJnymdXcM/uaoe3zu4r/xDYten2g20RG6wdHp3HO',
+'GQ': 'eNqt0slOAkEUheHfxrGcB5xnHEBFoaURUGN8AXfGBRA3blwb40J4Tl/BR3DhwluNHum4M3zkVh+qbgoIN5sCsjO2PA/Z0nh4LR9V289jluvhaVSpNm2r0k4chpZPs1e1uBoP9bN8tdmqF/JhKe/b66VyM9eKrDtsx2c5i6XkFVP+U69qYRi2oqjoG8rJhgnLlYJdVozvfI3+HleTx4Ft3Vz/95H1j3h57LPl6d3HLkGQ6g8GgmBwaJgRAedGXYfPbsyNKzs30cmTzqlnqit3mZ4RmBWf55TT6fR8OgbzYj1zv/0LAouS/C1LAssCKwKrAmti/es/LG/8gE2BLYFt6exn7OX3vxsymQzsCOwK7Ansi/1NAjmBA4FDgSOBvMCxwIlAQaAoEIrNv0BJIBIoC5yJzbXYEAvUBM4FLgQuhZ7pjH2/H/uPXt35maLXbvt6V3dWL1b3Vm/+vX3dL4jKj+k=',
+'GR': 'eNrtldlW1EAQhn+GVXBBFFEDzAzjMqOiM+l0FlwQ931HlBhxwf3Sw/HCzDv5CL6Fr2N1OvwkyPF4o1d+50zq7+qq6uok02n2AmiOyWVtQC7PVr922t21EZGx689GiTiibnFquQdwm/NzHRm73dRIFXdmwyT1xARJqsV4SepbZyBGJ2nshlEiMkpaqbLZqWunlI2PPW0ClE2ROqEYP0kjMzJpXiEtZJosqkwVs5wOQhuvJVwXwlUW53q2OSkaq6wbT+L8PE7Frlfcg5JepW0/C/SzrjzblDLlgzwtdlVi91HYvg6yhpSXtaPF3UrD8q5jmbQ7yDaYtFpyP/3SnR4U6UcyCEvuIZFhuy2joLv5mUXtuJM9s/LUuEmR9WVWdtJxU1e3fgkyywVtu1xF9J2F35mmMdnlg7wQ+DzajxKVSm+lUunrHxgcwjYCDI9s37Fz1+jusWHR6+wB9nIAjO+boN5f8Bc4cJAADgEmifFPTVdr0/WpKdGT9drMjFNtHDJ6unbYOeI4daNnakcbklozutGsthrHjjey+Hr1xKzjnLS5NVO+CpwiQJsAHdcEuFkP1jq5zt1Gq9ytyvfKI4Am8vCJ+LfSekPrdZ3nan99YLUu+f2i9nVWU5fijTevr1lTF7SvC/1oXVxXb6rD+I1crfOeAyKvKJE3mQBzBDhNgDMEOEuAcwSYJ8B5AiwQ4AIBLhLgEgEuE+AKAa4S4BoBrhPgBgFuEuAWAW4T+XcR4C4B7hHgPgEeEOAhAR4RYJEAjwmwRIAnBHhKgGUiXwUiBwcBEgI8J8AKAV4Q4CUBXhHgNQFWCfCGAG8J8I4A74mcSgT4SIBPBH8dezz2mePxWw/+Dd978Z8/Y1E+i0vyW5HfF6PlOPphrHwuliaAn8XQg+o=',
+'GT': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'GU': 'eNq908lSwkAUBdDLIEYUBwRnVHBKFDQEMoAD5Q+4s1yAOzauLVY25Wf6My58neC12YrlqerO7ddDhZDYGQB2UbqRJd1g+BbWm+54lJdBP4g6z1LpjKfnfBkEYdPudVtS88aqHQ6Gyg+kC/qthi97VJjMqqjjqMiLHFnY/rNjcskx+pCKxEgWua7yfRUEKgxVFDl9rxHfejC1uCCx47rGZFoqD/e/vdj6EncvKeleoR+mIR3LpLNzOcwTYCUWLHkeeZ0WlwrLklesb1PHrK4RUCTJ6z+5ZNa1kpHjAfeWjCwDoGzsNW0QsElx3tre2d2rxHl/QueDCeCQgCoBNWK9puuMSZb5KrNOR3E+5jknBJwScEby1xDgkFE3siNrzgm4IKBOQIOASwKuCHAJaBLgEdAioE2AT/J1EBCSvPAk7zMBXQKuCbgh4JaAOwJ6hJkkn0M2/hxSmN1nBv+pPEN7lN/7JO1d2ofOcutfhLGf4A==',
+'GW': 'eNq10UtOwzAQgOEfJyXQ8op5v1+bsKjUvBrBBnEBLhCyY8MadUV6B47CEbgZjAkduUtU8UmZGcceK7GTAEishElPwtPzWzWdDKSq83JcNTIeT72ZTKo8ub/L6lGalU2b12lWSC4kN21Zp8OiaatRe+sq6b+RtsLfoO+2LoeznY0MHx/+IyUu/YSXJQmvHy56jDGBCcPQmB7LCqJoZbU/iNaiddhQc62bWwpiBdbaOLZdHUttvXq2Rurfkaz3erv3bgq21fw37yjYVbCnYF/BgYJDBUcKjhWcKDhVcKbgXMGFgksFVwquFX/WXV/oru+dxXx+BSxKTho5VeTPqeT5BoBUSY0=',
+'GY': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'HK': 'eNrN099S00AUx/FvmxRBqvKvUkWsCmiBFhNq2xRQrPgPmOEFkDtuvGZyBXkH3olbHoqzCflN6sgMM974mTm7Z082u5M/2/SA5ow18bg1v07Po1YYJnHDBsebnW67f2K1fnIRua4VJReDNAmDJK7c3pDEE9nsbGqhPunqtsZg9MogSTeLgsAGvSQey8puX1cfpHW7vWyDo2HejS4bHYftdMPen/P+1jVdlza/S9acXbrHLiiXPa/s+35l7AHjAhMCDwUmq9XqoxQ8fpIbWXJqWmBGYFZgrpaDpwK1Qn2+noN6IS96JvBcYEHghcCiwEuBhsArgdcCbwSWBJYFVgTeCrwT+xwCqwJrAusCLYG2wIbAe4FAIBTYFOgIfBDoCvQE+mJ/oNgvK7AlsC2wI/BR4JPArsBngaHcnX8R2JPR/KvAN4Hvcnf+Q+CnwL7AgcChcC/Z8fTd8QxK/Ltrj/9dbcqOnEXfYj6PIBu7sK/KlcVeIdyr8W6jZAPPEs/6G/Mas7s=',
+'HN': 'eNrVlMl20zAUhlUnJYWWocWlzA2zLTDY8SC7DCWMu76A8I4N656ucN+Nh+BBeAP4fye+VhI2HNjwnRNJn+7VlXQcOxgopYIdNCfraD59/lqenmxhZCepiaoaE+bUCX3HaBIcHvAX2zip6iaxSZQWdYMVSG8yG+ew3Oambiqk1GGTcUWTRjnSU5ukUVFihEwMmIoCOdJypGUWaZhDpcKykMnCpmgDcZQapHMWUYsxpkrZxCCpsFmBUzfGxhP2pU0zhEqETAVDidxw7wp75rxgGOJimXvFTd7eubwHP5r+226ILqqPpgG9bb6soTn+wcexgOcNhp7nDYdYsq7OCIyNRhujs+c2t86PaBeE5Rrq4iWBui3Qdi77/u4VyN4sdvXa9RtdjP1N/9bt3vZ9fzze66vcuXtv26l5/8FD2iNh5SwqEGihQNN6LrqNabqWWEdrbVYXm61h6kKV1h4Ls5qsyuZJXxOTsp8O+5pau7a0n3ZO3Qa0Xjynk9mf2r1DV9HZQe4+P1aXOT/mzCKB9lSgPRNosUBLBHkYk26QCrRMoOUCrRBoRlh4yCWbSqAdCLTnAu2FQHspLP11Xil1KHDitUCbCrQ3wmrsrUB7J6g/4r2wGvsg0D4Kv3kf2tefX4Tj8Zr6K779HKj/kQ1nvIsfvy/7czdLeb8AMNPHJQ==',
+'HR': 'eNq91Mtz0lAUx/FvSytV2/IoqFWLb20VlAAhgI9ateL7VStqjG7cuK6MC8Pf58adC/8dTwL5CU6d0YV+hnNz7rlnkky4yWoKWM3b0J+z4c37z82yUxv0l23iOxUvsIpbbg1Cv9UOhqvOoJ9OWtuDfic6wXrHCZt+tdYO1qzuDUKr1PxqpR6EdTuNG4QNW600vEo7CF2r1OPG5iC5aiu+atYmbd+pubpYVR1ePFmwSavqV51ovVH2Ju8lWm36TsPV6rRVHm0kh/Heecs9/7etux1Wo0M8fJiyYefjDBOmUzOze9Jze/ftn2dBYFGGeSYGmcVkZvVMnMY9mbGebC6byeUstWcTVfL5YX2pkIBCsVgoRL/ixO0cOChwSGBZ4LDAEYGjAisrpREolX7mx2TyORwXOCFwUuCUwGmBMwJnBc6J/QUCawLnBS4IlAUqAhcFLglUBRyBmkBdoCHgim1Fsa0mtoHFtrtAR+CywBWBqwLXBNYFrgtsCNwQuClwS2BT4LZAV+COwF2BewL3BR4IPBR7o2QyfyzwROCpwDOBLYHnAtvy9/kLgZ7AS4FXAq9lMvfFPj0CgcBb4Y8MP0HRx2cnnOLf+Zrif5rNQXo8liycYT2JTYvueFhP13q+jNW2Ld5Z9JKwnp71fB/NP416eknfLuu2w/hmsRU9ZAsrYW3Uf8l/AMbIFsM=',
+'HT': 'eNrF0rtOAkEUxvG/i6IOiApe8X4HFS+4q0CDvoCdsViIjY21MRZC72P5Fvo4nmHNJyYWFiT+kjlzdubMyW52SimglLfwNGKhdf9S6z5lLYurlbBWb9vCRbdvq2hZtdRsxNXQ9jpRfFqJ2p16WLbtqL+w4Ps2G2dxWKm3O2Hr3lec91ekLasl/QNLr6/+Mn0fz1hWr8XJO0a/9yj5qRcehiw8vvq0TxCkhkeCIEiPjjEu4FzGZbLOuQmfO5frgZzApCQ13pT70X46L1AQmBFb783Juo8zXzWzAnPy3Wd+/ue3LAgsChQFlgSWBVYEVgXWBNYFNgQ2BbYEtgV2BHYF9sR+k0BZYF/gQOBQoCJwJHAscCJwKnabBc4EQoFIGJjkWg77a/kxqJ7NFP/l5hJubdzZeLbx7p/f4BNdkG3Z',
+'HU': 'eNq11Nty0lAUxvE/J7EYqFJaz1ptVWiphQBJwAP1qnf1AYA7bnrd4Up4Pl/HR+jaSfiGdKYzjKO/may1srPCDmRvmgWgWbewKFuYzn8F7eFqXUcbdTw+dd3jUXc6X/ppnvhnw1lr2bMczpb9id+38+XAnVoOJn4viKwIs+2R5UHoOodWBTbkplgtSslkNlUjmWrih7OOfXqnG7eEaomSJ4s6mRtttGLV0PXfveDa+2l73uqrH9unpktxuM5ZuPHc77YhXyiWHpQfFncqj/AEqgK13Y26llSu57FX9dbjXlp5ae3F1+CJl4y6ul5Pb61mHmGvIbAvcCDwVOCZwHOBF5L9ji8FXgm8Fngj8FbgUOCdwHuBI4FjgQ8CHwU+ib0agZbAicCpQFvgTOCzwLlAR6Ar4Av0xNaZwEAgEAjFlrHY4hUYCXwR+CrwTeC7ZOuxwIXc379ZbyPZGkW3NYo5/q0/Bf6H0l8elxZ+lpIcH7YNf7ts/y+2q7C3ia14bgGLG6MH',
+'ID': 'eNrdltl6FEUUx/8mbKLpBDIRVPZ1BjPQPb0XDjGALMqmKBEnbQQjbrgbotIDgiy+Ak/kA3iRl/GCU0v/0xPvEG74fd/pOnXq1KlzqnqqpzkMoLlRHgvr5DE7fzOeDIL+woh0ekE7L8SSTAZ+vzYsnUcvAJ1e0In0eDqZ9cvmlOqI9MK4kHlRUSY9v50VZSq9pCiz2fkyFzUrWmUofkEp09txKh6h9pA2kjYsyth4yXTpxYmJ4LcjG6JVRjLX1zOzvCiDnh+EUSpZSjS/HSZtE85vdyITUYcKUxcsNrmEklmmE48lkVgnYtaxITqxDSDDibaYjMxKOpLOIXElJHpmPlXKFNkBU0KUuBmJjKcuso0jpUa67YWJ9o5shbHZX1NeqN1aZW6L61SVaS9dWJTaFGx+Sa8TJqmZGcS5Lkf7yqotczwZjyo3Jzkmnawq0pxWTo/MeExIJ0hTc9Jykpnvm0Bpf2GNdauOP/NzHaC/MCSdc9NP2jR1Yx5fyWuEn6/rZWoMDa9avWbtuhfXv/QyRgjgWUY9T/SxsQ1jGzaONyR575VNm1+deO31hti3bN223duxc9du7bNn7779zQnP+LcaB8YbntXfmGxMtBsHtX7I933P18gedELPi+Ik9QbSyXICKEL9sNbfJGLvCs6nW6Gc3YzU7F3ajc8RUtnVwNxKZw7Oo1vFVF3atZeObz1U1+pOtf5qRczaWlV8xVpUt+pwXZu/siG7lY9arku5HFQtN5Y4VbMv+7i5Sv1nf+r5i/5WdRTTwFFic1Dcf8W9rbbErbWcs+sot66Vat9sznWOEeA4Ad4mwAkCnCTAKQKcJsA7BHiXAGcIcJbIr4gA5wlwgQDvEeB9AlwkwAcE+JAAlwgwQ4CPCHCZAB8T+W4QuT0IUBDgEwLMEeBTAlwhwFUCfEaAeQJ8ToBrBPiCAF8SuX0I8DUBviHAdQJ8S4DvCPA9AX4gg/YfCfATkcuPAL8Q+RoT4AYBFgnwKxm0/0aA3wlwkwAlAfoEuEWA2wT4gwB3CHCXAH8S4B4B7hPgARm0PySD9rr+F8H/wn56VulPz54hPP/8O/zUQ65+BrJ2hYw6qdvkZsXJmpx38nfNJrcX5KbCksickyVnW9Tj8qdjRmRJZM6J1mdkmxalldsScjPiH/0XWL8kIo8B94dKLw==',
+'IE': 'eNrN1mmb02QUxvG/s1BQyqS1dRRRdFBnOkw1aZOmxQVRVNxxQdRYccF9X0ZUEsV9Bf1gvvCdX8fzZLlJweWVl/zmepLTJ+ecbG0ya/PAWtsWm1tt8czxk9FG4GebO+xDEgzC/mRqc6ONSTa7feEiCOxTvDHO0sHa/n1BnhZnaVIVRVk6zPPjrJeGluLbpnKDtR7lSa5gWMy64sh1ydK4yBonfj8c9cvEXhrlTcKobBIUyYOqOBmO4qrpOE/ppaPq0LI0VN5gGOsQk2hUtY+TIKzKg3FRNDlbn/ihjrgq71VXZZJflZ32YWwVg0FZMozKo7fL1NvcUuS6zG0WBmPfz/PqG1bcBneiQTKwWjvY/njqp9EknST+eDLtnVexPW+VRJNp2W2xPKTilsX+edMNNz3Kz2VzzuKHDsyu1twqX7xmt5kPfnN7q5mbX5hb3NLYuu3iS9gu0HR2NJtLTfCarXYrB5d2Ou12t9O6rAPL3XbH8zqdlsVet9VqW+hyLnez3hWe59n8zit3ebsc6HS91lVln5qrdwtcIxZfu7KyssfGdXC9m7rBDVgVOzWBnricdfsrcvYKrAtsOKtuUfRcXy/y+7X+N8rZ/e5ddfFNyvHF7p7MXueBwFBcHJYgrM0rrs27nKiWM6rFsdjXVmAisE/gZoFbBG4VuE1gv8DtAgcE7hC4U+CgwF0CdwvcI3BI4F6B+wTuF3hA4EGxb7/AwwKHBR4ReFTgMYHHBY4IPCFwVOBJgacEnhZ7IIv9kgWmAs8KHBN4TuB5gRcEXhQ4LvCSwMsCrwi8KvbUEHhd4A2BNwXeEnhb4B2BdwXeE3hf7EEl8KHYq03gI4ETMhvX+3ws8InApwInBVKBTOAzme3zucApgS8EvhT4SuBrmY3rfb4R+FbgO4HvBX4Q+FHgJ4GfBU4LnJHZ/F9kdv7v4l+F/0Txaltwr7aDc/yP5rmQLF4Ao/EXY6kcjX8YS2X90jmj8S+1XXuc7z5nLFfDHjXLv9tr8nAxjtgOjrphhX+4tf2bc8zWJ2z8CUyoXk0=',
+'IL': 'eNrV1UtT01AYxvE/tFzqBQriBVQEBW2VahrapsELIGK94w1Ra0Vn3LhmOi5s9n4Ev47jwq/lexr6NGHGlW78teecN6dP0yaTnBQyQGHSuvaode8+fQ2Wyl7UHreNZrlUDUphyyZrS2HUHukFrJ5xX1tdafqlSj1sdQJX1Er1VtEFovZQHLXgmFXVpudXakF3T/Zh6oembaNse6p7Ta/sAstRx69Wi92qF613o7P7Ub/sd2wIy2HH9zyX9CPXV6L2cJx36Yn9dOB5nboXukAtag/a7JP13tD/m+7YgiD+f+lMPBTc0O0+D1i39z1LymAmm80ODQ5nsyOMCuRyh3Lm8JGjMCYwnuu+7O0y+Xw+l5/I51K7nDwmMCVw/IQNJ+P6VGJ+OlFPzfTr0wJnBM4KzEr6uM4JzAnMJ+q5ufOJ2lyI64VEZnFxv1xI7GceLgpcEjvVAkWBywJXBJYESgJXBa4JeGJXiYAvsCxQEbucBWrirp8eqAuEAisC1wVuCNwUuCWwKrAmsC5wW2BD4I7ApsBdgYbAPYH7Ag8EHgo8EngsdudIOrMl8FTgmcBzgRcCLwW2BV4J7Eh6/rXAG0ln3oqtgWIrhUBL4L3ArsAHgY+Szv+p/hvxMuUWqL1vA/w7Xob/kV3lNBLt14HtZNu089XotUy/3krOW9u2W23nQPtibde1H3ZL2pNlwzV7rmzY0v/T6t96BByQ',
+'IM': 'eNrl1Ol20kAUB/AhtKXRLrZV3EWsWlJBk0AWcMENcd8RNY11qUvdFWPVJs/XJ/DoY/gI3pmEP0mLx6Mf/OLvnHvnzp0MM+RDCmnGWGGSkjdMaW5h2SxqauCN0cTRDMuuuqJXDZLrMk00U6/wRuANhUt8YZRKyzHMqttdnAgXraBQr9GoF8uBUvdmqGur1OKhEV/8thUovi2eVnxDVdf8/DS/br1mW46ml12/SrWjanRH33bUUtlVFLHZG08eKo7ke22aVyiMiknX8x29ZLjRcZYaFvHjMvzf8L4drG4b5po2fykWXgrjV5W6aTFFqfN9gMVIaUmSBqTBocwwyMI6ivWiGqEY5cXYOMUGKiZkeVKWp6bCJzfKmyAbszkat6CzFbZBNrsd6zuicWc07qLI5XK7eZ3L5/NhN58Q9vbAdMJekffBfpgB/kQBOxSRZw/MRopQSjgo8iFQQQMdylABA0ywwO6pdosaHF7lCMVROAZ1OA4n4CScgtPQgDM9zW5xFs4lnBf5AlyES3AZrsBVuAbX4Qbc7Gl1i1vQhttwB+6CA3Pgwj2Yh/vwAB728QgW+ngMT+ApPINFeA4v4CW8gtfwBt7CO3gPHfgAvZ4HH2EJPsHnPr7AMrB/IPzM8Q9c50eK/bcG/zIa9Oaav4mV+HwkHPnezB9Eg6IZxUqs/lWv1UqxNsU8H79SeCm21OKRZt94z6Vop9hPrDKcfQ==',
+'IN': 'eNrtVmeTFVUQPZJRYRUw58g+ZWTmTsaAiDlgGGYQZh8grgF1Tc+dRXd2wZxzwpx/iV/8B37zr2h33zv93iuLKj9QVlnloeZNT8+5p/t2951lcimAyXX0M7uKfqam55NNQbAwu4Ye6sDL++TJNwX+wshreti4jFZt3RIEral902/DsI1qP+q3ad5mfq82XsIr04WWWXQRzTNRTkw24j7Rg4hudZz3yeq3Se3zLa0DE6f9NqPHMEr6vdawQi3OkJ281A/6bcwPqV0YZ7Qyo0VBnJCZs2KvDTluwpG8kPlhFybLOZBvPAogi3JiRxInJI+hBZGEC2JeFxheF5jEs+toI2xJih7nlbOol5JITCJ1QCI179EYCm6yTqNOs37AycXETDicaWsTUhmCNk45RCgFoDSphm1qGUYclAunH9WcWCyJ1UlKC7Os12bMTLgVjmoSyZg3Q/lSWEqWl+dBT3uTSG+0PWHsZbyWis6bo7xDMaRBvqHXOWs6I2VeJkWgzni59ilw/rCmImWi40kBTCx+UqCqpyJB1UutBJU75zJadds5P2iDmt3cDhkYE3uulqpF/FSkJAkrlaTaTRox3ryp4y4peU0a3C4SCEk4DXmdEDiDLNc+JjyaUgVugq2PTKVMr5fkoiRFJmEbXsbPyOQmriKxpGAiO8LCjLrUY26H20zkyRzTK8/VNvBYJ+t0UpuK6Xrl8/jZbnVDGU9Ni5T1p6LAQlQySYyC93rESV3vZYZFtesxZSj9kWNj6xZL3WQaqHp8cLhWU9MslLnDTfKildFs9YZTFi/MrrAfDv5s/AH5bHDwMK9FmszYp5QT3hJ9Pdhb24ni+vkUjcpkfC4986M2iWlfiRy7RHip8GyDY75Fpk18em2HiTOkUlHeUpMgos26qvEhpS9CbmtCO5qPFoRvIweiRjUyVDW3V1Lhj2IbRT0+91JnqUTP7nZ1t1v5jG6gJz5fme9PTW+lrPyeHL3ZJfRix7bjc5vkm/wcPIF+Br+txBiWLF22fMXKVatPPOlkrFEAaydOOXXd+g2nnb4emDhj4syzzj7n3PPOBy648KKJiy+59LLL15J/42Rv4oorN3lXEX+zH5hwcxQnZKdZlG+5+ppribP2uvVbr992w/YbbwJuvuXW226/4867dtwN3KMYS+fe+xRAoWB7J0PssiyrsiKU1rYPxGHT2VXnJnvXiF1Yfsn2/WXllMhfDf2dfCWxqmrELotKOZVdwmsLoZQuB6vq8uniVqN7EdAq9stK6y93l4WLVditFF0sK0t2VQ5zdjkUpehbluh0VRnhWL+VtzaJM9HVs+zsLoCLK1JSn0LrXFkdm6dEsvlbf2H3XvIG3b4k6NDu1koKulbo6pcnyy80Z1dmuy/ZleNXu7taOXXmd9Xv+JxdscfWfKw+9VR/715gX7n/gerAg9PVQ8Cesnr4kWp/VT1KJ+fAYwcfr56odoumzKFozsyQ9eTOYmaG7Ir/2b7oSDK/GxSeycoNirXHcus4LmPKlTWr8qmqmilYn1+QJbEU42f5aQXwjAJ4VsF+McQ/UADPjfhnxzhiC6djNw0w9zedpmlGOING7Yb5zaARm3WakbiDZpzfdH59GOqP2k0z5Fi7GWp2lEZjDfmDwdzcnOM7/WYk5zkFcEhh63bI7fd5BfCCAphXsF8M8bcKYEEBLC4eZiwuLrLdATisAI4ogBcVwEsK4GUF8IoCeFUBvKYAXlcAbyiANxXAWwrgbQXwjgJ4VwG8pwDeVwAfKIAPFcBHCuBjBfCJAvhUAXymAD5XAEcVwBcK4EsF8JUC+FoBfKMAvlUA3ymA7xXADwrgRwXwkwL4WXFs+xfFsTn/BPbP+jL+s350Cf7H8cCfS/+zqS//ly/63wJ20bWPrt/dRV9N0FcL2+jaTtevdP0FwCsr8A==',
+'IO': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'IQ': 'eNq10jlOw0AYhuGX7JDYQNj3HRJIwM5iExrEBbiAcUdDjVwR9xyLY3AbmHGUTwkVKOKR/M83M7LHsv9GHmjUTUkqpjw9vwUt30uTmplEfjuMzUrYGqRJebxrcmCybzfSYeP+rhP53XY/HnYjr9MNwnjYsyEe9iPP1MBMgriZ3RqmSWn0GHtE1cQw6rcH9ozbNMmZ+ePDfwwNO2TlZc6U13cbJ+TyhWKpXJnP5RaoCtQEHNdxXdcxwEYnu8Z5vO5MZBvdLGdLi9bUsUvLAnWBFYFVgTWZfv91gQ2BTYEtgW2BHYFdgT2BfYEDgUOBI4FjgROBU4EzgXOBCzG/TKApcClwJdASaAtcC9wIeDKdfYGOQFegJ9O5L/zKqC0Lti0/md3HV36m+4t/uGw3lyfG4o+56WpMB2O+Ft9dzW+B',
+'IR': 'eNq10stOwlAQxvG/lEtFRW6CN7wAakFNaFxA3RhfwBcQd2xcm6607+Qj+GYyp+AXSdw0xF9y5kzPdJKmcwIPCOoWYt/CdPY+vglHSVy2h+fwNnqxkyj5szZZ1oqLmqs0LY2Ch/twOvu4S18ZuK4kzlnh6fE/tsBtaXjdsPBWdekvOW8pX6AoUBLwN/2yn1pp3doW2BGoCOyKnf+kldVvqArUBOoCDYGmwJ5AS6AtsC9wIHAocCRwLNAROBE4FTgTOBfoCvQE+gIXApcCV2LjExgIDAWuhcwW1yPvrsdnxtavb491FTIumzT217HJMrY1B/DHTZQ=',
+'IS': 'eNrVlcly00AQhv/YCQmLyGL2nZjFhpgZrSOFQDD7vocAsuCSC+fg4oB84Ul4FZ6C16F7JLclKgequMBXnpl/erp7eqYkudME0FmibjhL3WDrq1lJRkM2pEEvycgQjXI/5oXRcKZ0GQ2/c9j6akDNTXXPC8Is90iYLE99k5GKszxItV0IaeqHUZZHg608pkkQ8XKSatfvmSTr5iHl0WGeuuRFPpTJCw25+NYlsqnsaHgzuxRbRSWWeaKYE8Um9fysS0UGo9qJvpH24zQcH4k2jIri3YCL8YqSfc5qOGvAKrHF85BG9lQRy5iTdHND8bQamqIsw9uTiTPRodMgYjeKdyldtyxpcoNzpGKtfzdzzQlbw9GwQfppf+dhEjFPKpC7LPLtFNLhwXafpqjb/jyNGo1Gozk9s2t2bvce7BUgeh9pZ//8wuJSa+HAQeBQ6/CRo63WseMnyH7y1OkzZ5eX223SzDnnvOMAF5yLTrvT7jpkv+SMqW17eUUAeswVboASAK21ot9YW6pas1Z1n2JS8dGlVoW/6yqXUW651ziWhY1mf1VsZe0Vras+5Yqe+LP2PKU8RrEuKTRvRINompFWFV16V3Thb9fZcWJn7VfuamxlrSqxqrwdtgdC/RkIBSASACPQQyvQkyoAqwJwVQDWBOCaAFwXgHUBuCEAfQG4KQC3BOC2ANwRgLsCcE8A7gvAAwF4KACPBOCxADwR6I0SgGcC8FwAXgjASwF4JQCvBWBDAN4IwKYAvBWAdwLwXqBvt1D3+Rs9EIBMAD4I+COKTxB/fLbzKfxfrDX/uZI2+pO2Se0jtx/AFxp/so1ekUXUW4v/DKn9ApLEVEs=',
+'IT': 'eNrF1dtS01AUxvF/aRGoIkpBxAN4tsWqDYUmQQUqIJ5ROVRFxhtvnPGO6XgheTdnfAhfx7VT89FdR8cLZ/zNrOy1ky9N20l2ynmgPGqb9qBt3n340qgGQdIescluLahH8Z7tm68GtSQLRGlgyCY1m4Xdh2JN6mkwTtoD2adaX7I+qpWXFtyJjeTAhepJ5ddMbJnZ9OBBnEYr/hWGXWhuN4z20tPCni9QtEkQRtmxPps+b/5pKLsh3XzM2WZ/tYCnL1/oL5gjA4MMCRQ7jhbtiscEhgWOW2DEpU4oX3T5LidHBUpy2I9ZPy5wSmCiVDrdk5+cTPszndlZ/7ecEzgvMCUwLXBB4KLAJYHLAlcErgpcE7gu9rcLVARmBG4IVAVuCtwSuC12k4rdFAKzYnerwJzAvEBDIBS7DwVigQWBOwJ3Be4JLAosiX/usvj7mwL3BVYEVgXWBB4IrAs8FHgk8FjgicBTgWdiT5fAhsALgZcCrwQ2BbYEtgV2xM+3xN//WuCN+P1b+X3mb3SWFLeY7H/K8W98zfO/rOQOq9nVf8v6vJ/pzWW1YbX+s9a6+qze2xLXcmWP3baNn62+u7ktU60JW57GbNlzZY/ouI2h6205cy8t9y7pt/oBej76Xw==',
+'JE': 'eNrt1GlT00AYB/A0gBBRVDyqgop3o4C7TTYHqGhVPPBWihoCHnjgrVhR2XrrN3T8Ou6zJH8SOs7ojPrKX2ef3edI2nQ6LTUZhlHqVKHWpsL41JzXy1m91qGSiAs/CGNdC+v5vqUSLhyXCvXakvkWNXrU0S8NDQgWStoZk6Fvy6AcytDx7Yb5LnUMGA3StCNkwNV0yDiNurnRfvqoQwOBz8vMk6G+yPMiEcaSB5xJn+vbSCFsu/HqgN5IDbiZxYR0y9ILbekzx5aCSi6XAWM2lRgrN96nnR6QccF5Q6tVHYWnkiBXHqQrPLp3xHg5luXIEV4sXZU5bixF5Kon8CLW53jq4PvqK5Bh5IRx8m0Z9NxmGqYLKswMtxgZZpNpms1my5LWNrDIUgva1VpGh+UdK1au6lSH1Za1xrLWYmIdFLPWz28boLgxbXVhqLu4qbh5S8/Wbdt3pKWd2T5lZFeS7taxZFPcszcd6u3TW3+xuA9YDtexDDp1ciOuEGIhE0xnItnToi7pQZGkSTlzaXIWLltkoeBlqvR7YeqnEzI2kJQG2f7MwIHcTQ5mzkOMHUrPh6ECR+AoVI6l3WE4Dqp8gnon1St1Sq2RymkVz1Syzup4DvkITucreRcoXEyzSxQuUxiFKozBFaheTbvXIALdGM/EVJzb8vW4uqi5eGoie5iYqP6krfdJuA434Cbcgim4DXfgLtyDabgPD+AhPILH8ASewjN4DjPwAmrwEmbhFbyGNzAHEurwFt7Be/gAH+ETfIYv8BWMf2D+T7WZ/lS7TeO/v6DlN1brL6w/PTc6WjDG1Jqk/ZtatYIxq2tNxnfaY7XGCsYPzATWRA==',
+'JM': 'eNrNk0lz00AQRl/iJDhAwAkEzBISm83CkRnZkkYKSwjrjRuVg6KCQy4UR8rFgfHv5M9woEe2G5kj5MCTevRNTy+jrdcAelsyjJsynJx+t/uRmYzXZVJkeSmOfLK49EUmmU17hwdyJoUJh2np0pNTZ4soFJkXwzArA4lPJk5CrJgRXyrlXFaYpIqJkzJwebUUSbiLCjMc2WyaHqdSwFeIJ8F4bdrctz6utx5GrhjFmWzRJYXPtDbwu6hqGut7RWFsw9zXNOEoFTVtWZiozL0zsfm8T73Njm/jyxiXJC5NpbLLskA2Vj2QdCF4Q2RuTG1xWTzvj/720vOXavi8JMPXT/4N1Vie0VhZZU2Bc01h/fyFi/KyNppzFlIvXVagtTkHNv/Urbq/VdNbrXp8S/SVWm6dqwpsb1+b4fUcr6+32zdu3mrf9npnBtxRYFeBPUX8nd/+jgLdbld83U5nt9Iz4O5UdO7dhwcPZ+4eBAo8UqCvwL4CoQIDRfz9SoReD/zyYFDFqBTdn4f7XJlI8UpXuaE/4LECRoFIgaECIwViBRIFUgWsIh+5It+wAgcKPFHgqQLPFHiuwKECLxQ4UuClAq8UeK3AGwXeKvBO4cyY/m4r/nfbW/qHOj8b/A+snpF9kGdxLPZD7JvYRz+XW/wFKXzKCQ==',
+'JO': 'eNrN1MtSE0EUxvE/SRDaC3KLCqjgBQk40cmEZCZ44aIYdaEPMGbnhrWVlZkdD8bO1/J0Lp8dq9SyyoW/SnefOn2mO5X0dK0M1Jat689Z9+nz1yzqFP0Fi/Ok2ap3epZKo6yYTA/jxfF0u5cn9cyXtIv+7KjAnl6zKK0dHuSN4eSgk8eJrbQ7VTdeMot/zs5b1Il9uhWmI19sizZsZtCyXFIMhpvESS8epHmc9fxGto3fZz/8Pn6f1C+YFv2SxR+OfzfU/DDszmas+3Luf6JAqVQu26cye2mOeQHnLo84uHJ17BosXHfOLbolZ/llNzG15MqqQFXghsBNgVticfVHvCawHqyzLrBR3fDJ29U7cDeoCW0KbAncE7gv8EDgocC2WBysM4m3g3jLah4J7Ij9HQK7AnsCjwUigbrAE4GnArFAQyARaArsC7QE2mInTuzgip1tgQOBZwLPBV4IvBQ4FDgSOBY4EXgl8FrgVOCNQFfgrUzH7wTey6/rw/hvjV7Jin8loxn+rYsy/5PKH9qp3W1dax/Ho2/f/GjXTdduuyW7oFd8s+PctPE7QUK8JA==',
+'JP': 'eNrVlElz00AUhDtxFkMSwDECzI4wYEMMsmRtYUnCZvawVlGl6JYL55RPyP+NGz+JK+/NyG3pQBVH+Kqs19PTs3hqpF4DQG9THpOmPA4Ov6dbQ29abyyXjenkl6Z3tofy87NgEOVFICXNi1HmaysLk1xUkheRlDgvYinSnWbDQRgneb/wjXFwWGRBlItr9EjmizLPD0IdKgnNip+qTGVUaAKaNjOWoUQH94tYOoNsZLfhmfUyPxzYzsR0+rZTzSK08ySZF9hoFNtoKtFMGzZgVtCOvvz3aDpZsaegB7ImMosl5ImRVA9Iz23oe3ZE3U7T0l6Uxru9WZmHVkVFmolri6kdlgvVh9rS02Ie3xbkcdRcQo3FxtLyymrz2PG1dWwQiD5x8lRrs906rdopEe1UtGmccZyzwDmjOy31z1cyFzaci5fmun254zhXrNZ8x7la2841lwDXXbcrGO1aLajuVvzSruiar3nrmky3O/eNVRurqwA3yGyszd8kwC1i9uZW55zvc9ah/nz/vcqcVfoEuE2AOwTYIsCAAHcJcI8AHpGrRwCfAAEBRkTuFZGrR4CYAAnROzwD2CbAfQI8IMBDAjwiwA4BdgmwR4DHBHhCgKcEeEaA5wQYE+AFAV4S4BUBXhPgDQHeEnnTCLBPgPcE+ECAjwT4RP6sP5O6/4XU/b/Bfhb0g3D0dQH/BusN/C+MW8BP+e23rB4Py9oG2nJd2z/k1ZL6G6KTFzs=',
+'KE': 'eNq11E1T01AUxvF/Wypo0BYUawFFkZdWqKZpSVN8AezeLYvSccOGNdNhQfrp/BB8GRae3DSPgZEZYcbfzLn33JtzkjZN2igBjUUbxnM2nJxednfb/iRbhG4xmx3pT8brSf3BfuDH3aHfCkfx3slpHFoadFv9UdOV9SbjctpiDU3LetbRTssDK+8Mg1ZknUnXKO4N/aDjOkNdt++uu2CLyFp9P44iV5CceloSuZKqLfppSVsVRdv8cfTQqZFMbjgr2HDuJ7cop1gsFWfKj2bnHj/BE5jP56l8blzuZbn39FnFq3oLSc3itPO55S+W/pwn52VN4JVAPeX26wK1WnbE7au3XssWsJw7Z5YtW76S21+Vm/fhtcAbgTWBtwLvBNYF3gtsCGwKbAlsi/1MAk2BDwI7ArsCLYGPAp8EfIG2QCDQEegK7AmEYi+D2NMt9hgL7At8Fvgi8FXgm8CBwKHAkdydfxcYyM2af5G+PjPJ61Mt8P9cl+48VL5nJH9ylel8O/66b9+rUkhnhX2cY5t/WlxYXFkcl9IYWP7LYmD5b/pPotU=',
+'KG': 'eNq9k0lz00AQhV/kmAQRNrPLJBAIYIONx5JGssKShH2p4kZxkF1cfOFMuTgg/wf+Gwd+DvTMaF6UM4HP7tHz6271TFnqtQD0OrIs1mSZzr/rQbFcbIguE50NJzOxJssjyZ+mZW83kRhLxNN5lZTjYTGrdFxloiazfhWbTCwJNUxzSWUicvFT5+syG9ZuKq721akUVbqwCS2JzJcn2mSMnYidsz6bzKrUzrRtspe81HZS4WpMsu6Ufbk7qqIax1Vcxmb4dN43J1su2u6McsJtUbocx2Y34uRLO1CVSs+q3NVnzfp1UROlnB3Ijw8Hx3PpmYtdvqzI8vWH+bsaBEHQClbbJ9aCdZwkQHhqIzx95uy58LzoTke+soTAhYuXQgdw2QnrXwlD+g2uXiNARIzuXo82t2q9eSOKbnodRdu3vL4d7dw59O/e87q3tdPte/9+9MD6A9KY1bWzmnO73VoPzGXg9LCxtyYPCTAigCLiN/VIsYa+rzdJddhrayyutzZH3j9aYwzfyxo1qmvY6nvtp+7192nMVY29jQkQEyAhQErkwSZARoCcyMNMgIIAuwR4RIDHBHhCgKcE2CPAPgEOCPCMAM8J8IIALwnwigCvCfCGAG8J8I4A7wn+Cvd6rprXU63g3/O7hf9F+5jjo8Qnic8S3yR+SfwB4mvhkQ==',
+'KH': 'eNqtk8tW01AUhj9oSxEbRUCo4AWvFG0gbZMmwQuynPsCITMmjl0ZmT6dr+XAfRryr2TpBBbf6t77z5+9z2nTnFEHGG1ZKtYtXV79mo8nwaIY2EU28dPcnHicLop+fTdZFIGbOT+bZjN/npezbOpKaCXMyyzy49xklB87I66WiBZFr1rAxv1q3D6TLPBnkbWUqW0Wpjbj9iyTyK2Z2HU1u1bNui+2a3KSBIGbvrwqp1lQdYX/dqX/7Vq1W98vbltGrizTjxVLPwfu+TVY7XR7a/1+f/3eBvcFDAzP4sFD8Dxv07Di9GZbe17Dr7Xx6FovFzIGrW23tgXsPK4xLWC34e+1eobD4TI5vTR3nN/kiYB9AQcCnjb8Zw39XMALAYcCXgrzX72Wf/jmrfQ7AUfC/g4BxwLeC9N1i+kPwnTtmx4L8AWcCDgVEAh72QRMBcwEhAIiAXMBsYBEQCrgTLT1RwGfRLvns4AvAs4FfBXcmOpodN3R6K5wd/zpcNf0bhjuROxZxNfVhb3FuJ/ZacSFGd8sfrtqxl85YJzz',
+'KI': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'KM': 'eNq10stKw0AUxvG/k9a09V4v9Va7jYtCaWwH3Ygv4AvE7ty4lqw04KP5ZnpOCh+zLeIP5sx3hpkQMikyoBhaqbtWXl4/YlP3LVVlXFm3bJL1saVYPD4sq9m0jNP71We0tPB0azvu0r0DS2U1L/0hi6YO1j4//cdU+NSWty0r719eEyGEzEYnhC7bAnne6+Utz64/8JzY2RXYE9gXODC2aHWdrWtz6lDgSGAocCxwInAqcCYwEjgXuBC4FLgSuBYYC9wITISNra+j017Hhke/fzL+yr4UI/9Xbfjb/wLGEDw9',
+'KN': 'eNrF00tv00AUhuG3TVtSoDQthGsL5VKwIS5uGt/KpS23JSsQi2CxYcMaRSxwfid/hgVn7PjTBHZQiUeamW/G50TKyA46QLBp06Rr08fP37PBfjydrNpmnBelHRTT+Ue7tsnTIjg6HLpRVAdpWI0spuMkKsoqi8PQikfTyUrT5pr21JS4MU6jvKxcQ1aGVZqOh3WnW5Pyz+5t1219cVwliZVXWVbleVh3WUk6V7xmsYhj7+Ginbw9+dslcEs9fVmw6es7d2WexZnO0jIrAme6ZvXsufN2e2vd1lzrhXWB3kYLNn7PPf/cNpuq6fn1PcsXvV7fJYF+//KMyy2Xr/SvXrt+o8lbM7AtcFPglrjzndvtebPeuat8b9c7v+/lB3UOBEKBhwKPxDsftHlQ1zTRgYHX26xRFLXZxTpHM21u6vcEHgvEAvsCQ4EDgZFAIpAKZGIvudg7LHAo8ETgqcAzgecCRwLHAicCLwReCrwSeC3wRjg1zSe25D6xrYV/+J2fHf635VMa7+0ePtj4YeOTjW9ub3/vF7jFprU=',
+'KP': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'KR': 'eNq91fdSE1EUx/EvJYAKCRIQFRXERjTBTU+wIPbeETVGLFixK+KMmzfyYfzPF/BBPJvd/NxlnLEM42fm7j337Ll3U25uJjqAiQG7LPXY5c7C50I66zSWBm1Qy2bK1bql8ulqw61YUGlEqxZtkJ2YnipaKxTcUsktl91Kxa1WU27Jco7jeulatlR3y47dSaW8uQ3X7uXcWr5Qt2fk627RumLdK8wU6im7mbWyXDrfcGu5TPMllNLlRqr18Grz4f3ew2tOJlf0S8ppe3mxoKKx1G1RxfHy4WyvRSVHqzaW2i1xcabVdfmF3vLe/KLjv+kV6XKQjs71uwmva16etdnl/Rfv2SHtHZ2xWFd3z5q16+gV6Ovri8cT/dZBfP1AwOJkMhlvgsFkMhjBUCu0eEO8BYY3ttjcUD5k02aBEYEt4ue3jmwbHdsO4814x/iY1ewU2CU2d/eegL198dZMBWCvwD6BtEQ/q4zApMB+8fNOkPfvO6HYG/yc64TiSQec0Jr+Iv7crEBOIC9QENsmYptLbJ+IbUWBqsCUwAGBgwKHBA4LTAscEZgROCpwTOC4wAmBkwKnBE4LnBE4K9H8OYHzAhfEfi0ClwQuC1wRuCpwTeC6wKzADYE5idbcFLglcFvsIBQ7BgTqAncF5gXuCdwXeCDwUGBB4JHAY4EnAk/FThyB5wKLEs2/EHgp8ErgtcAbgbcC78QOPIEPYn8vEo0/CixLtOaTRNcPx6vFP7o7vaP7exv/R2/Hqi7n/eN0h1pixTjcYqH2qzmJv5jzL/V/Upv4zbqz9j0tW5uzNh80L57r8PtvwXjIjpOytWFro15v23j4K/wAvyuQ5w==',
+'KW': 'eNq1081OwkAUBeBjAVFEqoiiWPFfQamW0h9wY1xrfIHSHRvXpivbd3Phe+m9UE9gaQxfmDunnTsTkradAoBOXUpSljKefIS9YZbUJEd91w9GsdwKemG2sPysmx4f+sPxJHUlRO5A+9ws9aK+PfBt3Zb6suJEzsCL08i1vWB6T9fjNJQpjLvdruzysqQ0O1tObs9O9iPHj9NAqrSlo8jxwlGszUGWGNLy+rSMqaPTtLytSHl/0TjHKBQNo7RqGOU1rBNQyW1UNFermzW9AkydzPlsmr/Z1J+5cPzWNgF1AnYIaJD0SK3neVfDXqOp/fu0+P8PCGgRcEiARZJbLcvKeyRZrblsTa+BIwLaBBwTcELAKQFnBJwTcEHAJQFXBFyTPDICugTcEHBLQI8Am4A7Wsz3BDiEP5u9WkV9tb7wf5/fBSyTfpX61Zv5rGNXRlOGPFWEMn4Asztujg==',
+'KY': 'eNrVlElz00AQhV/sJJiwB7MECJtYLGKDLI0ky3JIQgJh3wMHxUUVxYVzysWB8e/kz3CgW7Kf5RQnyhe+qpl53dN6PZZkNaoAGssyDWoy7X/7GTfb3nCwJEEWdJK+ZJLh9N5XCQITNja6vg7fGuPKMDbSMLBBxxrPtbFEURa1kr6NY9d2JPQ8285M2Ld+aE0m7rbTcW0iO20jCS8Ipdp1pZMZDhaLntpxlx0DPwtasVyogXhFsZhlYUsWk+VXF3ZZpEV+ZrR9oK3+YrsqcnSsMLRRJOfUA2V+K//d0VTxisjE8yabVk6UxFHhWpHd11v/ujR0yafvczId1OcxRaVSqcqozC8s4ggBasJRneT5LOly7PiJk6JP1cZM2Zw+Q4BlMtJnC10/nK+XdB7w2npJSwCcK11b5jwBLhDVF1cuXb6yevWa6usjVN8YAdwkgENU33JuU98p5Z1J/m7DcZm/t9Ys1ThO677q5gPPaUu0pnlfnqnjRJqPibwkRN4BAnSJ6rSkx1Gue0q3V+RF9MY1ulPWvaImLfsUXkA61SvPCqxJ2Tct1aSHfNLx2UrnmfQdHSPvleb29F/PfR4SYJ0AGwTYJMAWAR4RYJsAOwR4TIAnBNglwFMCPCPAcwK8IMBLArwi8q8jwBsCvCXAOwK8J8AHAnwkwB4BPhHMjOIToR+Hg/25Gfj9ruJ/ZWFGY0/u42cZX2T8UC235JesfwCXFfu1',
+'KZ': 'eNrtlnt31FQUxbct1ipUsB2VgoKCyow2Nu9M2kKp+MBXZSZ9qOmIjxHfCmgt2gx+Nj6FX4Y/OOfeZCeDy+VarC7+8jcryc7JOfuee++szLQnAbRn5bQ7Jaed4b7njnbnNbi6lMfJQCL+qOi6uZsOOnKTjJqJdx4BEsn05HC1wg+koghzV0QRpUUcdApv7IGTpPqkU/h1WG8DufVFB7nnJAPJ9PwgcsrckA9dLzAO6hR15ammS2tF1Kjvmnq10eJYn/hFHoRmrNzT9ERzu6YFnaQpC2OndA4HRcd2ONa8TYjEKVYPv+4qNj3F6u4bbSckldWggQmGtpfAzq5b9l2vjueH2n2jbW2s7kofJI0KV6x9HS/ZGXbK+XClA5uf1ivjh4l1l/Zi39cNjcY2dAi7oa62ElXb7+W+E0llKtGB3TjZhri81/yoW5gbMY5l852wrExyr3KxgxWxXNKxMadFdl33H18uG09tfEJu1tce9NLWizl9J99Y/AodpsGEYfLQoxNTeIwA0wR4/InDR2Zmnjw6MwMca+Q0eGqWAHPE6FZrTj4t4Olnnj0+f+Lkc8+Lbp06/cKLZ86+9PIrog3nWprTIlLbMtU2rqL0aVdDdcbn8ioBXiPAAlHtOK8vutTeYh1fUO0bHYS1juKEuhswnjrOEmutvcSXl1fOX5DT8qr1vLjG+BuX3lwWjF5ZeUukyUnfrmo1/53a//K7dQ/Oe+/LIKX+oO75wwXqlHNcJ8BHBLhCgB4B+gTIiOh+llVxpmRGZ/fna7zXq336VbzU/cqzVP2sqlWzRn5WaxOvhjI5dQ8bBNgkEtfLhtUmVOZsbdX5xqJv+1GZqbFom6vllf+myd8wLmV8c6NMa8zLrkOfPTfX0E7RrlVjnct5Zb0yp7Fuphv12SbAxwT4hACfEiAn8iYhwIAAnxHgKgE+J8AXBPiSAF8RYEiArwlwjQDfEOBbIm8iAnxPgB8I8CMBfiLAzwT4hQDXCXCDADeJvPwI8BuRPwAE+J0Ae+Tf483aWwT4gwB/EmCfAAUBRgS4TYC/CA4M+3NwyPwcTByQ591J/M/DZ7px/Beb8gdgT45tOa7K8bdq2bZ7e/0uVQ==',
+'LA': 'eNq10stOwkAUxvG/BeSiFQGtd/EuKCj3ghvjC/gC2B0b14aV7bv5AL6TTkv5UlxJor/knDkzc2bSpFNLAbWySdOcSS+T90Gj3QqmtpmMO82+65kltzEKptn59jCYVsJDjw+zhrbf79XDnWB+xSi6omomnVbU1vX8/rjXHHi+6/qj8XDkxQcs0/P89B9DLRyi9Lpi0tskLBMsK5VOZ6y0Za2SFcjlCzEo/KjzcZ2wti5g2xsbdtHetEtQlnB9bvEbKgJbAtsyW3ccJ1qPG5xEbfZgR2BXYE9gX+BA4FDgSOBYoCpwInAqcCZwLnAhcClwJXAt5pcJ1AVuBG4FGgJNgTuBe1nsaQm0ZbHuCL8ye3Lp8Ml9spyPrxR/IbNEZBNRNFEKn6WJbjwm598WTmSv',
+'LB': 'eNq91ElSwkAUxvG/xBEHFIzzPIKCCoEE3FhewAsgOzeurawgN/IQHsYDeARfB/0wblxQ5a+qu1/69QsUvKTsAeWiTfGMTY9P/ajaTuJFi7v1oNbp2U5YjZJ46iubxIGruLvt1pu10KUbySBy141aK0oLBmGjMui2Oz3bctcVO9RMMvffHt4jsMNp7U09rQsr7mwriXOWf7j/Xr4+2+ryFrWHp/th8ivRGSWy9X8vZbek0/OETS+vLvwh5+UmPc+bmp6ZZU4gLzAvsLDg9hbT/aWl0ZlCYRT/sLwiUBQoCawK+H7R9/1VG7AmsC7Z778hsCmwJbAtsCOwK7AnsC9wIHAocCRwLHAicCpwJnAu9tcIVAQuBC4FqgI1gSuBa4EbgbpAQyAQaAq0JBuHkt2PxHpZGMuwdSdd674zvrcPj/9mnYx1EvarsP5rrNiDXrIRuNXeIyV7P30C6xiBBg==',
+'LC': 'eNrNk0tz0zAUhU+btoRCgRbzpkB42tCArMi2Uh6lvKG0O4aF8bBhw5rJsED5J/wv/gwLruzkWCk7Jgu+Gd17dH3vUeKx4g6AeEPCqCvh05cfxVaqxqNV2ZSFHVZSGY5nn6WyKTIb72zrgXFGclaq/rByeal9srLTVeLygXXSl8igGY9WGgtvsN8a2NL0i8oNbGOUlyr1BkZ8EpdJJS3lRzitnDWJK+pCfYiWQ0yV/G2+KdJbK+WyzOW5KwpnbVJPSUs+07wmcqhU8HBRKge7/5pin+rwdUHCt5/+9QYsNnSWlldwhABdz1EfgFWfjh1fOyH6ZHfKjM2pdQJskFafFh0drkdhTxT2R+FsJPpMMBtylgDniNfnL1y8dHmz0VcmeH11AnCNAD1S6+te3ei19ZtTfet2747XcRLW73L23tZkB/QJcJ8ADwigSKPTQGuBelJPCaB1qyXU/Vq3nl7rQ/7NGV5rPe3XzUF1z4AAhgAZAXIit4bIR07kGybANgEeEuARAR4T4AkBdgjwlAC7BHhGgOcEeEGAlwR4RYDXBHhDgLcEeEeAPQK8J5gbzVVd8lfVLMzB73cH/xvLc1of5P18lPVZ1ndZv/xe/u4fZeXGqw==',
+'LI': 'eNrllNlSE0EUhn8CKDq4Ie5IIi4hSnSWpGeGqIiiiRJXRNQh4oL7WkWlvLDzdPoGXvg6np6Z/EwsuLLKG79U9/n79DmnT02le7IfwOSITO2tMi2vfvOnwk573HhnppXSga1Du2T8HR25nl8OW7JQnfZgGt5pzyXBrgzH197yqlaR7ZarQUuHqqQ98duu9iPb8ap+SweRXTFbEqPCVkkHfly/0unpYEm0UpIqaX7QiuxypaVdyalKBzrylLShK5HjyqoaVapxQUfqSYFqR/uSWYmkCbOtdKTivjc4pyQ6sE2LZvhyhOtJd36o49iSDsW6nVI8t3MSfWu2a7J1aqLDbh0p4vcUcYzT665U8mmTVVp5/XMOifJtJ2m198CNzKQx8fS2T6a1pqmUIZfrH8jlBrdsHdqG7QSwhq0dlrXTsnYBu62YPSN7kcaMxjH7xLn/wEEBOJTEHLYs4IjVpeeosaMEGCfUeaPzRPS4sWajG5NP4/PMlf3kZ3QakY91upI6hcKxieMnJgqFk5J7KntuURBZ7NYvxv4ikU9XSjmd1O/mnpkyzrKM3u95lgDnCGATwDG4BtGuqNiR+lPtphGu0cY4aXzqNn6PABUCVJWvhEAp+dMRYJoAtdr5mnChVjP6Yi3BaMNMrC8RYJYAlwlwhQBzBLhKgGsEqCc06nXqeqIbjWQj428A1wlwgwDzxOimEc3mfMbfjHVzPWY+XQI3idwQAtwmwB0C3CXAPQIsEOA+ARYJ8IAASwR4SIBHBHhMgIjI5SdAiwBPCLBCgKcEeEaA5wR4QYBVArwkwCsCvCab6zdEXhyyefw70quzuVn9nvTqDwT4SIBPBPhMgC8Ef0XytA6Yp/VHH/493/vxP7I4KtdJxspoouO1PH1fU/+vP+zSmFzjgY3HmowFGT+NHQZ+A+JWlG0=',
+'LK': 'eNq108tOwkAUxvG/FERxioD3K94FlUWB0mJMjC/gC4zduXFtupK+k4/gm+mZFk9kZQzxl/b068x02mSmHQ/otKSkVSlPz2/RzThLa5Jt0Bsn0hBnM1137oH7WxvE4ySY9G0w6EXJZCCj42QytEEod6EN+kMXRnYQSnfX9ntyK1OMsrRSTCZT+ZIiGRpGseuLsrQkLY8P/3HpuEteXhakvDZc/KHklSuL1aVlz6uxosD4ZirPvlPkKTMd45vv9vzIsymeyHO9bkzd1ZnXrjYUNJXLLdFsubymZr95XcGGgk0FWwq2Fewo2FWwp2BfwYGCQwVtBUcKjhWcKDhVcKbgXMGFgksly6egq+BKwbXiz4rtUXbb4535fHx6zKvyyykrjawqbfcbyfkFtK5Y+w==',
+'LR': 'eNq900lSwlAQxvG/YXIAFVRwBmdQUGRIwI3lBbwAsGPj2spKci+XHsdDuLBD5JMsLS1/VW/IS/d7SaVTTQDVgnV+xrrh+MWr9wK/GK7e3w1aXn80HE8GnYY7qtlNN/BTUZgFpW3WCjOCWG4lyu0MXG806Vq2a+m90cSzgFYQ7tINfMeCHh9mw/ee4Ub9ZnRSPOanQzUcpt3TgnXPr+F0juMknGQqnXEWl1gWWBHITuVy2SzkJFqfTm19VWBtfSZ2VL4gsCGwKbAlUBQoCWxL/F12BHYF9gT2BQ4EDgXKAhWBI4FjgROBU4EzgXOBC7FPI1ATuBS4EqgLNASuBW4EmgK3YhUr0BboCHQFXImvz889gZ5YJQu/EpVxMizjd/7G20eC/5b/alb5tOeuw7ZlP2nZmmetZI9WsvET9CJ2sw==',
+'LS': 'eNq90s1OwkAUhuHXaUERQUHqv4D/lRUhgN16A+6MCzVs2Lg2DQvSO/J+vBw9o+mXqjslPuk583VmOptOHABx01pasvYwnSdZWrV0PxiNk0d7v8oKK2VLg++TFb99NP6xuWYp6ff9SX5tmKXOZm6uFzPEfvhoT0vWnkMfC5wLnAtDV3JllgVWBCoCq9Xcl2PWagJ1gXWBjUYOGoVc1BTYFGgJRNGWPVaRzznYFtgR2BXYE9gXOBA4FGgLdAS6AkcCxwInAqcCZwLnAhdiv0zgUqAn/MnnlQj9lXj5zfdvAf/h1mpiNbO6s3q1egcqyUvi',
+'LT': 'eNrF00lPwkAYxvG/ZRGxuICKC+4bqGiBsnkxfgFvxkMlXrx4NsSDcPcb6ofx4Ds1eVI9GhJ/6UyfeWe6pW01BVSL1g0z1t0/vvbGw7ylqFXvD2zYHScmKm7x1WUraoTd3mAURo1mWO8MRu1mzRZ0kkuzljq/j89Z6gWBDdrJcsFSP4iCZiu+pM15Vrm5/uuu6nZx9zRl3fObiwme56XSmex0bibPrIBf8OOt4LtcsM1GLrtqDObE1X3V5xN5IZETFosCJYElgWWBlcSacqlcjmP557OsCqwJrAtsCFQENgW2BLYFdgR2BfYE9gUOBA4FjgSOxV6TQE3gROBU4EygLnAucCEQCDQEmgItgVCgLUzM92eZdp/lx6TO+Zniv9zaD3Zn7cHai7V3N7bb+QJG52jt',
+'LU': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'LV': 'eNrF07lOAlEUxvG/d9gERcV9A1wZN0SKcSh9ATtjoYRmGmpDLAxvaM/LWHDG5ctArICEX3LO/ebcZHKTueN7gF+y1ktbe40+wn6vYOmlGYSttj3f9xM7GUvBf8Pm+DBrKWxYDsanrd+ps/z4MOnix8t36y5Ye4vimOCc55xLuXQmS05gUSAvUFj6A8uJnFBcEVgVWBMoCawLbMjoOTcFtgS2BXYEdgX2BPYFDgQOBcoCFYGqwJHAscCJwKnAmcC5QE3sMwlcCFwKXAlcC9wI1AVuBRoCd2KXUpiZnyuXiq/c5zTv+fKYlyf7Yd6tOlYDq+e47DhDdG9bmA==',
+'LY': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'MA': 'eNrV08tu00AUxvF/k5bWlHIpEK4FDLS2C4EkzsUul7Zcyx0WiIWJ2LBhjSoWcR+AJ4SHYcEZx/nkgJAQ6oafMjNnxueMHcsT1oFw2brdOevefxyle7uLFmW9fpIObZ7sVa58tagXbm50rNkva7V7zYFl5Z2s00yHeWxDbzDMuzYmwzzJOnHPrUeWklpBy8bM9m1FUR5P9mh23Q6Z1Y036RdVVp5msc1dbTJda0ujbvW5Vi3qu5ys1R/mWburp4ptHsd5mrqafrVm3qLENh0NfltNx6s1i19u/+sQuqHoPs1Y9/m7e9UVNac+W5s7MM+CgOcdXPQKcGjp8JEl4x2FY15p2eVMTG15/ITASYFG49TpM41G4+w5OO+sXFi5eAn84rpf5Pjian1/sl4mTOIxy7kscEWm/+NVgVWBNYEg+DUO1oKgsl7GQZljFwthCJG4/afjYmr3isq7rq8Xz6CcawLXBZoCNwRuCrQE2mLrlbgjFldqY4Gu2LkS+5YFBmJfpkAqsCFwS+C2wB2BuwKbAlsC2wL3BO4LPBB4KPBI4LHAjvx5/YnAU4FnAs8FXoidOoFXAq8F3gj7ZnzMZ90x35lhf/2o879ZKNvfemvv7J21D9a+WPvm5va3fwIxBeGx',
+'MC': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'MD': 'eNq9k0tP20AUhQ9OKJShpUCh9JFJW1qICwa/xg/6iPgD7CoWxqqQ2HSNoi5wfid/hkXveMiRJdhQoX7RvXPmzrkzk8Qe9QCM1iRN5iWdXVwV08myqCo2WVDWUsinkwW3ZPZl8dw2jI9iiagKTVbWTXx20SRVGJkgr5u0ioLUtjamCoM4zQqRWRUHxopcVhNxlVWUpLm4/MbITkki7tjkte/bc6ady/juvEzChLY/rpuqsDfzm1yKRdiUou/0LYoqwvC+cjkrezI5Of7XYWSHNv2ek3QJ+1t28Lye5/XnnywsPsUSAdTys+crL1bX1LpopV6qDcmq1UptqldbW7faTkW/nk3E86ajO7x9R4ABAbQdtGQtmljd1rX12FEPZnVR9qPtPu2C09p1OL/b0XkGenZWK7XzDDt3GAyH1EMCvO94PnR0l48E2CbAJwJ8JsAOAXaJ/E0E8AnwhQB7BNgnQECAAwIcEiAkQESAmAAJAVICGAJkBMiJPMlEHl8CHBHgKwG+EeA7AX4QYEzwaLjXod++DnP4v9z0HtzSf6T4Kd/1VOKXxB+JazuX6/wF3I2dtw==',
+'ME': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'MF': 'eNrFkstSwkAQRY8EVHxGBFFJFHwGH1WQMpnEjeUP+AMxOzeuLVaG/3Lpn2kHsRmWLCxP1fSc7rozm5nAAYKGlFFNyvPLezoe1cWyKM6lS8bWvCcWpYPg4X44KMLMpHkRZcMwyYvMJLnpS+rOznfF4lk+NHkRx4UxRVLmp/GKhJ4e/2ILym1SXpekvE3UolLiVKXUWFZg5ZdVy+tzR9fWFdhQYNPyLcttthVwFfGdhuvuus1m6a09mbX3D8QPFego4Fk+Fa/jiXvetLHm4v5cftL5s7O+fY9vuy9+pMCxAl0FegqcKHCqwJkC5wpcKHCpyPMp0FfgSoFrBW4UuFVYmJ9vUy2/zccCxz6/HP6Tlqy2LHkZjKxvsdRaMw==',
+'MG': 'eNq10slWwjAUBuDfFqRUcEBR44Cztgpa00LBjfoCbliG7ti49nRl+268md40cIWVhwXfyfBnIOGcxrMBeA1q0go1o/F33B7kaZWykmFC436+sDKkLL3Xl4AqFTkaZ5GK4iTrqjDqUd9TMh4kWV/JXj/JBkpG3cSnXbHerSQtqbBLB/t+Jp8D6unkKE/L5g66oUYpVIHsRPr6OE8tmvh4X0Xn6a5oPteo+XrTcY5l2SWrUMY6AypO1TEA13Fdd5rnbNQYUK9v1re2dxq7ezrPUG7+5X22+B8OGHDIAMHMvChKkYXQpcjCLBV7joQZzub10GQxnRdz5x8z4IQBpwxoMT3fMtOUzxhwzoALBlwy4IoB1wy4YcAtA+4YfT4G+Ay4Z8ADA9oM6DDgkQFPDEszz6mkn9NkyZ9OfmysWvmf2tRPjip9OcRUfwHHb2hf',
+'MH': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'MK': 'eNq91EtT02AUxvE/bRH0LVDxQrwkKiq2SjRNm7bgBfEy48qd4yJk2LBxq9NxYfo5/Rp+BM/blIeCG8cZ/M3knGfeS5K2Sdt1oL1uZbxo5eDox2gyblrK0zgbjgobGE7GS9XUYNsmv/oNe7upHXnaswVllnfTrCgH3U7Zs9Fu3osHRZnaGaz1/ImKsm9rs6JT9mfbqsl+tTTLp/utxqOiHOZp34+Oct86HbtwNpm7u1VLwzyJp6v9Xc1PLlsaJcnZPf4TZXmSxjt/7Aj8DrurJO/abDmtB0ezq9Zs8uP+37e2b9PyZcHKtw/+651Tq9UbixdqS8u1i1wScK7ZdCurzjnLa63L685V2bVaa1euXrtuecNtzEAQBM4FvsKNm8dOXerWbYFQIBIbj6IwjKrxqs+yjUZ+bpqjMzlUDk9yeDr7ZVU+2Rsq3xG4K3Bv8xhszuV59wUeCDwU2BJ4JPbTCHQEHgs8EdgWiAWeCjwTSAS6AqlAT6Av9nwKDMSedbEHVWBHYFfgucALgZcCrwT2BF4L7Au8EXgr8E7gvXAuqteq4V+rYIH/61f9XE7b+Mfjk/19fbbj0Hf7c/5u/afPK/Ab1SS1Ow==',
+'ML': 'eNq90stOg0AUBuBf2mpVbLGKigretago0OFSE6O+gDvjghI33bg2jQvpW5r4OHoG6unsbfySM/PPYXJYQLcGoNuhZdSgZTD8SMcjnVIWithLc2okY+XRvbx+dxNS+XLPfC9K+3mRZH6YeP3cLYKyHXlJXmQ9L6aHg6HrFkKEtNMQoY67rcbFVFkUl1eLRB78NM8CmkczoqSf02tEXojMD4QcHMuRNCFSZzUppb5ftTU6PD7MZuvKrVxe52h5K2RUaFpNq2uN+QWtiUUGLC3rE4BcV5Sst1pUQFvXjVWjZbQNoKNP7yvW1hlgmhsm2TRNmbcsYlqWzL9ktjhvM+orudz4jmlWR2BHmaPaZYDNAKdk245D2XZk05HZnqTpHafs7zFgnwEHDDhkwBEDjhlwwoBTBpwx+mQMcBlwzoALBlwywGPAFQOuGeAzIGBAyIAeAwTDn1S/Yl3+ip+Yse8a/tsT1TPVC9U71RfVDwUnfQQ=',
+'MM': 'eNq11NtS01AYhuGXFiyosUkAcY97C7RI0qRJEAWEY28g9IwTj50emd4bdyZ/Nv2gzDDDjPrMrLW++dcmnbYrvTbQ862bdKw7O/8d97PpZMNyHoTRIB1XpWRaZBaSfjq9Wmc5LXcf7gdn50VYRHk4GI2L2IZsXIysluR7g3hcpHlgE1vlpmkRDIdDS5EOSmcPzOykPIxHaWYPLaIoqndMWjb34/h/DL1yqLqfC9b9Oii/jWta7cXW0r3O8sr9BzwUcBznkVOBroDrVkXXdZWrNY5zM7v1Gudqvef53qrve74/9xHW1gUeS5U3ZvmJwFOBZwLPpa6/aOrXvRR4JVXenOXXAm8E3gq8k7r+vql/EPgo8Ens5xDYEtgW2BHoCwwEdgU+C+wJBAKhwFAgEogFRgKJQCrzORPYF/gicCDwVeCbzNcPBY4EjgW+y+35RObzqXAn9VVaLK/S2gL/3MWf9l+fsXSH1mlatxlvzndvmbMbSvki22zGpBk9a6vW7N/EJbxCoUc=',
+'MN': 'eNrd1Flz0lAYxvF/obW1VctiAXFp3UFBSSAB6kLrvu/LRXDGC2687nBl8t360XwT4gO5cKbOeOVv5pzznMObQ2CS08gDjZJ10zXrxpOfg5bTiaZVmwSO+80W+q1hFAZevz1MZlG2cJIWNka7zngSujYGTrtrpaOwP540w27gtgfxlU7LjcKezfz51LPanj8Y/l5o2uhFoW3iBR3PCsN+J17zo+lK+q2ze7OKQWDXhcPA8eIN0qqcffZm/++H+e4blvqB5yf39IcdG/GQdD+WrDvYWSYjl8/ncsu5lWOraxwXWN84cfLU5rqBQtEUCsVCMc2lkjUopsply+UkJHnB6S2BikBVbL1Wq9nimXi9UqnPzHMlyWmq1+GswDmB8wIXJPt7twV2BC4KXBK4LHBF4KrANYHrYn+7QFPghsBNgZZAW+CWwG2BjoAj4Ap0BXoCnoAv9jwJDASGArsCdwTuCtwTuC8wEtgT2Bd4IPBQ4JHAY4EnAk8Fngk8F3gh8FLglcBrsbdI4K3AO4H3Ah8kmz9KNn+S7D5HyZ8Fvkg2fxWOZHZcxAfFwfcl/rnDUZ7/xZY9ulVr22mrLsyTfGivlI3xob1qbTNti/NfsSL4WQ==',
+'MO': 'eNq108tOwkAUxvG/U9CKFxS8K+JtURZsmtBWN8YX8AWAHRvXpivtW/g4LHwzOUfMF3BHor9kvjmTTk+amTSJgKRlUdYtRpO3oiobVg3TrBjbMq8WHnR98+NDWgzT/iDv34/fVY0mPdszqH61yayPt8mqMtjy+ek/psSn73hZs3idei4IIQoh1EI9rLMhEP/YjL1uxPPh9ZbxWGqzvSOwK143jQfsCTRl+Xv2BVoCbYEDgUOBI4FjgROBU4EzgXOBC4GOwKVAV+BK4FrgRuBW4E5Y2fwqa36VH6u/zedXxF+zk8dOGf8Dchsz8blETQ==',
+'MP': 'eNrF07lOw0AUBdBLwhJ2CGHfzG4DMcaOl7CFraZDFCZdGmpExSA+k5+h4M0kXCYtQeJIM3PfePwkW7ZbBOCWZXopyfTYek0Pj4O3lxEp8iSrN2Wn/tZ97UKKJA3cxkkoI8qjatxUWabixFNRmIdRU9XyKGtGKo5ClciZpKbSQGWPLc+TLrW/7zfY7qe7rUrM5EwQqDhWSaLSVJp5eVg1D5N0HR6XWA8C62JBdu6ufru4ejHTU59Mz2f69VoKRrHQPzCIIQJKbcMleTEjOo2OjU9Inix962ozNU1AmYAZK1esbJaKlU3BeytWlgKYte61zREwTzovLC4tr3TyaofOax3AOgEOmbzhbDrOlsnb9v6OYyaTd619sed6kvcJOCDgkIAqmez7PrMurawrndsnvs//ZN/u06kA3+rvE3BEQEDAMQEhAREBNQJikt+EgJTkgyf5ngk4IeCUgDMCzgm4IKBBwCUBVwRcE3BDwC2hJ+1fqV//SpU+9O6ziP8228O4l3fwIONdxofO8jhf+pCw+A==',
+'MQ': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'MR': 'eNrV1NtT00AUx/EvLQhqoViteAVvrUVbDU2alHoBvCve7xqiL7z4jB0fTP9O/xw9m5Sf7YMzzuiM4yez2bObk7OZNtlGEWhU7NSfttPW9teo2R30Fy2O260gsYmwGQ3SuNOKssEg7bqkwVj6psWdxlpvJfb8TpK2Y68Vriapb8Ogm6RBHITWdWLPSoZRkoaxb5ejOHBpy1YlsBXccp1sibHaG+4B13px20+sbOCq+S1bJNzatgqePZYr0BmkltSO25Fb1neLuFXzi1ZxKq9o9WYs6npedk+/YIPHG3+na7guO32asNPO50nGFArFyak90zN7C/vYL1AqzZZKc+X5ctnFNpibz+JyuVyaPZDHlYOHqocXjhyt2D91TH7Gbv74iV1jy55cFFgSOCVwWuCMwFmBcwI1gXqtVrcjj3M2k8+76Xotz69nh5t3Ge5SNp/d6fKzbnjvebGfdHkXLI/Eoy4IXBRoCrQELglcFvAEVgTaAr5AIPYBCIQCkdiLJ7Aq0BO4InBV4JrAdYE1gXWBDYEbAjcFbgncFrgjcFfgnsB9gQcCmwIPBR6JfS0CTwSeCjwTeC7wQuClwCuB1wJvBN4KvBN4L7bviW0ZAon8Xs5ozV/FH2S85p/ItyC3+eykE/wb34v876rWomFbGGm746VhXB02e+uwN4wv1j5a+2btB/6nG6k=',
+'MS': 'eNq108lOwlAUxvG/TCKIA+I8z6CgBaEMaowv4M64QOPGjWtDXFie01fwEVy48LTAl6I7g7/k3H7nHlpIeslHgXzWlk7Slvunt3qx7HQ7KWvabqP5YDvN7vAsbY3rVqvNsm1Vu51Ebzg0qvwarVts5K9ajuPVap7revW612gU2pVS8CXu0IczFpuOExpGbOfm+q+XvH8JlucxW14+/BgSCUQjsXiCcYFkYMIKUn5MT2amLE8nB4YeMzMrkJVenuvn3I/9bC6Ug0b35kLZGpgP3Ru2ILAovbykvNzn55U+WBVYk1C2N7chsCmwJbAtlnd2lfcE9gUOBA7FXpNAQeBI4FigKFASOBE4FXAEygIVgTOBqkBN/HM+AHWxQy52hgVaAucCFwKXwsj0jn3MP/afo3jeV5T/EB9R3dof/M7q0erV6t3v7Sd/A5bRfvw=',
+'MT': 'eNrFk8ty00AURNtyAsTCEALBBANJIBDLYKOHrbHMwwmPwIofEN6xoYodlRXjf+PDWNAjWW2ZBQsKiiPPndb1Vc/VlKbXBNDbYTjfZPj46dtkce5T5fHYZHPem0Xtn4Aq7s2mIUeUh4N0bvPUlQU2jwbJ2Lgn4kXAOKo/d+ZWmU0NRxyFNi+t44UNbOZyeZQwYdMstZPCmmZzO8lsZlhRei5NPVp9OK2m1RJDqnG47C3Jo5Rr2FHZWVotZ/Iwdd3yLvnV6nfTapktKhNFpt5Mz01F+Nxg+PrFbWoNz2t63oa36V24iEsC2Gq1Wr67uOGX/QqgfeVqm2y3twHfv8bcjn/9xprl7k0BdG51yB5/wJ5gXgC3u27u3ul0gbuC+l5N76/0gaDPIa+ljyzvUz8o5dFD4FCsv/sjARwLbldJXZOiJugva/qCusj1i/xjIf3E6UEtPxDAUFQ9DAufY2aqftSaalwR8FQAoQAiwXzscnEcxjwdAkgEMBL8TAWQCn5XApgIIBPAVKzXPBPAc7GuXwjgpQBmAjgRwKkAXgngtQDeCOCtAM4E8E4A7wX+GuXR23BH76iBf8L3H/gvHNTGn7DbaKDDse/mptNNGOqfjYm/CA==',
+'MU': 'eNq1kztTwlAQhY88FaNEfALi+wFqNLlJSLBx/AN2ahEyNjTWDmNh6P2H+mMsPJfHGrVz5Ju5u4fdk93McNPMAmhWGPp5hm7vJRj0S1SRsjoxf7YHqcadNl9dKp7Idr0g1JbEiWwrjBPFFHTiVuIN247LIrsq8qyA1chv63lqkITsO17iRo6ivcWil14Sjpf4fFiPUvS53JR0ur1WEoxnBJHjc27SiZzhnl9jDKrQ5nuo+GerSOXa1P6gn6G+uf5rauo0DI8zDE+vWqbIZLK5fKFQnJ0rYV4AjIVFwyibhsG3XDInsG5UjCFlrScAZQFYXjFXaV7TfnNSNr+tXd8QgKqQ0rUvXWO9LgA1AdgUWGdX+7Wn0WiIR8fqRFdHSs+s1Zn5jK6n2RKAbQHYEYBdAdgTgH0BOBCAQwE4EoBjgX+TALQE4EQATgXgTAAsATgXgAsBsAXAEQAl8NYJgCcAvoB/Y3Qtc/pavmPKfGSnvQG3/MAeeO55nnXmyjfmT4UsiWU=',
+'MV': 'eNqt0rtSwkAUxvG/ARS5GOXqHa9I1GgUSIiNY+/4AjGdjbVDZXg3C99LTxI4hM4Z/GV298vm7G6R7eWAXk26cUG617dPbzIuSwr6rueH8u5OMl+GcfXjQ1+a40T9wLGHfhhZkSsTwdD1wsC5H7ijMBqlwQ8tS1YOsnt00z28eEl6RlJtS23kB64dz0wXGVL68rTsMD+6KMkb3WU378VD0r2vSPfxHMcMwzByhpEvGKtrFBWsl0rlUgIqsWq1ulGZ5oppbprzbJoLW27VFNQbM9DI5HpCYh2aClrN2ZPJLWgrydvznLWjYFfBnoJ9BQcKDhV0FBwpOFZwouBUwZmCcwVdBRdKfo0CSy3mbM2lgisF1wpsBTcKbhU4iqWkVysfX61v/sfXz3Lri9P2F01W6EhrS/OSMccvQ55rRw==',
+'MW': 'eNrN1MdOw0AQxvE/KfSW0HsNOECAGBzHtNDLhRcIueXCGSEh4bwbbwa7ifmIDxyQQOIn7ex4PGvLttZOEnCyJjx3mfBQf/W3gsazY6uVg2pxr+DVwqrr18wZtxFWy0HN1JsH+UrezKVGbOFEa2Gx6haCWugWW50mevG+XHSD5vV9Pyybg/JDPV8JA5MFNouunjCd92d/MTl2aobHDhOeXuy7aJNIptLpdKKzq7uHXoG+vv4IDAwORGBITL1l2NYzkWzmK89kY7caGRUYExgXmBCYFJgSmBaYEZiV+DPOCcwLLAgsCiwJLAusCKwK5ATWBNbFfAKBvMCGwKbAlkBBYFtgR2BXoCjgCuwJ7At4AiUBX6AsEAgcCBwKHAkcC5wIVAROBc7k+/xc4ELiPZcS778SuBa4EbiVeP1O+LHWNkzZbeh08Kve3pP8N2ZnY3+VC1Fuh982+211O7y2/HOd7fkAV8Svmg==',
+'MX': 'eNrllldz3FQUx/+4BCcQBTsFDFh2qN7gDVbXGpTYxPJSbRJSIOsNC9GmJ1TTrA0lQAopX4MXvgNvfCkeOOfeq7OSZ5hhmDzFvxlp/zr3tHvutulBANNjdFsbodtqth7NOE5vbTs9tJx6o02Wxowz2yst08PvD1HUwTnPy4Mgj50aLcS9nCwuXy2XAnOP4r2gHrdzv+V4bInIEsYkYhIBLTRafhi1a7lHUQ7ZIlpruT4tqdoqQLmRO7n5xi2I6tqxHhrHlhe1tW+sqzY4ylXVanlAcXGs0kT8HKo8vMpZPN8kCThU9Re2HOoiKlqIOC01yv1SjVoeUQLaEzevQ11dPDAb5SZC1YLD24vVUGhJJee5hGooagO6WFjU8iK9YddXrTZUq55e5yo+J3DrZDD1fN4EFZOJubo+9cnHEvXWtuiT42P9g87NoZQPytnVH/Czq8nhmU9gPDtbPVRjbxT2AXpYXvi/L9P8om7n6Z2CL/7kMiUGBoeGtzw8snXbI49iuwBY1o7HRsd27tq9h/XjT4xb1pNPPU16wp60bWvK3kv6GXvKtu2pZ59jH2LSsp6fIP0CWV+cru17iTS7jNv2TB3YP/nyrGO5nuUDQRjFVsOem7Ir7bzyqgAkAusDB+eTZOG1Q6QX06U0TZrp66TfSJtpmjbffMv4LyXJ24uk3yHr8sq7h4+QZpf5NH3vKOmlY8dPJO9/kJwk3VptJ6fSD5spx3YMpOmuHrluJ6nY9VKhKSrRddmq+uwUTn3N/p1OZ2Mek1/n6ccm1R460puua9B1jd3E6i6UTsp5dIUitq+rPXC42q9OT/aPyvM3EynPwfScVHRSmqEqVtgTNZOPK2dqooucYjebL+oW+zUe7FPmtABkAuuugTTd1SPbu1nFrpcKTVGZzsNWladbOPU1+3e73Y15TH6dpx+bVXvoSm+6rqGblewmVnehdFbOoysUsX1d7YHD1X51+v7es/LeTZ9ZRWeluakChT3Tc8hMRJGnPPOsNOdiX8aDfc4IwFkBOCfQt5UAXBCAiwJwSQAuC8AVAfhEAD4VgM8E4HOBviAF4EuB/kwJwFcC8LUAfCMA3wrAdwKwLgC5APQE4KoAfC8APwjAjwLwkwBcE4CfBeAXAfhVAK4LwA0BuCkAtwTgNwG4LQB3BOCuANwTqvZ/0/8F/XM2xD9n8wPYXPw9uCm2OXyfrpT+9DTNtULXX6xphKO0tpMuj65/AJh1EC4=',
+'MY': 'eNq91dtPE0EUx/EvLaVdLIhoxTsqCkVb3V7otniBWhXwBt4Sk8qbLz4ask+yf51/gf+RZ9j256wxPjV+kpk5s3POTpppp9U8UF20Li5Z9/nL906tESbxnE2GjVa9d2iPoloviYvjZYuXXdHWZsvmzeR42K5HLu+4O2xawbrLSuJCmm/Z8xY1hmG93Rm9Loln0kW3U/lktdU9DMO00FsL3FpnvJCz2Zv+ePgzLfpLvftIjY12ume2PB2qbjjpvk5Zd1SaJiOXz00XzEyhSEkgCILZ4FR5bta2nhc4LbCw8Dv2nFkUOCtwzosr5rzrKrDkPb/gxRcFLklaWxnV+i4LXBG46sXXBJYFrns5N7z4psCKwC2B2wKrAmtiRyCwLnBH4K5ATaAucE/gvkAo9oUQaAq0BNoCGwIdgUigK9AT2BR4IPBQ4JHAY4EtgW2BvsATgYHAU4FnAs8FdgR2BfYEXgi8FHgl8FrsFyWwL9naA4G3Au8k+/y9wAeBj5LNn5T0WnAXwtGnqQm9s5znfypMsBX/0dwN526baNSWRm08d/8XfTuagbUfbvxpzY5z8A1+ASlB1c4=',
+'MZ': 'eNq900lPwkAYxvG/BWzFhcV9X1FQVHaKF+PdmBiPlZsXz6Yn6bfzG/iB9B3EJ3A0Gn/NzDzT6Uy6TMspoFy0Kvatenx6Dau9JJ61HDXCvvW71TCJM6OxJC5ZapSvr6J6s9Wx8UE7qp03+oOoG/ajuoVes2JXtjXHVstaCqNGa7jc+EDgBmo163SS2LPO3c3fNGXXDKvnKatebl0c43kpz0l7GaYF/MAPgpkgm7UXMOfP2+FMTF3ICeQFCjLMOp8fz/l84TsXx+YuyuR9LgksC6wIrAqsCawLbAhsCmwJbAvsCOwK7AnsCxwIHAocCZQEjgVOxD6ZQEXgVOBMoCpwLnAhk/lSoCb82NfWSrut9cYvfKT4D+6Pc7s4N2pdubfyYOXdPYSVT/uyYMc=',
+'NA': 'eNrllMl200AQRV+cBCcEEARESBjCjA0xqNWaHBJMmOd5VsQQvGGd41Xa/8Cn8An5NKol+1kKsIId95zufq5+VdVqHasxDqAxK1OvLtN6dytZavd7M6LTKMnkd7yU9Ct7G2NA1OgsKzti48uSeippi9mkvm5FmYnXu52m0bLjS1CnOk6ypgnElpmobWIRgQT8QYXQhHmRlo5aSWaCPNv6vKIIu/g6li4dk6qgFUlH2Q5MlPrtLK+ZmURJm8q5fNnqFMHUk6Op9W5z0E7pMM7kyGHGhrZIsc0KQdi2Jh3FyU5fNPKFJiqeOTGBX7LEpVJhVFQKMl6PVzyNzkplm3LRQb83WVy5XLh9O+KNPJOkSk5rDXG/V5Pwk7XhMrJPi0piTx50K9zp+m2OvN8pm5NEf05p2CWfvsnrx+aPCVSo5YzXJmqT2EWA+tT07pk9e/c5DuDU645Td/YfcCqpswcJcIgA7uG5I/PuwlHXtfqY6x5fOFHoxZOue2r+dK7PuGfPLcwX8fOu6w71hUaT+uIlxgmwVNLF2sp1mcsEuEIAj1Arq31fWbTv27gfDD1K/eKXjCKuynE19EsRTyarS7200tpuKVX4R7mKNb1SrzAMI0EmqeMPM2x9rTxdnFmE1NMyDc+gK+dU5fq5tl6V95IqivF41DchQJsAywS4SoAVAqwS4BrJ/at2rIq/Q4DrBFgjwA0C3CTALQLcJsAdAtwlwD0C3CfAAwI8JMAjAjwm8i8iwFMCPCPAcwK8IMBLArwiwGsCvCHAWwK8I8B7Anwg8rEn8kkgVU85NyPARwJ8IsBnAnwhVb1Bqvorqfr/huLzZT9cm9/H8M/YXhnH/87UYAyZlL9ifTCcHWt9Wz63cv+xjDkZi3aVK/wJTqpocg==',
+'NC': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'NE': 'eNrN081S01AYxvG/FAwCtQKK8hUk8tGqxaRNkxQWjDfgjmERMm7YuHYYF4Z7ZMdtcAEseE/TPqQzrsSFv8k5eXrec5Iz05N2A2ivWHc1Z93F5e/s+mrBUh72hoX9TK9rhQtLvfbpcWitF5b9POqmRRnnUT8uykEeWZ9YP0izokyt6EKnjGx27Ibrc7pJNScZFmWWdTr2grj+qqalYR724yR120jqNc9SmP1xdFiNzlj+9vVvb213G3U/nln388bFmpnGbGNk7jne2PwLWBBYXJpUoOl5zaa7vKnHvGwJvBJYFlgRaLVWX79Ze/vOzXer1tc2Nrcsb8v0Pn2BHYH3ArsCQW2+H1Sq7AeBxn1/Ko9qk/mT7I8XTLIVxnm0Onjcmxv/ILAnsC9wIHAo9jcJdAQ+CnwS+CzQFTgS+CJ2ogQisc9AoC8QCwwEEoFUIBM77wLHAifCP1Md71l3vO+e8pz7Bv+zc/uAb62d2zbP7P7d2i9rD4Axiwg=',
+'NF': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'NG': 'eNq91edy00AUhuGXFAIEYzChhd6CAzaRbMuyQyCE0HtvxtTQO8G0WMC9cQH84IY4KycfNgSGZAae8e6eXZ2VVhp5lW4H0imravOsujY2EWT8QlTrtU7FzxbL1XioFNUrYakR+/mo1jWVW45qn+PUnDtYzIRRvWyBNenhwULFy+WDYqlaD1zkgqIF2YKdth5WAteUKrlsudrvJk/OKYQu3y8EYdnl+4Fd2LK9bD4I48Qg00gNS/WCHw9EtbmNBfleVBtyd2RHvUo+6y5gsRdfpO5Xcvlqf7/WF3o5u0eX45crnj+5itr8qXPFT6LbeiXPc5Myvh/V2qx/cmT65teZ4V/ObDRp18TVwzlWjeNuq0lbe3tH59yuefMXdLNQICGwSCC5OJlMuJ+LXZCwOtGIXZRIwpJUKrU01ZNa1gPLV/RMshxpWcLKVQK9AqsF1gisFVi3fsPGBlgvsElgs8AWga2b+ia5/L6+OH1b6/NJC/QLbBfYIZARyArsFIsHpsBAU+wJ+AI5gbxAQVz8Y24gUBR7c8TeP4GywKDALoEhgd0CewSGBfYKjAjsExgV2C9wQOCgwCGBwwJHBI4KHBM4LnBC7B8icErgtMAZgbMC5wTOC1wQuChwSeCywBWBq2JboNgeIFAVuC6/H78hcFPglsBtac1pHr8jMCZwV+CetMb3BR6I7UrSOv5IWnMeS2v8ROCpwDOB5wIvBF4KvJLWeFzgtdg3TuCNwFuBdwLvBT4ITAjUBSKBjwKfhBlrfA464s9BG//e13b+t85Zlq4ZFjcn2dRP/lSax6ebM11u1x/WcmaxbTu2xZ+zdtzKNysjVkZtbNTaL7PofwfvLcki',
+'NI': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'NL': 'eNq908tu00AUxvF/m5aU0kyh3MsdCqQQwziJHactlBBuK3aIhbHYsEFihyIWpA+H+hC8Dmds8iVBBQkJ8YtmfObMeGYcj5s1oLlh1WjFqncfvvZasT8YrVkjj6N+YZm01T8YLVe9Fu2GO/Z34tzHnSTKinE79+0o7RfjTu6j1BLdqssyedKzGcZZ3u1lxXaYfXamsEhqqyRZUXXNbWHVGpn31u62fu1z1uj73KflBsv+RUu9Hhx9mS5ZD5Mm1WpHDW2GS1l9XLDq86fw/8xYrC0tH6uv1I+vnmBNoNFw9jO2sypoONcI+Sou85Mx03wZu/XAuXUbc9LZbadcOc+Gm5jbwukzAmcFzgmcF7gwk78osFnmrN6cf8ZLApcFrghcFbgmcF3ghsBNgVsCWwK3Be4I3BV7NQLbAvcE7gu0BCKBBwIPBbxALNAW6Ah0BRKxYy3QEzt7YgdYYEdgV2BP4JHAY4F9gScCA4GnAkOBZwLPBV7I7+OXMp9/Jfy16tNbCp/e1gL/1l6N/21gzzCcKYeTuPbnvjf2yt5beWvli5XvIf5mZTi97/Dn2B8AX7bz',
+'NO': 'eNq11Mly00AUheE/cQyBALYDYTBJGMJgQwSSbFmyGZwww4IdlSocFZtsWFMuFkg7Hoy34HW4LZVObKBgAfns7r7qvj3YJalTAzqrVk0bVu0ffInyznhkbS/vjqct6/Ptop9nk9AbphbG+W8z3x9mWm84Cbx+mvWs6UVxkmZREXlxmg3c0CAeplm8f9C1GYM8SwKb47syiW2XLLCRLLKxMO8WG0zr5ZZJPl1zBx6P+hM/iDxbeVitMpOzYlHiW0ZaHPPnkXDiD38ZabuRoDyE7w1S94OTtFx87gDLLjHxy/mLdvF2909NxzVF9XHBqk9f3T8+Y7G2VD92fPnEyZVTnBY4I9BomoZTxg37NC1utayrZdTv0qp894WmwOrZc8Uqa8Xcytxxzl8QuChwSaAtcFlgff0wZ8M17TLerLo34crMOrOuClwTuC6wJXBD4KbAra3bJcvvCHQF7gjcFdgW8ATuCdwXu+FLRY4vEAiEAj2Zj/sCkcBAIBZ3+1VgKDASeCDwUOCRwGOBscCOwK7AE4GnAs8Engu8EHgp8ErgtcAb4ciVj+SSeyS3F45wn2+1/7qce/fW/1L+1Tt7x+5Z+WDls5Xv7nrDir0S9uy2/AFc5sn1',
+'NP': 'eNq10stO20AUxvE/hBAKxOZ+6wVaaBtoDDHxJemm6gt024XJjg3ryqva78ZD8D7tGdv9MFIrVQJ+0sycc3RmPLI96ACDDZvyJZuurn8mw3BU5nuWZGEwmVklHqZlMZ1kUeyytMx7fzonZf7d7f/yOcxGYRQks+IyC8dBOp0VYwtiO6CIsjBKAqvEVSWdFYnrsUKahbFbJ/akKHGbphbZeupOL/PF+jnuPisWtq8wb/m3r8+xDNxSTTdzNv0oXNgy31noLvaWXiyvrNIX8Dzf99zkg++50BKvjqusrjfJfb3d39R9X3F1SHVOf622vvbgOhubAlsC2wI7Aq5zd7fub9sT2Bc4EHgp8ErgtcAbgUOBI4G3Au8EjgVOBN4LfBD4KPbJBE4FzgQ+CQwFAoFzgQuBkUAo/xdfCowFIuGf6l9xwf2Kdzyd21+dR+3v2ug1o9saf6v5Ta3f5HPNWLdhb4Hf0iR7Pg==',
+'NR': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'NU': 'eNrTYGZgYNAQAhKlrEAiJqXapLaUC8iKNtQ1jQVyjWuRJDhBEsYmGOIQDUYwDUxArp8jLSgNEAUmMhmBRPEBBlTAxMzMwsLMBASsDGxwwMDADgcMDBxwgKKVkwsOGBi44YCBgQcOUO3ihQMGBj44YGDghwMGogDEOywg7zgQp4PhwH9mFL4oEJsDsTwQAwA6zyku',
+'NZ': 'eNrV1Elv01AUhuG3GWgpwUCgDGFomRNIwY4z2GUoZZ6hDbMJbNiwrrIilviP/B0WHNvxh7NAQiAWPNK995xzB1uRc5tloFm3brxg3ftPXwZtz43HNUuizmo4SithPJ7PZ4N47CV71td8WzAIR5Ooa73F/cCSftTxe7avZYv78aTTdcPQQj/Ozw/S87cs6dgZkdsZpM+IJ8myftsCz+quJb0kibzOKI3tsMjPXqgXtybdyMsSqwfTF2vlzwjTZ9Sz1wxcd9Jzg9b0+Nk1i5aErpvPlSx9uvGnQzMZ0u7znHXbXyvMKJXKleqO+erCzkV2CdR215w9jlPbuw8cp55y6oqth/1OLqtnU3CgUF8qrC84eEjgsMCRRuNoBo4JHC+sOSHQEFiWn3tXbO9K4ZyThbjolMBpgTMCZwXOCZyXQtyElsAFgYsCbYFVgUsClwVcAU/sw5VC7ENXwBfoCfQFBgKB2AcpsCZwReCqwDWB6wLrAjcENgRuCtwSuC1wR+CuwD2B+wIPBB4KPBJ4LPBE7F8k8EzgucCmwJbAUOCFwEuBVwKvZbb+Rn4dF/e+FXgndoGK3TgCI5mtfxD4KPyV7DqqpNfRHP/O9zL/i+pvtiVrdmMyKLQkX56Oedu033V72obWviVjOasPp/W89gMFMhky',
+'OM': 'eNq90slOwlAUxvG/RZxwxBHnWVRQBMrgxhD27owLJG7cuDaNC9s38i18CF/A99BTCl9aVyYaf8m5/Xrv6W2T3nwKyGdt8EZtuHt4qReagbcXzl5dljuVYq3ru36zUy42u8e2XAv8RqlkwS3UAi8dPdMIvIylqL3X9G0lej5aib9nwbJtV7f7asENfLe3dTXwHFu4bv3NJR9eesPjkA1Pr2GMcZyU4ww7TnpklDEhzOOmlycyAzCZ6JnqS2w5PSMwKzCXHYBsLM/H+hck+Z2LAksCywIrArnIai4HawLrAhsCmwJbAtsCOwK7AnsC+wIHAocCR2K/RuBY4ETgVKAgUBQ4EzgXKAlciB1XSc7Hc0WgKuAK1CSZ62KHXJI9PxEd3eHw6H7wC58p/lOrX29W7dh9WDdW91a3Vu9Wz/35dr//C4GUfYI=',
+'PA': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'PE': 'eNq10klSwkAUxvG/YXIgojjPswYLFtEYwI3lBbwAZMfGNZWVyY08hDfT16AfsMOy/FW9fl/S6U6q0kEBCOo2pBUb+oO3uNnNU99yL4xa3cTutJudfDJrOXRrnh7D/iCLemErSrIH1+Iki623k6zduxtddlxPGm5dnpbGO9juZUtdi7aVZ/Hl+T9a4NpoeF2wYVh0cYpX8LxiqVxZXFpmRaAq4LvmOz+5OsmjKcv+1H1/8vyqzLy2tiawLlAX2JDZb94U2BLYFtgR2BXYE9gXOBA4FDgSOBY4ETgVOBM4F7gQuBS4ErgWuBH7fQINmc23wlzGR6LojsQ7f/PxWfj1mtIcVbOqfJedDNwpuLf6AliiVRI=',
+'PF': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'PG': 'eNq900tT01AYxvG/lEsVDKZYlTuiQCuttmluxQs67Nk5LKLDho1rpsOC5LvxLfgiLl34nqbzkC6cwQ2/ac775OQ9p5lJ0qoBrYYNowUbflxcJ520GC1Zzvrd4U+biDtJMZqbXCxGJ27B8dHAzoIiD7MgSqwrj7JB6Gps14KhzbvV7TyNsl7QDWM7yYdZklpL21aGxdTfbZd7xmmeWMn6Qey2GpR7uP6oegd1S/20V24zYyen3+5TpjcIkujfG7RcGQ+/Htlw+dvFipna7Nz8Qv3xk8Ulngp4E8ue8jPPsi9u3nc/3yt7fH/c5nLDW7H03OVm84XnNSfz5qV3l8drpm7n1arAmsB6JY/LRpk3pdLvcmV+S2BbrKeSN92CtbK/akfgtcCuwBuBtwJ7AvsCB2KPRqAt8E7gUKAj0BV4L/BBoCf2pom9NAIDgVAgEogFEoFUYChwJPBR4JPAZ/n//EW4l/ITmHWfwB8ewHGNh/b9K5zZcevqDZxbvZrM2dfKih32hPkLiuKdBA==',
+'PH': 'eNq11Mly00AUheE/cRInhEFOgAQIYgYHYtBgWZIZQpiHKl5AaMeGNaUV8jvwTjwYXMnyiVQFxYZ8ZXWfvu5uqzR42AOGW9YU69Z8/vI9PvDDWbFrgywYpXldSWeln3hek4v+YqblpFp/OA3K0KZPkrwc18vKqBrm5cS6yKpxFoyj2EJihSTfr5bPirX5Rr43K6YWU9vIy6JquZ95QR2CzBuFkyqFVgrrWpyFY+uyJM3TZqeNZie/PvtNG7VPeNnGn47+Tzesurr5umTNtx/VFWxZ7q2srvXXN05tnuaMoHzW8jkBxxlUnIGjbI7rjurOYo4zqD+t+Za3ts9fsMkXd3Y6p7N7SeByK18R2BO4Kk3drYC75x5nMx/UdXdRr2fXa1p7ut3rc03geivfELgpcEvgtsAdgbsC98Ruk8C+wH2BBwIHAiOBhwKPBDyx500gEAgFxgKRwEQgFkjEXg6BqcBjgScCTwWeCRxKNz8XOBJ4IfBS4JV082uBNwJvpVtv53cC7wU+CHwU/mr+eq5Ur6e3xMn71Tvxn1j9x2H/JPRbx6Leb303aI5tO+xpxO4uP//Q/wY1HcX5',
+'PK': 'eNrV1/d721QUxvFvmqZpS2ldM8oum5jYYMm2bAdKU6CUHSgbJ8wALXuFVZm99957771nmWVD2fw3nCvJr60+NMAD/NBPH0lHx+eee3Xl9En6uoG+rJ3GJttpeHRJkPf85tig3Xh2V2uGDb9QG7Gwkve8ZljvmzvQKHqlQt3lyvl6M/SHRy3pea4+aIZ2LuWrzVyuo2OxOUaXTTR3wPfCsp+zntH4ajN0uYZfGQnL1rYcWD6sNLxCqVKojoSBRbWRsNrwyiNhreEFI2Hd0+ggHm1HqeGXKjXXwy9YZT1acy4sVxqlctV1jD4IXMdioxy4ljZpydrV4vkLQc3KojbVqI+Nq7mVWCKwTu6xvdCP+rqyqlunaxq4RVpNPZq14qbV+ip5W2HFlu0H8cOOTYp3xO1H3sKSdS0Oj4aejbAd8N1zu/aea9vqXs7FY3visbVmtK+1YtHNsGK63kpPSWbyote5nHjz3cvz3GavbMOit1vwW+8h2r1cWInGJe+ktZW5MIjT1ibe1FxYjTJl9yhud3PR9kav7e/vsT/O/tr8uVzrm9Z69Hr86J7vx+kJdrP3vPEufe4SnRbbt5IzalNJmdA9sWdS7+QpU1ebxuoC06fPmB6DzMzsGmtmM5nMWrD2rHXWXS+zvt1ANjszk90ga6zGzhvasZHlZ2cTGZffOOOGuvpNsptutvkW2Sjecqu+3Nb9+f7+Qmo522wrUBQXe4p9sbhUTri4knA1QeAHdvbjOGjVu9ixuCou765JTRK14vi2VdOK7U493WQ2VdCay91aXC7bR2XVB9G/ZG1ucRbXOp8lXpudtf4g6OivsUE8tj7QAgPbbZ+AOXN2mBuZY/mBQVcwODgYxU5c3znWFbl8XDNvnhXtOJD+nuwksLPAfIFdxOIF7XhXgd3EanbfIwF7Cuwl9g0WGBKL92nH+wos3G9hwuL9D0i4fDseOvCghIs7eg618wcLHCJwqEBDLB5uxyMCh4nVHN6uOULgSIGjBI4WGBWLj2nHxwocJxYv6ogXt+Pjxfqc0O5zosBJAicLnCJwqsBpAqeL/WcjVn9mu35M4CyBswXOEThX4DyBJQKhWNzsiM9vxxeI9byw3fMigYsFLhG4VOAygcsFrhC4UuAqgasFrhG4VuA6gesFbhC4UeAmgZsFbhG4VeA2gdsF7hC4U+AugbsF7hG4V+A+gfsFHhB4UOAhgYcFHhF4VOAxgccFnhB4UuApgacFnhF4VuA5gecFXhB4UeAlgZcFXhF4VeA1Sfd8XdLxGwJvCrwl8LbAOwLvCrwn8L7AB7LyeKnAhwIfSbrmY0nXfCLwqcBnks4vE/hc4AuBLwW+Evha4BuBbwW+k3T+e0nnlwv8IOn+Pwr8JOmanyXd8xeBXyUd/ybp+pWN7az/XfjH4l8jJ7pfIxd1s+pauiov/t/p6Th6/6Pj/+g5v6t9LBjnWOau3e37oXFqe+zPjl53FJNrcsxY4dr7F/fuan8JMSs5ZifXakdu1p987q5d9tPT7Y5pyTWJXb71WWdNlx1/ACx/51o=',
+'PL': 'eNrV08tS1EAUxvE/DAgiZgxeQEFFRR3USJLJFS+A4BV1YZXlIqbcuHFtUS4c3sTX8Rl8HU5P4DNTumXBb2r6nO6cPpmadHodoDdnw96kDZ+//iz392Ysq6KgrG1a7LcufHDFG+tRFQdFPYgtpGU96FtM6kFiW5LM1tMqToKssCuZLfXT3NbyKkqCvB4UtpLbldLmab1qbfP2DZabG6RVGPXd9jAr3d7YNSuKf8qnLSvC0CZZe3nKsjz8f3HUFI/b5P3WURjd2i+braM1Tei5MBy+jdnw/Zf7/1rGOxOTp6amT8+cmeWsgOd1G95R7lk4zC31zlk+XHYf8P2uP5xZTZPY6MNc1x+W+ZafP2zpuz5d18k1Gvk5Fy4KXBKYF1gQuCxwRWBx6e/etqsC1wSuCywL3BC4KXBLYEXgtsAdgbtij0NgVeCewH2BBwKBwEOBNYFQIBKIxc6MQCKQCmRix1PsUAqUAusCjwQeCzwReCqwIbApsCXwTGBbYEfgucALgZcCrwReC7wR2BV4Kxy75lWdcK9qMnYM/cMOJ91He7Sf7PvFxd/ww0V7rH9cfAcHZl6/UQ==',
+'PM': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'PR': 'eNqt0zlOw0AYhuGXBILZV7OHfUkgAZOQ2KZBXIAOUQAdDTWiwohrcROuwCEo+Ce2PjkgJER4pJn5PPN7ZMvjShGoTFv36Fl3c/cU1o6D58dhu7gOo/jWZuLn7jXf3XJ2GkZhEjfj6nWj3ilr/7qslJa5orLFyKqCIGm1knY7CcMkin4oHrMYB0FusWAzF+d/HSpu6HT3fdY9vLqYU0gV+wdKDAp4mSF732EXRkbHxi1PeN5kutK1zdS0wIwoz7rsf5338zV+vt7PZbuAue972q7d7zIvsCAuL2ZcXsq4vJyBFYGywKrAmsC6wIbApsCWwLbAjsCuwJ7YJxOoCuwLHAjUBOoChwJHAoHAsUBDoClwItASaAuEYgde7DwLPUmPcb87xu/8k48i/83voV3aT3pl7cXam8v2eJ/mqH13',
+'PS': 'eNq11Nty0lAUxvE/pPSAVWzrWbBaT1CpQggkqYcW6/n4ACl3vfHayZXk3ZzxhXwE1ybyTVJ1pr3wN1l7r72SlUBIaHtAe92GdNmGw6NvQbffy9IdV97bTfxgGMUTK4fdOJv2XSmM3DrKpkkw2+N3B1mnky7l7WE3ytLtvNv3E38QxpNp4CfBcDKN/KTXtxNOprGfDEbxpGMNwyyt5a1xltYtGyaj/IpZupjvcB9oxdJ+1OvZcpTNLxZ0rbvh9tjVgml8eOTO6P/ZGM4bq7b6ND751HbTbPhSseHrd3e/CqreQrW2WK0uLa9QF2b5mXp99ew5aDTON3IuXyvkzrptLt8o1C8oL7h4SeCywJWrc3CtkF8XaIrLWy1LWs1WXp+trH5DwNVmMTu+2cq38nffFLgpcGtrDrYK+e1CfkfgrsA9gftiP4FAR2Bb4IFAV2BH4KHAI4Ge2NMi5dwXGAgEUj5+KDASCAUigVhgV+CxwBOBpwLPBPYE9gXGAs8FDgReCLwUeCXwWuCNwFuBd1LO3wt8EPgo9tYJfJZyvZifVv46L7jXeb/C//HTO9FhFbu+5+XzPLxKef232vEe9zX+FbVThPtfbfye147FhoU97Yztzh2sWtj8w+IXhWTNqw==',
+'PT': 'eNrd1Mly00AQxvF/7IQEsAOEzSyCgFhsgkGWLVkKSxKWsO+hclBcXHLhTKU4ID8ez8DLcKBHTj5LDwAHfmWr262e0ZQ8UrsOtJfssDdnh53dH+l4r2lZFnYHcTcdWSUZl85tWha211azXmjn8qwfjbJeN07SUT6wJLIYW+xHRWloqYXEtVhMbVQUjzo2VVyedMWytJi0H7srhuM8zMKoO3TXzwd2JgnydGe340ZG5ZFu5YNijXkSZIFbU3XqecuGPcuH5eqCZUmQTJpr9uPtxkGoDu0Hk6HVnklou1Acvs7Y4dtvdy9LarX67Fzt0PzC4SMcFWg0m4vHFo+fWDoJpxoH4LRYT6neODPNz5brrXOt841WkZdcuCjgCVwSq08Sb5pby37uVerV/v0er/janJcFlgWuiNW95WIFV63fF7c23z6+7/nTdV7zq/fwusANgZtif4FAR+CWwIrAbbG8NGdX4I7AXYFAoCf2SIjtGbG9KRAJxGLbU2xTij0RAqsC9wTuCzwQeCiwJrAusCHwSOCxwBOBpwKbAs8Engu8EHgp8ErgtcAbsadL4J3Ae4EPAh8FPglsCX/d5FUw614FWzP8W0Gd/8Fn21rb9v3i4k/45aJtq23bEt8t/wMnteBt',
+'PW': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'PY': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'QA': 'eNqt0stOg0AUxvG/UG2Veqv1Xq13qWLSBAqNG+MLuDMu1Lhx49oQF8Jb+S4+js5Q+wXiythfcs58Z2YCC/BdwG+ZltZNe3h+T4JhnjZNvg8vho9mIw6SvHJocxTZk+p+2z7q6jIMs8Egi+MsSXq/LzVMHvb7Zozy1DHDzfVkFt8uRXuZMu21Y2OJ4zhubXqm3nBmmRPwPK/pFYrszZfy6OQnF8M42wEWvLHKqxaXBJYFWgIrAu3SnbJVgTWBdYENgU2BLYFtgY7AjsCuQFdgT2Bf4EDgUOBI4FjgROBUzCcT6AmcCZwLBFK981ejX6Vmf5UP/unLZdJuTd2V6rO092bqydQ3cvRVwQ==',
+'RE': 'eNrV1MlOwlAUxvG/xXmesDhPqDigULBQZ30Ad8YFNm7cuDbEhficvoaP4LkFv1RXLnThLznnnjuShtsWMkBh0lKzx9Ldw0v02hy0qhGE9di69dfURL9VQRhYJ0wPu+1h4fwoagSVuFWtbX9f0GdVvWR1LT065kajRrlYqRWj+PueJTdrh5YbpXIUtwJrDsO4Va+2olLnBzxbcn3586bgmiQ9dll6yruHT/G8jOd53V6P10ufQH9iwKJdD7o0BMMjo8nM2PiXYyYmBabE1dOpOpFt19ns5/iMgO93VvmdOkntvX5nvZ/L5ayw/PVZZgXmBOYFFgQWBZYElgVWBFYF1gTWBfICGwKbAltif43AtsCOwK7AnkBRYF/gQKAkUBa70gIVgarAodhdF6iJXVeBSOBI4FjgROBU4EzgXOBC4FLgSvgT7Vem270yw12/dOZ7hv/ixj5Ktxb3Fs8Wb64/YmGfhg8nRY3B',
+'RO': 'eNrV08lOAkEQxvE/A6iDKOO+7xsu6AA6gDtuR08aDmi8ePFsjAfDu/kWvo41ol9GMV6MB3+Zrq7umjXTnY0D2V4LD0kLV7dPlcZD2rJ6oVjKVa5totyIlDLN0nU9X8wFYbUUrXZaVqrnc+WWSodlZd+3QdD48qSKX/eLb/cKWq/Ifz9daE47Njiv/tRlw+4t3MUs3F+E3xvhOPG44ziJZFs7HQJuyk0Z13Ut73xnedr9AF2RPKI7I+AJ9Aj0CvT1D+icQc9rHt7n9xwSGBYYERgVGBMYF5gQmBSYEpgWmBGYFZgTmBdYEFgUWBL7HQLLAisCqwJrAjmBdYENAV8gL1AQKApsCmwJBGKrWmz5iS1egW2BHYFdgT2BfYEDgUOBqsCRwLHAicCpwJnw55pbLBFusfHYL+7zHOe/uxyAmrUba4/WXsKxbbeaLamabd9XFTeVoA==',
+'RS': 'eNqt00lTwkAQhuEXgnvADdz3FRU0AQzivp29WR7U8uLFs0V50PxO/4wHZxL9DHpxe6oy0/R0k6GYKTpAccAMzU4zXN0+bpb8StjsMx8u/XItKDeuTbJW8v0wUeGFTTeuqNrloNQIv/YHl1452Ir6q1FLR1wRVXebeMvzorWgdSlvt3Sw3TDtleunWmUl2kA9bKbNwtnRb6einaLhLmWG+1370xPSjuNk0m3tHZ1ddAv0CLhu1o1BLubmcjbvKt+biLPZj/qEvn6BAYFBgbxAQWAoUZM0LDAiMCowJjAuMCEwKTAlMC0wIzArMCcwL7AgsCiwJLAs5m8SWBFYFVgTKAmUBdYFNgQ8AV+gIlAVqAlsijniAnUxJ1ugIbAtsCOwK7AnrfG+tOYPBA6lNT4SOBY4ETgVviW+Shl7lfIp/u7F+XFLwR77xFN/m8/Nfi7eH/O1D2Z+TsX5m3/I2/dOJ95pbjH2NlY/xa9dkqC+',
+'RU': 'eNrV08ly00AQxvF/7BCCwhr23WK1AYFk7SGQhH2/URyMigsXzlSKA8q78BC8Cy/DgR7L/iyTG0UVxc+lmZ52z2JZ6neB/qo120vWvP/4NQp3tlcsHMVJUVaWKHfaX31z9RtrsV3hKBpWdTKKgjgN8rKqUxdWdWFdWlR1OQqjJK0GdeKKozoaRXGaVfXQ+iTLqzp3hU197sqjILMtB3Vh9VYcFK42jKo6thlB5vYKXdL2sWnZZONmnTgPbOrATpnPndeF5a5fsWxhEYa7qpt82eQ7Nniz9add33Xj5tOCNZ+/uzvd0ul0uovW7Fnay7LAPs/zVvZ73oGDcOjwERt5q0ePwfETJ0+dPnP2nOfBeZlb8sJFgZ7v9xoWyzjvN9ckbuXdyLd43PvTfHuu+/iKm8Fs7ixu510VXJouc3lWM92rvb4/Wd9v1YzP4P92/p7O77v1r8j8fb4qcE3gutjfJDAQuCFwU+CWQCBwW+COQCgQCQwFYoFEIBXIBHKxR1bsYRdYE7grsC5wT+C+wIbApsCWwAOBhwKPBB4LPBF4KvBM4LnAC4GXAq8EXou9dcJf07zCi+4VXl/g3/nZ5X/x1u7TO7s+2PXDxXb0L9b/AnJC1Bo=',
+'RW': 'eNrN0zlOw1AUheEfOyEJYQzzPIMZAibg2C7ZAB2iCBENDTWKKJB3xH7YAMug4D4gR08pgYJPftfnDbIs+ToKgahhpVe2cnv/nBe9uqVOK23mXZtnhbdTsdRKLKfFwPm000qy7uBO1VIWxzZpDy7n/eXAJleXP71F7vZZHoasPL646AmCMDCl8nCFqkDNGXHF5fr3BaO1Phjzsmd8QmBSYEqgITDtnZnxsm9WYE5gXmBBYFFgSWBZYEVgVWBNYF1gQ2BTYEtgW2BHYFdgT2Bf7DMJHAgcChwJHAs0BU4ETgVigTOxjhU4F7gQSATaYn0t1snCn/lq3ZJr3bffPOc95L+5th/yxsadjScbr25ur/kBZG9p/A==',
+'SA': 'eNq91Mlv00AUx/Fvmq5AnbSFQtl3UlqDl8ROytKWfRMS4mh848IZ5UTyn/S/4t/hwBsvv7gHBEKIj/Rmnmfe2M7YTq8N9NatGS9b8+nzt3Q3DKfjVTvIQn+UlyPBdLxUTw+n45FbtL8XZlHfT/NJ5PphPomzeOD6fhb3/cSSJIv8QT5Js8gm0nzb1ifT+kKj4rRb5akGWRDGfuKuNxmGYViVLpalrtCtGgaBu4XZuN3piqWjqJ6Ys6P3h3/b9VxXNF9a1nw9crvTMNeeX1hcWl45cfIUqwKe1/E6xvNmeafI64kyd5nLu12vazyvW9QXK6u1Rb3L19a9ihvfUN5w+ozApsBZgXMCW42azfOz/EJjvOmiwCWBywJXBK6K1V+b1V9vrL0hcFPglsBtgTtij0ZgW+CuwI7AroAvcE/gvkAgEApEArFAX2AgkAikYu+v2DsrsCfwQOChwCOBxwL7AgdyPD8UeCLwVOCZwHOBF3I8fynwSuC1wBuBt/Lr/J3wR8pPdd59qv0W/96PNv/bwm/C/Q13qr4ZaxYbFnHV1/HB4qPFd7dJVd6yvWq7sJ/3E+t8u4Y=',
+'SB': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'SC': 'eNrNk8ly00AQhn/bCSEwbAYCRmEJqy0k0DJaHCAmEDhyguKgqLjkwplycUB+Ny48A6/D35LVyAWpyoUqvqqZ+aenl2kt4wGA8ZDTfIPT4dG31MsWc0NdRH5e0pB46WK+vjxczH9IwGw34giLLC+rqAitn07LKmaELStbhH6cMrZKizDNyqrIp8wzqWIJ42EqPlaWJKFPEFJlh0dVXgR+Qt9qKqKcVAkDEh7Qx4+4T7kPRGc+vUIq214gkfJBWz+yZZ04aRPzRozPWCGM83LCTuJuT3tNT1JPgiV9XTamYFhttmlWW6UDVs+LyPq0TP5ItkmVB0HAXbSY97l7t3+Spfv8t5oL2Vn9MNnMzGZSyP494ViWevrc4/TlvbzVDv3+YG391Mbpzf4ZnFUAc+78hYvmkhnyAzDmsrlydWt47Tr1aDS6YczI8DswjmOc4bbjOMDNW7fv7Ji7w3u1/b7hifOA9oemZaXso7ECTBTVrivaFSGT2GvV+DRG9andqV2l8Wkimpxd3cSIf7tpY8Xvtxb7Y4Wxnue19/SV2r+rl+WWeVZ6WdZd7UWOPL2P2+1xqVdq+XUxl/pJ57l1eaoAgQKEChApQKwAVgGSTmyqAJnCz1kBpgqwqwDPFOC5ArxQgD0FmCnASwXYV4BXCvBaAQ4U4I1yvH6rHO9zEppfbE1+se0e/m9mg3+S9gNf0UeOT7J+b/RXjp8cPY6BDNp/Ad0u7KE=',
+'SD': 'eNq10UlSg1AQxvG/kPgSzKBxirNxiLgkFiG4sbyAF8Ds3Li2WCl38SgexZtoQ6q+Isss8qtHv6bfUBQd+kA4sJA3Lby+faZF3rYsi9K5vc2KWn1oWRQ+PWaT2Na+ZtlDPE3m97Y4rW/rWJZm0SSubkiK3LPCy/M6prCcqvC+YeHjt4w1nu8tNJpsCjjXqkbbWR4EztlwwdLRrY5AV6AnVb3Xtays92X5G7YFdgQGArsCewL7AgcChwJDgSOBY4ETgVOBM4FzgQuBS4GRwJXAtcCNwK3AWOBOWNmi3Y2y3d8rHv3581k36xTWFezPkdjzD6ynR7Y=',
+'SE': 'eNrllOeSHDUUhY89Xgfw0owZ0gI2mRnYhs49LWgcwIFo8gLjxoQl5zDFD3r+82IUjwCP4UfgXklzutusq+wq/vFVaSRdXR0dhenpCMD0mPwsD8vPpd3f8u04Wq07pe0cWo9Uq+Wp/UA8PWmiRRzOG4kWq3YRp0VjE8pVK2PJIgrTvGkzqbOmzaVK8rBq2lIyw6JpF/NK8md2SrGatYlM2kuktBoyIEtZmXSuIlEs1Vyqpq0kmJdNJ5WqVJoPpCLnI7602ybWi5WVHNUKE6sVplYsSXtamWpFSTYQi2VdtZOqsVxtxVlYVl4rK3Sf6k3l1V0he+0kc29HBmM5QZmf2ByrpyYzMak7lZFiEaVa64ZTZ1LXqXTja8W2sB7TocNYd5N4QdmBHpE7v9LK6nC39SQrnVU9ts7qXC93e75qK/U8PAHrOBGrqVWvBned2TVibzwP15dF6eWGe1DynDalVaqGO+SSj63Qx3ZE2okuncnSy4NuRF+kPlhrK2rTqs2ymZvb6apKWbqovFi8evr6q6lW9ufLffLz8+8q22P/6MDGwUOHj9x081FsEuCW4NZgfCy4bTIBbg/uCO68K7h76x5gPLk3uC8Ijp+4HwgeCB4MHgoefuRR4LHpbDx5/IntcEviT46Dp6ITx+MESDfTVEqmmgEB8tmkKMdb863NgZ3KEMA87ZH2MwSoBVO7nNp22DbGBmRubfyIz/HxZ0kXdznGTfb5qujazk2/3WmaulvXx21y3fnp5bNtem2a8B68jncjfafjtuM9DPdlXLzmfg0PpZfTeV777OWYf/kxtdPpe+7t17rwcVObXtx7OEmAUwQ43b/H9RWdcXPPmJ4ffyZ9niPA8wQ4S4BzBDhPgAsEeIEALxLgJQK8TIBXiPyjCHCRAK8R4HUCvEGANwnwFgHeJsA7BNghwLsEeI8A7xNgQeTLQYCGAB8Q4DIBPiTARwT4mACfEGCXAJ8S4DMCfE6AL4h8iciw/RUBvibANwT4lgzb3xHgezJs/0CAHwnwE5EPJAF+ITfeXhJcE/dZPqCf5b/34f/BldF/JrVxHeXsVeWPPWLnfbno6z/3iPX7V4/vyA1elvKXlF+l7Bx1/ZHc6Ui2+w/5oyXW',
+'SG': 'eNrd1UtT01AYxvE/KfdqEbCAV7xbtNUEpEkRLQhaFRXvt1ovM25cM1nZ7P0Ifhx3fC3fJO1j4tSVrvzNnHPekzzNaTPJaaUAVGasC8ete/f5a1D1vChcsEl7pd6xA37UbXt+rZHUVc+N8smyTeptrxbE5+tR13ddN/lUONKLReFcvEhzLbDYaqfbaLuWXkri4UQa8tzkYpM285pB/wqjvZNemvMa/ROOzR5tDh5+LVu0asUWW06/2sB4JR6S7suQdXvfh8lxCs6w44yMjo1PMClQ7DlwEEql0lQKpg71WD3dD9kXmZmNpfVsXzG31OGywJzAfKZeyNRHBI4KHBM4nsmfyNQnJf97FwVOCZzO1Gcy9VmBcwLnBS5k8hfFbrvAksAlgcsCVYGawBWBqwKu2LMjsCz2fAhcE1gVe7wFfIFAoCGwJnBdYF3ghsBNgabAhsCmwC2BLYFtgdsCdwRaAncF7gncF9gReCDwUOwtEtgVeCzwROCpwDOB55LP/6l+IfBS8td/JfBa4I3AW7FNT2wXEegIvBf4IPBR4JPk838j3abiDWrv2xD/3nqB/0XZXpn5bPuRjouZY761+M9ibECzt4bWb20/Pm73vWVtPx7tdu3a+BOMXwm6',
+'SH': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'SI': 'eNq108ty0nAUx/EvpbXWS0GoWm8V71RBCSQk1GrFWutt3DkuUsZNN64dxoXhTXwZx4WP4Ot4/rn8CsrSfmZOzgn/c5L/hKRZBpo1O4yX7XBw+C1oRZPxutWx1w5H9kO/FU6SOBq42re6aAxdY8uN72x5B4dJN+62o1HSi32X/Lib5jgIR3HPqk13qcl4KRu20Y1sNO5ZQ8dzEx1vMEoCL+n7eXN+p76704rVUSfdw9GKNjsoVpJoYBvvuc12W8FkvGCL74fz09FeatlegkESpdP5/edNNV1KD59Ldvjy3T3BKQvlxaUTyydXTp0+w1mBVYFKJS8rUK3mZ2m9mtVV66nmTedcf8VOnbRfs7V6vb7mnIcLa4WZ7VxcF7gkcFngisBVgWsCGwLXxepGo1HUN2T2mdwUuCVwW+COwF2Be2KPXWBT4L7AA4GWQFvgocAjgY6AJ9AV6An4AoFAXyAUe3/F3liBLYHHAtsCTwSeymy9I/BMYCjwXGBX4IXM/j49uyfwUmBf4JXAa4E3Am8F3gnHIvtUF92n6pc4Xtvl/37JUunfKE9HOcvDOfHTYrcI69uzvP9X/HLZ1j7Y3/vJ4qPFV5d/wG+X7RX4A38myqs=',
+'SK': 'eNrV08tSE0EUxvE/CSgOIBLlIhcR8JIIA5M4SWa4GJCLIiU7ysWYcuPGtZViQfIOvJTP4OtwOhM+J7KFBb+q7j7dfbozme4p5oFiwarWkFXff17EndaoRUnFr0Vx0waiTmbKS6eqNyaWLYqLjc0gKftRs11OAr8S+nGzHSZBaBuVLK2WXTBsURQE/w9P9fZJ6pH7jXqn3cspZZJG3Nqk6sdpSitn/dO96+Zf3rRFNdusak8TNtuxNbXrJ+lfkzZF13SrXwNW/b50bycjl8ubwdzQg4cMCzwS8JwRK/YWx1z82IHxJ5434XmFgte35dNnApMCUwLTTjbu9mAmk/NcYHaux8ZdnXYstsxusXhW+v/jvMCCwAuBRYGXAksCywIrAq8EXgu8EXgrdhwCJYF3AqsCawK+wLrAhkAgUBaoCLwXCAWqYvdMoC52T8UutsCmwJbAtsCOwAeBhsCuwJ7AR4F9gQOBQ4EjgU8CnwWOBb4InAh3Lv08B93nGQzc8t5BnvvuzI7yh5VvrvyBv679asWO8tziK4+Ps8U=',
+'SL': 'eNq10V1Og0AQwPG/UK26oLaK399fQWOTSqGgL8YLeAHkzRefDU/Sm3gYD+F9dJbaibxZE3/Jzs7OzgJhQxcIuxLKtoTHp9fhVTYqPcnzqJekWSGldNTYDOrNQVJE0hIXEm5sV9zsurQPvruNkmqQ9wdFFcdVkveTYVGl+bCXFVWWXeTX46PJqHSk/eH+P6bQTnV4npHw8mHjD47jtmbnnPa8s8CiAmM8Y3wjwDdendncRt9oXRa+1u3C19z2NV61tKxgRdm80+lM8u5E8ztXFawpmwffYF3BhoJNBVsKthXsKNhVsKdgX8GBgkMFRwqOFZwoOFVwpuBcMbXxFbfsFb/xd++f7tRngl8MuQXkT5HK+AKMdFBE',
+'SM': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'SN': 'eNrVk0tS20AQhn9kk5hH4kB4Q2InCCQHBCONXiYPwwW4wKAdG9YUK8QlOBFHo3skt+QqNoEVX5Wmv271tMey5XcA+Ku03M3TcnV9P364WyAzOisoyx9a9SGZ9idnKlQlx9yEwbgoxyaiMBpRU9JufyTLuN2EUZIWqkwpCU2kizIyOW3URsccY5PynITGac7TKs9MnBRlbnSQF6Mys5tVGFNG+1WQ8QAV6IQLMVlalIY+5+qadqog4Uk5beAD8s3pAR061uXF/4fmiy3yc9BahZTGLw/0OdjlZo6W22V+zi0cx+nQ1XWceXwQgI+93kLPAizauLTM3uLTZwHof+nXkPdnfIVt9Sv52lrfXlxf39jc2t7a2WXf+/Z9MBz++DmYPdu+ALgCcNDyw5a7B1O4v3Gv3eN6XuMVnmfd3qjdmnWv6p/Wq6zuZ8i51nhdrt2drbtuq4dnTsuVN+f0BWAkAL8Eqh819WMBCATgRABOBUAJQCgAkWD/WjVALACJAKQCvWMCkAvAWADOBOC3APwRgL8C8E8AJgJwLuBNVK9Gl1+N7tzrRjxNOnivrNPj26RrwPGJfkKKz8KSq9E=',
+'SO': 'eNq108tOwkAUxvG/pVgRBMEbXvEuJJDYYKl1Y3wBXwDZuXFtupK+j4/hY7nTM7T5IgsTY/SXnDMnM6eTJjPTLQHdlqU0sPTw+BL3r7O0bvU4HA6iZGJTo36cpeViOUvb7pPbm2gcxYNkMrW+K+vq2WKkNtujmbcl48twMg0jtz7KUs9m7+/+Y+i6YZaeFiw9v7v8hVfyfL/sed5iwJJAxVl2qagreV11KtVZXatVC3NbrtQFGgKrAk2Blsz/25rAusCGwKbAlkBbYFtgR2BXYE9gX+BAoCNwKHAkcCxwInAqcCZwLnAhdmQCPfl+/ifya+C7a/DK77x9lPhr7nE0igiKcM/ETp2hxScAclBV',
+'SR': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'ST': 'eNq10TcOwkAURdGLDRiTcw6ta0ukkg2wAaCjoQYqYG/sDL5t6cmUCHGkefMnaaSZwAWCpsU1Z7E/3paPq2/VLlwfbLR4pOY9q8LQ6nl6tmjVereKt9uCY8Pt5h9dEHVxnDIW50uUKY7jOrFsjryA5xW8RFQnfP/jaLEkUBaoCFTl896aQF2gIdAUaAm0BToCXYGeQF9gIDAUGAmMBSYCU+FryRdkoy+4f3Hs+XL5lb0M9grMrC2tvQFX8jWA',
+'SV': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'SY': 'eNq11EtS20AQxvF/ZBwThHBCwiNR3g9iJ4Yg62GLkAIukAvI2nmTdcqryHfLcXKE7KAHoQ+8YAEFv6oZtXp6WqXSlHotoLdu06xj02T6Jxvk81lgcRHtpnlpmdFgPF9YPXZ7jg4iNybToyqZTKtiGKdZ2a+Gti1OyyquF6siTiybFFFcVqlbK/uuzXzWrhtau55FuZXH1qO00iQdWW1aZUVmwXhc5UWUN9s8K/55ch+XnrucT78e2PT7nwuv8FpL7Ycdz/OWH7Ei4K8GwVoQ+L5vcWCBC1285p9n63ydVU0T+3738ZN1/+mzhUdtbApsCWwLPBd4Ia4+DJt6N9td2MRb4WW+rrvsH7o4bG4W3/2lwCuB1wJvBN4KvBN4L/BB4KPAJ4Edgc9in0mgL/BF4KvAQGBXYE/gm8C+QCQwFIgFEoFUIBMYCYzFjr7AgcB3gUO5Pv9DuLH62C+5Y/+f+/H3tHVnvdq3GO4H1r0YnYuxYcNOPXZisa/CGexKjd8=',
+'SZ': 'eNrdledSFEEUhQ9JQEWCIkEUE7KjzO7sxAXDCiqIizk7jhFzFlGrHJ7BF/F9fAHfA29PONtTpb/0h+VX1dOnb597u3t3p7fUBqA0II/VTnncXv4STNXWVntEh5ZtBpFE/KlgrTD7VbRdL9VnbGlWaAVRHFadKIjt0AsiI3aSsOOqsB3UIid2QtuRketHKmzEYnCt0DX96Siu+pJXtSMxeaqS60mKHfuBEXtJIU+2EVdD3xSzqhPKfOzWYi+0qpFhyK7c4v761ZnqM34cSFItUg5/bbUjdch8tyirZllpZquMzs3+na6kuuTxrEUeK9/Uohqtbe0dGzq7ujdu2oyejC3yYfcm9EkD+ge2bhvcPjQ8LPGR0dEdI2MjO0dF7+oZyzKA8d179u7bn+qJlAMTE5CayjM5OZnU7EvL9ub1U61RMghwUNOHCDBFADM1mMpTTqhUymX5NKu2U66UE+16nu+abuCJp2aYrDk9c/jI0WOpNrQ6huZRMVPTzbhJXSaJruQ6KahsZlY/GeRrycBkrmy6uQezuR9D6XwllVsnwHECzJLi9ztHgBOaPkmAUwSYJ8ACAU4TYDENLmrxMyqeqUQvaB5ZsNHI1lV6jrpBLQsu5evOJQky1cj2nwzys8igwX0uLc3zjGJqnlfpvLrKPUvkrSDAeQJcIMBFAlwiwGUCXCHAVQJcI8B1AtwgwE0C3CJyxxG5GwgQEeAOAe4S4B4B7hPgAQEeEmCZAI8I8JgATwjwlMhtQoDnBHhBgJcEeEWA16So35Birh5/S4B35Pfx96SoVwjwgcifDgE+kqLnEylq3fOZ4I9Ir+52dXX/aMG/z3ob/ne6tF5vv/IMZW1Q2nimVR9kWm4FfJcmtwbkDYb8ivATjaOaQw==',
+'TC': 'eNrF08tu00AUxvF/k7aEQguUQIBSaLk64BQ7ceKkBNpyv4kdYuFabLphjSIWOG/Cy/AUvA5n4vRjAl1S8ZM88/n4zMiyxkEVCFZtGNVs2D/4loZxNB4t2U3W6w9yqwzGs8/W7KaXDIKd7TRuF25O9g+KbtRsWksyHi2Wza51qNa2XZ0sbudFksWtbt4sOmWl1RlMa6kVk6yT5K7t773WLfZtTRQV3W7R6xVpWvT7zazdmrxlb6Z52eIgiryHFau83zt68haulG+cxlkU5+U7HLUkcNNk+Dxnw5fv7jt6KhPVyvzCIicEauakG+yLLrnp1OnlFctnaodmtjl7TmBVvHwe6n/W635P3e+v+2vrli94a30XBRri8qXLVxqNtcZVl9enXL42BdcFNmSSN2/8zjdvefXNw3x7pn/jzt0yBwJNgXsC98VyGPo5LG/LPCmHqoeu3mptqX9LLHt7PhCIBGKBtkBHIBHoih01gVTsoIudY4FtgYcCQ4FHAo8FdgR2BfYEngg8FXgm8FzghcBLgVcCrwXeCLwVeCcci/JXnXe/ajL3D/YbVvnfFo7h+mBH4KNdX938Az7Z/NNlOwK/ACCAvvw=',
+'TD': 'eNq100tSwkAQxvG/A6gRVIJofOPbsKCKCo8hbCgv4AVCdmxcW6wIt/EgHsg7aA+PrrjUKn5V6flm0pNNV8ICENakTEtSxpPZYD4tS0qivo1T2dt57k1DUhSFo2HSsYM4bWe9pN3qpVk/kV1Terr57pb79mjYl6cjfVb6xpNmZu14ksVy6C530yyWQ3e3N58aufH6sokldMuivG1Jef9yNceYgjGmWDLbO+wq8Lw9b8llr+x5lXV2Kpr33e7XJw8OFVTVIvvV2pHv+1Bfced1tcqr/rxjBScKgnxeWOb1aRDAqYIzBecKLhRcKrhScK2goeBGwa2COwX3Ch4UPCp4UvCsZHyKP1uOvuhG/8H/fX4X2BSZKDIl3E9m5fkBGBBVTw==',
+'TF': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'TG': 'eNq10UtOwzAQgOGfpuVVEqC83y0PKSwqlbSJKRvEBbhAml03rFFXuPfgOCy5FYyTMDJLBHxSxjPKeKLYcQDEHQmzloTJ9MXMZ23J8kHSHxdSZ3PvTc91398ledI3hR3mybCwo5FNU5tl1phr6Ur9/m7VP8hvZJg1eZoV9lYK2TyeTOv2hjQ9PvzHErulDE8LEp7fXfQ0gmZrcWl5ZbW9Rhh9gXUFYbhRCsMqD0sul8rLq6LOy6LOo6jaW093eeR9y7PZUbClYFvBjvr+L7sK9hTsKzhQcKjgSMGxghMFpwrOFHQV9BScK7hQcKngSvFj1bU23bW+8jfePoJfz5ATx8jjbkdOh09e4k5L',
+'TH': 'eNrN1FtT2kAYxvG/IKg9aBB7rlZbD6ignBOQFqjag636AWjueuO1w5Xw3ZzpF/NdgaeJYy8604v+Znb32c1uQpINuSSQW7SqP2vVj59XQb5UHPaz1umVC0FoI34+GA5KFhrDfmo8adjPu4XtZrlXKjTCQaVXrrq2aotq4aDWqxTq4cC3xg+3bUFdS+0kaUvB6Czp0aC75JzFUlAsjmbfPdCYHEhY76x7f/P7EjOW6m6Ff/+KnGtuq4spqy6v3XOISCSnU+mZ2bkHiYc8Eng8Nr8AXmbCspfxItl4xuVJBxa9CY1nXM5K7CcsPRF4KvAskp9H8guBlwKvBF5L/H6XBVYE3kTyaiSvCbwVeCewLrAhsCmwJfY6BLYFdgR2BfICBYE9gX2Both+EigLVASqAjWxfSXgi21pgYZAU+BAoCXwXuCDQFugI9AV+ChwKHAkcCzwSeCzwBeBrxLPJwLfBL4LnIp9aQLnEp//p/y3Rp/ztPucO1P8e60k/7vUneL+BhfGrSuZTrxkXbm2be+2lD2zQyu/XGu3egOyGcN/',
+'TJ': 'eNq108tOg0AUxvG/tLVY71Xwfr8VLWqBltbEqC/gC2B3blwbVsK79c30DMSTsjSxv2TOfByGaQjTTg3otKWkTSlv719hd5SnLclJGI3G0hjmlVuP5oGnh1BGLwn9/jgLkiCSKexlkSQ/Hmf9JJBGHHhZJMuiQRZH2TD2PNljkKeNcjfZa0XSKLn3w75f/FScp5a0Xl9mMXXMVJSPOSmfzyZOsSyrVpdiNeZpKrAXWotLy/aKbUsWq7a9ti65LWxT2pVtNjYVOKrIruv+ZtfR7E6vMX1zp8zO1PqpfZzyusxupe8Uz26p6jtuK9hRsKtgT8G+ggMFhwqOFBwrOFFwquBMwbmCCwWXCq6UfD4FnoJrBTcKugp8BbcK7hR/Vh6nujlOE/7X5LuG+afMcshJwZwQ+XLEMn4A6ipilA==',
+'TK': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'TL': 'eNq90stOwkAUxvG/BUStoOD9fldQq1yKFTfGF3BnXGDjxo1rQ1wIb+jSxNfxjMCXYliqv6Rzvpw5maTtlFJAqWhLO2PLw9Nb1G3nLLVqQRgFzdg6F93E3oabv76qtapBI+7UrTTjTmgljMs20UjO+pYid1D8cydr6bIyqtvsdz3LtzeDMjwTjZwZVUqufC/PY7a8dFxM8LxUOuN549mJSaYE/GnHN4Ps9LPf6+f8fD7fzzP+AMwmckKhKDAnMC+wILAosCSwLMPvsiKwKrAmsC6wIbApsCWwLbAjsCuwJ7AvcCBwKHAk9msEygLHAicCpwKBwJnAuUBFoCpQE6gLhMKf6F3FtLuKH7915nuK/3ZXgHt7Hl21z/lq9dNlu85fG4lqtQ==',
+'TM': 'eNq10TtOw0AUheEfOwYmwUDCM7zfMoWLOMSJaBAbYANOujTUyBXxTlgMi2A/cJ2II7sEwSf5zpmHRiPfyAeijpU8sDKevo6KvGkp68XpxKbDorLRLQ8/3PeS8XSW3PVnWT8eTJLk1nYH1XMtS2mWxqPyhrTIPZs/Pf7HEJXDvDwvWXn5KGuF5zeCIFj2PG+FVQHnmm6hzM61lNdq686FYehqV65vCGwKtGW+3v5eV7Tckfo7twS2BXYEdgX2BPYFugIHAocCRwLHAicCpwJnAucCFwKXAlcC1wI3wo8tWtwoW/zG771/+vw16wzWBexPMbTvC5S7Rlo=',
+'TN': 'eNq90stOwlAQxvG/LaC24AUFvKB4F1SSpiEW3BhfwBco7Ni4Nl1B38oH8MFcOEX8AOPGkPhLzszk3HqSTtMFmmULSd5CfzjqpknRqjjsRO3ewCaidG6pYFX0c7Ka3fH4EMZBOxqMO8G41x+2bOk+TRxben76TrMjvlXdOAi7g9/2/TU1szQJLysWXutZOcdxXCfnOPnC6hrrAt6Ub8+xMAVFgZJfmsyW/Nl+z1u4fmNTYEtgW6AssCOL79wVqAhUBWoCewL7AgcChwJ1gSOBY4GGwInAqcCZwLnAhcClwJXAtdgvE2gJ3AjcCtwJS/lqlVzWKm9LXPP+4fIfKtbUkY2ajUaW7bOfl8ZR3g==',
+'TO': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'TR': 'eNrV08lPwkAUx/EvLSJqXVjc9x0XtCBIcSP+A96MBzVevHg2xIPyd/rPePANDb+UcFMvfpL35nVmOumkMyUfKOUttTOWHp7fK2GnHVh5Xy3Xo+aj9TQ7ybFCPFaLRz6iemhFo2+KK+sDL2atjMLB2a6/2ev37OHm+qdNyTXd9JKy9IrbXYLn+b6f9ryhzDBZgRGBUYGxwIy7BBNBT9+Sk1MCOYG8QKHYA8VEnUvU04k6aUZgVmBOYF5gQWBRYElgWWBFYFVgTWBdYENgU2BLYFtgR2BX7DcJ7AnsCxwIHAqUBY4EjgVCgYpAVeBEoCZ2eAVOBRpiR1ns+AqcCZwLXAhcClwJtIQ/E1+HdPc6pH651pfPf3Fre32yeLP4tLhzYZ//DeaFfSY=',
+'TT': 'eNrN08ty0zAUBuC/TVtSoOAUwr0UMBcbGiI7ji2XS1vu0Bl2DAvHwyYb1kyGRZV34O14GRYc+fLHBlbQBd+M5KMj6ciJba8DwNuUbtaVbjI9SnYCNZ+tyyDTaS6JdN6eOpSBjrW3txtKU4EJs2AQ5b6JZRhk0SDOi1Sam2wkg8nUJJkaJDJO5aplpZb5MPelZDSfrZXFbenponQq20a2flkpyFRYVLT9ZOqbSOayOLEDo6VsfQOhMok22i5Jivtp7/v9zC17pj1ImfHYxLFJEqO1X204iluLNyRMlWpMLkvm/cHfXjx7KbrPS9J9+WYfR8NypbOyijUCTnTF+slTp+XJbHRrra1nzhLg9GpA79fYaead3uZijdNc70h8rrG36TwB/f6Fio1rNr546XL/ytVrRbxVAa4TsE3ADQJubt8q0y5w+45bqde77l0b3/N8cd99IHFrzQ5rDgh4SMCQAEWSDxb5YSCqOCTJN+Jw2Iiteq8od0s+qAHBH+KwmS/P5T2MCIgIGBMQE5CQvOQk7zABuwQ8IuAxAU8IeErAHgH7BBwQ8IyA5wS8IOAlAa8IeE3AGwLeEvCOgEPCsSk/zxX7eaqlf6jzo4P/0eoxtQ/y33yU9l3aJ2lf7Vh+8k/UHtL7',
+'TV': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'TW': 'eNq908tOwlAQxvG/LVBEFMEL3vFu1SLEhbY7fQF3rtS4cePaEBaGd/NNfBEWzgH65WhcYeIvmTlzZtqmSU/jEIgblnqRpceX9zTJBr2q1Q+X7ezJGtdJOvhtmGpYHA9tVLIqc9f5zbJVabdrm6uf7SxvB7a5u512id0ySq8zlt5uXOkJgnCkUCwRCZQFZr26Mpf79pjqvMCCQM2rF+s5qHu1ryGwJLAssCKwKtAUWBNYF9gQ2BTYEtgW2BFoCewK7AnsCxwIHAocCRwLnIh9MoFTgTOBc4FEoC1wIdAR/mR8nAruOH1Mc/8w5D+4/6k2iWgS9/YTPFt8WvTtNfq2fgH4/Vjv',
+'TZ': 'eNq908lOAkEQxvG/A7jhvoH7rqCgMy4s7kuMJ71yGIkXL56N8aA+ns/g61jN6OfA0ai/0F2VSk3BhO5cAsgN2fbYYdvN3XO5UH19TEW5ZfFq2vKtcKtYqbtKvGvCTTneK4XBbqX+Ug6DYrWet0KjLx9rdCMqfug3RpRav6jqtw52v6xig3b8l1LoB/V89Jhn5evTr9A8ZCeIhjT3RCHnQmO7b7PtwXevH+N5CS/ppdo7OrvoFixPR1zeE6v3Wuh1H5d/gT4r93cPNHoGY3NihoYFRgRGBcYEMp/dGevPxp7NZr/zcWl+rwmBSYEpgWmBGYFZgTmBeYEFgUWBJYFlgRWBVbG/RiAvsCawLlAQKApsCGwK+AKB2KkW2BY7SwK7AiWBsthRFTvMAnsC+wIHAocCRwLHAicCpwJnAufCn4iuT9Jdn4G2X5zbehf/QeqHq3YBt7Zqb/Bk8d3lV7Yu4QNvupLw',
+'UA': 'eNq108lOwlAUxvG/RZxqHXAecFZARYulhboxvoA746ISN25cG+JCeDvfwZfwEVx4ivAFjRsN/pJ77zm357QN3BYzQDFnU3PUptv75/A4bjcnLU6CclSPG7ZVb3+5WEhbLs6DpFKuN1rVpBKka2hprdGKkspZNYwbJauutZvZzz7ryne74lboW1UQpU2xNf1QO2ZR3fctib5vx71tx5Kry78uxXTpTA9DNj2+pGEfx3Eyw9kRZ3RsnAkBd7LLS+Nu5oLX3XbdTo2lnufZrzjl9sC01/PlUTOzAjmBOYF5gYW+msW+uN+SwLLAisCqwJrAukBeYENgU2BLYFtgR2BXYE9gX+BAoCD2NwmUBA4FjgSOBcoCJwKnAr5AReBMIBCoCoQCkUBN7CSLHV+Bc2FgPo/0cHqk3wZxv/fMr1uy/zyu7YO9sXFn48nGa5rba34AmT191Q==',
+'UG': 'eNq1081OwkAUBeBjAVEEtWgREPFfi4K2hZZiTIwv4JZFadywcW2IC8sb+T6+gI/hwltajhN3/n0wM6e3txMSpmYGgFmWaZKXaTR+dtuD6SSXZElq9VpyVy78adQzb64Cu+OFo3HUD+yuF0a+LK6sA68lPd40cixpsqTB6cUVV922Jqk/28Pt+/EmVmB1emHypNJXkuRbVmA73fDrHkVJA96SxzQp3N3+dDHjZTY9LMj0+BJHhaZlsjlNW8wvLaNAwIqSiwQUklBaXQPWdbmtF3RdespK/4aSFZsGARVj6zMTYFTkE3+NNFfSPJPkaix9tkpATdnfqNfr86zaJqBBSb2R1ndI6s1mc96/S8AeAfsEHBBwSMARAccEnBBwSvKXEdAi4IyAcwLaBHQIuCDgkgCLAJsAh+StIKBHgEuAR3L0SY434VeSo5uNj+4b/sF75lvtuT8eQ3kp72U8yXiVMZSf8wE5OYER',
+'US': 'eNrtVtdy1EAQbGyCCTZg4Eg2GWwDBwqrlc4EY3LQHjmKI5qcofyEXPwg7/wMD8ysdudkXFRRmEd3laS51UxPT++W6kZ7AYwO0m26j273p76mB8NgZnoF/SiiZqtDK62Z2e9Ge6hkYjyiKyjCZpxQWhkWAaeXUaGSjJ5xESp6qCLIOmVCaUp3Sk1JKa2mRUC/siKMO2Nl7HiSdDZPEMYJ8wSh0lykUuaJLEvI1UGiqVxV5ZGS6iS19XGzKo9UYnVETKdb3JwFUr2i8mROd5qHJBdR3Am4LLTyW9yWZk2t+NByewV6jhHKTRDragDNAvie0I/UTtCM2IeMTYiII3UcSnPzsPAeqNRaGSk7QsoMqiIgnZWTNLAdJ7RiMkekM+cGPaOMVTQj60OcpHZHAt1sVUQ8C/NkVN6qymOlf9uMJLNCdGqFhGwx7wbvKtXS7M5T0jI25k+OXjg5CyfnX0/O0urk8LkZptDKC8okKbUu07TMsj8k91PYCoLaSzp1aE/+64MPLezt1SK6fZlaglno6eldvGTpsr7lK1ZilQDoH1i9Zu3guvUbGsDGgU2bt2wdagxTvG37jp27Grv37OX1fSMjQ6Nj+3m9/8DB5qHDQbiV4ihWiU6z1jjFR46Gx45PnJg8SfGpgdNnzp5rnL/QmCXh4iUBkBtj+DIGcIGNcwK9yW3MT7vAORVMXtUa+8bWVsuSU63n7oWNBa7WNqR847NszD8sj7Sq8qVWwtz1Mr6Xn8DPknseYzx/xe5j6SvS6jO62OT1fKbq5rgZpdZ1Mk7nb329Nu+on8XUeOrrnsd0+ef6b/Xktb1zAsQ3U/fKr9dyxIeub26Wrrdt4zYsr50Tr63robPX9WrX96JdPydtU/O8TfFlMdfvqZ/Rb3DNE+Pn8l5V+uu1nFPHFQFwVcDxNQeOrztwfMMBuCkAbgmA2wLgjgC4KwDuCegvkoA+PwKgIwAeCICHAuCRAHgsAJ4IgKcCYEoAPBMAzwXACwHwUkBfLgHwWgC8EQBvBcA7AfBeAHwQAB8FwCcB8FmAeaH65C7mT+73RVjA3+Jn73+n3DCP6ybt3W26vtH1g2OS9wu8aqmc',
+'UY': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'UZ': 'eNq10UtOwzAQxvE/SaFxgVIK5VEehfIKEpUAqTFhg7gAFwjdsWGNuoLehaNwFG4C41T6RHZUiJ8045E9tqJMGgNp29K4bunx6dVf5JNxw+oi8/nINm4mlaNuuHB3mxVX18PQ8eaLy0GWj85DQ7W1aXVup0M/KF+y48i2Hu7/Y0nDUqbnOUsvnyH/EJXiWjS/QF0gcS6xcIkDN5WEulFKLCrPLC4JLAs0BVak+g0tgVWBtsCawLpAR2BDYFNgS2BboCuwI7ArsCewL9ATOBA4FOgLHAkcC5wInAqcCTObjrsWxv0+49WPr5i/6vwibCrYn8NbfANB4Eo7',
+'VA': 'eNqt0jkSgkAQheFWUBT3fd8yMjHQwtALeAJDE2OLyCL3TEbeTF+DvhqJCPyr6OGjYJLBs0TEa2OERYzT+bbxo9DBrb8Dgsh87MaPd/sA3kahfnpcH7jmdf3z8tnbU8bjksO4PnSa5a1vtkghrohLvigkMHJKZQa6cRVcqZ2rP6oxoM5MNFIbSJMBLWagregwoMuAHgP6DBgwYMiAEQPGDJgwYMqAGQPmDFgwYMmAFZPMJQdp60HeM7z+fFk/9uV/6U+hf7se2hu3kzV6',
+'VC': 'eNrNlMlv00AYxV9XylIIYYcWMJQSQw1OvMRpgVL2HQpFHNKISy+cUcWByZ+J+Gc48D7beZqUG6gSP2lm3nyrxh67NQWg1eS0O8dpe+d7d6UdD3eXzby+2i1SV3CNY5fnrtt1RRG6XhyH/U7UGzA6H47nbXLDJKZ0mJBwzfs5Q113e8cV/TjqpFE+CJ1FJIXLaEnyqBi4gv5eP27Tl2WZy+lknZCF0+HubNXCGqypQVmirDhgnTQbML8TZVbA2ldtLSChJwn/LLVIWR/OOo7O5x3NC56n5ME95yQtbzb+dmnZUk5fJjh9/WUvwmOyYmp6ZhYHBKTnqA+aOHT4yDz1US/G41hDADYfr3Vzj71xwtONpqdtI80NcNLL9TklTJ8+c/bc+QsLC6YXa0xfrDF9qQa4LICg5ArHSF9dulbp5eB6ECy1TIc3gpu0rJT2qIobxQfBLU+b/bYAYgG0BdARQCJGOvU1AVJRarOWMbzASVZmVDFZZh7Tmbm8OrYv47OxXqn0uL2uqRDqXPC7ELzYgvdWAKsCWBPAHQHcFcA9AawL4L4ANgTwQAAPBfBIAI8F8EQATwXwTADPBfBCAC8F8EoArwW/NAG8FcA7AWwK4L0APghgS2BfqH4F0/Yr2Jr4x1p7/yX/KTP7MD7y2X3i+MzxjeMnxw+z8ZH8BmX97K4=',
+'VE': 'eNq1001T01AUxvE/Ka+B8q4NL6KCQqtUktC0DSqI6IwrdoyLkHHDxrXTYUH6Of0yLjy3xccwsGLgN70355zmnttJb+oVoL5oU2/SpvOLq85uFPZ7M5ZkcSvpprnV0v7Nb1O36OggthHFxX7WSjrNNC+ypJtn0SBqtTu2sEgtbeeNIgmzMMobrkG/Nz5s5RrVLGy5LrZXs5sXsS284za3eTcM76yn/+qeJafH973U3WUw/Ryx6dc392BKPK/ijY553vjEJFMC/rQ/U52tVmfnLJ5f8Idg0fcVL5Xi5VJc8uSpQE1cHJRiywL7BBCI1W/H1/ev1Fac67WWDepB8L//ammvtVJcti7wTGBD4LnAC4GXApsCWwKvBF4LbAvsiP1NAg2BNwJvBXYFmgLvBPYEQoFIIBbYFzvBAolAW6AjdpTFjq/AgcB7gQ8CHwUOBY4EPgkcC3wWOBH4IvBVeDDD12rUvVbBCI/jT4XHNvZA48yewXcbP2xc2vjtcvv5fwGJuZ1A',
+'VG': 'eNrN08tu00AUBuC/SVsKtBDCPVCYcikxNI6b2BO7QNNCW+6wQiyCxYYNaxSxYPJuvATiZbroObb7M+mSqhKfNON/JjNHGcvTrgNoN6UbL0j3+evPwdp6NBmv6vRwo5fGLpVnFDlr3WDg0jRwWRQFo14ny2W1nUzv25SBbJIturuXOY2xddkoTvKgqJX0nJVRlgeBbIsnLs7sKOokWq4/CcbzZT2tNvSr9SNZ1c/LisUGZ1OXZYFLdBjnXjlb/rsj5ZYlVqdJkr8H8s7iLV6SKCf1fqzJzPvtf3209VF032ak+/5L37ynVqvX1OzcPE4RmBckn9Zw5uzikuRz3hrP+QYB2l+ocvPIfOOilxtNL+uAWQbAJW+v7zJpvnL12vVW60ZL882K5uWK5lsV4DYBxqyYEnDHGGbt75p7xtwv86o3768xD9pFDgh4SMAjAtYI6JCXQ6ArDue7hXBqTbfKYRjJoFrDOuFUzTAsa66TfNME9AmICUgIsAQM6HC+zCnJd0vABgGPCXhCwFMCNgkYErBFwDYBzwh4TsAOAbsE7BHwgoCXBLwi4DUBbwh4S8A7kptGwAfCiSiv86xe562ZY9bar+N/M3cC7aO8p0/Svkj7Ie2PtN86J8c/AAgj1W8=',
+'VI': 'eNrN08tOwkAUBuDfFhEvKKJ4xwveWgUdam+YGOMLuHMF7Ni4Nqwo8bV8Ed/BhzDRM239nYUriYlfcmb+mZ5OSJg6NgCnKsOwJENvMIqabTUe3sjiylfO7XXY9Tt9L4m67ajfG7jS4Y8T2Y+llErCMImiJI7dpKOU2/VaHekaheN/flwxO04fVpeYtwfB9xs/N5clylHGQ0t27u9+Ozl6SofHKRmeXnQ0WJZlS1mF6SJmCGku5XlWT3PzC2XJi0aPYalCwLKRq0ZOpxUjV6pG1gtmWQCrxrumGn3ltfUsb+R03szpvJUDtinLO+kguZ5u1vX+LgF7BOwTcEA6N5gbBBwScETAMQEnBJyS/GUEuAScEXBOQJOAFgEXBFwSoAhoE+CRfAEE+AQEBIQERCQXnuQ+EyaSXeOCvsZvmNC7jb9Sm6Ae5CN9lvqQetVZfuYnOiCiqg==',
+'VN': 'eNrV1dlSE0EUxvE/BARFgzrGHTW4ESWayTqDC6Ii7rgh6hBxwfXWorhw8ho+he/hI/gyXnh6MvlILPXCsqzyV9XLOX2m0zXJTCYywMR261aHrVta+diY9Eut1Z0WBBbVJoNWHPnFRthM1sJWb90nd/n0VNlaVCrXXF3sRyU/sDGqVIOmzZuFuJKs+5V60eXLtTQdWcHSSlxrryZJW7WaQlxPcsVqvRg041q7vNH+lORDIj/du+DO0orrYXLaeisOSm6mc4bJOcfb57Si2HfntbEeVdxpgiAOw3SXzjVBcs2IBX5QcttVbeOfLIbri/0W357502HCDUn3rs+6DwOD9OjPDAxuGBreuGlkM1sEstnRbDa7NbvNvkFvh5fLeZ6X82xufdYFybwDkgKvK+9i+669NO+u3bW7A/ZIz3H27hPYLzAmSV7zA2nFmNUc7JRb/pBAPt9O5/Prc7fnuMBhgSMCR6X3vh0TOC52qwUKXfkTXfOTApMCRYFTAqcFSmK/EoGyQEWgKlATqAs0xB5NgVBgSuCMwFmBcwLnBaYFLgjMCFwUuCRwWWBW4IrAnMBVgWsC1wVuCNwUuCX25AjMC9wRuCtwT+C+wAOBBYGHAosCjwQeCzyR3nkk9goRaAo8FVgWeCbwXOCF9O7zUmBF4JXAa4E3Am/F3kTSW/9efr3n39J+JQ64V+LnPv6dbxn+B/1pcwZ/0+yfglFrQ2k8a/dyLm1f3JhZj+e71hasLabtqxutbjmN3bjWVbP2Q813h/xXQQ==',
+'VU': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'WF': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'WS': 'eNqt08lSwkAQxvG/AQQNiuK+4L4EJRYiBPRi+QLeLA/AjYtnK+VB8ma+h4+jHUN9lVR5cflVuqcz05NLZrwc4FUthUVLg9Frp9GNwrLV/ZbfG9pEuxFEmcVavOX2xtY7tj4O+pf+9XDcazcHo7r1XKk7iLtXku6gOe72Wx2/O0y62lFYmHRFYcmqXrOZbHbs5f7ufwYvHr7S05Sl53ZcpjhOzuQL006RksCMwGyqdt2yPWVLMOe67rwby3yysiCwKFAVWBJYFlhJza+m6rQ1gXWBDYFNgS2BbYGawI7ArsCewL7AgcChwJHAscCJwKlk5z2BusCZwLlAQ7K1L9n5C+HHkiOUj4/QG3/0kfv11vjGVCyK38SDxaPFy2R8n4zx/bOTQtfC/iif3TZhVQ==',
+'YE': 'eNq108tOAkEQheHfAURlEMX7/a6goMIAg26MOxfGFxjYsXFtWAnv5sL30upBD5BoYkL8ku46VaRnSGgKCaCQt62btq3VeW2Ubvpd33JUKYfteNDsDz+0/OCO3N1WbIWtTi+qlhvNdrFXHYReEFWDutWa9a7W3bzda0RB3IZRtRYfsMfV+93U4MH2zoylMKoE8UvDftez/un+P0rBlXh7nrLt5dHFEV4imZpOz8x63hwZAd/POvNZX9n/zhb84Xw0WxNnfzjPZXPW5FwesbAokBdYElgWWJHx778qsCawLrAhsCmwJbAtsCOwK7AnsC9wIHAocCRwLHAicCpwJvaTCRQFzgUuZDyXBMoClwJXMp6vhT8ZXK2ku1rvTO7tIzHR+dQvy/2nc181/cPMbiF24whsfQLvymiZ',
+'YT': 'eNrF0klOw0AQheGfdkJMgABhnmcwQyAKkbF3cAF2iEVAbNiwRhYL5LtxC44DZYc8dbaAxCdV9WuX2rLkjgIgalrLqtbun97SPKtb6nXi5MG2Se4NGpY6cRr32q1uMez6w9BSfJHaJvYf1ywlbcuXeeYs31z/zRIVS9meR6y9XBXR41zgnKu4qhulJhCWxqzKXO/vYTwcGHrNxKRAQ7w85eVpmJHh72kKzMogz5V5XmBBYFFgSWC58J1XBFYF1gTWBTYENgW2BLYFdgR2BfYE9gUOBA7FfpnAkcCxwInAqUBL4EzgXPiV/nWqFNfp/SfnPwP+y63VndWj1avVh9UXtsVUZQ==',
+'ZA': 'eNrN08lOAkEQxvG/IG6A+77v4oIOAjODG2piPOnVAxIvXjwb40F8PJ/B17Gakc9RE0+a+CPVXV1d3YRlckkgN2jDQ6cN17dP4Vbl+SEV5ZbFq9uut7pXqHn5sN7YrRXypcCSoiV+pd4oXd82yrVCseTb9rodCuIXTUeHA3fKD609tKwcWPat1b1n6H2tZlzVt0OVuhX8+FZXc8uLyglbXJ60pi+3BtGtn3uiKeem5nDXZsP9svtqYhLJ9lRHZ6KrO9FDWiDTYnm6Oac/8uYq1pNxdbf/3p81aXtlodfl2b5+l8cMDAoMCQwLjAiMjrXAuHz+LBMCkwJTAtMCMwKzAnMC8wILAosCSwLLAisCqwJrYj+NwLrAhsCmwJZAXmBbYEfAEygI7AoUBUoCZQFfIBD77wlUBPYE9gUOBA4FjgSqAscCJwKnwp+IHpl298hk2n7pTi/Jf5L6Ia7O4Mbi0eLV4urC4tzWL/AGi+iYDw==',
+'ZM': 'eNrF0stOwkAUxvG/BbQi3vCO93tRUSCCrRvj3rgzLCpx48a1IS6Et/MdfBw9U8hHdakm/pJzzjczTdOkE2SAoGitk7N2//ga9Tp5S3E9jNq2DHupg4Klei2uVUJ31EwflSxFwdVlo9FtxueVqN29SEb5+4O+pbBa7W97tri9/psRuJG0pxFrzzcupnhexnOyuVHGBPxxfwDy/jAnY6JQcDllckpgWizPDFieTe87xWEuJr5+25zAvMCCwKLAksCywIpASWBVYE1gXWBDYFNgS2BbYEdgV2BPYF/gQOBQ7JcJlAWOBI4FTgQqAqcCZwJV4Vf6VyvrrtbbT9/xkeG/3Fm1rB6s3q1erD4Bgs9bKA==',
+'ZW': 'eNrd1md3G1UQxvE/dpwEgi1IMClEBBKKhSKj7SsbUEIvoQZsYCOq6b2YlhWh99577/CSD5CPxtyV/EjLiTnJ4Q2Hn3xXs3fnzo6uLFtTo8DUWjssrrbDnoW9wXav2V2M7cSfas9kTc8Po6TR6hSX0m4eF0HcreWZFzSS4kLoLqTuStot15k8zMq3Z7wssBK5q9jMwqhja2M7zfzUwrDVSdt5lGZ+0MmTzA/tUmrFw9jW1PLALbIEL2nnQZa4FdZS7FK9KG653CBxiVHRr+s194q8MA2KSVuY1mp57ArlfpoHNuG6yOK0UyS20nYtT8O01n9tuWW6Xv0kj9xtgihJixv5kWsoC+wkyryG6zTOPD9upJ1asQ+2tniRedJ0E1G/WLhnIW9lvtKS7uJYb5ta3cU1FrmbJG4r7cqInV+289CfVvYqum3fZmEaFxvv+bbRfh408zB0WxUn9npbro34wLeack/F4S5783hks3tDh4yMrhhbuWr14UesOZJxgYmJiUoPHHX02vF1x0weu34dbNhY2WSTx22uwvEClU3V6pYTqkV+pXrixq1bq9XqBquzzR4TblDUP2n85H79/tKJUjunnCrWtkBN4DRTr7sjbBdoNOoNM11vDOZPt/lmn9e0j4FAMF0vHtPTttYC91OvD+4V1hSH7r5RTxxH1ltsbcV2iIs+izMXRwKxDOaTaFAzHNSMipqF1B7QEljakRnbk9kzzjyrPTs7u2Nn+X08W+AcgXMFzhM4X+ACgQsFLhK4WOAScfGuXUvxpWK/eQKXC1whcKUU81ctzfeb373b+r9a4BqBObF4fn4Qzw3i+eGcuaUrRWyhWzRUZx6uFbhO4HqBTOzjKdARuEHgRoGbBG4WuEXgVoEFgdsEbhe4Q+BOsU+7wN0C9wjcK3CfwP0CDwg8KPCQwMNif2AEHhX7hyTL5z8m8LjAEwJPSrmf4fmnBPYK5AJdgacF9gk8I/CswHMCzwu8IOX5F6Wc85LAywKvCLwq8JqU49cF3hB4U+AtgbcF3hF4V+A9gfcFPhD4UOAjKed/LPCJwKcCnwl8LvCFwJcCX0k5/lrgGynPfyvlmt8JfC/wg8CPAj8J/Czwi5TjX6Uc/ybl/N/l4Gr+Ifwrva8KK9xXhT9H+M/a3x7Ffef6P4xVNir954OJh+eGxz/VrRyg1nLXxpeps9ya4fhQ1i63btLG+v7Y8reR2Kj2c9wY22HrbVRsjLt4P/wF+NkoWg==',
+}
@@ -0,0 +1,309 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A generation of phone number metadata.
+
+A generation holds everything PhoneNumberUtil derives from one release of the
+metadata: where the metadata is read from, the country calling code mapping,
+the regions loaded so far and the strings and patterns they share. A
+PhoneNumberUtil uses a single generation at a time and can replace it with a
+new one without being recreated (see PhoneNumberUtil.reload()).
+"""
+
+import threading
+
+from phonenumbers import buildconstants
+from phonenumbers import compiledmetadata
+from phonenumbers import countrycodeindex
+from phonenumbers import dfacompiler
+from phonenumbers import metadatasource
+from phonenumbers import patternpool
+from phonenumbers import regionregistry
+
+
+# The country calling code shared by the NANPA regions.
+_NANPA_COUNTRY_CODE = 1
+
+
+class UnknownRegionError(LookupError):
+    """Raised when asked for the metadata of a region there is none for."""
+    pass
+
+
+class MetadataGeneration(object):
+    """The metadata of one release, loaded lazily region by region.
+
+    Attributes:
+        version: number identifying the generation; each reload of a
+            PhoneNumberUtil increments it.
+        file_prefix: prefix of the per-region metadata files (and of the
+            metadata bundle, if one was built), or None.
+        metadata_module: generated metadata module (see metadataarray.py)
+            read in preference to any metadata files, or None.
+        source: the MetadataSource the metadata of each region is read from;
+            unless given, the default source for file_prefix and
+            metadata_module (see metadatasource.get_default_source()).
+        dfa_module: generated DFA module (see dfacompiler.py) whose DFAs the
+            number descriptions of each region are matched with, or None to
+            match them with re.
+        regex_engine: the regexengine.RegexEngine the patterns of the pattern
+            pool are compiled with.
+        country_code_to_region_code_map: mapping from country calling code to
+            region codes.
+        supported_countries: the region codes there is metadata for.
+        region_registry: the RegionRegistry of the supported countries, whose
+            region IDs index the per-region tables of the generation.
+        nanpa_countries: the region codes of the NANPA countries.
+        region_codes_by_country_code: tuple of the region codes for each
+            country calling code (see countrycodeindex.py).
+        country_code_by_region_code: mapping from region code to country
+            calling code.
+        pattern_pool: the strings and compiled patterns shared by the metadata
+            of the loaded regions.
+    """
+
+    def __init__(self, version, file_prefix=None,
+                 country_code_to_region_code_map=None, metadata_module=None,
+                 source=None, dfa_module=None, regex_engine=None):
+        if (country_code_to_region_code_map is None and
+            metadata_module is not None):
+            country_code_to_region_code_map = \
+                    metadata_module.country_code_to_region_code_map
+        if country_code_to_region_code_map is None:
+            raise ValueError("a country code to region code mapping is "
+                             "needed unless a metadata module is given")
+        self.version = version
+        self.file_prefix = file_prefix
+        self.metadata_module = metadata_module
+        if source is None:
+            source = metadatasource.get_default_source(file_prefix,
+                                                       metadata_module)
+        self.source = source
+        self.dfa_module = dfa_module
+        self.country_code_to_region_code_map = country_code_to_region_code_map
+        supported_countries = []
+        for region_codes in country_code_to_region_code_map.values():
+            supported_countries.extend(region_codes)
+        # The index every lookup is checked against before any loading.
+        self.region_registry = regionregistry.RegionRegistry(
+                supported_countries)
+        self.supported_countries = list(self.region_registry.region_codes)
+        # Metadata built with a BuildProfile may have no NANPA regions.
+        self.nanpa_countries = country_code_to_region_code_map.get(
+                _NANPA_COUNTRY_CODE, [])
+        self._nanpa_country_set = frozenset(self.nanpa_countries)
+        # Generated metadata modules carry both tables ready-made.
+        if (metadata_module is not None and
+            country_code_to_region_code_map is
+                metadata_module.country_code_to_region_code_map):
+            self.region_codes_by_country_code = getattr(metadata_module,
+                    buildconstants.REGION_CODES_BY_COUNTRY_CODE_NAME)
+            self.country_code_by_region_code = getattr(metadata_module,
+                    buildconstants.COUNTRY_CODE_BY_REGION_CODE_NAME)
+        else:
+            self.region_codes_by_country_code = \
+                    countrycodeindex.build_region_codes_by_country_code(
+                            country_code_to_region_code_map)
+            self.country_code_by_region_code = \
+                    countrycodeindex.build_country_code_by_region_code(
+                            country_code_to_region_code_map)
+        self._country_code_by_region_id = [
+                self.country_code_by_region_code[region_code]
+                for region_code in self.region_registry.region_codes]
+        self.pattern_pool = patternpool.PatternPool(regex_engine)
+        self.regex_engine = self.pattern_pool.engine
+        # The metadata of each region by region ID, None until loaded.
+        self._metadata_by_region_id = self.region_registry.new_table()
+        # The CompiledPhoneMetadata of each region by region ID, None until
+        # first needed.
+        self._compiled_metadata_by_region_id = \
+                self.region_registry.new_table()
+        self._metadata_lock = threading.Lock()
+        # Whether each supported region's metadata turned out to be missing,
+        # as for those left out of a build with a BuildProfile, by region ID.
+        # Recorded so that the failed lookup is not retried.
+        self._unavailable_by_region_id = self.region_registry.new_table(False)
+        # The number of calls using the generation (see pin()), whether it
+        # has been replaced and whether its source has been closed, guarded
+        # by _pin_lock.
+        self._pin_lock = threading.Lock()
+        self._pin_count = 0
+        self._retired = False
+        self._closed = False
+
+    def pin(self):
+        """Registers a call about to use the generation, so that retire()
+        leaves its source open until the call calls unpin().
+
+        Returns:
+            whether the generation was pinned; False if it was retired and
+            its source closed already, as it should then no longer be used.
+        """
+        self._pin_lock.acquire()
+        try:
+            if self._closed:
+                return False
+            self._pin_count += 1
+            return True
+        finally:
+            self._pin_lock.release()
+
+    def unpin(self):
+        """Ends a call registered by pin(), closing the source if the
+        generation was retired and no other call uses it."""
+        self._pin_lock.acquire()
+        try:
+            self._pin_count -= 1
+            close = self._retired and not self._pin_count
+            if close:
+                self._closed = True
+        finally:
+            self._pin_lock.release()
+        if close:
+            self.source.close()
+
+    def retire(self):
+        """Marks the generation as replaced, closing its source, such as a
+        memory-mapped bundle, as soon as no pinned call uses it."""
+        self._pin_lock.acquire()
+        try:
+            self._retired = True
+            close = not self._pin_count and not self._closed
+            if close:
+                self._closed = True
+        finally:
+            self._pin_lock.release()
+        if close:
+            self.source.close()
+
+    def is_supported_region(self, region_code):
+        """Returns whether there is metadata for an upper-case region code,
+        without loading it."""
+        region_id = self.region_registry.get_region_id(region_code)
+        return (region_id is not None and
+                not self._unavailable_by_region_id[region_id])
+
+    def compile_all(self):
+        """Compiles every pattern of the pool. Every supported region must
+        already be loaded, or known to have no metadata.
+
+        Raises:
+            ValueError: some supported region is not loaded yet.
+        """
+        missing_regions = [
+                self.region_registry.get_region_code(region_id)
+                for region_id, metadata in
+                enumerate(self._metadata_by_region_id)
+                if metadata is None and
+                not self._unavailable_by_region_id[region_id]]
+        if missing_regions:
+            raise ValueError("regions not loaded: %s" %
+                             ", ".join(missing_regions))
+        self.pattern_pool.compile_all()
+
+    def get_region_codes_for_country_code(self, country_code):
+        """Returns the region codes for a country calling code, main country
+        first, or None if there are none."""
+        return countrycodeindex.get_region_codes_for_country_code(
+                self.region_codes_by_country_code, country_code)
+
+    def get_country_code_for_region(self, region_code):
+        """Returns the country calling code for an upper-case region code, or
+        0 if it is not supported."""
+        region_id = self.region_registry.get_region_id(region_code)
+        if region_id is None or self._unavailable_by_region_id[region_id]:
+            return 0
+        return self._country_code_by_region_id[region_id]
+
+    def is_nanpa_country(self, region_code):
+        """Returns whether an upper-case region code is one of the NANPA
+        countries."""
+        return region_code in self._nanpa_country_set
+
+    def get_metadata_for_region(self, region_code):
+        """Returns the metadata for an upper-case region code, loading it on
+        first use.
+
+        Raises:
+            UnknownRegionError: there is no metadata for region_code.
+        """
+        metadata = self.find_metadata_for_region(region_code)
+        if metadata is None:
+            raise UnknownRegionError(region_code)
+        return metadata
+
+    def find_metadata_for_region(self, region_code):
+        """Returns the metadata for an upper-case region code, loading it on
+        first use, or None if there is no metadata for region_code.
+
+        Region codes missing from the calling code mapping are answered
+        without any file access.
+        """
+        region_id = self.region_registry.get_region_id(region_code)
+        if region_id is None:
+            return None
+        metadata = self._metadata_by_region_id[region_id]
+        if metadata is None and not self._unavailable_by_region_id[region_id]:
+            metadata = self._load_metadata_for_region(region_id)
+        return metadata
+
+    def get_compiled_metadata_for_region(self, region_code):
+        """Returns the CompiledPhoneMetadata for an upper-case region code,
+        building it on first use.
+
+        Raises:
+            UnknownRegionError: there is no metadata for region_code.
+        """
+        region_id = self.region_registry.get_region_id(region_code)
+        if region_id is not None:
+            compiled_metadata = self._compiled_metadata_by_region_id[region_id]
+            if compiled_metadata is not None:
+                return compiled_metadata
+        compiled_metadata = compiledmetadata.CompiledPhoneMetadata(
+                self.get_metadata_for_region(region_code), self.pattern_pool,
+                self._get_number_desc_dfa(region_code))
+        self._metadata_lock.acquire()
+        try:
+            if self._compiled_metadata_by_region_id[region_id] is None:
+                self._compiled_metadata_by_region_id[region_id] = \
+                        compiled_metadata
+            return self._compiled_metadata_by_region_id[region_id]
+        finally:
+            self._metadata_lock.release()
+
+    def _get_number_desc_dfa(self, region_code):
+        if self.dfa_module is None:
+            return None
+        data = getattr(self.dfa_module,
+                       buildconstants.NUMBER_DESC_DFAS_NAME).get(region_code)
+        if data is None:
+            return None
+        return dfacompiler.dfa_from_string(data)
+
+    def _load_metadata_for_region(self, region_id):
+        metadata = self.source.load_metadata(
+                self.region_registry.get_region_code(region_id))
+        if metadata is None:
+            self._unavailable_by_region_id[region_id] = True
+            return None
+        self.pattern_pool.add_metadata(metadata)
+        # Another thread may have loaded the region meanwhile; keep whichever
+        # copy was stored first.
+        self._metadata_lock.acquire()
+        try:
+            if self._metadata_by_region_id[region_id] is None:
+                self._metadata_by_region_id[region_id] = metadata
+            return self._metadata_by_region_id[region_id]
+        finally:
+            self._metadata_lock.release()
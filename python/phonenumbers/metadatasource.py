@@ -0,0 +1,246 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sources of phone number metadata.
+
+A MetadataGeneration reads the metadata of each region, when it is first
+needed, from a MetadataSource. The sources provided read:
+
+    DirectorySource: one metadata file per region, named by a file prefix.
+    BundleSource: a memory-mapped bundle file (see metadatabundle.py).
+    ModuleSource: a generated metadata module (see metadataarray.py).
+    DictSource: PhoneMetadata instances already in memory.
+    ZipSource: the per-region files or the bundle, stored in a zip file.
+    PackageResourceSource: the same, as resources of an installed package,
+        wherever its loader finds them; this includes packages imported from
+        a zip file, such as a zipapp.
+
+A ChainedSource tries several sources in turn.
+"""
+
+import os.path
+import pkgutil
+import threading
+import zipfile
+
+from phonenumbers import buildconstants
+from phonenumbers import metadataarray
+from phonenumbers import metadatabundle
+from phonenumbers import phonemetadata_pb2
+
+
+def _parse_metadata_file(data):
+    # Each metadata file holds a PhoneMetadataCollection of one region.
+    metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    metadata_collection.ParseFromString(data)
+    return metadata_collection.metadata[0]
+
+
+class MetadataSource(object):
+    """Interface of the sources of metadata."""
+
+    def load_metadata(self, region_code):
+        """Returns the PhoneMetadata for an upper-case region code, or None if
+        the source has no metadata for it."""
+        raise NotImplementedError
+
+    def reopen(self):
+        """Returns a source reading the same metadata afresh, as used when
+        reloading metadata that may have been updated."""
+        return self
+
+    def close(self):
+        """Releases any file or mapping held by the source."""
+        pass
+
+
+class DirectorySource(MetadataSource):
+    """Reads the per-region metadata files named file_prefix + "_" + region
+    code."""
+
+    def __init__(self, file_prefix):
+        self.file_prefix = file_prefix
+
+    def load_metadata(self, region_code):
+        try:
+            f = open(self.file_prefix + "_" + region_code, "rb")
+        except IOError:
+            return None
+        try:
+            return _parse_metadata_file(f.read())
+        finally:
+            f.close()
+
+    def reopen(self):
+        return DirectorySource(self.file_prefix)
+
+
+class BundleSource(MetadataSource):
+    """Reads a memory-mapped metadata bundle file."""
+
+    def __init__(self, bundle_file_name):
+        self.bundle_file_name = bundle_file_name
+        self._bundle = metadatabundle.MetadataBundle(bundle_file_name)
+
+    def load_metadata(self, region_code):
+        return self._bundle.load_metadata(region_code)
+
+    def reopen(self):
+        return BundleSource(self.bundle_file_name)
+
+    def close(self):
+        self._bundle.close()
+
+
+class ModuleSource(MetadataSource):
+    """Reads a metadata module generated by buildmetadataprotofromxml.py."""
+
+    def __init__(self, metadata_module):
+        self.metadata_module = metadata_module
+
+    def load_metadata(self, region_code):
+        metadata_array = \
+                self.metadata_module.country_to_metadata.get(region_code)
+        if metadata_array is None:
+            return None
+        return metadataarray.array_to_metadata(metadata_array)
+
+
+class DictSource(MetadataSource):
+    """Serves a dict mapping region codes to PhoneMetadata instances.
+
+    A copy of the metadata is returned, so that the dict is left as it is by
+    the interning of strings done when metadata is loaded.
+    """
+
+    def __init__(self, metadata_by_region_code):
+        self.metadata_by_region_code = metadata_by_region_code
+
+    def load_metadata(self, region_code):
+        metadata = self.metadata_by_region_code.get(region_code)
+        if metadata is None:
+            return None
+        metadata_copy = phonemetadata_pb2.PhoneMetadata()
+        metadata_copy.CopyFrom(metadata)
+        return metadata_copy
+
+
+class ZipSource(MetadataSource):
+    """Reads metadata stored in a zip file, under the same names as in a
+    directory: the bundle, file_prefix + ".bundle", is read in a single
+    access if present, and otherwise the per-region files."""
+
+    def __init__(self, zip_file_name, file_prefix):
+        self.zip_file_name = zip_file_name
+        self.file_prefix = file_prefix
+        self._lock = threading.Lock()
+        self._zip_file = zipfile.ZipFile(zip_file_name)
+        self._bundle = None
+        bundle_name = file_prefix + buildconstants.META_DATA_BUNDLE_SUFFIX
+        if bundle_name in self._zip_file.namelist():
+            self._bundle = metadatabundle.MetadataBundle(
+                    os.path.join(zip_file_name, bundle_name),
+                    self._zip_file.read(bundle_name))
+
+    def load_metadata(self, region_code):
+        if self._bundle is not None:
+            return self._bundle.load_metadata(region_code)
+        self._lock.acquire()
+        try:
+            data = self._zip_file.read(self.file_prefix + "_" + region_code)
+        except KeyError:
+            return None
+        finally:
+            self._lock.release()
+        return _parse_metadata_file(data)
+
+    def reopen(self):
+        return ZipSource(self.zip_file_name, self.file_prefix)
+
+    def close(self):
+        self._zip_file.close()
+
+
+class PackageResourceSource(MetadataSource):
+    """Reads metadata stored as resources of a package, through
+    pkgutil.get_data(), so that it works whether the package is installed in
+    a directory or imported from a zip file. The bundle, resource_prefix +
+    ".bundle", is read in a single access if present, and otherwise the
+    per-region resources."""
+
+    def __init__(self, package, resource_prefix):
+        self.package = package
+        self.resource_prefix = resource_prefix
+        self._bundle = None
+        bundle_resource = \
+                resource_prefix + buildconstants.META_DATA_BUNDLE_SUFFIX
+        data = self._get_data(bundle_resource)
+        if data is not None:
+            self._bundle = metadatabundle.MetadataBundle(
+                    "%s:%s" % (package, bundle_resource), data)
+
+    def _get_data(self, resource):
+        try:
+            return pkgutil.get_data(self.package, resource)
+        except IOError:
+            return None
+
+    def load_metadata(self, region_code):
+        if self._bundle is not None:
+            return self._bundle.load_metadata(region_code)
+        data = self._get_data(self.resource_prefix + "_" + region_code)
+        if data is None:
+            return None
+        return _parse_metadata_file(data)
+
+    def reopen(self):
+        return PackageResourceSource(self.package, self.resource_prefix)
+
+
+class ChainedSource(MetadataSource):
+    """Reads the metadata for each region from the first of several sources
+    that has it."""
+
+    def __init__(self, sources):
+        self.sources = list(sources)
+
+    def load_metadata(self, region_code):
+        for source in self.sources:
+            metadata = source.load_metadata(region_code)
+            if metadata is not None:
+                return metadata
+        return None
+
+    def reopen(self):
+        return ChainedSource([source.reopen() for source in self.sources])
+
+    def close(self):
+        for source in self.sources:
+            source.close()
+
+
+def get_default_source(file_prefix=None, metadata_module=None):
+    """Returns the source PhoneNumberUtil.get_instance() reads from when given
+    a file prefix and/or a metadata module: the module first, then the bundle
+    next to the metadata files if one was built, then the files."""
+    sources = []
+    if metadata_module is not None:
+        sources.append(ModuleSource(metadata_module))
+    if file_prefix is not None:
+        bundle_file_name = \
+                file_prefix + buildconstants.META_DATA_BUNDLE_SUFFIX
+        if os.path.exists(bundle_file_name):
+            sources.append(BundleSource(bundle_file_name))
+        sources.append(DirectorySource(file_prefix))
+    return ChainedSource(sources)
@@ -0,0 +1,256 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sharing of metadata strings and compiled patterns across regions.
+
+Many regions carry identical strings in their metadata, such as "NA" for
+number types they do not have, "\\d{7,10}" as a possible number pattern or
+"$1 $2 $3" as a format. A PatternPool interns these as each region is loaded,
+so every region refers to one copy of each string, and compiles each unique
+regular expression at most once for all regions.
+"""
+
+import threading
+
+from phonenumbers import dfacompiler
+from phonenumbers import regexengine
+
+
+# The PhoneNumberDesc fields of PhoneMetadata.
+NUMBER_DESC_FIELDS = (
+    "general_desc",
+    "fixed_line",
+    "mobile",
+    "toll_free",
+    "premium_rate",
+    "shared_cost",
+    "personal_number",
+    "voip",
+    "pager",
+)
+
+_NUMBER_DESC_PATTERN_FIELDS = (
+    "national_number_pattern",
+    "possible_number_pattern",
+)
+
+# The longest numbers whose lengths possible length masks tell; numbers of
+# descriptions that match longer ones may have any length.
+_MAX_POSSIBLE_LENGTH = 32
+
+# The possible length mask of descriptions whose numbers may have any length.
+ANY_LENGTH_MASK = -1
+
+_NUMBER_FORMAT_STRING_FIELDS = (
+    "format",
+    "national_prefix_formatting_rule",
+    "domestic_carrier_code_formatting_rule",
+)
+
+
+# Returns a regular expression that matches exactly the strings regex matches
+# in full, when used with match().
+anchor_regex = regexengine.anchor_regex
+
+
+def get_metadata_regexes(metadata):
+    """Yields every regular expression in the metadata for a region."""
+    for field_name in NUMBER_DESC_FIELDS:
+        number_desc = getattr(metadata, field_name)
+        for pattern_field_name in _NUMBER_DESC_PATTERN_FIELDS:
+            if number_desc.HasField(pattern_field_name):
+                yield getattr(number_desc, pattern_field_name)
+    for num_format in _get_number_formats(metadata):
+        yield num_format.pattern
+        for leading_digits_pattern in num_format.leading_digits_pattern:
+            yield leading_digits_pattern
+    yield metadata.international_prefix
+    if metadata.HasField("national_prefix_for_parsing"):
+        yield metadata.national_prefix_for_parsing
+
+
+def _get_number_formats(metadata):
+    return list(metadata.number_format) + list(metadata.intl_number_format)
+
+
+class PatternPool(object):
+    """Interned metadata strings and shared compiled patterns.
+
+    Only strings that come from metadata added to the pool are interned and
+    compiled, so the pool stays bounded by the size of the metadata. It is
+    safe to use from several threads.
+
+    Attributes:
+        engine: the regexengine.RegexEngine the patterns are compiled with.
+        telemetry: the regextelemetry.RegexTelemetry the compilations are
+            recorded into, or None.
+    """
+
+    def __init__(self, engine=None):
+        if engine is None:
+            engine = regexengine.DEFAULT_ENGINE
+        self.engine = engine
+        self.telemetry = None
+        self._lock = threading.Lock()
+        # Maps each string to its canonical copy.
+        self._strings = {}
+        # Maps each regular expression to its compiled pattern, or to None
+        # until the pattern is first needed.
+        self._patterns = {}
+        # Maps regular expressions to their compiled anchored forms (see
+        # anchor_regex()), compiled on first use.
+        self._anchored_patterns = {}
+        # Maps possible number patterns to their possible length masks (see
+        # get_possible_lengths_mask()), computed on first use.
+        self._possible_lengths_masks = {}
+        self._string_references = 0
+        self._pattern_references = 0
+
+    def add_metadata(self, metadata):
+        """Replaces the strings in metadata by their canonical copies and
+        registers its regular expressions with the pool."""
+        self._lock.acquire()
+        try:
+            for field_name in NUMBER_DESC_FIELDS:
+                number_desc = getattr(metadata, field_name)
+                for pattern_field_name in _NUMBER_DESC_PATTERN_FIELDS:
+                    if number_desc.HasField(pattern_field_name):
+                        setattr(number_desc, pattern_field_name,
+                                self._intern_pattern(getattr(
+                                        number_desc, pattern_field_name)))
+            for num_format in _get_number_formats(metadata):
+                num_format.pattern = self._intern_pattern(num_format.pattern)
+                leading_digits_patterns = num_format.leading_digits_pattern
+                for i in xrange(len(leading_digits_patterns)):
+                    leading_digits_patterns[i] = \
+                            self._intern_pattern(leading_digits_patterns[i])
+                for string_field_name in _NUMBER_FORMAT_STRING_FIELDS:
+                    if num_format.HasField(string_field_name):
+                        setattr(num_format, string_field_name,
+                                self._intern(getattr(num_format,
+                                                     string_field_name)))
+            metadata.international_prefix = \
+                    self._intern_pattern(metadata.international_prefix)
+            if metadata.HasField("national_prefix_for_parsing"):
+                metadata.national_prefix_for_parsing = self._intern_pattern(
+                        metadata.national_prefix_for_parsing)
+        finally:
+            self._lock.release()
+
+    def _intern(self, string):
+        self._string_references += 1
+        return self._strings.setdefault(string, string)
+
+    def _intern_pattern(self, regex):
+        self._pattern_references += 1
+        self._patterns.setdefault(regex, None)
+        return self._intern(regex)
+
+    def contains_regex(self, regex):
+        return regex in self._patterns
+
+    def get_pattern(self, regex, region_code=None):
+        """Returns the shared compiled pattern for regex, or None if regex
+        does not come from metadata in the pool.
+
+        Args:
+            region_code: the region the pattern is wanted for, which its
+                compilation, if it happens now, is recorded against.
+        """
+        pattern = self._patterns.get(regex)
+        if pattern is None and regex in self._patterns:
+            pattern = self.compile_unshared(regex, self.engine.compile,
+                                            region_code)
+            self._patterns[regex] = pattern
+        return pattern
+
+    def get_anchored_pattern(self, regex, region_code=None):
+        """Returns the shared compiled pattern that matches exactly the
+        strings regex matches in full, or None if regex does not come from
+        metadata in the pool. region_code is as for get_pattern()."""
+        pattern = self._anchored_patterns.get(regex)
+        if pattern is None and regex in self._patterns:
+            pattern = self.compile_unshared(regex,
+                                            self.engine.compile_anchored,
+                                            region_code)
+            self._anchored_patterns[regex] = pattern
+        return pattern
+
+    def compile_unshared(self, regex, compile_regex, region_code=None):
+        """Returns compile_regex(regex), recording the compilation into
+        telemetry if it is enabled; for the patterns of the pool and for
+        those built from them, such as the combined number type pattern,
+        which the pool does not hold."""
+        telemetry = self.telemetry
+        if telemetry is None:
+            return compile_regex(regex)
+        return telemetry.compile(regex, compile_regex, region_code)
+
+    def get_possible_lengths_mask(self, possible_number_regex):
+        """Returns the bitmask of the lengths of the numbers that
+        possible_number_regex matches in full, where bit n stands for length
+        n, so that a number of length n can only match if (mask >> n) & 1.
+
+        Returns:
+            the mask, or ANY_LENGTH_MASK if the lengths cannot be told, as for
+            patterns the DFA compiler does not support.
+        """
+        mask = self._possible_lengths_masks.get(possible_number_regex)
+        if mask is None:
+            mask = ANY_LENGTH_MASK
+            if possible_number_regex in self._patterns:
+                try:
+                    mask = dfacompiler.compile_dfa(
+                            possible_number_regex).get_match_lengths_mask(
+                                    _MAX_POSSIBLE_LENGTH)
+                except dfacompiler.UnsupportedPatternError:
+                    pass
+                if mask is None:
+                    mask = ANY_LENGTH_MASK
+            self._possible_lengths_masks[possible_number_regex] = mask
+        return mask
+
+    def compile_metadata(self, metadata):
+        """Compiles every regular expression in metadata, which must have been
+        added to the pool."""
+        for regex in get_metadata_regexes(metadata):
+            self.get_pattern(regex, metadata.id)
+
+    def compile_all(self):
+        """Compiles every regular expression in the pool."""
+        for regex in self._patterns.keys():
+            self.get_pattern(regex)
+
+    def get_stats(self):
+        """Returns a dict of counters describing the pool:
+
+            unique_strings: number of distinct strings interned.
+            string_references: number of metadata fields sharing them.
+            unique_patterns: number of distinct regular expressions.
+            pattern_references: number of metadata fields holding one.
+            compiled_patterns: number of regular expressions compiled so far.
+        """
+        self._lock.acquire()
+        try:
+            return {
+                "unique_strings": len(self._strings),
+                "string_references": self._string_references,
+                "unique_patterns": len(self._patterns),
+                "pattern_references": self._pattern_references,
+                "compiled_patterns": len([pattern for pattern in
+                                          self._patterns.values()
+                                          if pattern is not None]),
+            }
+        finally:
+            self._lock.release()
@@ -18,19 +18,34 @@ Functionality includes formatting, parsing and validation. (Based on the Java
 implementation.)
 """
 
+import collections
+import functools
+import gc
+import multiprocessing.pool
 import os.path
 import re
+import threading
+import time
 import cStringIO as StringIO
 
+from phonenumbers import compiledmetadata
 from phonenumbers import countrycodetoregioncodemap
+from phonenumbers import metadatageneration
+from phonenumbers import patternpool
 from phonenumbers import phonemetadata_pb2
 from phonenumbers import phonenumber_pb2
+from phonenumbers import regexengine
+from phonenumbers import regextelemetry
 
 
 class Error(Exception):
     pass
 
 
+# Raised by get_metadata_for_region() for a region there is no metadata for.
+UnknownRegionError = metadatageneration.UnknownRegionError
+
+
 class NumberParseError(Error):
     """Errors encountered when parsing phone numbers."""
     INVALID_COUNTRY_CODE = u"Invalid country code"
@@ -148,6 +163,78 @@ _ALPHA_MAPPINGS = {
 _ALL_NORMALIZATION_MAPPINGS = {}
 _ALL_NORMALIZATION_MAPPINGS.update(DIGIT_MAPPINGS)
 _ALL_NORMALIZATION_MAPPINGS.update(_ALPHA_MAPPINGS)
+
+# The only characters outside ASCII whose upper-case variant is an ASCII
+# letter: the dotless i and the long s.
+_NON_ASCII_ALPHA_VARIANTS = u"\u0131\u017F"
+
+# Code points below this are remembered by a _DeletingTranslateTable once
+# looked up, which bounds its size to a few megabytes whatever it is fed.
+_MAX_REMEMBERED_CODE_POINT = 0x10000
+
+
+class _DeletingTranslateTable(dict):
+    """A unicode.translate() table that deletes the characters it does not
+    map."""
+
+    def __missing__(self, code_point):
+        if code_point < _MAX_REMEMBERED_CODE_POINT:
+            self[code_point] = None
+        return None
+
+
+def _build_translate_table(normalization_replacements, remove_non_matches):
+    """Returns the unicode.translate() table that replaces each character
+    whose upper-case variant is a key of normalization_replacements with its
+    value, and deletes the other characters if remove_non_matches is true."""
+    if remove_non_matches:
+        table = _DeletingTranslateTable()
+    else:
+        table = {}
+    for character, replacement in normalization_replacements.items():
+        table[ord(character)] = replacement
+        table[ord(character.lower())] = replacement
+    for character in _NON_ASCII_ALPHA_VARIANTS:
+        replacement = normalization_replacements.get(character.upper())
+        if replacement is not None:
+            table[ord(character)] = replacement
+    return table
+
+# The tables _normalize_helper() translates numbers with.
+_DIGITS_ONLY_TABLE = _build_translate_table(DIGIT_MAPPINGS, True)
+_ALL_NORMALIZATION_TABLE = _build_translate_table(
+    _ALL_NORMALIZATION_MAPPINGS, True)
+_ALL_NORMALIZATION_KEEPING_TABLE = _build_translate_table(
+    _ALL_NORMALIZATION_MAPPINGS, False)
+
+# The same normalizations for numbers made of ASCII characters only, as
+# str.translate() tables and the characters they delete, which translate
+# faster than the tables above.
+_ALL_BYTES = "".join(chr(code) for code in xrange(256))
+_ASCII_DIGITS = "0123456789"
+_ASCII_LETTERS = "".join(str(character) + str(character.lower())
+                         for character in sorted(_ALPHA_MAPPINGS))
+_NON_ASCII_LETTER_BYTES = _ALL_BYTES.translate(None, _ASCII_LETTERS)
+_NON_ASCII_DIGIT_BYTES = _ALL_BYTES.translate(None, _ASCII_DIGITS)
+_NON_ASCII_ALPHANUMERIC_BYTES = _ALL_BYTES.translate(
+    None, _ASCII_DIGITS + _ASCII_LETTERS)
+_ASCII_ALPHA_TABLE = "".join(
+    str(_ALPHA_MAPPINGS.get(unichr(code).upper(), chr(code)))
+    for code in xrange(256))
+
+
+def _has_alpha_phone_letters(ascii_number):
+    """Returns whether a number has at least three ASCII letters before its
+    first newline, which is what _VALID_ALPHA_PHONE_PATTERN matches, given
+    the ASCII characters of the number as a str.
+
+    The letters are counted in a single pass by str.translate(), in time
+    linear in the length of the number.
+    """
+    newline_index = ascii_number.find("\n")
+    if newline_index >= 0:
+        ascii_number = ascii_number[:newline_index]
+    return len(ascii_number.translate(None, _NON_ASCII_LETTER_BYTES)) >= 3
  
 # A list of all country codes where national significant numbers (excluding any
 # national prefix) exist that start with a leading zero.
@@ -227,7 +314,8 @@ _UNWANTED_END_CHAR_PATTERN = re.compile(
 
 # We use this pattern to check if the phone number has at least three letters
 # in it - if so, then we treat it as a number where some phone-number digits
-# are represented by letters.
+# are represented by letters. normalize() counts the letters itself, see
+# _has_alpha_phone_letters(), which is faster and takes the same decision.
 _VALID_ALPHA_PHONE_PATTERN = re.compile(u"(?:.*?[A-Za-z]){3}.*")
 
 # Regular expression of viable phone numbers. This is location independent.
@@ -301,41 +389,115 @@ _CC_PATTERN = re.compile(u"\\$CC")
 
 
 class _LRUCache(object):
-    """Simple LRU map."""
+    """LRU map, safe to use from several threads.
+
+    Each get() of a present key makes it the most recently used, and put()
+    evicts the least recently used key once the map holds more than size
+    keys, both in constant time.
+    """
     def __init__(self, size):
         self.size = size
-        self._map = {}
-        self._history = []
+        self._map = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get(self, key):
-        return self._map.get(key)
+        self._lock.acquire()
+        try:
+            value = self._map.pop(key, None)
+            if value is None:
+                self.misses += 1
+                return None
+            # Re-inserting moves the key to the most recently used end.
+            self._map[key] = value
+            self.hits += 1
+            return value
+        finally:
+            self._lock.release()
 
     def put(self, key, value):
-        self._map[key] = value
-        self._history.append(key)
-        # LRU strategy
-        if len(self._history) > self.size:
-            del self._map[self._history.pop(0)]
+        self._lock.acquire()
+        try:
+            self._map.pop(key, None)
+            self._map[key] = value
+            # LRU strategy
+            while len(self._map) > self.size:
+                self._map.popitem(last=False)
+                self.evictions += 1
+        finally:
+            self._lock.release()
 
     def contains_key(self, key):
         return key in self._map
 
+    def get_stats(self):
+        """Returns a dict of the size, capacity, hits, misses and evictions of
+        the cache."""
+        self._lock.acquire()
+        try:
+            return {
+                "size": len(self._map),
+                "capacity": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+        finally:
+            self._lock.release()
+
 
 class _RegexCache(object):
     """LRU Cache for compiled regular expressions."""
-    def __init__(self, size):
+    def __init__(self, size, engine=None):
         self._cache = _LRUCache(size)
+        if engine is None:
+            engine = regexengine.DEFAULT_ENGINE
+        # The regexengine.RegexEngine the patterns are compiled with.
+        self.engine = engine
+        # The RegexTelemetry compilations are recorded into, if enabled.
+        self.telemetry = None
 
     def get_pattern_for_regex(self, regex):
-        pattern = self._cache.get(regex)
+        return self._get_pattern(regex, regex, self.engine.compile)
+
+    def _get_pattern(self, key, regex, compile_regex):
+        pattern = self._cache.get(key)
         if not pattern:
-            pattern = re.compile(regex)
-            self._cache.put(regex, pattern)
+            telemetry = self.telemetry
+            if telemetry is None:
+                pattern = compile_regex(regex)
+            else:
+                pattern = telemetry.compile(regex, compile_regex)
+            self._cache.put(key, pattern)
         return pattern
 
+    def get_stats(self):
+        return self._cache.get_stats()
+
     def contains_regex(self, regex):
         return self._cache.contains_key(regex)
 
+    # The pattern compiler interface used by compiledmetadata.
+
+    def get_pattern(self, regex):
+        return self.get_pattern_for_regex(regex)
+
+    def get_anchored_pattern(self, regex):
+        return self._get_pattern(patternpool.anchor_regex(regex), regex,
+                                 self.engine.compile_anchored)
+
+
+# Default capacity of the regex cache. Metadata patterns are compiled once per
+# generation in its pattern pool; the cache holds the other patterns, such as
+# those of user-defined formats and their anchored forms, of which there can be
+# hundreds when numbers from many regions are handled.
+_DEFAULT_REGEX_CACHE_SIZE = 1000
+
+# Number of threads preload() uses by default.
+_DEFAULT_PRELOAD_WORKERS = 4
+
 
 # INTERNATIONAL and NATIONAL formats are consistent with the definition in
 # ITU-T Recommendation E. 123. For example, the number of the Google Zurich
@@ -369,6 +531,18 @@ TYPE_PAGER = 8
 # patterns for a specific country.
 TYPE_UNKNOWN = 9
 
+# The number type of each description in compiledmetadata.NUMBER_TYPE_FIELDS,
+# but for fixed_line, which may also be TYPE_FIXED_LINE_OR_MOBILE.
+_NUMBER_TYPE_BY_FIELD_NAME = {
+    "premium_rate": TYPE_PREMIUM_RATE,
+    "toll_free": TYPE_TOLL_FREE,
+    "shared_cost": TYPE_SHARED_COST,
+    "voip": TYPE_VOIP,
+    "personal_number": TYPE_PERSONAL_NUMBER,
+    "pager": TYPE_PAGER,
+    "mobile": TYPE_MOBILE,
+}
+
 # Types of phone number matches. See detailed description beside the
 # is_number_match() method.
 MATCH_TYPE_NO_MATCH = 0
@@ -383,6 +557,53 @@ VALIDATION_RESULT_TOO_SHORT = 2
 VALIDATION_RESULT_TOO_LONG = 3
 
 
+def _preload_generation(generation, regions, compile_patterns, workers):
+    """Loads, and optionally compiles, the metadata of regions in generation
+    on a pool of worker threads, skipping the supported regions that turn
+    out to have no metadata. Returns a dict mapping each region code to the
+    time in seconds spent on it."""
+    def preload_region(region_code):
+        start = time.time()
+        metadata = generation.find_metadata_for_region(region_code)
+        if metadata is not None and compile_patterns:
+            generation.pattern_pool.compile_metadata(metadata)
+            compiled_metadata = generation.get_compiled_metadata_for_region(
+                    region_code)
+            compiled_metadata.compile_number_type_pattern()
+            compiled_metadata.build_format_tries()
+        return region_code, time.time() - start
+    pool = multiprocessing.pool.ThreadPool(workers)
+    try:
+        return dict(pool.map(preload_region, regions))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _pins_metadata_generation(method):
+    """Decorates a PhoneNumberUtil method that reads metadata. The outermost
+    such call on a thread pins the generation current when it starts, so that
+    a concurrent reload() cannot make it mix metadata from two generations, nor
+    close the source of the generation while it is in use."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        local = self._local
+        if getattr(local, "generation", None) is not None:
+            return method(self, *args, **kwargs)
+        generation = self._generation
+        # A reload() between reading the generation and pinning it may have
+        # closed it already, in which case its successor is used.
+        while not generation.pin():
+            generation = self._generation
+        local.generation = generation
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            local.generation = None
+            generation.unpin()
+    return wrapper
+
+
 class PhoneNumberUtil(object):
     """"Utility for international phone numbers.
     
@@ -393,42 +614,276 @@ class PhoneNumberUtil(object):
     """
     _instance = None
 
-    def __init__(self):
-        self._country_to_metadata_map = {}
+    def __init__(self, regex_cache_size=_DEFAULT_REGEX_CACHE_SIZE,
+                 regex_engine=None):
+        # The metadata in use; replaced as a whole by reload().
+        self._generation = None
+        # Holds the generation pinned by the outermost metadata-reading call
+        # on each thread (see _pins_metadata_generation).
+        self._local = threading.local()
+        self._reload_lock = threading.Lock()
 
-        # A cache for frequently used country-specific regular expressions.  As most
-        # people use phone numbers primarily from one to two countries, and there are
-        # roughly 60 regular expressions needed, the initial capacity of 100 offers a
-        # rough load factor of 0.75.
-        self._regex_cache = _RegexCache(100)
+        # A cache for frequently used regular expressions that do not come
+        # from the metadata, whose patterns are shared by the generation.
+        self._regex_cache = _RegexCache(regex_cache_size, regex_engine)
+        # The regexengine.RegexEngine every pattern is compiled and matched
+        # with, as the generations share it.
+        self._regex_engine = self._regex_cache.engine
+        # The module-level patterns compiled again by that engine (see
+        # _get_engine_pattern()).
+        self._engine_patterns = {}
+        # The RegexTelemetry the instrumented paths record into, or None.
+        self._telemetry = None
 
     @classmethod
     def get_instance(cls, base_file_location=None,
-                     country_code_to_region_code_map=None):
+                     country_code_to_region_code_map=None,
+                     metadata_module=None, source=None,
+                     regex_cache_size=_DEFAULT_REGEX_CACHE_SIZE,
+                     dfa_module=None, regex_engine=None):
+        """Gets the PhoneNumberUtil singleton, creating it on first use.
+
+        Args:
+            base_file_location: prefix of the per-region metadata files (and of
+                the metadata bundle, if one was built).
+            country_code_to_region_code_map: mapping from country calling code
+                to region codes. Defaults to the mapping in metadata_module if
+                that is supplied.
+            metadata_module: a module generated by buildmetadataprotofromxml.py
+                (such as phonenumbers.metadata) to read metadata from instead
+                of the metadata files.
+            source: a metadatasource.MetadataSource to read metadata from
+                instead of base_file_location and metadata_module, such as a
+                PackageResourceSource for a package imported from a zip file.
+            regex_cache_size: the number of compiled regular expressions the
+                regex cache holds.
+            dfa_module: a module generated by buildmetadataprotofromxml.py
+                with --dfa (such as phonenumbers.metadatadfa), to validate
+                and classify numbers with DFAs rather than re, in time linear
+                in the length of the number.
+            regex_engine: the regexengine.RegexEngine to compile patterns
+                with, such as regexengine.get_engine("regex") (default: the
+                re module).
+        """
         if not cls._instance:
-            instance = cls()
-            instance._country_code_to_region_code_map = \
-                    country_code_to_region_code_map
-            instance._init(base_file_location)
+            instance = cls(regex_cache_size, regex_engine)
+            instance._generation = metadatageneration.MetadataGeneration(
+                    1, base_file_location, country_code_to_region_code_map,
+                    metadata_module, source, dfa_module,
+                    instance._regex_cache.engine)
             cls._instance = instance
         return cls._instance
 
-    def _init(self, file_prefix):
-        print "_init with file_prefix:", file_prefix
-        self._current_file_prefix = file_prefix
-        supported_countries = []
-        for region_codes in self._country_code_to_region_code_map.values():
-            supported_countries.extend(region_codes)
-        self._supported_countries = list(set(supported_countries))
-        self._nanpa_countries = \
-                self._country_code_to_region_code_map[_NANPA_COUNTRY_CODE]
-        
-    def _load_metadata_for_region_from_file(self, region_code):
-        f = open(self._current_file_prefix + "_" + region_code, "rb")
-        metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
-        metadata_collection.ParseFromString(f.read())
-        for metadata in metadata_collection.metadata:
-            self._country_to_metadata_map[region_code] = metadata
+    def _get_generation(self):
+        """Returns the generation pinned for the current call, or else the
+        current one."""
+        return getattr(self._local, "generation", None) or self._generation
+
+    def get_metadata_version(self):
+        """Returns the version of the metadata generation in use."""
+        return self._get_generation().version
+
+    def reload(self, base_file_location=None,
+               country_code_to_region_code_map=None, metadata_module=None,
+               source=None, preload=False,
+               workers=_DEFAULT_PRELOAD_WORKERS, dfa_module=None):
+        """Replaces the metadata in use by a new generation.
+
+        The new generation is built while the current one stays in use, then
+        swapped in with a single assignment. Calls already in progress finish
+        on the generation they started with; the source of the old
+        generation, such as its memory-mapped bundle, is closed once they
+        have, unless the new generation reads from the same source. Metadata
+        files and bundles should therefore be updated by renaming new files
+        into place, so that the old generation's bundle stays valid until
+        then.
+
+        The arguments are as for get_instance(). If none of
+        base_file_location, metadata_module and source is given, metadata is
+        read again from where the current generation read it, and the calling
+        code mapping is kept unless a new one is given. The DFA module is
+        kept unless a new one is given; DFAs that do not match the new
+        metadata are not used. The regex engine is kept.
+
+        Args:
+            preload: whether to load and compile the metadata of every region
+                before the swap. This briefly holds a full copy of the metadata
+                of both generations; otherwise regions load lazily as before.
+            workers: the number of threads to preload regions with.
+        Returns:
+            the version of the new generation.
+        """
+        self._reload_lock.acquire()
+        try:
+            current = self._generation
+            if (base_file_location is None and metadata_module is None and
+                source is None):
+                base_file_location = current.file_prefix
+                metadata_module = current.metadata_module
+                if base_file_location is None and metadata_module is None:
+                    source = current.source.reopen()
+            if (country_code_to_region_code_map is None and
+                metadata_module is None):
+                country_code_to_region_code_map = \
+                        current.country_code_to_region_code_map
+            if dfa_module is None:
+                dfa_module = current.dfa_module
+            generation = metadatageneration.MetadataGeneration(
+                    current.version + 1, base_file_location,
+                    country_code_to_region_code_map, metadata_module, source,
+                    dfa_module, current.regex_engine)
+            generation.pattern_pool.telemetry = self._telemetry
+            if preload:
+                _preload_generation(generation, generation.supported_countries,
+                                    True, workers)
+            self._generation = generation
+            if current.source is not generation.source:
+                current.retire()
+            return generation.version
+        finally:
+            self._reload_lock.release()
+
+    def reload_in_background(self, **kwargs):
+        """Runs reload() with the given keyword arguments on a new daemon
+        thread, and returns the thread."""
+        thread = threading.Thread(target=self.reload, kwargs=kwargs)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    @_pins_metadata_generation
+    def preload(self, regions=None, compile_patterns=True,
+                workers=_DEFAULT_PRELOAD_WORKERS):
+        """Loads the metadata for a set of regions ahead of use.
+
+        Metadata is otherwise loaded the first time a region is needed, so the
+        first request for each region pays for file I/O, protocol buffer
+        decoding and regular expression compilation. Calling this at startup
+        moves that cost out of the request path.
+
+        Args:
+            regions: the region codes to load (default: every supported
+                region).
+            compile_patterns: whether to also compile the regular expressions
+                of each region's metadata, with the combined number type
+                pattern and the leading digits tries of its formats.
+            workers: the number of threads to load regions with.
+        Returns:
+            a dict mapping each region code to the time in seconds spent
+            loading it.
+        """
+        generation = self._get_generation()
+        if regions is None:
+            regions = generation.supported_countries
+        regions = [region_code.upper() for region_code in regions]
+        return _preload_generation(generation, regions, compile_patterns,
+                                   workers)
+
+    @_pins_metadata_generation
+    def preload_for_fork(self, workers=_DEFAULT_PRELOAD_WORKERS):
+        """Eagerly loads and compiles all the metadata ahead of forking
+        worker processes.
+
+        Call this in the parent process of a pre-forking server, before the
+        workers are forked. It is preload() of every region followed by the
+        compilation of every regular expression of the metadata, so each
+        worker starts with them instead of loading and compiling its own
+        copy, and shares the memory holding them with the others until the
+        pages are written to. Nothing is made read-only or moved out of
+        reference counting, so pages still get copied as the objects are
+        used, the regex cache still fills in each worker and reload() still
+        works.
+
+        It then runs a full garbage collection, so that the workers do not
+        each inherit, and collect in their own copy of the pages, the garbage
+        left by loading. Where the interpreter has gc.freeze() (Python 3.7
+        onwards), it is called too, so that later collections do not write to
+        the pages holding the objects left. The metadata bundle, if any, is memory-mapped and so is
+        shared by the workers in any case.
+
+        Args:
+            workers: the number of threads to load regions with.
+        """
+        generation = self._get_generation()
+        _preload_generation(generation, generation.supported_countries, True,
+                            workers)
+        generation.compile_all()
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+
+    def get_metadata_pattern_stats(self):
+        """Returns counters describing the sharing of strings and compiled
+        patterns between the metadata of the loaded regions, as described in
+        patternpool.PatternPool.get_stats()."""
+        return self._get_generation().pattern_pool.get_stats()
+
+    def get_regex_cache_stats(self):
+        """Returns the size, capacity, hits, misses and evictions of the regex
+        cache, as a dict."""
+        return self._regex_cache.get_stats()
+
+    def enable_regex_telemetry(self, time_budget=None):
+        """Starts recording the compilations of the metadata patterns and of
+        the regex cache, and the time spent matching patterns in formatting,
+        number type classification and _matches_entirely(), per pattern and
+        region. While it is enabled, number types are classified by matching
+        the patterns of each number description in turn, rather than with the
+        DFA or the combined pattern, so that each is timed.
+
+        Args:
+            time_budget: the time in seconds a single match may take before
+                it is flagged as over budget, or None for no budget.
+        Returns:
+            the new regextelemetry.RegexTelemetry, whose get_slowest_patterns()
+            and get_over_budget_patterns() report what was recorded.
+        """
+        telemetry = regextelemetry.RegexTelemetry(time_budget)
+        self._set_regex_telemetry(telemetry)
+        return telemetry
+
+    def disable_regex_telemetry(self):
+        """Stops recording regex telemetry, and returns the RegexTelemetry
+        recorded into, or None if it was not enabled."""
+        telemetry = self._telemetry
+        self._set_regex_telemetry(None)
+        return telemetry
+
+    def _set_regex_telemetry(self, telemetry):
+        # Under the reload lock, so that a generation being built by reload()
+        # picks up the change.
+        self._reload_lock.acquire()
+        try:
+            self._telemetry = telemetry
+            self._regex_cache.telemetry = telemetry
+            if self._generation is not None:
+                self._generation.pattern_pool.telemetry = telemetry
+        finally:
+            self._reload_lock.release()
+
+    def get_regex_telemetry(self):
+        """Returns the RegexTelemetry being recorded into, or None if regex
+        telemetry is not enabled."""
+        return self._telemetry
+
+    def _get_engine_pattern(self, pattern):
+        """Returns a module-level pattern, compiled by re on import, compiled
+        again by the regex engine of the instance, so that it can be matched
+        through the engine. The pattern must not depend on flags."""
+        engine_pattern = self._engine_patterns.get(pattern)
+        if engine_pattern is None:
+            engine_pattern = self._regex_engine.compile(pattern.pattern)
+            self._engine_patterns[pattern] = engine_pattern
+        return engine_pattern
+
+    def _get_pattern_for_regex(self, regex):
+        """Returns the compiled pattern for regex, preferring the one shared by
+        all regions if regex comes from metadata, and otherwise using the regex
+        cache."""
+        pattern = self._get_generation().pattern_pool.get_pattern(regex)
+        if pattern is None:
+            pattern = self._regex_cache.get_pattern_for_regex(regex)
+        return pattern
     
     def extract_possible_number(self, number):
         """Attempts to extract a possible number from the string passed in.
@@ -501,12 +956,24 @@ class PhoneNumberUtil(object):
         Returns:
             the normalized string version of the phone number.
         """
-        if _VALID_ALPHA_PHONE_PATTERN.match(number):
-            return self._normalize_helper(
-                    number, _ALL_NORMALIZATION_MAPPINGS, True)
+        if isinstance(number, str):
+            number = number.decode("latin-1")
+        ascii_number = number.encode("ascii", "ignore")
+        if len(ascii_number) == len(number):
+            # The number is all ASCII, as most are.
+            if ascii_number.isdigit():
+                return number
+            if _has_alpha_phone_letters(ascii_number):
+                ascii_number = ascii_number.translate(
+                        _ASCII_ALPHA_TABLE, _NON_ASCII_ALPHANUMERIC_BYTES)
+            else:
+                ascii_number = ascii_number.translate(None,
+                                                      _NON_ASCII_DIGIT_BYTES)
+            return ascii_number.decode("ascii")
+        if _has_alpha_phone_letters(ascii_number):
+            return self._normalize_helper(number, _ALL_NORMALIZATION_TABLE)
         else:
-            return self._normalize_helper(
-                    number, DIGIT_MAPPINGS, True)
+            return self._normalize_helper(number, _DIGITS_ONLY_TABLE)
     
     def normalize_string_buffer(self, number):
         """Normalizes a string of characters representing a phone number. 
@@ -530,7 +997,7 @@ class PhoneNumberUtil(object):
         Returns:
             the normalized string version of the phone number.
         """
-        return self._normalize_helper(number, DIGIT_MAPPINGS, True)
+        return self._normalize_helper(number, _DIGITS_ONLY_TABLE)
     
     def convert_alpha_characters_in_number(self, number):
         """Converts all alpha characters in a number to their respective digits 
@@ -543,8 +1010,10 @@ class PhoneNumberUtil(object):
         Returns:
             the normalized string version of the phone number.
         """
-        return self._normalize_helper(number, _ALL_NORMALIZATION_MAPPINGS, False)
+        return self._normalize_helper(number,
+                                      _ALL_NORMALIZATION_KEEPING_TABLE)
     
+    @_pins_metadata_generation
     def get_length_of_geographical_area_code(self, number):
         """Gets the length of the geographical area code from the national_number
         field of the PhoneNumber object passed in, so that clients could use it to
@@ -588,17 +1057,18 @@ class PhoneNumberUtil(object):
         region_code = self.get_region_code_for_number(number)
         if not self._is_valid_region_code(region_code):
             return 0
-        metadata = self.get_metadata_for_region(region_code)
-        if not metadata.HasField("national_prefix"):
+        compiled_metadata = self._get_compiled_metadata_for_region(region_code)
+        if not compiled_metadata.metadata.HasField("national_prefix"):
             return 0
         type_ = self._get_number_type_helper(
-            self.get_national_significant_number(number), metadata)
+            self.get_national_significant_number(number), compiled_metadata)
         # Most numbers other than the two types below have to be dialled in full.
         if (type_ != TYPE_FIXED_LINE and
             type_ != TYPE_FIXED_LINE_OR_MOBILE):
             return 0
         return self.get_length_of_national_destination_code(number)
     
+    @_pins_metadata_generation
     def get_length_of_national_destination_code(self, number):
         """Gets the length of the national destination code (NDC) from the
         PhoneNumber object passed in, so that clients could use it to split a
@@ -667,31 +1137,26 @@ class PhoneNumberUtil(object):
         return len(number_groups[2])
     
     
-    def _normalize_helper(self, number, normalization_replacements, remove_non_matches):
+    def _normalize_helper(self, number, translate_table):
         """Normalizes a string of characters representing a phone number by
-        replacing all characters found in the accompanying map with the values
-        therein, and stripping all other characters if remove_non_matches is true.
-     
+        replacing the characters found in the translate table with the values
+        therein, and stripping the others if the table deletes them.
+
+        The tables are built by _build_translate_table() from mappings of
+        upper-case characters, so that the whole number is normalized in a
+        single call to unicode.translate().
+
         Args:
                 number a string of characters representing a phone number.
-                normalization_replacements a mapping of characters to what they 
-                        should be replaced by in the normalized version of the phone 
-                        number.
-                remove_non_matches indicates whether characters that are not able 
-                to be replaced should be stripped from the number. If this is false,
-                they will be left unchanged in the number.
+                translate_table one of the translate tables of this module,
+                        such as _DIGITS_ONLY_TABLE.
         Returns:
                 the normalized string version of the phone number.
         """
-        normalized_number = []
-        for character in number:
-            new_digit = normalization_replacements.get(character.upper())
-            if new_digit is not None:
-                    normalized_number.append(new_digit)
-            elif not remove_non_matches:
-                    normalized_number.append(character)
-            # If neither of the above are true, we remove this character.
-        return u"".join(normalized_number)
+        if isinstance(number, str):
+            # Each byte stands for the character of the same code point.
+            number = number.decode("latin-1")
+        return number.translate(translate_table)
     
     
     def _is_valid_region_code(self, region_code):
@@ -703,9 +1168,11 @@ class PhoneNumberUtil(object):
         Returns:
             True if region code is valid.
         """
-        return region_code in self._supported_countries
+        return (region_code is not None and
+                self._get_generation().is_supported_region(region_code))
     
     
+    @_pins_metadata_generation
     def format(self, number, number_format):
         """Formats a phone number in the specified format using default rules.
         
@@ -748,6 +1215,7 @@ class PhoneNumberUtil(object):
                 formatted_national_number, formatted_extension)
     
     
+    @_pins_metadata_generation
     def format_by_pattern(self, number, number_format, user_defined_formats):
         """Formats a phone number in the specified format using client-defined
         formatting rules. 
@@ -794,9 +1262,12 @@ class PhoneNumberUtil(object):
                 if national_prefix:
                     # Replace $NP with national prefix and $FG with the first
                     # group ($1).
-                    national_prefix_formatting_rule = _NP_PATTERN.sub(
+                    engine = self._regex_engine
+                    national_prefix_formatting_rule = engine.sub(
+                            self._get_engine_pattern(_NP_PATTERN),
                             national_prefix, national_prefix_formatting_rule)
-                    national_prefix_formatting_rule = _FG_PATTERN.sub(
+                    national_prefix_formatting_rule = engine.sub(
+                            self._get_engine_pattern(_FG_PATTERN),
                             u"$1", national_prefix_formatting_rule)
                     num_format_copy.national_prefix_formatting_rule = \
                             national_prefix_formatting_rule
@@ -811,14 +1282,18 @@ class PhoneNumberUtil(object):
                 # formats.
                 user_defined_formats_copy.append(num_format)
         formatted_number = self._format_according_to_formats(
-                national_significant_number, user_defined_formats_copy, 
-                number_format)
+                national_significant_number,
+                [compiledmetadata.CompiledNumberFormat(num_format,
+                                                       self._regex_cache)
+                 for num_format in user_defined_formats_copy],
+                number_format, region_code=region_code)
         self._maybe_get_formatted_extension(number, region_code, 
                 formatted_number)
         return self._format_number_by_format(country_code, number_format, 
                 formatted_number)
     
     
+    @_pins_metadata_generation
     def format_national_number_with_carrier_code(self, number, carrier_code):
         country_code = number.country_code
         national_significant_number = self.get_national_significant_number(number)
@@ -840,6 +1315,7 @@ class PhoneNumberUtil(object):
     
     
     
+    @_pins_metadata_generation
     def format_out_of_country_calling_number(self, number, country_calling_from):
         """Formats a phone number for out-of-country dialing purpose. 
         
@@ -864,7 +1340,7 @@ class PhoneNumberUtil(object):
             the formatted phone number.
         """
         if not self._is_valid_region_code(country_calling_from):
-            return format(number, FORMAT_INTERNATIONAL)
+            return self.format(number, FORMAT_INTERNATIONAL)
         country_code = number.country_code
         region_code = self.get_region_code_for_country_code(country_code)
         national_significant_number = \
@@ -876,7 +1352,8 @@ class PhoneNumberUtil(object):
             if self.is_nanpa_country(country_calling_from):
                 # For NANPA countries, return the national format for these
                 # countries but prefix it with the country code.
-                return country_code + " "  + format(number, FORMAT_NATIONAL)
+                return "%d %s" % (country_code,
+                                  self.format(number, FORMAT_NATIONAL))
             
         elif country_code == self.get_country_code_for_region(country_calling_from):
             # For countries that share a country calling code, the country code
@@ -887,7 +1364,7 @@ class PhoneNumberUtil(object):
             # not vice versa - so we don't cover this edge case for now and for
             # those cases return the version including country code. Details here:
             # http:#www.petitfute.com/voyage/225-info-pratiques-reunion
-            return format(number, FORMAT_NATIONAL)
+            return self.format(number, FORMAT_NATIONAL)
         
         formatted_national_number = self._format_national_number(
                 national_significant_number, region_code, FORMAT_INTERNATIONAL)
@@ -899,7 +1376,9 @@ class PhoneNumberUtil(object):
         # international format of the number is returned, unless there is a
         # preferred international prefix.
         international_prefix_for_formatting = ""
-        if self._matches_entirely(_UNIQUE_INTERNATIONAL_PREFIX, international_prefix):
+        if self._matches_entirely(
+                self._get_engine_pattern(_UNIQUE_INTERNATIONAL_PREFIX),
+                international_prefix):
             international_prefix_for_formatting = international_prefix
         elif metadata.HasField("preferred_international_prefix"):
             international_prefix_for_formatting = \
@@ -913,6 +1392,7 @@ class PhoneNumberUtil(object):
                     formatted_national_number, formatted_extension)
     
     
+    @_pins_metadata_generation
     def format_in_original_format(self, number, country_calling_from):
         """Formats a phone number using the original phone number format that the
         number is parsed from. 
@@ -1011,76 +1491,92 @@ class PhoneNumberUtil(object):
         Returns:
             the formatted phone number string.
         """
-        metadata = self.get_metadata_for_region(region_code)
-        intl_number_formats = metadata.intl_number_format
+        compiled_metadata = self._get_compiled_metadata_for_region(region_code)
+        intl_number_formats = compiled_metadata.intl_number_formats
         # When the intl_number_formats exists, we use that to format national
         # number for the INTERNATIONAL format instead of using the
         # number_desc.number_formats.
-        if not intl_number_formats or number_format == FORMAT_NATIONAL:
-            available_formats = metadata.number_format
-        else:
-            available_formats = metadata.intl_number_format
+        use_intl_formats = (bool(intl_number_formats) and
+                            number_format != FORMAT_NATIONAL)
+        # Only the formats whose leading digits can match are tried.
+        available_formats = compiled_metadata.get_candidate_formats(
+                number, use_intl_formats)
         return self._format_according_to_formats(number, available_formats, 
-                number_format, carrier_code)
+                number_format, carrier_code, region_code)
     
     
     def _format_according_to_formats(self, national_number, available_formats, 
-                                     number_format, carrier_code=None):
+                                     number_format, carrier_code=None,
+                                     region_code=None):
         """Note that carrier_code is optional - if None or an empty string, no
         carrier code replacement will take place. Carrier code replacement occurs
         before national prefix replacement.
         
             national_number: a string of characters representing a phone number.
             available_formats: the available formats the phone number could be 
-                formatted into.
+                formatted into, as CompiledNumberFormat instances.
             number_format: the format the phone number should be formatted into.
             carrier_code: carrier code string (default: None).
+            region_code: the region the formats are from, which regex
+                telemetry is recorded against (default: None).
         Returns:
             the formatted phone number string.
         """
-        for num_format in available_formats:
-            size = len(num_format.leading_digits_pattern)
-            if (not size or self._regex_cache.get_pattern_for_regex(
-                # We always use the last leading_digits_pattern, as it is the most
-                # detailed.
-                num_format.leading_digits_pattern[-1]).match(national_number)):
-
-                # TODO use _regex_cache. also use string buffer... mirror Java
-                # in general
-                pattern_to_match = re.compile(num_format.pattern)
-                number_format_rule = num_format.format
-                if self._matches_entirely(pattern_to_match, national_number):
-                    if (carrier_code and
-                        num_format.domestic_carrier_code_formatting_rule):
-                        domestic_carrier_code_formatting_rule = \
-                                num_format.domestic_carrier_code_formatting_rule
-                        # Replace the $CC in the formatting rule with the
-                        # desired carrier code.
-                        carrier_code_formatting_rule = _CC_PATTERN.sub(
-                                carrier_code, 
-                                domestic_carrier_code_formatting_rule, 1)
-                        # Now replace the $FG in the formatting rule with the
-                        # first group and the carrier code combined in the
-                        # appropriate way.
-                        number_format_rule = _FIRST_GROUP_PATTERN.sub(
-                                carrier_code_formatting_rule,
-                                number_format_rule, 1)
-    
-                    national_prefix_formatting_rule = \
-                            num_format.national_prefix_formatting_rule
-                    if (number_format == FORMAT_NATIONAL and 
-                        national_prefix_formatting_rule):
-                        number_format_rule = \
-                                self._backslash_notation(number_format_rule)
-                        return _FIRST_GROUP_PATTERN.sub(
-                                national_prefix_formatting_rule, 
-                                pattern_to_match.sub(
-                                        number_format_rule, national_number))
-                    else:
-                        number_format_rule = \
-                                self._backslash_notation(number_format_rule)
-                        return pattern_to_match.sub(number_format_rule, 
-                                national_number)
+        telemetry = self._telemetry
+        engine = self._regex_engine
+        for compiled_format in available_formats:
+            num_format = compiled_format.number_format
+            # The leading digits pattern is the last one, as it is the most
+            # detailed.
+            leading_digits_pattern = compiled_format.leading_digits_pattern
+            if telemetry is not None:
+                match = ((leading_digits_pattern is None or
+                          telemetry.match(leading_digits_pattern,
+                                          national_number, region_code)) and
+                         telemetry.match(compiled_format.pattern,
+                                         national_number, region_code))
+            elif (leading_digits_pattern is None or
+                  engine.match_prefix(leading_digits_pattern,
+                                      national_number)):
+                match = engine.match_prefix(compiled_format.pattern,
+                                            national_number)
+            else:
+                match = None
+            if match:
+                if (carrier_code and
+                    num_format.domestic_carrier_code_formatting_rule):
+                    domestic_carrier_code_formatting_rule = \
+                            num_format.domestic_carrier_code_formatting_rule
+                    # Replace the $CC in the formatting rule with the
+                    # desired carrier code.
+                    carrier_code_formatting_rule = engine.sub(
+                            self._get_engine_pattern(_CC_PATTERN),
+                            carrier_code, 
+                            domestic_carrier_code_formatting_rule, 1)
+                    # Now replace the $FG in the formatting rule with the
+                    # first group and the carrier code combined in the
+                    # appropriate way.
+                    number_format_rule = engine.sub(
+                            self._get_engine_pattern(_FIRST_GROUP_PATTERN),
+                            carrier_code_formatting_rule,
+                            num_format.format, 1)
+                    formatted_number = match.expand(
+                            self._backslash_notation(number_format_rule))
+                else:
+                    # The template was expanded when the metadata was
+                    # compiled.
+                    formatted_number = compiled_format.format_match(match)
+
+                national_prefix_formatting_rule = \
+                        num_format.national_prefix_formatting_rule
+                if (number_format == FORMAT_NATIONAL and 
+                    national_prefix_formatting_rule):
+                    return engine.sub(
+                            self._get_engine_pattern(_FIRST_GROUP_PATTERN),
+                            national_prefix_formatting_rule, 
+                            formatted_number)
+                else:
+                    return formatted_number
         # If no pattern above is matched, we format the number as a whole.
         return national_number
      
@@ -1226,60 +1722,63 @@ class PhoneNumberUtil(object):
     #
     #
     def _get_number_type_helper(self, national_number, metadata):
-        general_number_desc = metadata.general_desc
-        if (not general_number_desc.HasField("national_number_pattern") or
-            not self._is_number_matching_desc(national_number, general_number_desc)):
+        """Returns the type of a national number, given the
+        CompiledPhoneMetadata of its region."""
+        telemetry = self._telemetry
+        if telemetry is None:
+            field_name = metadata.match_number_type(national_number)
+        else:
+            field_name = metadata.match_number_type_with_telemetry(
+                    national_number, telemetry)
+        if field_name is None:
             return TYPE_UNKNOWN
-     
-        if self._is_number_matching_desc(national_number, metadata.premium_rate):
-            return TYPE_PREMIUM_RATE
-        
-        if self._is_number_matching_desc(national_number, metadata.toll_free):
-            return TYPE_TOLL_FREE
-        
-        if self._is_number_matching_desc(national_number, metadata.shared_cost):
-            return TYPE_SHARED_COST
-        
-        if self._is_number_matching_desc(national_number, metadata.voip):
-            return TYPE_VOIP
-        
-        if (self._is_number_matching_desc(national_number, metadata.personal_number)):
-            return TYPE_PERSONAL_NUMBER
-        
-        if (self._is_number_matching_desc(national_number, metadata.pager)):
-            return TYPE_PAGER
-     
-        is_fixed_line = self._is_number_matching_desc(national_number, metadata.fixed_line)
-        if is_fixed_line:
+        if field_name == "fixed_line":
             if metadata.same_mobile_and_fixed_line_pattern:
                 return TYPE_FIXED_LINE_OR_MOBILE
+            elif telemetry is not None:
+                if metadata.mobile.matches_with_telemetry(
+                        national_number, telemetry, metadata.metadata.id):
+                    return TYPE_FIXED_LINE_OR_MOBILE
             elif self._is_number_matching_desc(national_number, metadata.mobile):
                 return TYPE_FIXED_LINE_OR_MOBILE
             return TYPE_FIXED_LINE
-        
-        # Otherwise, test to see if the number is mobile. Only do this if certain
-        # that the patterns for mobile and fixed line aren't the same.
-        if (not metadata.same_mobile_and_fixed_line_pattern and
-            self._is_number_matching_desc(national_number, metadata.mobile)):
-            return TYPE_MOBILE
-        
-        return TYPE_UNKNOWN
+        return _NUMBER_TYPE_BY_FIELD_NAME[field_name]
     
     
+    @_pins_metadata_generation
     def get_metadata_for_region(self, region_code):
+        """Returns the metadata for a region, loading it on first use.
+
+        Raises:
+            UnknownRegionError: there is no metadata for region_code.
+        """
         if not region_code:
             return
-        region_code = region_code.upper()
-        if not region_code in self._country_to_metadata_map:
-            self._load_metadata_for_region_from_file(region_code)
-        return self._country_to_metadata_map[region_code]
+        return self._get_generation().get_metadata_for_region(
+                region_code.upper())
+
+    @_pins_metadata_generation
+    def get_metadata_for_region_or_none(self, region_code):
+        """Returns the metadata for a region, loading it on first use, or None
+        if there is no metadata for region_code.
+
+        Unlike get_metadata_for_region(), this never raises, and unknown
+        region codes cost a set lookup, so it suits region codes taken from
+        untrusted input.
+        """
+        if not region_code:
+            return None
+        return self._get_generation().find_metadata_for_region(
+                region_code.upper())
     
     
     def _is_number_matching_desc(self, national_number, number_desc):
-        return (self._matches_entirely(
-                    number_desc.possible_number_pattern, national_number) and
-                self._matches_entirely(
-                    number_desc.national_number_pattern, national_number))
+        """Returns whether national_number matches a CompiledNumberDesc."""
+        return number_desc.matches(national_number)
+
+    def _get_compiled_metadata_for_region(self, region_code):
+        return self._get_generation().get_compiled_metadata_for_region(
+                region_code.upper())
     
     #/**
     ## Tests whether a phone number matches a valid pattern. Note this doesn't
@@ -1348,6 +1847,7 @@ class PhoneNumberUtil(object):
     #
     
     
+    @_pins_metadata_generation
     def get_region_code_for_number(self, number):
         """Returns the country/region where a phone number is from. 
         
@@ -1362,7 +1862,8 @@ class PhoneNumberUtil(object):
         if not number: 
             return
         country_code = number.country_code
-        regions = self._country_code_to_region_code_map.get(country_code)
+        regions = self._get_generation().get_region_codes_for_country_code(
+                country_code)
         if not regions: 
             return
         if len(regions) == 1:
@@ -1375,15 +1876,20 @@ class PhoneNumberUtil(object):
         national_number = str(number.national_number)
         for region_code in region_codes:
             # If leading_digits is present, use  Otherwise, do full validation.
-            metadata = self.get_metadata_for_region(region_code)
+            compiled_metadata = \
+                    self._get_compiled_metadata_for_region(region_code)
+            metadata = compiled_metadata.metadata
             if metadata.HasField("leading_digits"):
                 if national_number.find(metadata.leading_digits) == 0:
                     return region_code
-            elif self._get_number_type_helper(national_number, metadata) != TYPE_UNKNOWN:
+            elif (self._get_number_type_helper(national_number,
+                                               compiled_metadata) !=
+                  TYPE_UNKNOWN):
                 return region_code
         return None
     
     
+    @_pins_metadata_generation
     def get_region_code_for_country_code(self, country_code):
         """Returns the region code that matches the specific country code. In the
         case of no region code being found, ZZ will be returned.
@@ -1396,37 +1902,33 @@ class PhoneNumberUtil(object):
         Returns:
             region code string or 'ZZ' if none found.
         """
-        region_codes = \
-                self._country_code_to_region_code_map.get(country_code)
+        region_codes = self._get_generation().\
+                get_region_codes_for_country_code(country_code)
         if not region_codes:
             return 'ZZ'
         return region_codes[0]
     
     
-    #/**
-    ## Returns the country calling code for a specific region. For example, this
-    ## would be 1 for the United States, and 64 for New Zealand.
-    # *
-    ## region_code the ISO 3166-1 two-letter country code that
-    ##           denotes the country/region that we want to get the country code for.
-    ## @return:number} the country calling code for the country/region denoted by
-    ##           region_code.
-    # */
-    #def get_country_code_for_region
-    #        function(region_code):
-    #
-    #    if not _is_valid_region_code(region_code):
-    #        return 0
-    #    
-    #    /** @type:i18n.phonenumbers.Phone_metadata} */
-    #    metadata = get_metadata_for_region(region_code)
-    #    if metadata == None:
-    #        return 0
-    #    
-    #    return metadata.country_code
-    #
-    #
-    #
+    @_pins_metadata_generation
+    def get_country_code_for_region(self, region_code):
+        """Returns the country calling code for a specific region. For example,
+        this would be 1 for the United States, and 64 for New Zealand.
+
+        The metadata for the region is not loaded.
+
+        Args:
+            region_code: the ISO 3166-1 two-letter country code that denotes
+                the country/region that we want to get the country code for.
+        Returns:
+            the country calling code for the country/region denoted by
+            region_code, or 0 if region_code is not supported.
+        """
+        if not region_code:
+            return 0
+        return self._get_generation().get_country_code_for_region(
+                region_code.upper())
+    
+    
     #/**
     ## Returns the national dialling prefix for a specific region. For example, this
     ## would be 1 for the United States, and 0 for New Zealand. Set strip_non_digits
@@ -1471,23 +1973,21 @@ class PhoneNumberUtil(object):
     #
     #
     #
-    #/**
-    ## Check if a country is one of the countries under the North American Numbering
-    ## Plan Administration (NANPA).
-    # *
-    ## region_code the ISO 3166-1 two-letter country code.
-    ## @return:boolean} true if region_code is one of the countries under NANPA.
-    # */
-    #def is_nANPACountry
-    #        function(region_code):
-    #
-    #    return goog.array.contains(
-    #            i18n.phonenumbers.metadata.country_code_to_region_code_map[
-    #                    _NANPA_COUNTRY_CODE],
-    #            region_code.to_upper_case())
-    #
-    #
-    #
+    @_pins_metadata_generation
+    def is_nanpa_country(self, region_code):
+        """Checks if a country is one of the countries under the North American
+        Numbering Plan Administration (NANPA).
+
+        Args:
+            region_code: the ISO 3166-1 two-letter country code.
+        Returns:
+            True if region_code is one of the countries under NANPA.
+        """
+        if not region_code:
+            return False
+        return self._get_generation().is_nanpa_country(region_code.upper())
+    
+    
     #/**
     ## Check whether country_code represents the country calling code from a country
     ## whose national significant number could contain a leading zero. An example of
@@ -2346,12 +2846,19 @@ class PhoneNumberUtil(object):
         regular expression.
         
         Args:
-            pattern: the regular expression pattern string to match against.
+            pattern: the regular expression pattern, compiled by the regex
+                engine of the instance, or pattern string, to match against.
             string: the string to test.
         Returns:
             True if string can be matched entirely against pattern.
         """
-        match = re.match(pattern, string)
+        if isinstance(pattern, basestring):
+            pattern = self._get_pattern_for_regex(pattern)
+        telemetry = self._telemetry
+        if telemetry is None:
+            match = self._regex_engine.match_prefix(pattern, string)
+        else:
+            match = telemetry.match(pattern, string)
         return match and len(match.group(0)) == len(string)
     
     #/**
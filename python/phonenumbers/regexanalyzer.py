@@ -0,0 +1,361 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Analysis of the regular expressions in the metadata for catastrophic
+backtracking, run at build time.
+
+Each pattern is first checked statically, on the parse tree of the re module,
+for the two shapes that make a backtracking matcher take time exponential or
+high-order polynomial in the length of its input:
+
+    nested quantifiers: a repeated subpattern that itself contains a variable
+        repeat, such as (?:\\d{1,3})+, which can split a string of digits
+        between the iterations in many ways.
+    ambiguous alternations: a repeated alternation whose alternatives can
+        start with the same character, such as (?:[1-3]|2\\d)*, which can
+        match the same string through different alternatives.
+
+It is then matched against digit strings meant to bring out its worst case:
+runs of a single digit, cycles through the digits and, where the DFA compiler
+supports the pattern, strings that keep the match alive as long as possible
+before failing. The longest match time found is recorded.
+"""
+
+import re
+import sre_constants
+import sre_parse
+import timeit
+
+from phonenumbers import dfacompiler
+from phonenumbers import patternpool
+
+
+# The lengths of the digit strings patterns are matched against.
+_FUZZ_LENGTHS = (8, 16, 32, 64)
+
+# Each string is matched _FUZZ_LOOPS times in a row, as a single match can
+# take less than the resolution of the clock, and this is repeated
+# _FUZZ_REPEATS times, keeping the shortest time, so that the time measured
+# is that of the matches rather than of interruptions.
+_FUZZ_LOOPS = 10
+_FUZZ_REPEATS = 3
+
+_DIGITS = u"0123456789"
+
+# Stands for any character a pattern element can match other than the ones
+# it names, such as those of "." or "\\D", in the first character sets.
+_ANY_CHARACTER = None
+
+NESTED_QUANTIFIER = "nested quantifier"
+AMBIGUOUS_ALTERNATION = "ambiguous alternation"
+
+# The kinds of the patterns, which tell how they are matched at run time.
+NATIONAL_NUMBER_PATTERN = "national_number_pattern"
+POSSIBLE_NUMBER_PATTERN = "possible_number_pattern"
+LEADING_DIGITS_PATTERN = "leading_digits_pattern"
+FORMAT_PATTERN = "format_pattern"
+
+
+class PatternReport(object):
+    """The analysis of one regular expression.
+
+    Attributes:
+        regex: the regular expression.
+        kind: one of the pattern kinds above.
+        region_codes: sorted list of the regions whose metadata has it.
+        issues: list of descriptions of the risky shapes found in it.
+        max_time: the longest time in seconds a match against a fuzzed string
+            took.
+        worst_input: the string that took max_time.
+    """
+
+    def __init__(self, regex, kind, region_codes, issues, max_time,
+                 worst_input):
+        self.regex = regex
+        self.kind = kind
+        self.region_codes = region_codes
+        self.issues = issues
+        self.max_time = max_time
+        self.worst_input = worst_input
+
+    def to_dict(self):
+        return {
+            "regex": self.regex,
+            "kind": self.kind,
+            "region_codes": self.region_codes,
+            "issues": self.issues,
+            "max_time": self.max_time,
+            "worst_input": self.worst_input,
+        }
+
+
+def find_issues(regex):
+    """Returns a list of descriptions of the nested quantifiers and ambiguous
+    alternations in regex, each starting with NESTED_QUANTIFIER or
+    AMBIGUOUS_ALTERNATION."""
+    issues = []
+    _find_issues(sre_parse.parse(regex), None, issues)
+    return issues
+
+
+def _find_issues(subpattern, enclosing_repeat, issues):
+    """Adds the issues of subpattern to issues, where enclosing_repeat is the
+    (min, max) counts of the innermost repeat with a maximum over 1 that
+    subpattern is part of, or None."""
+    for op, av in subpattern:
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            min_count, max_count, body = av
+            if enclosing_repeat is not None and min_count != max_count:
+                issues.append("%s: %s inside %s" % (
+                        NESTED_QUANTIFIER, _describe_counts(av),
+                        _describe_counts(enclosing_repeat)))
+            if max_count > 1:
+                _find_issues(body, (min_count, max_count), issues)
+            else:
+                _find_issues(body, enclosing_repeat, issues)
+        elif op == sre_constants.BRANCH:
+            alternatives = av[1]
+            if enclosing_repeat is not None:
+                first_sets = []
+                for alternative in alternatives:
+                    first_set, nullable = _get_first_set(alternative)
+                    if not nullable:
+                        first_sets.append(first_set)
+                if _have_overlap(first_sets):
+                    issues.append("%s inside %s" % (
+                            AMBIGUOUS_ALTERNATION,
+                            _describe_counts(enclosing_repeat)))
+            for alternative in alternatives:
+                _find_issues(alternative, enclosing_repeat, issues)
+        elif op == sre_constants.SUBPATTERN:
+            _find_issues(av[-1], enclosing_repeat, issues)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            _find_issues(av[1], enclosing_repeat, issues)
+
+
+def _describe_counts(av):
+    min_count, max_count = av[0], av[1]
+    if max_count == sre_constants.MAXREPEAT:
+        return "{%d,}" % min_count
+    if min_count == max_count:
+        return "{%d}" % min_count
+    return "{%d,%d}" % (min_count, max_count)
+
+
+def _have_overlap(first_sets):
+    seen = set()
+    for first_set in first_sets:
+        if _ANY_CHARACTER in first_set or _ANY_CHARACTER in seen:
+            if first_set and seen:
+                return True
+        if seen & first_set:
+            return True
+        seen |= first_set
+    return False
+
+
+def _get_first_set(subpattern):
+    """Returns the set of the characters subpattern can start with, where
+    _ANY_CHARACTER stands for characters the set does not name, and whether
+    it can match the empty string."""
+    first_set = set()
+    for op, av in subpattern:
+        element_set, nullable = _get_element_first_set(op, av)
+        first_set |= element_set
+        if not nullable:
+            return first_set, False
+    return first_set, True
+
+
+def _get_element_first_set(op, av):
+    if op == sre_constants.LITERAL:
+        return set([unichr(av)]), False
+    if op == sre_constants.IN:
+        return _get_class_first_set(av), False
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        first_set, nullable = _get_first_set(av[2])
+        return first_set, nullable or av[0] == 0
+    if op == sre_constants.BRANCH:
+        first_set = set()
+        any_nullable = False
+        for alternative in av[1]:
+            alternative_set, nullable = _get_first_set(alternative)
+            first_set |= alternative_set
+            any_nullable = any_nullable or nullable
+        return first_set, any_nullable
+    if op == sre_constants.SUBPATTERN:
+        return _get_first_set(av[-1])
+    if op in (sre_constants.AT, sre_constants.ASSERT,
+              sre_constants.ASSERT_NOT):
+        return set(), True
+    # NOT_LITERAL, ANY, GROUPREF and the like.
+    return set([_ANY_CHARACTER]), False
+
+
+def _get_class_first_set(items):
+    first_set = set()
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            first_set.add(unichr(av))
+        elif op == sre_constants.RANGE:
+            first_set.update(unichr(code) for code in xrange(av[0], av[1] + 1)
+                             if code < 0x80)
+            if av[1] >= 0x80:
+                first_set.add(_ANY_CHARACTER)
+        elif (op == sre_constants.CATEGORY and
+              av == sre_constants.CATEGORY_DIGIT):
+            first_set.update(_DIGITS)
+        else:
+            first_set.add(_ANY_CHARACTER)
+    return first_set
+
+
+def get_fuzz_strings(regex):
+    """Returns the digit strings regex is matched against to find its worst
+    case."""
+    strings = set()
+    for length in _FUZZ_LENGTHS:
+        for digit in _DIGITS:
+            strings.add(digit * length)
+        strings.add((_DIGITS * length)[:length])
+        strings.add((_DIGITS[::-1] * length)[:length])
+    strings.update(_get_live_strings(regex))
+    return sorted(strings)
+
+
+def _get_live_strings(regex):
+    """Returns strings that some string starting with them matches regex,
+    each as long as possible up to the longest fuzz length, followed by a
+    digit after which nothing can match; none if the DFA compiler does not
+    support regex."""
+    try:
+        dfa = dfacompiler.compile_dfa(regex)
+    except dfacompiler.UnsupportedPatternError:
+        return []
+    max_length = _FUZZ_LENGTHS[-1]
+    strings = []
+    for first_digit in _DIGITS:
+        string = u""
+        state = 1
+        next_digit = first_digit
+        while next_digit is not None and len(string) < max_length:
+            string += next_digit
+            state = _step(dfa, state, next_digit)
+            next_digit = None
+            for digit in _DIGITS:
+                if _step(dfa, state, digit):
+                    next_digit = digit
+                    break
+        if state:
+            for digit in _DIGITS:
+                if not _step(dfa, state, digit):
+                    string += digit
+                    break
+            strings.append(string)
+    return strings
+
+
+def _step(dfa, state, character):
+    symbol = dfa.symbols.get(character)
+    if symbol is None or not state:
+        return 0
+    return dfa.transitions[state * dfa.symbol_count + symbol]
+
+
+def get_worst_match_time(pattern, strings):
+    """Returns the longest time in seconds matching pattern against one of
+    strings took, and that string."""
+    max_time = 0.0
+    worst_input = None
+    match = pattern.match
+    loops = xrange(_FUZZ_LOOPS)
+    for string in strings:
+        shortest_time = None
+        for _ in xrange(_FUZZ_REPEATS):
+            start = timeit.default_timer()
+            for _ in loops:
+                match(string)
+            seconds = (timeit.default_timer() - start) / _FUZZ_LOOPS
+            if shortest_time is None or seconds < shortest_time:
+                shortest_time = seconds
+        if worst_input is None or shortest_time > max_time:
+            max_time = shortest_time
+            worst_input = string
+    return max_time, worst_input
+
+
+def analyze_pattern(regex, kind, region_codes=()):
+    """Returns the PatternReport of regex, matched the way patterns of kind
+    are matched at run time."""
+    if kind == LEADING_DIGITS_PATTERN:
+        pattern = re.compile(regex)
+    else:
+        pattern = re.compile(patternpool.anchor_regex(regex))
+    max_time, worst_input = get_worst_match_time(pattern,
+                                                 get_fuzz_strings(regex))
+    return PatternReport(regex, kind, sorted(region_codes),
+                         find_issues(regex), max_time, worst_input)
+
+
+def iter_metadata_patterns(metadata):
+    """Yields a (regex, kind) pair for each of the patterns of the metadata
+    for a region that numbers are matched against."""
+    for field_name in patternpool.NUMBER_DESC_FIELDS:
+        number_desc = getattr(metadata, field_name)
+        if number_desc.HasField("national_number_pattern"):
+            yield number_desc.national_number_pattern, NATIONAL_NUMBER_PATTERN
+        if number_desc.HasField("possible_number_pattern"):
+            yield number_desc.possible_number_pattern, POSSIBLE_NUMBER_PATTERN
+    for number_format in (list(metadata.number_format) +
+                          list(metadata.intl_number_format)):
+        yield number_format.pattern, FORMAT_PATTERN
+        for leading_digits_pattern in number_format.leading_digits_pattern:
+            yield leading_digits_pattern, LEADING_DIGITS_PATTERN
+
+
+class MetadataAnalyzer(object):
+    """Analyses the patterns of the metadata of one region at a time, so that
+    the metadata of every region need not be held at once. Each distinct
+    pattern is analysed the first time it is seen."""
+
+    def __init__(self):
+        self._reports = {}
+        self._region_codes = {}
+
+    def add_metadata(self, metadata):
+        for regex, kind in iter_metadata_patterns(metadata):
+            key = (regex, kind)
+            if key not in self._reports:
+                self._reports[key] = analyze_pattern(regex, kind)
+                self._region_codes[key] = set()
+            self._region_codes[key].add(metadata.id)
+
+    def get_reports(self):
+        """Returns the PatternReport of each distinct pattern of the metadata
+        added so far, slowest first."""
+        reports = []
+        for key, report in self._reports.items():
+            report.region_codes = sorted(self._region_codes[key])
+            reports.append(report)
+        reports.sort(key=lambda report: report.max_time, reverse=True)
+        return reports
+
+
+def analyze_metadata(metadata_list):
+    """Returns the PatternReport of each distinct pattern of the metadata of
+    metadata_list, slowest first."""
+    analyzer = MetadataAnalyzer()
+    for metadata in metadata_list:
+        analyzer.add_metadata(metadata)
+    return analyzer.get_reports()
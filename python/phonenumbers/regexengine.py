@@ -0,0 +1,215 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Engines that compile and match the regular expressions of the metadata.
+
+The pattern pool of each metadata generation and the regex cache of
+PhoneNumberUtil compile their patterns through a RegexEngine. Three are
+available:
+
+    re: the re module of the standard library, which is the default.
+    regex: the third-party regex module, if installed, which is a drop-in
+        replacement for re.
+    dfa: the DFA compiler of dfacompiler.py for the patterns without groups
+        matched in full, such as those of the number descriptions, whose
+        match then takes time linear in the length of the number whatever
+        the pattern. Other patterns, and those the DFA compiler does not
+        support, are compiled with re.
+
+The library both compiles its patterns and matches and substitutes with
+them through the engine (full_match(), match_prefix() and sub()), so an
+engine may match its own patterns in its own way. The compiled patterns have
+the interface of compiled re patterns, except that anchored patterns (see
+compile_anchored()) need only support match() and the pattern attribute, and
+their matches group(0), start() and end().
+"""
+
+import re
+import sre_parse
+
+from phonenumbers import dfacompiler
+
+try:
+    import regex as _regex_module
+except ImportError:
+    _regex_module = None
+
+
+def anchor_regex(regex):
+    """Returns a regular expression that matches exactly the strings regex
+    matches in full, when used with match()."""
+    return u"(?:" + regex + u")\\Z"
+
+
+class RegexEngine(object):
+    """The engine of the re module, whose methods the other engines
+    override.
+
+    Attributes:
+        name: the name the engine is known by in ENGINE_NAMES.
+    """
+    name = "re"
+
+    def compile(self, regex):
+        """Returns the compiled pattern for regex."""
+        return re.compile(regex)
+
+    def compile_anchored(self, regex):
+        """Returns a compiled pattern whose match() only succeeds on the
+        strings regex matches in full."""
+        return self.compile(anchor_regex(regex))
+
+    def full_match(self, anchored_pattern, string):
+        """Returns whether anchored_pattern, from compile_anchored(), matches
+        all of string."""
+        return anchored_pattern.match(string) is not None
+
+    def match_prefix(self, pattern, string):
+        """Returns the match of pattern, from compile() or
+        compile_anchored(), at the start of string, or None."""
+        return pattern.match(string)
+
+    def sub(self, pattern, template, string, count=0):
+        """Returns string with the first count (or all) matches of pattern,
+        from compile(), replaced by template, which may refer to groups as
+        \\1 or \\g<1>."""
+        return pattern.sub(template, string, count)
+
+
+class ThirdPartyRegexEngine(RegexEngine):
+    """The engine of the third-party regex module.
+
+    Raises:
+        ImportError: the regex module is not installed.
+    """
+    name = "regex"
+
+    def __init__(self):
+        if _regex_module is None:
+            raise ImportError("the regex module is not installed")
+
+    def compile(self, regex):
+        return _regex_module.compile(regex)
+
+
+class DFARegexEngine(RegexEngine):
+    """The engine matching anchored patterns with DFAs, and compiling the
+    other patterns with a fallback engine.
+
+    DFAs are built when patterns are compiled, which for the national number
+    patterns of every region takes about a second.
+    """
+    name = "dfa"
+
+    def __init__(self, fallback=None):
+        """Args:
+            fallback: the engine for the patterns the DFA compiler does not
+                handle (default: re).
+        """
+        if fallback is None:
+            fallback = RegexEngine()
+        self.fallback = fallback
+
+    def compile(self, regex):
+        return self.fallback.compile(regex)
+
+    def compile_anchored(self, regex):
+        # A DFA only tells whether a string matches, not where the groups
+        # are, as formatting needs.
+        if sre_parse.parse(regex).pattern.groups > 1:
+            return self.fallback.compile_anchored(regex)
+        try:
+            dfa = dfacompiler.compile_dfa(regex)
+        except dfacompiler.UnsupportedPatternError:
+            return self.fallback.compile_anchored(regex)
+        return _DFAPattern(anchor_regex(regex), dfa)
+
+    def full_match(self, anchored_pattern, string):
+        # Runs the DFA without building a match.
+        if isinstance(anchored_pattern, _DFAPattern):
+            return anchored_pattern._dfa.full_match(string)
+        return self.fallback.full_match(anchored_pattern, string)
+
+    def match_prefix(self, pattern, string):
+        return self.fallback.match_prefix(pattern, string)
+
+    def sub(self, pattern, template, string, count=0):
+        return self.fallback.sub(pattern, template, string, count)
+
+
+class _DFAPattern(object):
+    """An anchored pattern matched with a DFA."""
+    __slots__ = ("pattern", "_dfa")
+
+    def __init__(self, pattern, dfa):
+        self.pattern = pattern
+        self._dfa = dfa
+
+    def match(self, string):
+        if self._dfa.full_match(string):
+            return _DFAMatch(string)
+        return None
+
+
+class _DFAMatch(object):
+    """The match of a _DFAPattern, which is the whole string."""
+    __slots__ = ("string",)
+
+    def __init__(self, string):
+        self.string = string
+
+    def group(self, index=0):
+        if index != 0:
+            raise IndexError("no such group")
+        return self.string
+
+    def start(self):
+        return 0
+
+    def end(self):
+        return len(self.string)
+
+
+_ENGINE_CLASSES = {
+    RegexEngine.name: RegexEngine,
+    ThirdPartyRegexEngine.name: ThirdPartyRegexEngine,
+    DFARegexEngine.name: DFARegexEngine,
+}
+
+# The names of the engines, default first.
+ENGINE_NAMES = (RegexEngine.name, ThirdPartyRegexEngine.name,
+                DFARegexEngine.name)
+
+# The engine used unless another one is given.
+DEFAULT_ENGINE = RegexEngine()
+
+
+def get_engine(name):
+    """Returns a new engine of the given name, one of ENGINE_NAMES.
+
+    Raises:
+        ValueError: there is no engine of that name.
+        ImportError: the module the engine needs is not installed.
+    """
+    if name not in _ENGINE_CLASSES:
+        raise ValueError("unknown regex engine: %s" % name)
+    return _ENGINE_CLASSES[name]()
+
+
+def get_available_engine_names():
+    """Returns the names of the engines that can be used here, default
+    first."""
+    return tuple(name for name in ENGINE_NAMES
+                 if name != ThirdPartyRegexEngine.name or
+                 _regex_module is not None)
@@ -0,0 +1,161 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in measurement of the time spent compiling and matching regular
+expressions.
+
+A RegexTelemetry counts the compilations and matches of each pattern, per
+region where the region is known, with their cumulative and longest times.
+Matches that take longer than a time budget are flagged, which points at
+patterns that backtrack badly on some inputs. PhoneNumberUtil only records
+into one once enabled (see PhoneNumberUtil.enable_regex_telemetry()); until
+then, the cost is a check for None on the instrumented paths.
+"""
+
+import re
+import threading
+import time
+
+
+# The fields get_slowest_patterns() can rank patterns by.
+_RANKING_FIELDS = frozenset(["max_time", "total_time", "compile_time"])
+
+
+class _PatternStats(object):
+    """The counters of one pattern in one region."""
+    __slots__ = ("compile_count", "compile_time", "match_count", "total_time",
+                 "max_time", "over_budget_count")
+
+    def __init__(self):
+        self.compile_count = 0
+        self.compile_time = 0.0
+        self.match_count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.over_budget_count = 0
+
+
+class RegexTelemetry(object):
+    """Counters of the compilations and matches of regular expressions, safe
+    to use from several threads.
+
+    Attributes:
+        time_budget: the time in seconds a single match may take before it is
+            counted as over budget, or None for no budget.
+    """
+
+    def __init__(self, time_budget=None):
+        self.time_budget = time_budget
+        self._lock = threading.Lock()
+        # Maps (regex, region code) pairs to their _PatternStats; the region
+        # code is None where it is not known.
+        self._stats = {}
+
+    def _get_stats(self, regex, region_code):
+        key = (regex, region_code)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _PatternStats()
+        return stats
+
+    def compile(self, regex, compile_regex=re.compile, region_code=None):
+        """Returns compile_regex(regex), recording the time taken against the
+        regular expression of the pattern, which its matches are recorded
+        against too (it differs from regex for anchored patterns), and
+        region_code."""
+        start = time.time()
+        pattern = compile_regex(regex)
+        self.record_compile(pattern.pattern, time.time() - start, region_code)
+        return pattern
+
+    def match(self, pattern, string, region_code=None):
+        """Returns pattern.match(string), recording the time taken against
+        the pattern and region_code."""
+        start = time.time()
+        match = pattern.match(string)
+        self.record_match(pattern.pattern, time.time() - start, region_code)
+        return match
+
+    def record_compile(self, regex, seconds, region_code=None):
+        """Records a compilation of regex that took seconds."""
+        self._lock.acquire()
+        try:
+            stats = self._get_stats(regex, region_code)
+            stats.compile_count += 1
+            stats.compile_time += seconds
+        finally:
+            self._lock.release()
+
+    def record_match(self, regex, seconds, region_code=None):
+        """Records a match against regex that took seconds, flagging it if it
+        went over the time budget."""
+        self._lock.acquire()
+        try:
+            stats = self._get_stats(regex, region_code)
+            stats.match_count += 1
+            stats.total_time += seconds
+            if seconds > stats.max_time:
+                stats.max_time = seconds
+            if self.time_budget is not None and seconds > self.time_budget:
+                stats.over_budget_count += 1
+        finally:
+            self._lock.release()
+
+    def get_stats(self):
+        """Returns a list with a dict of counters for each pattern and region
+        recorded so far:
+
+            regex: the regular expression.
+            region_code: the region it was used for, or None if not known.
+            compile_count, compile_time: the number of compilations and the
+                seconds they took in all.
+            match_count, total_time, max_time: the number of matches, the
+                seconds they took in all and the longest of them.
+            over_budget_count: the number of matches over the time budget.
+        """
+        self._lock.acquire()
+        try:
+            items = self._stats.items()
+            return [dict([("regex", regex), ("region_code", region_code)] +
+                         [(name, getattr(stats, name))
+                          for name in _PatternStats.__slots__])
+                    for (regex, region_code), stats in items]
+        finally:
+            self._lock.release()
+
+    def get_slowest_patterns(self, count=10, ranking="max_time"):
+        """Returns the dicts of get_stats() of the count patterns with the
+        highest value of ranking, which is one of "max_time", "total_time"
+        and "compile_time", highest first."""
+        if ranking not in _RANKING_FIELDS:
+            raise ValueError("unknown ranking: %s" % ranking)
+        stats = self.get_stats()
+        stats.sort(key=lambda item: item[ranking], reverse=True)
+        return stats[:count]
+
+    def get_over_budget_patterns(self):
+        """Returns the dicts of get_stats() of the patterns with matches over
+        the time budget, those with the longest match first."""
+        stats = [item for item in self.get_stats()
+                 if item["over_budget_count"]]
+        stats.sort(key=lambda item: item["max_time"], reverse=True)
+        return stats
+
+    def reset(self):
+        """Forgets everything recorded so far."""
+        self._lock.acquire()
+        try:
+            self._stats = {}
+        finally:
+            self._lock.release()
@@ -0,0 +1,56 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of the supported region codes.
+
+Each supported region is given a small integer ID, its position in the sorted
+list of region codes, so that per-region data can be kept in lists indexed by
+ID rather than in dictionaries keyed by region code. IDs are stable for a
+given set of regions.
+"""
+
+
+class RegionRegistry(object):
+    """The supported region codes and their integer IDs.
+
+    Attributes:
+        region_codes: tuple of the upper-case region codes, in ID order.
+    """
+
+    def __init__(self, region_codes):
+        self.region_codes = tuple(sorted(set(region_codes)))
+        self._region_code_set = frozenset(self.region_codes)
+        self._region_ids = dict((region_code, region_id) for
+                                region_id, region_code in
+                                enumerate(self.region_codes))
+
+    def __len__(self):
+        return len(self.region_codes)
+
+    def __contains__(self, region_code):
+        return region_code in self._region_code_set
+
+    def get_region_id(self, region_code):
+        """Returns the ID of an upper-case region code, or None if it is not
+        supported."""
+        return self._region_ids.get(region_code)
+
+    def get_region_code(self, region_id):
+        """Returns the region code with the given ID."""
+        return self.region_codes[region_id]
+
+    def new_table(self, value=None):
+        """Returns a list with one slot per region, indexed by region ID and
+        filled with value."""
+        return [value] * len(self.region_codes)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for buildmetadatafromxml."""
+
+import os.path
+import unittest
+import xml.etree.ElementTree
+
+from phonenumbers import buildmetadatafromxml
+from phonenumbers import phonemetadata_pb2
+
+
+TEST_XML_FILE = os.path.join(os.path.dirname(buildmetadatafromxml.__file__),
+                             "PhoneNumberMetaDataForTesting.xml")
+
+
+class BuildMetadataFromXmlTest(unittest.TestCase):
+    def test_build_without_profile(self):
+        metadata_collection = \
+                buildmetadatafromxml.build_phone_metadata_collection(
+                        TEST_XML_FILE, True)
+        self.assertEquals(17, len(metadata_collection.metadata))
+
+    def test_build_with_profile(self):
+        profile = buildmetadatafromxml.BuildProfile(
+                ["AR", "DE"], ["fixedLine", "mobile"],
+                include_intl_formats=False, include_example_numbers=False)
+        metadata_collection = \
+                buildmetadatafromxml.build_phone_metadata_collection(
+                        TEST_XML_FILE, True, profile)
+        self.assertEquals(["AR", "DE"],
+                sorted(metadata.id for metadata in
+                       metadata_collection.metadata))
+        for metadata in metadata_collection.metadata:
+            self.assertEquals(0, len(metadata.intl_number_format))
+            self.assertTrue(len(metadata.number_format) > 0)
+            self.assertEquals("NA",
+                    metadata.premium_rate.national_number_pattern)
+            self.assertNotEquals("NA",
+                    metadata.fixed_line.national_number_pattern)
+            self.assertFalse(metadata.fixed_line.HasField("example_number"))
+            self.assertTrue(metadata.IsInitialized())
+
+    def test_build_territory_matches_collection(self):
+        metadata_collection = \
+                buildmetadatafromxml.build_phone_metadata_collection(
+                        TEST_XML_FILE, True)
+        territory_xmls = [xml.etree.ElementTree.tostring(territory)
+                          for territory in
+                          buildmetadatafromxml.iter_territories(TEST_XML_FILE)]
+        self.assertEquals(len(metadata_collection.metadata),
+                          len(territory_xmls))
+        for territory_xml, expected_metadata in zip(territory_xmls,
+                metadata_collection.metadata):
+            metadata = phonemetadata_pb2.PhoneMetadata()
+            metadata.ParseFromString(
+                    buildmetadatafromxml.build_territory_metadata(
+                            territory_xml, True))
+            self.assertEquals(expected_metadata, metadata)
+
+    def test_iter_phone_metadata_matches_collection(self):
+        profile = buildmetadatafromxml.BuildProfile(["AR", "DE", "US"])
+        metadata_collection = \
+                buildmetadatafromxml.build_phone_metadata_collection(
+                        TEST_XML_FILE, True, profile)
+        self.assertEquals(list(metadata_collection.metadata),
+                list(buildmetadatafromxml.iter_phone_metadata(
+                        TEST_XML_FILE, True, profile)))
+
+    def test_territory_hash_follows_content(self):
+        territory = xml.etree.ElementTree.fromstring(
+                xml.etree.ElementTree.tostring(
+                        buildmetadatafromxml.iter_territories(
+                                TEST_XML_FILE).next()))
+        territory_hash = buildmetadatafromxml.get_territory_hash(territory)
+        self.assertEquals(territory_hash,
+                buildmetadatafromxml.get_territory_hash(territory))
+        territory.set("nationalPrefix", "9")
+        self.assertNotEquals(territory_hash,
+                buildmetadatafromxml.get_territory_hash(territory))
+
+    def test_profile_rejects_unknown_number_type(self):
+        self.assertRaises(ValueError, buildmetadatafromxml.BuildProfile,
+                None, ["fixedLine", "landline"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for buildmetadataprotofromxml."""
+
+import cStringIO as StringIO
+import logging
+import os.path
+import shutil
+import sys
+import tempfile
+import unittest
+
+from phonenumbers import buildconstants
+from phonenumbers import buildmetadataprotofromxml
+from phonenumbers.test import buildmetadatafromxml_test
+
+
+class BuildMetadataProtoFromXmlTest(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.output_dir, "metadata.xml")
+        source_file = open(buildmetadatafromxml_test.TEST_XML_FILE)
+        self.xml_text = source_file.read()
+        source_file.close()
+        # The metadata file prefixes are absolute, so they would otherwise
+        # point into the package.
+        self.file_prefix = os.path.join(self.output_dir, "metadata")
+        self.get_file_prefix = buildmetadataprotofromxml._get_file_prefix
+        buildmetadataprotofromxml._get_file_prefix = \
+                lambda options: self.file_prefix
+
+    def tearDown(self):
+        buildmetadataprotofromxml._get_file_prefix = self.get_file_prefix
+        shutil.rmtree(self.output_dir)
+
+    def _build(self, xml_text, *args):
+        xml_file = open(self.input_file, "w")
+        xml_file.write(xml_text)
+        xml_file.close()
+        argv, stdout = sys.argv, sys.stdout
+        sys.argv = ["buildmetadataprotofromxml.py", "-i", self.input_file,
+                    "-o", self.output_dir, "-t", "-l", "-j", "1",
+                    "--regions", "US"] + list(args)
+        sys.stdout = StringIO.StringIO()
+        logging.disable(logging.ERROR)
+        try:
+            buildmetadataprotofromxml.main()
+        finally:
+            self.stdout = sys.stdout.getvalue()
+            sys.argv, sys.stdout = argv, stdout
+            logging.disable(logging.NOTSET)
+
+    def _get_preferred_extn_prefix(self):
+        return buildmetadataprotofromxml._read_metadata_proto_file(
+                self.file_prefix + "_US").preferred_extn_prefix
+
+    def _read_manifest(self):
+        manifest_file = open(self.file_prefix +
+                             buildconstants.META_DATA_MANIFEST_SUFFIX)
+        try:
+            return manifest_file.read()
+        finally:
+            manifest_file.close()
+
+    def test_rebuild_after_failed_pattern_gate(self):
+        self._build(self.xml_text)
+        self.assertEquals(" extn. ", self._get_preferred_extn_prefix())
+        changed_xml_text = self.xml_text.replace(
+                'preferredExtnPrefix=" extn. "', 'preferredExtnPrefix=" ext. "')
+        # Every pattern takes longer than no time at all.
+        self.assertRaises(SystemExit, self._build, changed_xml_text,
+                          "--max-match-time", "0")
+        self.assertEquals(" extn. ", self._get_preferred_extn_prefix())
+        # The failed build did not record US as built, so it is rebuilt.
+        self._build(changed_xml_text)
+        self.assertEquals(" ext. ", self._get_preferred_extn_prefix())
+
+    def test_failed_pattern_gate_streaming_keeps_manifest(self):
+        self._build(self.xml_text, "--streaming")
+        manifest = self._read_manifest()
+        changed_xml_text = self.xml_text.replace(
+                'preferredExtnPrefix=" extn. "', 'preferredExtnPrefix=" ext. "')
+        self.assertRaises(SystemExit, self._build, changed_xml_text,
+                          "--streaming", "--max-match-time", "0")
+        self.assertEquals(manifest, self._read_manifest())
+        self._build(changed_xml_text, "--streaming")
+        self.assertNotEquals(manifest, self._read_manifest())
+        self.assertEquals(" ext. ", self._get_preferred_extn_prefix())
+
+    def _read_outputs(self):
+        outputs = {}
+        for file_name in (self.file_prefix +
+                                  buildconstants.META_DATA_BUNDLE_SUFFIX,
+                          os.path.join(self.output_dir,
+                                       "metadatafortesting.py"),
+                          os.path.join(self.output_dir,
+                                       "metadatadfafortesting.py")):
+            output_file = open(file_name, "rb")
+            outputs[file_name] = output_file.read()
+            output_file.close()
+        return outputs
+
+    def test_streaming_build_writes_same_outputs(self):
+        self._build(self.xml_text, "--regions", "US,GB,DE", "--dfa")
+        outputs = self._read_outputs()
+        self._build(self.xml_text, "--regions", "US,GB,DE", "--dfa",
+                    "--streaming", "--force")
+        self.assertEquals(outputs, self._read_outputs())
+        self.assertEquals([], [file_name
+                               for file_name in os.listdir(self.output_dir)
+                               if file_name.endswith(".tmp")])
+
+    def test_builder_change_rebuilds_every_territory(self):
+        self._build(self.xml_text)
+        manifest = self._read_manifest()
+        get_builder_digest = buildmetadataprotofromxml._get_builder_digest
+        buildmetadataprotofromxml._get_builder_digest = lambda: "changed"
+        try:
+            self._build(self.xml_text)
+        finally:
+            buildmetadataprotofromxml._get_builder_digest = get_builder_digest
+        self.assertNotEquals(manifest, self._read_manifest())
+        self.assertTrue("Built 1 of 1 territories" in self.stdout)
+
+    def test_stale_region_files_are_removed(self):
+        self._build(self.xml_text, "--regions", "US,GB")
+        self.assertTrue(os.path.exists(self.file_prefix + "_GB"))
+        # A file left by a build whose manifest is gone.
+        open(self.file_prefix + "_DE", "wb").close()
+        os.remove(self.file_prefix + buildconstants.META_DATA_MANIFEST_SUFFIX)
+        self._build(self.xml_text, "--force")
+        self.assertTrue(os.path.exists(self.file_prefix + "_US"))
+        self.assertFalse(os.path.exists(self.file_prefix + "_GB"))
+        self.assertFalse(os.path.exists(self.file_prefix + "_DE"))
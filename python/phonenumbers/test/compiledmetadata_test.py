@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for compiledmetadata."""
+
+import re
+import unittest
+
+from phonenumbers import buildconstants
+from phonenumbers import compiledmetadata
+from phonenumbers import metadatageneration
+from phonenumbers import phonemetadata_pb2
+from phonenumbers import phonenumberutil
+from phonenumbers import regextelemetry
+from phonenumbers.test import countrycodetoregioncodemapfortesting
+
+
+class CompiledMetadataTest(unittest.TestCase):
+    def setUp(self):
+        self.generation = metadatageneration.MetadataGeneration(1,
+                buildconstants.TEST_META_DATA_FILE_PREFIX,
+                countrycodetoregioncodemapfortesting.
+                        country_code_to_region_code_map)
+
+    def test_compiled_metadata_is_built_once(self):
+        compiled_metadata = \
+                self.generation.get_compiled_metadata_for_region("US")
+        self.assertTrue(compiled_metadata is
+                self.generation.get_compiled_metadata_for_region("US"))
+        self.assertTrue(compiled_metadata.metadata is
+                self.generation.get_metadata_for_region("US"))
+        self.assertRaises(metadatageneration.UnknownRegionError,
+                self.generation.get_compiled_metadata_for_region, "ZZ")
+
+    def test_number_desc_matches_whole_number(self):
+        compiled_metadata = \
+                self.generation.get_compiled_metadata_for_region("US")
+        self.assertTrue(compiled_metadata.general_desc.
+                        has_national_number_pattern)
+        self.assertTrue(compiled_metadata.toll_free.matches("8002530000"))
+        self.assertFalse(compiled_metadata.toll_free.matches("800253000"))
+        self.assertFalse(compiled_metadata.toll_free.matches("80025300001"))
+        self.assertFalse(compiled_metadata.toll_free.matches("8002530000\n"))
+        self.assertFalse(compiled_metadata.toll_free.matches("6502530000"))
+
+    def test_possible_lengths_mask(self):
+        compiled_metadata = \
+                self.generation.get_compiled_metadata_for_region("US")
+        # <possibleNumberPattern>\d{7,10}</possibleNumberPattern>
+        self.assertEquals(sum(1 << length for length in xrange(7, 11)),
+                          compiled_metadata.general_desc.possible_lengths_mask)
+        self.assertEquals(1 << 10,
+                          compiled_metadata.toll_free.possible_lengths_mask)
+        self.assertEquals(None, compiled_metadata.match_number_type("650253"))
+
+
+        metadata = self.generation.get_metadata_for_region("AR")
+        compiled_metadata = \
+                self.generation.get_compiled_metadata_for_region("AR")
+        self.assertEquals(len(metadata.number_format),
+                          len(compiled_metadata.number_formats))
+        self.assertEquals(len(metadata.intl_number_format),
+                          len(compiled_metadata.intl_number_formats))
+        for number_format, compiled_format in zip(metadata.number_format,
+                compiled_metadata.number_formats):
+            self.assertTrue(compiled_format.number_format is number_format)
+            if number_format.leading_digits_pattern:
+                self.assertEquals(number_format.leading_digits_pattern[-1],
+                        compiled_format.leading_digits_pattern.pattern)
+            else:
+                self.assertEquals(None,
+                                  compiled_format.leading_digits_pattern)
+        # The format pattern is anchored, and still captures the groups.
+        compiled_format = compiled_metadata.number_formats[0]
+        self.assertEquals("11 2345-6789",
+                compiled_format.pattern.sub(u"\\1 \\2-\\3", "1123456789"))
+        self.assertFalse(compiled_format.pattern.match("11234567890"))
+        self.assertTrue(compiled_format.leading_digits_pattern.match(
+                "11234567890"))
+
+    def test_match_number_type(self):
+        compiled_metadata = \
+                self.generation.get_compiled_metadata_for_region("US")
+        self.assertEquals("toll_free",
+                          compiled_metadata.match_number_type("8002530000"))
+        self.assertEquals("premium_rate",
+                          compiled_metadata.match_number_type("9002530000"))
+        self.assertEquals("fixed_line",
+                          compiled_metadata.match_number_type("6502530000"))
+        self.assertEquals(None,
+                          compiled_metadata.match_number_type("650253000"))
+        self.assertTrue(compiled_metadata.compile_number_type_pattern() is
+                        compiled_metadata.compile_number_type_pattern())
+
+    def test_match_number_type_agrees_with_descriptions(self):
+        telemetry = regextelemetry.RegexTelemetry()
+        for region_code in self.generation.supported_countries:
+            compiled_metadata = \
+                    self.generation.get_compiled_metadata_for_region(
+                            region_code)
+            for length in xrange(2, 17):
+                for first_digit in "0123456789":
+                    national_number = (first_digit + "234567890123456")[
+                            :length]
+                    if compiled_metadata.general_desc.\
+                            has_national_number_pattern:
+                        expected = compiled_metadata.\
+                                _match_number_type_sequentially(
+                                        national_number)
+                    else:
+                        expected = None
+                    self.assertEquals(expected,
+                            compiled_metadata.match_number_type(
+                                    national_number))
+                    self.assertEquals(expected,
+                            compiled_metadata.match_number_type_with_telemetry(
+                                    national_number, telemetry))
+
+    def test_mobile_left_out_when_same_as_fixed_line(self):
+        for region_code in self.generation.supported_countries:
+            compiled_metadata = \
+                    self.generation.get_compiled_metadata_for_region(
+                            region_code)
+            self.assertEquals(
+                    not compiled_metadata.same_mobile_and_fixed_line_pattern,
+                    "mobile" in compiled_metadata.number_type_fields)
+
+    def test_number_desc_without_patterns_matches_nothing(self):
+        metadata = phonemetadata_pb2.PhoneMetadata()
+        metadata.CopyFrom(self.generation.get_metadata_for_region("US"))
+        metadata.ClearField("mobile")
+        metadata.same_mobile_and_fixed_line_pattern = False
+        self.generation.pattern_pool.add_metadata(metadata)
+        compiled_metadata = compiledmetadata.CompiledPhoneMetadata(
+                metadata, self.generation.pattern_pool)
+        self.assertEquals(0, compiled_metadata.mobile.possible_lengths_mask)
+        self.assertFalse(compiled_metadata.mobile.matches("6502530000"))
+        self.assertEquals("fixed_line",
+                compiled_metadata._match_number_type_sequentially(
+                        "6502530000"))
+        self.assertEquals("fixed_line",
+                          compiled_metadata.match_number_type("6502530000"))
+        self.assertEquals(phonenumberutil.TYPE_FIXED_LINE,
+                phonenumberutil.PhoneNumberUtil()._get_number_type_helper(
+                        "6502530000", compiled_metadata))
+
+    def test_expand_template(self):
+        self.assertEquals((u"%s %s-%s", (1, 2, 3)),
+                          compiledmetadata.expand_template(u"$1 $2-$3"))
+        self.assertEquals((u"(%s) %s", (1, 2)),
+                          compiledmetadata.expand_template(u"($1) $2"))
+        self.assertEquals((u"%% %s", (1,)),
+                          compiledmetadata.expand_template(u"% $1"))
+        self.assertEquals((u"123", ()),
+                          compiledmetadata.expand_template(u"123"))
+        self.assertEquals((None, ()),
+                          compiledmetadata.expand_template(u"$1\\$2"))
+        self.assertEquals((None, ()),
+                          compiledmetadata.expand_template(u"$12"))
+
+    def test_format_match_agrees_with_sub(self):
+        for region_code in ("AR", "DE", "GB", "US"):
+            compiled_metadata = \
+                    self.generation.get_compiled_metadata_for_region(
+                            region_code)
+            for compiled_format in (compiled_metadata.number_formats +
+                                    compiled_metadata.intl_number_formats):
+                for length in xrange(3, 13):
+                    number = u"1234567890123"[:length]
+                    match = compiled_format.pattern.match(number)
+                    if match:
+                        self.assertEquals(compiled_format.pattern.sub(
+                                compiled_format.number_format.format.replace(
+                                        u"$", u"\\"), number),
+                                compiled_format.format_match(match))
+
+    def test_format_match_falls_back_to_re(self):
+        number_format = phonemetadata_pb2.NumberFormat()
+        number_format.pattern = u"(\\d{2})(\\d)?(\\d{3})"
+        number_format.format = u"$1\\$3"
+        compiled_format = compiledmetadata.CompiledNumberFormat(
+                number_format, self.generation.pattern_pool)
+        self.assertEquals(None, compiled_format.template)
+        # As in re.sub(), the backslash escapes the second one.
+        self.assertEquals(u"12\\3", compiled_format.format_match(
+                re.match(number_format.pattern, u"12345")))
+        # A group that takes no part in the match fails as it does in re.
+        number_format.format = u"$1 $2 $3"
+        compiled_format = compiledmetadata.CompiledNumberFormat(
+                number_format, self.generation.pattern_pool)
+        self.assertRaises(re.error, compiled_format.format_match,
+                          re.match(number_format.pattern, u"12345"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for countrycodeindex."""
+
+import unittest
+
+from phonenumbers import countrycodeindex
+from phonenumbers.test import countrycodetoregioncodemapfortesting
+from phonenumbers.test import metadatafortesting
+
+
+class CountryCodeIndexTest(unittest.TestCase):
+    def test_generated_tables_match_mapping(self):
+        for module in (countrycodetoregioncodemapfortesting,
+                       metadatafortesting):
+            self.assertEquals(
+                    countrycodeindex.build_region_codes_by_country_code(
+                            module.country_code_to_region_code_map),
+                    module.region_codes_by_country_code)
+            self.assertEquals(
+                    countrycodeindex.build_country_code_by_region_code(
+                            module.country_code_to_region_code_map),
+                    module.country_code_by_region_code)
+
+    def test_get_region_codes_for_country_code(self):
+        region_codes_by_country_code = \
+                countrycodetoregioncodemapfortesting.\
+                region_codes_by_country_code
+        self.assertEquals(countrycodeindex.COUNTRY_CODE_SLOTS,
+                          len(region_codes_by_country_code))
+        self.assertEquals(("US", "BS"),
+                countrycodeindex.get_region_codes_for_country_code(
+                        region_codes_by_country_code, 1))
+        for country_code in (0, 2, -1, 1000, 12345):
+            self.assertEquals(None,
+                    countrycodeindex.get_region_codes_for_country_code(
+                            region_codes_by_country_code, country_code))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for dfacompiler."""
+
+import os.path
+import re
+import unittest
+
+from phonenumbers import buildconstants
+from phonenumbers import buildmetadatafromxml
+from phonenumbers import compiledmetadata
+from phonenumbers import dfacompiler
+from phonenumbers import metadata
+from phonenumbers import metadatadfa
+from phonenumbers import metadatageneration
+from phonenumbers import patternpool
+from phonenumbers.test import metadatadfafortesting
+from phonenumbers.test import metadatafortesting
+
+
+_XML_FILE = os.path.join(os.path.dirname(buildconstants.__file__),
+                         "PhoneNumberMetaData.xml")
+_TEST_XML_FILE = os.path.join(os.path.dirname(buildconstants.__file__),
+                              "PhoneNumberMetaDataForTesting.xml")
+
+
+def _get_test_strings(max_length=12):
+    """Returns strings of digits of every length up to max_length, with a few
+    non-digit strings."""
+    strings = [u"", u"NA", u"1-2", u"12a"]
+    for length in xrange(1, max_length + 1):
+        for first_digit in u"0123456789":
+            strings.append((first_digit + u"12345678901234567890")[:length])
+            strings.append((first_digit + u"98765432109876543210")[:length])
+    return strings
+
+
+class DFACompilerTest(unittest.TestCase):
+    def assertMatchesLikeRe(self, regex):
+        dfa = dfacompiler.compile_dfa(regex)
+        anchored_pattern = re.compile(patternpool.anchor_regex(regex))
+        for string in _get_test_strings():
+            self.assertEquals(bool(anchored_pattern.match(string)),
+                              dfa.full_match(string), (regex, string))
+
+    def test_matches_like_re(self):
+        for regex in (u"\\d{7,10}", u"[2-9]\\d{2}", u"1(?:2|34)?5", u"NA",
+                      u"(?:1|12)+3*", u"0[1-35-8]\\d{0,}", u"8~10",
+                      u"(1)(2)?", u"", u"[1-3\\d]{2}",
+                      u"2(?:4(?:2|3-59]|3[13]))\\d{2}"):
+            self.assertMatchesLikeRe(regex)
+
+    def test_unsupported_patterns(self):
+        for regex in (u"^1", u"1$", u"(?=1)1", u"(1)\\1", u"[^1]", u".",
+                      u"1+?", u"\\s", u"[a-z]", u"(1"):
+            self.assertRaises(dfacompiler.UnsupportedPatternError,
+                              dfacompiler.compile_dfa, regex)
+        self.assertRaises(dfacompiler.UnsupportedPatternError,
+                          dfacompiler.compile_dfa, u"\\d{1,1000}",
+                          max_states=100)
+
+    def test_several_patterns(self):
+        dfa = dfacompiler.compile_dfa([u"\\d{3,4}", u"1\\d+", u"NA"])
+        self.assertEquals(3, dfa.match_mask(u"123"))
+        self.assertEquals(1, dfa.match_mask(u"234"))
+        self.assertEquals(2, dfa.match_mask(u"12345"))
+        self.assertEquals(4, dfa.match_mask(u"NA"))
+        self.assertEquals(0, dfa.match_mask(u"1A"))
+        # Every pattern must match.
+        self.assertFalse(dfa.full_match(u"1234"))
+        dfa = dfacompiler.compile_dfa([u"\\d{3,4}", u"1\\d+"])
+        self.assertFalse(dfa.full_match(u"234"))
+        self.assertTrue(dfa.full_match(u"1234"))
+
+    def test_minimal(self):
+        # The dead state, the start state and one state per digit read.
+        self.assertEquals(5, dfacompiler.compile_dfa(
+                u"(?:1|2)(?:3|4|5)\\d").state_count)
+        self.assertEquals(4, dfacompiler.compile_dfa(
+                u"12|22|32").state_count)
+        self.assertEquals(3, dfacompiler.compile_dfa(u"1|1").state_count)
+
+    def test_match_lengths_mask(self):
+        self.assertEquals((1 << 3) | (1 << 5), dfacompiler.compile_dfa(
+                u"\\d{3}(?:\\d{2})?").get_match_lengths_mask(17))
+        self.assertEquals(1 << 9, dfacompiler.compile_dfa(
+                [u"\\d{7,10}", u"[2-9]\\d{8}"]).get_match_lengths_mask(17))
+        self.assertEquals(0, dfacompiler.compile_dfa(
+                [u"\\d{3}", u"\\d{4}"]).get_match_lengths_mask(17))
+        self.assertEquals(None, dfacompiler.compile_dfa(
+                u"1\\d+").get_match_lengths_mask(17))
+        self.assertEquals(None, dfacompiler.compile_dfa(
+                u"\\d{1,18}").get_match_lengths_mask(17))
+
+    def test_serialization(self):
+        dfa = dfacompiler.compile_dfa([u"\\d{3,4}", u"1\\d+", u"NA"])
+        copy = dfacompiler.dfa_from_string(dfacompiler.dfa_to_string(dfa))
+        self.assertEquals(dfa.regexes, copy.regexes)
+        self.assertEquals(dfa.symbols, copy.symbols)
+        self.assertEquals(list(dfa.transitions), list(copy.transitions))
+        self.assertEquals(list(dfa.accept_masks), list(copy.accept_masks))
+
+    def test_serialization_of_many_regexes(self):
+        regexes = [u"%d" % number for number in xrange(32)]
+        dfa = dfacompiler.compile_dfa(regexes)
+        copy = dfacompiler.dfa_from_string(dfacompiler.dfa_to_string(dfa))
+        self.assertEquals(list(dfa.accept_masks), list(copy.accept_masks))
+        self.assertEquals(1 << 31, copy.match_mask(u"31"))
+        # The accept masks of more would not fit in 32 bits.
+        self.assertRaises(dfacompiler.UnsupportedPatternError,
+                          dfacompiler.compile_dfa, regexes + [u"32"])
+
+
+class NumberDescDFATest(unittest.TestCase):
+    def assertDFAMatchesLikeRe(self, metadata_module, dfa_module, xml_file):
+        generation = metadatageneration.MetadataGeneration(
+                1, metadata_module=metadata_module)
+        dfa_generation = metadatageneration.MetadataGeneration(
+                1, metadata_module=metadata_module, dfa_module=dfa_module)
+        national_numbers_by_region_code = {}
+        for region_metadata, _, example_number in _iter_example_numbers(
+                xml_file):
+            national_numbers_by_region_code.setdefault(
+                    region_metadata.id, []).append(example_number)
+        for region_code in generation.supported_countries:
+            compiled_metadata = generation.get_compiled_metadata_for_region(
+                    region_code)
+            dfa_compiled_metadata = \
+                    dfa_generation.get_compiled_metadata_for_region(
+                            region_code)
+            if compiledmetadata.get_number_desc_regexes(
+                    compiled_metadata.metadata):
+                # The generated DFA module is up to date.
+                self.assertTrue(dfa_compiled_metadata.number_desc_dfa
+                                is not None, region_code)
+            national_numbers = national_numbers_by_region_code.get(
+                    region_code, [])
+            for example_number in list(national_numbers):
+                # Also try the numbers a digit short and a digit long.
+                national_numbers.extend([example_number[:-1],
+                                         example_number + u"0"])
+            for national_number in national_numbers:
+                self.assertEquals(
+                        compiled_metadata.match_number_type(national_number),
+                        dfa_compiled_metadata.match_number_type(
+                                national_number),
+                        (region_code, national_number))
+                for field_name in patternpool.NUMBER_DESC_FIELDS:
+                    # Descriptions without patterns are never matched.
+                    if getattr(compiled_metadata,
+                               field_name).possible_number_pattern is None:
+                        continue
+                    self.assertEquals(
+                            getattr(compiled_metadata, field_name).matches(
+                                    national_number),
+                            getattr(dfa_compiled_metadata, field_name).matches(
+                                    national_number),
+                            (region_code, field_name, national_number))
+
+    def test_example_numbers_for_testing(self):
+        self.assertDFAMatchesLikeRe(metadatafortesting, metadatadfafortesting,
+                                    _TEST_XML_FILE)
+
+    def test_example_numbers(self):
+        self.assertDFAMatchesLikeRe(metadata, metadatadfa, _XML_FILE)
+
+    def test_stale_dfa_is_ignored(self):
+        generation = metadatageneration.MetadataGeneration(
+                1, metadata_module=metadatafortesting)
+        region_metadata = generation.get_metadata_for_region("US")
+        stale_dfa = dfacompiler.dfa_from_string(
+                metadatadfafortesting.number_desc_dfas["GB"])
+        compiled_metadata = compiledmetadata.CompiledPhoneMetadata(
+                region_metadata, generation.pattern_pool, stale_dfa)
+        self.assertEquals(None, compiled_metadata.number_desc_dfa)
+        self.assertEquals("toll_free",
+                          compiled_metadata.match_number_type("8002530000"))
+
+
+def _iter_example_numbers(xml_file):
+    # Example numbers are only kept by the "lite" build.
+    for region_metadata in buildmetadatafromxml.iter_phone_metadata(xml_file,
+                                                                    True):
+        for field_name in patternpool.NUMBER_DESC_FIELDS:
+            example_number = getattr(region_metadata,
+                                     field_name).example_number
+            if example_number:
+                yield region_metadata, field_name, example_number
+
+
+if __name__ == "__main__":
+    unittest.main()
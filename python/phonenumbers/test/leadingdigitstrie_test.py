@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for leadingdigitstrie."""
+
+import unittest
+
+from phonenumbers import leadingdigitstrie
+from phonenumbers import metadata
+from phonenumbers import metadatageneration
+from phonenumbers.test import metadatafortesting
+
+
+def _get_matching_formats(compiled_formats, national_number):
+    return [compiled_format for compiled_format in compiled_formats
+            if compiled_format.leading_digits_pattern is None or
+            compiled_format.leading_digits_pattern.match(national_number)]
+
+
+class LeadingDigitsTrieTest(unittest.TestCase):
+    def test_expand_leading_digits(self):
+        self.assertEquals([u"2", u"3", u"4", u"51"],
+                          leadingdigitstrie.expand_leading_digits(
+                                  u"[2-4]|51"))
+        self.assertEquals([u"12", u"13", u"2"],
+                          leadingdigitstrie.expand_leading_digits(
+                                  u"1[23]|2"))
+        # Only the shortest prefix is kept.
+        self.assertEquals([u"1"],
+                          leadingdigitstrie.expand_leading_digits(u"1|12"))
+        self.assertEquals([u""],
+                          leadingdigitstrie.expand_leading_digits(u"\\d*"))
+
+    def test_expand_leading_digits_limits(self):
+        self.assertEquals(None,
+                          leadingdigitstrie.expand_leading_digits(u"(?=1)1"))
+        self.assertEquals(None,
+                          leadingdigitstrie.expand_leading_digits(
+                                  u"123456789"))
+        self.assertEquals(None,
+                          leadingdigitstrie.expand_leading_digits(
+                                  u"[1-9]\\d{3}"))
+
+    def assertCandidatesMatch(self, metadata_module):
+        generation = metadatageneration.MetadataGeneration(
+                1, metadata_module=metadata_module)
+        for region_code in generation.supported_countries:
+            compiled_metadata = generation.get_compiled_metadata_for_region(
+                    region_code)
+            for compiled_formats in (compiled_metadata.number_formats,
+                                     compiled_metadata.intl_number_formats):
+                trie = leadingdigitstrie.LeadingDigitsTrie(compiled_formats)
+                for first_digits in xrange(1000):
+                    national_number = u"%03d4567890" % first_digits
+                    matching_formats = _get_matching_formats(compiled_formats,
+                                                             national_number)
+                    candidate_formats = trie.get_candidate_formats(
+                            national_number)
+                    # The candidates keep the formats' order and include
+                    # every format that matches.
+                    self.assertEquals(
+                            matching_formats,
+                            _get_matching_formats(candidate_formats,
+                                                  national_number),
+                            (region_code, national_number))
+
+    def test_candidates_for_testing(self):
+        self.assertCandidatesMatch(metadatafortesting)
+
+    def test_candidates(self):
+        self.assertCandidatesMatch(metadata)
+
+    def test_short_format_lists_are_not_indexed(self):
+        generation = metadatageneration.MetadataGeneration(
+                1, metadata_module=metadatafortesting)
+        compiled_metadata = generation.get_compiled_metadata_for_region("US")
+        self.assertTrue(compiled_metadata.number_formats is
+                        compiled_metadata.get_candidate_formats(u"6502530000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for metadataarray."""
+
+import unittest
+
+from phonenumbers import buildconstants
+from phonenumbers import metadataarray
+from phonenumbers import phonemetadata_pb2
+from phonenumbers.test import countrycodetoregioncodemapfortesting
+from phonenumbers.test import metadatafortesting
+
+
+def _load_metadata_from_region_file(region_code):
+    f = open(buildconstants.TEST_META_DATA_FILE_PREFIX + "_" + region_code,
+             "rb")
+    metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    metadata_collection.ParseFromString(f.read())
+    f.close()
+    return metadata_collection.metadata[0]
+
+
+class MetadataArrayTest(unittest.TestCase):
+    def test_generated_module_matches_region_files(self):
+        self.assertEquals(
+                countrycodetoregioncodemapfortesting.
+                        country_code_to_region_code_map,
+                metadatafortesting.country_code_to_region_code_map)
+        for region_code, array in \
+                metadatafortesting.country_to_metadata.items():
+            self.assertEquals(_load_metadata_from_region_file(region_code),
+                    metadataarray.array_to_metadata(array))
+
+    def test_round_trip(self):
+        metadata = _load_metadata_from_region_file("AR")
+        array = metadataarray.message_to_array(metadata)
+        self.assertEquals("AR", array[9])
+        self.assertEquals(54, array[10])
+        self.assertEquals(metadata, metadataarray.array_to_metadata(array))
+
+    def test_unset_description_is_present(self):
+        metadata = metadataarray.array_to_metadata(
+                metadatafortesting.country_to_metadata["AD"])
+        self.assertTrue(metadata.HasField("general_desc"))
+        self.assertTrue(metadata.IsInitialized())
+
+
+if __name__ == "__main__":
+    unittest.main()
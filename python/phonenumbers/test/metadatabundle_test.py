@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for metadatabundle."""
+
+import cStringIO as StringIO
+import os
+import tempfile
+import unittest
+
+from phonenumbers import buildconstants
+from phonenumbers import metadatabundle
+from phonenumbers import phonemetadata_pb2
+from phonenumbers.test import countrycodetoregioncodemapfortesting
+
+
+def _load_metadata_from_region_file(region_code):
+    f = open(buildconstants.TEST_META_DATA_FILE_PREFIX + "_" + region_code,
+             "rb")
+    metadata_collection = phonemetadata_pb2.PhoneMetadataCollection()
+    metadata_collection.ParseFromString(f.read())
+    f.close()
+    return metadata_collection.metadata[0]
+
+
+class MetadataBundleTest(unittest.TestCase):
+    def setUp(self):
+        self.bundle = metadatabundle.MetadataBundle(
+                buildconstants.TEST_META_DATA_FILE_PREFIX +
+                buildconstants.META_DATA_BUNDLE_SUFFIX)
+
+    def tearDown(self):
+        self.bundle.close()
+
+    def test_bundle_matches_region_files(self):
+        region_codes = set()
+        for codes in countrycodetoregioncodemapfortesting.\
+                country_code_to_region_code_map.values():
+            region_codes.update(codes)
+        self.assertEquals(sorted(region_codes),
+                sorted(self.bundle.region_codes()))
+        for region_code in region_codes:
+            self.assertEquals(_load_metadata_from_region_file(region_code),
+                    self.bundle.load_metadata(region_code))
+
+    def test_unknown_region(self):
+        self.assertFalse(self.bundle.has_region("ZZ"))
+        self.assertEquals(None, self.bundle.load_metadata("ZZ"))
+
+    def test_write_and_read_bundle(self):
+        metadata_list = [_load_metadata_from_region_file("US"),
+                         _load_metadata_from_region_file("GB")]
+        output = StringIO.StringIO()
+        metadatabundle.write_bundle(output, metadata_list)
+        fd, file_name = tempfile.mkstemp()
+        try:
+            os.write(fd, output.getvalue())
+            os.close(fd)
+            bundle = metadatabundle.MetadataBundle(file_name)
+            self.assertEquals(["GB", "US"], sorted(bundle.region_codes()))
+            self.assertEquals(metadata_list[1], bundle.load_metadata("GB"))
+            bundle.close()
+        finally:
+            os.remove(file_name)
+
+    def test_rejects_other_files(self):
+        self.assertRaises(metadatabundle.BundleFormatError,
+                metadatabundle.MetadataBundle,
+                buildconstants.TEST_META_DATA_FILE_PREFIX + "_US")
+
+
+if __name__ == "__main__":
+    unittest.main()
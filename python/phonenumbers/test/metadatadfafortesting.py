@@ -0,0 +1,40 @@
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This file is automatically generated by buildmetadataprotofromxml.py. Do
+not modify directly."""
+
+
+# A mapping from a region code to the DFA of the number descriptions of that
+# region, serialized by dfacompiler.dfa_to_string(). Regions whose patterns
+# the DFA compiler does not support are left out.
+number_desc_dfas = {
+'AD': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'AO': 'eNq90TtOw0AQxvE/dgIxMQ+b9yOEN6ZIgREE0yAuwAVsOjfUyBX4LhyFo3ATmHXEJ6dMAT9pZmfXu15pJ/GBJLZUdS0V5VtWV4FVeZo92+yubq0PrEqLMnm4z9Pbkfv+XpST8tJ23LT39q3K8qvRtfvLuK48mz89/sWQuKFJL3OWXr9cbvE832t0uswLLAj0giDoNaaOLvYFwnAptDCwLLAi0/euCkRRHFkYiMWt/4I1gXWBDYFNgS2BbYEdgV2BPYF9gYHAgcBQ4FDgSOBY4ETgVOBM4FzgQpjZpN0d1+6PGY59fvv8B+sU1hXs5Rhb/ACJZkk5',
+'AR': 'eNq108tSwjAUxvE/LSAoouL9fkNFRW1FEbzjA7hzWKg7N66drqTjY/oyLjwU+Sw7xstvJsnJSZpJpknJBUoFq4KMVQ9Pr9Wy74fBqHXu/b1KtVZ/tGS97HthbIZ1Br9mRMNhkO2M+V70eXvBetQNW7FJ6e6kMBiwsOZZp9aTzltYLVm+5XvbljsJA8dSt42fNqV2E1XPCateiu0Dxziu6zpO0kmlB8gIZAUGh3JfYDj3HeelZ8mRUYExgYJYPN4F47F4QmBSevc8JTAtMCMwKzAnMC+wILAosCSwLLAisCqwJrAuUBTYENgU2BL7TQLbAjsCuwJlgT2BfYEDAU/AFzgUqAgcCRyLXVCBE7H7LHb7BU4FzgTOBS4ELgWuBK4FGtJffCP0pfNkku0nk0vwOx8ufyX1z+XOzvpmpWlbblr7nui09nqx14ndCj4BOWCSBw==',
+'AU': 'eNqt0zlPw0AQhuGX2AmYI9wk3DcECGDnIuEOV0lFB3Q01MgVyq/jb1EwxujDkYgQEY+0O+OZXSeWvQUHKIzZFPbZ9PD0Wi0G1VY4bBf3wW71oP5otUoxqLTCdLyg0QoHom6pHDfryU7GskpczMTFwG+FnqVB3fftstbWyEaNhn/vB6XaY9xNWem22W0oROFzeu6x6eUuer6ElOO66UzKdVO99Al4X/rt0QYFhuR7jee13TI7LDAiMJrIxxL5uMCEtP/PSYEpgVwiz+fzFvOf+bTAjMCswJzAvMCCwKLAksCywIrAqsCawLrAhsCm2GsS2BLYFtgRKArsCuwJ7Av4Yh+ZQEmgLPbdClQFagIHAnWBhsChwJHAsbSvSeYnAqfSOT8TOBdoClwIXApcCVwL3AgdxUfMjY7YXA/de3f+vCX6OeeH8V91O3HkEsNOAva2adqGSxtvUXS+9/8WPwATKJhR',
+'BS': 'eNrNk0lz00AQhV/sJITVJBFLAGF2JIjksaSR7LCEAAlw4UZxECo4cOFMuaCK8e/kz3CgR2M/j4sb5MBX1T2vW93TGtUo6gKItsRNNsR9+Pyj2h2q6SS06azIzChSypSlqSozGsVmrFRsi6bL5Z8kkOpofy8XU5mps7xs6mEybkxRqyQrrNKiylFjqjpPdNWYcZ0luolNIT2ZdEhKD01ZyLDYaNmlzGWwyuzEYjpZdxPtvJ3ZvFxXJtdjU8iqdfVn4bbI5SO4t/dK7EHkWC7fkeDtwd8ukV1a92VF3Nfv9ut6dDrdjmV1bR0nCFq9MdMn2/XU6TOiz3o1Hud6BOj1zlNvLuUtm562AbUEwJZX77NNgCAILly8dHknCIArBLhKgGsECAlwPez3b9zs3wpv2/ydMLx7777LC5GrERcv6he9DwjwkAC7BEiI1elCp3MAcYmnLYN00Pa2j2a9Vs/3scrl3ZYDl59P4NzU04OFTtsaRYAhkWtLgJwABQE0AUoCVERuNZHrS4A9AjwiwGMCPCHAUwLsE+AZAQ4I8JwALwjwkgCHBDgiwCsCvCbAG4Jjw/2Gq/Y3jFb+YZ9fXfxPrB2TvZNv8l7so9g3sZ82lqP+BvRMvNE=',
+'DE': 'eNq900lv00AYxvF/ancLS6HpQtgKlMWBBLxkscvSFtqyLzcOJuLChTOKOGB/Q+58GQ68jpsHBwlRIcQvemeemfGMomTsOYC3bM1owZp3H76E7aCbTwbd6qBciYsN21tp2O30h8VsnkWpH3USG2TpIE6GxWpQjv00tNBq2XNRO85Hi+VJgd8Ogny0aaPA69lEkmcD6+I866d+ODyMkfWDvDWam+wqv0rs++OFX05bs1Hi+14aRL3ihH6eJYcHzNjSq92/7byiGzcfa9Z8+lr8ZhUzjjvruu7c/MIidaHMx46fKPJJsVyvKy9V5k9V8ulKrlhuCKyI5cbK6mR+VWBNoNH4mdcr+UwlVzUFzgqcEzgvcEFs78Xxp9ncgEsClwWuCGwKXBW4JnBd4IbYXyPQErgpcEugLdARuC1wR8AXu64CoUAk0BXoCfQFBmL3WewCC2wJ3BW4J3Bf4IHAtsCOwK7AQ4FHAnsC+wIHAo8Fngg8FXgm8Fym51/I9Hw1vxR7G+Vo+bXAG5m+5+Wr7Rav9l6NI5v9Q/Hd+e3a/D+opf+w9rZW1mer91bfirFTzq1bDaw2iuxM7/sBN27aOA==',
+'GB': 'eNrF00lTE0EYxvE/hBAGFAjIEjeQNcGMTsgySVzYVLawaBWVQ0h58cLZSnkQPybFF/CD+HYGnmIqHqX8VXXPM73NJNOdTQDZCas6Q1adf/tZyReCX53B6MbFWPuw3bQKfqVtLbXYsFGLoXWVQ7/mequx3pTFatDTPGKx1goK1d4ZM25GdqNeahX9cvsybAX+ejtnnWHPwmHw1+eVK1Fzv+Xjrfgl6y7d6qLPqu+/3f9wR3/CDCSSg6khPIFhuc0j3fzgoeNZgVEbOeZ54258Oh3NTHux5ScmBR4JTAlMC8wIzArYAplMJlrnJnTzY4n/ricCTwWeCTwXmBOYF3ghsCCwKLAksCywIrAq9jkEcgJrAi8F8gK+wCuB1wKBQEFgXaAoUBLbSwIVsa0ntlvFNrVAXeCNwFuBdwLvBTYENgW2BLYFdgQ+CHwU+CSwK7AnsC9wIHAo0BA4EjtdAicCpwKfBb4I9y468gPuyDf6/uXCiXt/9eR/Ls0z+OrKleUO/LB8baXZttKEP9l7w6M=',
+'IT': 'eNq11MlO40AQxvF/MGEZ1sHs+zIMCQTGJhDisIb1hoQ4ziDNgQtn5BP46XgEXocD1U74ICAQQuInVXdVd7vlKN3OeUCuz5q4zZp/lzelQhgmcbcVf4NiObqwofVCGCRxe20+DNIFrgqsjNK5+rPPRdGqciFK4tanXS33LS8Hud2Ke7CU3LpFxST/dk1ka1bTydsoXZqPm2z8tPrVLue6tLnKWHP93/3sF5o8r9kz2ZZW2gTaBX4IdHTWdUGnNGzZ3SPQK/BToM/3+/0U+OLygVo62PieQwLDAiMCowJjAuMCEwKTAlMC0wIzArMCcwK/BOYFfgssiP0dAnmBRYElgYLAssCKwB+x0ykQCqyKHVN5P18TWBcoCWyInV6BSKAisCmwJbAtsCOwK7AnUBXYFzgQOJT38yOBY4ETacw/o3bdmt11m87wdQ8e3+3A3q+aqfVPced677l+Pf/R+LnFmcW1xX29Pre97FYxYLHhrrKFfRnIWrgP4CMaN6ke',
+'JP': 'eNrTYGZgYNDgARKlTEDCz5EWlAaIAhOZjECi2IABF2BC5jAjcyDaQUQxB1zwPz8A6WURMg==',
+'KR': 'eNq11NduE0EUxvF/YjsO4BKHhNBDx4Y1uJdQQui9BwPGhBLqFRKyuMD7RjwMd7wOZ73rT7sWF1iCn3RmzozPzFqr2cnHgPy8Nf1Za15sfq855ZLbX7BBt1xstns2VXXa7qBlScuNVjW8xasrlUG3WutZebU3qFtX7w0a1tV6BfuxbNUVp+oOupXicLeG03QLo33aw33mbFDuloqVul/SdOxJiaDC7Scta5W8+fBsyrJGSbu6/WmbuLs26mb8Qm97b3295P//selmMB1d63d5rxs2n6as+Rr3nh0yHYsnEjPJ2S1bt5ESSKfTmUzaA5nsXMDyXC6XGYL5XC4YwfZRavlCZgQWd4zY2tB8yNJOgV0CuwX2COwVq9m3PwDL4q09EICDAocEDkv0nRwROCpwTOC42OsVKAicEDgp4AgUBU4JnBYoiZ0wgYpAVaAmdmTEDprYmRE7lgJtgRWBMwJnBc4JnJdovipwQWBN4KLAJYHLAlcErgpcE7gucEPgpkTnbwncFrgj9hUJ3BO4L/BA4KHAI4HHAusCTwQ6Ak8Fngk8F7vfxK4EgZ7AS4ENgVcCrwXeCLwV2BR4J/Be4INE849iN5FEaz5LdP9w/q/4V2LcuxJ/TPF/pWITL/Fu6WQQ2VA+HolQjNdn/7J+0tpJ/sOf6tbtfX+z6FhsBOHlnZjf/wrGi/ZZNS2WLJa9/ovFT/gN7a05Qg==',
+'MX': 'eNqt0ztOw0AQxvE/cV4EAiS8328wkICdAMElBaKDAwQ6GmrkCvlG3IVLcAwKZpPwsRJCQoGfNLuzM1rLksdhAIR1W9KyLXcPz51GHGdp1Q7duJncWyVpxFHmte1Qce3WoJ2lxX7PXSxZGrs8+ioPbl9EkXvAt3ryWc/Z4eZy2C10W295HLHl6cWlnlyQ7ykUS5QFRgUqAmNePu7lnuqEwKTAlEDNy+te7psWmBGYFZgTmBdYEFgUWBJYFlgRWBVYE1gX2BDYFNgS2BbYEdgV2BPYF/tkAgcChwJHAg2BpsCxwIlAJDaZAi2BtsCpwJnAuUBHbKzl5/w3+qObd6P7xpDeA/5b4Q9xZT/itcWtxavb7fVqVm+7kbf4ANejcLw=',
+'NZ': 'eNrV1Mlv00AUx/Fvk4aWEgwECoSt7CSQgu0kTlyWtuw7tGE34cSFc8iJ+K/k3+HAsx3/cISQEIgDH2lm3nszHluWPY0y0KhZN1607v3HL72W58bjqiWRvxoO00oYjxfy2X489iz2O24YWqEdTxrra21b2wuHk6hjvcVB35Ig8ttd26Jpy4I437+f7r+dbGEXRq7fS+8RT5LdgpYFntVdS7pJEnn+MI0Di9vZA3Xj5qQTeVli9f70wZr5PcL0HkuW9F13uu3Pc+GPuZKlTzf/dGgkQ9p9mrNu9HmeGaVSeb6yY6GyuHOJXQLV3VVnj+NU9+4Dx6mlnJpi65M4l9WzKdhfqB8orC9YPihwSOBwvX4kA0cFjhXWHBeoC5wQWClce7IQF50SOC1wRuCswDmB81KIL9irFmgKXBS4JNASWBW4LHBFwBXwpBD70Bb7kAU6Al2BQKAn9oGKfZACawJXBa4JXBe4IbAusCGwKXBT4JbAbYE7AncF7gncF3gg8FDgkcBjgSdif5HAM4HnAlsC2wIDgRcCLwVeyWz9tfw6Ll77RuCtwDuxg1PsxJHZ+lDgg/BXsiMoOXxGkzn+jW9l/heV32zL1uzEo1doSb4yHfO2Ze90NG0Da1+TsZzVB9N6XvsO9f8TBw==',
+'PL': 'eNrF08tKw1AUheHfprU18Vrv13o3VauJYJo4EV/AmSCkwYkTx9KRLb6eb+GLOHCnLYs4Ezvwg+y9TrI5BHLiO4Bft9KtWOk8vyX9rmspDVtJZsu4/5sHjXyX25vrNAizXpQGUZL12ulVbC2OmzbTLk7XLMVBYIuoeLtqqR0Mh0uW7+/+2vy8DcrLhJXXxzwWlBxTrkxWnRpTAq6A5xXyoFv1YNodrSzPjCY898f2s3MC8wILAnWBxcJM0ZLAssCKwKrAmsC6wIbApsCWwLbAjkBDYFdgT2Bf4EDgUOBI4FjgROyTCTQFTgXOBM4FWgIXApcCgUAojGV4zMr5MfsYZ58vh//yYD/Jk13vebfX+LT+DYt2YbQ=',
+'RE': 'eNrN07tSwkAUxvG/QQXxjiLe75egoiFgIFo4voCdY4EZGxtrx7EwvKOdr+EDWHgS9DNYOhb+Zvbk27PZHRgWNwe4JSuPQ1Zu7p7D7mPRUscP2pFN293MQsGSH/g2CbLtZHvgnp+GHb8Rxc1W9ecLeUttz3Ir291Ourat3vHqUexbPQmiuN2Mw45Xa7RqYfR5kGMvXl789uEmj7TcD1h5eElihuPkHMcZdIacYfIChdSIjV4uJmUUxsYn0pXJqb5jpksCM5Lk2UxOlXu5XP7qzwlUKt9705yW3t6K+p8rlf7vMi+wILAosCSwLLAisCqwJrAusCGwKbAlsC2wI7ArsCf2MwlUBfYFDgQOBWoCRwLHAp5AXexSCzQEmgInYrddoCV2nQVCgVOBM+HP9K73YHK93/7qzPcc/82V/YGvbdzaeLLxmsztY34AANx65Q==',
+'SG': 'eNrN08lSwkAQxvE/BBBwQVFwV9xRURNRFjdEXG6+gFrlwYtnKyeLp+O1PDiB8NWgJ/Xir9IzPdOdVKWSKTpAMWsGP2mGx5f3Wsnz2n7GLB68cqVWfzJ71ZLntv142ND2U0G1XOmWvu2Ht/RWJvPc7hPTZuU1aq7bKybCotfr8+r9QtSs7pu/nYrB1B1eI2Z4ew7ezxJ1orGoueKJIZICqVB6GEYERsf6YMzKLZlxgQmBrJVPWvmUQC7fB3krt00LzAjMWvmclc8LLAgsCiwJLAsUBFYEVgXWBNYFNgQ2BbbEfBqBbYEdgV2BksCewL7AgYAr5p8SOBQoCxwJHAtUBKoCNYG6wInAqcCZwLkM9lzI4H5D4FKgKXAl0BK4FrgRuBW4k8Gen+odt1hw3AoR/ubD4T/JBcfPCnNCqIYRvKrzJcwXoWVFJ9gzjS0TnWA2TZ9P2JqD',
+'US': 'eNq108tOwkAUxvG/FLHetYgXvN+LghaJUHb6Au5coTs3rg0rS3w1H8xEz1DzOS6R+Etmzneak+mi0zgA4si2fmjbw9Nrp95MBv2qNb1mq9F9tEfdQXbVSxqt67xNB/82W8pn3WTZYhonSdZuZ51OlqY1d8ivEXdyN0ny5wVr7m7/WmJXhtvzhG0vNy56CkExcCZLU4QC05Ln8DvPDOvs3LzlBW/Gs7gksCwQeTmvkZdd8zMfWS57874VgYrAqsCawLrAhkBVYFNgS2BbYEdgV2BPYF/gQOBQ4EjgWOBE4FTs8wnUBM4EzgXqAg2BC4FLYWT5dSq66/TOmD6CcU+gMuK6tx/hzdanq/b6L0TYbTA=',
+'YT': 'eNrF0klOw0AQheGfdkJMgABhnmcwQyAKkbF3cAF2iEVAbNiwRhYL5LtxC44DZYc8dbaAxCdV9WuX2rLkjgIgalrLqtbun97SPKtb6nXi5MG2Se4NGpY6cRr32q1uMez6w9BSfJHaJvYf1ywlbcuXeeYs31z/zRIVS9meR6y9XBXR41zgnKu4qhulJhCWxqzKXO/vYTwcGHrNxKRAQ7w85eVpmJHh72kKzMogz5V5XmBBYFFgSWC58J1XBFYF1gTWBTYENgW2BLYFdgR2BfYE9gUOBA7FfpnAkcCxwInAqUBL4EzgXPiV/nWqFNfp/SfnPwP+y63VndWj1avVh9UXtsVUZQ==',
+}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for metadatasource."""
+
+import os
+import os.path
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from phonenumbers import buildconstants
+from phonenumbers import metadatageneration
+from phonenumbers import metadatasource
+from phonenumbers.test import countrycodetoregioncodemapfortesting
+from phonenumbers.test import metadatafortesting
+
+
+_FILE_PREFIX = buildconstants.TEST_META_DATA_FILE_PREFIX
+_BUNDLE_FILE_NAME = _FILE_PREFIX + buildconstants.META_DATA_BUNDLE_SUFFIX
+_REGION_CODES = sorted(metadatafortesting.country_to_metadata.keys())
+
+
+class MetadataSourceTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_directory = tempfile.mkdtemp()
+        self.expected = metadatasource.DirectorySource(_FILE_PREFIX)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_directory)
+
+    def _make_zip_file(self, include_bundle):
+        zip_file_name = os.path.join(self.temp_directory, "metadata.zip")
+        zip_file = zipfile.ZipFile(zip_file_name, "w")
+        for region_code in _REGION_CODES:
+            zip_file.write(_FILE_PREFIX + "_" + region_code,
+                           "data/metadata_" + region_code)
+        if include_bundle:
+            zip_file.write(_BUNDLE_FILE_NAME, "data/metadata.bundle")
+        zip_file.close()
+        return zip_file_name
+
+    def _assert_source_matches_files(self, source):
+        for region_code in _REGION_CODES:
+            self.assertEquals(self.expected.load_metadata(region_code),
+                              source.load_metadata(region_code))
+        self.assertEquals(None, source.load_metadata("ZZ"))
+        reopened_source = source.reopen()
+        self.assertEquals(self.expected.load_metadata("US"),
+                          reopened_source.load_metadata("US"))
+        reopened_source.close()
+        source.close()
+
+    def test_bundle_source(self):
+        self._assert_source_matches_files(
+                metadatasource.BundleSource(_BUNDLE_FILE_NAME))
+
+    def test_module_source(self):
+        self._assert_source_matches_files(
+                metadatasource.ModuleSource(metadatafortesting))
+
+    def test_dict_source(self):
+        metadata_by_region_code = dict(
+                (region_code, self.expected.load_metadata(region_code))
+                for region_code in _REGION_CODES)
+        source = metadatasource.DictSource(metadata_by_region_code)
+        self.assertFalse(source.load_metadata("US") is
+                         metadata_by_region_code["US"])
+        self._assert_source_matches_files(source)
+
+    def test_zip_source(self):
+        self._assert_source_matches_files(metadatasource.ZipSource(
+                self._make_zip_file(False), "data/metadata"))
+        self._assert_source_matches_files(metadatasource.ZipSource(
+                self._make_zip_file(True), "data/metadata"))
+
+    def test_package_resource_source(self):
+        self._assert_source_matches_files(
+                metadatasource.PackageResourceSource("phonenumbers",
+                        buildconstants.TEST_META_DATA_RESOURCE_PREFIX))
+
+    def test_chained_source(self):
+        source = metadatasource.ChainedSource([
+                metadatasource.DictSource(
+                        {"US": self.expected.load_metadata("US")}),
+                metadatasource.DirectorySource(_FILE_PREFIX)])
+        self._assert_source_matches_files(source)
+
+    def test_generation_reads_source(self):
+        generation = metadatageneration.MetadataGeneration(1,
+                country_code_to_region_code_map=
+                        countrycodetoregioncodemapfortesting.
+                        country_code_to_region_code_map,
+                source=metadatasource.ZipSource(self._make_zip_file(True),
+                                                "data/metadata"))
+        self.assertEquals(self.expected.load_metadata("DE"),
+                          generation.get_metadata_for_region("DE"))
+        generation.source.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for patternpool."""
+
+import unittest
+
+from phonenumbers import metadataarray
+from phonenumbers import patternpool
+from phonenumbers import regextelemetry
+from phonenumbers.test import metadatafortesting
+
+
+def _get_metadata(region_code):
+    return metadataarray.array_to_metadata(
+            metadatafortesting.country_to_metadata[region_code])
+
+
+class PatternPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = patternpool.PatternPool()
+
+    def test_add_metadata_interns_strings(self):
+        de_metadata = _get_metadata("DE")
+        it_metadata = _get_metadata("IT")
+        self.assertFalse(de_metadata.pager.national_number_pattern is
+                         it_metadata.pager.national_number_pattern)
+        self.pool.add_metadata(de_metadata)
+        self.pool.add_metadata(it_metadata)
+        self.assertTrue(de_metadata.pager.national_number_pattern is
+                        it_metadata.pager.national_number_pattern)
+        self.assertEquals(_get_metadata("DE"), de_metadata)
+
+    def test_get_pattern(self):
+        metadata = _get_metadata("US")
+        self.pool.add_metadata(metadata)
+        regex = metadata.general_desc.national_number_pattern
+        pattern = self.pool.get_pattern(regex)
+        self.assertEquals(regex, pattern.pattern)
+        self.assertTrue(pattern is self.pool.get_pattern(regex))
+        # Regular expressions from elsewhere are not kept by the pool.
+        self.assertEquals(None, self.pool.get_pattern("\\d{3}-\\d{4}"))
+
+    def test_get_possible_lengths_mask(self):
+        metadata = _get_metadata("US")
+        self.pool.add_metadata(metadata)
+        self.assertEquals(
+                (1 << 7) | (1 << 8) | (1 << 9) | (1 << 10),
+                self.pool.get_possible_lengths_mask(
+                        metadata.general_desc.possible_number_pattern))
+        self.assertEquals(patternpool.ANY_LENGTH_MASK,
+                          self.pool.get_possible_lengths_mask("\\d{7,10}x"))
+
+    def test_stats(self):
+        metadata = _get_metadata("US")
+        self.pool.add_metadata(metadata)
+        self.assertEquals(0, self.pool.get_stats()["compiled_patterns"])
+        self.pool.compile_metadata(metadata)
+        stats = self.pool.get_stats()
+        self.assertEquals(stats["unique_patterns"], stats["compiled_patterns"])
+        self.assertTrue(stats["unique_patterns"] < stats["pattern_references"])
+
+    def test_compilations_are_recorded_into_telemetry(self):
+        metadata = _get_metadata("US")
+        self.pool.add_metadata(metadata)
+        self.pool.telemetry = regextelemetry.RegexTelemetry()
+        regex = metadata.general_desc.national_number_pattern
+        self.pool.compile_metadata(metadata)
+        self.pool.get_anchored_pattern(regex, "US")
+        self.pool.get_anchored_pattern(regex, "US")
+        stats = dict(((item["regex"], item["region_code"]), item)
+                     for item in self.pool.telemetry.get_stats())
+        self.assertEquals(1, stats[(regex, "US")]["compile_count"])
+        # Anchored patterns are recorded as they are matched.
+        self.assertEquals(1, stats[(patternpool.anchor_regex(regex),
+                                    "US")]["compile_count"])
+        self.assertEquals(set(["US"]), set(region_code
+                                           for _, region_code in stats))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,9 +19,13 @@ import os.path
 import unittest
 
 from phonenumbers import buildconstants
+from phonenumbers import metadatageneration
+from phonenumbers import metadatasource
+from phonenumbers import patternpool
 from phonenumbers import phonenumber_pb2
 from phonenumbers import phonenumberutil
 from phonenumbers.test import countrycodetoregioncodemapfortesting
+from phonenumbers.test import metadatafortesting
 
 
 phoneutil = phonenumberutil.PhoneNumberUtil.get_instance(
@@ -99,6 +103,253 @@ class PhoneNumberUtilTest(unittest.TestCase):
         self.assertEquals("$1 $2 $3 $4", 
                 metadata.intl_number_format[3].format)
 
+    def test_preload(self):
+        timings = phoneutil.preload(["US", "DE", "AR"], workers=2)
+        self.assertEquals(["AR", "DE", "US"], sorted(timings.keys()))
+        for seconds in timings.values():
+            self.assertTrue(seconds >= 0)
+        metadata = phoneutil.get_metadata_for_region("DE")
+        self.assertTrue(phoneutil._matches_entirely(
+                metadata.premium_rate.national_number_pattern, "9001234567"))
+        self.assertTrue(phoneutil._get_generation().pattern_pool.contains_regex(
+                metadata.premium_rate.national_number_pattern))
+
+        # What the first formatting call would otherwise build is built too.
+        util = phonenumberutil.PhoneNumberUtil()
+        util._generation = metadatageneration.MetadataGeneration(1,
+                buildconstants.TEST_META_DATA_FILE_PREFIX,
+                countrycodetoregioncodemapfortesting.
+                        country_code_to_region_code_map)
+        util.preload(["DE"], workers=1)
+        compiled_metadata = \
+                util._generation.get_compiled_metadata_for_region("DE")
+        self.assertTrue(compiled_metadata._number_format_trie is not None)
+        self.assertTrue(compiled_metadata._number_type_pattern is not None)
+
+    def test_preload_for_fork(self):
+        phoneutil.preload_for_fork(workers=2)
+        generation = phoneutil._get_generation()
+        stats = phoneutil.get_metadata_pattern_stats()
+        self.assertEquals(stats["unique_patterns"], stats["compiled_patterns"])
+        for region_code in generation.supported_countries:
+            metadata = phoneutil.get_metadata_for_region(region_code)
+            self.assertTrue(generation.pattern_pool.get_pattern(
+                    metadata.international_prefix) is not None)
+
+    def test_metadata_strings_shared_between_regions(self):
+        us_metadata = phoneutil.get_metadata_for_region("US")
+        gb_metadata = phoneutil.get_metadata_for_region("GB")
+        self.assertTrue(us_metadata.shared_cost.national_number_pattern is
+                        gb_metadata.pager.national_number_pattern)
+        stats = phoneutil.get_metadata_pattern_stats()
+        self.assertTrue(stats["unique_patterns"] <
+                        stats["pattern_references"])
+        self.assertTrue(stats["unique_strings"] < stats["string_references"])
+
+    def test_reload(self):
+        version = phoneutil.get_metadata_version()
+        old_metadata = phoneutil.get_metadata_for_region("US")
+        self.assertEquals(version + 1, phoneutil.reload())
+        self.assertEquals(version + 1, phoneutil.get_metadata_version())
+        new_metadata = phoneutil.get_metadata_for_region("US")
+        self.assertFalse(old_metadata is new_metadata)
+        self.assertEquals(old_metadata, new_metadata)
+
+    def test_reload_during_call_keeps_generation(self):
+        version = phoneutil.get_metadata_version()
+        seen_versions = []
+        original_format_national_number = phoneutil._format_national_number
+        def format_national_number(*args, **kwargs):
+            seen_versions.append(phoneutil.get_metadata_version())
+            phoneutil.reload_in_background(preload=True, workers=2).join()
+            seen_versions.append(phoneutil.get_metadata_version())
+            return original_format_national_number(*args, **kwargs)
+        phoneutil._format_national_number = format_national_number
+        try:
+            number = phonenumber_pb2.PhoneNumber()
+            number.country_code = 1
+            number.national_number = 6502530000
+            self.assertEquals("650 253 0000",
+                    phoneutil.format(number, phonenumberutil.FORMAT_NATIONAL))
+        finally:
+            del phoneutil._format_national_number
+        self.assertEquals([version, version], seen_versions)
+        self.assertEquals(version + 1, phoneutil.get_metadata_version())
+
+    def test_reload_closes_old_source_after_calls(self):
+        closed_sources = []
+        class Source(metadatasource.ModuleSource):
+            def close(self):
+                closed_sources.append(self)
+        old_source = Source(metadatafortesting)
+        util = phonenumberutil.PhoneNumberUtil()
+        util._generation = metadatageneration.MetadataGeneration(
+                1, metadata_module=metadatafortesting, source=old_source)
+        old_generation = util._generation
+        # As a call in progress on another thread would.
+        self.assertTrue(old_generation.pin())
+        util.reload(metadata_module=metadatafortesting,
+                    source=Source(metadatafortesting))
+        self.assertEquals("US", util.get_metadata_for_region("US").id)
+        self.assertEquals([], closed_sources)
+        old_generation.unpin()
+        self.assertEquals([old_source], closed_sources)
+        self.assertFalse(old_generation.pin())
+        # A source kept by the new generation is left open.
+        util.reload(metadata_module=metadatafortesting,
+                    source=util._generation.source)
+        self.assertEquals([old_source], closed_sources)
+
+    def test_unknown_region(self):
+        self.assertRaises(phonenumberutil.UnknownRegionError,
+                phoneutil.get_metadata_for_region, "ZZ")
+        self.assertEquals(None,
+                phoneutil.get_metadata_for_region_or_none("ZZ"))
+        self.assertEquals(None,
+                phoneutil.get_metadata_for_region_or_none(None))
+        self.assertEquals("US",
+                phoneutil.get_metadata_for_region_or_none("us").id)
+        self.assertFalse(phoneutil._is_valid_region_code("ZZ"))
+        self.assertFalse(phoneutil._is_valid_region_code(None))
+
+    def test_regex_telemetry(self):
+        self.assertEquals(None, phoneutil.get_regex_telemetry())
+        telemetry = phoneutil.enable_regex_telemetry(time_budget=-1)
+        try:
+            number = phonenumber_pb2.PhoneNumber()
+            number.country_code = 1
+            number.national_number = 6502530000
+            self.assertEquals("650 253 0000", phoneutil.format(
+                    number, phonenumberutil.FORMAT_NATIONAL))
+            self.assertEquals(phonenumberutil.TYPE_FIXED_LINE_OR_MOBILE,
+                              phoneutil._get_number_type_helper(
+                                      "6502530000",
+                                      phoneutil._get_compiled_metadata_for_region(
+                                              "US")))
+            self.assertTrue(phoneutil._matches_entirely("\\d{3}-\\d{2}",
+                                                        "123-45"))
+        finally:
+            self.assertTrue(telemetry is phoneutil.disable_regex_telemetry())
+        stats = dict(((item["regex"], item["region_code"]), item)
+                     for item in telemetry.get_stats())
+        # Format patterns are matched in their anchored form.
+        self.assertEquals(1, stats[(patternpool.anchor_regex(
+                "(\\d{3})(\\d{3})(\\d{4})"), "US")]["match_count"])
+        # Number types are recorded against the pattern of each description
+        # tried, here the general and the fixed line descriptions, which have
+        # the same pattern in the US test metadata.
+        us_metadata = phoneutil.get_metadata_for_region("US")
+        self.assertEquals(2, stats[(patternpool.anchor_regex(
+                us_metadata.fixed_line.national_number_pattern),
+                "US")]["match_count"])
+        self.assertEquals(1, stats[("\\d{3}-\\d{2}", None)]["match_count"])
+        # Every match goes over a negative budget, even those too quick for
+        # the clock to tell from no time at all.
+        self.assertEquals(len([item for item in stats.values()
+                               if item["match_count"]]),
+                          len(telemetry.get_over_budget_patterns()))
+        self.assertEquals(1, len(telemetry.get_slowest_patterns(1)))
+        self.assertEquals(None, phoneutil.get_regex_telemetry())
+
+    def test_get_country_code_for_region(self):
+        self.assertEquals(1, phoneutil.get_country_code_for_region("US"))
+        self.assertEquals(64, phoneutil.get_country_code_for_region("nz"))
+        self.assertEquals(0, phoneutil.get_country_code_for_region("ZZ"))
+        self.assertEquals(0, phoneutil.get_country_code_for_region(None))
+        self.assertEquals("US",
+                phoneutil.get_region_code_for_country_code(1))
+        self.assertEquals("ZZ",
+                phoneutil.get_region_code_for_country_code(12345))
+
+    def test_is_nanpa_country(self):
+        self.assertTrue(phoneutil.is_nanpa_country("US"))
+        self.assertTrue(phoneutil.is_nanpa_country("bs"))
+        self.assertFalse(phoneutil.is_nanpa_country("DE"))
+        self.assertFalse(phoneutil.is_nanpa_country("ZZ"))
+        self.assertFalse(phoneutil.is_nanpa_country(None))
+
+    def test_normalize(self):
+        self.assertEquals(u"03456234", phoneutil.normalize(u"034-56&+#234"))
+        self.assertEquals(u"034426486479",
+                          phoneutil.normalize(u"034-I-am-HUNGRY"))
+        self.assertEquals(u"255", phoneutil.normalize(u"\uFF125\u0665"))
+        self.assertEquals(u"03456234", phoneutil.normalize("034-56&+#234"))
+        self.assertEquals(u"1800333", phoneutil.normalize_digits_only(
+                u"1800-ABC-\uFF13\uFF13\uFF13"))
+        self.assertEquals(u"1800-222-333",
+                          phoneutil.convert_alpha_characters_in_number(
+                                  u"1800-ABC-DEF"))
+
+    def test_normalize_matches_alpha_pattern(self):
+        # Letters are converted when _VALID_ALPHA_PHONE_PATTERN would match,
+        # whether the number is all ASCII or not.
+        numbers = [u""]
+        for _ in xrange(5):
+            numbers = [number + character for number in numbers
+                       for character in u"1a-\n\uFF11\u0131\u00E9"]
+            for number in numbers:
+                if phonenumberutil._VALID_ALPHA_PHONE_PATTERN.match(number):
+                    table = phonenumberutil._ALL_NORMALIZATION_TABLE
+                else:
+                    table = phonenumberutil._DIGITS_ONLY_TABLE
+                self.assertEquals(phoneutil._normalize_helper(number, table),
+                                  phoneutil.normalize(number))
+        self.assertEquals(u"1800642767638",
+                          phoneutil.normalize("1800-MICROSOFT"))
+        self.assertEquals(u"1800", phoneutil.normalize("1800-MI\nCROSOFT"))
+        self.assertEquals(u"1800", phoneutil.normalize("1800-MI\xe9"))
+        self.assertTrue(isinstance(phoneutil.normalize("1800"), unicode))
+
+    def test_normalize_matches_mappings(self):
+        # Every character of the Basic Multilingual Plane is translated as
+        # looking up its upper-case variant in the mappings does.
+        number = u"".join(unichr(code_point) for code_point in xrange(0x10000))
+        for mappings, remove_non_matches, table in (
+                (phonenumberutil.DIGIT_MAPPINGS, True,
+                 phonenumberutil._DIGITS_ONLY_TABLE),
+                (phonenumberutil._ALL_NORMALIZATION_MAPPINGS, True,
+                 phonenumberutil._ALL_NORMALIZATION_TABLE),
+                (phonenumberutil._ALL_NORMALIZATION_MAPPINGS, False,
+                 phonenumberutil._ALL_NORMALIZATION_KEEPING_TABLE)):
+            expected = []
+            for character in number:
+                new_digit = mappings.get(character.upper())
+                if new_digit is not None:
+                    expected.append(new_digit)
+                elif not remove_non_matches:
+                    expected.append(character)
+            self.assertEquals(u"".join(expected),
+                              phoneutil._normalize_helper(number, table))
+
+    def test_supported_region_without_metadata(self):
+        country_code_to_region_code_map = \
+                countrycodetoregioncodemapfortesting.\
+                country_code_to_region_code_map.copy()
+        country_code_to_region_code_map[999] = ["XX"]
+        generation = metadatageneration.MetadataGeneration(1,
+                buildconstants.TEST_META_DATA_FILE_PREFIX,
+                country_code_to_region_code_map)
+        self.assertTrue(generation.is_supported_region("XX"))
+        self.assertEquals(None, generation.find_metadata_for_region("XX"))
+        # The failed load is remembered rather than retried.
+        self.assertFalse(generation.is_supported_region("XX"))
+        self.assertRaises(metadatageneration.UnknownRegionError,
+                generation.get_metadata_for_region, "XX")
+
+        # Preloading skips the regions without metadata.
+        util = phonenumberutil.PhoneNumberUtil()
+        util._generation = metadatageneration.MetadataGeneration(1,
+                buildconstants.TEST_META_DATA_FILE_PREFIX,
+                country_code_to_region_code_map)
+        timings = util.preload(workers=2)
+        self.assertTrue("XX" in timings)
+        self.assertFalse(util._generation.is_supported_region("XX"))
+        self.assertTrue(util._generation.find_metadata_for_region("US")
+                        is not None)
+        util.preload_for_fork(workers=2)
+        stats = util.get_metadata_pattern_stats()
+        self.assertEquals(stats["unique_patterns"], stats["compiled_patterns"])
+
     def test_get_length_of_geographical_area_code(self):
         number = phonenumber_pb2.PhoneNumber()
         # Google MTV, which has area code "650".
@@ -150,5 +401,39 @@ class PhoneNumberUtilTest(unittest.TestCase):
         #     phoneutil.get_length_of_geographical_area_code(number))
 
 
+class LRUCacheTest(unittest.TestCase):
+    def test_get_refreshes_recency(self):
+        cache = phonenumberutil._LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEquals(1, cache.get("a"))
+        cache.put("c", 3)
+        self.assertTrue(cache.contains_key("a"))
+        self.assertFalse(cache.contains_key("b"))
+        self.assertTrue(cache.contains_key("c"))
+
+    def test_put_existing_key_does_not_duplicate(self):
+        cache = phonenumberutil._LRUCache(2)
+        cache.put("a", 1)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertTrue(cache.contains_key("a"))
+        self.assertEquals(0, cache.get_stats()["evictions"])
+
+    def test_stats(self):
+        cache = phonenumberutil._LRUCache(1)
+        self.assertEquals(None, cache.get("a"))
+        cache.put("a", 1)
+        cache.get("a")
+        cache.put("b", 2)
+        self.assertEquals({"size": 1, "capacity": 1, "hits": 1, "misses": 1,
+                           "evictions": 1}, cache.get_stats())
+
+    def test_regex_cache_stats(self):
+        stats = phoneutil.get_regex_cache_stats()
+        self.assertEquals(phonenumberutil._DEFAULT_REGEX_CACHE_SIZE,
+                          stats["capacity"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for regexanalyzer."""
+
+import unittest
+
+from phonenumbers import metadataarray
+from phonenumbers import regexanalyzer
+from phonenumbers.test import metadatafortesting
+
+
+class RegexAnalyzerTest(unittest.TestCase):
+    def test_nested_quantifiers(self):
+        self.assertEquals(["nested quantifier: {1,3} inside {1,}"],
+                          regexanalyzer.find_issues(u"(?:\\d{1,3})+"))
+        self.assertEquals(["nested quantifier: {1,} inside {2}"],
+                          regexanalyzer.find_issues(u"(?:1\\d+){2}"))
+        # Fixed counts split a string in only one way.
+        self.assertEquals([], regexanalyzer.find_issues(u"(?:\\d{2}){1,3}"))
+        self.assertEquals([], regexanalyzer.find_issues(u"1(?:\\d{2,3})?"))
+
+    def test_ambiguous_alternations(self):
+        self.assertEquals(["ambiguous alternation inside {0,}"],
+                          regexanalyzer.find_issues(u"(?:[1-3]|2\\d)*"))
+        self.assertEquals(["ambiguous alternation inside {1,}"],
+                          regexanalyzer.find_issues(u"(?:\\d|.1)+"))
+        self.assertEquals([], regexanalyzer.find_issues(u"(?:1|2\\d)*"))
+        # Alternations that are not repeated are tried once.
+        self.assertEquals([], regexanalyzer.find_issues(u"[1-3]|2\\d"))
+
+    def test_fuzz_strings(self):
+        strings = regexanalyzer.get_fuzz_strings(u"12\\d{3}")
+        self.assertTrue(u"0" * 64 in strings)
+        self.assertTrue(u"0123456789" * 3 + u"01" in strings)
+        # The longest string on which a match stays possible, followed by a
+        # digit that ends it.
+        self.assertTrue(u"120000" in strings)
+
+    def test_analyze_pattern(self):
+        report = regexanalyzer.analyze_pattern(
+                u"\\d{7,10}", regexanalyzer.POSSIBLE_NUMBER_PATTERN,
+                ["US", "CA"])
+        self.assertEquals(["CA", "US"], report.region_codes)
+        self.assertEquals([], report.issues)
+        self.assertTrue(report.max_time > 0)
+        self.assertTrue(report.worst_input is not None)
+        self.assertEquals(u"\\d{7,10}", report.to_dict()["regex"])
+
+    def test_analyze_metadata(self):
+        metadata_list = [metadataarray.array_to_metadata(array) for array in
+                         metadatafortesting.country_to_metadata.values()]
+        reports = regexanalyzer.analyze_metadata(metadata_list)
+        patterns = set((regex, kind) for metadata in metadata_list
+                       for regex, kind in
+                       regexanalyzer.iter_metadata_patterns(metadata))
+        self.assertEquals(len(patterns), len(reports))
+        self.assertEquals(sorted(reports, key=lambda report: -report.max_time),
+                          reports)
+        self.assertEquals([], [report.regex for report in reports
+                               if report.issues])
+
+
+if __name__ == "__main__":
+    unittest.main()
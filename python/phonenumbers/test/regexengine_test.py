@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for regexengine."""
+
+import unittest
+
+from phonenumbers import metadatageneration
+from phonenumbers import phonenumber_pb2
+from phonenumbers import phonenumberutil
+from phonenumbers import regexengine
+from phonenumbers.test import metadatafortesting
+
+
+class RegexEngineTest(unittest.TestCase):
+    def get_engines(self):
+        return [regexengine.get_engine(name)
+                for name in regexengine.get_available_engine_names()]
+
+    def test_engines_agree(self):
+        for engine in self.get_engines():
+            anchored_pattern = engine.compile_anchored(u"1(?:2|34)?5")
+            self.assertTrue(engine.full_match(anchored_pattern, u"1345"),
+                            engine.name)
+            self.assertFalse(engine.full_match(anchored_pattern, u"13456"),
+                             engine.name)
+            self.assertEquals(u"1345", engine.match_prefix(
+                    anchored_pattern, u"1345").group(0))
+            pattern = engine.compile(u"(\\d{3})(\\d{4})")
+            self.assertEquals(u"123", engine.match_prefix(
+                    pattern, u"12345678").group(1))
+            self.assertEquals(None, engine.match_prefix(pattern, u"123"))
+            self.assertEquals(u"123-4567 8", engine.sub(
+                    pattern, u"\\1-\\g<2> ", u"12345678").strip())
+            self.assertEquals(u"$1-45", engine.sub(
+                    engine.compile(u"\\$NP"), u"$1", u"$NP-45", 1))
+
+    def test_dfa_engine_falls_back(self):
+        engine = regexengine.get_engine("dfa")
+        self.assertTrue(isinstance(engine.compile_anchored(u"1\\d{3}"),
+                                   regexengine._DFAPattern))
+        # Groups are needed for formatting.
+        pattern = engine.compile_anchored(u"(1)(\\d{3})")
+        self.assertEquals(u"234", pattern.match(u"1234").group(2))
+        # Lookaheads are not supported by the DFA compiler.
+        self.assertTrue(engine.compile_anchored(u"(?=1)\\d{4}").match(u"1234"))
+
+    def test_get_engine(self):
+        self.assertEquals("re", regexengine.DEFAULT_ENGINE.name)
+        self.assertEquals("re", regexengine.get_available_engine_names()[0])
+        self.assertRaises(ValueError, regexengine.get_engine, "pcre")
+
+    def test_generation_engine(self):
+        for engine in self.get_engines():
+            generation = metadatageneration.MetadataGeneration(
+                    1, metadata_module=metadatafortesting,
+                    regex_engine=engine)
+            self.assertTrue(generation.regex_engine is engine)
+            compiled_metadata = generation.get_compiled_metadata_for_region(
+                    "US")
+            self.assertTrue(compiled_metadata.toll_free.matches(u"8002530000"))
+            self.assertFalse(compiled_metadata.toll_free.matches(
+                    u"6502530000"))
+
+    def test_formatting_through_engine(self):
+        numbers = []
+        for country_code, national_number in ((44, 2070313000),
+                                              (54, 92214654321),
+                                              (1, 6502530000)):
+            number = phonenumber_pb2.PhoneNumber()
+            number.country_code = country_code
+            number.national_number = national_number
+            numbers.append(number)
+        results_by_engine = {}
+        for engine in self.get_engines():
+            util = phonenumberutil.PhoneNumberUtil(regex_engine=engine)
+            util._generation = metadatageneration.MetadataGeneration(
+                    1, metadata_module=metadatafortesting,
+                    regex_engine=engine)
+            results_by_engine[engine.name] = [
+                    (util.format(number, phonenumberutil.FORMAT_NATIONAL),
+                     util.format(number,
+                                 phonenumberutil.FORMAT_INTERNATIONAL),
+                     util.format_national_number_with_carrier_code(number,
+                                                                   u"15"),
+                     util.get_region_code_for_number(number))
+                    for number in numbers]
+        for name, results in results_by_engine.items():
+            self.assertEquals(results_by_engine["re"], results, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for regextelemetry."""
+
+import unittest
+
+from phonenumbers import regextelemetry
+
+
+class RegexTelemetryTest(unittest.TestCase):
+    def setUp(self):
+        self.telemetry = regextelemetry.RegexTelemetry(time_budget=0.5)
+
+    def test_record_match(self):
+        self.telemetry.record_match("\\d+", 0.25, "US")
+        self.telemetry.record_match("\\d+", 0.75, "US")
+        self.telemetry.record_match("\\d+", 0.25, "DE")
+        self.telemetry.record_compile("\\d+", 0.125)
+        stats = dict((item["region_code"], item)
+                     for item in self.telemetry.get_stats())
+        self.assertEquals({"regex": "\\d+", "region_code": "US",
+                           "compile_count": 0, "compile_time": 0.0,
+                           "match_count": 2, "total_time": 1.0,
+                           "max_time": 0.75, "over_budget_count": 1},
+                          stats["US"])
+        self.assertEquals(1, stats["DE"]["match_count"])
+        self.assertEquals(1, stats[None]["compile_count"])
+        self.assertEquals(0.125, stats[None]["compile_time"])
+
+    def test_compile_and_match(self):
+        pattern = self.telemetry.compile("(\\d{3})")
+        self.assertEquals("123", self.telemetry.match(pattern, "1234",
+                                                      "US").group(1))
+        self.assertEquals(None, self.telemetry.match(pattern, "12"))
+        stats = dict((item["region_code"], item)
+                     for item in self.telemetry.get_stats())
+        self.assertEquals(1, stats[None]["compile_count"])
+        self.assertEquals(1, stats[None]["match_count"])
+        self.assertEquals(1, stats["US"]["match_count"])
+
+    def test_slowest_patterns(self):
+        self.telemetry.record_match("a", 0.25)
+        self.telemetry.record_match("b", 0.75)
+        self.telemetry.record_match("c", 0.5)
+        self.telemetry.record_match("c", 0.5)
+        self.assertEquals(["b", "c"],
+                          [item["regex"] for item in
+                           self.telemetry.get_slowest_patterns(2)])
+        self.assertEquals(["c", "b", "a"],
+                          [item["regex"] for item in
+                           self.telemetry.get_slowest_patterns(
+                                   ranking="total_time")])
+        self.assertRaises(ValueError, self.telemetry.get_slowest_patterns,
+                          ranking="match_count")
+        self.assertEquals(["b"],
+                          [item["regex"] for item in
+                           self.telemetry.get_over_budget_patterns()])
+        self.telemetry.reset()
+        self.assertEquals([], self.telemetry.get_stats())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# Copyright (C) 2011 Neil Rahilly <neilrahilly@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for regionregistry."""
+
+import unittest
+
+from phonenumbers import regionregistry
+
+
+class RegionRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = regionregistry.RegionRegistry(
+                ["US", "GB", "BS", "US"])
+
+    def test_membership(self):
+        self.assertEquals(3, len(self.registry))
+        self.assertTrue("GB" in self.registry)
+        self.assertFalse("gb" in self.registry)
+        self.assertFalse("ZZ" in self.registry)
+
+    def test_region_ids(self):
+        self.assertEquals(("BS", "GB", "US"), self.registry.region_codes)
+        for region_id, region_code in enumerate(self.registry.region_codes):
+            self.assertEquals(region_id,
+                              self.registry.get_region_id(region_code))
+            self.assertEquals(region_code,
+                              self.registry.get_region_code(region_id))
+        self.assertEquals(None, self.registry.get_region_id("ZZ"))
+        # The same regions, in any order, get the same IDs.
+        self.assertEquals(self.registry.get_region_id("US"),
+                regionregistry.RegionRegistry(["GB", "US", "BS"]).
+                        get_region_id("US"))
+
+    def test_new_table(self):
+        self.assertEquals([False, False, False],
+                          self.registry.new_table(False))
+
+
+if __name__ == "__main__":
+    unittest.main()